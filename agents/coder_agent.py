@@ -2,12 +2,13 @@
 """
 Author: rahn
 Datum: 03.02.2026
-Version: 1.5
+Version: 1.6
 Beschreibung: Coder Agent - Generiert Production-Ready Code basierend auf Projektanforderungen.
               AENDERUNG 31.01.2026: Single-File Modus fuer File-by-File Generierung (Anti-Truncation).
               AENDERUNG 01.02.2026: Dependency-Versionen fuer requirements.txt.
               AENDERUNG 02.02.2026: Anti-Pattern Constraints hinzugefuegt (zirkulaere Imports etc.)
               AENDERUNG 03.02.2026: Fix 11 - max_tokens aus Config an LLM uebergeben (Root Cause fuer Truncation!)
+              AENDERUNG 18.10.2026: Einzeldatei-Kontext nach Relevanz statt 50 Zeilen jeder Datei.
 """
 
 import logging
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 # ÄNDERUNG 24.01.2026: Zentrale Hilfsfunktion verwenden (Single Source of Truth)
 from agents.agent_utils import get_model_from_config, combine_project_rules
 
+# AENDERUNG 18.10.2026: Relevanz-gerankter Kontext fuer Einzeldatei-Prompts
+from backend.context_selector import ContextSelection, select_context
+
 # AENDERUNG 01.02.2026: Dependency-Versionen fuer requirements.txt
 try:
     from backend.dev_loop_helpers import get_python_dependency_versions
@@ -208,7 +212,9 @@ def build_single_file_prompt(
     blueprint: Dict[str, Any],
     existing_files: Dict[str, str],
     user_goal: str,
-    database_schema: str = ""
+    database_schema: str = "",
+    depends_on: Optional[List[str]] = None,
+    context: Optional[ContextSelection] = None
 ) -> str:
     """
     Baut den Prompt fuer eine einzelne Datei.
@@ -220,6 +226,8 @@ def build_single_file_prompt(
         existing_files: Dict mit bereits erstellten Dateien (path -> content)
         user_goal: Urspruengliches Benutzer-Ziel
         database_schema: SQL-Schema vom DBDesigner (Fix 58g)
+        depends_on: Geplante Abhaengigkeiten der Datei (volle Inhalte im Kontext)
+        context: Bereits gewaehlter Kontext (select_context/legacy_selection)
 
     Returns:
         Vollstaendiger Prompt fuer den Coder
@@ -248,15 +256,12 @@ TECHNISCHER KONTEXT:
         if is_db_related:
             prompt += f"\nDATENBANK-SCHEMA (EXAKT diese Tabellennamen und Spalten verwenden!):\n{database_schema[:2000]}\nWICHTIG: Verwende NUR die Tabellennamen aus dem Schema! Erfinde KEINE eigenen!\n"
 
+    # AENDERUNG 18.10.2026: Volle Inhalte nur fuer direkte Abhaengigkeiten, sonst Signaturen
+    # (Token-Budget) - vorher wuchs der Prompt mit jeder erstellten Datei um 50 Zeilen
     if existing_files:
-        prompt += "\n\nBEREITS ERSTELLTE DATEIEN (als Referenz):\n"
-        for filepath, content in existing_files.items():
-            # Zeige nur die ersten 50 Zeilen jeder Datei als Kontext
-            lines = content.split('\n')[:50]
-            truncated = '\n'.join(lines)
-            if len(content.split('\n')) > 50:
-                truncated += "\n... (gekuerzt)"
-            prompt += f"\n--- {filepath} ---\n{truncated}\n"
+        if context is None:
+            context = select_context(target_file, existing_files, depends_on or [])
+        prompt += context.text
 
     # AENDERUNG 01.02.2026: Spezialbehandlung fuer requirements.txt
     # Verhindert dass LLM veraltete/falsche Versionen generiert (z.B. greenlet==2.0.7)
@@ -23,7 +23,6 @@ import os
 import time
 import logging
 import shutil
-from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -74,6 +73,8 @@ from .dependency_inventory import (
     load_inventory_from_file
 )
 
+from .dependency_inventory_cache import get_inventory_cache
+
 # =========================================================================
 # Re-exports aus dependency_security.py
 # =========================================================================
@@ -104,15 +105,15 @@ class DependencyAgent:
         self.config = config or {}
         self.auto_install = self.config.get("auto_install", True)
         self.check_vulns = self.config.get("check_vulnerabilities", True)
+        # AENDERUNG 18.10.2026: Fingerprint-Cache statt festem cache_inventory-Timeout
         self._inventory_cache = None
-        self._cache_timestamp = None
-        self._cache_duration = self.config.get("cache_inventory", 300)  # 5 Minuten
 
         # Callback fuer UI-Updates (wird vom Orchestrator gesetzt)
         self.on_log = None
 
         # npm-Pfad mit Windows-Fallback cachen
         self._npm_path = self._find_npm_path()
+        self._inventory_store = get_inventory_cache(self._npm_path)
 
         logger.info("DependencyAgent initialisiert (IT-Abteilung bereit)")
 
@@ -189,19 +190,17 @@ class DependencyAgent:
     # =========================================================================
 
     def get_inventory(self, force_refresh: bool = False) -> Dict[str, Any]:
-        """Gibt das aktuelle Inventar zurueck."""
-        now = datetime.now()
-        if (not force_refresh and self._inventory_cache and self._cache_timestamp and
-            (now - self._cache_timestamp).total_seconds() < self._cache_duration):
-            return self._inventory_cache
-
-        # Neu scannen
-        inventory = scan_inventory(self._npm_path, self.on_log)
+        """
+        Gibt das aktuelle Inventar zurueck.
 
-        # Cache aktualisieren
+        AENDERUNG 18.10.2026: Gueltig solange sich site-packages, globales
+        node_modules und die Tool-Binaries nicht geaendert haben.
+        """
+        if force_refresh:
+            inventory = scan_inventory(self._npm_path, self.on_log)
+        else:
+            inventory = self._inventory_store.get()
         self._inventory_cache = inventory
-        self._cache_timestamp = now
-
         return inventory
 
     def update_inventory(self) -> Dict[str, Any]:
@@ -7,6 +7,7 @@ Beschreibung: Verfügbarkeitsprüfung für Dependencies.
               Extrahiert aus dependency_agent.py (Regel 1: Max 500 Zeilen)
               Enthält: check_dependency, detect_package_type, _check_* Methoden, compare_versions
 # ÄNDERUNG [02.02.2026]: try/except + Logging, packaging.version für compare_versions
+# AENDERUNG 18.10.2026: Python-/npm-Checks als Lookup im Inventar-Cache
 """
 
 import subprocess
@@ -18,6 +19,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 
 from .dependency_constants import NPM_PACKAGES, is_builtin_module
+from .dependency_inventory_cache import get_inventory_cache, global_node_modules_dir
 
 logger = logging.getLogger(__name__)
 
@@ -145,20 +147,12 @@ def check_python_package(name: str, min_version: str = None) -> Dict[str, Any]:
         }
 
     try:
-        result = subprocess.run(
-            ["python", "-m", "pip", "show", name],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        # AENDERUNG 18.10.2026: Lookup im Inventar (importlib.metadata) statt
+        # "pip show"-Subprozess pro Paket
+        found = get_inventory_cache().lookup_python(name)
 
-        if result.returncode == 0:
-            # Version extrahieren
-            version = None
-            for line in result.stdout.split("\n"):
-                if line.startswith("Version:"):
-                    version = line.split(":", 1)[1].strip()
-                    break
+        if found is not None:
+            version = found[1]
 
             meets_requirement = True
             if min_version and version:
@@ -186,6 +180,22 @@ def check_npm_package(name: str, min_version: str = None, npm_path: Optional[str
         if not npm_path:
             return {"installed": False, "version": None, "error": "npm nicht verfuegbar", "type": "npm"}
 
+        # AENDERUNG 18.10.2026: Globales node_modules aus dem Inventar-Cache lesen;
+        # "npm list -g" nur wenn das Verzeichnis nicht ermittelbar ist
+        if global_node_modules_dir(npm_path):
+            version = get_inventory_cache(npm_path).lookup_npm(name)
+            if version is None:
+                return {"installed": False, "version": None, "type": "npm"}
+            meets_requirement = True
+            if min_version and version:
+                meets_requirement = compare_versions(version, min_version) >= 0
+            return {
+                "installed": True,
+                "version": version,
+                "meets_requirement": meets_requirement,
+                "type": "npm"
+            }
+
         result = subprocess.run(
             [npm_path, "list", "-g", name, "--depth=0", "--json"],
             capture_output=True,
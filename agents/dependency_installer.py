@@ -2,13 +2,16 @@
 """
 Author: rahn
 Datum: 01.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Installations-Funktionen für Dependencies.
               Extrahiert aus dependency_agent.py (Regel 1: Max 500 Zeilen)
               Enthält: install_dependencies, install_single_package, _validate_install_command
+              AENDERUNG 18.10.2026: pip laeuft mit sys.executable - demselben Interpreter,
+              dessen Pakete das Inventar (dependency_inventory_cache.py) meldet.
 """
 
 import os
+import sys
 import subprocess
 import logging
 import shlex
@@ -159,6 +162,12 @@ def install_dependencies(install_command: str, project_path: str = None,
             resolved = _shutil.which(parts[0])
             if resolved:
                 parts[0] = resolved
+        # AENDERUNG 18.10.2026: "python"/"pip" aus dem PATH koennen ein anderer Interpreter
+        # sein als der, dessen Pakete das Inventar liest - Installation daher mit sys.executable
+        elif parts[0].lower() == "python":
+            parts[0] = sys.executable
+        elif parts[0].lower() == "pip":
+            parts = [sys.executable, "-m", "pip"] + parts[1:]
 
         # Arbeitsverzeichnis
         cwd = project_path if project_path and os.path.isdir(project_path) else None
@@ -6,17 +6,22 @@ Version: 1.0
 Beschreibung: Inventar-Verwaltung für Dependencies.
               Extrahiert aus dependency_agent.py (Regel 1: Max 500 Zeilen)
               Enthält: get_inventory, _scan_* Methoden, health_score
+              AENDERUNG 18.10.2026: Scans ohne pip/npm-Subprozesse ueber
+              dependency_inventory_cache.py
 """
 
-import subprocess
 import json
 import logging
 import shutil
-from datetime import datetime
 from typing import Dict, Any, Optional, Callable
 
 from .dependency_constants import INVENTORY_PATH
-from .dependency_checker import check_system_tool
+from .dependency_inventory_cache import (
+    get_inventory_cache,
+    scan_python_distributions,
+    scan_npm_global,
+    scan_system_tools_concurrent,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +31,9 @@ def scan_inventory(npm_path: Optional[str] = None,
     """
     Scannt alle installierten Pakete.
 
+    AENDERUNG 18.10.2026: Python im Prozess, npm/System-Tools parallel;
+    das Ergebnis landet im Fingerprint-Cache (dependency_inventory_cache).
+
     Args:
         npm_path: Pfad zu npm (optional)
         on_log: Callback für Logging
@@ -40,26 +48,7 @@ def scan_inventory(npm_path: Optional[str] = None,
 
     _log("InventoryScan", {"status": "started"})
 
-    inventory = {
-        "last_updated": datetime.now().isoformat(),
-        "python": scan_python_packages(),
-        "npm": scan_npm_packages(npm_path),
-        "system": scan_system_tools(),
-        "health_score": 0
-    }
-
-    # npm-Status konsistent fuer Health-Score halten
-    npm_error = inventory.get("npm", {}).get("error")
-    npm_version = inventory.get("npm", {}).get("version")
-    system_tools = inventory.get("system", {})
-    if "npm" not in system_tools:
-        system_tools["npm"] = None
-    if npm_error or npm_version == "not installed":
-        system_tools["npm"] = None
-    inventory["system"] = system_tools
-
-    # Health-Score berechnen
-    inventory["health_score"] = calculate_health_score(inventory)
+    inventory = get_inventory_cache(npm_path).get(force_refresh=True)
 
     _log("InventoryScan", {"status": "complete", "health": inventory["health_score"]})
 
@@ -67,108 +56,25 @@ def scan_inventory(npm_path: Optional[str] = None,
 
 
 def scan_python_packages() -> Dict[str, Any]:
-    """Scannt installierte Python-Pakete."""
-    try:
-        result = subprocess.run(
-            ["python", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
-            raw = (result.stdout or "").strip() or (result.stderr or "").strip()
-            python_version = raw.replace("Python ", "", 1).strip() if raw else "unknown"
-        else:
-            python_version = "unknown"
-
-        # Pakete auflisten
-        result = subprocess.run(
-            ["python", "-m", "pip", "list", "--format=json"],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        packages = []
-        if result.returncode == 0:
-            pip_list = json.loads(result.stdout)
-            for pkg in pip_list:
-                packages.append({
-                    "name": pkg.get("name"),
-                    "version": pkg.get("version"),
-                    "status": "installed"
-                })
-
-        return {
-            "version": python_version,
-            "packages": packages
-        }
-
-    except Exception as e:
-        logger.warning(f"Fehler beim Scannen von Python-Paketen: {e}")
-        return {"version": "unknown", "packages": [], "error": str(e)}
+    """Scannt installierte Python-Pakete (importlib.metadata, ohne pip-Subprozess)."""
+    return scan_python_distributions()
 
 
 def scan_npm_packages(npm_path: Optional[str] = None) -> Dict[str, Any]:
-    """Scannt installierte NPM-Pakete (global)."""
+    """Scannt installierte NPM-Pakete (global, aus node_modules gelesen)."""
     try:
         # Gecachten npm-Pfad verwenden
         if not npm_path:
             npm_path = shutil.which("npm")
-        if not npm_path:
-            return {"version": "not installed", "packages": []}
-
-        # npm Version
-        result = subprocess.run(
-            [npm_path, "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        npm_version = result.stdout.strip() if result.returncode == 0 else "unknown"
-
-        # Globale Pakete
-        result = subprocess.run(
-            [npm_path, "list", "-g", "--depth=0", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        packages = []
-        if result.returncode == 0:
-            try:
-                data = json.loads(result.stdout)
-                for name, info in data.get("dependencies", {}).items():
-                    packages.append({
-                        "name": name,
-                        "version": info.get("version", "unknown"),
-                        "status": "installed"
-                    })
-            except json.JSONDecodeError:
-                pass
-
-        return {
-            "version": npm_version,
-            "packages": packages
-        }
-
+        return scan_npm_global(npm_path)
     except Exception as e:
         logger.warning(f"Fehler beim Scannen von NPM-Paketen: {e}")
         return {"version": "unknown", "packages": [], "error": str(e)}
 
 
 def scan_system_tools() -> Dict[str, Any]:
-    """Scannt wichtige System-Tools."""
-    tools = ["node", "git", "docker", "python", "npm", "curl"]
-    result = {}
-
-    for tool in tools:
-        check = check_system_tool(tool)
-        if check.get("installed"):
-            result[tool] = check.get("version", "installed")
-
-    return result
+    """Scannt wichtige System-Tools (parallel)."""
+    return scan_system_tools_concurrent()
 
 
 def calculate_health_score(inventory: Dict[str, Any]) -> int:
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: In-Process Dependency-Inventar mit Fingerprint-Cache.
+              Ersetzt die sequentiellen Subprozesse (pip list, pip show,
+              npm ls -g, npm -v, <tool> --version):
+              - Python-Distributionen ueber importlib.metadata (im Prozess)
+              - Globale npm-Pakete aus node_modules/.package-lock.json bzw.
+                den package.json-Dateien (ohne npm-Aufruf)
+              - System-Tool-Probes parallel
+              - Persistenter Cache, gueltig solange sich der Fingerprint
+                (mtimes von site-packages, node_modules, Tool-Binaries) nicht
+                aendert - ersetzt das feste cache_inventory-Timeout
+              - check_python_package/check_npm_package als O(1)-Lookup
+"""
+
+import os
+import re
+import sys
+import json
+import site
+import time
+import shutil
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dependency_constants import INVENTORY_PATH
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_CACHE_PATH = INVENTORY_PATH.parent / ".dependency_inventory_cache.json"
+SYSTEM_TOOLS = ("node", "git", "docker", "python", "npm", "curl")
+# Bei Format-Aenderungen erhoehen → Cache wird verworfen
+CACHE_FORMAT_VERSION = 1
+# Fingerprint (stat-Aufrufe) hoechstens so oft pruefen - Einzel-Lookups in
+# Schleifen bleiben damit reine Dict-Zugriffe
+FINGERPRINT_MIN_INTERVAL = 1.0
+
+
+def normalize_python_name(name: str) -> str:
+    """PEP 503: 'Flask_SQLAlchemy' → 'flask-sqlalchemy'."""
+    return re.sub(r"[-_.]+", "-", str(name)).strip().lower()
+
+
+# =========================================================================
+# Python
+# =========================================================================
+
+def python_site_dirs() -> List[str]:
+    """site-packages-Verzeichnisse des laufenden Interpreters."""
+    candidates = []
+    try:
+        candidates += site.getsitepackages()
+        candidates.append(site.getusersitepackages())
+    except AttributeError:
+        pass  # virtualenv < 20 ohne getsitepackages
+    candidates += [p for p in sys.path if p.endswith(("site-packages", "dist-packages"))]
+    dirs = []
+    for path in candidates:
+        path = os.path.abspath(path)
+        if path not in dirs and os.path.isdir(path):
+            dirs.append(path)
+    return dirs
+
+
+def _safe_listdir(path: str) -> List[str]:
+    try:
+        return os.listdir(path)
+    except OSError:
+        return []
+
+
+def scan_python_distributions() -> Dict[str, Any]:
+    """Installierte Python-Distributionen (im Prozess, ohne pip)."""
+    packages = []
+    seen = set()
+    try:
+        for dist in metadata.distributions():
+            name = dist.metadata.get("Name") if dist.metadata else None
+            if not name:
+                continue
+            key = normalize_python_name(name)
+            # Erste Fundstelle gewinnt (wie beim Import ueber sys.path)
+            if key in seen:
+                continue
+            seen.add(key)
+            packages.append({"name": name, "version": dist.version, "status": "installed"})
+    except Exception as e:
+        logger.warning(f"Fehler beim Lesen der Python-Distributionen: {e}")
+        return {"version": _python_version(), "packages": packages, "error": str(e)}
+    packages.sort(key=lambda p: p["name"].lower())
+    return {"version": _python_version(), "packages": packages}
+
+
+def _python_version() -> str:
+    return ".".join(str(part) for part in sys.version_info[:3])
+
+
+# =========================================================================
+# npm
+# =========================================================================
+
+def global_node_modules_dir(npm_path: Optional[str]) -> Optional[str]:
+    """
+    Leitet das globale node_modules-Verzeichnis aus dem npm-Pfad ab
+    (Unix: <prefix>/lib/node_modules, Windows: %APPDATA%\\npm\\node_modules).
+    """
+    if not npm_path:
+        return None
+    real = os.path.realpath(npm_path)
+    parts = Path(real).parts
+    if "node_modules" in parts:
+        idx = len(parts) - 1 - parts[::-1].index("node_modules")
+        return str(Path(*parts[:idx + 1]))
+    base = os.path.dirname(os.path.abspath(npm_path))
+    for candidate in (
+        os.path.join(base, "node_modules"),
+        os.path.join(os.path.dirname(base), "lib", "node_modules"),
+    ):
+        if os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+def _read_json(path: str) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def parse_node_modules(node_modules: str) -> List[Dict[str, str]]:
+    """
+    Top-Level-Pakete eines node_modules-Verzeichnisses.
+
+    Nutzt den versteckten Lockfile (.package-lock.json, npm >= 7) und liest
+    sonst die package.json der Paketordner direkt.
+    """
+    lock = _read_json(os.path.join(node_modules, ".package-lock.json"))
+    packages: Dict[str, str] = {}
+    if lock and isinstance(lock.get("packages"), dict):
+        for key, info in lock["packages"].items():
+            if not key.startswith("node_modules/") or not isinstance(info, dict):
+                continue
+            name = key[len("node_modules/"):]
+            if "node_modules/" in name:
+                continue  # verschachtelte Abhaengigkeit
+            packages[name] = info.get("version", "unknown")
+    else:
+        for entry in _safe_listdir(node_modules):
+            if entry.startswith("."):
+                continue
+            entry_path = os.path.join(node_modules, entry)
+            names = (
+                [f"{entry}/{sub}" for sub in _safe_listdir(entry_path)]
+                if entry.startswith("@") else [entry]
+            )
+            for name in names:
+                pkg = _read_json(os.path.join(node_modules, name, "package.json"))
+                if pkg is not None:
+                    packages[name] = pkg.get("version", "unknown")
+    return [
+        {"name": name, "version": version, "status": "installed"}
+        for name, version in sorted(packages.items())
+    ]
+
+
+def scan_npm_global(npm_path: Optional[str]) -> Dict[str, Any]:
+    """Globale npm-Pakete und npm-Version ohne npm-Aufruf."""
+    if not npm_path:
+        return {"version": "not installed", "packages": []}
+    node_modules = global_node_modules_dir(npm_path)
+    if not node_modules:
+        return {"version": "unknown", "packages": [], "error": "globales node_modules nicht gefunden"}
+    try:
+        packages = parse_node_modules(node_modules)
+    except Exception as e:
+        logger.warning(f"Fehler beim Lesen von {node_modules}: {e}")
+        return {"version": "unknown", "packages": [], "error": str(e)}
+    version = next((p["version"] for p in packages if p["name"] == "npm"), "unknown")
+    return {"version": version, "packages": packages, "node_modules": node_modules}
+
+
+# =========================================================================
+# System-Tools
+# =========================================================================
+
+def scan_system_tools_concurrent(tools=SYSTEM_TOOLS, max_workers: int = 6) -> Dict[str, Any]:
+    """Prueft System-Tools parallel (je ein '<tool> --version')."""
+    from .dependency_checker import check_system_tool
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tools)))) as pool:
+        checks = list(pool.map(check_system_tool, tools))
+    return {
+        tool: check.get("version", "installed")
+        for tool, check in zip(tools, checks) if check.get("installed")
+    }
+
+
+# =========================================================================
+# Cache
+# =========================================================================
+
+def _mtime(path: Optional[str]) -> float:
+    try:
+        return os.stat(path).st_mtime if path else 0.0
+    except OSError:
+        return 0.0
+
+
+class InventoryCache:
+    """
+    Fingerprint-basierter Inventar-Cache (Speicher + Datei).
+
+    Der Fingerprint besteht aus den mtimes der site-packages-Verzeichnisse,
+    des globalen node_modules (inkl. Lockfile) und der Tool-Binaries im PATH.
+    Installationen aendern diese mtimes, damit wird neu gescannt - sonst
+    bleibt das Inventar ohne Zeitlimit gueltig.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, npm_path: Optional[str] = None,
+                 tools=SYSTEM_TOOLS):
+        self.cache_path = Path(cache_path) if cache_path else INVENTORY_CACHE_PATH
+        self.npm_path = npm_path
+        self.tools = tuple(tools)
+        self._lock = threading.RLock()
+        self._fingerprint: Optional[str] = None
+        self._inventory: Optional[Dict[str, Any]] = None
+        self._python_index: Dict[str, Tuple[str, str]] = {}
+        self._npm_index: Dict[str, str] = {}
+        self._checked_at = 0.0
+        self.stats = {"scans": 0, "memory_hits": 0, "disk_hits": 0}
+
+    def fingerprint(self) -> str:
+        """Billiger Fingerprint ueber stat()-Aufrufe."""
+        parts: List[Any] = [CACHE_FORMAT_VERSION, sys.executable]
+        parts += [(d, _mtime(d)) for d in python_site_dirs()]
+        node_modules = global_node_modules_dir(self.npm_path)
+        if node_modules:
+            parts += [(node_modules, _mtime(node_modules)),
+                      _mtime(os.path.join(node_modules, ".package-lock.json"))]
+        for tool in self.tools:
+            path = shutil.which(tool)
+            parts.append((tool, path, _mtime(path)))
+        return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+    def _set(self, fingerprint: str, inventory: Dict[str, Any]) -> None:
+        self._fingerprint = fingerprint
+        self._inventory = inventory
+        self._python_index = {
+            normalize_python_name(p["name"]): (p["name"], p.get("version"))
+            for p in inventory.get("python", {}).get("packages", [])
+        }
+        self._npm_index = {
+            p["name"]: p.get("version") for p in inventory.get("npm", {}).get("packages", [])
+        }
+
+    def _load_disk(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        data = _read_json(str(self.cache_path))
+        if data and data.get("fingerprint") == fingerprint and isinstance(data.get("inventory"), dict):
+            return data["inventory"]
+        return None
+
+    def _save_disk(self, fingerprint: str, inventory: Dict[str, Any]) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "inventory": inventory}, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Inventar-Cache konnte nicht gespeichert werden: {e}")
+
+    def scan(self) -> Dict[str, Any]:
+        """Vollstaendiger Scan: Python im Prozess, npm und System-Tools parallel."""
+        from .dependency_inventory import calculate_health_score
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            npm_future = pool.submit(scan_npm_global, self.npm_path)
+            system_future = pool.submit(scan_system_tools_concurrent, self.tools)
+            python = scan_python_distributions()
+            npm = npm_future.result()
+            system = system_future.result()
+
+        # npm-Status konsistent fuer Health-Score halten
+        if "npm" not in system or npm.get("error") or npm.get("version") == "not installed":
+            system["npm"] = None
+        inventory = {
+            "last_updated": datetime.now().isoformat(),
+            "python": python,
+            "npm": npm,
+            "system": system,
+            "health_score": 0,
+        }
+        inventory["health_score"] = calculate_health_score(inventory)
+        self.stats["scans"] += 1
+        return inventory
+
+    def get(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Inventar - aus Speicher/Datei solange der Fingerprint passt."""
+        with self._lock:
+            now = time.monotonic()
+            if (not force_refresh and self._inventory is not None
+                    and now - self._checked_at < FINGERPRINT_MIN_INTERVAL):
+                self.stats["memory_hits"] += 1
+                return self._inventory
+            fingerprint = self.fingerprint()
+            self._checked_at = now
+            if not force_refresh:
+                if self._inventory is not None and self._fingerprint == fingerprint:
+                    self.stats["memory_hits"] += 1
+                    return self._inventory
+                cached = self._load_disk(fingerprint)
+                if cached is not None:
+                    self.stats["disk_hits"] += 1
+                    self._set(fingerprint, cached)
+                    return cached
+            inventory = self.scan()
+            self._set(fingerprint, inventory)
+            self._save_disk(fingerprint, inventory)
+            return inventory
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._fingerprint = None
+            self._inventory = None
+            self._checked_at = 0.0
+
+    def lookup_python(self, name: str) -> Optional[Tuple[str, str]]:
+        """(Distributionsname, Version) oder None."""
+        self.get()
+        return self._python_index.get(normalize_python_name(name))
+
+    def lookup_npm(self, name: str) -> Optional[str]:
+        """Version eines global installierten npm-Pakets oder None."""
+        self.get()
+        return self._npm_index.get(name)
+
+
+_caches: Dict[Optional[str], InventoryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_inventory_cache(npm_path: Optional[str] = None) -> InventoryCache:
+    """Prozessweiter Cache pro npm-Pfad."""
+    if npm_path is None:
+        npm_path = shutil.which("npm")
+    with _caches_lock:
+        cache = _caches.get(npm_path)
+        if cache is None:
+            cache = _caches[npm_path] = InventoryCache(npm_path=npm_path)
+        return cache
+
+
+def reset_inventory_caches() -> None:
+    """Verwirft alle Caches im Speicher (fuer Tests)."""
+    with _caches_lock:
+        _caches.clear()
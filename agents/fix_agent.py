@@ -1,11 +1,13 @@
 """
 Author: rahn
 Datum: 03.02.2026
-Version: 1.2
+Version: 1.3
 Beschreibung: Spezialisierter Agent fuer gezielte Code-Korrekturen.
               Repariert nur die gemeldeten Fehler, ohne funktionierenden Code zu aendern.
               AENDERUNG 02.02.2026: Signatur-Fix fuer UTDS BatchExecution Kompatibilitaet.
               AENDERUNG 03.02.2026: Fix 11 - max_tokens aus Config an LLM uebergeben.
+              AENDERUNG 18.10.2026: build_fix_prompt mit stabilem Cache-Praefix
+                                    (Anweisungen vor Fehler und Dateiinhalt).
 """
 
 import logging
@@ -15,6 +17,7 @@ from typing import Dict, List, Optional, Any
 # AENDERUNG 02.02.2026: Import fuer konsistente project_rules Verarbeitung
 # AENDERUNG 02.02.2026: get_model_from_config fuer Single Source of Truth Modellwahl
 from agents.agent_utils import combine_project_rules, get_model_from_config
+from backend.prompt_cache import DEFAULT_MIN_PREFIX_CHARS, join_cacheable
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +176,27 @@ TECH-STACK DES PROJEKTS (WICHTIG!):
     )
 
 
+# AENDERUNG 18.10.2026: Fuer alle Fix-Tasks identisch - stabiler Praefix bei aktivem prompt_cache
+FIX_PROMPT_INSTRUCTIONS = """KORREKTUR-AUFGABE
+
+ANWEISUNGEN:
+1. Analysiere den Fehler anhand der Fehlermeldung und der betroffenen Zeilen
+2. Identifiziere die minimale Aenderung zur Behebung
+3. Korrigiere NUR den Fehler - keine anderen Aenderungen
+4. Gib die korrigierte Datei im folgenden Format aus:
+
+### CORRECTION: <ZIELDATEI>
+```
+[Die VOLLSTAENDIGE korrigierte Datei]
+```
+
+WICHTIG:
+- Gib die gesamte Datei aus, nicht nur die geaenderten Zeilen
+- Behalte alle existierenden Kommentare und Formatierung
+- Aendere keine funktionierenden Teile des Codes
+"""
+
+
 def build_fix_prompt(
     file_path: str,
     current_content: str,
@@ -180,7 +204,8 @@ def build_fix_prompt(
     error_message: str,
     line_numbers: List[int],
     context_files: Optional[Dict[str, str]] = None,
-    suggested_fix: str = ""
+    suggested_fix: str = "",
+    cache_settings: Optional[Dict[str, Any]] = None
 ) -> str:
     """
     Baut einen gezielten Fix-Prompt fuer den Agent.
@@ -193,6 +218,8 @@ def build_fix_prompt(
         line_numbers: Betroffene Zeilennummern
         context_files: Optional - Relevante andere Dateien als Kontext
         suggested_fix: Optional - Vorgeschlagene Korrektur
+        cache_settings: Optional - get_prompt_cache_settings(config); bei enabled
+                        stehen die Anweisungen als Cache-Praefix vorne
 
     Returns:
         Formatierter Prompt fuer den Fix-Agent
@@ -222,6 +249,26 @@ def build_fix_prompt(
     if suggested_fix:
         fix_hint = f"\n\nHINWEIS ZUR KORREKTUR:\n{suggested_fix}"
 
+    if cache_settings and cache_settings.get("enabled"):
+        task_section = f"""ZIELDATEI: {file_path}
+FEHLERTYP: {error_type}
+{line_hint}
+
+FEHLERMELDUNG:
+{error_message}
+{fix_hint}
+
+AKTUELLER DATEIINHALT (mit Zeilennummern):
+```
+{numbered_content}
+```
+{context_section}
+
+AUSGABE als ### CORRECTION: {file_path}
+"""
+        return join_cacheable(FIX_PROMPT_INSTRUCTIONS, task_section,
+                              cache_settings.get("min_prefix_chars", DEFAULT_MIN_PREFIX_CHARS))
+
     prompt = f"""KORREKTUR-AUFGABE
 
 ZIELDATEI: {file_path}
@@ -386,7 +433,8 @@ def create_fix_task(
     error_type: str,
     error_message: str,
     line_numbers: List[int] = None,
-    context_files: Dict[str, str] = None
+    context_files: Dict[str, str] = None,
+    cache_settings: Optional[Dict[str, Any]] = None
 ):
     """
     Erstellt einen CrewAI Task fuer die Code-Korrektur.
@@ -399,6 +447,7 @@ def create_fix_task(
         error_message: Fehlermeldung
         line_numbers: Betroffene Zeilen
         context_files: Kontext-Dateien
+        cache_settings: Optional - Prompt-Caching-Layout (siehe build_fix_prompt)
 
     Returns:
         CrewAI Task
@@ -411,7 +460,8 @@ def create_fix_task(
         error_type=error_type,
         error_message=error_message,
         line_numbers=line_numbers or [],
-        context_files=context_files
+        context_files=context_files,
+        cache_settings=cache_settings
     )
 
     return Task(
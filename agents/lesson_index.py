@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Retrieval-Index fuer Memory-Lessons.
+              - Invertierter Index ueber pattern, tags und action mit
+                BM25-Scoring gegen den aktuellen Fehler-/Feedback-Text
+              - MinHash-LSH ueber die Pattern-Woerter fuer die Duplikat-Pruefung
+                (is_duplicate_lesson) statt Mengenbildung pro Lesson
+              - Cache pro Memory-Datei (mtime/Groesse); save_memory aktualisiert
+                den Index inkrementell (neue Lessons, geaenderte Counts)
+"""
+
+import os
+import re
+import json
+import math
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from agents.memory_encryption import decrypt_data
+from minhash_utils import band_keys, minhash
+
+logger = logging.getLogger(__name__)
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+BAND_ROWS = 2  # 64 Permutationen (minhash_utils) → 32 Baender: Kandidat ab Jaccard 0.43 (Overlap 0.6) mit p > 0.998
+DEFAULT_QUERY_CHARS = 4000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Kleingeschriebene Wort-Tokens (mind. 2 Zeichen)."""
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if len(t) > 1]
+
+
+def get_lesson_retrieval_settings(config: Any) -> Dict[str, Any]:
+    """Liest lesson_retrieval aus der Config - ohne Dict-Config deaktiviert."""
+    settings = {"enabled": False, "query_chars": DEFAULT_QUERY_CHARS}
+    if not isinstance(config, dict):
+        return settings
+    raw = config.get("lesson_retrieval") or {}
+    if not isinstance(raw, dict):
+        raw = {}
+    settings["enabled"] = bool(raw.get("enabled", True))
+    query_chars = raw.get("query_chars", DEFAULT_QUERY_CHARS)
+    if isinstance(query_chars, int) and query_chars > 0:
+        settings["query_chars"] = query_chars
+    return settings
+
+
+class LessonIndex:
+    """
+    Index ueber eine Lesson-Liste in Datei-Reihenfolge.
+
+    select() liefert dieselbe Auswahl wie bisher (Tag-Filter, Sortierung nach
+    count) und rankt bei gesetzter Query die passenden Lessons per BM25 nach vorn.
+    """
+
+    def __init__(self, lessons: Iterable[Dict[str, Any]] = ()):
+        self.lessons: List[Dict[str, Any]] = []
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._lengths: List[int] = []
+        self._total_length = 0
+        self._patterns: List[str] = []
+        self._tags: List[List[str]] = []
+        self._global: List[bool] = []
+        self._relevant: Dict[str, List[int]] = {}
+        # MinHash-Signaturen entstehen erst bei der ersten Duplikat-Pruefung
+        self._signed = 0
+        self._bands: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self._empty_pattern = False
+        for lesson in lessons:
+            self._add(lesson)
+
+    def __len__(self) -> int:
+        return len(self.lessons)
+
+    def _add(self, lesson: Dict[str, Any]) -> None:
+        if not isinstance(lesson, dict):
+            lesson = {}
+        doc = len(self.lessons)
+        self.lessons.append(dict(lesson))
+        tags = [t for t in lesson.get("tags", []) or [] if isinstance(t, str)]
+        pattern = str(lesson.get("pattern", "") or "")
+        tokens = tokenize(" ".join([pattern, " ".join(tags), str(lesson.get("action", "") or "")]))
+        for token in tokens:
+            postings = self._postings.setdefault(token, {})
+            postings[doc] = postings.get(doc, 0) + 1
+        self._lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        self._patterns.append(pattern.lower())
+        self._empty_pattern = self._empty_pattern or not pattern
+        self._tags.append([t.lower() for t in tags])
+        self._global.append("global" in tags)
+        self._relevant.clear()
+
+    def sync(self, lessons: List[Dict[str, Any]]) -> bool:
+        """
+        Uebernimmt eine neue Lesson-Liste inkrementell.
+
+        Gleicher Praefix (Patterns) → Counts aktualisieren, neue Lessons anhaengen.
+        Returns False wenn sich der Praefix geaendert hat (Neuaufbau noetig).
+        """
+        known = len(self.lessons)
+        if len(lessons) < known:
+            return False
+        for doc in range(known):
+            lesson = lessons[doc] if isinstance(lessons[doc], dict) else {}
+            if str(lesson.get("pattern", "") or "").lower() != self._patterns[doc]:
+                return False
+        for doc in range(known):
+            if lessons[doc] != self.lessons[doc]:
+                self.lessons[doc] = dict(lessons[doc])
+        for lesson in lessons[known:]:
+            self._add(lesson)
+        return True
+
+    # ---------------------------------------------------------------------
+    # Auswahl fuer den Prompt
+    # ---------------------------------------------------------------------
+
+    def _relevant_docs(self, tech_stack: Optional[str]) -> List[int]:
+        stack = (tech_stack or "").lower()
+        cached = self._relevant.get(stack)
+        if cached is None:
+            cached = [doc for doc in range(len(self.lessons))
+                      if self._global[doc] or (stack and any(tag in stack for tag in self._tags[doc]))]
+            self._relevant[stack] = cached
+        return cached
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """BM25-Scores aller Lessons mit mindestens einem Query-Term."""
+        count = len(self.lessons)
+        if not count:
+            return {}
+        avg_length = self._total_length / count or 1.0
+        result: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, tf in postings.items():
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[doc] / avg_length)
+                result[doc] = result.get(doc, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+        return result
+
+    def _count(self, doc: int) -> Any:
+        return self.lessons[doc].get("count", 1)
+
+    def select(self, tech_stack: Optional[str] = None, limit: int = 15,
+               query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Top-Lessons: ohne Query nach count, mit Query zuerst nach BM25-Relevanz."""
+        relevant = self._relevant_docs(tech_stack)
+        by_count = sorted(relevant, key=self._count, reverse=True)
+        if not query:
+            return [self.lessons[doc] for doc in by_count[:limit]]
+        scores = self.scores(query)
+        ranked = sorted((doc for doc in relevant if scores.get(doc, 0.0) > 0),
+                        key=lambda doc: (-scores[doc], -self._count(doc), doc))[:limit]
+        chosen = set(ranked)
+        ranked.extend(doc for doc in by_count[:limit] if doc not in chosen)
+        return [self.lessons[doc] for doc in ranked[:limit]]
+
+    # ---------------------------------------------------------------------
+    # Duplikat-Pruefung
+    # ---------------------------------------------------------------------
+
+    def _sign(self) -> None:
+        for doc in range(self._signed, len(self._patterns)):
+            signature = minhash(set(self._patterns[doc].split()))
+            for key in band_keys(signature, BAND_ROWS):
+                self._bands.setdefault(key, []).append(doc)
+        self._signed = len(self._patterns)
+
+    def is_duplicate(self, pattern: str, similarity_threshold: float = 0.6) -> bool:
+        """
+        Semantik von is_duplicate_lesson: Substring in eine Richtung oder
+        Wort-Ueberlappung/max(Wortanzahl) >= similarity_threshold.
+
+        Die Ueberlappung wird nur fuer LSH-Kandidaten berechnet; Overlap >= t
+        bedeutet Jaccard >= t / (2 - t), bei 0.6 also >= 0.43.
+        """
+        error_lower = pattern.lower()
+        if self._empty_pattern:
+            return bool(self.lessons)
+        if any(existing in error_lower or error_lower in existing for existing in self._patterns):
+            return True
+        error_words = set(error_lower.split())
+        if not error_words:
+            return False
+        self._sign()
+        candidates: Set[int] = set()
+        for key in band_keys(minhash(error_words), BAND_ROWS):
+            candidates.update(self._bands.get(key, ()))
+        for doc in sorted(candidates):
+            existing_words = set(self._patterns[doc].split())
+            overlap = len(error_words & existing_words) / max(len(error_words), len(existing_words))
+            if overlap >= similarity_threshold:
+                return True
+        return False
+
+
+# =========================================================================
+# Cache pro Memory-Datei
+# =========================================================================
+
+_indexes: Dict[str, Tuple[Tuple[int, int], LessonIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def _signature(path: str) -> Tuple[int, int]:
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return 0, 0
+
+
+def get_lesson_index(memory_path: str) -> Optional[LessonIndex]:
+    """Index der Memory-Datei; None wenn sie fehlt oder nicht lesbar ist."""
+    key = os.path.abspath(memory_path)
+    signature = _signature(key)
+    if signature == (0, 0):
+        return None
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+    try:
+        with open(key, "r", encoding="utf-8") as f:
+            data = json.loads(decrypt_data(f.read()))
+        index = LessonIndex(data.get("lessons", []) or [])
+    except Exception:
+        return None
+    with _indexes_lock:
+        _indexes[key] = (signature, index)
+    return index
+
+
+def sync_lesson_index(memory_path: str, lessons: List[Dict[str, Any]]) -> None:
+    """Nach save_memory: vorhandenen Index inkrementell nachziehen."""
+    key = os.path.abspath(memory_path)
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached is None:
+            return
+        index = cached[1]
+        if not index.sync(lessons):
+            index = LessonIndex(lessons)
+        _indexes[key] = (_signature(key), index)
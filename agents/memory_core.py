@@ -2,11 +2,12 @@
 """
 Author: rahn
 Datum: 01.02.2026
-Version: 1.1
+Version: 1.2
 Beschreibung: Memory Agent Core-Funktionen (Load/Save).
               Extrahiert aus memory_agent.py (Regel 1: Max 500 Zeilen)
 
               ÄNDERUNG 01.02.2026 v1.1: DataSource und DomainTerm Funktionen hinzugefügt
+              AENDERUNG 18.10.2026 v1.2: Lessons ueber LessonIndex (BM25-Ranking, inkrementell)
 """
 
 import os
@@ -19,6 +20,7 @@ from typing import Any, Dict, List, Optional
 
 from agents.memory_types import MemoryData, MemoryEntry, DataSource, DomainTerm
 from agents.memory_encryption import encrypt_data, decrypt_data
+from agents.lesson_index import get_lesson_index, sync_lesson_index
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,11 @@ def save_memory(memory_path: str, memory_data: MemoryData) -> None:
     encrypted_content = encrypt_data(json_content)
     with open(memory_path, "w", encoding="utf-8") as f:
         f.write(encrypted_content)
+    # AENDERUNG 18.10.2026: Lesson-Index inkrementell nachziehen statt neu einlesen
+    try:
+        sync_lesson_index(memory_path, memory_data.get("lessons", []) or [])
+    except Exception:
+        logger.debug("save_memory: Lesson-Index-Sync fehlgeschlagen", exc_info=True)
 
 
 async def save_memory_async(memory_path: str, memory_data: MemoryData) -> None:
@@ -161,62 +168,34 @@ async def update_memory_async(
     return entry
 
 
-def get_lessons_for_prompt(memory_path: str, tech_stack: str = None, limit: int = 15) -> str:
+def get_lessons_for_prompt(memory_path: str, tech_stack: str = None, limit: int = 15,
+                           query: str = None) -> str:
     """
     Lädt Lessons Learned aus dem Memory, gefiltert nach Tech-Stack.
 
     ÄNDERUNG 03.02.2026: Lessons nach Häufigkeit (count) sortieren.
     High-Impact Lessons (count >= 5) werden zuerst angezeigt.
 
+    AENDERUNG 18.10.2026: Mit query (aktueller Fehler/Feedback) werden die
+    Lessons per BM25 nach Relevanz gerankt, freie Plaetze nach count aufgefuellt.
+
     Args:
         memory_path: Pfad zur Memory-Datei
         tech_stack: Optional Tech-Stack Filter
         limit: Max. Anzahl Lessons (Default: 15)
+        query: Optional Fehler-/Feedback-Text fuer das Relevanz-Ranking
 
     Returns:
         Formatierter String mit priorisierten Lessons
     """
-    if not os.path.exists(memory_path):
+    index = get_lesson_index(memory_path)
+    if index is None:
         return ""
 
-    try:
-        with open(memory_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        # Decrypt if encrypted, otherwise parse as-is (backwards compatible)
-        decrypted_content = decrypt_data(content)
-        data = json.loads(decrypted_content)
-    except Exception:
-        return ""
-
-    lessons = data.get("lessons", [])
-    relevant_lessons = []
-
-    for lesson in lessons:
-        # Simple keywords matching or global
-        tags = lesson.get("tags", [])
-        is_relevant = False
-
-        if "global" in tags:
-            is_relevant = True
-        elif tech_stack:
-            for tag in tags:
-                if tag.lower() in tech_stack.lower():
-                    is_relevant = True
-                    break
-
-        if is_relevant:
-            relevant_lessons.append(lesson)
-
+    relevant_lessons = index.select(tech_stack, limit, query)
     if not relevant_lessons:
         return ""
 
-    # ÄNDERUNG 03.02.2026: Nach count sortieren (höchste zuerst)
-    relevant_lessons = sorted(
-        relevant_lessons,
-        key=lambda x: x.get("count", 1),
-        reverse=True
-    )[:limit]
-
     # ÄNDERUNG 03.02.2026: Formatierung mit Prioritäts-Emoji und suggested_fix
     result = []
     for lesson in relevant_lessons:
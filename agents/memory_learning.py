@@ -22,6 +22,7 @@ from typing import Dict, List, Optional, Union
 
 from agents.memory_encryption import decrypt_data
 from agents.memory_core import load_memory, save_memory
+from agents.lesson_index import get_lesson_index
 
 
 # ÄNDERUNG 03.02.2026: Fix 9 - Spezifische Fixes für bekannte Fehler-Patterns
@@ -183,32 +184,12 @@ def is_duplicate_lesson(
     if not error_pattern:
         return False
 
-    try:
-        with open(memory_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        decrypted_content = decrypt_data(content)
-        data = json.loads(decrypted_content)
-    except Exception:
+    # AENDERUNG 18.10.2026: Pruefung ueber den gecachten Lesson-Index (MinHash-LSH)
+    # statt Datei neu lesen und Wortmengen pro Lesson bilden
+    index = get_lesson_index(memory_path)
+    if index is None:
         return False
-
-    error_lower = error_pattern.lower()
-    error_words = set(error_lower.split())
-
-    for lesson in data.get("lessons", []):
-        existing_pattern = lesson.get("pattern", "").lower()
-
-        # Exakte Match-Prüfung
-        if existing_pattern in error_lower or error_lower in existing_pattern:
-            return True
-
-        # Wort-Überlappungs-Prüfung
-        existing_words = set(existing_pattern.split())
-        if len(error_words) > 0 and len(existing_words) > 0:
-            overlap = len(error_words & existing_words) / max(len(error_words), len(existing_words))
-            if overlap >= similarity_threshold:
-                return True
-
-    return False
+    return index.is_duplicate(error_pattern, similarity_threshold)
 
 
 def _generate_action_text(error_msg: str) -> str:
@@ -1,10 +1,11 @@
 """
 Author: rahn
 Datum: 31.01.2026
-Version: 1.2
+Version: 1.3
 Beschreibung: Zentrale Factory fuer Agent-Erstellung im Backend.
               AENDERUNG 31.01.2026: Dart AI Agenten hinzugefuegt (Planner, Analyst, Konzepter).
               AENDERUNG 31.01.2026: Fix-Agent fuer gezielte Code-Korrekturen hinzugefuegt.
+              AENDERUNG 18.10.2026: Agenten ueber den Agent-Pool wiederverwenden (agent_pool.py).
 """
 
 from typing import Dict, Any, List
@@ -24,6 +25,8 @@ from agents.analyst_agent import create_analyst
 from agents.konzepter_agent import create_konzepter
 # AENDERUNG 31.01.2026: Fix-Agent fuer gezielte Code-Korrekturen
 from agents.fix_agent import create_fix_agent
+# AENDERUNG 18.10.2026: Wiederverwendung konstruierter Agenten
+from .agent_pool import pooled_agent
 
 # ÄNDERUNG 29.01.2026: Agent-Erstellung in zentrale Factory ausgelagert
 
@@ -33,7 +36,8 @@ def init_agents(
     project_rules: Dict[str, Any],
     router=None,
     include: List[str] = None,
-    tech_blueprint: Dict[str, Any] = None
+    tech_blueprint: Dict[str, Any] = None,
+    pooled: bool = True
 ) -> Dict[str, Any]:
     """
     Erstellt alle benoetigten Agenten fuer den Orchestration-Flow.
@@ -44,6 +48,8 @@ def init_agents(
         router: Optionaler ModelRouter fuer konsistente Modell-Auswahl
         include: Optional - Nur bestimmte Agenten instanziieren
         tech_blueprint: Optional - Tech-Stack-Informationen (language, framework, project_type)
+        pooled: Agenten aus dem Agent-Pool wiederverwenden (False fuer parallel
+                laufende Tasks, die eigene Instanzen brauchen)
 
     Returns:
         Dict mit Agent-Instanzen (coder, reviewer, tester, security, db_designer, techstack_architect, designer)
@@ -87,4 +93,11 @@ def init_agents(
     }
 
     selected = include or list(available.keys())
-    return {key: available[key]() for key in selected if key in available}
+    if not pooled:
+        return {key: available[key]() for key in selected if key in available}
+    # AENDERUNG 18.10.2026: Gleicher Key (Rolle, Modell, Regeln, Tech-Stack) → gleicher Agent
+    return {
+        key: pooled_agent(config, key, project_rules, available[key], router=router,
+                          tech_blueprint=tech_blueprint)
+        for key in selected if key in available
+    }
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Agent-Pool fuer init_agents und den UTDS-Fallback.
+              Fertig konstruierte CrewAI-Agenten (inkl. LLM-Client und
+              zusammengesetzter Regel-Backstory) werden ueber Runs und
+              Modell-Fallbacks hinweg wiederverwendet.
+              - Key: (Rolle, aufgeloestes Modell, Regel-Hash, Tech-Stack-Fingerprint)
+              - Config-Aenderung (Hash ueber die Config) verwirft alle Eintraege
+              - Statistik: Hits/Misses und Konstruktionszeit pro Rolle
+
+              Ein Modellwechsel des Routers ergibt einen neuen Key - der Agent fuer
+              das vorherige Modell bleibt im Pool, der Rueckwechsel kostet nichts.
+              Gepoolte Agenten sind geteilt: parallel laufende Tasks (Parallel-Patch)
+              muessen eigene Instanzen bauen (init_agents(..., pooled=False)).
+
+              Konfiguration (optional, config.yaml):
+                agent_pool:
+                  enabled: true
+                  max_entries: 64
+"""
+
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .prompt_assembly import hash_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 64
+
+# Rolle in init_agents → Rolle fuer die Modellauswahl in den create_*-Funktionen
+MODEL_ROLES = {
+    "db_designer": "database_designer",
+    "analyst": "meta_orchestrator",
+    "konzepter": "meta_orchestrator",
+}
+
+
+def get_agent_pool_settings(config: Any) -> Dict[str, Any]:
+    """Liest agent_pool aus der Config - ohne echte Config (z.B. Mock) kein Pooling."""
+    if not isinstance(config, dict):
+        return {"enabled": False, "max_entries": DEFAULT_MAX_ENTRIES}
+    settings = config.get("agent_pool")
+    if not isinstance(settings, dict):
+        settings = {}
+    return {
+        "enabled": bool(settings.get("enabled", True)),
+        "max_entries": int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+    }
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """Hash ueber die komplette Config (Reihenfolge der Keys egal)."""
+    return hash_key(json.dumps(config, sort_keys=True, default=str))
+
+
+def tech_fingerprint(tech_blueprint: Optional[Dict[str, Any]]) -> str:
+    if not tech_blueprint:
+        return ""
+    return hash_key(json.dumps(tech_blueprint, sort_keys=True, default=str))
+
+
+def resolve_model(config: Dict[str, Any], role: str, router=None) -> str:
+    """Modell, das die create_*-Funktion fuer diese Rolle verwenden wird."""
+    model_role = MODEL_ROLES.get(role, role)
+    if router is not None:
+        return router.get_model(model_role)
+    from agents.agent_utils import get_model_from_config
+    return get_model_from_config(config, model_role)
+
+
+def model_of(agent: Any) -> Optional[str]:
+    """Tatsaechliches Modell eines Agenten (LLM-Objekt oder Modell-String)."""
+    llm = getattr(agent, "llm", None)
+    if isinstance(llm, str):
+        return llm
+    model = getattr(llm, "model", None)
+    return model if isinstance(model, str) else None
+
+
+class AgentPool:
+    """LRU-Pool fertig konstruierter Agenten."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, ...], Any]" = OrderedDict()
+        self._config_fp: Optional[str] = None
+        self._roles: Dict[str, Dict[str, float]] = {}
+        self.invalidations = 0
+
+    def _role_stats(self, role: str) -> Dict[str, float]:
+        return self._roles.setdefault(role, {"hits": 0, "misses": 0, "builds": 0,
+                                             "build_ms_total": 0.0, "build_ms_last": 0.0})
+
+    def _check_config(self, config_fp: str) -> None:
+        # Aufruf nur unter self._lock
+        if self._config_fp is not None and self._config_fp != config_fp and self._entries:
+            logger.info("[AgentPool] Config geaendert - %d Agenten verworfen", len(self._entries))
+            self._entries.clear()
+            self.invalidations += 1
+        self._config_fp = config_fp
+
+    def get_or_build(self, role: str, model: str, rules_hash: str, tech_fp: str,
+                     config_fp: str, builder: Callable[[], Any]) -> Any:
+        """
+        Gepoolter Agent fuer den Key oder builder().
+
+        Exceptions von builder() werden nicht gecached. Weicht das Modell des
+        gebauten Agenten vom aufgeloesten ab (Router hat zwischendurch gewechselt),
+        wird er unter seinem tatsaechlichen Modell abgelegt.
+        """
+        key = (role, model, rules_hash, tech_fp)
+        with self._lock:
+            self._check_config(config_fp)
+            stats = self._role_stats(role)
+            agent = self._entries.get(key)
+            if agent is not None:
+                self._entries.move_to_end(key)
+                stats["hits"] += 1
+                return agent
+            stats["misses"] += 1
+
+        start = time.perf_counter()
+        agent = builder()
+        build_ms = (time.perf_counter() - start) * 1000
+        if agent is None:
+            return agent
+
+        actual_model = model_of(agent) or model
+        with self._lock:
+            stats = self._role_stats(role)
+            stats["builds"] += 1
+            stats["build_ms_total"] += build_ms
+            stats["build_ms_last"] = round(build_ms, 3)
+            if self._config_fp == config_fp:
+                self._entries[(role, actual_model, rules_hash, tech_fp)] = agent
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        logger.debug("[AgentPool] %s (%s) gebaut in %.1f ms", role, actual_model, build_ms)
+        return agent
+
+    def invalidate(self, role: Optional[str] = None) -> int:
+        """Verwirft alle Eintraege (oder nur die einer Rolle); liefert die Anzahl."""
+        with self._lock:
+            keys = [key for key in self._entries if role is None or key[0] == role]
+            for key in keys:
+                del self._entries[key]
+            if keys:
+                self.invalidations += 1
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            roles = {}
+            for name, agg in self._roles.items():
+                builds = agg["builds"]
+                roles[name] = {
+                    "hits": agg["hits"],
+                    "misses": agg["misses"],
+                    "builds": builds,
+                    "build_ms_avg": round(agg["build_ms_total"] / builds, 3) if builds else 0.0,
+                    "build_ms_last": agg["build_ms_last"],
+                }
+            hits = sum(r["hits"] for r in roles.values())
+            total = hits + sum(r["misses"] for r in roles.values())
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": hits,
+                "misses": total - hits,
+                "hit_rate": round(hits / total * 100, 1) if total else 0.0,
+                "invalidations": self.invalidations,
+                "roles": roles,
+            }
+
+
+_instance: Optional[AgentPool] = None
+_instance_lock = threading.Lock()
+
+
+def get_agent_pool() -> AgentPool:
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = AgentPool()
+        return _instance
+
+
+def pooled_agent(config: Dict[str, Any], role: str, project_rules: Optional[Dict[str, Any]],
+                 builder: Callable[[], Any], router=None,
+                 tech_blueprint: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Agent fuer eine Rolle ueber den Pool - ohne aktiven Pool direkt builder().
+
+    Fehler bei der Key-Bildung (z.B. nicht serialisierbare Regeln) fallen auf
+    die direkte Konstruktion zurueck, damit der Pool nie einen Run blockiert.
+    """
+    settings = get_agent_pool_settings(config)
+    if not settings["enabled"]:
+        return builder()
+    try:
+        model = resolve_model(config, role, router)
+        rules_hash = hash_key(json.dumps(project_rules or {}, sort_keys=True, default=str))
+        tech_fp = tech_fingerprint(tech_blueprint)
+        config_fp = config_fingerprint(config)
+    except Exception as e:
+        logger.debug("[AgentPool] Kein Pool-Key fuer %s: %s", role, e)
+        return builder()
+    pool = get_agent_pool()
+    pool.max_entries = settings["max_entries"]
+    return pool.get_or_build(role, model, rules_hash, tech_fp, config_fp, builder)
@@ -7,6 +7,7 @@ Beschreibung: FastAPI Backend - REST API und WebSocket-Endpunkte für das Multi-
               ÄNDERUNG 29.01.2026: API in Router-Module aufgeteilt.
               ÄNDERUNG 31.01.2026: Dependency-Check beim Server-Start.
               ÄNDERUNG 31.01.2026: Automatischer Health-Check und periodischer Re-Check.
+              AENDERUNG 18.10.2026: Lazy OrchestrationManager + Startup-Profiler.
 """
 # ÄNDERUNG 29.01.2026: Router-Registrierung ausgelagert und File-Size reduziert
 # ÄNDERUNG [31.01.2026]: Dependency-Check ohne Auto-Install in Produktion
@@ -16,6 +17,11 @@ import logging
 import asyncio
 from contextlib import asynccontextmanager
 
+# AENDERUNG 18.10.2026: Startup-Profiler zuerst - Import-Baum mit PROFILE_STARTUP=1
+from .startup_profiler import get_startup_profiler, enable_from_env
+enable_from_env()
+_startup_profiler = get_startup_profiler()
+
 # Dependency-Check VOR allen anderen Imports (ausser logging)
 # Auto-Install nur in DEV-Umgebungen aktivieren
 def _is_dev_env() -> bool:
@@ -26,7 +32,8 @@ def _is_dev_env() -> bool:
 try:
     from .dependency_checker import check_and_install_dependencies
     _auto_install = _is_dev_env()
-    _dep_result = check_and_install_dependencies(auto_install=_auto_install)
+    with _startup_profiler.phase("dependency_check"):
+        _dep_result = check_and_install_dependencies(auto_install=_auto_install)
     if _dep_result["failed"]:
         logging.warning(f"Einige Dependencies konnten nicht installiert werden: {_dep_result['failed']}")
     if not _auto_install and _dep_result.get("missing"):
@@ -34,13 +41,15 @@ try:
 except Exception as e:
     logging.warning(f"Dependency-Check fehlgeschlagen: {e}")
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from slowapi.errors import RateLimitExceeded
-from slowapi import _rate_limit_exceeded_handler
-from .middleware import SecurityHeadersMiddleware
-from .app_state import limiter
-from .routers import core, config, security, budget, library, external_bureau, dependencies, session, discovery
+with _startup_profiler.phase("import:fastapi"):
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from slowapi.errors import RateLimitExceeded
+    from slowapi import _rate_limit_exceeded_handler
+    from .middleware import SecurityHeadersMiddleware
+with _startup_profiler.phase("import:routers"):
+    from .app_state import limiter
+    from .routers import core, config, security, budget, library, external_bureau, dependencies, session, discovery
 
 # AENDERUNG 31.01.2026: Import fuer Health-Check
 from model_router import get_model_router
@@ -50,12 +59,25 @@ from .app_state import manager
 _health_check_task = None
 
 
+# AENDERUNG 18.10.2026: Inkrementelle Re-Checks (Fehler-Signale des Routers)
+# jede Minute, Voll-Re-Check der unavailable Modelle weiterhin alle 10 Minuten
+_FAILED_RECHECK_INTERVAL = 60
+_UNAVAILABLE_RECHECK_EVERY = 10
+
+
 async def _periodic_health_recheck():
-    """Periodischer Re-Check aller unavailable Modelle (alle 10 Minuten)."""
+    """Periodischer Re-Check: gemeldete Fehler jede Minute, unavailable alle 10 Minuten."""
+    tick = 0
     while True:
         try:
-            await asyncio.sleep(600)  # 10 Minuten warten
+            await asyncio.sleep(_FAILED_RECHECK_INTERVAL)
+            tick += 1
             router = get_model_router(manager.config)
+            rechecked = await router.recheck_failed_models()
+            if rechecked:
+                logging.info(f"Inkrementeller Re-Check: {len(rechecked)} Modelle geprueft")
+            if tick % _UNAVAILABLE_RECHECK_EVERY:
+                continue
             if router.permanently_unavailable:
                 logging.info(f"Periodischer Re-Check: Pruefe {len(router.permanently_unavailable)} unavailable Modelle...")
                 results = await router.recheck_unavailable_models()
@@ -74,8 +96,12 @@ async def _initial_health_check():
     # AENDERUNG 02.02.2026: Kurze Verzoegerung damit Server zuerst startet
     await asyncio.sleep(2)
     try:
+        # AENDERUNG 18.10.2026: Manager im Thread erzeugen (schwere Imports
+        # blockieren sonst den Event-Loop waehrend der ersten Requests)
+        config = await asyncio.to_thread(lambda: manager.config)
+        _startup_profiler.mark("manager_ready")
         logging.info("Background: Fuehre initialen Health-Check durch...")
-        router = get_model_router(manager.config)
+        router = get_model_router(config)
         results = await router.health_check_all_primary_models()
         unavailable = [r for r, info in results.items() if not info.get("available", True)]
         if unavailable:
@@ -102,6 +128,9 @@ async def lifespan(app):
     # Starte periodischen Re-Check Task
     _health_check_task = asyncio.create_task(_periodic_health_recheck())
     logging.info("Periodischer Health-Check Task gestartet (alle 10 Minuten)")
+    # AENDERUNG 18.10.2026: Run-Scheduler (Warteschlange, parallele Runs)
+    run_scheduler = runs.start_scheduler(asyncio.get_running_loop())
+    _startup_profiler.mark("ready")
 
     yield  # App laeuft
 
@@ -115,6 +144,8 @@ async def lifespan(app):
             except asyncio.CancelledError:
                 pass
     logging.info("Shutdown: Health-Check Tasks gestoppt")
+    if run_scheduler is not None:
+        run_scheduler.shutdown()
 
 
 app = FastAPI(
@@ -155,3 +186,15 @@ app.include_router(model_stats.router)
 # AENDERUNG 13.02.2026: Feature-Tracking API-Endpoints (Kanban-Board)
 from backend.routers import features
 app.include_router(features.router)
+# AENDERUNG 18.10.2026: Startup-Profil (GET /startup/profile)
+from backend.routers import startup
+app.include_router(startup.router)
+# AENDERUNG 18.10.2026: Live-Sicht des OperationSupervisors (GET /operations)
+from backend.routers import operations
+app.include_router(operations.router)
+# AENDERUNG 18.10.2026: Run-Traces (GET /traces, GET /traces/{run_id})
+from backend.routers import traces
+app.include_router(traces.router)
+# AENDERUNG 18.10.2026: Run-Warteschlange mit Admission-Control (POST/GET/DELETE /runs)
+from backend.routers import runs
+app.include_router(runs.router)
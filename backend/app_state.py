@@ -4,13 +4,16 @@ Author: rahn
 Datum: 29.01.2026
 Version: 1.0
 Beschreibung: Zentrale App-Objekte für FastAPI-Router.
+              AENDERUNG 18.10.2026: OrchestrationManager wird lazy erzeugt.
 """
 # ÄNDERUNG 29.01.2026: Zentrale App-Objekte für Router-Splitting
 
 import asyncio
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from .orchestration_manager import OrchestrationManager
+# AENDERUNG 18.10.2026: Kein Import von orchestration_manager beim Laden -
+# der zieht CrewAI, LiteLLM, alle Agenten, Playwright- und Docker-Module nach
+from .lazy_loader import LazyInstance
 
 # ÄNDERUNG 25.01.2026: Konstante für Default max_retries
 DEFAULT_MAX_RETRIES = 5
@@ -64,6 +67,14 @@ class ConnectionManager:
                         pass  # Bereits entfernt
 
 
-manager = OrchestrationManager()
+def _create_manager():
+    """Erzeugt den OrchestrationManager beim ersten Zugriff auf `manager`."""
+    from .orchestration_manager import OrchestrationManager
+    return OrchestrationManager()
+
+
+# AENDERUNG 18.10.2026: Proxy statt Instanz - Endpoints wie /budget/stats
+# brauchen den Manager nicht, der Server startet ohne den Import-Baum
+manager = LazyInstance(_create_manager, "OrchestrationManager")
 ws_manager = ConnectionManager()
 limiter = Limiter(key_func=get_remote_address)
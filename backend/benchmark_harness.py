@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: End-to-End Benchmark der Orchestrierung mit aufgezeichneten LLM-Antworten.
+              Treibt run_task() fuer die Referenzprojekte aus
+              benchmarks/reference_projects.yaml (Flask, Next.js, CLI) mit einer
+              LLM-Kassette (backend/llm_cassette.py) statt echter Modelle.
+              - Messwerte: Wall-Zeit, CPU-Zeit (inkl. Kindprozesse), Peak-RSS,
+                geschriebene Bytes (Prozess-I/O und Projekt-Output) und
+                Phasen-Zeiten aus dem Run-Trace (backend/run_tracer.py)
+              - jedes Projekt laeuft standardmaessig in einem eigenen Prozess
+                (Peak-RSS und Singletons pro Run)
+              - Vergleich mit einer Baseline-Datei, Exit-Code 1 bei Regression
+
+              CLI:
+                python -m backend.benchmark_harness list
+                python -m backend.benchmark_harness record <projekt>
+                python -m backend.benchmark_harness run [projekte ...] [--latency-scale 1.0]
+                    [--latency-ms N] [--repeat 1] [--in-process] [--baseline datei]
+                    [--tolerance 0.2] [--save-baseline] [--json]
+"""
+
+import copy
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from .llm_cassette import (
+    cassette_path,
+    finish_cassette_recording,
+    finish_cassette_replay,
+    start_cassette_recording,
+    start_cassette_replay,
+)
+from .run_tracer import TRACE_DIR, TRACE_SUFFIX, trace_path
+from .trace_report import build_report, list_traces, load_trace
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARK_DIR = os.path.join(BASE_DIR, "benchmarks")
+PROJECTS_FILE = os.path.join(BENCHMARK_DIR, "reference_projects.yaml")
+CASSETTE_DIR = os.path.join(BENCHMARK_DIR, "cassettes")
+RESULTS_DIR = os.path.join(BASE_DIR, "budget_data", "benchmarks")
+
+DEFAULT_TOLERANCE = 0.2
+COMPARED_METRICS = ("wall_seconds", "cpu_seconds", "peak_rss_mb", "io_write_bytes")
+# Kuerzere Phasen schwanken zu stark fuer einen prozentualen Vergleich
+MIN_PHASE_MS = 250
+
+# Offline und deterministisch: keine externen Dienste, kein Docker, kein Smoke-Test
+BENCHMARK_OVERRIDES: Dict[str, Any] = {
+    "external_specialists": {"enabled": False},
+    "doc_enrichment": {"enabled": False},
+    "smoke_test": {"enabled": False},
+    "docker": {"enabled": False, "fallback_to_host": True},
+    "run_tracing": {"enabled": True},
+    "llm_cassettes": {"record": False},
+}
+
+
+def load_reference_projects(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Referenzprojekte (Name → goal, project_name, config_overrides)."""
+    with open(path or PROJECTS_FILE, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return dict(data.get("projects") or {})
+
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    result = copy.deepcopy(base)
+    for key, value in (override or {}).items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _deep_merge(result[key], value)
+        else:
+            result[key] = copy.deepcopy(value)
+    return result
+
+
+def build_benchmark_config(base_config: Dict[str, Any], overrides: Optional[Dict[str, Any]] = None,
+                           replay: bool = True) -> Dict[str, Any]:
+    """config.yaml + Benchmark-Defaults + Projekt-Overrides."""
+    config = _deep_merge(_deep_merge(base_config or {}, BENCHMARK_OVERRIDES), overrides or {})
+    sdk = config.get("claude_sdk")
+    if replay and isinstance(sdk, dict):
+        # TPM-Schutz vor Claude-Aufrufen ist im Replay reine Wartezeit
+        sdk["pre_call_cooldown"] = {}
+    return config
+
+
+# =========================================================================
+# Ressourcen-Messung (Linux: /proc, sonst resource/os.times soweit vorhanden)
+# =========================================================================
+
+def _read_proc_fields(name: str) -> Dict[str, int]:
+    fields: Dict[str, int] = {}
+    try:
+        with open(f"/proc/self/{name}", "r", encoding="ascii") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                parts = value.split()
+                if parts and parts[0].isdigit():
+                    fields[key.strip()] = int(parts[0]) * (1024 if parts[1:] == ["kB"] else 1)
+    except OSError:
+        pass
+    return fields
+
+
+def _reset_peak_rss() -> bool:
+    """Setzt VmHWM zurueck (Linux >= 4.0), damit Peak-RSS nur den Run misst."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    peak = _read_proc_fields("status").get("VmHWM")
+    if peak:
+        return peak
+    try:
+        import resource
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+def _io_write_bytes() -> Optional[int]:
+    return _read_proc_fields("io").get("write_bytes")
+
+
+def directory_size(path: Optional[str]) -> Tuple[int, int]:
+    """(Bytes, Dateien) unterhalb von path."""
+    total = files = 0
+    if not path or not os.path.isdir(path):
+        return 0, 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+                files += 1
+            except OSError:
+                continue
+    return total, files
+
+
+def measure(workload: Callable[[], Any]) -> Tuple[Any, Dict[str, Any]]:
+    """Fuehrt workload aus und misst Wall-/CPU-Zeit, Peak-RSS und Prozess-I/O."""
+    peak_is_run_local = _reset_peak_rss()
+    io_before = _io_write_bytes()
+    times_before = os.times()
+    cpu_before = time.process_time()
+    start = time.perf_counter()
+    value = workload()
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_before
+    times_after = os.times()
+    io_after = _io_write_bytes()
+    peak = _peak_rss_bytes()
+    children = (times_after.children_user - times_before.children_user
+                + times_after.children_system - times_before.children_system)
+    return value, {
+        "wall_seconds": round(wall, 3),
+        "cpu_seconds": round(cpu + children, 3),
+        "children_cpu_seconds": round(children, 3),
+        "peak_rss_mb": round(peak / (1024 * 1024), 1) if peak else None,
+        "peak_rss_run_local": peak_is_run_local,
+        "io_write_bytes": (io_after - io_before) if io_before is not None and io_after is not None else None,
+    }
+
+
+def trace_timings(path: Optional[str]) -> Dict[str, Any]:
+    """Phasen-Zeiten und Kategorien aus einem Run-Trace."""
+    if not path or not os.path.isfile(path):
+        return {"phases_ms": {}, "self_by_category_ms": {}, "critical_by_category_ms": {},
+                "iterations": 0, "llm_calls": 0}
+    meta, spans = load_trace(path)
+    phases: Dict[str, float] = {}
+    for span in spans:
+        if span["cat"] == "phase":
+            phases[span["name"]] = round(phases.get(span["name"], 0.0) + span["dur_us"] / 1000, 1)
+    report = build_report(meta, spans, top=0)
+    return {
+        "phases_ms": phases,
+        "self_by_category_ms": report["self_by_category_ms"],
+        "critical_by_category_ms": report["critical_by_category_ms"],
+        "iterations": sum(1 for s in spans if s["cat"] == "iteration"),
+        "llm_calls": sum(1 for s in spans if s["cat"] == "llm"),
+    }
+
+
+def _find_trace(manager: Any, started_at: float) -> Optional[str]:
+    run_id = getattr(manager, "_stats_project_id", None)
+    if run_id:
+        path = trace_path(run_id)
+        if os.path.isfile(path):
+            return path
+    # Fallback-ID (ohne Library): neuester Trace seit Run-Start
+    for entry in list_traces():
+        if entry["modified"] >= started_at:
+            return os.path.join(TRACE_DIR, entry["run_id"] + TRACE_SUFFIX)
+    return None
+
+
+# =========================================================================
+# Benchmark-Lauf
+# =========================================================================
+
+def _default_manager_factory(config_path: str):
+    from .orchestration_manager import OrchestrationManager
+    return OrchestrationManager(config_path=config_path)
+
+
+def run_project(name: str, project: Dict[str, Any], cassette: Optional[str] = None,
+                latency_scale: float = 1.0, latency_ms: Optional[float] = None,
+                strict: bool = True, record_to: Optional[str] = None,
+                base_config_path: Optional[str] = None,
+                manager_factory: Callable[[str], Any] = _default_manager_factory) -> Dict[str, Any]:
+    """
+    Ein Benchmark-Lauf fuer ein Referenzprojekt im aktuellen Prozess.
+
+    Mit cassette: Replay (keine echten LLM-Aufrufe). Mit record_to: echte
+    Aufrufe, Antworten werden in die Kassette geschrieben. Die Manager-
+    Initialisierung zaehlt nicht zur gemessenen Zeit.
+    """
+    with open(base_config_path or os.path.join(BASE_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+        base_config = yaml.safe_load(f) or {}
+    config = build_benchmark_config(base_config, project.get("config_overrides"),
+                                    replay=record_to is None)
+    result: Dict[str, Any] = {"project": name, "mode": "record" if record_to else "replay",
+                              "latency_scale": latency_scale, "latency_ms": latency_ms, "error": None}
+
+    with tempfile.TemporaryDirectory(prefix="bench_cfg_") as tmp:
+        config_path = os.path.join(tmp, "config.yaml")
+        with open(config_path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(config, f, allow_unicode=True, sort_keys=False)
+
+        if record_to:
+            start_cassette_recording(record_to, source=f"benchmark:{name}")
+        else:
+            start_cassette_replay(cassette, latency_scale=latency_scale,
+                                  latency_ms=latency_ms, strict=strict)
+        cassette_stats = None
+        manager = None
+        started_at = time.time()
+        try:
+            manager = manager_factory(config_path)
+            started_at = time.time()
+
+            def workload():
+                try:
+                    manager.run_task(project["goal"], project_name=project.get("project_name"))
+                except Exception as e:
+                    result["error"] = f"{type(e).__name__}: {e}"[:500]
+
+            _, metrics = measure(workload)
+            result.update(metrics)
+        finally:
+            if record_to:
+                result["cassette"] = finish_cassette_recording()
+            else:
+                cassette_stats = finish_cassette_replay()
+                result["cassette"] = cassette_stats
+
+    output_dir = getattr(manager, "project_path", None)
+    result["output_bytes"], result["output_files"] = directory_size(output_dir)
+    result["output_dir"] = output_dir
+    result["trace"] = _find_trace(manager, started_at)
+    result.update(trace_timings(result["trace"]))
+    if cassette_stats and cassette_stats.get("misses") and not result["error"]:
+        result["error"] = f"{cassette_stats['misses']} Anfragen ohne Kassetten-Antwort"
+    return result
+
+
+def run_isolated(name: str, latency_scale: float = 1.0, latency_ms: Optional[float] = None,
+                 strict: bool = True, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """run_project in einem frischen Python-Prozess (eigener Peak-RSS, frische Singletons)."""
+    with tempfile.TemporaryDirectory(prefix="bench_out_") as tmp:
+        out = os.path.join(tmp, "result.json")
+        cmd = [sys.executable, "-m", "backend.benchmark_harness", "run-one", name,
+               "--out", out, "--latency-scale", str(latency_scale)]
+        if latency_ms is not None:
+            cmd += ["--latency-ms", str(latency_ms)]
+        if not strict:
+            cmd.append("--lenient")
+        proc = subprocess.run(cmd, cwd=BASE_DIR, capture_output=True, text=True, timeout=timeout)
+        if os.path.isfile(out):
+            with open(out, "r", encoding="utf-8") as f:
+                return json.load(f)
+    tail = (proc.stderr or proc.stdout or "").strip().splitlines()[-5:]
+    return {"project": name, "mode": "replay", "error": f"Exit {proc.returncode}: " + " | ".join(tail)}
+
+
+def _median_run(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    ok = [r for r in runs if not r.get("error") and r.get("wall_seconds") is not None]
+    if not ok:
+        return runs[-1]
+    median = statistics.median_low([r["wall_seconds"] for r in ok])
+    result = dict(next(r for r in ok if r["wall_seconds"] == median))
+    result["repeats"] = len(runs)
+    result["wall_seconds_all"] = [r.get("wall_seconds") for r in runs]
+    return result
+
+
+# =========================================================================
+# Baseline-Vergleich und Ausgabe
+# =========================================================================
+
+def compare_to_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any],
+                        tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Regressionen gegenueber der Baseline (Wert > Baseline * (1 + tolerance))."""
+    previous = {r["project"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        base = previous.get(result["project"])
+        if not base or result.get("error"):
+            continue
+        checks = [(metric, result.get(metric), base.get(metric)) for metric in COMPARED_METRICS]
+        for phase, ms in (result.get("phases_ms") or {}).items():
+            base_ms = (base.get("phases_ms") or {}).get(phase)
+            if base_ms is not None and max(ms, base_ms) >= MIN_PHASE_MS:
+                checks.append((f"phase:{phase}", ms, base_ms))
+        for metric, value, base_value in checks:
+            if value is None or not base_value:
+                continue
+            if value > base_value * (1 + tolerance):
+                regressions.append(f"{result['project']}: {metric} {value} > {base_value} "
+                                   f"(+{100 * (value / base_value - 1):.0f}%)")
+    return regressions
+
+
+def render_table(results: List[Dict[str, Any]]) -> str:
+    """Text-Tabelle fuer die CLI."""
+    lines = [f"{'Projekt':<18} {'Wall s':>8} {'CPU s':>8} {'RSS MB':>8} {'I/O KB':>9} "
+             f"{'Output KB':>10} {'LLM':>5}  Phasen"]
+    for r in results:
+        if r.get("error") and r.get("wall_seconds") is None:
+            lines.append(f"{r['project']:<18} FEHLER: {r['error']}")
+            continue
+        io_kb = "-" if r.get("io_write_bytes") is None else f"{r['io_write_bytes'] / 1024:.0f}"
+        phases = ", ".join(f"{k} {v / 1000:.1f}s" for k, v in
+                           sorted((r.get("phases_ms") or {}).items(), key=lambda kv: -kv[1])[:5])
+        lines.append(f"{r['project']:<18} {r['wall_seconds']:>8.2f} {r['cpu_seconds']:>8.2f} "
+                     f"{r.get('peak_rss_mb') or '-':>8} {io_kb:>9} "
+                     f"{r.get('output_bytes', 0) / 1024:>10.0f} {r.get('llm_calls', 0):>5}  {phases}")
+        if r.get("error"):
+            lines.append(f"{'':<18} FEHLER: {r['error']}")
+    return "\n".join(lines)
+
+
+def _save_results(results: List[Dict[str, Any]], path: Optional[str] = None) -> str:
+    path = path or os.path.join(RESULTS_DIR, time.strftime("bench_%Y%m%d_%H%M%S.json"))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"created_at": time.time(), "results": results}, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="End-to-End Benchmark mit LLM-Kassetten")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Referenzprojekte und Kassetten anzeigen")
+
+    record = sub.add_parser("record", help="Kassette mit echten LLM-Aufrufen aufnehmen")
+    record.add_argument("project")
+
+    for name in ("run", "run-one"):
+        cmd = sub.add_parser(name, help="Replay-Benchmark" if name == "run" else argparse.SUPPRESS)
+        cmd.add_argument("projects", nargs="*" if name == "run" else 1)
+        cmd.add_argument("--latency-scale", type=float, default=1.0,
+                         help="Faktor auf die aufgezeichnete Latenz (0 = ohne Wartezeit)")
+        cmd.add_argument("--latency-ms", type=float, default=None, help="Feste Latenz pro Aufruf")
+        cmd.add_argument("--lenient", action="store_true",
+                         help="Fehlende Antworten mit der letzten des Agenten beantworten")
+        if name == "run-one":
+            cmd.add_argument("--out", required=True)
+        else:
+            cmd.add_argument("--repeat", type=int, default=1)
+            cmd.add_argument("--in-process", action="store_true")
+            cmd.add_argument("--baseline", default=None)
+            cmd.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+            cmd.add_argument("--save-baseline", action="store_true")
+            cmd.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    projects = load_reference_projects()
+
+    if args.command == "list":
+        for name, project in projects.items():
+            available = "Kassette" if os.path.isfile(cassette_path(name, CASSETTE_DIR)) else "keine Kassette"
+            print(f"{name:<18} [{available}] {project.get('description', '')}")
+        return 0
+
+    if args.command == "record":
+        if args.project not in projects:
+            print(f"Unbekanntes Projekt: {args.project}", file=sys.stderr)
+            return 2
+        path = cassette_path(args.project, CASSETTE_DIR)
+        result = run_project(args.project, projects[args.project], record_to=path)
+        print(render_table([result]))
+        print(f"Kassette: {path}")
+        return 1 if result.get("error") else 0
+
+    if args.command == "run-one":
+        name = args.projects[0]
+        result = run_project(name, projects[name], cassette=cassette_path(name, CASSETTE_DIR),
+                             latency_scale=args.latency_scale, latency_ms=args.latency_ms,
+                             strict=not args.lenient)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+        return 0
+
+    names = args.projects or list(projects)
+    unknown = [n for n in names if n not in projects]
+    missing = [n for n in names if n in projects and not os.path.isfile(cassette_path(n, CASSETTE_DIR))]
+    if unknown or missing:
+        for n in unknown:
+            print(f"Unbekanntes Projekt: {n}", file=sys.stderr)
+        for n in missing:
+            print(f"Keine Kassette fuer {n} - zuerst: python -m backend.benchmark_harness record {n}",
+                  file=sys.stderr)
+        return 2
+
+    results = []
+    for name in names:
+        runs = []
+        for _ in range(max(1, args.repeat)):
+            if args.in_process:
+                runs.append(run_project(name, projects[name], cassette=cassette_path(name, CASSETTE_DIR),
+                                        latency_scale=args.latency_scale, latency_ms=args.latency_ms,
+                                        strict=not args.lenient))
+            else:
+                runs.append(run_isolated(name, args.latency_scale, args.latency_ms, not args.lenient))
+        results.append(_median_run(runs))
+
+    saved = _save_results(results)
+    regressions: List[str] = []
+    if args.baseline and os.path.isfile(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+    if args.save_baseline and args.baseline:
+        _save_results(results, args.baseline)
+
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressions}, indent=2, ensure_ascii=False))
+    else:
+        print(render_table(results))
+        print(f"\nErgebnisse: {saved}")
+        for line in regressions:
+            print(f"REGRESSION {line}")
+    return 1 if regressions or any(r.get("error") for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
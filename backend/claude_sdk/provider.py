@@ -18,9 +18,16 @@ import time
 from typing import Callable, Optional
 
 from . import loader as state
+from ..prompt_cache import split_cacheable, usage_from_sdk_result
+from ..llm_cassette import get_cassette_player, record_llm_call
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYSTEM_PROMPT = (
+    "Gib nur den angeforderten Output zurueck. "
+    "Keine Erklaerungen oder Kommentare ausserhalb des angeforderten Formats."
+)
+
 
 class ClaudeSDKProvider:
     """
@@ -37,6 +44,8 @@ class ClaudeSDKProvider:
         self._initialized = False
         # AENDERUNG 25.02.2026: Fix 85 — Aktiven CLI-Prozess tracken fuer sauberen Stop
         self._current_process = None
+        # AENDERUNG 18.10.2026: Echte Token-Usage (inkl. Cache) des letzten SDK-Calls pro Thread
+        self._usage_local = threading.local()
         logger.info("ClaudeSDKProvider initialisiert (Lazy-Loading)")
 
     def kill_active_process(self):
@@ -262,8 +271,10 @@ class ClaudeSDKProvider:
         use_cli_mode: bool = False,
         max_output_tokens: Optional[int] = None,
     ) -> str:
+        # AENDERUNG 18.10.2026: Benchmark-Replay beantwortet den Aufruf aus der LLM-Kassette
+        cassette_player = get_cassette_player()
         # AENDERUNG 22.02.2026: Fix 75a — CLI-Modus braucht kein SDK-Lazy-Loading
-        if not use_cli_mode:
+        if not use_cli_mode and cassette_player is None:
             self._ensure_initialized()
 
         agent_display_name = role.capitalize()
@@ -285,13 +296,28 @@ class ClaudeSDKProvider:
 
         start_time = time.time()
 
+        # AENDERUNG 18.10.2026: Im SDK-Modus wandert der stabile Prompt-Praefix in den
+        # System-Prompt, den das SDK automatisch cached. Der CLI-Modus behaelt ihn im
+        # stdin-Prompt (Kommandozeilen-Limit), dort cached die CLI den Praefix selbst.
+        prompt_chars = len(prompt)
+        original_prompt = prompt
+        cache_prefix, prompt_suffix = split_cacheable(prompt)
+        if cache_prefix and use_cli_mode:
+            prompt = f"{cache_prefix}\n{prompt_suffix}"
+        elif cache_prefix:
+            system_prompt = f"{system_prompt or DEFAULT_SYSTEM_PROMPT}\n\n{cache_prefix}"
+            prompt = prompt_suffix
+        self._usage_local.usage = None
+
         try:
             # AENDERUNG 22.02.2026: Fix 75a — CLI-Modus fuer einfache Rollen
             # ROOT-CAUSE-FIX:
             # Symptom: Einfache Rollen (DB-Designer etc.) brauchen 2+ Min
             # Ursache: allowed_tools=[] = ALLE Tools → Claude liest Dateien statt zu antworten
             # Loesung: `claude -p` Subprozess mit --max-turns 1 → keine Tools, direkte Antwort
-            if use_cli_mode:
+            if cassette_player is not None:
+                result = cassette_player.replay("claude_sdk", agent_display_name, model, original_prompt)
+            elif use_cli_mode:
                 result = self._run_cli(
                     prompt=prompt,
                     model=model,
@@ -313,16 +339,22 @@ class ClaudeSDKProvider:
                 )
 
             latency_ms = (time.time() - start_time) * 1000
-            prompt_tokens_est = len(prompt) // 3
-            completion_tokens_est = len(result) // 3
+            usage = usage_from_sdk_result(getattr(self._usage_local, "usage", None)) or {
+                "prompt_tokens": prompt_chars // 3,
+                "completion_tokens": len(result) // 3,
+                "cached_tokens": 0,
+            }
             self._record_success(
                 role=role,
                 model=model,
-                prompt_tokens=prompt_tokens_est,
-                completion_tokens=completion_tokens_est,
+                prompt_tokens=usage["prompt_tokens"],
+                completion_tokens=usage["completion_tokens"],
                 latency_ms=latency_ms,
                 project_id=project_id,
+                cached_tokens=usage["cached_tokens"],
             )
+            record_llm_call("claude_sdk", agent_display_name, model, original_prompt, result,
+                            latency_ms=latency_ms, usage=usage)
 
             if ui_log_callback:
                 ui_log_callback(
@@ -398,10 +430,7 @@ class ClaudeSDKProvider:
         # Symptom: TechStack/DB-Designer/Designer liefern ~28 Zeichen via CLI
         # Ursache: Kein System-Prompt → Claude antwortet konversationell statt strukturiert
         # Loesung: Default System-Prompt wie in _run_sync() (Zeile 226-227)
-        effective_system = system_prompt or (
-            "Gib nur den angeforderten Output zurueck. "
-            "Keine Erklaerungen oder Kommentare ausserhalb des angeforderten Formats."
-        )
+        effective_system = system_prompt or DEFAULT_SYSTEM_PROMPT
         cmd.extend(["--system-prompt", effective_system])
 
         # CLAUDECODE Env-Var entfernen (Nested-Session-Prevention, wie in _run_sync)
@@ -492,13 +521,12 @@ class ClaudeSDKProvider:
         """Synchroner Wrapper fuer async claude-agent-sdk query()."""
         import anyio
 
-        result_container = {"text": "", "error": None, "traceback_obj": None}
+        result_container = {"text": "", "error": None, "traceback_obj": None, "usage": None}
         stop_event = threading.Event()
 
         async def _async_query():
             base_option_kwargs = {
-                "system_prompt": system_prompt
-                or "Gib nur den angeforderten Output zurueck. Keine Erklaerungen oder Kommentare ausserhalb des angeforderten Formats.",
+                "system_prompt": system_prompt or DEFAULT_SYSTEM_PROMPT,
                 "allowed_tools": tools or [],
                 "max_turns": max_turns,
                 "cwd": cwd,
@@ -591,6 +619,7 @@ class ClaudeSDKProvider:
                     elif isinstance(message, state._sdk_result_message):
                         if message.result and not result_text:
                             result_text = message.result
+                        result_container["usage"] = getattr(message, "usage", None)
                     else:
                         logger.debug("SDK-DIAG: Unbehandelter Typ: %s", msg_type_name)
             finally:
@@ -628,6 +657,7 @@ class ClaudeSDKProvider:
                 raise result_container["error"].with_traceback(traceback_obj)
             raise result_container["error"]
 
+        self._usage_local.usage = result_container["usage"]
         if not result_container["text"]:
             raise ValueError(
                 f"Claude SDK ({model}): Leere Antwort erhalten. "
@@ -644,6 +674,7 @@ class ClaudeSDKProvider:
         completion_tokens: int,
         latency_ms: float,
         project_id: Optional[str],
+        cached_tokens: int = 0,
     ):
         model_full = state.CLAUDE_MODEL_MAP.get(model, model)
         model_id = f"claude-sdk/{model_full}"
@@ -658,6 +689,7 @@ class ClaudeSDKProvider:
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
                 project_id=project_id,
+                cached_tokens=cached_tokens,
             )
         except Exception as e:
             logger.debug("BudgetTracker.record_usage() Fehler: %s", e)
@@ -675,6 +707,7 @@ class ClaudeSDKProvider:
                 cost_usd=0.0,
                 latency_ms=latency_ms,
                 success=True,
+                cached_tokens=cached_tokens,
             )
         except Exception as e:
             logger.debug("ModelStatsDB.record_call() Fehler: %s", e)
@@ -2,18 +2,20 @@
 """
 Author: rahn
 Datum: 24.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Claude SDK Retry/Heartbeat-Logik.
+              AENDERUNG 18.10.2026: Abbruch ueber den OperationSupervisor beendet
+              die Retry-Schleife und unterbricht Cooldown/Backoff.
 """
 
 import logging
-import time
 import random
 import json
 import re
 from typing import Optional
 
 from . import loader as state
+from ..operation_supervisor import OperationCancelled, cancellable_sleep, check_cancelled
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +27,11 @@ logger = logging.getLogger(__name__)
 #          aufgerufen via loop.run_until_complete → asyncio.run() = RuntimeError)
 # Loesung: time.sleep() blockiert zuverlaessig unabhaengig vom Event-Loop-Kontext
 def _sleep_with_blocking(seconds: float) -> None:
-    """Fuehrt einen blockierenden Sleep durch (sicher in jedem Kontext)."""
-    if seconds > 0:
-        time.sleep(seconds)
+    """
+    Fuehrt einen blockierenden Sleep durch (sicher in jedem Kontext).
+    AENDERUNG 18.10.2026: Innerhalb einer Supervisor-Operation abbrechbar.
+    """
+    cancellable_sleep(seconds)
 
 
 def _truncate_prompt_to_token_limit(prompt: str, token_limit: int) -> str:
@@ -389,6 +393,7 @@ def run_sdk_with_retry(
     last_short_preview = ""
 
     for sdk_attempt in range(retries):
+        check_cancelled()
         try:
             raw_output = run_with_heartbeat(
                 func=lambda: manager.claude_provider.run_agent(
@@ -496,6 +501,10 @@ def run_sdk_with_retry(
                 )
                 continue
 
+        except OperationCancelled:
+            # Abbruch ist kein SDK-Fehler: kein Retry, kein OpenRouter-Fallback
+            manager._ui_log(display_name, "Cancelled", "Claude SDK Aufruf abgebrochen")
+            raise
         except Exception as sdk_error:
             error_str = str(sdk_error)
 
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Kontext-Auswahl fuer Einzeldatei-Prompts (File-by-File, ParallelGen).
+              Statt der ersten 50 Zeilen JEDER bereits erstellten Datei werden
+              die Dateien fuer die Zieldatei gerankt:
+              - geplante Abhaengigkeiten (depends_on aus Plan/Dependency-Graph)
+              - Naehe im Import-Graph (Python, JS/TS, HTML/Jinja, CSS)
+              - Pfad-Aehnlichkeit (Verzeichnis, Namens-Tokens)
+              Vollstaendiger Inhalt nur fuer direkte Abhaengigkeiten, sonst
+              Export-Signaturen - alles unter einem Token-Budget. Die Prompt-
+              Groesse bleibt damit unabhaengig von der Anzahl erstellter Dateien.
+"""
+
+import re
+import posixpath
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+CHARS_PER_TOKEN = 3  # wie est_tokens in prompt_assembly
+DEFAULT_BUDGET_TOKENS = 6000
+LEGACY_LINES = 50
+MAX_SIGNATURE_LINES = 40
+HEAD_LINES = 10
+MAX_OMITTED_NAMES = 40
+
+HEADER = "\n\nBEREITS ERSTELLTE DATEIEN (als Referenz):\n"
+
+_PY_FROM = re.compile(r"^\s*from\s+(\.*[\w.]*)\s+import\s+\(?([\w*, ]+)", re.M)
+_PY_IMPORT = re.compile(r"^\s*import\s+([\w., ]+)", re.M)
+_JS_IMPORT = re.compile(r"""(?:\bfrom\s*|\bimport\s*\(?\s*|\brequire\(\s*)['"]([^'"]+)['"]""")
+_HTML_REF = re.compile(r"""(?:\bsrc|\bhref)\s*=\s*['"]([^'"#?{}]+)""")
+_JINJA_REF = re.compile(r"""\{%-?\s*(?:extends|include|import|from)\s+['"]([^'"]+)['"]""")
+_CSS_IMPORT = re.compile(r"""@import\s+(?:url\()?\s*['"]?([^'")\s;]+)""")
+_JS_EXTS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".vue")
+_JS_SUFFIXES = ("",) + _JS_EXTS + tuple("/index" + ext for ext in _JS_EXTS)
+
+_PY_SIGNATURE = re.compile(
+    r"^(?:(?:async\s+)?def\s|class\s|@\w[\w.]*\.(?:route|get|post|put|delete|patch)\b"
+    r"|\s{4}(?:async\s+)?def\s(?!_)|[A-Z_][A-Z0-9_]*\s*[:=]|\w+\s*=\s*(?:Flask|Blueprint|FastAPI|APIRouter|SQLAlchemy)\()")
+_JS_SIGNATURE = re.compile(
+    r"^\s*(?:export\s|module\.exports|exports\.\w+|(?:async\s+)?function\s+\w+|class\s+\w+"
+    r"|(?:app|router)\.(?:get|post|put|delete|patch|use)\(|(?:interface|type)\s+\w+)")
+_SQL_SIGNATURE = re.compile(r"^\s*CREATE\s+(?:TABLE|INDEX|VIEW)", re.I)
+_TEMPLATE_SIGNATURE = re.compile(r"\{%-?\s*(?:extends|block|include|macro)\b|<form\b|\bid\s*=")
+
+
+@dataclass
+class ContextSelection:
+    """Ausgewaehlter Kontext plus Groessen-Statistik fuer das UI-Log."""
+    text: str
+    full: List[str] = field(default_factory=list)
+    signatures: List[str] = field(default_factory=list)
+    omitted: List[str] = field(default_factory=list)
+    legacy_chars: int = 0
+    budget_chars: int = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "context_chars": len(self.text),
+            "legacy_chars": self.legacy_chars,
+            "saved_chars": self.legacy_chars - len(self.text),
+            "budget_chars": self.budget_chars,
+            "full": self.full,
+            "signatures": len(self.signatures),
+            "omitted": len(self.omitted),
+        }
+
+
+def get_context_settings(config: Any) -> Dict[str, Any]:
+    """single_file_context aus der Config - ohne Dict-Config bleibt das alte Verhalten."""
+    settings = {"enabled": False, "budget_tokens": DEFAULT_BUDGET_TOKENS}
+    if not isinstance(config, dict):
+        return settings
+    raw = config.get("single_file_context") or {}
+    if not isinstance(raw, dict):
+        raw = {}
+    settings["enabled"] = bool(raw.get("enabled", True))
+    budget = raw.get("budget_tokens", DEFAULT_BUDGET_TOKENS)
+    if isinstance(budget, int) and budget > 0:
+        settings["budget_tokens"] = budget
+    return settings
+
+
+# =========================================================================
+# Import-Graph
+# =========================================================================
+
+def _norm(path: str) -> str:
+    norm = posixpath.normpath(path.replace("\\", "/")) if path else ""
+    return "" if norm == "." else norm.lstrip("/")
+
+
+class _PathResolver:
+    """Loest Import-Referenzen gegen die bekannten Pfade auf (exakt oder per Suffix)."""
+
+    def __init__(self, paths: Iterable[str]):
+        self.paths = set(paths)
+        self._by_name: Dict[str, List[str]] = {}
+        for path in self.paths:
+            self._by_name.setdefault(posixpath.basename(path), []).append(path)
+
+    def find(self, candidate: str) -> Optional[str]:
+        candidate = _norm(candidate)
+        if not candidate or candidate.startswith(".."):
+            return None
+        if candidate in self.paths:
+            return candidate
+        matches = [p for p in self._by_name.get(posixpath.basename(candidate), ())
+                   if p.endswith("/" + candidate)]
+        return min(matches, key=len) if matches else None
+
+    def first(self, candidates: Iterable[str]) -> Optional[str]:
+        for candidate in candidates:
+            found = self.find(candidate)
+            if found:
+                return found
+        return None
+
+
+def _python_refs(path: str, content: str, resolver: _PathResolver) -> Set[str]:
+    directory = posixpath.dirname(path)
+    refs: Set[str] = set()
+
+    def module_candidates(module: str, base: str) -> List[str]:
+        if not module:
+            return [posixpath.join(base, "__init__.py")]
+        stem = posixpath.join(base, module.replace(".", "/"))
+        return [stem + ".py", posixpath.join(stem, "__init__.py")]
+
+    for module, names in _PY_FROM.findall(content):
+        dots = len(module) - len(module.lstrip("."))
+        base = directory
+        for _ in range(max(dots - 1, 0)):
+            base = posixpath.dirname(base)
+        base = base if dots else ""
+        module = module.lstrip(".")
+        for name in (n.strip() for n in names.split(",")):
+            if name and name != "*":
+                found = resolver.first(module_candidates(f"{module}.{name}" if module else name, base))
+                if found:
+                    refs.add(found)
+        found = resolver.first(module_candidates(module, base))
+        if found:
+            refs.add(found)
+    for modules in _PY_IMPORT.findall(content):
+        for module in (m.strip().split(" ")[0] for m in modules.split(",")):
+            found = resolver.first(module_candidates(module, "")) if module else None
+            if found:
+                refs.add(found)
+    return refs
+
+
+def _js_candidates(spec: str, directory: str) -> List[str]:
+    if spec.startswith("."):
+        stems = [posixpath.join(directory, spec)]
+    elif spec.startswith(("@/", "~/")):
+        stems = [spec[2:], "src/" + spec[2:]]
+    elif spec.startswith("/"):
+        stems = [spec[1:], "public/" + spec[1:], "static/" + spec[1:]]
+    else:
+        return []  # npm-Paket
+    return [posixpath.normpath(stem) + suffix for stem in stems for suffix in _JS_SUFFIXES]
+
+
+def _asset_candidates(ref: str, directory: str) -> List[str]:
+    if "://" in ref or ref.startswith(("mailto:", "data:", "//")):
+        return []
+    if ref.startswith("/"):
+        return [ref[1:], "static/" + ref[1:], "public/" + ref[1:]]
+    return [posixpath.normpath(posixpath.join(directory, ref)), ref, "static/" + ref, "templates/" + ref]
+
+
+def file_references(path: str, content: str, resolver: _PathResolver) -> Set[str]:
+    """Bekannte Dateien, die path importiert/einbindet."""
+    path = _norm(path)
+    directory = posixpath.dirname(path)
+    ext = posixpath.splitext(path)[1].lower()
+    refs: Set[str] = set()
+    if ext == ".py":
+        refs |= _python_refs(path, content, resolver)
+    if ext in _JS_EXTS or ext in (".html", ".htm", ".svelte", ".astro"):
+        for spec in _JS_IMPORT.findall(content):
+            found = resolver.first(_js_candidates(spec, directory))
+            if found:
+                refs.add(found)
+    if ext in (".html", ".htm", ".jinja", ".jinja2", ".j2", ".vue", ".svelte"):
+        for ref in _HTML_REF.findall(content) + _JINJA_REF.findall(content):
+            found = resolver.first(_asset_candidates(ref, directory))
+            if found:
+                refs.add(found)
+    if ext in (".css", ".scss", ".sass", ".less"):
+        for ref in _CSS_IMPORT.findall(content):
+            found = resolver.first(_asset_candidates(ref, directory))
+            if found:
+                refs.add(found)
+    refs.discard(path)
+    return refs
+
+
+def import_distances(target: str, existing_files: Dict[str, str],
+                     depends_on: Iterable[str] = ()) -> Dict[str, int]:
+    """
+    Abstand jeder Datei zur Zieldatei im (ungerichteten) Import-Graph.
+
+    Die Zieldatei existiert meist noch nicht - ihre Kanten sind die geplanten
+    Abhaengigkeiten plus alle Dateien, die sie bereits importieren.
+    """
+    target = _norm(target)
+    files = {_norm(path): content for path, content in existing_files.items()}
+    resolver = _PathResolver(list(files) + [target])
+    neighbours: Dict[str, Set[str]] = {path: set() for path in resolver.paths}
+    for path, content in files.items():
+        for ref in file_references(path, content or "", resolver):
+            neighbours[path].add(ref)
+            neighbours[ref].add(path)
+    for dep in depends_on:
+        found = resolver.find(dep)
+        if found and found != target:
+            neighbours[target].add(found)
+            neighbours[found].add(target)
+    distances = {target: 0}
+    queue = deque([target])
+    while queue:
+        current = queue.popleft()
+        for neighbour in neighbours[current]:
+            if neighbour not in distances:
+                distances[neighbour] = distances[current] + 1
+                queue.append(neighbour)
+    return distances
+
+
+# =========================================================================
+# Ranking und Signaturen
+# =========================================================================
+
+def _path_tokens(path: str) -> Set[str]:
+    stem = posixpath.splitext(path)[0]
+    spaced = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", stem)
+    tokens = {t.lower().rstrip("s") for t in re.split(r"[/\\._\-\s\[\]()]+", spaced) if len(t) > 1}
+    return tokens - {"src", "app", "index", "lib", "init"}
+
+
+def path_similarity(a: str, b: str) -> float:
+    """0..1 aus Namens-Token-Jaccard und gemeinsamem Verzeichnis."""
+    tokens_a, tokens_b = _path_tokens(a), _path_tokens(b)
+    union = tokens_a | tokens_b
+    score = 0.6 * (len(tokens_a & tokens_b) / len(union) if union else 0.0)
+    if posixpath.dirname(_norm(a)) == posixpath.dirname(_norm(b)):
+        score += 0.4
+    return score
+
+
+def export_signatures(path: str, content: str) -> str:
+    """Oeffentliche Schnittstelle einer Datei (def/class/export/Routen/Tabellen)."""
+    ext = posixpath.splitext(path)[1].lower()
+    if ext == ".py":
+        pattern = _PY_SIGNATURE
+    elif ext in _JS_EXTS:
+        pattern = _JS_SIGNATURE
+    elif ext == ".sql":
+        pattern = _SQL_SIGNATURE
+    elif ext in (".html", ".htm", ".jinja", ".jinja2", ".j2"):
+        pattern = _TEMPLATE_SIGNATURE
+    else:
+        pattern = None
+    lines = content.split("\n")
+    if pattern is not None:
+        picked = [line.rstrip().rstrip("{").rstrip()[:160] for line in lines if pattern.search(line)]
+        if picked:
+            extra = len(picked) - MAX_SIGNATURE_LINES
+            picked = picked[:MAX_SIGNATURE_LINES]
+            if extra > 0:
+                picked.append(f"... (+{extra} weitere)")
+            return "\n".join(picked)
+    head = "\n".join(lines[:HEAD_LINES])
+    return head + ("\n... (gekuerzt)" if len(lines) > HEAD_LINES else "")
+
+
+def legacy_context(existing_files: Dict[str, str]) -> str:
+    """Bisheriges Format: erste 50 Zeilen jeder Datei."""
+    if not existing_files:
+        return ""
+    text = HEADER
+    for filepath, content in existing_files.items():
+        lines = content.split('\n')
+        truncated = '\n'.join(lines[:LEGACY_LINES])
+        if len(lines) > LEGACY_LINES:
+            truncated += "\n... (gekuerzt)"
+        text += f"\n--- {filepath} ---\n{truncated}\n"
+    return text
+
+
+def legacy_selection(existing_files: Dict[str, str]) -> ContextSelection:
+    text = legacy_context(existing_files)
+    return ContextSelection(text=text, full=list(existing_files), legacy_chars=len(text))
+
+
+def rank_files(target: str, existing_files: Dict[str, str],
+               depends_on: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """Dateien nach Relevanz fuer target: geplante Deps, Import-Abstand, Pfad-Aehnlichkeit."""
+    target_norm = _norm(target)
+    resolver = _PathResolver(_norm(path) for path in existing_files)
+    planned = {resolver.find(dep) for dep in depends_on or ()} - {None}
+    distances = import_distances(target, existing_files, planned)
+    ranked = []
+    for path in existing_files:
+        norm = _norm(path)
+        direct = norm in planned or norm == target_norm
+        distance = distances.get(norm)
+        score = 1000.0 if direct else 0.0
+        if distance:
+            score += 100.0 / distance
+        score += 50.0 * path_similarity(norm, target_norm)
+        ranked.append({"path": path, "score": round(score, 2), "direct": direct, "distance": distance})
+    ranked.sort(key=lambda item: (-item["score"], item["path"]))
+    return ranked
+
+
+def select_context(target: str, existing_files: Dict[str, str],
+                   depends_on: Iterable[str] = (),
+                   budget_tokens: int = DEFAULT_BUDGET_TOKENS) -> ContextSelection:
+    """
+    Kontext-Block fuer den Einzeldatei-Prompt unter budget_tokens.
+
+    Direkte Abhaengigkeiten (und die Zieldatei selbst bei Reparaturen) kommen
+    vollstaendig, alle anderen als Signaturen in Ranking-Reihenfolge; was nicht
+    mehr passt, wird nur namentlich aufgefuehrt.
+    """
+    budget = max(budget_tokens, 0) * CHARS_PER_TOKEN
+    selection = ContextSelection(text="", budget_chars=budget,
+                                 legacy_chars=len(legacy_context(existing_files)))
+    if not existing_files:
+        return selection
+    blocks: List[str] = []
+    used = len(HEADER)
+    for item in rank_files(target, existing_files, depends_on):
+        path = item["path"]
+        content = existing_files[path] or ""
+        if not content.strip():
+            continue
+        block = f"\n--- {path} ---\n{content}\n" if item["direct"] else ""
+        if block and used + len(block) <= budget:
+            selection.full.append(path)
+        else:
+            block = f"\n--- {path} (Signaturen) ---\n{export_signatures(path, content)}\n"
+            if used + len(block) > budget:
+                selection.omitted.append(path)
+                continue
+            selection.signatures.append(path)
+        blocks.append(block)
+        used += len(block)
+    text = HEADER + "".join(blocks)
+    if selection.omitted:
+        names = selection.omitted[:MAX_OMITTED_NAMES]
+        more = len(selection.omitted) - len(names)
+        text += "\nWeitere vorhandene Dateien: " + ", ".join(names) + (f" (+{more})" if more > 0 else "") + "\n"
+    selection.text = text
+    return selection
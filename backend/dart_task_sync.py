@@ -1,19 +1,21 @@
 """
 Author: rahn
 Datum: 01.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Dart-Task-Synchronisation fuer externes Task-Tracking.
               Synchronisiert abgeleitete Tasks mit Dart Project Management.
+              AENDERUNG 18.10.2026: Geteilter HTTP-Client (Keep-Alive-Pool) statt
+              requests, sync_batch synchronisiert parallel.
 """
 
 import os
 import json
 import logging
-import requests
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from backend.task_models import DerivedTask, TaskStatus, TaskPriority
+from backend.http_client import get_http_client, HttpClientError
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +51,10 @@ class DartTaskSync:
         TaskStatus.SKIPPED: "Cancelled"
     }
 
+    # Timeout pro Request und maximale parallele Requests in sync_batch
+    REQUEST_TIMEOUT = 10
+    BATCH_CONCURRENCY = 4
+
     def __init__(self, token: str = None, dartboard: str = None):
         """
         Initialisiert den DartTaskSync.
@@ -103,23 +109,23 @@ class DartTaskSync:
         }
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 f"{self.API_BASE}/tasks/create",
                 headers=self._get_headers(),
-                json=payload,
-                timeout=10
+                json_body=payload,
+                timeout=self.REQUEST_TIMEOUT
             )
 
-            if response.status_code in [200, 201]:
+            if response.status in [200, 201]:
                 data = response.json()
                 dart_id = data.get("id") or data.get("duid")
                 logger.info("[DartTaskSync] Task %s -> Dart %s", task.id, dart_id)
                 return dart_id
             else:
-                logger.error("[DartTaskSync] Fehler: %s - %s", response.status_code, response.text[:200])
+                logger.error("[DartTaskSync] Fehler: %s - %s", response.status, response.text[:200])
                 return None
 
-        except requests.exceptions.RequestException as e:
+        except HttpClientError as e:
             logger.error("[DartTaskSync] Netzwerk-Fehler: %s", e)
             return None
 
@@ -151,23 +157,23 @@ class DartTaskSync:
         }
 
         try:
-            response = requests.patch(
+            response = get_http_client().patch(
                 f"{self.API_BASE}/tasks/update",
                 headers=self._get_headers(),
-                json=payload,
-                timeout=10
+                json_body=payload,
+                timeout=self.REQUEST_TIMEOUT
             )
 
-            if response.status_code in [200, 204]:
+            if response.status in [200, 204]:
                 # Kommentar hinzufuegen wenn vorhanden
                 if comment:
                     self.add_comment(dart_id, comment)
                 return True
             else:
-                logger.error("[DartTaskSync] Update-Fehler: %s", response.status_code)
+                logger.error("[DartTaskSync] Update-Fehler: %s", response.status)
                 return False
 
-        except requests.exceptions.RequestException as e:
+        except HttpClientError as e:
             logger.error("[DartTaskSync] Netzwerk-Fehler: %s", e)
             return False
 
@@ -191,16 +197,16 @@ class DartTaskSync:
         }
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 f"{self.API_BASE}/comments/create",
                 headers=self._get_headers(),
-                json=payload,
-                timeout=10
+                json_body=payload,
+                timeout=self.REQUEST_TIMEOUT
             )
 
-            return response.status_code in [200, 201]
+            return response.status in [200, 201]
 
-        except requests.exceptions.RequestException as e:
+        except HttpClientError as e:
             logger.error("[DartTaskSync] Kommentar-Fehler: %s", e)
             return False
 
@@ -268,6 +274,9 @@ class DartTaskSync:
         """
         Synchronisiert mehrere Tasks als Batch.
 
+        AENDERUNG 18.10.2026: Parallel ueber den geteilten HTTP-Client
+        (maximal BATCH_CONCURRENCY gleichzeitige Requests, Reihenfolge bleibt erhalten).
+
         Args:
             tasks: Liste von Tasks
             parent_task_id: Optionale Parent-Task-ID fuer Subtasks
@@ -276,15 +285,27 @@ class DartTaskSync:
             Dict mit Task-ID -> Dart-ID Mapping
         """
         result = {}
+        if not self._enabled or not tasks:
+            return result
 
-        for task in tasks:
-            dart_id = self.sync_task(task)
+        dart_ids = get_http_client().map_concurrent(
+            self._sync_task_safe, list(tasks), max_workers=self.BATCH_CONCURRENCY
+        )
+        for task, dart_id in zip(tasks, dart_ids):
             if dart_id:
                 result[task.id] = dart_id
                 task.dart_id = dart_id
 
         return result
 
+    def _sync_task_safe(self, task: DerivedTask) -> Optional[str]:
+        """sync_task fuer Batch-Worker - ein Fehler bricht den Batch nicht ab."""
+        try:
+            return self.sync_task(task)
+        except Exception as e:
+            logger.error("[DartTaskSync] Batch-Fehler bei %s: %s", task.id, e)
+            return None
+
     def get_task_status(self, dart_id: str) -> Optional[str]:
         """
         Holt den aktuellen Status eines Dart-Tasks.
@@ -299,18 +320,18 @@ class DartTaskSync:
             return None
 
         try:
-            response = requests.get(
+            response = get_http_client().get(
                 f"{self.API_BASE}/tasks/{dart_id}",
                 headers=self._get_headers(),
-                timeout=10
+                timeout=self.REQUEST_TIMEOUT
             )
 
-            if response.status_code == 200:
+            if response.status == 200:
                 data = response.json()
                 return data.get("status")
             return None
 
-        except requests.exceptions.RequestException:
+        except HttpClientError:
             return None
 
 
@@ -319,6 +340,9 @@ class MockDartTaskSync(DartTaskSync):
     Mock-Implementierung fuer Tests ohne echte Dart-API.
     """
 
+    # Sequentiell: der Mock-Zaehler ist nicht thread-sicher
+    BATCH_CONCURRENCY = 1
+
     def __init__(self, *args, **kwargs):
         self.token = "mock-token"
         self.dartboard = "Mock Dartboard"
@@ -15,7 +15,6 @@ Beschreibung: Coder-Kernfunktionen fuer DevLoop.
 import logging
 import os
 import json
-import time
 import traceback
 from typing import Dict, Any, Tuple
 
@@ -33,6 +32,7 @@ from .orchestration_helpers import (
     is_openrouter_error  # AENDERUNG 02.02.2026: OpenRouter-Fehler fuer sofortigen Modellwechsel
 )
 from .heartbeat_utils import run_with_heartbeat
+from .operation_supervisor import OperationCancelled, cancellable_sleep, check_cancelled
 from .dev_loop_helpers import _sanitize_unicode, _check_for_truncation
 
 # AENDERUNG 08.02.2026: Refactoring — Imports aus neuen Modulen
@@ -74,6 +74,7 @@ def run_coder_task(manager, project_rules: Dict[str, Any], c_prompt: str, agent_
     last_error_type = None
 
     for coder_attempt in range(MAX_CODER_RETRIES):
+        check_cancelled()
         current_model = manager.model_router.get_model("coder") if manager.model_router else "unknown"
         try:
             # AENDERUNG 29.01.2026: Heartbeat-Wrapper fuer stabile WebSocket-Verbindung
@@ -90,6 +91,10 @@ def run_coder_task(manager, project_rules: Dict[str, Any], c_prompt: str, agent_
             if current_code != raw_output:
                 manager._ui_log("Coder", "ThinkTagFilter", "Model-Output bereinigt (Think-Tags entfernt)")
             break
+        except OperationCancelled as oc:
+            # AENDERUNG 18.10.2026: Abbruch (API/Supervisor) beendet die Retry-Schleife
+            manager._ui_log("Coder", "Cancelled", f"Code-Generierung abgebrochen: {oc}")
+            raise
         except TimeoutError as te:
             # AENDERUNG 02.02.2026: OpenRouter-Fehler = sofortiger Modellwechsel
             if is_openrouter_error(te):
@@ -253,7 +258,7 @@ def run_coder_task(manager, project_rules: Dict[str, Any], c_prompt: str, agent_
                 manager._ui_log("Coder", "Warning",
                                 f"Server-Fehler erkannt (Fehler {error_count}/{ERRORS_BEFORE_MODEL_SWITCH}): "
                                 f"{str(error)[:100]} - Pause 5s vor Retry")
-                time.sleep(5)
+                cancellable_sleep(5)
 
                 if error_count >= ERRORS_BEFORE_MODEL_SWITCH:
                     manager._ui_log("Coder", "Status", f"Modellwechsel nach {error_count} Server-Fehlern")
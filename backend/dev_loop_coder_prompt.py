@@ -7,16 +7,20 @@ Beschreibung: Prompt-Builder-Funktionen fuer den DevLoop Coder.
               Extrahiert aus dev_loop_coder.py (Regel 1: Max 500 Zeilen).
               Enthaelt: _build_patch_prompt, build_coder_prompt,
               Security-Fix-Templates, Framework-spezifische Prompt-Regeln.
+              AENDERUNG 18.10.2026: Sektionen ueber prompt_assembly.py
+              (memoisiert, Sektions-Budget, Groessen-Telemetrie).
 """
 
 import os
 import re
 import json
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List
 
 from agents.memory_agent import get_lessons_for_prompt
 from agents.memory_core import get_constraints_for_prompt
+from agents.lesson_index import get_lesson_retrieval_settings
 from .dev_loop_helpers import get_python_dependency_versions
 from .file_status_detector import get_file_status_summary_for_log
 from .dev_loop_coder_utils import (
@@ -25,6 +29,19 @@ from .dev_loop_coder_utils import (
     _get_current_code_dict,
 )
 from .context_compressor import compress_context
+from .prompt_assembly import (
+    PromptAssembler,
+    file_signature,
+    get_prompt_telemetry,
+    get_section_cache,
+    hash_key,
+)
+from .prompt_cache import (
+    CACHE_BREAKPOINT,
+    STABLE_CODER_SECTIONS,
+    get_prompt_cache_settings,
+    join_cacheable,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +179,124 @@ _SECURITY_FIX_TEMPLATES = {
 }
 
 
+# =========================================================================
+# AENDERUNG 18.10.2026: Vorberechnete, statische Prompt-Fragmente (pro Coder-Rolle
+# identisch) - werden nicht mehr bei jeder Iteration neu zusammengesetzt
+# =========================================================================
+_UNIT_TEST_RULES = (
+    "\n\n🧪 UNIT-TEST REQUIREMENT:\n"
+    "- Erstelle IMMER Unit-Tests für alle neuen Funktionen/Klassen\n"
+    "- Test-Dateien: tests/test_<modulname>.py oder tests/<modulname>.test.js\n"
+    "- Mindestens 3 Test-Cases pro Funktion (normal, edge-case, error-case)\n"
+    "- Format: ### FILENAME: tests/test_<modulname>.py\n"
+    "- Tests müssen AUSFÜHRBAR sein (pytest bzw. npm test)\n"
+)
+
+_API_TEST_RULES = (
+    "\n🔌 API-TESTS:\n"
+    "- Teste JEDEN API-Endpoint mit mindestens 2 Test-Cases\n"
+    "- Prüfe Erfolgs-Response UND Fehler-Response\n"
+    "- Python: pytest + Flask test_client oder requests\n"
+    "- JavaScript: jest + supertest\n"
+)
+
+_RUN_BAT_RULES = (
+    "\n\n📁 RUN.BAT PFLICHT-REGELN:\n"
+    "- run.bat MUSS direkt per Doppelklick lauffaehig sein (KEINE Argumente erforderlich!)\n"
+    "- MUSS mit '@echo off' beginnen\n"
+    "- MUSS Dependencies installieren (npm install / pip install -r requirements.txt)\n"
+    "- MUSS den Server in neuem Fenster starten: start \"\" cmd /c \"npm run dev\"\n"
+    "- MUSS den Browser oeffnen: start \"\" http://localhost:PORT\n"
+    # AENDERUNG 14.02.2026: pause entfernt - blockiert subprocess.Popen() im server_runner (Deadlock)
+    "- VERBOTEN: 'pause' oder 'pause > nul' (blockiert automatisierten Testlauf!)\n"
+    "- VERBOTEN: Argumente wie run.bat [dev|build|start]\n"
+)
+
+# AENDERUNG 07.02.2026: SVG Data-URL Verbot auch bei Template-Projekten (Fix 20)
+_TEMPLATE_SVG_RULES = (
+    "\nKEINE INLINE SVG DATA-URLs:\n"
+    "- NIEMALS url(\"data:image/svg+xml,...\") in CSS oder JSX verwenden!\n"
+    "- Stattdessen: CSS-Gradienten, separate .svg in public/, Unicode-Zeichen\n"
+)
+
+_JS_DEPENDENCY_RULES = (
+    "\n\nDEPENDENCY-VOLLSTAENDIGKEIT (KRITISCH!):\n"
+    "- JEDE importierte Bibliothek MUSS in package.json 'dependencies' stehen!\n"
+    "- Verwende EXAKTE Versionen (KEIN ^ oder ~ Prefix)!\n"
+    "- Node.js built-ins (fs, path, crypto) NICHT in package.json.\n"
+)
+
+# AENDERUNG 08.02.2026: App Router statt Pages Router (Fix 22.4C)
+_NEXTJS_RULES = (
+    "\nNEXT.JS REGELN (App Router):\n"
+    "- ES6 import/export (KEIN require/module.exports)\n"
+    "- Dateien in app/, components/, lib/ DIREKT im Root (NICHT src/)\n"
+    "- app/layout.js + app/globals.css MUESSEN existieren\n"
+    "- API-Routen als Route Handlers: export async function GET/POST(request) in app/api/*/route.js\n"
+    "- Client-Components mit 'use client' Direktive am Dateianfang\n"
+    "- Verwende next/jest, NICHT @next/jest\n"
+    # AENDERUNG 09.02.2026: Fix 39 — Hydration-Error Praevention
+    "- HYDRATION-SCHUTZ: <html> und <body> in app/layout.js MUESSEN suppressHydrationWarning haben!\n"
+    "- Datums-Formatierung NIEMALS direkt in JSX ({new Date().toLocaleDateString()}) — "
+    "stattdessen useEffect + useState oder ISO-String\n"
+    # AENDERUNG 07.02.2026: SVG Data-URL Verbot (Fix 20)
+    "- KEINE inline SVG Data-URLs in CSS oder JSX! "
+    "Verwende stattdessen: CSS-Gradienten (radial-gradient, linear-gradient), "
+    "separate .svg Dateien in public/, oder Unicode-Zeichen.\n"
+)
+
+_ROUTER_CONSISTENCY_RULES = (
+    "\nROUTER-KONSISTENZ (KRITISCH):\n"
+    "- VERBOTEN: Erstelle KEINE Dateien unter pages/ (Pages Router ist VERALTET)\n"
+    "- Verwende AUSSCHLIESSLICH App Router: app/layout.js, app/page.js, app/api/*/route.js\n"
+    "- Wenn pages/ Dateien existieren: IGNORIERE sie, erstelle KEINE neuen\n"
+    "- HYDRATION-SCHUTZ: <html suppressHydrationWarning> und <body suppressHydrationWarning> in layout.js PFLICHT!\n"
+)
+
+_FILE_BLACKLIST_RULES = (
+    "\nDIESE DATEIEN NIEMALS GENERIEREN:\n"
+    "- package-lock.json (wird automatisch durch npm install erstellt)\n"
+    "- node_modules/ (wird automatisch durch npm install erstellt)\n"
+    "- .next/ (wird automatisch durch next build erstellt)\n"
+)
+
+_DESIGN_RULES = (
+    "\nDESIGN-REGELN (Regel 19 - VERBINDLICH):\n"
+    "- KEINE purple, violet oder indigo Farben verwenden!\n"
+    "- KEINE blue-purple Gradients!\n"
+    "- Verwende moderne, saubere Farben die zum Thema passen.\n"
+)
+
+_section_cache = get_section_cache()
+
+
+@lru_cache(maxsize=64)
+def _fallback_framework_rules(language: str, framework: str, project_type: str) -> str:
+    """Hartcodierte Framework-Regeln fuer Projekte ohne Template."""
+    rules = ""
+    if language in ("javascript", "typescript"):
+        rules += _JS_DEPENDENCY_RULES
+    if "next" in framework or "next" in project_type:
+        rules += _NEXTJS_RULES
+    return rules
+
+
+def _template_rules_section(template: dict, pinned: Dict[str, str]) -> str:
+    """Template-Regeln + gepinnte Versionen + SVG-Verbot als eine Sektion."""
+    from techstack_templates.template_loader import get_coder_rules
+
+    section = ""
+    coder_rules = get_coder_rules(template)
+    if coder_rules:
+        section += f"\n\n{coder_rules}\n"
+    # Pinned-Versionen aus Template als Referenz
+    if pinned:
+        section += "\nGEPINNTE VERSIONEN (verwende EXAKT diese):\n"
+        for pkg, ver in pinned.items():
+            section += f"  {pkg}: {ver}\n"
+    return section + _TEMPLATE_SVG_RULES
+
+
 def build_coder_prompt(
     manager,
     user_goal: str,
@@ -180,32 +315,37 @@ def build_coder_prompt(
     Wenn UTDS-Tasks vorhanden sind oder Dateien identifiziert wurden die gepatcht werden muessen,
     wird automatisch der Patch-Modus aktiviert.
     """
-    c_prompt = f"Ziel: {user_goal}\nTech: {manager.tech_blueprint}\nDB: {manager.database_schema}\n"
+    # AENDERUNG 18.10.2026: Prompt als benannte Sektionen (Budget + Telemetrie)
+    asm = PromptAssembler("coder")
+    asm += f"Ziel: {user_goal}\nTech: {manager.tech_blueprint}\nDB: {manager.database_schema}\n"
 
+    asm.start("briefing")
     briefing_context = manager.get_briefing_context()
     if briefing_context:
-        c_prompt += f"\n{briefing_context}\n"
+        asm += f"\n{briefing_context}\n"
 
+    asm.start("design")
     # AENDERUNG 08.02.2026: Designer-Output als Pflicht-Input fuer Coder (Fix 22.6)
     if hasattr(manager, 'design_concept') and manager.design_concept and "Kein Design" not in manager.design_concept:
         design_brief = manager.design_concept[:500]
-        c_prompt += (
+        asm += (
             f"\n### DESIGN-VORGABEN (PFLICHT — vom Designer-Agenten):\n"
             f"{design_brief}\n"
             f"Verwende diese Farben und das beschriebene Design-Konzept!\n"
         )
 
+    asm.start("iteration_history")
     # AENDERUNG 09.02.2026: Fix 35 — Iteration-Memory fuer Coder-Kontext
     if iteration_history and len(iteration_history) > 0:
-        c_prompt += "\n### ITERATIONS-HISTORIE (vorherige Fixes - BEACHTEN!):\n"
+        asm += "\n### ITERATIONS-HISTORIE (vorherige Fixes - BEACHTEN!):\n"
         for entry in iteration_history[-5:]:  # Letzte 5 Iterationen
             it_nr = entry["iteration"]
             fb_files = ", ".join(entry.get("feedback_files", [])[:5])
             utds_files = ", ".join(entry.get("utds_fixed", [])[:5])
-            c_prompt += f"- Iteration {it_nr}: Reviewer bemangelte [{fb_files}]"
+            asm += f"- Iteration {it_nr}: Reviewer bemangelte [{fb_files}]"
             if utds_files:
-                c_prompt += f" -> UTDS hat gefixt: [{utds_files}]"
-            c_prompt += "\n"
+                asm += f" -> UTDS hat gefixt: [{utds_files}]"
+            asm += "\n"
         # Ping-Pong-Warnung fuer Dateien die mehrfach bemangelt wurden
         repeated = {}
         for entry in iteration_history:
@@ -214,16 +354,18 @@ def build_coder_prompt(
         pp_files = [f for f, c in repeated.items() if c >= 2]
         if pp_files:
             max_count = max(repeated[f] for f in pp_files)
-            c_prompt += f"ACHTUNG: {', '.join(pp_files)} wurde(n) bereits {max_count}x bemangelt!\n"
-            c_prompt += "Diese Dateien NICHT mit falschen Patterns regenerieren!\n"
+            asm += f"ACHTUNG: {', '.join(pp_files)} wurde(n) bereits {max_count}x bemangelt!\n"
+            asm += "Diese Dateien NICHT mit falschen Patterns regenerieren!\n"
 
+    asm.start("protected_files")
     # AENDERUNG 09.02.2026: Fix 35 — Geschuetzte Dateien als Warnung im Prompt
     if utds_protected_files and len(utds_protected_files) > 0:
-        c_prompt += "\n### GESCHUETZTE DATEIEN (gerade durch UTDS gefixt - NICHT veraendern!):\n"
+        asm += "\n### GESCHUETZTE DATEIEN (gerade durch UTDS gefixt - NICHT veraendern!):\n"
         for pf in utds_protected_files:
-            c_prompt += f"- {pf} (UTDS-Fix aktiv, NICHT regenerieren)\n"
-        c_prompt += "Generiere diese Dateien NICHT neu. Sie wurden gerade automatisch repariert.\n"
+            asm += f"- {pf} (UTDS-Fix aktiv, NICHT regenerieren)\n"
+        asm += "Generiere diese Dateien NICHT neu. Sie wurden gerade automatisch repariert.\n"
 
+    asm.start("code_context")
     # AENDERUNG 05.02.2026: UTDS-Task-Erkennung fuer Patch-Modus
     use_patch_mode = False
     patch_mode_reason = ""
@@ -273,13 +415,13 @@ def build_coder_prompt(
                     f"Patch-Dateien: {', '.join(affected_files[:5])}")
                 manager._ui_log("Coder", "FileStatus", status_summary)
 
-                c_prompt += _build_patch_prompt(code_dict, affected_files, feedback)
+                asm += _build_patch_prompt(code_dict, affected_files, feedback)
             else:
                 manager._ui_log("Coder", "FullMode",
                     f"PatchMode-Fallback: {patch_mode_reason}")
-                c_prompt += f"\nAlt-Code:\n{manager.current_code}\n"
+                asm += f"\nAlt-Code:\n{manager.current_code}\n"
                 if feedback:
-                    c_prompt += f"\nKorrektur: {feedback}\n"
+                    asm += f"\nKorrektur: {feedback}\n"
         else:
             affected_files = _get_affected_files_from_feedback(feedback)
 
@@ -291,7 +433,7 @@ def build_coder_prompt(
             if affected_files and code_dict:
                 manager._ui_log("Coder", "PatchMode",
                     f"Patch-Modus aktiv fuer: {', '.join(affected_files)}")
-                c_prompt += _build_patch_prompt(code_dict, affected_files, feedback)
+                asm += _build_patch_prompt(code_dict, affected_files, feedback)
             else:
                 if code_dict and feedback:
                     # AENDERUNG 10.02.2026: Fix 41 — Context-Kompression statt alle Dateien voll
@@ -306,13 +448,13 @@ def build_coder_prompt(
                     manager._file_summaries_cache = cache_data
                     manager._ui_log("Coder", "PatchModeAllFiles",
                         f"Keine spezifischen Dateien erkannt - {len(code_dict)} Dateien mit Kompression")
-                    c_prompt += _build_patch_prompt(compressed, list(compressed.keys()), feedback)
+                    asm += _build_patch_prompt(compressed, list(compressed.keys()), feedback)
                 else:
                     fallback_reason = "Kein code_dict" if not code_dict else "Keine Dateien im Feedback"
                     manager._ui_log("Coder", "PatchModeFallback", fallback_reason)
-                    c_prompt += f"\nAlt-Code:\n{manager.current_code}\n"
+                    asm += f"\nAlt-Code:\n{manager.current_code}\n"
                     if feedback:
-                        c_prompt += f"\nKorrektur: {feedback}\n"
+                        asm += f"\nKorrektur: {feedback}\n"
     elif not manager.is_first_run:
         # ROOT-CAUSE-FIX 06.02.2026 (v2): Strukturierter Multi-File-Kontext statt roher String
         code_dict = _get_current_code_dict(manager)
@@ -328,16 +470,17 @@ def build_coder_prompt(
             manager._file_summaries_cache = cache_data
             manager._ui_log("Coder", "StructuredPatchMode",
                 f"Strukturierter Patch-Kontext ({len(code_dict)} Dateien, komprimiert) mit Feedback")
-            c_prompt += _build_patch_prompt(compressed, list(compressed.keys()), feedback)
+            asm += _build_patch_prompt(compressed, list(compressed.keys()), feedback)
         else:
             manager._ui_log("Coder", "FullMode",
                 f"Kein gezielter Fehler-Kontext erkannt - vollstaendige Regenerierung ({patch_mode_reason or 'Standard'})")
-            c_prompt += f"\nAlt-Code:\n{manager.current_code}\n"
+            asm += f"\nAlt-Code:\n{manager.current_code}\n"
             if feedback:
-                c_prompt += f"\nKorrektur: {feedback}\n"
+                asm += f"\nKorrektur: {feedback}\n"
     elif feedback:
-        c_prompt += f"\nKorrektur: {feedback}\n"
+        asm += f"\nKorrektur: {feedback}\n"
 
+    asm.start("missing_files")
     # AENDERUNG 21.02.2026: Fix 59f — Fehlende Dateien als Erstellungsanweisung
     # ROOT-CAUSE-FIX:
     # Symptom: PatchMode kann nur existierende Dateien aendern, nicht neue erstellen
@@ -345,67 +488,84 @@ def build_coder_prompt(
     # Loesung: Erkannte fehlende Dateien explizit als Erstellungsauftrag im Prompt
     _missing_files = getattr(manager, '_missing_files', [])
     if _missing_files:
-        c_prompt += "\n### NEUE DATEIEN ERSTELLEN (PFLICHT!):\n"
-        c_prompt += "Die folgenden Dateien werden von existierendem Code referenziert,\n"
-        c_prompt += "existieren aber NICHT. Du MUSST sie als ### FILENAME: <pfad> erstellen:\n\n"
+        asm += "\n### NEUE DATEIEN ERSTELLEN (PFLICHT!):\n"
+        asm += "Die folgenden Dateien werden von existierendem Code referenziert,\n"
+        asm += "existieren aber NICHT. Du MUSST sie als ### FILENAME: <pfad> erstellen:\n\n"
         for mf in _missing_files:
-            c_prompt += f"### FILENAME: {mf['file']}\n"
-            c_prompt += f"Grund: {mf['reason']}\n"
+            asm += f"### FILENAME: {mf['file']}\n"
+            asm += f"Grund: {mf['reason']}\n"
             # Schema-Kontext fuer DB-bezogene Dateien (API-Routen)
             _db_schema = getattr(manager, 'database_schema', '')
             if '/api/' in mf['file'] and _db_schema and "Kein Datenbank" not in _db_schema:
-                c_prompt += f"DATENBANK-SCHEMA (EXAKT diese Tabellennamen verwenden!):\n"
-                c_prompt += f"{_db_schema[:1000]}\n"
-            c_prompt += "Erstelle diese Datei VOLLSTAENDIG mit funktionierendem Code.\n\n"
+                asm += f"DATENBANK-SCHEMA (EXAKT diese Tabellennamen verwenden!):\n"
+                asm += f"{_db_schema[:1000]}\n"
+            asm += "Erstelle diese Datei VOLLSTAENDIG mit funktionierendem Code.\n\n"
         # Reset nach Verwendung
         manager._missing_files = []
 
+    asm.start("security_basics")
     if iteration == 0 and not feedback:
-        c_prompt += "\n\n🛡️ SECURITY BASICS (von Anfang an beachten!):\n"
-        c_prompt += "- Kein innerHTML/document.write mit User-Input (XSS-Risiko)\n"
-        c_prompt += "- Keine String-Konkatenation in SQL/DB-Queries (Injection-Risiko)\n"
-        c_prompt += "- Keine hardcoded API-Keys, Passwörter oder Secrets im Code\n"
-        c_prompt += "- Bei eval(): Nur mit Button-Input, NIEMALS mit User-Text-Input\n"
-        c_prompt += "- Nutze textContent statt innerHTML wenn möglich\n\n"
+        asm += "\n\n🛡️ SECURITY BASICS (von Anfang an beachten!):\n"
+        asm += "- Kein innerHTML/document.write mit User-Input (XSS-Risiko)\n"
+        asm += "- Keine String-Konkatenation in SQL/DB-Queries (Injection-Risiko)\n"
+        asm += "- Keine hardcoded API-Keys, Passwörter oder Secrets im Code\n"
+        asm += "- Bei eval(): Nur mit Button-Input, NIEMALS mit User-Text-Input\n"
+        asm += "- Nutze textContent statt innerHTML wenn möglich\n\n"
         # AENDERUNG 06.02.2026: Test-Script-Pflicht in package.json
         tech_lang = manager.tech_blueprint.get("language", "") if manager.tech_blueprint else ""
         if tech_lang.lower() in ("javascript", "typescript"):
-            c_prompt += "📦 PACKAGE.JSON PFLICHT:\n"
-            c_prompt += "- package.json MUSS ein 'test' Script enthalten (z.B. 'jest' oder 'vitest run')\n"
-            c_prompt += "- Beispiel: \"test\": \"jest --passWithNoTests\"\n\n"
-
+            asm += "📦 PACKAGE.JSON PFLICHT:\n"
+            asm += "- package.json MUSS ein 'test' Script enthalten (z.B. 'jest' oder 'vitest run')\n"
+            asm += "- Beispiel: \"test\": \"jest --passWithNoTests\"\n\n"
+
+    # AENDERUNG 18.10.2026: Lessons/Constraints nur neu lesen wenn sich die Memory-Datei aendert
+    memory_path = os.path.join(manager.base_dir, "memory", "global_memory.json")
+    memory_sig = file_signature(memory_path)
+    asm.start("lessons")
+    # AENDERUNG 18.10.2026: Bei Feedback Lessons nach Relevanz zum aktuellen Fehler ranken (BM25)
+    retrieval = get_lesson_retrieval_settings(getattr(manager, 'config', None))
+    lesson_query = feedback[:retrieval["query_chars"]] if retrieval["enabled"] and feedback else None
     try:
-        memory_path = os.path.join(manager.base_dir, "memory", "global_memory.json")
         tech_stack = manager.tech_blueprint.get("project_type", "") if manager.tech_blueprint else ""
-        lessons = get_lessons_for_prompt(memory_path, tech_stack=tech_stack)
+        lessons = _section_cache.get(
+            "lessons", hash_key(memory_path, memory_sig, tech_stack, lesson_query),
+            get_lessons_for_prompt, memory_path, tech_stack=tech_stack, query=lesson_query)
         if lessons and lessons.strip():
-            c_prompt += f"\n\n📚 LESSONS LEARNED (aus früheren Projekten - UNBEDINGT BEACHTEN!):\n{lessons}\n"
-            manager._ui_log("Memory", "LessonsApplied", f"Coder erhält {len(lessons.splitlines())} Lektionen")
+            asm += f"\n\n📚 LESSONS LEARNED (aus früheren Projekten - UNBEDINGT BEACHTEN!):\n{lessons}\n"
+            manager._ui_log("Memory", "LessonsApplied", f"Coder erhält {len(lessons.splitlines())} Lektionen"
+                            + (" (nach Relevanz)" if lesson_query else ""))
     except Exception as les_err:
         manager._ui_log("Memory", "Warning", f"Lektionen konnten nicht geladen werden: {les_err}")
 
     # AENDERUNG 03.02.2026: Fix 7 - Environment Constraints laden
+    asm.start("env_constraints")
     try:
-        memory_path = os.path.join(manager.base_dir, "memory", "global_memory.json")
-        env_constraints = get_constraints_for_prompt(memory_path)
+        env_constraints = _section_cache.get(
+            "env_constraints", hash_key(memory_path, memory_sig),
+            get_constraints_for_prompt, memory_path)
         if env_constraints and env_constraints.strip():
-            c_prompt += f"\n\n⚠️ UMGEBUNGS-EINSCHRÄNKUNGEN (KRITISCH - NICHT IGNORIEREN!):\n"
-            c_prompt += "Diese Module/Features sind in der Ausführungsumgebung NICHT verfügbar:\n"
-            c_prompt += env_constraints + "\n"
-            c_prompt += "\nWICHTIG: Verwende NUR die angegebenen Alternativen! Diese Einschränkungen sind PERMANENT!\n"
+            asm += f"\n\n⚠️ UMGEBUNGS-EINSCHRÄNKUNGEN (KRITISCH - NICHT IGNORIEREN!):\n"
+            asm += "Diese Module/Features sind in der Ausführungsumgebung NICHT verfügbar:\n"
+            asm += env_constraints + "\n"
+            asm += "\nWICHTIG: Verwende NUR die angegebenen Alternativen! Diese Einschränkungen sind PERMANENT!\n"
             manager._ui_log("Memory", "EnvConstraints", f"Coder erhält {len(env_constraints.splitlines())} Umgebungs-Constraints")
     except Exception as env_err:
         manager._ui_log("Memory", "Warning", f"Environment Constraints konnten nicht geladen werden: {env_err}")
 
     # AENDERUNG 01.02.2026: Dependency-Versionen aus Inventar laden
+    asm.start("dependency_versions")
     try:
-        dep_versions = get_python_dependency_versions()
+        dep_versions = _section_cache.get(
+            "dependency_versions",
+            hash_key(os.getcwd(), file_signature(os.path.join("library", "dependencies.json"))),
+            get_python_dependency_versions)
         if dep_versions:
-            c_prompt += f"\n\n📦 {dep_versions}\n"
-            c_prompt += "WICHTIG: Für requirements.txt NUR diese Versionen verwenden! Keine eigenen Versionen erfinden!\n"
+            asm += f"\n\n📦 {dep_versions}\n"
+            asm += "WICHTIG: Für requirements.txt NUR diese Versionen verwenden! Keine eigenen Versionen erfinden!\n"
     except Exception as dep_err:
         manager._ui_log("Coder", "Warning", f"Dependency-Versionen konnten nicht geladen werden: {dep_err}")
 
+    asm.start("security_tasks")
     # AENDERUNG 07.02.2026: Security Fix-Templates
     if hasattr(manager, 'security_vulnerabilities') and manager.security_vulnerabilities:
         severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
@@ -454,46 +614,37 @@ def build_coder_prompt(
             "iteration": iteration + 1
         }, ensure_ascii=False))
 
-        c_prompt += "\n\n⚠️ SECURITY TASKS (priorisiert nach Severity - CRITICAL zuerst):\n"
-        c_prompt += "\n".join(task_prompt_lines)
-        c_prompt += "\n\nWICHTIG: Bearbeite die Tasks in der angegebenen Reihenfolge! Implementiere die LÖSUNG für jeden Task!\n"
+        asm += "\n\n⚠️ SECURITY TASKS (priorisiert nach Severity - CRITICAL zuerst):\n"
+        asm += "\n".join(task_prompt_lines)
+        asm += "\n\nWICHTIG: Bearbeite die Tasks in der angegebenen Reihenfolge! Implementiere die LÖSUNG für jeden Task!\n"
 
     # AENDERUNG 10.02.2026: Fix 47 — Doc-Enrichment Pipeline
     # Injiziert aktuelle Bibliotheks-Dokumentation in Coder-Prompt
+    asm.start("doc_enrichment")
     try:
         from .doc_enrichment import get_doc_enrichment_section
-        doc_section = get_doc_enrichment_section(manager)
+        # AENDERUNG 18.10.2026: docs_generation im Key - verspaetete Fetches
+        # machen die memoisierte Teil-Sektion ungueltig
+        doc_pipeline = getattr(manager, '_doc_enrichment', None)
+        doc_section = _section_cache.get(
+            "doc_enrichment",
+            hash_key(id(doc_pipeline), getattr(doc_pipeline, 'docs_generation', 0),
+                     repr(manager.tech_blueprint), getattr(manager, '_current_user_goal', '')),
+            get_doc_enrichment_section, manager, cache_empty=False)
         if doc_section:
-            c_prompt += doc_section
+            asm += doc_section
             manager._ui_log("DocEnrichment", "Injected",
                 f"Bibliotheks-Docs eingefuegt ({len(doc_section)} Zeichen)")
     except Exception as doc_err:
         logger.debug("Doc-Enrichment uebersprungen: %s", doc_err)
 
-    c_prompt += "\n\n🧪 UNIT-TEST REQUIREMENT:\n"
-    c_prompt += "- Erstelle IMMER Unit-Tests für alle neuen Funktionen/Klassen\n"
-    c_prompt += "- Test-Dateien: tests/test_<modulname>.py oder tests/<modulname>.test.js\n"
-    c_prompt += "- Mindestens 3 Test-Cases pro Funktion (normal, edge-case, error-case)\n"
-    c_prompt += "- Format: ### FILENAME: tests/test_<modulname>.py\n"
-    c_prompt += "- Tests müssen AUSFÜHRBAR sein (pytest bzw. npm test)\n"
+    asm.add("unit_tests", _UNIT_TEST_RULES)
 
     if manager.tech_blueprint and manager.tech_blueprint.get("requires_server"):
-        c_prompt += "\n🔌 API-TESTS:\n"
-        c_prompt += "- Teste JEDEN API-Endpoint mit mindestens 2 Test-Cases\n"
-        c_prompt += "- Prüfe Erfolgs-Response UND Fehler-Response\n"
-        c_prompt += "- Python: pytest + Flask test_client oder requests\n"
-        c_prompt += "- JavaScript: jest + supertest\n"
+        asm.add("api_tests", _API_TEST_RULES)
 
     # AENDERUNG 06.02.2026: run.bat und Framework-Verzeichnisstruktur Regeln
-    c_prompt += "\n\n📁 RUN.BAT PFLICHT-REGELN:\n"
-    c_prompt += "- run.bat MUSS direkt per Doppelklick lauffaehig sein (KEINE Argumente erforderlich!)\n"
-    c_prompt += "- MUSS mit '@echo off' beginnen\n"
-    c_prompt += "- MUSS Dependencies installieren (npm install / pip install -r requirements.txt)\n"
-    c_prompt += "- MUSS den Server in neuem Fenster starten: start \"\" cmd /c \"npm run dev\"\n"
-    c_prompt += "- MUSS den Browser oeffnen: start \"\" http://localhost:PORT\n"
-    # AENDERUNG 14.02.2026: pause entfernt - blockiert subprocess.Popen() im server_runner (Deadlock)
-    c_prompt += "- VERBOTEN: 'pause' oder 'pause > nul' (blockiert automatisierten Testlauf!)\n"
-    c_prompt += "- VERBOTEN: Argumente wie run.bat [dev|build|start]\n"
+    asm.add("run_bat", _RUN_BAT_RULES)
 
     # AENDERUNG 07.02.2026: Dynamische Template-Regeln statt hartcodierte Framework-Regeln
     _source_template = None
@@ -502,86 +653,71 @@ def build_coder_prompt(
 
     if _source_template:
         # Template-basierte Regeln — dynamisch aus Template laden
+        asm.start("template_rules")
         try:
-            from techstack_templates.template_loader import get_template_by_id, get_coder_rules
+            from techstack_templates.template_loader import get_template_by_id
             template = get_template_by_id(_source_template)
             if template:
-                coder_rules = get_coder_rules(template)
-                if coder_rules:
-                    c_prompt += f"\n\n{coder_rules}\n"
-                # Pinned-Versionen aus Template als Referenz
                 pinned = manager.tech_blueprint.get("_pinned_versions", {})
-                if pinned:
-                    c_prompt += "\nGEPINNTE VERSIONEN (verwende EXAKT diese):\n"
-                    for pkg, ver in pinned.items():
-                        c_prompt += f"  {pkg}: {ver}\n"
-                # AENDERUNG 07.02.2026: SVG Data-URL Verbot auch bei Template-Projekten (Fix 20)
-                c_prompt += "\nKEINE INLINE SVG DATA-URLs:\n"
-                c_prompt += "- NIEMALS url(\"data:image/svg+xml,...\") in CSS oder JSX verwenden!\n"
-                c_prompt += "- Stattdessen: CSS-Gradienten, separate .svg in public/, Unicode-Zeichen\n"
+                asm += _section_cache.get(
+                    "template_rules",
+                    hash_key(_source_template, template.get("display_name"),
+                             template.get("coder_rules"), sorted(pinned.items())),
+                    _template_rules_section, template, pinned)
         except ImportError:
             pass
     else:
         # Fallback: Hartcodierte Regeln fuer Projekte ohne Template
-        language = ""
+        language = framework = project_type = ""
         if manager.tech_blueprint:
             language = manager.tech_blueprint.get("language", "").lower()
-        if language in ("javascript", "typescript"):
-            c_prompt += "\n\nDEPENDENCY-VOLLSTAENDIGKEIT (KRITISCH!):\n"
-            c_prompt += "- JEDE importierte Bibliothek MUSS in package.json 'dependencies' stehen!\n"
-            c_prompt += "- Verwende EXAKTE Versionen (KEIN ^ oder ~ Prefix)!\n"
-            c_prompt += "- Node.js built-ins (fs, path, crypto) NICHT in package.json.\n"
-        framework = ""
-        if manager.tech_blueprint:
             framework = manager.tech_blueprint.get("framework", "").lower()
             project_type = manager.tech_blueprint.get("project_type", "").lower()
-            if "next" in framework or "next" in project_type:
-                # AENDERUNG 08.02.2026: App Router statt Pages Router (Fix 22.4C)
-                c_prompt += "\nNEXT.JS REGELN (App Router):\n"
-                c_prompt += "- ES6 import/export (KEIN require/module.exports)\n"
-                c_prompt += "- Dateien in app/, components/, lib/ DIREKT im Root (NICHT src/)\n"
-                c_prompt += "- app/layout.js + app/globals.css MUESSEN existieren\n"
-                c_prompt += "- API-Routen als Route Handlers: export async function GET/POST(request) in app/api/*/route.js\n"
-                c_prompt += "- Client-Components mit 'use client' Direktive am Dateianfang\n"
-                c_prompt += "- Verwende next/jest, NICHT @next/jest\n"
-                # AENDERUNG 09.02.2026: Fix 39 — Hydration-Error Praevention
-                c_prompt += "- HYDRATION-SCHUTZ: <html> und <body> in app/layout.js MUESSEN suppressHydrationWarning haben!\n"
-                c_prompt += "- Datums-Formatierung NIEMALS direkt in JSX ({new Date().toLocaleDateString()}) — "
-                c_prompt += "stattdessen useEffect + useState oder ISO-String\n"
-                # AENDERUNG 07.02.2026: SVG Data-URL Verbot (Fix 20)
-                c_prompt += "- KEINE inline SVG Data-URLs in CSS oder JSX! "
-                c_prompt += "Verwende stattdessen: CSS-Gradienten (radial-gradient, linear-gradient), "
-                c_prompt += "separate .svg Dateien in public/, oder Unicode-Zeichen.\n"
+        asm.add("framework_rules", _fallback_framework_rules(language, framework, project_type))
 
     # AENDERUNG 08.02.2026: Router-Konsistenz bei Next.js erzwingen (Fix 23A)
     if manager.tech_blueprint:
         _pt = manager.tech_blueprint.get("project_type", "").lower()
         if "next" in _pt:
-            c_prompt += "\nROUTER-KONSISTENZ (KRITISCH):\n"
-            c_prompt += "- VERBOTEN: Erstelle KEINE Dateien unter pages/ (Pages Router ist VERALTET)\n"
-            c_prompt += "- Verwende AUSSCHLIESSLICH App Router: app/layout.js, app/page.js, app/api/*/route.js\n"
-            c_prompt += "- Wenn pages/ Dateien existieren: IGNORIERE sie, erstelle KEINE neuen\n"
-            c_prompt += "- HYDRATION-SCHUTZ: <html suppressHydrationWarning> und <body suppressHydrationWarning> in layout.js PFLICHT!\n"
+            asm.add("router_consistency", _ROUTER_CONSISTENCY_RULES)
 
     # AENDERUNG 07.02.2026: Datei-Blacklist (gilt fuer ALLE Frameworks)
-    c_prompt += "\nDIESE DATEIEN NIEMALS GENERIEREN:\n"
-    c_prompt += "- package-lock.json (wird automatisch durch npm install erstellt)\n"
-    c_prompt += "- node_modules/ (wird automatisch durch npm install erstellt)\n"
-    c_prompt += "- .next/ (wird automatisch durch next build erstellt)\n"
+    asm.add("file_blacklist", _FILE_BLACKLIST_RULES)
 
     # AENDERUNG 09.02.2026: Purple-Verbot (CLAUDE.md Regel 19, Dreifach-Schutz)
-    c_prompt += "\nDESIGN-REGELN (Regel 19 - VERBINDLICH):\n"
-    c_prompt += "- KEINE purple, violet oder indigo Farben verwenden!\n"
-    c_prompt += "- KEINE blue-purple Gradients!\n"
-    c_prompt += "- Verwende moderne, saubere Farben die zum Thema passen.\n"
+    asm.add("design_rules", _DESIGN_RULES)
 
-    c_prompt += "\nFormat: ### FILENAME: path/to/file.ext"
+    asm.add("format", "\nFormat: ### FILENAME: path/to/file.ext")
 
     # AENDERUNG 10.02.2026: Fix 40d-Nachbesserung - Token-Budget-Guard
     max_prompt_tokens = 80000  # Default, kimi-k2.5 sicher bei 80k (262k - 131k Output - 20k CrewAI)
+    section_budgets = None
     if hasattr(manager, 'config') and manager.config:
         max_prompt_tokens = manager.config.get("max_prompt_tokens", 80000)
-    c_prompt = _truncate_prompt_if_needed(c_prompt, max_prompt_tokens)
+        if isinstance(manager.config, dict):
+            section_budgets = manager.config.get("prompt_section_budgets")
+    # AENDERUNG 18.10.2026: Erst Sektions-Budget, dann Kuerzung von Datei-Inhalten/Feedback
+    asm.apply_budget(max_prompt_tokens * 3, section_budgets)
+    # AENDERUNG 18.10.2026: Stabiler Praefix + variabler Suffix fuer Provider-Prompt-Caching
+    cache_settings = get_prompt_cache_settings(getattr(manager, 'config', None))
+    if cache_settings["enabled"]:
+        # Gerankte Lessons aendern sich mit dem Feedback → nicht in den stabilen Praefix
+        stable = [name for name in STABLE_CODER_SECTIONS if not (lesson_query and name == "lessons")]
+        prefix, suffix = asm.split_text(stable)
+        assembled = join_cacheable(prefix, suffix, cache_settings["min_prefix_chars"])
+    else:
+        assembled = asm.text()
+    c_prompt = _truncate_prompt_if_needed(assembled, max_prompt_tokens)
+
+    stats = get_prompt_telemetry().record(asm, len(c_prompt), iteration)
+    largest = sorted(stats["sections_chars"].items(), key=lambda item: item[1], reverse=True)[:5]
+    manager._ui_log("Coder", "PromptSections", json.dumps({
+        "chars": stats["final_chars"],
+        "est_tokens": stats["est_tokens"],
+        "assembly_ms": stats["assembly_ms"],
+        "largest": dict(largest),
+        "dropped": stats["dropped"],
+    }, ensure_ascii=False))
 
     return c_prompt
 
@@ -616,6 +752,7 @@ def _truncate_prompt_if_needed(prompt: str, max_tokens: int) -> str:
         "\n\n\U0001f4c1",    # 📁
         "\n\n\u26a0\ufe0f SECURITY",  # ⚠️ SECURITY
         "\n\nFormat:",
+        CACHE_BREAKPOINT,  # AENDERUNG 18.10.2026: nie ueber den Cache-Praefix hinaus loeschen
     ]
     for marker in removable_markers:
         if len(prompt) <= max_chars:
@@ -2,12 +2,14 @@
 """
 Author: rahn
 Datum: 08.02.2026
-Version: 1.1
+Version: 1.2
 Beschreibung: Utility-Funktionen fuer den DevLoop Coder.
               Extrahiert aus dev_loop_coder.py (Regel 1: Max 500 Zeilen).
               Enthaelt: Model-Output-Bereinigung, PatchMode-Erkennung,
               Datei-Extraktion, Code-Dict-Lesen, Rebuild-von-Disk.
               AENDERUNG 21.02.2026: Fix 59e — Fehlende-Datei-Erkennung.
+              AENDERUNG 18.10.2026: get_project_files / sync_written_files - Dateien
+              aus dem ProjectCodeStore statt os.walk ueber das Projekt.
 """
 
 import logging
@@ -16,6 +18,8 @@ import posixpath
 import re
 from typing import Dict, List
 
+from .project_code_store import get_code_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -279,6 +283,49 @@ def rebuild_current_code_from_disk(manager) -> str:
     return "\n\n".join(parts)
 
 
+# AENDERUNG 18.10.2026: Gemeinsame Datei-Sicht fuer Parallel-Patcher und Validatoren
+def get_project_files(manager) -> Dict[str, str]:
+    """
+    Projekt-Dateien als Dict {pfad: inhalt} aus manager.code_store.
+
+    Fallback auf _get_current_code_dict() (Festplatte) fuer Manager ohne
+    oder mit leerem Store.
+    """
+    store = get_code_store(manager)
+    if store is not None and len(store):
+        return store.as_dict(skip_empty=True)
+    return _get_current_code_dict(manager)
+
+
+def sync_written_files(manager, written_files: List[str]) -> str:
+    """
+    Uebernimmt gerade geschriebene Dateien in manager.code_store.
+
+    Liest nur diese Dateien zurueck (Inhalt wie auf Platte, nach Bereinigung
+    und Dependency-Merge) statt das ganze Projekt neu einzulesen und markiert
+    sie als clean. Ohne Store: rebuild_current_code_from_disk().
+
+    Returns:
+        Aktuelle ### FILENAME:-Sicht des Projekt-Codes
+    """
+    store = get_code_store(manager)
+    project_path = getattr(manager, 'project_path', None)
+    if store is None or not project_path:
+        return rebuild_current_code_from_disk(manager)
+
+    patch = {}
+    for rel_path in written_files:
+        rel_path = rel_path.replace('\\', '/')
+        try:
+            with open(os.path.join(str(project_path), rel_path), "r", encoding="utf-8") as f:
+                patch[rel_path] = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Datei nicht lesbar: {rel_path}: {e}")
+    store.apply_patch(patch)
+    store.mark_clean(list(patch))
+    return store.render()
+
+
 # AENDERUNG 21.02.2026: Fix 59e — Fehlende-Datei-Erkennung
 def detect_missing_files(manager) -> List[Dict[str, str]]:
     """
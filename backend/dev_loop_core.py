@@ -16,11 +16,13 @@ import os
 import json
 import logging
 from typing import Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
 from agents.memory_agent import update_memory
+from .operation_supervisor import get_supervisor
+# AENDERUNG 18.10.2026: Spans pro Iteration und Schritt (backend/run_tracer.py)
+from .run_tracer import begin_span, end_span, trace_span
 from .dev_loop_steps import (
     build_coder_prompt,
     run_coder_task,
@@ -50,6 +52,8 @@ from .dev_loop_run_helpers import (
 )
 # AENDERUNG 09.02.2026: Fix 35 — Dateinamen-Extraktion fuer Ping-Pong-Erkennung
 from .dev_loop_helpers import extract_filenames_from_feedback
+from .dev_loop_coder_utils import sync_written_files
+from .project_code_store import get_code_store
 
 
 import re
@@ -161,7 +165,8 @@ class DevLoop:
         # AENDERUNG 31.01.2026: File-by-File Modus bei komplexen Projekten
         # AENDERUNG 01.02.2026: Parallele Generierung mit dynamischer Worker-Anzahl
         if should_use_file_by_file(manager.tech_blueprint, manager.config):
-            run_file_by_file_phase(manager, user_goal, project_rules)
+            with trace_span("file_generation"):
+                run_file_by_file_phase(manager, user_goal, project_rules)
 
         max_retries = manager.config.get("max_retries", 3)
         feedback = ""
@@ -195,7 +200,13 @@ class DevLoop:
         # Wenn PingPong >= 3: Haiku→Sonnet, >= 6: Sonnet→Opus
         manager._sdk_tier_escalation = None
 
+        _iteration_span = None
         while iteration < max_retries:
+            # AENDERUNG 18.10.2026: Ein Span pro Iteration - die vielen continue-Pfade
+            # schliessen ihn beim naechsten Durchlauf, der Rest am Ende von dev_loop
+            end_span(_iteration_span)
+            _iteration_span = begin_span(f"iteration {iteration + 1}", "iteration", iteration=iteration + 1)
+
             # AENDERUNG 22.02.2026: Fix 68b — Stop-Check am Anfang jeder Iteration
             # ROOT-CAUSE-FIX: Reset setzt Stop-Flag, DevLoop prueft es kooperativ
             if hasattr(manager, 'is_stop_requested') and manager.is_stop_requested():
@@ -242,9 +253,10 @@ class DevLoop:
                     truncated_files = []
                 elif _is_patch and feedback:
                     from .dev_loop_parallel_patch import should_use_parallel_patch, run_parallel_patch
-                    from .dev_loop_coder_utils import _get_affected_files_from_feedback, _get_current_code_dict
+                    from .dev_loop_coder_utils import _get_affected_files_from_feedback, get_project_files
                     _pp_affected = _get_affected_files_from_feedback(feedback)
-                    _pp_code_dict = _get_current_code_dict(manager) if _pp_affected else {}
+                    # AENDERUNG 18.10.2026: Dateien aus manager.code_store statt os.walk
+                    _pp_code_dict = get_project_files(manager) if _pp_affected else {}
                     _pp_config = manager.config.get("parallel_patch", {})
 
                     if _pp_affected and should_use_parallel_patch(_pp_affected, _pp_code_dict, _pp_config):
@@ -278,8 +290,19 @@ class DevLoop:
                     _normalize_package_json_versions(str(manager.output_path))
 
                 # ROOT-CAUSE-FIX 07.02.2026: PatchMode Merge
+                # AENDERUNG 18.10.2026: Parallel-Patch hat den Store bereits gepatcht -
+                # nur die normalisierte package.json nachziehen statt alles neu einzulesen
                 if manager.project_path and os.path.exists(str(manager.project_path)):
-                    manager.current_code = rebuild_current_code_from_disk(manager)
+                    if _use_parallel and get_code_store(manager) is not None:
+                        sync_written_files(manager, [
+                            f for f in ("package.json",)
+                            if os.path.exists(os.path.join(str(manager.project_path), f))])
+                    else:
+                        manager.current_code = rebuild_current_code_from_disk(manager)
+                        _code_store = get_code_store(manager)
+                        if _code_store is not None:
+                            # Stand entspricht der Platte
+                            _code_store.mark_clean()
             finally:
                 manager._update_worker_status("coder", "idle")
 
@@ -305,13 +328,14 @@ class DevLoop:
                     for cf in (created_files or []):
                         manager.doc_service.collect_code_file(cf, manager.current_code, f"Iteration {iteration + 1}")
 
-            sandbox_result, sandbox_failed, test_result, ui_result, test_summary = run_sandbox_and_tests(
-                manager,
-                manager.current_code,
-                created_files,
-                iteration,
-                manager.tech_blueprint.get("project_type", "webapp")
-            )
+            with trace_span("sandbox", "sandbox"):
+                sandbox_result, sandbox_failed, test_result, ui_result, test_summary = run_sandbox_and_tests(
+                    manager,
+                    manager.current_code,
+                    created_files,
+                    iteration,
+                    manager.tech_blueprint.get("project_type", "webapp")
+                )
 
             # AENDERUNG 31.01.2026: Truncation als Sandbox-Fehler behandeln
             if truncated_files:
@@ -333,15 +357,16 @@ class DevLoop:
                     sandbox_result, sandbox_failed, test_result, ui_result, test_summary, truncated_files, created_files = recovery
 
             self.set_current_agent("Reviewer", project_id)
-            review_output, review_verdict, _ = run_review(
-                manager,
-                project_rules,
-                manager.current_code,
-                sandbox_result,
-                test_summary,
-                sandbox_failed,
-                self.run_with_timeout
-            )
+            with trace_span("review", "review"):
+                review_output, review_verdict, _ = run_review(
+                    manager,
+                    project_rules,
+                    manager.current_code,
+                    sandbox_result,
+                    test_summary,
+                    sandbox_failed,
+                    self.run_with_timeout
+                )
 
             # AENDERUNG 01.02.2026: Augment Context bei wiederholten Fehlern
             augment_context = ""
@@ -367,12 +392,13 @@ class DevLoop:
                 }, ensure_ascii=False))
 
             self.set_current_agent("Security", project_id)
-            security_passed, security_rescan_vulns = run_security_rescan(
-                manager,
-                project_rules,
-                manager.current_code,
-                iteration
-            )
+            with trace_span("security", "security"):
+                security_passed, security_rescan_vulns = run_security_rescan(
+                    manager,
+                    project_rules,
+                    manager.current_code,
+                    iteration
+                )
 
             # AENDERUNG 30.01.2026: Quality Gate - Security Validierung
             if hasattr(manager, 'quality_gate'):
@@ -580,9 +606,11 @@ class DevLoop:
             if validator_decision.root_cause:
                 try:
                     mem_path = os.path.join(manager.base_dir, "memory", "global_memory.json")
-                    ThreadPoolExecutor(max_workers=1).submit(update_memory, mem_path,
+                    # AENDERUNG 18.10.2026: Gemeinsamer Supervisor-Pool statt Wegwerf-Executor
+                    get_supervisor().submit(update_memory, mem_path,
                         f"Root Cause (Iter {iteration+1}): {validator_decision.root_cause[:500]}",
-                        f"Action: {validator_decision.action.value}", sandbox_result[:500] if sandbox_result else "")
+                        f"Action: {validator_decision.action.value}", sandbox_result[:500] if sandbox_result else "",
+                        name="update_memory:root_cause", owner="Memory")
                     manager._ui_log("Memory", "OrchestratorDecision", f"Root Cause aufgezeichnet (Iter {iteration+1})")
                 except Exception as e:
                     manager._ui_log("Memory", "Warning", f"Memory-Aufzeichnung fehlgeschlagen: {e}")
@@ -702,9 +730,10 @@ class DevLoop:
                     review_summary=review_output[:200] if review_output else "",
                     test_result=test_summary[:100] if test_summary else "")
             try:
-                ThreadPoolExecutor(max_workers=1).submit(update_memory, os.path.join(
+                get_supervisor().submit(update_memory, os.path.join(
                     manager.base_dir, "memory", "global_memory.json"),
-                    manager.current_code, review_output, sandbox_result)
+                    manager.current_code, review_output, sandbox_result,
+                    name="update_memory", owner="Memory")
             except Exception as e:
                 manager._ui_log("Memory", "Error", f"Memory fehlgeschlagen: {e}")
 
@@ -21,6 +21,7 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
 from sandbox_runner import run_sandbox
+from .project_code_store import parse_code_files
 
 
 # =========================================================================
@@ -145,22 +146,14 @@ def _parse_code_to_files(code: str) -> dict:
     Returns:
         Dict {filename: content} oder {} wenn kein Multi-File-Format erkannt
     """
-    pattern = r"###\s*(?:FILENAME|FILE|PATH|DATEI|PFAD)?:?\s*(.+?):?\s*[\r\n]+"
-    parts = re.split(pattern, code)
-    if len(parts) < 3:
-        return {}
-    code_dict = {}
-    for i in range(1, len(parts), 2):
-        if i + 1 >= len(parts):
-            break
-        filename = parts[i].strip().rstrip(':')
-        content = parts[i + 1].strip()
+    # AENDERUNG 18.10.2026: Gemeinsamer (gecachter) Parser aus project_code_store
+    # statt eigener re.split-Variante
+    return {
+        filename: content
+        for filename, content in parse_code_files(code).items()
         # AENDERUNG 09.02.2026: Fix 36 — Blacklisted Dateien aus Code-Dict filtern
-        if is_forbidden_file(filename):
-            continue
-        if filename and content:
-            code_dict[filename] = content
-    return code_dict
+        if not is_forbidden_file(filename)
+    }
 
 
 # AENDERUNG 20.02.2026: Fix 57a — Direkte JS-Validierung ohne detect_code_type()
@@ -310,7 +303,8 @@ def _validate_files_individually(code_dict: dict, tech_blueprint: dict) -> str:
     return f"✅ Alle {len(code_dict)} Dateien validiert (Pro-Datei-Pruefung)."
 
 
-def run_sandbox_for_project(code: str, tech_blueprint: dict) -> str:
+def run_sandbox_for_project(code: str, tech_blueprint: dict,
+                            code_files: Optional[Dict[str, str]] = None) -> str:
     """
     Führt Syntax-Check durch, berücksichtigt den Projekt-Typ aus dem Blueprint.
 
@@ -324,19 +318,24 @@ def run_sandbox_for_project(code: str, tech_blueprint: dict) -> str:
     Args:
         code: Der zu validierende Code
         tech_blueprint: Blueprint mit Projekt-Typ und Sprache
+        code_files: Bereits zerlegte Dateien (manager.code_store) - spart das Parsen von code
 
     Returns:
         Validierungsergebnis als String (✅ oder ❌)
     """
     language = tech_blueprint.get("language", "").lower()
     project_type = tech_blueprint.get("project_type", "").lower()
+    # AENDERUNG 18.10.2026: Dateien aus dem ProjectCodeStore uebernehmen statt neu zu parsen
+    if code_files is not None:
+        code_dict = {f: c for f, c in code_files.items() if c and not is_forbidden_file(f)}
+    else:
+        code_dict = _parse_code_to_files(code)
 
     # Python-Projekte: NUR Python-Syntax prüfen
     if language == "python" or any(pt in project_type for pt in [
         "python", "flask", "fastapi", "django", "tkinter", "pyqt", "pyside", "desktop"
     ]):
         # AENDERUNG 08.02.2026: Auch Python-Projekte pro Datei validieren (Fix 31)
-        code_dict = _parse_code_to_files(code)
         if code_dict:
             py_errors = []
             for filename, content in code_dict.items():
@@ -363,7 +362,6 @@ def run_sandbox_for_project(code: str, tech_blueprint: dict) -> str:
     # Symptom: "Nicht geschlossenes String-Literal (`)" in JEDER Iteration
     # Ursache: _validate_jsx() bekommt ALLE Dateien als einen String, Backticks bluten
     # Loesung: Code in einzelne Dateien aufteilen, jede separat validieren
-    code_dict = _parse_code_to_files(code)
     if code_dict:
         return _validate_files_individually(code_dict, tech_blueprint)
 
@@ -2,7 +2,7 @@
 """
 Author: rahn
 Datum: 10.02.2026
-Version: 1.1
+Version: 1.2
 Beschreibung: Paralleler PatchMode - verteilt Datei-Fixes auf mehrere Coder-Worker.
               Loest das Problem dass EIN Coder-Call fuer ALLE betroffenen Dateien
               den max_tokens Output-Limit ueberschreitet und abgeschnittene Dateien produziert.
@@ -10,6 +10,8 @@ Beschreibung: Paralleler PatchMode - verteilt Datei-Fixes auf mehrere Coder-Work
 AENDERUNG 10.02.2026: Fix 48 - Neue Datei
 AENDERUNG 13.02.2026: Fix 53 - Eigener Gruppen-Timeout, Modell-Rotation,
   gestaffelte Ausfuehrung (max_concurrent_groups), dynamische Gruppengroesse
+AENDERUNG 18.10.2026: Ergebnis per code_store.apply_patch() statt Neuaufbau
+  des gesamten Projekts von Platte (os.walk)
 ROOT-CAUSE-FIX:
   Symptom: Dateien werden abgeschnitten (`import { cl;` statt vollstaendiger Import)
   Ursache: EIN LLM-Call muss ALLE betroffenen Dateien ausgeben → Output > max_tokens
@@ -26,9 +28,14 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # _run_group_coder() nutzt jetzt _run_coder_with_timeout() mit eigenem Timeout
 from .dev_loop_coder import save_coder_output
 from .dev_loop_coder_prompt import build_coder_prompt, filter_feedback_for_files
-from .dev_loop_coder_utils import _get_affected_files_from_feedback, rebuild_current_code_from_disk
+from .dev_loop_coder_utils import (
+    _get_affected_files_from_feedback,
+    rebuild_current_code_from_disk,
+    sync_written_files,
+)
 from .dev_loop_helpers import _parse_code_to_files, _check_for_truncation, validate_before_write
 from .context_compressor import compress_context
+from .project_code_store import get_code_store
 
 logger = logging.getLogger(__name__)
 
@@ -292,7 +299,9 @@ def _run_coder_with_timeout(manager, project_rules, prompt, timeout_seconds):
         manager.config, project_rules,
         router=manager.model_router,
         include=["coder"],
-        tech_blueprint=getattr(manager, 'tech_blueprint', None)
+        tech_blueprint=getattr(manager, 'tech_blueprint', None),
+        # AENDERUNG 18.10.2026: Gruppen laufen parallel - eigene Agent-Instanz statt Pool
+        pooled=False
     ).get("coder")
 
     if not agent:
@@ -455,21 +464,19 @@ def run_parallel_patch(
                 manager._ui_log("ParallelPatch", "Error",
                     f"Gruppe {group} Timeout/Fehler: {str(e)[:200]}")
 
-    # Schritt 4: Merge — Aktualisiere code_dict mit neuen Ergebnissen
-    merged_code_dict = dict(code_dict)  # Kopie des aktuellen Stands
+    # Schritt 4: Merge — Ergebnisse den vollen Pfaden im code_dict zuordnen
+    # AENDERUNG 18.10.2026: Nur die geaenderten Dateien (Patch) statt Kopie des code_dict
+    patch: Dict[str, str] = {}
     created_files = []
 
     for fname, content in all_results.items():
         # Finde den vollen Pfad im code_dict
         matched_key = None
-        for key in merged_code_dict:
+        for key in code_dict:
             if os.path.basename(key) == fname or key.endswith(fname):
                 matched_key = key
                 break
-        if matched_key:
-            merged_code_dict[matched_key] = content
-        else:
-            merged_code_dict[fname] = content
+        patch[matched_key or fname] = content
         created_files.append(fname)
 
     # Schritt 5: Dateien auf Disk schreiben
@@ -489,8 +496,17 @@ def run_parallel_patch(
         )
         created_files = written_files
 
-    # Schritt 6: current_code von Disk rekonstruieren
-    merged_current_code = rebuild_current_code_from_disk(manager)
+    # Schritt 6: Geschriebene Dateien in den ProjectCodeStore uebernehmen
+    # AENDERUNG 18.10.2026: Nur diese Dateien zuruecklesen (Inhalt wie auf Platte)
+    if manager.project_path:
+        merged_current_code = sync_written_files(manager, created_files)
+    else:
+        store = get_code_store(manager)
+        if store is not None:
+            store.apply_patch(patch)
+            merged_current_code = store.render()
+        else:
+            merged_current_code = rebuild_current_code_from_disk(manager)
 
     manager._ui_log("ParallelPatch", "Complete",
         f"Parallel PatchMode abgeschlossen: "
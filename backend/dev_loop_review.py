@@ -2,12 +2,13 @@
 """
 Author: rahn
 Datum: 08.02.2026
-Version: 1.1
+Version: 1.2
 Beschreibung: Review-Funktion fuer DevLoop mit Retry- und Modellwechsel-Logik.
               Extrahiert aus dev_loop_validators.py (Regel 1: Max 500 Zeilen)
               Enthaelt: run_review
               AENDERUNG 08.02.2026: Modul-Extraktion aus dev_loop_validators.py
               AENDERUNG 10.02.2026: Fix 42 - Reviewer Context-Kompression
+              AENDERUNG 18.10.2026: Stabiler Prompt-Praefix fuer Provider-Prompt-Caching
 """
 
 import json
@@ -18,7 +19,7 @@ from crewai import Task
 
 from .agent_factory import init_agents
 from .context_compressor import compress_context
-from .dev_loop_coder_utils import _get_current_code_dict
+from .dev_loop_coder_utils import get_project_files
 from .orchestration_helpers import (
     is_rate_limit_error,
     is_model_unavailable_error,
@@ -29,9 +30,48 @@ from .orchestration_helpers import (
     truncate_review_output
 )
 from .heartbeat_utils import run_with_heartbeat
+from .operation_supervisor import OperationCancelled, check_cancelled
+from .prompt_cache import get_prompt_cache_settings, join_cacheable
 
 logger = logging.getLogger(__name__)
 
+# AENDERUNG 18.10.2026: Unveraenderlicher Teil des Reviewer-Prompts - mit aktivem
+# prompt_cache stabiler Praefix vor Code und Ergebnissen (wie build_coder_prompt)
+REVIEW_INSTRUCTIONS = """=== ANALYSE-ANWEISUNGEN ===
+ANALYSIERE den EXAKTEN Fehler im SANDBOX/DOCKER-ERGEBNIS!
+
+Bei Fehlern MUSST du folgendes liefern:
+1. URSACHE: Die KONKRETE Ursache (NICHT generisch "Docker fehlgeschlagen")
+2. BETROFFENE DATEIEN: [DATEI:dateiname.ext] fuer JEDE betroffene Datei
+3. LOESUNG: Konkreter Fix mit Code-Beispiel
+
+WICHTIG: Nenne JEDE betroffene Datei im Format [DATEI:dateiname.ext]!
+
+BEISPIELE fuer korrektes Feedback:
+- "ModuleNotFoundError: No module named 'flask'"
+  -> URSACHE: flask fehlt in requirements.txt
+  -> BETROFFENE DATEIEN: [DATEI:requirements.txt]
+  -> LOESUNG: Fuege 'flask' zu requirements.txt hinzu
+
+- "SyntaxError: unexpected indent in line 15"
+  -> URSACHE: Einrueckungsfehler in Zeile 15
+  -> BETROFFENE DATEIEN: [DATEI:app.py]
+  -> LOESUNG: Korrigiere die Einrueckung in Zeile 15
+
+- "ImportError: cannot import name 'Config' from 'config'"
+  -> URSACHE: Klasse Config existiert nicht in config.py
+  -> BETROFFENE DATEIEN: [DATEI:config.py]
+  -> LOESUNG: Erstelle die Config-Klasse in config.py
+
+VERBOTEN - Niemals solches Feedback geben:
+- "Die Docker-Tests sind fehlgeschlagen, was darauf hindeutet..."
+- "Es gibt Probleme mit der Konfiguration"
+- Unspezifische Aussagen ohne konkrete Dateinennung
+- OK sagen wenn Fehler im SANDBOX/DOCKER-ERGEBNIS vorhanden sind
+
+Wenn der Code FEHLERFREI ist und alle Tests bestanden: Antworte mit "OK"
+"""
+
 
 def _compress_review_code(manager, sandbox_result: str, test_summary: str) -> str:
     """
@@ -43,7 +83,8 @@ def _compress_review_code(manager, sandbox_result: str, test_summary: str) -> st
     Ursache: Reviewer bekam current_code verbatim ohne Kompression
     Loesung: compress_context() anwenden (gleiche Logik wie Coder)
     """
-    code_dict = _get_current_code_dict(manager)
+    # AENDERUNG 18.10.2026: Dateien aus manager.code_store statt os.walk
+    code_dict = get_project_files(manager)
     if not code_dict:
         return getattr(manager, 'current_code', '') or ''
 
@@ -143,41 +184,13 @@ def run_review(
 
 === TEST-ZUSAMMENFASSUNG ===
 {test_summary if test_summary else "Keine Test-Zusammenfassung vorhanden."}
-
-=== ANALYSE-ANWEISUNGEN ===
-ANALYSIERE den EXAKTEN Fehler oben im SANDBOX/DOCKER-ERGEBNIS!
-
-Bei Fehlern MUSST du folgendes liefern:
-1. URSACHE: Die KONKRETE Ursache (NICHT generisch "Docker fehlgeschlagen")
-2. BETROFFENE DATEIEN: [DATEI:dateiname.ext] fuer JEDE betroffene Datei
-3. LOESUNG: Konkreter Fix mit Code-Beispiel
-
-WICHTIG: Nenne JEDE betroffene Datei im Format [DATEI:dateiname.ext]!
-
-BEISPIELE fuer korrektes Feedback:
-- "ModuleNotFoundError: No module named 'flask'"
-  -> URSACHE: flask fehlt in requirements.txt
-  -> BETROFFENE DATEIEN: [DATEI:requirements.txt]
-  -> LOESUNG: Fuege 'flask' zu requirements.txt hinzu
-
-- "SyntaxError: unexpected indent in line 15"
-  -> URSACHE: Einrueckungsfehler in Zeile 15
-  -> BETROFFENE DATEIEN: [DATEI:app.py]
-  -> LOESUNG: Korrigiere die Einrueckung in Zeile 15
-
-- "ImportError: cannot import name 'Config' from 'config'"
-  -> URSACHE: Klasse Config existiert nicht in config.py
-  -> BETROFFENE DATEIEN: [DATEI:config.py]
-  -> LOESUNG: Erstelle die Config-Klasse in config.py
-
-VERBOTEN - Niemals solches Feedback geben:
-- "Die Docker-Tests sind fehlgeschlagen, was darauf hindeutet..."
-- "Es gibt Probleme mit der Konfiguration"
-- Unspezifische Aussagen ohne konkrete Dateinennung
-- OK sagen wenn Fehler im SANDBOX/DOCKER-ERGEBNIS vorhanden sind
-
-Wenn der Code FEHLERFREI ist und alle Tests bestanden: Antworte mit "OK"
 """
+    # AENDERUNG 18.10.2026: Stabile Anweisungen als Cache-Praefix vor Code/Ergebnissen
+    cache_settings = get_prompt_cache_settings(manager.config)
+    if cache_settings["enabled"]:
+        r_prompt = join_cacheable(REVIEW_INSTRUCTIONS, r_prompt, cache_settings["min_prefix_chars"])
+    else:
+        r_prompt += "\n" + REVIEW_INSTRUCTIONS
     manager._update_worker_status("reviewer", "working", "Pruefe Code...", manager.model_router.get_model("reviewer") if manager.model_router else "")
 
     # AENDERUNG 08.02.2026: Nur noch agent_timeouts Dict (globales agent_timeout_seconds entfernt)
@@ -233,6 +246,7 @@ Wenn der Code FEHLERFREI ist und alle Tests bestanden: Antworte mit "OK"
     last_error_type = None
 
     for review_attempt in range(MAX_REVIEW_RETRIES):
+        check_cancelled()
         task_review = Task(description=r_prompt, expected_output="OK/Feedback", agent=agent_reviewer)
         current_model = manager.model_router.get_model("reviewer")
         try:
@@ -276,6 +290,10 @@ Wenn der Code FEHLERFREI ist und alle Tests bestanden: Antworte mit "OK"
                     error_tracker = {}  # Tracker zuruecksetzen nach Modellwechsel
                 continue
             break
+        except OperationCancelled as oc:
+            # AENDERUNG 18.10.2026: Abbruch (API/Supervisor) beendet die Retry-Schleife
+            manager._ui_log("Reviewer", "Cancelled", f"Code-Review abgebrochen: {oc}")
+            raise
         except TimeoutError as te:
             # AENDERUNG 02.02.2026: OpenRouter-Fehler = sofortiger Modellwechsel
             if is_openrouter_error(te):
@@ -28,6 +28,7 @@ from .parallel_file_generator import (
     get_file_list_from_plan
 )
 from .dev_loop_steps import run_sandbox_and_tests
+from .project_code_store import get_code_store
 
 logger = logging.getLogger(__name__)
 
@@ -284,10 +285,15 @@ def handle_truncation_recovery(manager, project_rules, truncated_files,
             loop.close()
 
         if repair_success and repaired_content:
-            manager.current_code = merge_repaired_files(
-                manager.current_code,
-                repaired_content
-            )
+            # AENDERUNG 18.10.2026: Patch direkt in den ProjectCodeStore (O(reparierte Dateien))
+            code_store = get_code_store(manager)
+            if code_store is not None:
+                code_store.apply_patch(repaired_content)
+            else:
+                manager.current_code = merge_repaired_files(
+                    manager.current_code,
+                    repaired_content
+                )
             manager._ui_log("DevLoop", "TruncationRepaired", json.dumps({
                 "success": True,
                 "repaired_files": list(repaired_content.keys()),
@@ -458,7 +464,10 @@ def process_utds_feedback(task_derivation, manager, feedback,
             )
             if sec_modified:
                 _utds_modified_files.extend(sec_modified)
-            if sec_success:
+            # AENDERUNG 18.10.2026: None = nur bekannte Issues, keine Ableitung noetig
+            if sec_success is None:
+                manager._ui_log("TaskDerivation", "SecuritySkipped", sec_summary)
+            elif sec_success:
                 manager._ui_log("TaskDerivation", "SecuritySuccess",
                                f"Security-Tasks erfolgreich: {len(sec_modified)} Dateien geaendert")
             else:
@@ -478,7 +487,9 @@ def process_utds_feedback(task_derivation, manager, feedback,
             )
             if sb_modified:
                 _utds_modified_files.extend(sb_modified)
-            if sb_success:
+            if sb_success is None:
+                manager._ui_log("TaskDerivation", "SandboxSkipped", sb_summary)
+            elif sb_success:
                 manager._ui_log("TaskDerivation", "SandboxSuccess",
                                f"Sandbox-Tasks erfolgreich: {len(sb_modified)} Dateien geaendert")
             else:
@@ -494,7 +505,9 @@ def process_utds_feedback(task_derivation, manager, feedback,
         )
         if td_modified:
             _utds_modified_files.extend(td_modified)
-        if td_success:
+        if td_success is None:
+            manager._ui_log("TaskDerivation", "Skipped", td_summary)
+        elif td_success:
             manager._ui_log("TaskDerivation", "Success",
                            f"Alle Tasks erfolgreich: {len(td_modified)} Dateien geaendert")
             # AENDERUNG 13.02.2026: Fix 53d — Original-Feedback ERHALTEN statt ersetzen
@@ -15,7 +15,6 @@ import base64
 import logging
 from datetime import datetime
 from typing import Dict, Any, List, Tuple
-from concurrent.futures import ThreadPoolExecutor
 
 from agents.memory_agent import (
     extract_error_pattern,
@@ -37,6 +36,8 @@ from content_validator import (
 from .dev_loop_helpers import run_sandbox_for_project
 from .dev_loop_test_utils import ensure_tests_exist
 from .pre_docker_validator import validate_before_docker
+from .project_code_store import get_code_store
+from .operation_supervisor import get_supervisor
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +164,33 @@ def _is_harmless_warning_only(stderr: str, stdout: str = "") -> bool:
     return len(non_warning_lines) == 0
 
 
+def _run_docker_test_matrix(manager, executor):
+    """
+    AENDERUNG 18.10.2026: Fuehrt die Docker-Test-Matrix aus und liefert ein
+    kombiniertes DockerResult (kompatibel zum bisherigen install_and_test()).
+    """
+    try:
+        from server_runner import requires_server
+        include_app = requires_server(manager.tech_blueprint)
+    except ImportError:
+        include_app = False
+
+    checks = executor.build_matrix_checks(include_app=include_app)
+    manager._ui_log("Docker", "Info",
+        f"Test-Matrix: {', '.join(c.name for c in checks)} parallel")
+    matrix = executor.run_test_matrix(
+        checks,
+        on_log=lambda check, stream, line: logger.debug("[%s/%s] %s", check, stream, line)
+    )
+    manager._ui_log("Docker", "Matrix", json.dumps({
+        "checks": {name: {"success": r.success, "duration": round(r.duration_seconds, 1)}
+                   for name, r in matrix.results.items()},
+        "cancelled": matrix.cancelled,
+        "duration": round(matrix.duration_seconds, 1)
+    }, ensure_ascii=False))
+    return matrix.combined_result()
+
+
 def run_sandbox_and_tests(
     manager,
     current_code: str,
@@ -180,7 +208,13 @@ def run_sandbox_and_tests(
     # Spart Docker-Zeit wenn Code offensichtliche Fehler hat (Truncation, zirkulaere Imports)
     if created_files and manager.project_path:
         project_files = {}
+        # AENDERUNG 18.10.2026: Inhalte aus manager.code_store, Platte nur als Fallback
+        code_store = get_code_store(manager)
         for filepath in created_files:
+            stored = code_store.get(filepath) if code_store is not None else None
+            if stored:
+                project_files[filepath] = stored
+                continue
             full_path = os.path.join(manager.project_path, filepath)
             if os.path.exists(full_path):
                 try:
@@ -271,8 +305,13 @@ def run_sandbox_and_tests(
 
                 # AENDERUNG 01.02.2026: Install + Test in EINEM Container
                 # Vorher: getrennte Aufrufe fuehrten zu "No module named pytest"
-                manager._ui_log("Docker", "Info", "Installiere Dependencies und fuehre Tests aus...")
-                combined_result = executor.install_and_test()
+                # AENDERUNG 18.10.2026: Test-Matrix - Syntax, Install+Test und App-Start
+                # laufen als parallele Container gegen dasselbe Image
+                if docker_config.get("test_matrix", True):
+                    combined_result = _run_docker_test_matrix(manager, executor)
+                else:
+                    manager._ui_log("Docker", "Info", "Installiere Dependencies und fuehre Tests aus...")
+                    combined_result = executor.install_and_test()
 
             # Ab hier: combined_result aus BEIDEN Pfaden (persistent ODER Einmal-Container)
             if combined_result.success:
@@ -339,7 +378,11 @@ def run_sandbox_and_tests(
                     logger.warning("Docker-Cleanup fehlgeschlagen: %s", cleanup_err)
 
     # AENDERUNG 31.01.2026: Nutze Projekt-Typ-aware Sandbox statt generischem run_sandbox()
-    sandbox_result = run_sandbox_for_project(current_code, manager.tech_blueprint)
+    # AENDERUNG 18.10.2026: Validatoren lesen die Dateien aus manager.code_store
+    code_store = get_code_store(manager)
+    sandbox_result = run_sandbox_for_project(
+        current_code, manager.tech_blueprint,
+        code_files=code_store.as_dict(skip_empty=True) if code_store is not None else None)
     manager._ui_log("Sandbox", "Result", sandbox_result)
     sandbox_failed = sandbox_result.startswith("\u274c")
 
@@ -375,9 +418,9 @@ def run_sandbox_and_tests(
             error_msg = extract_error_pattern(sandbox_result)
             tags = generate_tags_from_context(manager.tech_blueprint, sandbox_result)
             # AENDERUNG 29.01.2026: Non-blocking Memory-Operation fuer WebSocket-Stabilitaet
-            with ThreadPoolExecutor(max_workers=1) as mem_executor:
-                future = mem_executor.submit(learn_from_error, memory_path, error_msg, tags)
-                learn_result = future.result(timeout=5)  # Max 5s warten
+            # AENDERUNG 18.10.2026: Supervisor-Pool - der Timeout gibt den Aufrufer wirklich frei
+            learn_result = get_supervisor().run(learn_from_error, memory_path, error_msg, tags,
+                                                name="learn_from_error", owner="Memory", timeout=5)
             manager._ui_log("Memory", "Learning", f"Sandbox: {learn_result}")
         except Exception as mem_err:
             manager._ui_log("Memory", "Error", f"Memory-Operation fehlgeschlagen: {mem_err}")
@@ -394,11 +437,21 @@ def run_sandbox_and_tests(
             # AENDERUNG 30.01.2026: Stelle sicher dass Tests existieren bevor wir sie ausfuehren
             ensure_tests_exist(manager, iteration)
 
-            unit_test_result = run_unit_tests(manager.project_path, manager.tech_blueprint)
+            # AENDERUNG 18.10.2026: Inkrementelle Unit-Tests (Impact-Analyse) im Patch-Modus,
+            # letzte Iteration laeuft immer mit kompletter Suite
+            incremental = manager.config.get("testing", {}).get("incremental_unit_tests", True)
+            max_retries = getattr(manager, "max_retries", None) or manager.config.get("max_retries", 3)
+            unit_test_result = run_unit_tests(
+                manager.project_path, manager.tech_blueprint,
+                changed_files=created_files,
+                incremental=bool(incremental),
+                full_run=iteration + 1 >= max_retries
+            )
         manager._ui_log("UnitTest", "Result", json.dumps({
             "status": unit_test_result.get("status"),
             "summary": unit_test_result.get("summary"),
             "test_count": unit_test_result.get("test_count", 0),
+            "impact": unit_test_result.get("impact"),
             "iteration": iteration + 1
         }, ensure_ascii=False))
         if unit_test_result.get("status") == "FAIL":
@@ -473,9 +526,9 @@ def run_sandbox_and_tests(
                 tags = generate_tags_from_context(manager.tech_blueprint, test_summary)
                 tags.append("ui-test")
                 # AENDERUNG 29.01.2026: Non-blocking Memory-Operation fuer WebSocket-Stabilitaet
-                with ThreadPoolExecutor(max_workers=1) as mem_executor:
-                    future = mem_executor.submit(learn_from_error, memory_path, error_msg, tags)
-                    learn_result = future.result(timeout=5)  # Max 5s warten
+                # AENDERUNG 18.10.2026: Supervisor-Pool - der Timeout gibt den Aufrufer wirklich frei
+                learn_result = get_supervisor().run(learn_from_error, memory_path, error_msg, tags,
+                                                    name="learn_from_error", owner="Memory", timeout=5)
                 manager._ui_log("Memory", "Learning", f"Test: {learn_result}")
             except Exception as mem_err:
                 manager._ui_log("Memory", "Error", f"Memory-Operation fehlgeschlagen: {mem_err}")
@@ -26,6 +26,7 @@ from .orchestration_helpers import (
     extract_vulnerabilities
 )
 from .heartbeat_utils import run_with_heartbeat
+from .operation_supervisor import OperationCancelled, check_cancelled
 from .claude_sdk import run_sdk_with_retry
 
 logger = logging.getLogger(__name__)
@@ -130,6 +131,7 @@ WICHTIG - CVE-REGELN:
         # Fallback: CrewAI/OpenRouter Retry-Schleife
         # AENDERUNG 30.01.2026: Retry-Schleife mit Fallback bei 404/Rate-Limit
         for security_attempt in range(MAX_SECURITY_RETRIES):
+            check_cancelled()
             current_security_model = manager.model_router.get_model("security") if manager.model_router else "unknown"
             manager._update_worker_status("security", "working",
                 f"Security-Scan (Versuch {security_attempt + 1}/{MAX_SECURITY_RETRIES})",
@@ -197,6 +199,11 @@ WICHTIG - CVE-REGELN:
                 manager._update_worker_status("security", "idle")
                 break  # Erfolg - Schleife verlassen
 
+            except OperationCancelled as oc:
+                # AENDERUNG 18.10.2026: Abbruch (API/Supervisor) beendet die Retry-Schleife
+                manager._ui_log("Security", "Cancelled", f"Security-Scan abgebrochen: {oc}")
+                manager._update_worker_status("security", "idle")
+                raise
             except Exception as sec_err:
                 # AENDERUNG 30.01.2026: Retry bei 404/Rate-Limit/Leere Antwort mit Fallback-Modell
                 should_retry = (
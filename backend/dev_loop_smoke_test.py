@@ -196,8 +196,14 @@ def run_smoke_test(
             logger.info(f"Smoke-Test: Server gestartet auf {server.url}")
 
             # Server-Output fuer Compile-Error-Erkennung capturen
+            # AENDERUNG 18.10.2026: Bevorzugt aus dem Output-Tail des server_runner lesen
+            # (die Pipes werden dort bereits im Hintergrund konsumiert)
+            output_tail = getattr(server, "output_tail", None)
             if server.process:
-                server_output = _capture_server_output(server.process, timeout=3.0)
+                if output_tail is not None:
+                    server_output = output_tail.read_new(wait=0.5)
+                else:
+                    server_output = _capture_server_output(server.process, timeout=3.0)
                 result.server_output = server_output
                 result.compile_errors = _extract_compile_errors(server_output)
 
@@ -213,7 +219,10 @@ def run_smoke_test(
 
             # Nochmal Server-Output checken (Compile-Errors koennen verzoegert kommen)
             if server.process:
-                late_output = _capture_server_output(server.process, timeout=2.0)
+                if output_tail is not None:
+                    late_output = output_tail.read_new(wait=0.5)
+                else:
+                    late_output = _capture_server_output(server.process, timeout=2.0)
                 if late_output:
                     result.server_output += late_output
                     late_errors = _extract_compile_errors(late_output)
@@ -17,6 +17,7 @@ from backend.task_deriver import TaskDeriver
 from backend.task_dispatcher import TaskDispatcher
 from backend.task_tracker import TaskTracker
 from backend.dart_task_sync import DartTaskSync
+from backend.feedback_delta import FeedbackDeltaEngine, delta_text
 
 # AENDERUNG 01.02.2026: Memory und Documentation Integration
 try:
@@ -62,6 +63,9 @@ class DevLoopTaskDerivation:
         # Dispatcher (lazy init)
         self._dispatcher: Optional[TaskDispatcher] = None
 
+        # AENDERUNG 18.10.2026: Issue-Ledger pro Run - nur neue/regressed Issues ableiten
+        self.feedback_delta = FeedbackDeltaEngine.from_config(self.config)
+
     @property
     def dispatcher(self) -> TaskDispatcher:
         """Lazy-Init des Dispatchers."""
@@ -79,7 +83,7 @@ class DevLoopTaskDerivation:
         feedback: str,
         source: str,
         context: Dict[str, Any] = None
-    ) -> Tuple[bool, str, List[str]]:
+    ) -> Tuple[Optional[bool], str, List[str]]:
         """
         Verarbeitet Feedback durch Task-Ableitung und parallele Ausfuehrung.
 
@@ -89,21 +93,35 @@ class DevLoopTaskDerivation:
             context: Zusaetzlicher Kontext
 
         Returns:
-            Tuple (erfolg, zusammengefasstes_feedback, modifizierte_dateien)
+            Tuple (erfolg, zusammengefasstes_feedback, modifizierte_dateien);
+            erfolg None = uebersprungen (nur bereits abgeleitete Issues), der
+            Text ist dann nur eine Statusmeldung und gehoert nicht ins Feedback
         """
         context = context or {}
 
+        # AENDERUNG 18.10.2026: Bereits abgeleitete, unveraenderte Issues unterdruecken
+        delta = self.feedback_delta.filter(feedback, source)
+        derivation_feedback = feedback
+        if delta is not None:
+            self._emit_event("FeedbackDelta", {**delta.to_dict(), "stats": self.get_stats()})
+            if delta.skip_derivation:
+                return None, (f"UTDS: {delta.suppressed} bekannte Issues unveraendert "
+                              f"- keine neue Task-Ableitung ({source})"), []
+            derivation_feedback = delta_text(delta, feedback)
+
         # AENDERUNG 01.02.2026: Strukturiertes WebSocket Event - Start
         self._emit_event("DerivationStart", {
             "source": source,
-            "feedback_length": len(feedback),
+            "feedback_length": len(derivation_feedback),
             "has_context": bool(context)
         })
 
         # 1. Tasks ableiten
-        result = self.deriver.derive_tasks(feedback, source, context)
+        result = self.deriver.derive_tasks(derivation_feedback, source, context)
 
         if not result.tasks:
+            # Nichts Ausfuehrbares abgeleitet - dieselben Issues erneut abzuleiten hilft nicht
+            self.feedback_delta.confirm(delta, True)
             self._emit_event("DerivationComplete", {
                 "success": False,
                 "reason": "no_tasks_derived",
@@ -154,6 +172,8 @@ class DevLoopTaskDerivation:
 
         # 4. Ergebnisse zusammenfassen
         success, summary, modified_files = self._summarize_results(batch_results, result)
+        # AENDERUNG 18.10.2026: Nur erfolgreich behobene Issues kuenftig unterdruecken
+        self.feedback_delta.confirm(delta, success)
 
         # AENDERUNG 01.02.2026: Execution Results dokumentieren
         self._record_execution_to_documentation(batch_results)
@@ -375,6 +395,10 @@ class DevLoopTaskDerivation:
 
         return success, "\n".join(summary_parts), list(set(all_modified))
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistik der Feedback-Delta-Engine (unterdrueckte Duplikate etc.)."""
+        return {"feedback_delta": self.feedback_delta.stats()}
+
     def get_pending_tasks(self) -> List[DerivedTask]:
         """Liefert alle ausstehenden Tasks."""
         return self.tracker.get_pending_tasks()
@@ -442,7 +466,8 @@ def integrate_task_derivation(
         iteration: Aktuelle Iteration
 
     Returns:
-        Tuple (verwendet_task_derivation, feedback_oder_summary, modifizierte_dateien)
+        Tuple (verwendet_task_derivation, feedback_oder_summary, modifizierte_dateien);
+        None = uebersprungen (siehe process_feedback)
     """
     # Task-Derivation Instanz holen oder erstellen
     if not hasattr(manager, '_task_derivation'):
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Persistenter Cache fuer Bibliotheks-Dokumentation (Doc-Enrichment).
+              Key: (Library, Version, Query-Hint), Eintraege mit TTL - geteilt
+              ueber Runs und Projekte. Leere Ergebnisse ("keine Docs") werden
+              mit kuerzerer TTL gemerkt, damit ein ausgefallener MCP-Server nicht
+              jeden Run erneut Zeit kostet.
+              Folgt dem Pattern von feature_tracking_db.py (WAL-Mode, Thread-local).
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "budget_data")
+DB_PATH = os.path.join(DB_DIR, "doc_cache.db")
+DEFAULT_TTL_HOURS = 168
+DEFAULT_NEGATIVE_TTL_HOURS = 1
+
+
+def doc_cache_key(library: str, version: str, query: str) -> str:
+    raw = "\x00".join(((library or "").lower(), str(version or ""), query or ""))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class DocDiskCache:
+    """SQLite-Cache fuer Docs mit TTL (positiv und negativ)."""
+
+    def __init__(self, db_path: str = None, ttl_hours: float = DEFAULT_TTL_HOURS,
+                 negative_ttl_hours: float = DEFAULT_NEGATIVE_TTL_HOURS):
+        self.db_path = db_path or DB_PATH
+        self.ttl_seconds = ttl_hours * 3600
+        self.negative_ttl_seconds = negative_ttl_hours * 3600
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Thread-lokale Connection (SQLite ist nicht thread-safe)."""
+        if not hasattr(self._local, 'conn') or self._local.conn is None:
+            self._local.conn = sqlite3.connect(self.db_path, timeout=10)
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.execute("PRAGMA busy_timeout=5000")
+        return self._local.conn
+
+    def _init_db(self):
+        conn = self._get_conn()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS docs (
+                key TEXT PRIMARY KEY,
+                library TEXT NOT NULL,
+                version TEXT,
+                query TEXT,
+                content TEXT,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                hits INTEGER DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_docs_expires ON docs(expires_at);
+        """)
+        conn.commit()
+
+    def get(self, library: str, version: str, query: str,
+            now: Optional[float] = None) -> Tuple[bool, Optional[str]]:
+        """(Treffer, Inhalt) - Inhalt None heisst: zuletzt keine Docs gefunden."""
+        now = time.time() if now is None else now
+        key = doc_cache_key(library, version, query)
+        conn = self._get_conn()
+        row = conn.execute("SELECT content, expires_at FROM docs WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] < now:
+            return False, None
+        conn.execute("UPDATE docs SET hits = hits + 1 WHERE key = ?", (key,))
+        conn.commit()
+        return True, row[0]
+
+    def put(self, library: str, version: str, query: str, content: Optional[str],
+            now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        ttl = self.ttl_seconds if content else self.negative_ttl_seconds
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO docs (key, library, version, query, content, fetched_at, expires_at, hits) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+            (doc_cache_key(library, version, query), (library or "").lower(), str(version or ""),
+             query or "", content or None, now, now + ttl))
+        conn.commit()
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        conn = self._get_conn()
+        cursor = conn.execute("DELETE FROM docs WHERE expires_at < ?", (now,))
+        conn.commit()
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._get_conn()
+        total, negative, hits = conn.execute(
+            "SELECT COUNT(*), SUM(content IS NULL), COALESCE(SUM(hits), 0) FROM docs").fetchone()
+        return {"entries": total, "negative": negative or 0, "hits": hits}
+
+
+_instances: Dict[str, DocDiskCache] = {}
+_instance_lock = threading.Lock()
+
+
+def get_doc_disk_cache(settings: Any) -> Optional[DocDiskCache]:
+    """
+    Cache aus doc_enrichment.disk_cache - ohne enabled: true kein Disk-Cache.
+
+    Eine Instanz pro Pfad, damit alle Pipelines (Runs) dieselbe DB teilen.
+    """
+    if not isinstance(settings, dict) or not settings.get("enabled", False):
+        return None
+    path = settings.get("path") or DB_PATH
+    with _instance_lock:
+        cache = _instances.get(path)
+        if cache is None:
+            try:
+                cache = DocDiskCache(path,
+                                     ttl_hours=settings.get("ttl_hours", DEFAULT_TTL_HOURS),
+                                     negative_ttl_hours=settings.get("negative_ttl_hours",
+                                                                     DEFAULT_NEGATIVE_TTL_HOURS))
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Doc-Cache nicht verfuegbar (%s): %s", path, e)
+                return None
+            _instances[path] = cache
+        return cache
@@ -2,7 +2,7 @@
 """
 Author: rahn
 Datum: 10.02.2026
-Version: 1.0
+Version: 1.2
 Beschreibung: Doc-Enrichment Pipeline - Holt relevante Bibliotheks-Dokumentation
               und injiziert sie in den Coder-Prompt via MCP Server.
               Primaer: Context7 MCP (kostenlos, kein API-Key noetig)
@@ -13,15 +13,27 @@ ROOT-CAUSE-FIX:
   Symptom: Coder generiert Code mit fehlender Library-Integration (z.B. Shadcn border-border)
   Ursache: Coder-Prompt enthaelt nur Template-Regeln, keine aktuellen Library-Docs
   Loesung: MCP-basierte Documentation-Retrieval Pipeline mit Session-Cache
+
+AENDERUNG 18.10.2026: MCP-Sessions bleiben ueber Fetches offen (mcp_session_pool.py),
+  Libraries werden parallel mit gemeinsamem Zeitbudget geholt, Ergebnisse landen
+  zusaetzlich im persistenten Doc-Cache (doc_cache.py) fuer alle Runs/Projekte.
+
+AENDERUNG 18.10.2026: docs_generation zaehlt verspaetet fertige Fetches - Teil des
+  SectionCache-Keys im Coder-Prompt, damit spaete Docs den naechsten Prompt erreichen.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 import re
 import shutil
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set, Tuple
+
+from .doc_cache import get_doc_disk_cache
+from .mcp_session_pool import ConnectFn, get_mcp_session_pool, is_connection_error, stdio_session
 
 logger = logging.getLogger(__name__)
 
@@ -102,7 +114,19 @@ class DocEnrichmentPipeline:
         self._enabled = self._config.get("enabled", False)
         self._cache: Dict[str, Optional[str]] = {}
         self._npx_path: Optional[str] = None
-        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="doc-enrich")
+        # AENDERUNG 18.10.2026: Parallele Fetches ueber langlebige MCP-Sessions + Disk-Cache
+        self._versions: Dict[str, str] = {}
+        self._executor = ThreadPoolExecutor(max_workers=self._config.get("max_concurrent_fetches", 4),
+                                            thread_name_prefix="doc-enrich")
+        self._pool = get_mcp_session_pool()
+        self._pool.idle_timeout = self._config.get("session_idle_timeout_seconds", self._pool.idle_timeout)
+        self._disk_cache = get_doc_disk_cache(self._config.get("disk_cache"))
+        # Negative Disk-Eintraege nur, wenn Context7 "keine Docs" meldet - nie nach Fehlern
+        self._reported_missing: Set[str] = set()
+        self._fetch_failed: Set[str] = set()
+        # AENDERUNG 18.10.2026: Steigt, wenn ein Fetch nach dem Zeitbudget fertig wird
+        self.docs_generation = 0
+        self._generation_lock = threading.Lock()
         # AENDERUNG 10.02.2026: Fix 47b — UI-Logging Callback
         # Damit Specialist-Aktivitaeten im Frontend-Output sichtbar sind
         self._ui_log = ui_log_callback
@@ -121,6 +145,9 @@ class DocEnrichmentPipeline:
         if not libraries:
             return ""
 
+        self._versions = self._library_versions(tech_blueprint)
+        docs = self._fetch_all(libraries)
+
         max_total = self._config.get("max_total_chars", 10000)
         sections = []
         total_chars = 0
@@ -129,7 +156,7 @@ class DocEnrichmentPipeline:
             if total_chars >= max_total:
                 break
 
-            doc = self._fetch_docs_for_library(lib_name, query_hint)
+            doc = docs.get(lib_name)
             if not doc:
                 continue
 
@@ -147,6 +174,45 @@ class DocEnrichmentPipeline:
         header = "\n\n📚 BIBLIOTHEKS-DOKUMENTATION (aktuelle Docs - BEACHTEN!):\n"
         return header + "\n\n".join(sections) + "\n"
 
+    def _fetch_all(self, libraries: List[Tuple[str, str]]) -> Dict[str, Optional[str]]:
+        """
+        Holt alle Libraries parallel mit gemeinsamem Zeitbudget (fetch_budget_seconds).
+
+        Nicht rechtzeitig fertige Fetches laufen weiter und fuellen den Cache
+        fuer den naechsten Prompt. Sobald einer fertig ist, steigt docs_generation -
+        die bis dahin memoisierte (unvollstaendige) Prompt-Sektion ist damit veraltet.
+        """
+        budget = self._config.get("fetch_budget_seconds", 45)
+        futures = {self._executor.submit(self._fetch_docs_for_library, lib_name, query_hint): lib_name
+                   for lib_name, query_hint in libraries}
+        done, pending = wait(futures, timeout=budget)
+        results: Dict[str, Optional[str]] = {}
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                logger.warning("Doc-Enrichment Fehler fuer '%s': %s", futures[future], str(e)[:200])
+        if pending:
+            skipped = sorted(futures[f] for f in pending)
+            logger.info("Doc-Enrichment: Zeitbudget %ss erschoepft, ohne Docs: %s", budget, skipped)
+            self._emit_ui_log("DocEnrichment", "Budget",
+                              f"Zeitbudget erschoepft - spaeter verfuegbar: {', '.join(skipped)}")
+            for future in pending:
+                future.add_done_callback(self._late_fetch_done)
+        return results
+
+    def _late_fetch_done(self, _future) -> None:
+        with self._generation_lock:
+            self.docs_generation += 1
+
+    @staticmethod
+    def _library_versions(tech_blueprint: dict) -> Dict[str, str]:
+        """Versionen aus tech_blueprint.dependencies (Teil des Disk-Cache-Keys)."""
+        deps = tech_blueprint.get("dependencies", {})
+        if not isinstance(deps, dict):
+            return {}
+        return {str(name).lower(): str(version or "") for name, version in deps.items()}
+
     def _detect_libraries(self, tech_blueprint: dict, user_goal: str) -> List[Tuple[str, str]]:
         """Erkennt Bibliotheken aus Goal-Keywords, Dependencies und Templates. Max 5."""
         detected = []
@@ -190,29 +256,48 @@ class DocEnrichmentPipeline:
         return detected[:5]  # Maximal 5 Bibliotheken (Token-Budget)
 
     def _fetch_docs_for_library(self, library_name: str, query_hint: str) -> Optional[str]:
-        """Holt Docs mit Session-Cache. Async-to-Sync Bridge via ThreadPoolExecutor."""
+        """Holt Docs mit Session-Cache und Disk-Cache. Sync-Bridge ueber den MCP-Pool-Loop."""
         # Cache-Lookup
         cache_key = library_name.lower()
         if cache_key in self._cache:
             logger.debug("Doc-Enrichment Cache-Hit: '%s'", library_name)
             return self._cache[cache_key]
 
-        # Async-to-Sync Bridge (gleiche Pattern wie CodeRabbit)
-        # ROOT-CAUSE-FIX: DevLoop ist synchron, MCP SDK ist async
-        # Loesung: asyncio.run() in separatem Thread via ThreadPoolExecutor
-        def _run_async():
-            return asyncio.run(self._fetch_async(library_name, query_hint))
+        version = self._versions.get(cache_key, "")
+        if self._disk_cache is not None:
+            try:
+                hit, cached = self._disk_cache.get(library_name, version, query_hint)
+            except Exception as e:
+                logger.debug("Doc-Cache Lesefehler: %s", e)
+                hit, cached = False, None
+            if hit:
+                logger.debug("Doc-Enrichment Disk-Cache-Hit: '%s'", library_name)
+                self._cache[cache_key] = cached
+                return cached
 
+        # ROOT-CAUSE-FIX: DevLoop ist synchron, MCP SDK ist async
+        # AENDERUNG 18.10.2026: Statt asyncio.run() pro Fetch laeuft alles auf dem Pool-Loop,
+        # dort bleiben die MCP-Sessions zwischen den Fetches offen
+        self._reported_missing.discard(cache_key)
+        self._fetch_failed.discard(cache_key)
         try:
-            future = self._executor.submit(_run_async)
-            result = future.result(timeout=60)
+            result = self._pool.run(self._fetch_async(library_name, query_hint), timeout=60)
         except Exception as e:
             logger.warning("Doc-Enrichment Async-Bridge Fehler fuer '%s': %s",
                            library_name, str(e)[:200])
             result = None
+            self._fetch_failed.add(cache_key)
 
         # Ergebnis cachen (auch None, um wiederholte Fehlversuche zu vermeiden)
         self._cache[cache_key] = result
+        # AENDERUNG 18.10.2026: Auf die Platte nur Docs oder ein bestaetigtes "keine Docs" -
+        # Timeouts/Verbindungsfehler sind voruebergehend und werden im naechsten Run erneut versucht
+        confirmed_missing = cache_key in self._reported_missing and cache_key not in self._fetch_failed
+        if self._disk_cache is not None and (result or confirmed_missing):
+            try:
+                self._disk_cache.put(library_name, version, query_hint, result)
+            except Exception as e:
+                logger.debug("Doc-Cache Schreibfehler: %s", e)
         return result
 
     def _emit_ui_log(self, agent: str, event: str, message: str):
@@ -266,88 +351,84 @@ class DocEnrichmentPipeline:
         timeout = ctx7_config.get("timeout_seconds", 30)
         max_chars = self._config.get("max_docs_chars", 3000)
 
+        key = "context7"
+        entry = None
         try:
-            from mcp import ClientSession
-            from mcp.client.stdio import stdio_client, StdioServerParameters
+            # AENDERUNG 18.10.2026: Session aus dem Pool - Handshake nur einmal pro Server
+            entry = await self._pool.acquire(
+                key, self._connect(npx_path, ["-y", "@upstash/context7-mcp"], {**os.environ}), timeout)
+
+            # Tool-Namen dynamisch ermitteln (Context7 benennt Tools um)
+            tool_names = entry.tool_names
+            resolve_tool = "resolve-library-id"
+            # Context7 hat get-library-docs zu query-docs umbenannt
+            if "get-library-docs" in tool_names:
+                docs_tool = "get-library-docs"
+            else:
+                docs_tool = "query-docs"
+
+            if resolve_tool not in tool_names:
+                logger.warning("Context7: Tool '%s' nicht gefunden. Verfuegbar: %s",
+                               resolve_tool, tool_names)
+                return None
+
+            if docs_tool not in tool_names:
+                logger.warning("Context7: Docs-Tool nicht gefunden. Verfuegbar: %s",
+                               tool_names)
+                return None
+
+            # Schritt 1: Library-ID aufloesen
+            resolve_result = await asyncio.wait_for(
+                entry.call_tool(resolve_tool, {
+                    "libraryName": library_name
+                }),
+                timeout=timeout
+            )
 
-            server_params = StdioServerParameters(
-                command=npx_path,
-                args=["-y", "@upstash/context7-mcp"],
-                env={**os.environ}
+            if resolve_result.isError:
+                logger.warning("Context7 resolve fehlgeschlagen fuer '%s'",
+                               library_name)
+                self._reported_missing.add(library_name.lower())
+                return None
+
+            resolve_text = self._extract_text_from_result(resolve_result)
+            library_id = self._parse_library_id(resolve_text)
+            if not library_id:
+                logger.info("Context7: Keine Library-ID fuer '%s' gefunden",
+                            library_name)
+                self._reported_missing.add(library_name.lower())
+                return None
+
+            # Schritt 2: Dokumentation abrufen
+            docs_result = await asyncio.wait_for(
+                entry.call_tool(docs_tool, {
+                    "libraryId": library_id,
+                    "topic": query
+                }),
+                timeout=timeout
             )
 
-            async with stdio_client(server_params) as (read_stream, write_stream):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await asyncio.wait_for(session.initialize(), timeout=timeout)
-
-                    # Tool-Namen dynamisch ermitteln (Context7 benennt Tools um)
-                    tools_result = await asyncio.wait_for(
-                        session.list_tools(), timeout=timeout)
-                    tool_names = {t.name for t in tools_result.tools}
-
-                    resolve_tool = "resolve-library-id"
-                    # Context7 hat get-library-docs zu query-docs umbenannt
-                    if "get-library-docs" in tool_names:
-                        docs_tool = "get-library-docs"
-                    else:
-                        docs_tool = "query-docs"
-
-                    if resolve_tool not in tool_names:
-                        logger.warning("Context7: Tool '%s' nicht gefunden. Verfuegbar: %s",
-                                       resolve_tool, tool_names)
-                        return None
-
-                    if docs_tool not in tool_names:
-                        logger.warning("Context7: Docs-Tool nicht gefunden. Verfuegbar: %s",
-                                       tool_names)
-                        return None
-
-                    # Schritt 1: Library-ID aufloesen
-                    resolve_result = await asyncio.wait_for(
-                        session.call_tool(resolve_tool, {
-                            "libraryName": library_name
-                        }),
-                        timeout=timeout
-                    )
-
-                    if resolve_result.isError:
-                        logger.warning("Context7 resolve fehlgeschlagen fuer '%s'",
-                                       library_name)
-                        return None
-
-                    resolve_text = self._extract_text_from_result(resolve_result)
-                    library_id = self._parse_library_id(resolve_text)
-                    if not library_id:
-                        logger.info("Context7: Keine Library-ID fuer '%s' gefunden",
-                                    library_name)
-                        return None
-
-                    # Schritt 2: Dokumentation abrufen
-                    docs_result = await asyncio.wait_for(
-                        session.call_tool(docs_tool, {
-                            "libraryId": library_id,
-                            "topic": query
-                        }),
-                        timeout=timeout
-                    )
-
-                    if docs_result.isError:
-                        logger.warning("Context7 docs fehlgeschlagen fuer '%s' (ID: %s)",
-                                       library_name, library_id)
-                        return None
-
-                    doc_text = self._extract_text_from_result(docs_result)
-                    return self._truncate_doc(doc_text, max_chars) if doc_text else None
+            if docs_result.isError:
+                logger.warning("Context7 docs fehlgeschlagen fuer '%s' (ID: %s)",
+                               library_name, library_id)
+                self._reported_missing.add(library_name.lower())
+                return None
+
+            doc_text = self._extract_text_from_result(docs_result)
+            if not doc_text:
+                self._reported_missing.add(library_name.lower())
+                return None
+            return self._truncate_doc(doc_text, max_chars)
 
         except asyncio.TimeoutError:
             logger.warning("Context7: Timeout nach %ds fuer '%s'", timeout, library_name)
-            return None
         except FileNotFoundError:
             logger.warning("Context7: npx Prozess konnte nicht gestartet werden")
-            return None
         except Exception as e:
             logger.warning("Context7 Fehler fuer '%s': %s", library_name, str(e)[:200])
-            return None
+            await self._discard_if_broken(key, entry, e)
+        self._fetch_failed.add(library_name.lower())
+        return None
 
     async def _fetch_via_ref_tools(self, library_name: str, query: str) -> Optional[str]:
         """Holt Docs via Ref.tools MCP (Fallback). Benoetigt REF_TOOLS_API_KEY."""
@@ -371,45 +452,52 @@ class DocEnrichmentPipeline:
         timeout = ref_config.get("timeout_seconds", 30)
         max_chars = self._config.get("max_docs_chars", 3000)
 
+        key = f"ref_tools:{hashlib.sha1(api_key.encode('utf-8')).hexdigest()[:8]}"
+        entry = None
         try:
-            from mcp import ClientSession
-            from mcp.client.stdio import stdio_client, StdioServerParameters
-
-            server_params = StdioServerParameters(
-                command=npx_path,
-                args=["-y", "ref-tools-mcp@latest"],
-                env={**os.environ, "REF_API_KEY": api_key}
+            entry = await self._pool.acquire(
+                key, self._connect(npx_path, ["-y", "ref-tools-mcp@latest"],
+                                   {**os.environ, "REF_API_KEY": api_key}), timeout)
+
+            # Dokumentation suchen
+            search_result = await asyncio.wait_for(
+                entry.call_tool("ref_search_documentation", {
+                    "query": f"{library_name} setup integration {query}"
+                }),
+                timeout=timeout
             )
 
-            async with stdio_client(server_params) as (read_stream, write_stream):
-                async with ClientSession(read_stream, write_stream) as session:
-                    await asyncio.wait_for(session.initialize(), timeout=timeout)
-
-                    # Dokumentation suchen
-                    search_result = await asyncio.wait_for(
-                        session.call_tool("ref_search_documentation", {
-                            "query": f"{library_name} setup integration {query}"
-                        }),
-                        timeout=timeout
-                    )
+            if search_result.isError:
+                logger.warning("Ref.tools Suche fehlgeschlagen fuer '%s'",
+                               library_name)
+                return None
 
-                    if search_result.isError:
-                        logger.warning("Ref.tools Suche fehlgeschlagen fuer '%s'",
-                                       library_name)
-                        return None
-
-                    doc_text = self._extract_text_from_result(search_result)
-                    return self._truncate_doc(doc_text, max_chars) if doc_text else None
+            doc_text = self._extract_text_from_result(search_result)
+            return self._truncate_doc(doc_text, max_chars) if doc_text else None
 
         except asyncio.TimeoutError:
             logger.warning("Ref.tools: Timeout nach %ds fuer '%s'", timeout, library_name)
-            return None
         except FileNotFoundError:
             logger.warning("Ref.tools: npx Prozess konnte nicht gestartet werden")
-            return None
         except Exception as e:
             logger.warning("Ref.tools Fehler fuer '%s': %s", library_name, str(e)[:200])
-            return None
+            await self._discard_if_broken(key, entry, e)
+        self._fetch_failed.add(library_name.lower())
+        return None
+
+    async def _discard_if_broken(self, key: str, entry, error: Exception) -> None:
+        """
+        Pool-Session nur bei Verbindungsfehlern verwerfen. Timeouts und Tool-Fehler
+        betreffen einen Aufruf - die Session teilen sich parallele Fetches.
+        """
+        # AENDERUNG 18.10.2026: Vorher schloss jeder Fehler die gemeinsame Session
+        if entry is not None and (is_connection_error(error) or not entry.alive):
+            await self._pool.discard(key, entry)
+
+    @staticmethod
+    def _connect(command: str, args: List[str], env: Dict[str, str]) -> ConnectFn:
+        """Verbindungsaufbau fuer den Session-Pool (in Tests durch Fake-Server ersetzt)."""
+        return lambda: stdio_session(command, args, env)
 
     def _get_npx_path(self) -> Optional[str]:
         """Cached shutil.which('npx') Ergebnis (Windows-kompatibel)."""
@@ -5,6 +5,8 @@ Datum: 31.01.2026
 Version: 1.0
 Beschreibung: Fuehrt Befehle in Docker-Containern aus.
               Ermoeglicht isolierte Ausfuehrung von generierten Projekten.
+              AENDERUNG 18.10.2026: Parallele Test-Matrix (run_test_matrix) ueber docker_test_matrix
+              AENDERUNG 18.10.2026: docker run als "subprocess"-Span im Run-Trace
 """
 
 import subprocess
@@ -15,6 +17,9 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 
+# AENDERUNG 18.10.2026: Docker-Subprozesse als Spans im Run-Trace
+from .run_tracer import trace_span
+
 # Logger konfigurieren
 logger = logging.getLogger(__name__)
 
@@ -43,6 +48,10 @@ class DockerConfig:
     timeout_test: int = 180
     timeout_run: int = 60
     cleanup_on_success: bool = True
+    # AENDERUNG 18.10.2026: Obergrenze gleichzeitiger Container der Test-Matrix
+    matrix_max_parallel: int = 3
+    # Sekunden die die App im Matrix-App-Check laufen muss ohne zu crashen
+    matrix_app_check_seconds: int = 10
     images: Dict[str, str] = field(default_factory=lambda: {
         "python": "python:3.11-slim",
         "nodejs": "node:20-alpine",
@@ -303,47 +312,9 @@ class DockerExecutor:
         """
         timeout = timeout or (self.config.timeout_install + self.config.timeout_test)
 
-        if self.tech_stack == "python":
-            # Pruefe ob requirements.txt existiert
-            req_file = self.project_path / "requirements.txt"
-            test_dir = self.project_path / "tests"
-            test_files = list(self.project_path.glob("**/test_*.py"))
-
-            if not req_file.exists():
-                # Keine requirements - nur Tests laufen lassen
-                if not test_dir.exists() and not test_files:
-                    return DockerResult(
-                        success=True,
-                        stdout="Keine requirements.txt und keine Tests gefunden",
-                        stderr="",
-                        exit_code=0
-                    )
-                cmd = "python -m pytest -v --tb=short"
-            else:
-                # BEIDES in einem Container-Aufruf
-                if not test_dir.exists() and not test_files:
-                    cmd = "pip install --no-cache-dir -r requirements.txt && echo 'Dependencies installiert, keine Tests gefunden'"
-                else:
-                    cmd = "pip install --no-cache-dir -r requirements.txt && python -m pytest -v --tb=short"
-
-        elif self.tech_stack in ("nodejs", "javascript"):
-            pkg_file = self.project_path / "package.json"
-            if not pkg_file.exists():
-                return DockerResult(
-                    success=True,
-                    stdout="Keine package.json gefunden",
-                    stderr="",
-                    exit_code=0
-                )
-            cmd = "npm install --silent && npm test -- --passWithNoTests --silent"
-
-        else:
-            return DockerResult(
-                success=False,
-                stdout="",
-                stderr=f"Unbekannter TechStack: {self.tech_stack}",
-                exit_code=1
-            )
+        cmd, skip_result = self._install_and_test_command()
+        if skip_result is not None:
+            return skip_result
 
         logger.info(f"Installiere und teste im selben Container: {cmd[:80]}...")
         return self._run_in_container(cmd, timeout)
@@ -358,15 +329,8 @@ class DockerExecutor:
         Returns:
             DockerResult mit Syntax-Check-Ergebnis
         """
-        if self.tech_stack == "python":
-            # Alle Python-Dateien mit ast checken
-            cmd = "python -c \"import ast, sys; [ast.parse(open(f).read()) for f in __import__('glob').glob('**/*.py', recursive=True)]; print('Syntax OK')\""
-
-        elif self.tech_stack in ("nodejs", "javascript"):
-            # Alle JS-Dateien mit node --check checken
-            cmd = "find . -name '*.js' -exec node --check {} \\; && echo 'Syntax OK'"
-
-        else:
+        cmd = self._syntax_check_command()
+        if cmd is None:
             return DockerResult(
                 success=False,
                 stdout="",
@@ -377,6 +341,90 @@ class DockerExecutor:
         logger.info(f"Fuehre Syntax-Check im Container aus")
         return self._run_in_container(cmd, timeout)
 
+    # AENDERUNG 18.10.2026: Parallele Test-Matrix
+    def build_matrix_checks(self, include_app: bool = True, syntax_timeout: int = 30) -> list:
+        """
+        Erstellt die unabhaengigen Checks fuer run_test_matrix().
+
+        - syntax: Syntax-Check (kritisch)
+        - install_test: Dependencies + Unit-Tests (kritisch)
+        - app_start: App muss matrix_app_check_seconds laufen ohne zu crashen
+          (nicht kritisch; bei Node.js nur wenn node_modules schon existiert,
+          da parallele npm installs auf demselben Mount kollidieren)
+
+        Args:
+            include_app: App-Start-Check aufnehmen (nur fuer Server-Projekte sinnvoll)
+            syntax_timeout: Timeout fuer den Syntax-Check
+
+        Returns:
+            Liste von MatrixCheck
+        """
+        from .docker_test_matrix import MatrixCheck
+
+        checks = []
+        syntax_cmd = self._syntax_check_command()
+        if syntax_cmd:
+            checks.append(MatrixCheck("syntax", syntax_cmd, timeout=syntax_timeout, critical=True))
+
+        install_cmd, _skip = self._install_and_test_command()
+        if install_cmd:
+            checks.append(MatrixCheck(
+                "install_test", install_cmd,
+                timeout=self.config.timeout_install + self.config.timeout_test, critical=True
+            ))
+
+        if include_app:
+            app_cmd = self._app_check_command()
+            if app_cmd:
+                checks.append(MatrixCheck(
+                    "app_start", app_cmd,
+                    timeout=self.config.timeout_install + self.config.matrix_app_check_seconds + 30
+                ))
+        return checks
+
+    def run_test_matrix(
+        self,
+        checks: Optional[list] = None,
+        runner=None,
+        max_parallel: Optional[int] = None,
+        cancel_on_critical_failure: bool = True,
+        on_log=None
+    ):
+        """
+        Fuehrt die Checks nebenlaeufig in getrennten Containern aus.
+
+        Args:
+            checks: MatrixChecks (default: build_matrix_checks())
+            runner: Check-Runner (default: DockerCheckRunner; LocalCheckRunner als Stand-in)
+            max_parallel: Max. gleichzeitige Container (default: config.matrix_max_parallel)
+            cancel_on_critical_failure: Restliche Checks bei kritischem Fehler abbrechen
+            on_log: Optionaler Callback (check_name, stream, line) fuer Live-Logs
+
+        Returns:
+            MatrixResult (combined_result() liefert ein einzelnes DockerResult)
+
+        Raises:
+            RuntimeError: Wenn kein Runner angegeben und Docker nicht verfuegbar ist
+        """
+        from .docker_test_matrix import DockerCheckRunner, MatrixResult, run_matrix
+
+        if runner is None:
+            if not self._get_docker_path():
+                raise RuntimeError("Docker nicht verfuegbar")
+            runner = DockerCheckRunner(self)
+        if checks is None:
+            checks = self.build_matrix_checks()
+        if not checks:
+            return MatrixResult(runner=runner.name, error=f"Unbekannter TechStack: {self.tech_stack}")
+
+        logger.info(f"Starte Test-Matrix ({runner.name}): {[c.name for c in checks]}")
+        return run_matrix(
+            checks, runner,
+            max_parallel=max_parallel or self.config.matrix_max_parallel,
+            cancel_on_critical_failure=cancel_on_critical_failure,
+            on_log=on_log
+        )
+
     def run_app(
         self,
         port: int = 5000,
@@ -426,14 +474,17 @@ class DockerExecutor:
         docker_cmd = [c for c in docker_cmd if c]
 
         try:
-            result = subprocess.run(
-                docker_cmd,
-                capture_output=True,
-                timeout=timeout,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
-            )
+            with trace_span("docker run (app)", "subprocess", image=image) as span:
+                result = subprocess.run(
+                    docker_cmd,
+                    capture_output=True,
+                    timeout=timeout,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace'
+                )
+                if span is not None:
+                    span.set(exit_code=result.returncode)
 
             container_id = result.stdout.strip()[:12] if result.returncode == 0 else None
 
@@ -505,6 +556,85 @@ class DockerExecutor:
     # Private Methoden
     # =========================================================================
 
+    def _install_and_test_command(self):
+        """
+        Liefert den Install+Test-Befehl oder ein Skip-Ergebnis.
+
+        Returns:
+            Tuple (cmd, skip_result) - genau eines davon ist gesetzt
+        """
+        if self.tech_stack == "python":
+            # Pruefe ob requirements.txt existiert
+            req_file = self.project_path / "requirements.txt"
+            test_dir = self.project_path / "tests"
+            test_files = list(self.project_path.glob("**/test_*.py"))
+
+            if not req_file.exists():
+                # Keine requirements - nur Tests laufen lassen
+                if not test_dir.exists() and not test_files:
+                    return None, DockerResult(
+                        success=True,
+                        stdout="Keine requirements.txt und keine Tests gefunden",
+                        stderr="",
+                        exit_code=0
+                    )
+                return "python -m pytest -v --tb=short", None
+            # BEIDES in einem Container-Aufruf
+            if not test_dir.exists() and not test_files:
+                return ("pip install --no-cache-dir -r requirements.txt && "
+                        "echo 'Dependencies installiert, keine Tests gefunden'"), None
+            return "pip install --no-cache-dir -r requirements.txt && python -m pytest -v --tb=short", None
+
+        if self.tech_stack in ("nodejs", "javascript"):
+            pkg_file = self.project_path / "package.json"
+            if not pkg_file.exists():
+                return None, DockerResult(
+                    success=True,
+                    stdout="Keine package.json gefunden",
+                    stderr="",
+                    exit_code=0
+                )
+            return "npm install --silent && npm test -- --passWithNoTests --silent", None
+
+        return None, DockerResult(
+            success=False,
+            stdout="",
+            stderr=f"Unbekannter TechStack: {self.tech_stack}",
+            exit_code=1
+        )
+
+    def _syntax_check_command(self) -> Optional[str]:
+        """Syntax-Check-Befehl fuer den TechStack (None wenn unbekannt)."""
+        if self.tech_stack == "python":
+            # Alle Python-Dateien mit ast checken
+            return "python -c \"import ast, sys; [ast.parse(open(f).read()) for f in __import__('glob').glob('**/*.py', recursive=True)]; print('Syntax OK')\""
+        if self.tech_stack in ("nodejs", "javascript"):
+            # Alle JS-Dateien mit node --check checken
+            return "find . -name '*.js' -not -path './node_modules/*' -exec node --check {} \\; && echo 'Syntax OK'"
+        return None
+
+    def _app_check_command(self) -> Optional[str]:
+        """
+        AENDERUNG 18.10.2026: App-Start-Check fuer die Test-Matrix.
+        Die App gilt als OK wenn sie nach matrix_app_check_seconds noch laeuft
+        (timeout beendet sie mit 124/143) oder regulaer mit 0 endet.
+        """
+        seconds = self.config.matrix_app_check_seconds
+        alive = (f"code=$?; if [ $code -eq 124 ] || [ $code -eq 143 ]; then "
+                 f"echo 'App laeuft nach {seconds}s'; exit 0; fi; exit $code")
+        if self.tech_stack == "python":
+            if not (self.project_path / "src" / "app.py").exists():
+                return None
+            install = ""
+            if (self.project_path / "requirements.txt").exists():
+                install = "pip install --no-cache-dir -q -r requirements.txt > /dev/null && "
+            return f"{install}timeout {seconds} python src/app.py; {alive}"
+        if self.tech_stack in ("nodejs", "javascript"):
+            if not (self.project_path / "node_modules").exists():
+                return None
+            return f"timeout {seconds} npm start; {alive}"
+        return None
+
     def _get_docker_path(self) -> Optional[str]:
         """Cached Docker-Pfad zurueckgeben."""
         if self._docker_path is None:
@@ -557,14 +687,17 @@ class DockerExecutor:
         logger.debug(f"Docker-Befehl: {' '.join(docker_cmd)}")
 
         try:
-            result = subprocess.run(
-                docker_cmd,
-                capture_output=True,
-                timeout=timeout,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
-            )
+            with trace_span(f"docker run: {cmd[:60]}", "subprocess", image=image) as span:
+                result = subprocess.run(
+                    docker_cmd,
+                    capture_output=True,
+                    timeout=timeout,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace'
+                )
+                if span is not None:
+                    span.set(exit_code=result.returncode)
 
             duration = time.time() - start_time
 
@@ -649,6 +782,8 @@ def create_docker_executor(
         config.cpu_limit = docker_config.get("cpu_limit", 1.0)
         config.timeout_install = docker_config.get("timeout_install", 300)
         config.timeout_test = docker_config.get("timeout_test", 180)
+        config.matrix_max_parallel = docker_config.get("matrix_max_parallel", 3)
+        config.matrix_app_check_seconds = docker_config.get("matrix_app_check_seconds", 10)
         if "images" in docker_config:
             config.images.update(docker_config["images"])
 
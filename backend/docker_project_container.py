@@ -2,11 +2,13 @@
 """
 Author: rahn
 Datum: 10.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Persistenter Docker-Container fuer Projekt-Lebenszyklus.
               Loest das Problem dass generierte Projekte auf dem Windows-Host
               laufen und Dependencies zwischen Projekten kollidieren.
               Fix 50: Docker Project Container (Phase 1).
+              AENDERUNG 18.10.2026: Host-Port = Container-Port + Port-Versatz des
+              Run-Workers, damit parallele Runs desselben Stacks nicht kollidieren.
 
 ROOT-CAUSE-FIX:
   Symptom: npm install auf Windows ist flaky, globale Pakete kollidieren
@@ -23,6 +25,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
+from .run_worker import port_offset
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,6 +93,8 @@ class ProjectContainerManager:
         # Port aus Blueprint oder Default
         port_start = container_config.get("port_range_start", 3000)
         self.port = tech_blueprint.get("server_port", port_start)
+        # Im Container bleibt der App-Port, auf dem Host bekommt jeder Worker-Run seinen Bereich
+        self.host_port = self.port + port_offset()
 
         # Container-Name (sanitized)
         safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', os.path.basename(project_path))
@@ -99,8 +105,8 @@ class ProjectContainerManager:
         self.is_running = False
 
         logger.info(
-            "ProjectContainerManager initialisiert: %s (%s, Port %d, Image %s)",
-            self.container_name, self.tech_stack, self.port, self.image
+            "ProjectContainerManager initialisiert: %s (%s, Port %d→%d, Image %s)",
+            self.container_name, self.tech_stack, self.host_port, self.port, self.image
         )
 
     def _get_docker_path(self) -> Optional[str]:
@@ -159,7 +165,7 @@ class ProjectContainerManager:
 
         docker run -d --name {container_name}
             -v {project_path}:/app -w /app
-            -p {port}:{port}
+            -p {host_port}:{port}
             --memory {memory_limit} --cpus {cpu_limit}
             {image} tail -f /dev/null
 
@@ -181,7 +187,7 @@ class ProjectContainerManager:
             "--name", self.container_name,
             "-v", f"{mount_path}:/app",
             "-w", "/app",
-            "-p", f"{self.port}:{self.port}",
+            "-p", f"{self.host_port}:{self.port}",
             "--memory", self.memory_limit,
             "--cpus", str(self.cpu_limit),
             self.image,
@@ -198,7 +204,7 @@ class ProjectContainerManager:
                 container_id = result.stdout.strip()[:12]
                 logger.info(
                     "Docker-Container erstellt: %s (ID: %s, Port: %d)",
-                    self.container_name, container_id, self.port
+                    self.container_name, container_id, self.host_port
                 )
                 return True
             else:
@@ -353,11 +359,11 @@ class ProjectContainerManager:
 
         logger.info(
             "Server gestartet im Container: %s (warte auf Port %d...)",
-            run_cmd, self.port
+            run_cmd, self.host_port
         )
 
         # Warte auf Port-Bereitschaft
-        return self._wait_for_port(self.port, timeout)
+        return self._wait_for_port(self.host_port, timeout)
 
     def stop_server(self) -> bool:
         """
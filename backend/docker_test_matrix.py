@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Parallele Test-Matrix fuer den DockerExecutor.
+              Startet unabhaengige Checks (Syntax, Install+Test, App-Start) als
+              gleichzeitige Einmal-Container mit Ressourcen-Limits, streamt deren
+              Logs asynchron und aggregiert die DockerResults. Schlaegt ein
+              kritischer Check fehl, werden die restlichen abgebrochen.
+              LocalCheckRunner ersetzt Docker wenn kein Daemon vorhanden ist.
+              AENDERUNG 18.10.2026: Logs blockweise lesen (Zeilen > 64 KiB brachen
+              readline() ab), leere Matrix ist kein Erfolg.
+"""
+
+import os
+import re
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from .docker_executor import DockerResult
+
+logger = logging.getLogger(__name__)
+
+# Maximale Anzahl gleichzeitig laufender Checks (Default, config: docker.matrix_max_parallel)
+DEFAULT_MATRIX_MAX_PARALLEL = 3
+
+# Pro Stream gepufferte Zeichen (Rest wird verworfen, Anfang+Ende bleiben erhalten)
+MAX_STREAM_CHARS = 200_000
+
+# Lese-Blockgroesse; laengere Zeilen werden in Teilen dieser Groesse geloggt
+READ_CHUNK_BYTES = 65536
+
+# Callback fuer Log-Streaming: (check_name, stream, line)
+LogCallback = Callable[[str, str, str], None]
+
+
+@dataclass
+class MatrixCheck:
+    """
+    Ein unabhaengiger Check der Test-Matrix.
+
+    Attributes:
+        name: Eindeutiger Name (wird Teil des Container-Namens)
+        cmd: Shell-Befehl im Container bzw. lokal
+        timeout: Timeout in Sekunden
+        critical: Bei Fehlschlag werden die restlichen Checks abgebrochen
+        memory_limit: Optionales Memory-Limit (sonst DockerConfig.memory_limit)
+        cpu_limit: Optionales CPU-Limit (sonst DockerConfig.cpu_limit)
+    """
+    name: str
+    cmd: str
+    timeout: int = 120
+    critical: bool = False
+    memory_limit: Optional[str] = None
+    cpu_limit: Optional[float] = None
+
+
+@dataclass
+class MatrixResult:
+    """Aggregiertes Ergebnis einer Test-Matrix."""
+    results: Dict[str, DockerResult] = field(default_factory=dict)
+    cancelled: List[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    runner: str = "docker"
+    error: str = ""
+
+    @property
+    def success(self) -> bool:
+        """
+        True wenn mindestens ein Check lief, keiner fehlschlug und keiner
+        abgebrochen wurde - eine leere Matrix (unbekannter TechStack) ist kein Erfolg.
+        """
+        return (bool(self.results) and not self.error and not self.cancelled
+                and all(r.success for r in self.results.values()))
+
+    @property
+    def failed_checks(self) -> List[str]:
+        return [name for name, r in self.results.items() if not r.success]
+
+    def combined_result(self) -> DockerResult:
+        """
+        Fasst alle Check-Ergebnisse zu einem DockerResult zusammen.
+        stdout/stderr werden pro Check mit Header versehen.
+        """
+        stdout_parts, stderr_parts = [], []
+        exit_code = 0
+        for name, result in self.results.items():
+            if result.stdout:
+                stdout_parts.append(f"=== {name} ===\n{result.stdout}")
+            if result.stderr:
+                stderr_parts.append(f"=== {name} ===\n{result.stderr}")
+            if not result.success and exit_code == 0:
+                exit_code = result.exit_code or 1
+        if self.cancelled:
+            stderr_parts.append(f"Abgebrochen: {', '.join(self.cancelled)}")
+            exit_code = exit_code or 1
+        if not self.results:
+            stderr_parts.append(self.error or "Keine Checks ausgefuehrt")
+            exit_code = exit_code or 1
+        return DockerResult(
+            success=self.success,
+            stdout="\n".join(stdout_parts),
+            stderr="\n".join(stderr_parts),
+            exit_code=exit_code,
+            duration_seconds=self.duration_seconds,
+        )
+
+
+class _AsyncProcessRunner:
+    """Gemeinsame Logik: Prozess starten, Logs streamen, Timeout, Abbruch."""
+
+    name = "base"
+
+    async def _spawn(self, check: MatrixCheck) -> asyncio.subprocess.Process:
+        raise NotImplementedError
+
+    async def _kill(self, check: MatrixCheck, process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await self._reap(process)
+
+    @staticmethod
+    async def _reap(process: asyncio.subprocess.Process) -> None:
+        # Prozess einsammeln, damit der Transport vor dem Loop-Ende geschlossen wird
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.debug(f"Prozess {process.pid} reagiert nicht auf kill")
+
+    @staticmethod
+    async def _pump(stream, check_name: str, stream_name: str,
+                    buffer: List[str], on_log: Optional[LogCallback]) -> None:
+        # Blockweise statt readline(): das scheitert an Zeilen ueber dem Stream-Limit
+        size = 0
+        pending = b""
+
+        def _emit(raw: bytes) -> None:
+            nonlocal size
+            line = raw.decode("utf-8", errors="replace")
+            if size < MAX_STREAM_CHARS:
+                buffer.append(line)
+                size += len(line)
+            if on_log:
+                try:
+                    on_log(check_name, stream_name, line.rstrip("\n"))
+                except Exception:
+                    pass  # Log-Callback darf den Check nicht abbrechen
+
+        while True:
+            chunk = await stream.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                _emit(raw + b"\n")
+            while len(pending) >= READ_CHUNK_BYTES:
+                _emit(pending[:READ_CHUNK_BYTES])
+                pending = pending[READ_CHUNK_BYTES:]
+        if pending:
+            _emit(pending)
+
+    async def run(self, check: MatrixCheck, on_log: Optional[LogCallback] = None) -> DockerResult:
+        """Fuehrt einen Check aus. Wird bei Abbruch (CancelledError) sauber beendet."""
+        start = time.time()
+        try:
+            process = await self._spawn(check)
+        except (OSError, ValueError) as e:
+            return DockerResult(False, "", str(e), -1, duration_seconds=time.time() - start)
+
+        out: List[str] = []
+        err: List[str] = []
+        pumps = asyncio.gather(
+            self._pump(process.stdout, check.name, "stdout", out, on_log),
+            self._pump(process.stderr, check.name, "stderr", err, on_log),
+        )
+        try:
+            await asyncio.wait_for(asyncio.shield(pumps), timeout=check.timeout)
+            exit_code = await process.wait()
+        except asyncio.TimeoutError:
+            await self._kill(check, process)
+            pumps.cancel()
+            return DockerResult(False, "".join(out), f"Timeout nach {check.timeout}s", -1,
+                                duration_seconds=time.time() - start)
+        except asyncio.CancelledError:
+            await self._kill(check, process)
+            pumps.cancel()
+            raise
+        except (ValueError, asyncio.LimitOverrunError, OSError) as e:
+            await self._kill(check, process)
+            pumps.cancel()
+            return DockerResult(False, "".join(out), f"Log-Streaming fehlgeschlagen: {e}", -1,
+                                duration_seconds=time.time() - start)
+
+        return DockerResult(
+            success=exit_code == 0,
+            stdout="".join(out),
+            stderr="".join(err),
+            exit_code=exit_code,
+            duration_seconds=time.time() - start,
+        )
+
+
+class DockerCheckRunner(_AsyncProcessRunner):
+    """Fuehrt jeden Check in einem eigenen Einmal-Container aus (docker run --rm)."""
+
+    name = "docker"
+
+    def __init__(self, executor):
+        self.executor = executor
+
+    def container_name(self, check: MatrixCheck) -> str:
+        safe = re.sub(r"[^a-zA-Z0-9_.-]", "_", check.name)
+        return f"{self.executor.container_name}_{safe}"
+
+    def build_command(self, check: MatrixCheck) -> List[str]:
+        """Baut den docker-run-Befehl inkl. Ressourcen-Limits."""
+        executor = self.executor
+        config = executor.config
+        project_mount = str(executor.project_path)
+        if os.name == 'nt':
+            project_mount = '/' + project_mount.replace(':', '').replace('\\', '/')
+        image = config.images.get(executor.tech_stack, "python:3.11-slim")
+        return [
+            executor._get_docker_path() or "docker", "run", "--rm",
+            "--name", self.container_name(check),
+            "-v", f"{project_mount}:/app",
+            "-w", "/app",
+            "--memory", check.memory_limit or config.memory_limit,
+            "--cpus", str(check.cpu_limit or config.cpu_limit),
+            image,
+            "sh", "-c", check.cmd,
+        ]
+
+    async def _spawn(self, check: MatrixCheck) -> asyncio.subprocess.Process:
+        cmd = self.build_command(check)
+        logger.debug(f"Matrix-Check {check.name}: {' '.join(cmd)}")
+        return await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+
+    async def _kill(self, check: MatrixCheck, process: asyncio.subprocess.Process) -> None:
+        # Der docker-CLI-Prozess allein stoppt den Container nicht zuverlaessig
+        await super()._kill(check, process)
+        try:
+            rm = await asyncio.create_subprocess_exec(
+                self.executor._get_docker_path() or "docker", "rm", "-f", self.container_name(check),
+                stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+            )
+            await asyncio.wait_for(rm.wait(), timeout=10)
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.debug(f"Container-Abbruch {check.name} fehlgeschlagen: {e}")
+
+
+class LocalCheckRunner(_AsyncProcessRunner):
+    """
+    Lokaler Stand-in ohne Docker: fuehrt die Check-Befehle als Shell-Prozess
+    im Projektverzeichnis aus. Keine Ressourcen-Limits.
+    """
+
+    name = "local"
+
+    def __init__(self, project_path):
+        self.project_path = str(project_path)
+
+    async def _spawn(self, check: MatrixCheck) -> asyncio.subprocess.Process:
+        kwargs = {}
+        if os.name != 'nt':
+            kwargs["start_new_session"] = True  # Prozessgruppe fuer sauberes Kill
+        return await asyncio.create_subprocess_shell(
+            check.cmd, cwd=self.project_path,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, **kwargs
+        )
+
+    async def _kill(self, check: MatrixCheck, process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None and os.name != 'nt':
+            import signal
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+                await self._reap(process)
+                return
+            except (ProcessLookupError, PermissionError):
+                pass
+        await super()._kill(check, process)
+
+
+async def run_matrix_async(checks: List[MatrixCheck], runner: _AsyncProcessRunner,
+                           max_parallel: int = DEFAULT_MATRIX_MAX_PARALLEL,
+                           cancel_on_critical_failure: bool = True,
+                           on_log: Optional[LogCallback] = None) -> MatrixResult:
+    """
+    Fuehrt alle Checks nebenlaeufig aus (max. max_parallel gleichzeitig).
+
+    Args:
+        checks: Liste unabhaengiger Checks
+        runner: DockerCheckRunner oder LocalCheckRunner
+        max_parallel: Obergrenze gleichzeitiger Container
+        cancel_on_critical_failure: Restliche Checks abbrechen wenn ein kritischer fehlschlaegt
+        on_log: Optionaler Callback fuer gestreamte Log-Zeilen
+
+    Returns:
+        MatrixResult (Reihenfolge der results entspricht der Check-Reihenfolge)
+    """
+    start = time.time()
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+    matrix = MatrixResult(runner=runner.name)
+    finished: Dict[str, DockerResult] = {}
+
+    async def _guarded(check: MatrixCheck) -> DockerResult:
+        async with semaphore:
+            return await runner.run(check, on_log)
+
+    tasks = {asyncio.ensure_future(_guarded(c)): c for c in checks}
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        abort = False
+        for task in done:
+            check = tasks[task]
+            result = task.result()
+            finished[check.name] = result
+            if check.critical and not result.success and cancel_on_critical_failure:
+                abort = True
+        if abort and pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            matrix.cancelled = [tasks[t].name for t in pending]
+            logger.info(f"Test-Matrix: kritischer Check fehlgeschlagen - abgebrochen: {matrix.cancelled}")
+            pending = set()
+
+    for check in checks:
+        if check.name in finished:
+            matrix.results[check.name] = finished[check.name]
+    matrix.duration_seconds = time.time() - start
+    return matrix
+
+
+def run_matrix(checks: List[MatrixCheck], runner: _AsyncProcessRunner,
+               max_parallel: int = DEFAULT_MATRIX_MAX_PARALLEL,
+               cancel_on_critical_failure: bool = True,
+               on_log: Optional[LogCallback] = None,
+               timeout: Optional[float] = None) -> MatrixResult:
+    """
+    Synchrone Bruecke fuer run_matrix_async().
+    asyncio.run() laeuft in eigenem Thread, damit ein evtl. laufender
+    Event-Loop des Aufrufers nicht kollidiert (gleiches Pattern wie CodeRabbit).
+    """
+    def _async_runner():
+        return asyncio.run(run_matrix_async(
+            checks, runner, max_parallel, cancel_on_critical_failure, on_log
+        ))
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_async_runner).result(timeout=timeout)
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Feedback-Delta-Engine fuer die UTDS-Task-Ableitung.
+              Reviewer-/Security-Feedback wird in normalisierte Issue-Einheiten
+              zerlegt, per SimHash (Wort-Shingles) gefingerprintet und gegen ein
+              Issue-Ledger pro Run abgeglichen. An den TaskDeriver gehen nur neue
+              oder wieder aufgetauchte (regressed) Issues - bereits abgeleitete,
+              unveraenderte Issues kosten keinen LLM-Call mehr.
+              AENDERUNG 18.10.2026: Issues gelten erst nach erfolgreicher Ableitung
+              als erledigt (confirm) - nach fehlgeschlagenen UTDS-Tasks werden noch
+              offene Issues in der naechsten Runde erneut abgeleitet.
+
+              Konfiguration (optional, config.yaml):
+                feedback_delta:
+                  enabled: true
+                  sources: [reviewer, security]
+                  max_distance: 3      # Hamming-Distanz fuer Near-Duplicates
+"""
+
+import re
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+# 4 Baender a 16 Bit: Fingerprints mit Distanz <= 3 teilen mindestens ein Band
+_BAND_BITS = 16
+_BANDS = SIMHASH_BITS // _BAND_BITS
+SHINGLE_SIZE = 3
+MIN_UNIT_CHARS = 12
+
+_BULLET_RE = re.compile(r"^\s*(?:[-*•]|\d+[.)]|\[[A-Z]+\])\s+")
+_LINE_NO_RE = re.compile(r"(?:line|zeile|:)\s*\d+", re.IGNORECASE)
+_PAREN_NO_RE = re.compile(r"\(\d+\)")
+_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}")
+_HEX_RE = re.compile(r"[0-9a-f]{8,}")
+_WORD_RE = re.compile(r"[\w./\[\]:-]+")
+
+
+# =========================================================================
+# Zerlegung und Fingerprints
+# =========================================================================
+
+def _is_heading(line: str) -> bool:
+    stripped = line.strip()
+    return (stripped.startswith("#") or set(stripped) <= set("=-_*")
+            or (stripped.endswith(":") and len(stripped) < 60 and not _BULLET_RE.match(line)))
+
+
+def split_issue_units(feedback: str) -> List[str]:
+    """
+    Zerlegt Feedback in Issue-Einheiten.
+
+    Aufzaehlungspunkte starten eine neue Einheit, eingerueckte Folgezeilen
+    gehoeren zur vorherigen. Ueberschriften und sehr kurze Zeilen sind keine Issues.
+    """
+    units: List[str] = []
+    current: List[str] = []
+    for line in (feedback or "").splitlines():
+        if not line.strip() or _is_heading(line):
+            if current:
+                units.append("\n".join(current))
+                current = []
+            continue
+        if current and not _BULLET_RE.match(line) and line[:1] in (" ", "\t"):
+            current.append(line.rstrip())
+            continue
+        if current:
+            units.append("\n".join(current))
+        current = [line.rstrip()]
+    if current:
+        units.append("\n".join(current))
+    return [unit for unit in units if len(unit.strip()) >= MIN_UNIT_CHARS]
+
+
+def normalize_issue(text: str) -> str:
+    """Entfernt variable Anteile (Zeilennummern, Zeitstempel, Hashes, Aufzaehlung)."""
+    normalized = _BULLET_RE.sub("", text.strip())
+    normalized = _LINE_NO_RE.sub("", normalized)
+    normalized = _PAREN_NO_RE.sub("", normalized)
+    normalized = _TIMESTAMP_RE.sub("", normalized)
+    normalized = _HEX_RE.sub("", normalized.lower())
+    return re.sub(r"\s+", " ", normalized).strip()
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> int:
+    """64-Bit-SimHash ueber Wort-Shingles des normalisierten Textes."""
+    words = _WORD_RE.findall(text)
+    if not words:
+        return 0
+    if len(words) < shingle_size:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)]
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = _hash64(shingle)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+# =========================================================================
+# Ledger
+# =========================================================================
+
+@dataclass
+class IssueEntry:
+    """Ein bekanntes Issue im Ledger eines Runs."""
+    fingerprint: int
+    source: str
+    text: str
+    first_round: int
+    last_round: int
+    occurrences: int = 1
+    open: bool = True
+    regressions: int = 0
+    # Von der UTDS erfolgreich abgeleitet/ausgefuehrt - erst dann wird unterdrueckt
+    derived: bool = False
+
+
+@dataclass
+class FeedbackDelta:
+    """Ergebnis eines Abgleichs: was an die Task-Ableitung weitergeht."""
+    source: str
+    units: int = 0
+    new: List[str] = field(default_factory=list)
+    regressed: List[str] = field(default_factory=list)
+    retried: List[str] = field(default_factory=list)
+    suppressed: int = 0
+    resolved: int = 0
+    entries: List[IssueEntry] = field(default_factory=list, repr=False)
+
+    @property
+    def forwarded(self) -> List[str]:
+        return self.new + self.regressed + self.retried
+
+    @property
+    def skip_derivation(self) -> bool:
+        """Nur bekannte Issues → keine neue Ableitung noetig."""
+        return self.units > 0 and not self.forwarded
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "units": self.units,
+            "new": len(self.new),
+            "regressed": len(self.regressed),
+            "retried": len(self.retried),
+            "suppressed": self.suppressed,
+            "resolved": self.resolved,
+        }
+
+
+class IssueLedger:
+    """Issue-Fingerprints eines Runs mit LSH-Baendern fuer Near-Duplicate-Suche."""
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self._entries: List[IssueEntry] = []
+        self._bands: Dict[tuple, List[int]] = {}
+        self._rounds: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _band_keys(self, fingerprint: int) -> Iterable[tuple]:
+        mask = (1 << _BAND_BITS) - 1
+        for band in range(_BANDS):
+            yield band, fingerprint >> (band * _BAND_BITS) & mask
+
+    def find(self, fingerprint: int, source: str) -> Optional[IssueEntry]:
+        """Naechstes bekanntes Issue derselben Quelle innerhalb max_distance."""
+        best, best_distance = None, self.max_distance + 1
+        for key in self._band_keys(fingerprint):
+            for index in self._bands.get(key, ()):
+                entry = self._entries[index]
+                if entry.source != source:
+                    continue
+                distance = hamming(entry.fingerprint, fingerprint)
+                if distance < best_distance:
+                    best, best_distance = entry, distance
+        return best
+
+    def _add(self, fingerprint: int, source: str, text: str, round_no: int) -> IssueEntry:
+        index = len(self._entries)
+        entry = IssueEntry(fingerprint, source, text, round_no, round_no)
+        self._entries.append(entry)
+        for key in self._band_keys(fingerprint):
+            self._bands.setdefault(key, []).append(index)
+        return entry
+
+    def mark_derived(self, delta: FeedbackDelta) -> None:
+        """Die weitergegebenen Issues wurden erfolgreich abgeleitet - kuenftig unterdruecken."""
+        with self._lock:
+            for entry in delta.entries:
+                entry.derived = True
+
+    def reconcile(self, feedback: str, source: str) -> FeedbackDelta:
+        """
+        Gleicht ein Feedback gegen das Ledger ab und aktualisiert es.
+
+        Issues der Quelle, die in dieser Runde fehlen, gelten als behoben -
+        tauchen sie spaeter wieder auf, sind sie eine Regression.
+        """
+        units = split_issue_units(feedback)
+        delta = FeedbackDelta(source=source, units=len(units))
+        with self._lock:
+            round_no = self._rounds.get(source, 0) + 1
+            self._rounds[source] = round_no
+            for unit in units:
+                fingerprint = simhash(normalize_issue(unit))
+                entry = self.find(fingerprint, source)
+                if entry is None:
+                    delta.entries.append(self._add(fingerprint, source, unit, round_no))
+                    delta.new.append(unit)
+                    continue
+                if entry.last_round == round_no:
+                    delta.suppressed += 1  # Duplikat innerhalb desselben Feedbacks
+                    continue
+                entry.occurrences += 1
+                entry.last_round = round_no
+                if not entry.open:
+                    entry.open = True
+                    entry.derived = False
+                    entry.regressions += 1
+                    delta.regressed.append(unit)
+                    delta.entries.append(entry)
+                elif entry.derived:
+                    delta.suppressed += 1
+                else:
+                    # Letzte Ableitung fehlgeschlagen - Issue ist weiter offen
+                    delta.retried.append(unit)
+                    delta.entries.append(entry)
+            for entry in self._entries:
+                if entry.source == source and entry.open and entry.last_round < round_no:
+                    entry.open = False
+                    delta.resolved += 1
+        return delta
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{
+                "fingerprint": f"{entry.fingerprint:016x}",
+                "source": entry.source,
+                "text": entry.text[:200],
+                "occurrences": entry.occurrences,
+                "open": entry.open,
+                "derived": entry.derived,
+                "regressions": entry.regressions,
+            } for entry in self._entries]
+
+
+# =========================================================================
+# Engine
+# =========================================================================
+
+class FeedbackDeltaEngine:
+    """Filtert Feedback vor der UTDS-Ableitung und fuehrt Statistik."""
+
+    def __init__(self, enabled: bool = True, sources: Iterable[str] = ("reviewer", "security"),
+                 max_distance: int = 3):
+        self.enabled = enabled
+        self.sources = set(sources)
+        self.ledger = IssueLedger(max_distance=max_distance)
+        self._stats = {
+            "calls": 0, "units": 0, "new": 0, "regressed": 0, "retried": 0,
+            "suppressed": 0, "resolved": 0, "derivations_skipped": 0,
+        }
+
+    @classmethod
+    def from_config(cls, config: Any) -> "FeedbackDeltaEngine":
+        settings = config.get("feedback_delta") if isinstance(config, dict) else None
+        if not isinstance(settings, dict):
+            settings = {}
+        return cls(
+            enabled=bool(settings.get("enabled", True)),
+            sources=settings.get("sources", ("reviewer", "security")),
+            max_distance=int(settings.get("max_distance", 3)),
+        )
+
+    def filter(self, feedback: str, source: str) -> Optional[FeedbackDelta]:
+        """
+        Delta fuer ein Feedback - None wenn die Quelle nicht gefiltert wird.
+
+        Sind alle Issues neu, bleibt der Original-Text fuer die Ableitung erhalten;
+        sonst enthaelt delta_text() nur neue und regressed Issues.
+        """
+        if not self.enabled or source not in self.sources or not feedback:
+            return None
+        delta = self.ledger.reconcile(feedback, source)
+        self._stats["calls"] += 1
+        for key in ("units", "suppressed", "resolved"):
+            self._stats[key] += getattr(delta, key)
+        self._stats["new"] += len(delta.new)
+        self._stats["regressed"] += len(delta.regressed)
+        self._stats["retried"] += len(delta.retried)
+        if delta.skip_derivation:
+            self._stats["derivations_skipped"] += 1
+        return delta
+
+    def confirm(self, delta: Optional[FeedbackDelta], success: bool) -> None:
+        """
+        Ergebnis der Ableitung zurueckmelden. Nur bei Erfolg gelten die Issues
+        als erledigt; sonst werden sie, solange sie offen sind, erneut abgeleitet.
+        """
+        if delta is not None and success:
+            self.ledger.mark_derived(delta)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "ledger_size": len(self.ledger)}
+
+
+def delta_text(delta: FeedbackDelta, original: str) -> str:
+    """Text fuer den TaskDeriver: Original wenn nichts unterdrueckt wurde."""
+    if not delta.suppressed:
+        return original
+    parts = []
+    if delta.new:
+        parts.append("\n".join(delta.new))
+    if delta.regressed:
+        parts.append("Wieder aufgetreten (Regression):\n" + "\n".join(delta.regressed))
+    if delta.retried:
+        parts.append("Weiter offen (letzte Behebung fehlgeschlagen):\n" + "\n".join(delta.retried))
+    return "\n\n".join(parts)
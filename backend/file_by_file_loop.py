@@ -2,7 +2,7 @@
 """
 Author: rahn
 Datum: 31.01.2026
-Version: 1.2
+Version: 1.3
 Beschreibung: File-by-File Code-Generierung zur Vermeidung von Truncation.
               Basiert auf Dart AI Feature-Ableitung Konzept.
 
@@ -12,6 +12,8 @@ Beschreibung: File-by-File Code-Generierung zur Vermeidung von Truncation.
               AENDERUNG 31.01.2026: Integration von Traceability Manager,
               Documentation Service und Memory Agent.
               AENDERUNG 31.01.2026: Intelligente Retries mit Fehler-Kontext.
+              AENDERUNG 18.10.2026: Pipeline-Modus (file_by_file_pipeline.py) -
+              bereite Dateien werden parallel generiert, Schreiben ueberlappt.
 """
 
 import os
@@ -22,6 +24,7 @@ from crewai import Task, Crew
 
 # AENDERUNG 09.02.2026: Fix 36 — System-Level Blacklist
 from backend.dev_loop_helpers import is_forbidden_file
+from backend.project_code_store import ProjectCodeStore, split_code_blocks
 
 from agents.planner_agent import (
     create_planner,
@@ -43,6 +46,10 @@ from backend.error_analyzer import ErrorAnalyzer, FileError
 from backend.orchestration_worker_status import update_worker_status
 # AENDERUNG 02.02.2026: Memory-Integration fuer Planner
 from agents.memory_core import add_plan_entry
+# AENDERUNG 18.10.2026: Relevanz-gerankter Kontext statt 50 Zeilen jeder Datei
+from backend.context_selector import get_context_settings, legacy_selection, select_context
+# AENDERUNG 18.10.2026: Ueberlappende Generierung/Schreiben mit In-Flight-Fenster
+from backend.file_by_file_pipeline import get_pipeline_settings, run_pipelined_files
 
 logger = logging.getLogger(__name__)
 
@@ -364,6 +371,15 @@ def run_single_file_coder(
         "iteration": iteration
     }, ensure_ascii=False))
 
+    # AENDERUNG 18.10.2026: Kontext nach depends_on, Import-Graph und Pfad-Aehnlichkeit
+    # unter Token-Budget - Prompt-Groesse pro Datei wird fuer den Vergleich geloggt
+    context_settings = get_context_settings(getattr(manager, 'config', None))
+    if context_settings["enabled"]:
+        context = select_context(filepath, existing_files or {}, file_task.get("depends_on") or [],
+                                 context_settings["budget_tokens"])
+    else:
+        context = legacy_selection(existing_files or {})
+
     # Baue Prompt mit Kontext
     # AENDERUNG 20.02.2026: Fix 58g — Schema an Einzeldatei-Coder durchreichen
     prompt = build_single_file_prompt(
@@ -372,8 +388,15 @@ def run_single_file_coder(
         manager.tech_blueprint,
         existing_files,
         user_goal,
-        database_schema=getattr(manager, 'database_schema', '')
+        database_schema=getattr(manager, 'database_schema', ''),
+        context=context
     )
+    manager._ui_log("Coder", "ContextSelection", json.dumps({
+        "file": filepath,
+        "prompt_chars": len(prompt),
+        "existing_files": len(existing_files or {}),
+        **context.stats()
+    }, ensure_ascii=False))
 
     # AENDERUNG 08.02.2026: Pro-Agent Timeout statt globalem agent_timeout_seconds
     agent_timeouts = manager.config.get("agent_timeouts", {})
@@ -491,25 +514,23 @@ def _extract_file_content(output: str, expected_path: str) -> Optional[str]:
     Returns:
         Extrahierter Code oder None
     """
-    import re
-
     if not output:
         return None
 
-    # Pattern: ### FILENAME: path\ncode
-    pattern = rf'###\s*FILENAME:\s*{re.escape(expected_path)}\s*\n(.*?)(?=###\s*FILENAME:|$)'
-    matches = re.findall(pattern, output, re.DOTALL | re.IGNORECASE)
-    if matches:
-        # AENDERUNG 31.01.2026: Markdown-Wrapper IMMER entfernen
-        return _strip_markdown_wrapper(matches[0])
-
-    # Fallback: Suche nach dem Pfad-Fragment
-    filename = os.path.basename(expected_path)
-    pattern = rf'###\s*FILENAME:.*?{re.escape(filename)}\s*\n(.*?)(?=###\s*FILENAME:|$)'
-    matches = re.findall(pattern, output, re.DOTALL | re.IGNORECASE)
-    if matches:
-        # AENDERUNG 31.01.2026: Markdown-Wrapper IMMER entfernen
-        return _strip_markdown_wrapper(matches[0])
+    # AENDERUNG 18.10.2026: Gemeinsamer Parser (project_code_store) statt eigener Regex
+    blocks = split_code_blocks(output)
+    if blocks:
+        # Exakter Pfad (case-insensitive wie bisher)
+        for name, content in blocks:
+            if name.lower() == expected_path.lower():
+                # AENDERUNG 31.01.2026: Markdown-Wrapper IMMER entfernen
+                return _strip_markdown_wrapper(content)
+
+        # Fallback: Suche nach dem Pfad-Fragment
+        filename = os.path.basename(expected_path).lower()
+        for name, content in blocks:
+            if name.lower().endswith(filename):
+                return _strip_markdown_wrapper(content)
 
     # Letzter Fallback: Nimm den gesamten Output (abzueglich Markdown-Bloecke)
     code = _strip_markdown_wrapper(output)
@@ -565,99 +586,110 @@ async def run_file_by_file_loop(
         pass
     _fid_map = getattr(manager, '_feature_id_map', {})
 
-    for file_task in sorted_files:
-        filepath = file_task["path"]
+    # AENDERUNG 18.10.2026: Pipeline statt strikt sequenziell - LLM-Aufrufe in Threads,
+    # Schreiben/Feature-DB ueberlappt mit der Generierung der naechsten bereiten Dateien
+    pipeline = get_pipeline_settings(getattr(manager, 'config', None))
+    if pipeline["enabled"]:
+        completed_files, existing_content, failed_files = await run_pipelined_files(
+            manager, project_rules, sorted_files, user_goal,
+            run_single_file_coder, _analyze_generation_failure,
+            max_iterations=max_iterations, window=pipeline["window"],
+            fdb=_fdb_ref, fid_map=_fid_map
+        )
+    else:
+        for file_task in sorted_files:
+            filepath = file_task["path"]
 
-        # AENDERUNG 13.02.2026: Feature-Status auf "in_progress" setzen
-        _fid = _fid_map.get(filepath)
-        if _fid and _fdb_ref:
-            try:
-                _fdb_ref.update_status(_fid, "in_progress", agent="Coder")
-                manager._ui_log("System", "FeatureUpdate", json.dumps({
-                    "id": _fid, "status": "in_progress", "file_path": filepath
-                }, ensure_ascii=False))
-            except Exception:
-                pass
-
-        # Pruefe Abhaengigkeiten
-        depends = file_task.get("depends_on", [])
-        unmet = [d for d in depends if d not in completed_files]
-        if unmet:
-            manager._ui_log("FileByFile", "Warning",
-                           f"Abhaengigkeiten fuer {filepath} nicht erfuellt: {unmet}")
-            # Trotzdem versuchen, aber mit Warnung
-
-        # Generiere Datei (mit intelligentem Retry)
-        success = False
-        error_context = None  # Fehlerkontext fuer naechsten Versuch
-        last_output = ""
-        last_error = ""
+            # AENDERUNG 13.02.2026: Feature-Status auf "in_progress" setzen
+            _fid = _fid_map.get(filepath)
+            if _fid and _fdb_ref:
+                try:
+                    _fdb_ref.update_status(_fid, "in_progress", agent="Coder")
+                    manager._ui_log("System", "FeatureUpdate", json.dumps({
+                        "id": _fid, "status": "in_progress", "file_path": filepath
+                    }, ensure_ascii=False))
+                except Exception:
+                    pass
 
-        for attempt in range(max_iterations):
-            result_path, result = run_single_file_coder(
-                manager,
-                project_rules,
-                file_task,
-                existing_content,
-                user_goal,
-                attempt,
-                error_context=error_context  # AENDERUNG 31.01.2026: Fehlerkontext mitgeben
-            )
+            # Pruefe Abhaengigkeiten
+            depends = file_task.get("depends_on", [])
+            unmet = [d for d in depends if d not in completed_files]
+            if unmet:
+                manager._ui_log("FileByFile", "Warning",
+                               f"Abhaengigkeiten fuer {filepath} nicht erfuellt: {unmet}")
+                # Trotzdem versuchen, aber mit Warnung
+
+            # Generiere Datei (mit intelligentem Retry)
+            success = False
+            error_context = None  # Fehlerkontext fuer naechsten Versuch
+            last_output = ""
+            last_error = ""
+
+            for attempt in range(max_iterations):
+                result_path, result = run_single_file_coder(
+                    manager,
+                    project_rules,
+                    file_task,
+                    existing_content,
+                    user_goal,
+                    attempt,
+                    error_context=error_context  # AENDERUNG 31.01.2026: Fehlerkontext mitgeben
+                )
 
-            if result_path:
-                # AENDERUNG 09.02.2026: Fix 36 — System-Level Blacklist
-                if is_forbidden_file(filepath):
-                    manager._ui_log("FileByFile", "ForbiddenFileBlocked", filepath)
-                    break  # Naechste Datei in der aeusseren Schleife
-                # Speichere Datei
-                full_path = os.path.join(manager.project_path, filepath)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(result)
-
-                completed_files.append(filepath)
-                existing_content[filepath] = result
-                success = True
-
-                # AENDERUNG 13.02.2026: Feature-Status auf "done" setzen
-                if _fid and _fdb_ref:
-                    try:
-                        _fdb_ref.mark_done(_fid, actual_lines=len(result.splitlines()))
-                        manager._ui_log("System", "FeatureUpdate", json.dumps({
-                            "id": _fid, "status": "done", "file_path": filepath
-                        }, ensure_ascii=False))
-                    except Exception:
-                        pass
-                break
+                if result_path:
+                    # AENDERUNG 09.02.2026: Fix 36 — System-Level Blacklist
+                    if is_forbidden_file(filepath):
+                        manager._ui_log("FileByFile", "ForbiddenFileBlocked", filepath)
+                        break  # Naechste Datei in der aeusseren Schleife
+                    # Speichere Datei
+                    full_path = os.path.join(manager.project_path, filepath)
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    with open(full_path, "w", encoding="utf-8") as f:
+                        f.write(result)
 
-            # AENDERUNG 31.01.2026: Analysiere Fehler fuer gezielten Retry
-            last_output = result if isinstance(result, str) else ""
-            last_error = result if not result_path else ""
+                    completed_files.append(filepath)
+                    existing_content[filepath] = result
+                    success = True
 
-            error_context = _analyze_generation_failure(
-                output=last_output,
-                expected_path=filepath,
-                error_message=last_error
-            )
+                    # AENDERUNG 13.02.2026: Feature-Status auf "done" setzen
+                    if _fid and _fdb_ref:
+                        try:
+                            _fdb_ref.mark_done(_fid, actual_lines=len(result.splitlines()))
+                            manager._ui_log("System", "FeatureUpdate", json.dumps({
+                                "id": _fid, "status": "done", "file_path": filepath
+                            }, ensure_ascii=False))
+                        except Exception:
+                            pass
+                    break
 
-            manager._ui_log("FileByFile", "Retry", json.dumps({
-                "attempt": attempt + 1,
-                "max": max_iterations,
-                "file": filepath,
-                "error_type": error_context.get("error_type", "unknown"),
-                "hint": error_context.get("suggested_fix", "")
-            }, ensure_ascii=False))
+                # AENDERUNG 31.01.2026: Analysiere Fehler fuer gezielten Retry
+                last_output = result if isinstance(result, str) else ""
+                last_error = result if not result_path else ""
 
-        if not success:
-            failed_files.append(filepath)
-            manager._ui_log("FileByFile", "Error",
-                           f"Datei {filepath} konnte nicht erstellt werden")
-            # AENDERUNG 13.02.2026: Feature-Status auf "failed" setzen
-            if _fid and _fdb_ref:
-                try:
-                    _fdb_ref.mark_failed(_fid, f"Generierung fehlgeschlagen nach {max_iterations} Versuchen")
-                except Exception:
-                    pass
+                error_context = _analyze_generation_failure(
+                    output=last_output,
+                    expected_path=filepath,
+                    error_message=last_error
+                )
+
+                manager._ui_log("FileByFile", "Retry", json.dumps({
+                    "attempt": attempt + 1,
+                    "max": max_iterations,
+                    "file": filepath,
+                    "error_type": error_context.get("error_type", "unknown"),
+                    "hint": error_context.get("suggested_fix", "")
+                }, ensure_ascii=False))
+
+            if not success:
+                failed_files.append(filepath)
+                manager._ui_log("FileByFile", "Error",
+                               f"Datei {filepath} konnte nicht erstellt werden")
+                # AENDERUNG 13.02.2026: Feature-Status auf "failed" setzen
+                if _fid and _fdb_ref:
+                    try:
+                        _fdb_ref.mark_failed(_fid, f"Generierung fehlgeschlagen nach {max_iterations} Versuchen")
+                    except Exception:
+                        pass
 
     # 3. Integration: Traceability, Documentation, Memory
     await _integrate_file_by_file_results(
@@ -984,24 +1016,9 @@ def merge_repaired_files(existing_code: str, repaired_content: Dict[str, str]) -
     Returns:
         Aktualisierter Code mit reparierten Dateien
     """
-    import re
-
-    result = existing_code
-
-    for filepath, new_content in repaired_content.items():
-        # Pattern: ### FILENAME: filepath\n...content...(bis zum naechsten ### FILENAME oder Ende)
-        pattern = rf'(###\s*FILENAME:\s*{re.escape(filepath)}\s*\n).*?(?=###\s*FILENAME:|$)'
-
-        # Ersetze mit neuer Version
-        replacement = f"### FILENAME: {filepath}\n{new_content}\n"
-
-        new_result = re.sub(pattern, replacement, result, flags=re.DOTALL)
-
-        if new_result == result:
-            # Datei war nicht im Code - anhaengen
-            result = result.rstrip() + f"\n\n### FILENAME: {filepath}\n{new_content}\n"
-        else:
-            result = new_result
-
-    return result
+    # AENDERUNG 18.10.2026: Ueber ProjectCodeStore - unveraenderte Bloecke bleiben
+    # woertlich erhalten, fehlende Dateien werden angehaengt
+    store = ProjectCodeStore.from_code(existing_code)
+    store.apply_patch(repaired_content)
+    return store.render()
 
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Pipeline-Ausfuehrung fuer den File-by-File Modus.
+              Bisher lief jede Datei strikt nacheinander: LLM-Aufruf (blockierend
+              im Event-Loop), Schreiben, Feature-DB-Update - erst dann die naechste.
+              Die Pipeline ueberlappt die Stufen:
+              - bis zu `window` Dateien gleichzeitig in Generierung, sobald ihre
+                depends_on fertig sind (spekulativ vor der aktuellen Datei)
+              - LLM-Aufrufe laufen in Threads, nicht im Event-Loop
+              - Schreiben und Feature-DB-Updates laufen in einer eigenen Stufe
+                parallel zur Generierung der naechsten Dateien
+              - Retries stellen nur die fehlgeschlagene Datei erneut ein
+              AENDERUNG 18.10.2026: Standardmaessig aus (window-fache Coder-Last);
+              solange das Coder-Modell rate-limited ist, startet nur eine Datei.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.dev_loop_helpers import is_forbidden_file
+from backend.run_tracer import bind_trace_context
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = 3
+
+
+def get_pipeline_settings(config: Any) -> Dict[str, Any]:
+    """Liest file_by_file_pipeline aus der Config (Default und ohne dict-Config: sequenziell)."""
+    if not isinstance(config, dict):
+        return {"enabled": False, "window": 1}
+    settings = config.get("file_by_file_pipeline", {}) or {}
+    window = settings.get("window", DEFAULT_WINDOW)
+    try:
+        window = max(1, int(window))
+    except (TypeError, ValueError):
+        window = DEFAULT_WINDOW
+    return {"enabled": bool(settings.get("enabled", False)), "window": window}
+
+
+def _coder_rate_limited(manager) -> bool:
+    """True solange das Coder-Modell im Rate-Limit-Cooldown des ModelRouters ist."""
+    check = getattr(getattr(manager, "model_router", None), "is_role_rate_limited", None)
+    if not callable(check):
+        return False
+    try:
+        return check("coder") is True
+    except Exception:
+        return False
+
+
+class _FeatureUpdates:
+    """Feature-DB Status-Updates samt UI-Event (Fehler blockieren die Pipeline nicht)."""
+
+    def __init__(self, manager, fdb, fid_map: Dict[str, Any]):
+        self._manager = manager
+        self._fdb = fdb
+        self._fid_map = fid_map or {}
+
+    def in_progress(self, filepath: str) -> None:
+        fid = self._fid_map.get(filepath)
+        if fid and self._fdb:
+            try:
+                self._fdb.update_status(fid, "in_progress", agent="Coder")
+                self._emit(fid, "in_progress", filepath)
+            except Exception:
+                pass
+
+    def done(self, filepath: str, content: str) -> None:
+        fid = self._fid_map.get(filepath)
+        if fid and self._fdb:
+            try:
+                self._fdb.mark_done(fid, actual_lines=len(content.splitlines()))
+                self._emit(fid, "done", filepath)
+            except Exception:
+                pass
+
+    def failed(self, filepath: str, reason: str) -> None:
+        fid = self._fid_map.get(filepath)
+        if fid and self._fdb:
+            try:
+                self._fdb.mark_failed(fid, reason)
+            except Exception:
+                pass
+
+    def _emit(self, fid, status: str, filepath: str) -> None:
+        self._manager._ui_log("System", "FeatureUpdate", json.dumps({
+            "id": fid, "status": status, "file_path": filepath
+        }, ensure_ascii=False))
+
+
+def _write_file(project_path: str, filepath: str, content: str) -> None:
+    full_path = os.path.join(project_path, filepath)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+async def run_pipelined_files(
+    manager,
+    project_rules: Dict[str, Any],
+    sorted_files: List[Dict[str, Any]],
+    user_goal: str,
+    generate: Callable[..., Tuple[Optional[str], str]],
+    analyze_failure: Callable[..., Dict[str, Any]],
+    max_iterations: int = 3,
+    window: int = DEFAULT_WINDOW,
+    fdb=None,
+    fid_map: Optional[Dict[str, Any]] = None
+) -> Tuple[List[str], Dict[str, str], List[str]]:
+    """
+    Erzeugt die Dateien aus sorted_files mit ueberlappenden Stufen.
+
+    Eine Datei ist bereit, wenn alle ihre depends_on (soweit im Plan) fertig
+    oder endgueltig fehlgeschlagen sind. Bereite Dateien starten in Plan-
+    Reihenfolge; ist keine bereit und nichts in Arbeit (Zyklus), startet die
+    naechste Datei trotzdem - wie im sequenziellen Modus mit Warnung.
+    Solange das Coder-Modell rate-limited ist, laeuft hoechstens eine Datei.
+
+    Args:
+        manager: OrchestrationManager
+        project_rules: Projekt-Regeln
+        sorted_files: Dateien in Prioritaets-Reihenfolge (sort_files_by_priority)
+        user_goal: Benutzer-Anforderung
+        generate: run_single_file_coder (blockierend, laeuft im Thread-Pool)
+        analyze_failure: _analyze_generation_failure fuer den Retry-Kontext
+        max_iterations: Max. Versuche pro Datei
+        window: Max. Dateien gleichzeitig in Generierung
+        fdb: FeatureTrackingDB (optional)
+        fid_map: Dateipfad → Feature-ID
+
+    Returns:
+        Tuple (completed_files, existing_content, failed_files) in Plan-Reihenfolge
+    """
+    loop = asyncio.get_running_loop()
+    window = max(1, window)
+    features = _FeatureUpdates(manager, fdb, fid_map)
+    plan_paths = [f["path"] for f in sorted_files]
+    order = {path: i for i, path in enumerate(plan_paths)}
+
+    queue: List[Tuple[Dict[str, Any], int, Optional[Dict[str, Any]]]] = [
+        (file_task, 0, None) for file_task in sorted_files]
+    in_flight: Dict[asyncio.Future, Tuple[Dict[str, Any], int]] = {}
+    writes: List[asyncio.Future] = []
+    done_paths: set = set()
+    existing_content: Dict[str, str] = {}
+    completed: List[str] = []
+    failed: List[str] = []
+    peak = 0
+    throttled = False
+    started = time.monotonic()
+
+    generator = ThreadPoolExecutor(max_workers=window, thread_name_prefix="fbf-gen")
+    # Eine Schreib-Stufe: Reihenfolge der Writes/DB-Updates bleibt erhalten
+    writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fbf-write")
+
+    def is_ready(file_task: Dict[str, Any]) -> bool:
+        return all(d in done_paths for d in file_task.get("depends_on", []) if d in order)
+
+    def launch(index: int) -> None:
+        file_task, attempt, error_context = queue.pop(index)
+        filepath = file_task["path"]
+        if attempt == 0:
+            writer.submit(features.in_progress, filepath)
+            unmet = [d for d in file_task.get("depends_on", []) if d not in existing_content]
+            if unmet:
+                manager._ui_log("FileByFile", "Warning",
+                                f"Abhaengigkeiten fuer {filepath} nicht erfuellt: {unmet}")
+        # Snapshot: parallel laufende Dateien sehen nur bereits fertige Dateien
+        snapshot = dict(existing_content)
+        # LLM-Spans der Datei haengen unter dem aufrufenden Span (file_generation)
+        future = loop.run_in_executor(
+            generator,
+            bind_trace_context(lambda: generate(manager, project_rules, file_task, snapshot,
+                                                user_goal, attempt, error_context=error_context)))
+        in_flight[future] = (file_task, attempt)
+
+    def finish_failed(filepath: str, reason: str) -> None:
+        failed.append(filepath)
+        done_paths.add(filepath)
+        manager._ui_log("FileByFile", "Error",
+                        f"Datei {filepath} konnte nicht erstellt werden")
+        writes.append(loop.run_in_executor(writer, features.failed, filepath, reason))
+
+    try:
+        while queue or in_flight:
+            # Fenster mit bereiten Dateien auffuellen (Retries stehen vorne in der Queue)
+            # AENDERUNG 18.10.2026: Kein Nachschub waehrend des Coder-Rate-Limits
+            limit = window
+            if window > 1 and _coder_rate_limited(manager):
+                limit = 1
+                if not throttled:
+                    manager._ui_log("FileByFile", "Throttled",
+                                    "Coder-Modell rate-limited - Pipeline startet vorerst nur eine Datei")
+                throttled = True
+            else:
+                throttled = False
+            while queue and len(in_flight) < limit:
+                index = next((i for i, (task, _, _) in enumerate(queue) if is_ready(task)), None)
+                if index is None:
+                    if in_flight:
+                        break
+                    index = 0
+                launch(index)
+            peak = max(peak, len(in_flight))
+
+            finished, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for future in finished:
+                file_task, attempt = in_flight.pop(future)
+                filepath = file_task["path"]
+                try:
+                    result_path, result = future.result()
+                except Exception as e:
+                    result_path, result = None, str(e)
+
+                if result_path:
+                    # AENDERUNG 09.02.2026: Fix 36 — System-Level Blacklist
+                    if is_forbidden_file(filepath):
+                        manager._ui_log("FileByFile", "ForbiddenFileBlocked", filepath)
+                        finish_failed(filepath, "Datei steht auf der Blacklist (nicht generieren)")
+                        continue
+                    completed.append(filepath)
+                    existing_content[filepath] = result
+                    done_paths.add(filepath)
+                    # Schreiben + Feature-DB ueberlappen mit der naechsten Generierung
+                    writes.append(loop.run_in_executor(
+                        writer, _write_and_mark_done, manager.project_path, filepath, result, features))
+                    continue
+
+                last_output = result if isinstance(result, str) else ""
+                error_context = analyze_failure(
+                    output=last_output,
+                    expected_path=filepath,
+                    error_message=last_output
+                )
+                manager._ui_log("FileByFile", "Retry", json.dumps({
+                    "attempt": attempt + 1,
+                    "max": max_iterations,
+                    "file": filepath,
+                    "error_type": error_context.get("error_type", "unknown"),
+                    "hint": error_context.get("suggested_fix", "")
+                }, ensure_ascii=False))
+                if attempt + 1 < max_iterations:
+                    queue.insert(0, (file_task, attempt + 1, error_context))
+                else:
+                    finish_failed(filepath, f"Generierung fehlgeschlagen nach {max_iterations} Versuchen")
+
+        if writes:
+            await asyncio.gather(*writes)
+    finally:
+        generator.shutdown(wait=False, cancel_futures=True)
+        writer.shutdown(wait=False)
+
+    manager._ui_log("FileByFile", "Pipeline", json.dumps({
+        "window": window,
+        "peak_in_flight": peak,
+        "files": len(plan_paths),
+        "completed": len(completed),
+        "failed": len(failed),
+        "wall_seconds": round(time.monotonic() - started, 2)
+    }, ensure_ascii=False))
+
+    completed.sort(key=order.get)
+    failed.sort(key=order.get)
+    ordered_content = {path: existing_content[path] for path in completed}
+    return completed, ordered_content, failed
+
+
+def _write_and_mark_done(project_path: str, filepath: str, content: str,
+                         features: _FeatureUpdates) -> None:
+    _write_file(project_path, filepath, content)
+    features.done(filepath, content)
@@ -2,15 +2,18 @@
 """
 Author: rahn
 Datum: 29.01.2026
-Version: 1.0
+Version: 1.2
 Beschreibung: Heartbeat-Utilities für stabile WebSocket-Verbindung während langer Operationen.
+              AENDERUNG 18.10.2026: Ausfuehrung ueber backend/operation_supervisor.py
+              AENDERUNG 18.10.2026: Jeder Aufruf ist ein "llm"-Span im Run-Trace
 """
 # ÄNDERUNG 29.01.2026: Ausgelagert aus orchestration_manager.py um zirkuläre Imports zu vermeiden
 
-import threading
-import time
 import json
 
+from .operation_supervisor import get_supervisor
+from .run_tracer import bind_trace_context, trace_span
+
 
 def run_with_heartbeat(
     func,
@@ -39,53 +42,27 @@ def run_with_heartbeat(
         TimeoutError: Wenn die Funktion länger als timeout_seconds dauert
         Exception: Wenn die Funktion eine Exception wirft
     """
-    result = [None]
-    exception = [None]
-    completed = threading.Event()
-    start_time = time.time()
-
-    def target():
-        try:
-            result[0] = func()
-        except Exception as e:
-            exception[0] = e
-        finally:
-            completed.set()
-
-    def heartbeat_sender():
-        """Sendet regelmäßige Heartbeat-Updates bis der Task fertig ist."""
-        heartbeat_count = 0
-        while not completed.is_set():
-            completed.wait(timeout=heartbeat_interval)
-            if not completed.is_set():
-                heartbeat_count += 1
-                elapsed = int(time.time() - start_time)
-                if ui_log_callback:
-                    try:
-                        ui_log_callback(
-                            agent_name,
-                            "Heartbeat",
-                            json.dumps({
-                                "status": "working",
-                                "task": task_description,
-                                "elapsed_seconds": elapsed,
-                                "heartbeat_count": heartbeat_count
-                            }, ensure_ascii=False)
-                        )
-                    except Exception:
-                        pass  # Heartbeat-Fehler ignorieren
-
-    work_thread = threading.Thread(target=target, daemon=True)
-    heartbeat_thread = threading.Thread(target=heartbeat_sender, daemon=True)
-
-    work_thread.start()
-    heartbeat_thread.start()
-    work_thread.join(timeout=timeout_seconds)
-
-    if work_thread.is_alive():
-        completed.set()  # Signal an Heartbeat-Thread zum Stoppen
-        raise TimeoutError(f"Operation dauerte länger als {timeout_seconds}s")
+    # AENDERUNG 18.10.2026: Zentraler Supervisor statt Worker- und Heartbeat-Thread pro Aufruf
+    def send_heartbeat(op):
+        if ui_log_callback:
+            ui_log_callback(
+                agent_name,
+                "Heartbeat",
+                json.dumps({
+                    "status": "working",
+                    "task": task_description,
+                    "elapsed_seconds": int(op.elapsed),
+                    "heartbeat_count": op.heartbeat_count
+                }, ensure_ascii=False)
+            )
 
-    if exception[0]:
-        raise exception[0]
-    return result[0]
+    # Span im aufrufenden Thread, func erbt ihn im Supervisor-Worker (verschachtelte Spans)
+    with trace_span(task_description, "llm", agent=agent_name):
+        return get_supervisor().run(
+            bind_trace_context(func),
+            name=task_description,
+            owner=agent_name,
+            timeout=timeout_seconds,
+            heartbeat_interval=heartbeat_interval,
+            on_heartbeat=send_heartbeat,
+        )
@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Gemeinsamer HTTP-Client mit Connection-Pooling fuer externe APIs.
+              Ersetzt die pro Aufruf erzeugten Sessions (EXA, Dart, OpenRouter):
+              - Keep-Alive-Verbindungspools pro Host (wiederverwendete TCP/TLS-Verbindungen)
+              - Begrenzte Parallelitaet global und pro Host
+              - Retries mit Full-Jitter-Backoff (nur idempotent bzw. bei toten Keep-Alive-Verbindungen)
+              - Zusammenlegen identischer, gleichzeitig laufender GET-Anfragen
+              - Async-Wrapper (asyncio.to_thread) fuer FastAPI/asyncio-Aufrufer
+              Basiert nur auf der Standardbibliothek (http.client), damit weder
+              aiohttp noch requests installiert sein muessen.
+"""
+
+import asyncio
+import http.client
+import json
+import logging
+import random
+import ssl
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Standard-Limits (pro Prozess geteilt)
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_MAX_IDLE_PER_HOST = 4
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_BASE = 0.25
+DEFAULT_BACKOFF_MAX = 4.0
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Fehler die bei einer wiederverwendeten Verbindung auf einen vom Server
+# geschlossenen Keep-Alive-Socket hindeuten - Request wurde nicht verarbeitet
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class HttpClientError(Exception):
+    """Netzwerk- oder Protokollfehler beim HTTP-Aufruf."""
+
+    def __init__(self, message: str, url: str = "", status: Optional[int] = None):
+        self.url = url
+        self.status = status
+        super().__init__(message)
+
+
+class HttpTimeoutError(HttpClientError):
+    """Timeout beim Verbindungsaufbau, Senden oder Lesen."""
+
+
+class HttpStatusError(HttpClientError):
+    """Antwort mit Fehler-Statuscode (von HttpResponse.raise_for_status)."""
+
+
+@dataclass
+class HttpResponse:
+    """Vollstaendig gelesene HTTP-Antwort."""
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    url: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8")) if self.body else None
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise HttpStatusError(
+                f"HTTP {self.status} fuer {self.url}: {self.text[:200]}",
+                url=self.url, status=self.status
+            )
+
+
+class _HostPool:
+    """Keep-Alive-Pool fuer genau einen (scheme, host, port)."""
+
+    def __init__(self, scheme: str, host: str, port: int, max_connections: int,
+                 max_idle: int, ssl_context: Optional[ssl.SSLContext]):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self._ssl_context = ssl_context
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Liefert (Verbindung, wiederverwendet). Blockiert bei vollem Pool."""
+        if not self._slots.acquire(timeout=timeout):
+            raise HttpTimeoutError(f"Verbindungspool fuer {self.host} erschoepft")
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop(), True
+            self.created += 1
+        if self.scheme == "https":
+            conn = http.client.HTTPSConnection(self.host, self.port, timeout=timeout,
+                                               context=self._ssl_context)
+        else:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        return conn, False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        """Gibt die Verbindung zurueck - wiederverwendbar in den Idle-Stack, sonst schliessen."""
+        try:
+            with self._lock:
+                if reusable and len(self._idle) < self.max_idle:
+                    # LIFO: zuletzt benutzte Verbindung ist am wahrscheinlichsten noch offen
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+
+class SharedHttpClient:
+    """
+    Thread-sicherer HTTP-Client mit Verbindungspools pro Host.
+
+    Alle Methoden sind synchron und blockierend; die a*-Varianten laufen
+    ueber asyncio.to_thread und blockieren den Event-Loop nicht.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        coalesce_gets: bool = True,
+        user_agent: str = "AgentSmith/1.0",
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.coalesce_gets = coalesce_gets
+        self.user_agent = user_agent
+        self._concurrency = threading.BoundedSemaphore(max_concurrency)
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._pools_lock = threading.Lock()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+        self._stats = {"requests": 0, "retries": 0, "coalesced": 0, "errors": 0}
+
+    # =========================================================================
+    # Oeffentliche API
+    # =========================================================================
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json_body: Any = None,
+        data: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+    ) -> HttpResponse:
+        """
+        Fuehrt eine HTTP-Anfrage aus.
+
+        Args:
+            method: HTTP-Methode
+            url: Vollstaendige URL (http/https)
+            headers: Zusaetzliche Header
+            json_body: Wird als JSON serialisiert (setzt Content-Type)
+            data: Roher Body (alternativ zu json_body)
+            timeout: Timeout pro Versuch in Sekunden
+            retries: Ueberschreibt die Anzahl Wiederholungen
+
+        Returns:
+            HttpResponse (auch bei 4xx/5xx - raise_for_status() nutzen)
+
+        Raises:
+            HttpTimeoutError, HttpClientError bei Netzwerkfehlern
+        """
+        method = method.upper()
+        headers = dict(headers or {})
+        if json_body is not None:
+            data = json.dumps(json_body).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+
+        if method == "GET" and self.coalesce_gets and data is None:
+            key = (url, tuple(sorted((k.lower(), v) for k, v in headers.items())))
+            with self._inflight_lock:
+                future = self._inflight.get(key)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    self._inflight[key] = future
+            if not owner:
+                self._count("coalesced")
+                return future.result()
+            try:
+                response = self._request_with_retries(method, url, headers, data, timeout, retries)
+                future.set_result(response)
+                return response
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(key, None)
+
+        return self._request_with_retries(method, url, headers, data, timeout, retries)
+
+    def get(self, url: str, **kwargs) -> HttpResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> HttpResponse:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> HttpResponse:
+        return self.request("PATCH", url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs) -> HttpResponse:
+        """Async-Variante von request() - laeuft im Thread-Pool."""
+        return await asyncio.to_thread(self.request, method, url, **kwargs)
+
+    async def aget(self, url: str, **kwargs) -> HttpResponse:
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url: str, **kwargs) -> HttpResponse:
+        return await self.arequest("POST", url, **kwargs)
+
+    def map_concurrent(self, func: Callable[[Any], Any], items: List[Any],
+                       max_workers: Optional[int] = None) -> List[Any]:
+        """
+        Wendet func parallel auf items an (Reihenfolge bleibt erhalten).
+
+        Fuer Bulk-Operationen wie Dart-Batch-Sync. Die Pools begrenzen die
+        tatsaechliche Anzahl gleichzeitiger Verbindungen zusaetzlich.
+        """
+        if not items:
+            return []
+        workers = max(1, min(max_workers or self.max_connections_per_host, len(items)))
+        if workers == 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http-bulk") as pool:
+            return list(pool.map(func, items))
+
+    def stats(self) -> Dict[str, Any]:
+        """Zaehler fuer Monitoring und Tests."""
+        with self._stats_lock:
+            result = dict(self._stats)
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        result["connections_created"] = sum(p.created for p in pools)
+        result["connections_reused"] = sum(p.reused for p in pools)
+        result["hosts"] = {
+            f"{p.scheme}://{p.host}:{p.port}": {
+                "created": p.created, "reused": p.reused, "idle": p.idle_count
+            }
+            for p in pools
+        }
+        return result
+
+    def close(self) -> None:
+        """Schliesst alle Idle-Verbindungen."""
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    # =========================================================================
+    # Interna
+    # =========================================================================
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] = self._stats.get(key, 0) + amount
+
+    def _get_pool(self, scheme: str, host: str, port: int) -> _HostPool:
+        key = (scheme, host, port)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(scheme, host, port, self.max_connections_per_host,
+                                 self.max_idle_per_host,
+                                 self._ssl_context if scheme == "https" else None)
+                self._pools[key] = pool
+            return pool
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-Jitter: zufaellig zwischen 0 und base * 2^attempt (gedeckelt)."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _request_with_retries(self, method: str, url: str, headers: Dict[str, str],
+                              data: Optional[bytes], timeout: Optional[float],
+                              retries: Optional[int]) -> HttpResponse:
+        max_retries = self.retries if retries is None else retries
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            self._count("requests")
+            try:
+                response, _ = self._send_once(method, url, headers, data, timeout)
+            except _StaleConnection as e:
+                # Tote Keep-Alive-Verbindung: Server hat nichts verarbeitet,
+                # daher auch fuer POST gefahrlos wiederholbar
+                if attempt < max_retries:
+                    attempt += 1
+                    self._count("retries")
+                    continue
+                self._count("errors")
+                raise e.error
+            except HttpClientError:
+                if idempotent and attempt < max_retries:
+                    time.sleep(self._backoff(attempt))
+                    attempt += 1
+                    self._count("retries")
+                    continue
+                self._count("errors")
+                raise
+
+            if response.status in self.retry_statuses and idempotent and attempt < max_retries:
+                time.sleep(self._backoff(attempt, response.headers.get("retry-after")))
+                attempt += 1
+                self._count("retries")
+                continue
+            return response
+
+    def _send_once(self, method: str, url: str, headers: Dict[str, str],
+                   data: Optional[bytes], timeout: Optional[float]) -> Tuple[HttpResponse, bool]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise HttpClientError(f"Ungueltige URL: {url}", url=url)
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        timeout = self.timeout if timeout is None else timeout
+
+        send_headers = {"User-Agent": self.user_agent, "Accept-Encoding": "identity",
+                        "Connection": "keep-alive"}
+        send_headers.update(headers)
+
+        pool = self._get_pool(scheme, parts.hostname, port)
+        if not self._concurrency.acquire(timeout=timeout):
+            raise HttpTimeoutError("Globales Parallelitaetslimit erreicht", url=url)
+        try:
+            conn, reused = pool.acquire(timeout)
+            reusable = False
+            try:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.request(method, path, body=data, headers=send_headers)
+                raw = conn.getresponse()
+                body = raw.read()
+                reusable = not raw.will_close
+                response = HttpResponse(
+                    status=raw.status,
+                    headers={k.lower(): v for k, v in raw.getheaders()},
+                    body=body,
+                    url=url,
+                )
+                return response, reused
+            except _STALE_CONNECTION_ERRORS as e:
+                if reused:
+                    raise _StaleConnection(HttpClientError(f"Verbindung getrennt: {e}", url=url))
+                raise HttpClientError(f"Verbindung getrennt: {e}", url=url) from e
+            except TimeoutError as e:
+                raise HttpTimeoutError(f"Timeout nach {timeout}s: {url}", url=url) from e
+            except (OSError, http.client.HTTPException) as e:
+                raise HttpClientError(f"HTTP-Fehler bei {url}: {e}", url=url) from e
+            finally:
+                pool.release(conn, reusable)
+        finally:
+            self._concurrency.release()
+
+
+class _StaleConnection(Exception):
+    """Intern: wiederverwendete Verbindung war bereits vom Server geschlossen."""
+
+    def __init__(self, error: HttpClientError):
+        self.error = error
+        super().__init__(str(error))
+
+
+# =========================================================================
+# Prozessweiter Client
+# =========================================================================
+
+_client: Optional[SharedHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> SharedHttpClient:
+    """Liefert den prozessweit geteilten HTTP-Client (lazy erzeugt)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = SharedHttpClient()
+    return _client
+
+
+def reset_http_client() -> None:
+    """Schliesst und verwirft den geteilten Client (fuer Tests)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
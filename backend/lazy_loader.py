@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Lazy-Loading fuer schwere Subsysteme beim Server-Start.
+              - LazyAttr: Platzhalter fuer ein Modul-Attribut (Klasse/Funktion),
+                das Modul wird erst beim ersten Aufruf importiert
+              - LazyInstance: Proxy fuer ein Singleton (z.B. OrchestrationManager),
+                das erst beim ersten Attributzugriff erzeugt wird
+              Ladezeiten landen als Phasen im Startup-Profiler.
+"""
+
+import importlib
+import threading
+from typing import Any, Callable
+
+from .startup_profiler import get_startup_profiler
+
+
+class LazyAttr:
+    """
+    Platzhalter fuer ``from <module> import <attr>``.
+
+    Aufruf und Attributzugriff importieren das Modul beim ersten Mal
+    (thread-safe) und delegieren danach an das echte Objekt.
+    """
+
+    __slots__ = ("_module", "_attr", "_target", "_lock")
+
+    def __init__(self, module: str, attr: str):
+        self._module = module
+        self._attr = attr
+        self._target = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        target = self._target
+        if target is None:
+            with self._lock:
+                if self._target is None:
+                    with get_startup_profiler().phase(f"lazy:{self._module}"):
+                        module = importlib.import_module(self._module)
+                    self._target = getattr(module, self._attr)
+                target = self._target
+        return target
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._target is not None
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "geladen" if self._target is not None else "nicht geladen"
+        return f"<LazyAttr {self._module}.{self._attr} ({state})>"
+
+
+class LazyInstance:
+    """
+    Proxy fuer ein erst bei Bedarf erzeugtes Objekt.
+
+    Lesen, Schreiben und Loeschen von Attributen werden an die Instanz
+    weitergereicht; ``isinstance`` sieht ueber ``__class__`` die echte Klasse.
+    Die Factory laeuft genau einmal, auch bei gleichzeitigen Zugriffen.
+
+    Args:
+        factory: Erzeugt die Instanz (darf schwere Imports enthalten)
+        name: Phasenname fuer den Startup-Profiler
+    """
+
+    def __init__(self, factory: Callable[[], Any], name: str):
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_target", None)
+        object.__setattr__(self, "_lazy_lock", threading.RLock())
+
+    def _lazy_get(self) -> Any:
+        target = object.__getattribute__(self, "_lazy_target")
+        if target is None:
+            with object.__getattribute__(self, "_lazy_lock"):
+                target = object.__getattribute__(self, "_lazy_target")
+                if target is None:
+                    name = object.__getattribute__(self, "_lazy_name")
+                    factory = object.__getattribute__(self, "_lazy_factory")
+                    with get_startup_profiler().phase(f"init:{name}"):
+                        target = factory()
+                    object.__setattr__(self, "_lazy_target", target)
+        return target
+
+    def _lazy_is_loaded(self) -> bool:
+        return object.__getattribute__(self, "_lazy_target") is not None
+
+    @property
+    def __class__(self):
+        return type(self._lazy_get())
+
+    def __getattr__(self, name: str):
+        return getattr(self._lazy_get(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self._lazy_get(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self._lazy_get(), name)
+
+    def __repr__(self) -> str:
+        if not self._lazy_is_loaded():
+            return f"<LazyInstance {object.__getattribute__(self, '_lazy_name')} (nicht erzeugt)>"
+        return repr(self._lazy_get())
+
+
+def lazy_get(obj: Any) -> Any:
+    """Liefert bei LazyInstance/LazyAttr das echte Objekt, sonst obj selbst."""
+    if type(obj) is LazyInstance:
+        return obj._lazy_get()
+    if type(obj) is LazyAttr:
+        return obj.resolve()
+    return obj
+
+
+def is_loaded(obj: Any) -> bool:
+    """True wenn obj kein Lazy-Platzhalter ist oder bereits geladen wurde."""
+    if type(obj) is LazyInstance:
+        return obj._lazy_is_loaded()
+    if type(obj) is LazyAttr:
+        return obj.is_loaded
+    return True
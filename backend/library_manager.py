@@ -2,14 +2,17 @@
 """
 Author: rahn
 Datum: 29.01.2026
-Version: 1.1
+Version: 1.2
 Beschreibung: Library Manager - Zentrale Protokoll- und Archivverwaltung.
               Speichert alle Agent-Kommunikationen und Projektverläufe.
               ÄNDERUNG 29.01.2026: Discovery Briefing wird mit Projekten gespeichert.
               # ÄNDERUNG [31.01.2026]: Archiv-Sanitizing und Token-Summen-Korrektur.
+              AENDERUNG 18.10.2026: Run-Worker schreiben ihr aktuelles Projekt in eine
+              eigene Datei (current_project_<run_id>.json).
 """
 
 import os
+import re
 import json
 import uuid
 import logging
@@ -18,6 +21,7 @@ from typing import Dict, Any, List, Optional
 
 # AENDERUNG 07.02.2026: Sanitizer-Funktionen extrahiert nach library_sanitizer.py (Regel 1)
 from .library_sanitizer import prepare_archive_payload
+from .run_worker import worker_run_id
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +45,11 @@ class LibraryManager:
         self.base_dir = base_dir
         self.library_dir = os.path.join(base_dir, "library")
         self.archive_dir = os.path.join(self.library_dir, "archive")
-        self.current_project_file = os.path.join(self.library_dir, "current_project.json")
+        # Parallele Run-Worker duerfen sich die Datei nicht gegenseitig ueberschreiben
+        run_id = worker_run_id()
+        file_name = (f"current_project_{re.sub(r'[^A-Za-z0-9_-]', '_', run_id)}.json"
+                     if run_id else "current_project.json")
+        self.current_project_file = os.path.join(self.library_dir, file_name)
 
         # Verzeichnisse erstellen
         os.makedirs(self.library_dir, exist_ok=True)
@@ -186,6 +194,43 @@ class LibraryManager:
         self._save_current_project()
         return entry_id
 
+    # AENDERUNG 18.10.2026: Batch-Variante fuer die UI-Log-Pipeline (eine Speicherung pro Batch)
+    def log_entries(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Protokolliert mehrere Eintraege und schreibt die Projektdatei nur einmal.
+
+        Args:
+            entries: Dicts mit from_agent, to_agent, entry_type, content,
+                     iteration und optional timestamp (ISO-String)
+
+        Returns:
+            Anzahl protokollierter Eintraege
+        """
+        if not self.current_project or not entries:
+            return 0
+
+        project = self.current_project
+        for item in entries:
+            from_agent = item["from_agent"]
+            iteration = item.get("iteration", 0)
+            project["entries"].append({
+                "id": f"entry_{len(project['entries']) + 1:04d}",
+                "timestamp": item.get("timestamp") or datetime.now().isoformat(),
+                "iteration": iteration,
+                "from_agent": from_agent,
+                "to_agent": item.get("to_agent", "System"),
+                "type": item["entry_type"],
+                "content": self._serialize_content(item["content"]),
+                "metadata": {}
+            })
+            if from_agent not in project["agents_involved"]:
+                project["agents_involved"].append(from_agent)
+            if iteration > project["iterations"]:
+                project["iterations"] = iteration
+
+        self._save_current_project()
+        return len(entries)
+
     def _serialize_content(self, content: Any) -> Any:
         """Serialisiert Inhalte für JSON-Speicherung."""
         if isinstance(content, str):
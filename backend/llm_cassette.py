@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: LLM-Kassetten - Mitschnitt und Replay von LLM-Antworten.
+              - Aufnahme: echte Runs schreiben jede Antwort (LiteLLM-Callback und
+                ClaudeSDKProvider) als JSONL in eine Kassette
+              - Replay: LiteLLM (ueber mock_response) und ClaudeSDKProvider liefern
+                die aufgezeichneten Antworten statt eines echten Aufrufs, mit
+                konfigurierbarer synthetischer Latenz
+              - Zuordnung: zuerst ueber den normalisierten Prompt-Hash (Pfade,
+                Zeitstempel und IDs ausgeblendet), sonst die naechste unbenutzte
+                Antwort desselben Agenten in Aufnahme-Reihenfolge
+              Verwendet von backend/benchmark_harness.py.
+
+              Konfiguration (optional, config.yaml):
+                llm_cassettes:
+                  record: false   # true: budget_data/cassettes/<run_id>.cassette.jsonl
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .prompt_cache import strip_breakpoints
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "budget_data", "cassettes")
+CASSETTE_SUFFIX = ".cassette.jsonl"
+CASSETTE_VERSION = 1
+
+# Laufzeit-abhaengige Prompt-Teile, die zwischen Aufnahme und Replay abweichen
+_VOLATILE_PATTERNS = (
+    (re.compile(r"[A-Za-z]:[\\/][^\s'\"]*?[\\/]projects[\\/][^\s'\"\\/]+"), "<PROJECT>"),
+    (re.compile(r"/[^\s'\"]*?/projects/[^\s'\"/]+"), "<PROJECT>"),
+    (re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"), "<UUID>"),
+    (re.compile(r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"), "<TS>"),
+    (re.compile(r"\b\d{8}_\d{6}\b"), "<TS>"),
+    (re.compile(r"\b\d{1,2}\.\d{1,2}\.\d{4}(?: \d{2}:\d{2}(?::\d{2})?)?"), "<TS>"),
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class CassetteMissError(RuntimeError):
+    """Keine passende Antwort in der Kassette (Replay im strikten Modus)."""
+
+
+def cassette_path(name: str, directory: Optional[str] = None) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", str(name)) or "run"
+    return os.path.join(directory or CASSETTE_DIR, safe + CASSETTE_SUFFIX)
+
+
+def get_cassette_settings(config: Any) -> Dict[str, Any]:
+    """Liest llm_cassettes aus der Config - Aufnahme nur bei record: true."""
+    settings = config.get("llm_cassettes") if isinstance(config, dict) else None
+    if not isinstance(settings, dict):
+        settings = {}
+    return {"record": bool(settings.get("record", False))}
+
+
+# =========================================================================
+# Prompt-Schluessel
+# =========================================================================
+
+def prompt_text(prompt: Any) -> str:
+    """Prompt als Text - Strings direkt, LiteLLM-Nachrichten (auch Content-Bloecke) zusammengefuegt."""
+    if isinstance(prompt, str):
+        return prompt
+    if not isinstance(prompt, list):
+        return "" if prompt is None else str(prompt)
+    parts = []
+    for message in prompt:
+        if not isinstance(message, dict):
+            continue
+        content = message.get("content")
+        if isinstance(content, list):
+            content = "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+        parts.append(f"{message.get('role', '')}: {content or ''}")
+    return "\n".join(parts)
+
+
+def normalize_prompt(text: str) -> str:
+    """Blendet laufzeit-abhaengige Teile und Cache-Breakpoints aus."""
+    text = strip_breakpoints(text or "")
+    for pattern, replacement in _VOLATILE_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def prompt_key(prompt: Any) -> str:
+    return hashlib.sha256(normalize_prompt(prompt_text(prompt)).encode("utf-8")).hexdigest()[:24]
+
+
+def response_text(completion_response: Any) -> str:
+    """Antworttext aus einer LiteLLM-ModelResponse (Objekt oder dict)."""
+    try:
+        choices = completion_response["choices"] if isinstance(completion_response, dict) \
+            else completion_response.choices
+        message = choices[0]["message"] if isinstance(choices[0], dict) else choices[0].message
+        content = message["content"] if isinstance(message, dict) else message.content
+        return content or ""
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return ""
+
+
+def _agent_key(agent: Optional[str]) -> str:
+    return (agent or "unknown").strip().lower().replace(" ", "").replace("-", "").replace("_", "")
+
+
+# =========================================================================
+# Aufnahme
+# =========================================================================
+
+class CassetteRecorder:
+    """Schreibt LLM-Antworten sofort (Crash-sicher) in eine Kassetten-Datei."""
+
+    def __init__(self, path: str, source: Optional[str] = None):
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "cassette", "version": CASSETTE_VERSION,
+                                "source": source, "created_at": time.time()},
+                               ensure_ascii=False) + "\n")
+
+    def record(self, provider: str, agent: str, model: str, prompt: Any, response: str,
+               latency_ms: float = 0.0, usage: Optional[Dict[str, Any]] = None) -> None:
+        text = prompt_text(prompt)
+        entry = {
+            "type": "call",
+            "provider": provider,
+            "agent": agent,
+            "model": model,
+            "key": prompt_key(text),
+            "prompt_chars": len(text),
+            "prompt_head": normalize_prompt(text)[:200],
+            "response": response or "",
+            "latency_ms": round(float(latency_ms or 0.0), 1),
+            "usage": usage or {},
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+                self.count += 1
+            except OSError as e:
+                logger.debug("Kassette nicht schreibbar (%s): %s", self.path, e)
+
+
+# =========================================================================
+# Replay
+# =========================================================================
+
+def load_cassette(path: str) -> List[Dict[str, Any]]:
+    """Aufgezeichnete Aufrufe in Aufnahme-Reihenfolge (defekte Zeilen werden ignoriert)."""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("type") == "call":
+                entries.append(record)
+    return entries
+
+
+class CassettePlayer:
+    """
+    Liefert aufgezeichnete Antworten in der Reihenfolge der Anfragen.
+
+    Latenz: latency_ms (fest) oder aufgezeichnete Latenz * latency_scale.
+    Im strikten Modus loest eine Anfrage ohne passende Antwort
+    CassetteMissError aus, sonst wird die letzte Antwort des Agenten wiederholt.
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]], latency_scale: float = 1.0,
+                 latency_ms: Optional[float] = None, strict: bool = True,
+                 sleep: Callable[[float], None] = time.sleep, source: Optional[str] = None):
+        self.entries = entries
+        self.latency_scale = max(0.0, float(latency_scale))
+        self.latency_ms = latency_ms
+        self.strict = strict
+        self.source = source
+        self._sleep = sleep
+        self._used = [False] * len(entries)
+        self._last_by_agent: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "exact": 0, "sequence": 0, "reused": 0, "misses": 0,
+                       "simulated_latency_ms": 0.0}
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "CassettePlayer":
+        return cls(load_cassette(path), source=path, **kwargs)
+
+    def _match(self, key: str, agent: str) -> Optional[int]:
+        for index, entry in enumerate(self.entries):
+            if not self._used[index] and entry.get("key") == key:
+                self._stats["exact"] += 1
+                return index
+        for index, entry in enumerate(self.entries):
+            if not self._used[index] and _agent_key(entry.get("agent")) == agent:
+                self._stats["sequence"] += 1
+                return index
+        return None
+
+    def replay(self, provider: str, agent: str, model: str, prompt: Any) -> str:
+        """Antwort fuer einen LLM-Aufruf (blockiert fuer die synthetische Latenz)."""
+        key, agent_norm = prompt_key(prompt), _agent_key(agent)
+        with self._lock:
+            self._stats["calls"] += 1
+            index = self._match(key, agent_norm)
+            if index is None:
+                index = None if self.strict else self._last_by_agent.get(agent_norm)
+                if index is None:
+                    self._stats["misses"] += 1
+                    raise CassetteMissError(
+                        f"Kassette ohne Antwort fuer {agent} ({provider}/{model}, Schluessel {key})")
+                self._stats["reused"] += 1
+            self._used[index] = True
+            self._last_by_agent[agent_norm] = index
+            entry = self.entries[index]
+            delay_ms = self.latency_ms if self.latency_ms is not None \
+                else float(entry.get("latency_ms", 0.0)) * self.latency_scale
+            self._stats["simulated_latency_ms"] += delay_ms
+        if delay_ms > 0:
+            self._sleep(delay_ms / 1000.0)
+        return entry.get("response", "")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["recorded"] = len(self.entries)
+            stats["unused"] = self._used.count(False)
+        stats["simulated_latency_ms"] = round(stats["simulated_latency_ms"], 1)
+        return stats
+
+
+# =========================================================================
+# Aktive Kassette (Aufnahme oder Replay, eine pro Prozess)
+# =========================================================================
+
+_recorder: Optional[CassetteRecorder] = None
+_player: Optional[CassettePlayer] = None
+_active_lock = threading.Lock()
+
+
+def start_cassette_recording(path: str, source: Optional[str] = None) -> Optional[CassetteRecorder]:
+    """Startet die Aufnahme; ein evtl. noch aktiver Mitschnitt wird ersetzt."""
+    global _recorder
+    try:
+        recorder = CassetteRecorder(path, source=source)
+    except OSError as e:
+        logger.warning("LLM-Kassette nicht verfuegbar: %s", e)
+        return None
+    with _active_lock:
+        _recorder = recorder
+    return recorder
+
+
+def finish_cassette_recording() -> Optional[str]:
+    """Beendet die Aufnahme und liefert den Pfad der Kassette."""
+    global _recorder
+    with _active_lock:
+        recorder, _recorder = _recorder, None
+    if recorder is None:
+        return None
+    logger.info("LLM-Kassette geschrieben: %s (%d Aufrufe)", recorder.path, recorder.count)
+    return recorder.path
+
+
+def start_cassette_replay(path: str, **kwargs) -> CassettePlayer:
+    """Aktiviert das Replay - LLM-Aufrufe werden ab jetzt aus der Kassette bedient."""
+    global _player
+    player = CassettePlayer.load(path, **kwargs)
+    with _active_lock:
+        _player = player
+    return player
+
+
+def finish_cassette_replay() -> Optional[Dict[str, Any]]:
+    """Beendet das Replay und liefert die Trefferstatistik."""
+    global _player
+    with _active_lock:
+        player, _player = _player, None
+    return player.stats() if player is not None else None
+
+
+def get_cassette_player() -> Optional[CassettePlayer]:
+    return _player
+
+
+def cassette_active() -> bool:
+    return _recorder is not None or _player is not None
+
+
+def record_llm_call(provider: str, agent: str, model: str, prompt: Any, response: str,
+                    latency_ms: float = 0.0, usage: Optional[Dict[str, Any]] = None) -> None:
+    """Schneidet einen LLM-Aufruf mit - ohne aktive Aufnahme ein No-Op."""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(provider, agent, model, prompt, response, latency_ms, usage)
+
+
+# =========================================================================
+# LiteLLM
+# =========================================================================
+
+_install_lock = threading.Lock()
+
+
+def install_litellm_cassette(litellm_module: Any,
+                             agent_getter: Optional[Callable[[], str]] = None) -> bool:
+    """
+    Haengt das Replay vor litellm.completion/acompletion.
+
+    Bei aktivem Replay wird die Antwort als mock_response durchgereicht:
+    LiteLLM baut daraus eine normale ModelResponse (inkl. Streaming und
+    Callbacks), es geht aber kein Request raus. Ohne Replay unveraendert.
+    Idempotent.
+    """
+    agent_getter = agent_getter or (lambda: "Unknown")
+    with _install_lock:
+        if getattr(litellm_module.completion, "_cassette_wrapped", False):
+            return False
+        original_completion = litellm_module.completion
+        original_acompletion = getattr(litellm_module, "acompletion", None)
+
+        def _with_replay(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            player = _player
+            if player is not None and "mock_response" not in kwargs:
+                kwargs["mock_response"] = player.replay(
+                    "litellm", agent_getter(), kwargs.get("model", ""), kwargs.get("messages"))
+            return kwargs
+
+        def completion(*args, **kwargs):
+            return original_completion(*args, **_with_replay(kwargs))
+
+        completion._cassette_wrapped = True
+        litellm_module.completion = completion
+
+        if original_acompletion is not None:
+            async def acompletion(*args, **kwargs):
+                # Synthetische Latenz blockiert nur einen Worker-Thread, nicht den Event-Loop
+                kwargs = await asyncio.to_thread(_with_replay, kwargs)
+                return await original_acompletion(*args, **kwargs)
+
+            acompletion._cassette_wrapped = True
+            litellm_module.acompletion = acompletion
+        return True
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Langlebige MCP-Client-Sessions fuer das Doc-Enrichment.
+              Bisher startete jeder Library-Fetch einen eigenen npx-Prozess mit
+              initialize → list_tools → resolve → fetch. Der Pool haelt pro Server
+              eine initialisierte Session auf einem eigenen Event-Loop-Thread:
+              - ein Handshake pro Server, danach nur noch call_tool
+              - parallele Aufrufe ueber dieselbe Session (JSON-RPC mit IDs)
+              - kaputte oder lange ungenutzte Sessions werden neu aufgebaut
+              Die Verbindung ist ueber connect austauschbar (Tests: Fake-Server).
+              AENDERUNG 18.10.2026: discard() nur fuer die tatsaechlich kaputte Session
+              (Generationspruefung), is_connection_error() trennt Verbindungs- von
+              Aufruffehlern - parallele Fetches teilen sich eine Session.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_S = 600.0
+
+# anyio-Streams bzw. MCP melden eine geschlossene Verbindung mit diesen Typen/Codes
+_CONNECTION_ERROR_NAMES = {"ClosedResourceError", "BrokenResourceError", "EndOfStream"}
+_MCP_CONNECTION_CLOSED = -32000
+
+ConnectFn = Callable[[], AsyncContextManager[Any]]
+
+
+@asynccontextmanager
+async def stdio_session(command: str, args: List[str], env: Dict[str, str]):
+    """Standard-Verbindung: MCP-Server als Subprozess ueber stdio, initialisiert."""
+    from mcp import ClientSession
+    from mcp.client.stdio import stdio_client, StdioServerParameters
+
+    server_params = StdioServerParameters(command=command, args=args, env=env)
+    async with stdio_client(server_params) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            yield session
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """
+    True wenn exc die Verbindung selbst betrifft (Session unbrauchbar).
+    Timeouts und Tool-Fehler eines einzelnen Aufrufs gehoeren nicht dazu.
+    """
+    if isinstance(exc, (ConnectionError, EOFError)):
+        return True
+    if type(exc).__name__ in _CONNECTION_ERROR_NAMES:
+        return True
+    return getattr(getattr(exc, "error", None), "code", None) == _MCP_CONNECTION_CLOSED
+
+
+@dataclass
+class PooledSession:
+    """Eine offene Session samt Tool-Liste aus dem Handshake."""
+    key: str
+    session: Any
+    tool_names: Set[str]
+    created: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    uses: int = 0
+    _closing: Optional[asyncio.Event] = None
+    _task: Optional["asyncio.Task"] = None
+
+    @property
+    def alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        self.last_used = time.monotonic()
+        self.uses += 1
+        return await self.session.call_tool(name, arguments)
+
+
+class McpSessionPool:
+    """
+    Session-Pool mit eigenem Event-Loop-Thread.
+
+    MCP-Sessions sind an den Loop gebunden, auf dem sie geoeffnet wurden -
+    deshalb laufen alle Fetches ueber run() auf diesem einen Loop.
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT_S):
+        self.idle_timeout = idle_timeout
+        self._sessions: Dict[str, PooledSession] = {}
+        self._open_locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self.handshakes: Dict[str, int] = {}
+        self.reuses: Dict[str, int] = {}
+
+    # ---------------------------------------------------------------------
+    # Loop-Thread
+    # ---------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None or not self._thread or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="mcp-pool", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self._sessions.clear()
+                self._open_locks.clear()
+            return self._loop
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Fuehrt coro auf dem Pool-Loop aus (blockierend, fuer den synchronen DevLoop)."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    # ---------------------------------------------------------------------
+    # Sessions (nur auf dem Pool-Loop aufrufen)
+    # ---------------------------------------------------------------------
+
+    async def acquire(self, key: str, connect: ConnectFn, timeout: float = 30.0) -> PooledSession:
+        """Offene Session fuer key - Handshake nur beim ersten Mal oder nach Ausfall."""
+        lock = self._open_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._sessions.get(key)
+            if entry is not None and entry.alive:
+                if time.monotonic() - entry.last_used <= self.idle_timeout:
+                    self.reuses[key] = self.reuses.get(key, 0) + 1
+                    return entry
+                logger.debug("MCP-Pool: Session '%s' war zu lange ungenutzt - neu aufbauen", key)
+            if entry is not None:
+                await self._close(entry)
+            entry = await self._open(key, connect, timeout)
+            self._sessions[key] = entry
+            self.handshakes[key] = self.handshakes.get(key, 0) + 1
+            return entry
+
+    async def _open(self, key: str, connect: ConnectFn, timeout: float) -> PooledSession:
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future = loop.create_future()
+        closing = asyncio.Event()
+
+        async def owner():
+            # Context-Manager (anyio) muessen im selben Task betreten und verlassen werden
+            try:
+                async with connect() as session:
+                    tools = await session.list_tools()
+                    if not ready.done():
+                        ready.set_result(PooledSession(
+                            key=key, session=session,
+                            tool_names={t.name for t in getattr(tools, "tools", []) or []},
+                            _closing=closing))
+                    await closing.wait()
+            except BaseException as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                if not isinstance(e, (Exception, asyncio.CancelledError)):
+                    raise
+
+        task = loop.create_task(owner())
+        try:
+            entry = await asyncio.wait_for(asyncio.shield(ready), timeout=timeout)
+        except BaseException:
+            closing.set()
+            task.cancel()
+            raise
+        entry._task = task
+        return entry
+
+    async def _close(self, entry: PooledSession) -> None:
+        if entry._closing is not None:
+            entry._closing.set()
+        if entry._task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(entry._task), timeout=5)
+            except BaseException:
+                entry._task.cancel()
+
+    async def discard(self, key: str, entry: Optional[PooledSession] = None) -> None:
+        """
+        Session nach Verbindungsfehler verwerfen - der naechste acquire() baut neu auf.
+        Mit entry nur, wenn genau diese Session noch im Pool ist: ein zweiter Fetch,
+        der denselben Ausfall sieht, schliesst nicht die inzwischen neu aufgebaute.
+        """
+        current = self._sessions.get(key)
+        if current is None or (entry is not None and current is not entry):
+            return
+        del self._sessions[key]
+        await self._close(current)
+
+    async def _close_all(self) -> None:
+        for key in list(self._sessions):
+            await self.discard(key)
+
+    def close_all(self) -> None:
+        """Alle Sessions schliessen (atexit, Tests)."""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            return
+        try:
+            self.run(self._close_all(), timeout=10)
+        except Exception as e:
+            logger.debug("MCP-Pool: Schliessen fehlgeschlagen: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": {key: {"uses": entry.uses, "alive": entry.alive,
+                               "age_s": round(time.monotonic() - entry.created, 1)}
+                         for key, entry in self._sessions.items()},
+            "handshakes": dict(self.handshakes),
+            "reuses": dict(self.reuses),
+        }
+
+
+_instance: Optional[McpSessionPool] = None
+_instance_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> McpSessionPool:
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = McpSessionPool()
+            atexit.register(_instance.close_all)
+        return _instance
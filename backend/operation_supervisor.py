@@ -0,0 +1,442 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Zentraler Supervisor fuer langlaufende Operationen.
+              Ersetzt die Thread-Paare aus run_with_heartbeat (Worker + Heartbeat-
+              Sender pro Aufruf) und die Wegwerf-Executors in run_with_timeout,
+              dev_loop_core und dev_loop_sandbox:
+              - Ein gemeinsamer, begrenzter Worker-Pool
+              - Ein Timer-Thread (Heap nach Faelligkeit) fuer alle Heartbeats
+                und Deadlines
+              - Kooperativer Abbruch ueber CancelToken (check_cancelled())
+              - Live-Sicht aller ueberwachten Operationen (snapshot())
+
+              Python-Threads lassen sich nicht abschiessen: bei Timeout wird der
+              Aufrufer sofort freigegeben und das Token gesetzt, die Funktion
+              selbst endet erst am naechsten check_cancelled() bzw. regulaer.
+              Ist der Pool voll (z.B. verschachtelte Aufrufe aus einem Worker
+              oder haengende Operationen), laeuft die Operation in einem
+              Overflow-Thread statt auf einen freien Worker zu warten.
+              AENDERUNG 18.10.2026: cancel() gibt wartende Aufrufer sofort frei
+              (OperationCancelled) und bricht verschachtelte Operationen mit ab;
+              Heartbeat-Callbacks laufen im Pool statt im Timer-Thread;
+              cancellable_sleep() als Abbruchpunkt in Retry-/Backoff-Schleifen.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+# Abgeschlossene Operationen bleiben fuer die Live-Sicht kurz sichtbar
+FINISHED_HISTORY = 50
+# Heartbeat-Callbacks bei vollem Worker-Pool
+HEARTBEAT_OVERFLOW_WORKERS = 2
+
+
+class OperationCancelled(Exception):
+    """Operation wurde abgebrochen (manuell oder durch Deadline)."""
+
+
+class CancelToken:
+    """Kooperatives Abbruch-Signal einer Operation."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Schlaeft bis Abbruch oder Timeout (Ersatz fuer time.sleep)."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise OperationCancelled(self.reason or "cancelled")
+
+
+class SupervisedOperation:
+    """Zustand einer ueberwachten Operation."""
+
+    def __init__(self, op_id: int, name: str, owner: Optional[str],
+                 timeout: Optional[float], heartbeat_interval: Optional[float],
+                 on_heartbeat: Optional[Callable[["SupervisedOperation"], None]]):
+        self.op_id = op_id
+        self.name = name
+        self.owner = owner
+        self.timeout = timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.on_heartbeat = on_heartbeat
+        self.token = CancelToken()
+        self.future: Future = Future()
+        self.started_at = time.time()
+        self._t0 = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self._duration: Optional[float] = None
+        self.status = "running"  # running | done | failed | timeout | cancelled
+        self.heartbeat_count = 0
+        self.overflow = False
+        # Aeussere Operation bei verschachtelten Aufrufen (Abbruch wird vererbt)
+        self.parent_id: Optional[int] = None
+        self._heartbeat_pending = False
+        # Wird bei Ende ODER Deadline gesetzt - weckt den wartenden Aufrufer
+        self.released = threading.Event()
+
+    @property
+    def elapsed(self) -> float:
+        if self._duration is not None:
+            return self._duration
+        return time.monotonic() - self._t0
+
+    @property
+    def active(self) -> bool:
+        return self.status == "running"
+
+    def to_dict(self) -> Dict[str, Any]:
+        remaining = None
+        if self.timeout is not None and self.active:
+            remaining = round(max(0.0, self.timeout - self.elapsed), 2)
+        return {
+            "id": self.op_id,
+            "name": self.name,
+            "owner": self.owner,
+            "status": self.status,
+            "started_at": self.started_at,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "timeout_seconds": self.timeout,
+            "remaining_seconds": remaining,
+            "heartbeat_count": self.heartbeat_count,
+            "cancel_requested": self.token.cancelled,
+            "cancel_reason": self.token.reason,
+            "overflow": self.overflow,
+        }
+
+
+_local = threading.local()
+
+
+def current_operation() -> Optional[SupervisedOperation]:
+    """Die Operation, die im aktuellen Thread laeuft (oder None)."""
+    return getattr(_local, "operation", None)
+
+
+def check_cancelled() -> None:
+    """
+    Kooperativer Abbruchpunkt fuer supervised Funktionen.
+
+    Raises:
+        OperationCancelled: Wenn die aktuelle Operation abgebrochen wurde
+    """
+    op = current_operation()
+    if op is not None:
+        op.token.raise_if_cancelled()
+
+
+def cancellable_sleep(seconds: float) -> None:
+    """
+    Ersatz fuer time.sleep in Retry-/Backoff-Schleifen: innerhalb einer
+    Operation endet das Warten sofort beim Abbruch.
+
+    Raises:
+        OperationCancelled: Wenn die aktuelle Operation abgebrochen wurde
+    """
+    op = current_operation()
+    if op is None:
+        if seconds > 0:
+            time.sleep(seconds)
+        return
+    if seconds > 0:
+        op.token.wait(seconds)
+    op.token.raise_if_cancelled()
+
+
+class OperationSupervisor:
+    """
+    Fuehrt Funktionen auf einem gemeinsamen Pool aus und verwaltet Heartbeats
+    und Deadlines ueber einen einzigen Timer-Thread.
+
+    Args:
+        max_workers: Groesse des gemeinsamen Worker-Pools
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="Supervisor")
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._ops: Dict[int, SupervisedOperation] = {}
+        self._finished: List[SupervisedOperation] = []
+        self._busy_workers = 0
+        self._counters = {"started": 0, "done": 0, "failed": 0, "timeout": 0,
+                          "cancelled": 0, "overflow": 0, "heartbeats": 0}
+        # Timer-Heap: (faellig, seq, op_id, art)
+        self._timers: List[tuple] = []
+        self._timer_seq = itertools.count()
+        self._timer_cond = threading.Condition(self._lock)
+        self._timer_thread: Optional[threading.Thread] = None
+        self._heartbeat_executor = ThreadPoolExecutor(max_workers=HEARTBEAT_OVERFLOW_WORKERS,
+                                                      thread_name_prefix="Supervisor-Heartbeat")
+        self._closed = False
+
+    # =========================================================================
+    # Timer
+    # =========================================================================
+
+    def _schedule(self, delay: float, op_id: int, kind: str) -> None:
+        """Muss mit gehaltenem Lock aufgerufen werden."""
+        heapq.heappush(self._timers, (time.monotonic() + max(0.0, delay),
+                                      next(self._timer_seq), op_id, kind))
+        if self._timer_thread is None or not self._timer_thread.is_alive():
+            self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True,
+                                                  name="Supervisor-Timer")
+            self._timer_thread.start()
+        self._timer_cond.notify()
+
+    def _timer_loop(self) -> None:
+        while True:
+            with self._timer_cond:
+                while not self._closed:
+                    now = time.monotonic()
+                    if self._timers and self._timers[0][0] <= now:
+                        break
+                    timeout = (self._timers[0][0] - now) if self._timers else None
+                    self._timer_cond.wait(timeout)
+                if self._closed:
+                    return
+                _, _, op_id, kind = heapq.heappop(self._timers)
+                op = self._ops.get(op_id)
+            if op is None or not op.active:
+                continue  # Operation bereits beendet → Timer verfaellt
+            if kind == "deadline":
+                self._expire(op)
+            else:
+                self._heartbeat(op)
+
+    def _heartbeat(self, op: SupervisedOperation) -> None:
+        op.heartbeat_count += 1
+        with self._lock:
+            self._counters["heartbeats"] += 1
+            if op.active:
+                self._schedule(op.heartbeat_interval, op.op_id, "heartbeat")
+            # Callback (UI-Log/WebSocket) nicht im Timer-Thread: ein langsamer
+            # Callback wuerde Deadlines und Heartbeats aller Operationen verzoegern.
+            # Haengt der vorige noch, wird dieser Heartbeat nicht zusaetzlich gestapelt.
+            if not op.on_heartbeat or op._heartbeat_pending:
+                return
+            op._heartbeat_pending = True
+            pooled = self._busy_workers < self.max_workers
+            if pooled:
+                self._busy_workers += 1
+        # Voller Pool (z.B. lauter LLM-Aufrufe): kleine Ausweich-Lane statt Thread pro Heartbeat
+        executor = self._executor if pooled else self._heartbeat_executor
+        executor.submit(self._send_heartbeat, op, pooled)
+
+    def _send_heartbeat(self, op: SupervisedOperation, pooled: bool) -> None:
+        try:
+            op.on_heartbeat(op)
+        except Exception:
+            pass  # Heartbeat-Fehler ignorieren
+        finally:
+            with self._lock:
+                op._heartbeat_pending = False
+                if pooled:
+                    self._busy_workers -= 1
+
+    def _expire(self, op: SupervisedOperation) -> None:
+        op.token.cancel("timeout")
+        self._finish(op, "timeout")
+        logger.warning("[Supervisor] %s (%s) nach %.1fs abgelaufen",
+                       op.name, op.owner or "-", op.elapsed)
+
+    # =========================================================================
+    # Lebenszyklus einer Operation
+    # =========================================================================
+
+    def _finish(self, op: SupervisedOperation, status: str) -> None:
+        with self._lock:
+            if not op.active:
+                return
+            op.status = status
+            op.finished_at = time.time()
+            op._duration = time.monotonic() - op._t0
+            self._ops.pop(op.op_id, None)
+            self._finished.append(op)
+            del self._finished[:-FINISHED_HISTORY]
+            self._counters[status] += 1
+        op.released.set()
+
+    def _execute(self, op: SupervisedOperation, func: Callable, args, kwargs,
+                 pooled: bool) -> None:
+        _local.operation = op
+        try:
+            if op.token.cancelled:
+                raise OperationCancelled(op.token.reason or "cancelled")
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            if not op.future.done():
+                op.future.set_exception(e)
+            status = "cancelled" if isinstance(e, OperationCancelled) else "failed"
+            self._finish(op, status)
+        else:
+            if not op.future.done():
+                op.future.set_result(result)
+            self._finish(op, "done")
+        finally:
+            _local.operation = None
+            if pooled:
+                with self._lock:
+                    self._busy_workers -= 1
+
+    def start(self, func: Callable, *args, name: Optional[str] = None,
+              owner: Optional[str] = None, timeout: Optional[float] = None,
+              heartbeat_interval: Optional[float] = None,
+              on_heartbeat: Optional[Callable[[SupervisedOperation], None]] = None,
+              **kwargs) -> SupervisedOperation:
+        """
+        Startet eine Operation im Hintergrund.
+
+        Args:
+            func: Auszufuehrende Funktion (mit *args/**kwargs)
+            name: Anzeigename (Default: Funktionsname)
+            owner: Verantwortlicher Agent (fuer die Live-Sicht)
+            timeout: Deadline in Sekunden (None = keine)
+            heartbeat_interval: Sekunden zwischen on_heartbeat-Aufrufen
+            on_heartbeat: Callback(op) - laeuft im Pool, nie parallel zu sich selbst
+
+        Returns:
+            SupervisedOperation (op.future liefert Ergebnis/Exception)
+        """
+        if self._closed:
+            raise RuntimeError("OperationSupervisor ist beendet")
+        op = SupervisedOperation(
+            next(self._ids), name or getattr(func, "__name__", "operation"), owner,
+            timeout, heartbeat_interval if on_heartbeat else None, on_heartbeat,
+        )
+        parent = current_operation()
+        if parent is not None:
+            op.parent_id = parent.op_id
+            if parent.token.cancelled:
+                op.token.cancel(parent.token.reason or "cancelled")
+        with self._lock:
+            self._ops[op.op_id] = op
+            self._counters["started"] += 1
+            pooled = self._busy_workers < self.max_workers
+            if pooled:
+                self._busy_workers += 1
+            else:
+                op.overflow = True
+                self._counters["overflow"] += 1
+            if timeout is not None:
+                self._schedule(timeout, op.op_id, "deadline")
+            if op.heartbeat_interval:
+                self._schedule(op.heartbeat_interval, op.op_id, "heartbeat")
+        if pooled:
+            self._executor.submit(self._execute, op, func, args, kwargs, True)
+        else:
+            threading.Thread(target=self._execute, args=(op, func, args, kwargs, False),
+                             daemon=True, name=f"Supervisor-Overflow-{op.op_id}").start()
+        return op
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Wie start(), liefert aber direkt das Future (Fire-and-forget)."""
+        return self.start(func, *args, **kwargs).future
+
+    def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Fuehrt eine Operation aus und wartet auf das Ergebnis.
+
+        Raises:
+            TimeoutError: Wenn die Deadline (timeout) vorher abläuft
+            OperationCancelled: Wenn die Operation abgebrochen wurde
+            Exception: Exceptions der Funktion unveraendert
+        """
+        op = self.start(func, *args, **kwargs)
+        op.released.wait()
+        if op.status == "timeout":
+            raise TimeoutError(f"Operation dauerte länger als {op.timeout}s")
+        if op.status == "cancelled" and not op.future.done():
+            raise OperationCancelled(op.token.reason or "cancelled")
+        return op.future.result()
+
+    def cancel(self, op_id: int, reason: str = "cancelled") -> bool:
+        """
+        Bricht eine Operation samt verschachtelter Operationen ab.
+
+        Wartende Aufrufer (run()) werden sofort mit OperationCancelled
+        freigegeben; die Funktion selbst endet am naechsten check_cancelled()
+        bzw. cancellable_sleep() oder regulaer.
+        """
+        with self._lock:
+            op = self._ops.get(op_id)
+            if op is None:
+                return False
+            doomed = [op]
+            for candidate in doomed:
+                doomed.extend(o for o in self._ops.values() if o.parent_id == candidate.op_id)
+        for target in doomed:
+            target.token.cancel(reason)
+            self._finish(target, "cancelled")
+        logger.info("[Supervisor] %s (%s) abgebrochen: %s", op.name, op.owner or "-", reason)
+        return True
+
+    # =========================================================================
+    # Live-Sicht
+    # =========================================================================
+
+    def snapshot(self, include_finished: bool = False) -> List[Dict[str, Any]]:
+        """Laufende (optional auch zuletzt beendete) Operationen."""
+        with self._lock:
+            ops = list(self._ops.values())
+            if include_finished:
+                ops += list(reversed(self._finished))
+        return [op.to_dict() for op in ops]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                "running": len(self._ops),
+                "busy_workers": self._busy_workers,
+                "max_workers": self.max_workers,
+                "pending_timers": len(self._timers),
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._timer_cond:
+            self._closed = True
+            self._timer_cond.notify_all()
+        for op in list(self._ops.values()):
+            op.token.cancel("shutdown")
+        self._executor.shutdown(wait=wait)
+        self._heartbeat_executor.shutdown(wait=wait)
+
+
+_supervisor: Optional[OperationSupervisor] = None
+_supervisor_lock = threading.Lock()
+
+
+def get_supervisor() -> OperationSupervisor:
+    """Prozessweiter Supervisor (Singleton)."""
+    global _supervisor
+    if _supervisor is None:
+        with _supervisor_lock:
+            if _supervisor is None:
+                _supervisor = OperationSupervisor()
+    return _supervisor
@@ -12,6 +12,8 @@ import logging
 import threading
 
 from model_stats_db import get_model_stats_db
+from .prompt_cache import extract_cached_tokens, install_litellm_prompt_cache
+from .llm_cassette import install_litellm_cassette, record_llm_call, response_text
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +78,8 @@ try:
                 prompt_tokens = getattr(usage, 'prompt_tokens', 0)
                 completion_tokens = getattr(usage, 'completion_tokens', 0)
                 model = kwargs.get('model', 'unknown')
+                # AENDERUNG 18.10.2026: Aus dem Provider-Prompt-Cache gelesene Tokens
+                cached_tokens = extract_cached_tokens(usage)
 
                 # Erfasse die Nutzung
                 record = tracker.record_usage(
@@ -83,7 +87,8 @@ try:
                     model=model,
                     prompt_tokens=prompt_tokens,
                     completion_tokens=completion_tokens,
-                    project_id=current_project_id
+                    project_id=current_project_id,
+                    cached_tokens=cached_tokens
                 )
 
                 # AENDERUNG 09.02.2026: ModelStatsDB - Latenz und Kosten in SQLite erfassen
@@ -98,16 +103,27 @@ try:
                         completion_tokens=completion_tokens,
                         cost_usd=record.cost_usd if record else 0.0,
                         latency_ms=latency_ms,
-                        success=True
+                        success=True,
+                        cached_tokens=cached_tokens
                     )
                 except Exception as stats_err:
                     logger.debug("ModelStatsDB.record_call fehlgeschlagen: %s", stats_err)
 
+                # AENDERUNG 18.10.2026: Antwort fuer Benchmark-Replays mitschneiden (nur bei aktiver Kassette)
+                record_llm_call(
+                    "litellm", current_agent_name, model, kwargs.get('messages'),
+                    response_text(completion_response),
+                    latency_ms=(end_time - start_time).total_seconds() * 1000 if start_time and end_time else 0,
+                    usage={"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                           "cached_tokens": cached_tokens}
+                )
+
                 logger.debug(
-                    "_budget_tracking_callback: %s - %s+%s Tokens (Modell: %s, Projekt: %s)",
+                    "_budget_tracking_callback: %s - %s+%s Tokens (%s gecached, Modell: %s, Projekt: %s)",
                     current_agent_name,
                     prompt_tokens,
                     completion_tokens,
+                    cached_tokens,
                     model,
                     current_project_id
                 )
@@ -141,5 +157,11 @@ try:
     litellm.failure_callback = [_failure_tracking_callback]
     logger.info("litellm callbacks: Budget-Tracking + Failure-Tracking registriert (Thread-Safe)")
 
+    # AENDERUNG 18.10.2026: Cache-Breakpoints im Prompt vor jedem completion()-Aufruf
+    # in cache_control-Bloecke uebersetzen (bzw. fuer andere Provider entfernen)
+    install_litellm_prompt_cache(litellm)
+    # AENDERUNG 18.10.2026: Benchmark-Replay aus LLM-Kassetten (aussen, sieht die Original-Nachrichten)
+    install_litellm_cassette(litellm, agent_getter=lambda: _get_current_tracking_context()[0])
+
 except ImportError:
     logger.warning("litellm.success_callback: LiteLLM nicht verfuegbar - Budget-Tracking deaktiviert")
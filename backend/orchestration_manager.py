@@ -61,9 +61,12 @@ _env_loaded_from = _load_env_robust()
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from agents.meta_orchestrator_agent import MetaOrchestratorV2
-from agents.researcher_agent import create_researcher
-from .agent_factory import init_agents
+# AENDERUNG 18.10.2026: Schwere Subsysteme (CrewAI, Agenten, DevLoop,
+# Playwright-/Docker-Tester) werden erst beim ersten Aufruf importiert
+from .lazy_loader import LazyAttr
+MetaOrchestratorV2 = LazyAttr("agents.meta_orchestrator_agent", "MetaOrchestratorV2")
+create_researcher = LazyAttr("agents.researcher_agent", "create_researcher")
+init_agents = LazyAttr("backend.agent_factory", "init_agents")
 from agents.memory_agent import (
     update_memory, update_memory_async, get_lessons_for_prompt, learn_from_error,
     extract_error_pattern, generate_tags_from_context
@@ -76,16 +79,17 @@ from .orchestration_helpers import (
     is_model_unavailable_error, is_rate_limit_error, is_empty_response_error, handle_model_error
 )
 # AENDERUNG 08.02.2026: Fix 24 - Waisen-Check Phase
-from .orchestration_phases import run_waisen_check_phase
-from .dev_loop import DevLoop
+run_waisen_check_phase = LazyAttr("backend.orchestration_phases", "run_waisen_check_phase")
+DevLoop = LazyAttr("backend.dev_loop", "DevLoop")
 from .library_manager import get_library_manager
 from .session_manager import get_session_manager
 from .quality_gate import QualityGate
 from .agent_message import AgentMessage, create_help_needed
 from .documentation_service import DocumentationService
 from .heartbeat_utils import run_with_heartbeat
+from .operation_supervisor import OperationCancelled, check_cancelled
 from file_utils import find_html_file, find_python_entry
-from crewai import Task
+Task = LazyAttr("crewai", "Task")
 
 # AENDERUNG 09.02.2026: ModelStatsDB fuer Run-Tracking (Fix 40)
 from model_stats_db import get_model_stats_db
@@ -97,9 +101,12 @@ from .orchestration_discovery import format_briefing_context
 from .orchestration_worker_status import (
     update_worker_status, handle_worker_status_change, AGENT_NAMES_MAPPING
 )
-from .orchestration_readme import generate_simple_readme, generate_readme_with_agent
+generate_simple_readme = LazyAttr("backend.orchestration_readme", "generate_simple_readme")
+generate_readme_with_agent = LazyAttr("backend.orchestration_readme", "generate_readme_with_agent")
 from .orchestration_help_handler import handle_help_needed_events
-from .orchestration_phases import run_techstack_phase, run_db_designer_phase, run_designer_phase
+run_techstack_phase = LazyAttr("backend.orchestration_phases", "run_techstack_phase")
+run_db_designer_phase = LazyAttr("backend.orchestration_phases", "run_db_designer_phase")
+run_designer_phase = LazyAttr("backend.orchestration_phases", "run_designer_phase")
 
 # AENDERUNG 01.02.2026: External Bureau Integration fuer Augment Context
 try:
@@ -110,7 +117,17 @@ except ImportError:
     logger.debug("ExternalBureauManager nicht verfuegbar")
 
 # AENDERUNG 01.02.2026: Universal Task Derivation System (UTDS)
-from .dev_loop_task_derivation import DevLoopTaskDerivation
+DevLoopTaskDerivation = LazyAttr("backend.dev_loop_task_derivation", "DevLoopTaskDerivation")
+# AENDERUNG 18.10.2026: Datei-basierter Code-Speicher hinter current_code
+from .project_code_store import ProjectCodeStore
+# AENDERUNG 18.10.2026: Spaltenbasierte Run-Telemetrie fuer das Dashboard
+from .run_telemetry import get_run_telemetry
+# AENDERUNG 18.10.2026: Span-Tracing pro Run (kritischer Pfad, Flamegraph)
+from .run_tracer import begin_span, end_span, finish_run_trace, get_tracing_settings, start_run_trace, trace_span
+# AENDERUNG 18.10.2026: LLM-Antworten echter Runs als Benchmark-Kassette mitschneiden
+from .llm_cassette import cassette_active, cassette_path, finish_cassette_recording, get_cassette_settings, start_cassette_recording
+# AENDERUNG 18.10.2026: UI-Log-Senken laufen in einem Hintergrund-Consumer
+from .ui_log_pipeline import UILogPipeline, build_orchestration_sinks
 
 
 class OrchestrationManager:
@@ -152,6 +169,9 @@ class OrchestrationManager:
             }
         )
         self.on_log: Optional[Callable[[str, str, str], None]] = None
+        # AENDERUNG 18.10.2026: _ui_log reiht nur ein, Senken laufen gebuendelt im Consumer
+        self._ui_log_pipeline = UILogPipeline.from_config(
+            self.config, build_orchestration_sinks(AGENT_TO_SESSION_KEY))
 
         # AENDERUNG 13.02.2026: Feature-Tracking DB initialisieren
         self._feature_id_map = {}  # Mapping file_path → feature_id (gesetzt nach Planner)
@@ -210,32 +230,50 @@ class OrchestrationManager:
                 logger.warning(f"External Bureau nicht verfuegbar: {e}")
                 self.external_bureau = None
 
+    # AENDERUNG 18.10.2026: current_code ist eine lazy gerenderte Sicht auf den
+    # ProjectCodeStore. Zuweisungen (String oder Dict) laden den Store; Patches
+    # laufen ueber code_store.apply_patch() ohne den Gesamttext zu kopieren.
+    @property
+    def code_store(self) -> ProjectCodeStore:
+        store = self.__dict__.get("_code_store")
+        if store is None:
+            store = ProjectCodeStore()
+            self.__dict__["_code_store"] = store
+        return store
+
+    @property
+    def current_code(self) -> str:
+        return self.code_store.render()
+
+    @current_code.setter
+    def current_code(self, value) -> None:
+        self.code_store.load_code(value)
+
     def _load_config(self):
         with open(self.config_path, "r", encoding="utf-8") as f:
             return yaml.safe_load(f)
 
     def _ui_log(self, agent: str, event: str, message: str):
-        if self.on_log:
-            self.on_log(agent, event, message)
-        log_event(agent, event, message)
-        try:
-            library = get_library_manager()
-            if library.current_project:
-                library.log_entry(from_agent=agent, to_agent="System", entry_type=event,
-                                  content=message, iteration=getattr(self, '_current_iteration', 0))
-        except Exception:
-            pass
-        try:
-            session_mgr = get_session_manager()
-            session_mgr.add_log(agent, event, message)
-            if event in ("Status", "Working", "Result", "Complete", "Error", "HELP_NEEDED"):
-                agent_lower = agent.lower().replace("-", "").replace(" ", "")
-                session_key = AGENT_TO_SESSION_KEY.get(agent, agent_lower)
-                session_mgr.set_agent_active(session_key, event in ("Status", "Working"))
-                if event == "HELP_NEEDED":
-                    session_mgr.set_agent_blocked(session_key, True, message)
-        except Exception:
-            pass
+        # AENDERUNG 18.10.2026: Nur noch Einreihen auf dem Agent-Thread - WebSocket,
+        # crew_log.jsonl, Telemetrie, Library und Session bedient der Pipeline-Consumer
+        pipeline = getattr(self, "_ui_log_pipeline", None)
+        if pipeline is None:
+            pipeline = UILogPipeline(build_orchestration_sinks(AGENT_TO_SESSION_KEY), threaded=False)
+            self._ui_log_pipeline = pipeline
+        pipeline.submit(agent, event, message, self.on_log, getattr(self, '_current_iteration', 0))
+
+    def _flush_ui_log(self, report_drops: bool = False) -> None:
+        """Wartet bis alle UI-Events in Library/Session angekommen sind (Phasengrenzen)."""
+        pipeline = getattr(self, "_ui_log_pipeline", None)
+        if pipeline is None:
+            return
+        if not pipeline.flush():
+            logger.warning("UI-Log-Pipeline: flush() Timeout (%s Events offen)", pipeline.stats()["queued"])
+        if report_drops:
+            stats = pipeline.stats()
+            if stats["dropped"]:
+                logger.warning("UI-Log-Pipeline: %d Events verworfen (Queue voll): %s",
+                               stats["dropped"], stats["dropped_by_event"])
 
     def _log_help_needed(self, agent: str, reason: str, context: dict = None, action_required: str = "manual_review"):
         project_id = os.path.basename(self.project_path) if self.project_path else None
@@ -305,6 +343,9 @@ class OrchestrationManager:
 
     def _handle_help_needed_events(self, iteration: int) -> Dict[str, Any]:
         """Wrapper für ausgelagerte HELP_NEEDED Handler Funktion."""
+        # AENDERUNG 18.10.2026: HELP_NEEDED setzt den Blockiert-Status erst im
+        # Pipeline-Consumer - vor dem Lesen von get_blocked_agents() abwarten
+        self._flush_ui_log()
         return handle_help_needed_events(
             session_mgr=get_session_manager(),
             project_path=self.project_path,
@@ -495,8 +536,12 @@ class OrchestrationManager:
         self._is_running = True
         # AENDERUNG 22.02.2026: Fix 68a — Stop-Flag zuruecksetzen vor neuem Run
         self._clear_stop()
+        # AENDERUNG 18.10.2026: Telemetrie-Zeitreihe pro Run
+        get_run_telemetry().reset()
         # AENDERUNG 26.02.2026: Claude-Circuit-Breaker pro Run zuruecksetzen
         self.reset_claude_provider_override()
+        _run_span = None
+        _cassette_recording = False
         try:
             self._ui_log("System", "Task Start", f"Goal: {user_goal}")
             # AENDERUNG 10.02.2026: Fix 47 — User-Goal fuer Doc-Enrichment Keyword-Erkennung
@@ -508,6 +553,8 @@ class OrchestrationManager:
             self._custom_project_name = sanitized_name
 
             try:
+                # AENDERUNG 18.10.2026: Offene Events noch dem vorherigen Projekt zuordnen
+                self._flush_ui_log()
                 library = get_library_manager()
                 display_name = sanitized_name or (user_goal[:50] if len(user_goal) > 50 else user_goal)
                 library.start_project(name=display_name, goal=user_goal, briefing=self.discovery_briefing)
@@ -527,6 +574,7 @@ class OrchestrationManager:
                 self._ui_log("Library", "Warning", f"Library-Start fehlgeschlagen: {lib_err}")
 
             try:
+                self._flush_ui_log()
                 session_mgr = get_session_manager()
                 session_mgr.start_session(goal=user_goal, project_id=project_id)
                 session_mgr.update_status("Working")
@@ -539,6 +587,17 @@ class OrchestrationManager:
             # AENDERUNG 09.02.2026: Fix 40c - Konsistente Stats-ID (Library-ID statt ueberschriebener project_id)
             self._stats_project_id = getattr(self, '_stats_run_id', project_id)
 
+            # AENDERUNG 18.10.2026: Trace-Datei pro Run (budget_data/traces/<run_id>.trace.jsonl)
+            if get_tracing_settings(self.config)["enabled"]:
+                start_run_trace(self._stats_project_id or datetime.now().strftime("run_%Y%m%d_%H%M%S"))
+            _run_span = begin_span("run", "run", goal=user_goal[:200])
+            # AENDERUNG 18.10.2026: Kassette pro Run (budget_data/cassettes/<run_id>.cassette.jsonl),
+            # nicht waehrend eines Benchmark-Replays oder einer Harness-Aufnahme
+            if get_cassette_settings(self.config)["record"] and not cassette_active():
+                _cassette_recording = start_cassette_recording(
+                    cassette_path(self._stats_project_id or datetime.now().strftime("run_%Y%m%d_%H%M%S")),
+                    source=user_goal[:200]) is not None
+
             # AENDERUNG 08.02.2026: Globales agent_timeout_seconds entfernt, Pro-Agent-Timeouts aus agent_timeouts Dict
             agent_timeouts = self.config.get("agent_timeouts", {})
             # AENDERUNG 21.02.2026: 3→7 damit alle konfigurierten Modelle + dynamischer Fallback probiert werden
@@ -599,6 +658,7 @@ class OrchestrationManager:
                 return
 
             # 🔎 RESEARCH PHASE
+            _phase_span = begin_span("research")
             if self.is_first_run:
                 # AENDERUNG 08.02.2026: research_timeout_minutes entfernt → agent_timeouts["researcher"]
                 RESEARCH_TIMEOUT_SECONDS = agent_timeouts.get("researcher", 600)
@@ -657,6 +717,12 @@ class OrchestrationManager:
                                 "status": "completed", "model": research_model, "timeout_seconds": RESEARCH_TIMEOUT_SECONDS
                             }, ensure_ascii=False))
                             break
+                        except OperationCancelled as oc:
+                            # AENDERUNG 18.10.2026: Abgebrochene Recherche wird uebersprungen (optional)
+                            self._ui_log("Researcher", "Cancelled", f"Recherche abgebrochen: {oc}")
+                            self._update_worker_status("researcher", "idle")
+                            start_context = ""
+                            break
                         except TimeoutError as te:
                             self._ui_log("Researcher", "Timeout", f"Recherche abgebrochen: {te}")
                             self._update_worker_status("researcher", "idle")
@@ -689,6 +755,8 @@ class OrchestrationManager:
                             }, ensure_ascii=False))
                             break
 
+            end_span(_phase_span)
+
             # AENDERUNG 25.02.2026: Fix 85 — Stop-Check vor Meta-Orchestrator
             if self.is_stop_requested():
                 self._ui_log("System", "Stopped", "Run vor Planner-Phase gestoppt")
@@ -698,6 +766,7 @@ class OrchestrationManager:
             # AENDERUNG 21.02.2026: 3→7 damit alle konfigurierten Modelle + dynamischer Fallback probiert werden
             MAX_META_RETRIES = 7
             plan_data = None
+            _phase_span = begin_span("planner")
             for meta_attempt in range(MAX_META_RETRIES):
                 current_meta_model = self.model_router.get_model("meta_orchestrator") if self.model_router else "unknown"
                 try:
@@ -718,6 +787,7 @@ class OrchestrationManager:
                             continue
                     self._ui_log("Orchestrator", "Error", f"Meta-Orchestrator Fehler: {str(meta_err)[:200]}")
                     raise meta_err
+            end_span(_phase_span)
 
             if not plan_data:
                 self._log_help_needed(agent="Orchestrator", reason="no_orchestration_plan",
@@ -820,11 +890,12 @@ class OrchestrationManager:
 
             # 🔄 DEV LOOP
             dev_loop = DevLoop(self, set_current_agent, run_with_timeout)
-            success, feedback = dev_loop.run(
-                user_goal=user_goal, project_rules=self.project_rules,
-                agent_coder=agent_coder, agent_reviewer=agent_reviewer,
-                agent_tester=agent_tester, agent_security=agent_security, project_id=getattr(self, '_stats_run_id', project_id)
-            )
+            with trace_span("dev_loop"):
+                success, feedback = dev_loop.run(
+                    user_goal=user_goal, project_rules=self.project_rules,
+                    agent_coder=agent_coder, agent_reviewer=agent_reviewer,
+                    agent_tester=agent_tester, agent_security=agent_security, project_id=getattr(self, '_stats_run_id', project_id)
+                )
 
             # ÄNDERUNG 03.02.2026: Entfernt - wird jetzt in dev_loop.py nach erster Iteration gesetzt (Fix 6)
             # self.is_first_run = False
@@ -876,42 +947,52 @@ class OrchestrationManager:
                 except Exception as dc_cleanup_err:
                     logger.warning("Docker-Container-Cleanup: %s", dc_cleanup_err)
                 self._docker_container = None
+            # AENDERUNG 18.10.2026: Run-Span schliessen, offene Spans als unfinished markieren
+            end_span(_run_span)
+            finish_run_trace()
+            if _cassette_recording:
+                finish_cassette_recording()
+            # AENDERUNG 18.10.2026: Alle UI-Events zustellen, Verluste protokollieren
+            self._flush_ui_log(report_drops=True)
 
     def _run_techstack_phase(self, user_goal: str, base_project_rules: dict, project_id: str, agent_timeout: int):
         """TechStack-Analyse Phase (Wrapper für ausgelagerte Funktion)."""
         # AENDERUNG 21.02.2026: Fix 59g — manager durchreichen fuer Claude SDK Integration
-        self.tech_blueprint, self.quality_gate = run_techstack_phase(
-            user_goal=user_goal, base_project_rules=base_project_rules, project_id=project_id,
-            agent_timeout=agent_timeout, config=self.config, model_router=self.model_router,
-            project_path=self.project_path, discovery_briefing=self.discovery_briefing,
-            ui_log_callback=self._ui_log, update_worker_status_callback=self._update_worker_status,
-            manager=self
-        )
+        with trace_span("techstack"):
+            self.tech_blueprint, self.quality_gate = run_techstack_phase(
+                user_goal=user_goal, base_project_rules=base_project_rules, project_id=project_id,
+                agent_timeout=agent_timeout, config=self.config, model_router=self.model_router,
+                project_path=self.project_path, discovery_briefing=self.discovery_briefing,
+                ui_log_callback=self._ui_log, update_worker_status_callback=self._update_worker_status,
+                manager=self
+            )
 
     def _run_db_designer_phase(self, user_goal: str, project_rules: dict, project_id: str, agent_timeout: int):
         """DB-Designer Phase (Wrapper für ausgelagerte Funktion)."""
         # AENDERUNG 21.02.2026: Fix 59g — manager durchreichen fuer Claude SDK Integration
-        self.database_schema = run_db_designer_phase(
-            user_goal=user_goal, project_rules=project_rules, project_id=project_id,
-            agent_timeout=agent_timeout, config=self.config, model_router=self.model_router,
-            tech_blueprint=self.tech_blueprint, quality_gate=getattr(self, 'quality_gate', None),
-            doc_service=getattr(self, 'doc_service', None),
-            ui_log_callback=self._ui_log, update_worker_status_callback=self._update_worker_status,
-            manager=self
-        )
+        with trace_span("database_designer"):
+            self.database_schema = run_db_designer_phase(
+                user_goal=user_goal, project_rules=project_rules, project_id=project_id,
+                agent_timeout=agent_timeout, config=self.config, model_router=self.model_router,
+                tech_blueprint=self.tech_blueprint, quality_gate=getattr(self, 'quality_gate', None),
+                doc_service=getattr(self, 'doc_service', None),
+                ui_log_callback=self._ui_log, update_worker_status_callback=self._update_worker_status,
+                manager=self
+            )
 
     def _run_designer_phase(self, user_goal: str, project_rules: dict, project_id: str, agent_timeout: int):
         """Designer Phase (Wrapper für ausgelagerte Funktion)."""
         # AENDERUNG 21.02.2026: Fix 59g — manager durchreichen fuer Claude SDK Integration
-        self.design_concept = run_designer_phase(
-            user_goal=user_goal, project_rules=project_rules, project_id=project_id,
-            project_path=self.project_path, agent_timeout=agent_timeout, config=self.config,
-            model_router=self.model_router, tech_blueprint=self.tech_blueprint,
-            quality_gate=getattr(self, 'quality_gate', None),
-            doc_service=getattr(self, 'doc_service', None),
-            ui_log_callback=self._ui_log, update_worker_status_callback=self._update_worker_status,
-            manager=self
-        )
+        with trace_span("designer"):
+            self.design_concept = run_designer_phase(
+                user_goal=user_goal, project_rules=project_rules, project_id=project_id,
+                project_path=self.project_path, agent_timeout=agent_timeout, config=self.config,
+                model_router=self.model_router, tech_blueprint=self.tech_blueprint,
+                quality_gate=getattr(self, 'quality_gate', None),
+                doc_service=getattr(self, 'doc_service', None),
+                ui_log_callback=self._ui_log, update_worker_status_callback=self._update_worker_status,
+                manager=self
+            )
 
     def _create_run_bat(self):
         """Erstellt eine intelligente run.bat."""
@@ -956,7 +1037,8 @@ class OrchestrationManager:
             self._ui_log("DependencyAgent", "Status", "Pruefe und installiere Dependencies...")
             # AENDERUNG 09.02.2026: max_duration aus config.yaml lesen (Default: 300s = 5 Min)
             dep_max_duration = dep_config.get("max_duration", 300)
-            dep_result = dep_agent.prepare_for_task(self.tech_blueprint, self.project_path, max_duration=dep_max_duration)
+            with trace_span("dependencies"):
+                dep_result = dep_agent.prepare_for_task(self.tech_blueprint, self.project_path, max_duration=dep_max_duration)
             if dep_result.get("status") == "OK":
                 self._ui_log("DependencyAgent", "DependencyStatus", json.dumps({
                     "status": "ready", "health_score": dep_result.get("inventory", {}).get("health_score", 0)
@@ -1001,6 +1083,7 @@ class OrchestrationManager:
                 }, ensure_ascii=False))
         except Exception as doc_err:
             self._ui_log("DocumentationManager", "Warning", f"Dokumentations-Generierung fehlgeschlagen: {doc_err}")
+        self._flush_ui_log()
         try:
             library = get_library_manager()
             library.complete_project(status="success")
@@ -1025,6 +1108,7 @@ class OrchestrationManager:
         except Exception as stats_err:
             logger.warning("ModelStatsDB.finish_run (failed): %s", stats_err)
 
+        self._flush_ui_log()
         try:
             library = get_library_manager()
             library.complete_project(status="failed")
@@ -1059,6 +1143,7 @@ class OrchestrationManager:
         except Exception as stats_err:
             logger.warning("ModelStatsDB.finish_run (error): %s", stats_err)
 
+        self._flush_ui_log()
         try:
             library = get_library_manager()
             library.complete_project(status="error")
@@ -23,6 +23,7 @@ from .orchestration_helpers import (
     is_model_unavailable_error, is_rate_limit_error, is_empty_response_error, handle_model_error
 )
 from .heartbeat_utils import run_with_heartbeat
+from .operation_supervisor import OperationCancelled, check_cancelled
 from .orchestration_utils import _repair_json, _extract_json_from_text, _infer_blueprint_from_requirements
 from .orchestration_budget import set_current_agent
 from .quality_gate import QualityGate
@@ -141,6 +142,7 @@ def run_techstack_phase(
     for techstack_attempt in range(MAX_TECHSTACK_RETRIES):
         if techstack_result:
             break  # SDK hat bereits Ergebnis geliefert
+        check_cancelled()
         current_techstack_model = model_router.get_model("techstack_architect")
         try:
             agent_techstack = init_agents(config, base_project_rules, router=model_router,
@@ -153,6 +155,8 @@ def run_techstack_phase(
                 heartbeat_interval=15, timeout_seconds=agent_timeout
             )
             break
+        except OperationCancelled:
+            raise  # AENDERUNG 18.10.2026: Abbruch ist kein Modellfehler - kein Retry
         except Exception as ts_error:
             if is_model_unavailable_error(ts_error) or is_rate_limit_error(ts_error) or is_empty_response_error(ts_error):
                 ui_log_callback("TechStack", "Warning", f"Modell {current_techstack_model} nicht verfügbar/leer (Versuch {techstack_attempt + 1}/{MAX_TECHSTACK_RETRIES}), wechsle zu Fallback...")
@@ -326,6 +330,7 @@ def run_db_designer_phase(
     for db_attempt in range(MAX_DB_RETRIES):
         if database_schema:
             break  # SDK hat bereits Ergebnis geliefert
+        check_cancelled()
         current_db_model = model_router.get_model("db_designer")
         try:
             agent_db = init_agents(config, project_rules, router=model_router, include=["db_designer"]).get("db_designer")
@@ -337,6 +342,8 @@ def run_db_designer_phase(
                     heartbeat_interval=15, timeout_seconds=agent_timeout
                 )
                 break
+        except OperationCancelled:
+            raise  # AENDERUNG 18.10.2026: Abbruch ist kein Modellfehler - kein Retry
         except Exception as db_error:
             if is_model_unavailable_error(db_error) or is_rate_limit_error(db_error) or is_empty_response_error(db_error):
                 ui_log_callback("DBDesigner", "Warning", f"Modell {current_db_model} nicht verfügbar/leer (Versuch {db_attempt + 1}/{MAX_DB_RETRIES}), wechsle...")
@@ -454,6 +461,7 @@ def run_designer_phase(
     for design_attempt in range(MAX_DESIGN_RETRIES):
         if design_concept:
             break  # SDK hat bereits Ergebnis geliefert
+        check_cancelled()
         current_design_model = model_router.get_model("designer")
         try:
             agent_des = init_agents(config, project_rules, router=model_router, include=["designer"]).get("designer")
@@ -468,6 +476,8 @@ def run_designer_phase(
                     heartbeat_interval=15, timeout_seconds=agent_timeout
                 )
                 break
+        except OperationCancelled:
+            raise  # AENDERUNG 18.10.2026: Abbruch ist kein Modellfehler - kein Retry
         except Exception as des_error:
             if is_model_unavailable_error(des_error) or is_rate_limit_error(des_error) or is_empty_response_error(des_error):
                 ui_log_callback("Designer", "Warning", f"Modell {current_design_model} nicht verfügbar/leer (Versuch {design_attempt + 1}/{MAX_DESIGN_RETRIES}), wechsle...")
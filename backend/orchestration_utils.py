@@ -13,23 +13,27 @@ Beschreibung: Utility-Funktionen für Orchestration Manager.
 
 import re
 import logging
-import threading
 from typing import Optional, Dict, List
 
 # ÄNDERUNG 02.02.2026: Import UI_TYPE_KEYWORDS für intelligente UI-Typ Erkennung
 from backend.qg_constants import UI_TYPE_KEYWORDS
+from backend.operation_supervisor import get_supervisor
 
 logger = logging.getLogger(__name__)
 
 
-def run_with_timeout(func, timeout_seconds: int = 60):
+def run_with_timeout(func, timeout_seconds: int = 60, owner: Optional[str] = None):
     """
     Führt eine Funktion mit Timeout aus.
     Verhindert endloses Blockieren bei langsamen API-Aufrufen oder Netzwerk-Problemen.
 
+    AENDERUNG 18.10.2026: Laeuft ueber den zentralen OperationSupervisor
+    (gemeinsamer Pool + Deadline im Timer-Thread) statt eines eigenen Threads.
+
     Args:
         func: Die auszuführende Funktion (keine Argumente)
         timeout_seconds: Maximale Ausführungszeit in Sekunden
+        owner: Verantwortlicher Agent (nur fuer die Live-Sicht)
 
     Returns:
         Das Ergebnis der Funktion
@@ -38,30 +42,17 @@ def run_with_timeout(func, timeout_seconds: int = 60):
         TimeoutError: Wenn die Funktion länger als timeout_seconds dauert
         Exception: Wenn die Funktion eine Exception wirft
     """
-    result = [None]
-    exception = [None]
-
-    def target():
-        try:
-            result[0] = func()
-        except Exception as e:
-            exception[0] = e
-            logger.debug("run_with_timeout: Ausnahme in Ziel-Funktion: %s", e, exc_info=True)
-
     logger.info("run_with_timeout: Operation startet (Timeout %ds)", timeout_seconds)
-    thread = threading.Thread(target=target, daemon=True)
-    thread.start()
-    thread.join(timeout=timeout_seconds)
-
-    if thread.is_alive():
-        msg = f"Operation dauerte länger als {timeout_seconds}s"
-        logger.error("[run_with_timeout] - %s", msg)
-        raise TimeoutError(msg)
-    if exception[0]:
-        exc = exception[0]
+    try:
+        return get_supervisor().run(func, name=getattr(func, "__name__", "run_with_timeout"),
+                                    owner=owner, timeout=timeout_seconds)
+    except TimeoutError as exc:
+        logger.error("[run_with_timeout] - %s", exc)
+        raise
+    except Exception as exc:
+        logger.debug("run_with_timeout: Ausnahme in Ziel-Funktion: %s", exc, exc_info=True)
         logger.error("[run_with_timeout] - Unerwarteter Fehler: %s", exc, exc_info=True)
         raise Exception(f"Unerwarteter Fehler in Timeout-Operation: {exc}") from exc
-    return result[0]
 
 
 def _repair_json(text: str) -> str:
@@ -23,6 +23,8 @@ from .file_dependency_graph import (
     analyze_parallelization_potential
 )
 from .dev_loop_helpers import _ensure_test_dependencies, is_forbidden_file
+# AENDERUNG 18.10.2026: Run-Trace-Kontext an die Generator-Threads weitergeben
+from .run_tracer import bind_trace_context
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +60,8 @@ async def generate_single_file_async(
     existing_files: Dict[str, str],
     user_goal: str,
     project_rules: Dict[str, Any],
-    timeout_seconds: int = 750
+    timeout_seconds: int = 750,
+    depends_on: Optional[List[str]] = None
 ) -> Tuple[str, Optional[str], Optional[str]]:
     """
     Generiert eine einzelne Datei asynchron.
@@ -73,6 +76,7 @@ async def generate_single_file_async(
         user_goal: Benutzer-Anforderung
         project_rules: Projekt-Regeln
         timeout_seconds: Timeout pro Datei (Default = agent_timeouts.coder Fallback)
+        depends_on: Abhaengigkeiten aus dem Dependency-Graph (Kontext-Auswahl)
 
     Returns:
         Tuple (filename, content, error) - error ist None bei Erfolg
@@ -83,7 +87,7 @@ async def generate_single_file_async(
     file_task = {
         "path": filename,
         "description": file_description,
-        "depends_on": []
+        "depends_on": list(depends_on or [])
     }
 
     # Fuehre in Thread aus (LLM-Aufruf ist blockierend)
@@ -94,7 +98,7 @@ async def generate_single_file_async(
         result_path, result_content = await asyncio.wait_for(
             loop.run_in_executor(
                 executor,
-                lambda: run_single_file_coder(
+                bind_trace_context(lambda: run_single_file_coder(
                     manager,
                     project_rules,
                     file_task,
@@ -102,7 +106,7 @@ async def generate_single_file_async(
                     user_goal,
                     iteration=0,
                     error_context=None
-                )
+                ))
             ),
             timeout=timeout_seconds
         )
@@ -188,7 +192,9 @@ async def run_parallel_file_generation(
                 existing_files=results.copy(),  # Kontext aus vorherigen Batches
                 user_goal=user_goal,
                 project_rules=project_rules,
-                timeout_seconds=timeout_per_file
+                timeout_seconds=timeout_per_file,
+                # AENDERUNG 18.10.2026: Graph-Abhaengigkeiten steuern die Kontext-Auswahl
+                depends_on=graph[filename].depends_on if filename in graph else None
             )
             tasks.append(task)
 
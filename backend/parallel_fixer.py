@@ -16,6 +16,7 @@ from datetime import datetime
 from crewai import Task, Crew
 
 from backend.error_analyzer import FileError, ErrorAnalyzer
+from backend.prompt_cache import get_prompt_cache_settings
 from agents.fix_agent import (
     create_fix_agent,
     build_fix_prompt,
@@ -238,7 +239,8 @@ class ParallelFixer:
                         error_type=error.error_type,
                         error_message=error.error_message,
                         line_numbers=error.line_numbers,
-                        context_files=context_files
+                        context_files=context_files,
+                        cache_settings=get_prompt_cache_settings(self.config)
                     )
                     sdk_output = run_sdk_with_retry(
                         self.manager, role="fix", prompt=fix_prompt,
@@ -284,7 +286,8 @@ class ParallelFixer:
                 error_type=error.error_type,
                 error_message=error.error_message,
                 line_numbers=error.line_numbers,
-                context_files=context_files
+                context_files=context_files,
+                cache_settings=get_prompt_cache_settings(self.config)
             )
 
             # Crew ausfuehren
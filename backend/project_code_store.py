@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: ProjectCodeStore - Datei-basierte Repraesentation des Projekt-Codes.
+              Ersetzt das mehrfache Zerlegen/Zusammensetzen des ### FILENAME:-Strings
+              (manager.current_code) an verschiedenen Stellen mit leicht
+              unterschiedlichen Regexes:
+              - Ein gemeinsamer Parser fuer alle Marker-Varianten
+              - Pro Datei: Content-Hash, Versionszaehler, Dirty-Flag
+              - Patches in O(geaenderte Dateien) statt Kopie des Gesamttexts
+              - Verkettete Sicht (render) wird lazy erzeugt und gecached;
+                unveraenderte Bloecke werden woertlich uebernommen
+              AENDERUNG 18.10.2026: Zuweisung der eigenen Sicht (current_code =
+              current_code) laedt nicht neu - Dirty-Flags bleiben erhalten.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Marker-Zeile: ### [FILENAME|FILE|PATH|DATEI|PFAD:] pfad[:]
+# Ohne Keyword zaehlt die Zeile nur als Marker wenn der Name pfadartig ist
+# (kein Leerzeichen, enthaelt '.' oder '/') - Markdown-Ueberschriften wie
+# "### Installation" in README-Inhalten bleiben damit Teil der Datei.
+_MARKER_RE = re.compile(
+    r"^###[ \t]*(?P<kw>(?:FILENAME|FILE|PATH|DATEI|PFAD)[ \t]*:)?[ \t]*"
+    r"(?P<name>[^\r\n]*?)[ \t]*:?[ \t]*\r?$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_EXTENSIONLESS_FILES = frozenset({
+    "Dockerfile", "Makefile", "Procfile", "Gemfile", "Rakefile", "LICENSE", "Caddyfile",
+})
+
+
+def _is_marker(match: "re.Match") -> bool:
+    name = match.group("name").strip().rstrip(":")
+    if not name:
+        return False
+    if match.group("kw"):
+        return True
+    if any(ch.isspace() for ch in name):
+        return False
+    return "." in name or "/" in name or name in _EXTENSIONLESS_FILES
+
+
+def _iter_blocks(text: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Liefert (name, marker_start, content_start, block_end) fuer alle Datei-Bloecke.
+    Der Text vor dem ersten Marker (Preamble) gehoert zu keinem Block.
+    """
+    markers = [m for m in _MARKER_RE.finditer(text) if _is_marker(m)]
+    blocks = []
+    for i, m in enumerate(markers):
+        content_start = m.end()
+        if content_start < len(text) and text[content_start] == "\n":
+            content_start += 1
+        block_end = markers[i + 1].start() if i + 1 < len(markers) else len(text)
+        blocks.append((m.group("name").strip().rstrip(":").strip(), m.start(), content_start, block_end))
+    return blocks
+
+
+def split_code_blocks(text: str) -> List[Tuple[str, str]]:
+    """
+    Zerlegt einen Multi-File-String in (dateiname, inhalt)-Paare.
+
+    Inhalte sind gestrippt, Reihenfolge und Duplikate bleiben erhalten.
+    Ohne Marker wird eine leere Liste geliefert.
+    """
+    if not text or "###" not in text:
+        return []
+    return [(name, text[cs:end].strip()) for name, _, cs, end in _iter_blocks(text)]
+
+
+@lru_cache(maxsize=16)
+def _parse_cached(text: str) -> Tuple[Tuple[str, str], ...]:
+    files: Dict[str, str] = {}
+    for name, content in split_code_blocks(text):
+        if name and content:
+            files[name] = content
+    return tuple(files.items())
+
+
+def parse_code_files(text: str) -> Dict[str, str]:
+    """
+    Parst einen Multi-File-String zu {dateiname: inhalt} (leere Dateien entfallen).
+
+    Gecached: derselbe current_code-String wird von Sandbox, Validatoren und
+    Patcher mehrfach pro Iteration geparst.
+    """
+    if not isinstance(text, str) or not text:
+        return {}
+    return dict(_parse_cached(text))
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8", errors="replace")).hexdigest()
+
+
+@dataclass
+class CodeFile:
+    """Eine Datei im Store."""
+    path: str
+    content: str
+    version: int = 1
+    dirty: bool = True
+    # Original-Block (Marker + Inhalt) solange die Datei unveraendert ist
+    raw: Optional[str] = None
+    _hash: Optional[str] = None
+
+    @property
+    def hash(self) -> str:
+        if self._hash is None:
+            self._hash = _content_hash(self.content)
+        return self._hash
+
+    def render(self) -> str:
+        if self.raw is not None:
+            return self.raw if self.raw.endswith("\n") else self.raw + "\n"
+        return f"### FILENAME: {self.path}\n{self.content}\n"
+
+
+class ProjectCodeStore:
+    """
+    Datei-basierter Code-Speicher mit lazy gerenderter ### FILENAME:-Sicht.
+
+    Ein per load_code() gesetzter String wird erst beim ersten strukturierten
+    Zugriff geparst und von render() unveraendert zurueckgegeben, solange
+    keine Datei geaendert wurde.
+    """
+
+    def __init__(self):
+        self._files: Dict[str, CodeFile] = {}
+        self._preamble = ""
+        self._pending_text: Optional[str] = None
+        self._rendered: Optional[str] = ""
+        self.revision = 0
+        self._counters = {"parses": 0, "renders": 0, "patches": 0}
+
+    # =========================================================================
+    # Laden
+    # =========================================================================
+
+    @classmethod
+    def from_code(cls, text: Any) -> "ProjectCodeStore":
+        store = cls()
+        store.load_code(text)
+        return store
+
+    def load_code(self, value: Any) -> None:
+        """
+        Ersetzt den Inhalt durch einen ### FILENAME:-String oder ein Dict.
+
+        Beim spaeteren Parsen werden nur Dateien mit geaendertem Hash als
+        dirty markiert und ihre Version erhoeht.
+        """
+        if isinstance(value, dict):
+            self._ensure_parsed()
+            new_files = {str(k): "" if v is None else str(v) for k, v in value.items()}
+            for path in [p for p in self._files if p not in new_files]:
+                del self._files[path]
+            for path, content in new_files.items():
+                self._set(path, content)
+            self._preamble = ""
+            self._touch()
+            return
+        text = "" if value is None else str(value)
+        if text is self._rendered and self._pending_text is None:
+            return
+        self._pending_text = text
+        self._rendered = text
+        self.revision += 1
+
+    def _ensure_parsed(self) -> None:
+        text = self._pending_text
+        if text is None:
+            return
+        self._pending_text = None
+        self._counters["parses"] += 1
+        blocks = _iter_blocks(text) if "###" in text else []
+        self._preamble = text[:blocks[0][1]] if blocks else text
+        old = self._files
+        self._files = {}
+        for name, start, cs, end in blocks:
+            if not name:
+                continue
+            content = text[cs:end].strip()
+            previous = old.get(name)
+            if previous is not None and previous.content == content:
+                entry = previous
+            else:
+                entry = CodeFile(
+                    path=name, content=content,
+                    version=(previous.version + 1) if previous else 1,
+                )
+            entry.raw = text[start:end]
+            self._files.pop(name, None)
+            self._files[name] = entry
+
+    # =========================================================================
+    # Aenderungen
+    # =========================================================================
+
+    def _set(self, path: str, content: str) -> bool:
+        entry = self._files.get(path)
+        if entry is not None and entry.content == content:
+            return False
+        if entry is None:
+            self._files[path] = CodeFile(path=path, content=content)
+        else:
+            entry.content = content
+            entry.version += 1
+            entry.dirty = True
+            entry.raw = None
+            entry._hash = None
+        return True
+
+    def _touch(self) -> None:
+        self._rendered = None
+        self.revision += 1
+
+    def set_file(self, path: str, content: str) -> bool:
+        """Setzt eine Datei. Returns: True wenn sich der Inhalt geaendert hat."""
+        self._ensure_parsed()
+        changed = self._set(path, content)
+        if changed:
+            self._touch()
+        return changed
+
+    def apply_patch(self, files: Dict[str, str]) -> List[str]:
+        """
+        Uebernimmt geaenderte Dateien (neue werden angehaengt).
+
+        Returns:
+            Pfade deren Inhalt sich tatsaechlich geaendert hat
+        """
+        self._ensure_parsed()
+        self._counters["patches"] += 1
+        changed = [path for path, content in files.items() if self._set(path, content)]
+        if changed:
+            self._touch()
+        return changed
+
+    def remove_file(self, path: str) -> bool:
+        self._ensure_parsed()
+        if self._files.pop(path, None) is None:
+            return False
+        self._touch()
+        return True
+
+    def mark_clean(self, paths: Optional[List[str]] = None) -> None:
+        """Setzt das Dirty-Flag zurueck (z.B. nachdem Dateien geschrieben wurden)."""
+        self._ensure_parsed()
+        for path in (paths if paths is not None else list(self._files)):
+            entry = self._files.get(path)
+            if entry is not None:
+                entry.dirty = False
+
+    # =========================================================================
+    # Lesen
+    # =========================================================================
+
+    def get(self, path: str, default: Optional[str] = None) -> Optional[str]:
+        self._ensure_parsed()
+        entry = self._files.get(path)
+        return entry.content if entry is not None else default
+
+    def __contains__(self, path: str) -> bool:
+        self._ensure_parsed()
+        return path in self._files
+
+    def __len__(self) -> int:
+        self._ensure_parsed()
+        return len(self._files)
+
+    def paths(self) -> List[str]:
+        self._ensure_parsed()
+        return list(self._files)
+
+    def as_dict(self, skip_empty: bool = False) -> Dict[str, str]:
+        self._ensure_parsed()
+        return {p: f.content for p, f in self._files.items() if f.content or not skip_empty}
+
+    def file_info(self, path: str) -> Optional[CodeFile]:
+        self._ensure_parsed()
+        return self._files.get(path)
+
+    def hashes(self) -> Dict[str, str]:
+        self._ensure_parsed()
+        return {p: f.hash for p, f in self._files.items()}
+
+    def dirty_files(self) -> List[str]:
+        self._ensure_parsed()
+        return [p for p, f in self._files.items() if f.dirty]
+
+    def render(self) -> str:
+        """Verkettete ### FILENAME:-Sicht (gecached bis zur naechsten Aenderung)."""
+        if self._rendered is None:
+            self._counters["renders"] += 1
+            parts = [self._preamble] if self._preamble else []
+            for entry in self._files.values():
+                if parts and not parts[-1].endswith("\n"):
+                    parts.append("\n")
+                parts.append(entry.render())
+            self._rendered = "".join(parts)
+        return self._rendered
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def stats(self) -> Dict[str, Any]:
+        self._ensure_parsed()
+        return {
+            "files": len(self._files),
+            "bytes": sum(len(f.content) for f in self._files.values()),
+            "dirty": len(self.dirty_files()),
+            "revision": self.revision,
+            **self._counters,
+        }
+
+
+def get_code_store(manager) -> Optional[ProjectCodeStore]:
+    """
+    Liefert den ProjectCodeStore des Managers oder None.
+
+    None bei Managern ohne Store (z.B. Mocks in Tests) - Aufrufer nutzen
+    dann den String-basierten Weg ueber manager.current_code.
+    """
+    store = getattr(manager, "code_store", None)
+    return store if isinstance(store, ProjectCodeStore) else None
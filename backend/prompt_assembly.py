@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Prompt-Assembly-Engine fuer build_coder_prompt.
+              - PromptAssembler: Prompt als Liste benannter Sektionen statt
+                eines einzigen, immer wieder verlaengerten Strings
+              - SectionCache: memoisierte Sektionen (Lessons, Constraints,
+                Dependency-Versionen, Template-Regeln, Doc-Enrichment), Key
+                ist ein Hash ueber die Eingaben (z.B. mtime der Memory-Datei)
+              - Sektions-Budget: optionale Obergrenzen pro Sektion und
+                priorisiertes Verwerfen vor _truncate_prompt_if_needed
+              - PromptTelemetry: Groesse pro Sektion, Assembly-Zeit, Cache-Hits
+
+              Konfiguration (optional, config.yaml):
+                prompt_section_budgets:
+                  lessons: 6000          # max. Zeichen dieser Sektion
+                  doc_enrichment: 8000
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Reihenfolge in der Sektionen bei Budget-Ueberschreitung komplett entfallen
+# (entspricht Stufe 1 in _truncate_prompt_if_needed, um Doc-Enrichment ergaenzt)
+DROPPABLE_SECTIONS = ("lessons", "env_constraints", "doc_enrichment")
+TRUNCATION_MARKER = "\n[...gekuerzt wegen Sektions-Budget]\n"
+SECTION_CACHE_SIZE = 256
+
+
+def file_signature(path: str) -> Tuple[int, int]:
+    """(mtime_ns, size) einer Datei - (0, 0) wenn sie fehlt."""
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return 0, 0
+
+
+def hash_key(*parts: Any) -> str:
+    """Stabiler Hash ueber beliebige (repr-bare) Eingaben."""
+    return hashlib.sha1(repr(parts).encode("utf-8", "replace")).hexdigest()
+
+
+# =========================================================================
+# Sektions-Cache
+# =========================================================================
+
+class SectionCache:
+    """
+    LRU-Cache fuer Prompt-Sektionen.
+
+    Ein Eintrag gilt nur fuer dieselbe Builder-Funktion (Identitaet), damit
+    ausgetauschte Funktionen (z.B. in Tests) nie alte Werte liefern.
+    """
+
+    def __init__(self, max_entries: int = SECTION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Callable, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, key: str, builder: Callable, *args,
+            cache_empty: bool = True, **kwargs) -> Any:
+        """
+        Wert aus dem Cache oder builder(*args, **kwargs).
+
+        Exceptions werden nie gecached, leere Ergebnisse nur mit cache_empty
+        (z.B. nicht bei Doc-Enrichment, wo "" auch "Dienst nicht erreichbar" heisst).
+        """
+        cache_key = (name, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] is builder:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = builder(*args, **kwargs)
+        if not value and not cache_empty:
+            return value
+        with self._lock:
+            self._entries[cache_key] = (builder, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_section_cache = SectionCache()
+
+
+def get_section_cache() -> SectionCache:
+    return _section_cache
+
+
+# =========================================================================
+# Assembler
+# =========================================================================
+
+class PromptAssembler:
+    """
+    Sammelt einen Prompt in benannten Sektionen.
+
+    Nutzung wie ein String (`asm += "..."`); start(name) beginnt eine neue
+    Sektion. Gleichnamige Sektionen werden in der Statistik zusammengefasst.
+    """
+
+    def __init__(self, role: str = "coder"):
+        self.role = role
+        self._sections: List[List[Any]] = []  # [name, [teile]]
+        self._t0 = time.perf_counter()
+        self.dropped: List[str] = []
+        self.capped: List[str] = []
+        self.start("header")
+
+    def start(self, name: str) -> "PromptAssembler":
+        if self._sections and not self._sections[-1][1]:
+            self._sections[-1][0] = name  # leere Sektion wiederverwenden
+        else:
+            self._sections.append([name, []])
+        return self
+
+    def __iadd__(self, text: str) -> "PromptAssembler":
+        if text:
+            self._sections[-1][1].append(text)
+        return self
+
+    def add(self, name: str, text: str) -> None:
+        """Komplette Sektion anhaengen."""
+        self.start(name)
+        self += text
+
+    def sizes(self) -> "OrderedDict[str, int]":
+        sizes: "OrderedDict[str, int]" = OrderedDict()
+        for name, parts in self._sections:
+            length = sum(len(p) for p in parts)
+            if length:
+                sizes[name] = sizes.get(name, 0) + length
+        return sizes
+
+    def __len__(self) -> int:
+        return sum(self.sizes().values())
+
+    def text(self) -> str:
+        return "".join("".join(parts) for _, parts in self._sections)
+
+    def split_text(self, stable: Iterable[str]) -> Tuple[str, str]:
+        """
+        (praefix, suffix): Sektionen aus stable zuerst, Rest danach.
+
+        Die relative Reihenfolge innerhalb beider Teile bleibt erhalten -
+        Grundlage fuer Provider-Prompt-Caching (siehe prompt_cache.py).
+        """
+        stable = set(stable)
+        prefix = "".join("".join(parts) for name, parts in self._sections if name in stable)
+        suffix = "".join("".join(parts) for name, parts in self._sections if name not in stable)
+        return prefix, suffix
+
+    # ---------------------------------------------------------------------
+    # Budget
+    # ---------------------------------------------------------------------
+
+    def apply_budget(self, max_chars: int,
+                     section_budgets: Optional[Dict[str, int]] = None,
+                     droppable: Iterable[str] = DROPPABLE_SECTIONS) -> None:
+        """
+        Verteilt das Zeichen-Budget auf die Sektionen.
+
+        1. Obergrenzen aus section_budgets (Sektion wird am Ende gekuerzt)
+        2. Ist der Prompt dann noch zu gross, entfallen die Sektionen aus
+           droppable in dieser Reihenfolge - Datei-Inhalte und Feedback
+           kuerzt danach _truncate_prompt_if_needed.
+        """
+        for name, budget in (section_budgets or {}).items():
+            try:
+                budget = int(budget)
+            except (TypeError, ValueError):
+                continue
+            for section in self._sections:
+                if section[0] != name:
+                    continue
+                joined = "".join(section[1])
+                if len(joined) > budget:
+                    keep = max(0, budget - len(TRUNCATION_MARKER))
+                    section[1] = [joined[:keep] + TRUNCATION_MARKER]
+                    self.capped.append(name)
+        for name in droppable:
+            if len(self) <= max_chars:
+                break
+            before = len(self)
+            for section in self._sections:
+                if section[0] == name:
+                    section[1] = []
+            if len(self) < before:
+                self.dropped.append(name)
+                logger.info("Prompt-Budget: Sektion '%s' entfernt (%d Zeichen)", name, before - len(self))
+
+    @property
+    def assembly_ms(self) -> float:
+        return round((time.perf_counter() - self._t0) * 1000, 3)
+
+
+# =========================================================================
+# Telemetrie
+# =========================================================================
+
+class PromptTelemetry:
+    """Aggregierte Groessen pro Sektion und die letzten Prompts."""
+
+    def __init__(self, history: int = 50):
+        self._lock = threading.Lock()
+        self._sections: Dict[str, Dict[str, float]] = {}
+        self._recent: deque = deque(maxlen=history)
+        self.prompts = 0
+
+    def record(self, assembler: PromptAssembler, final_chars: int,
+               iteration: Optional[int] = None) -> Dict[str, Any]:
+        sizes = assembler.sizes()
+        entry = {
+            "role": assembler.role,
+            "iteration": iteration,
+            "timestamp": time.time(),
+            "assembly_ms": assembler.assembly_ms,
+            "sections_chars": dict(sizes),
+            "assembled_chars": sum(sizes.values()),
+            "final_chars": final_chars,
+            "est_tokens": final_chars // 3,
+            "dropped": list(assembler.dropped),
+            "capped": list(assembler.capped),
+        }
+        with self._lock:
+            self.prompts += 1
+            for name, size in sizes.items():
+                agg = self._sections.setdefault(name, {"count": 0, "total_chars": 0, "max_chars": 0})
+                agg["count"] += 1
+                agg["total_chars"] += size
+                agg["max_chars"] = max(agg["max_chars"], size)
+            self._recent.append(entry)
+        return entry
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            sections = {
+                name: {**agg, "avg_chars": round(agg["total_chars"] / agg["count"], 1)}
+                for name, agg in sorted(self._sections.items(),
+                                        key=lambda item: item[1]["total_chars"], reverse=True)
+            }
+            return {
+                "prompts": self.prompts,
+                "sections": sections,
+                "recent": list(self._recent),
+                "cache": _section_cache.stats(),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sections.clear()
+            self._recent.clear()
+            self.prompts = 0
+
+
+_telemetry = PromptTelemetry()
+
+
+def get_prompt_telemetry() -> PromptTelemetry:
+    return _telemetry
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Provider-seitiges Prompt-Caching fuer stabile Prompt-Praefixe.
+              - Layout: stabiler Praefix (Regeln, Tech-Stack, Briefing, Lessons)
+                + variabler Suffix (Feedback, Code, Iterations-Historie),
+                getrennt durch CACHE_BREAKPOINT
+              - LiteLLM: Breakpoint wird vor jedem completion()-Aufruf in
+                cache_control-Bloecke uebersetzt (Anthropic/Claude) bzw.
+                entfernt (Provider mit automatischem Praefix-Caching)
+              - Claude SDK/CLI: Praefix wandert in den System-Prompt, den die
+                CLI automatisch cached
+              - Usage-Auswertung: gecachte Input-Tokens aus den verschiedenen
+                Provider-Formaten fuer ModelStatsDB und BudgetTracker
+
+              Konfiguration (optional, config.yaml):
+                prompt_cache:
+                  enabled: true
+                  min_prefix_chars: 4000   # kuerzere Praefixe cached kein Provider
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_BREAKPOINT = "\n<!-- cache-breakpoint -->\n"
+DEFAULT_MIN_PREFIX_CHARS = 4000
+
+# Sektionen aus build_coder_prompt, die sich zwischen Iterationen nicht aendern
+STABLE_CODER_SECTIONS = (
+    "header", "briefing", "design", "security_basics", "lessons",
+    "env_constraints", "dependency_versions", "doc_enrichment", "unit_tests",
+    "api_tests", "run_bat", "template_rules", "framework_rules",
+    "router_consistency", "file_blacklist", "design_rules",
+)
+
+# Modelle mit expliziten cache_control-Breakpoints (alle anderen cachen
+# Praefixe automatisch oder gar nicht - dort wird nur der Marker entfernt)
+_CACHE_CONTROL_MARKERS = ("anthropic/", "claude")
+
+
+def get_prompt_cache_settings(config: Any) -> Dict[str, Any]:
+    """Liest prompt_cache aus der Config - ohne Eintrag ist das Layout aus."""
+    settings = config.get("prompt_cache") if isinstance(config, dict) else None
+    if not isinstance(settings, dict):
+        settings = {}
+    return {
+        "enabled": bool(settings.get("enabled", False)),
+        "min_prefix_chars": int(settings.get("min_prefix_chars", DEFAULT_MIN_PREFIX_CHARS)),
+    }
+
+
+def join_cacheable(prefix: str, suffix: str, min_prefix_chars: int = DEFAULT_MIN_PREFIX_CHARS) -> str:
+    """Praefix + Breakpoint + Suffix; zu kurze Praefixe bekommen keinen Breakpoint."""
+    if not prefix or not suffix or len(prefix) < min_prefix_chars:
+        return prefix + suffix
+    return prefix + CACHE_BREAKPOINT + suffix
+
+
+def split_cacheable(text: str) -> Tuple[str, str]:
+    """(praefix, suffix) am ersten Breakpoint - ohne Breakpoint ist der Praefix leer."""
+    if not isinstance(text, str) or CACHE_BREAKPOINT not in text:
+        return "", text
+    prefix, suffix = text.split(CACHE_BREAKPOINT, 1)
+    return prefix, suffix.replace(CACHE_BREAKPOINT, "\n")
+
+
+def strip_breakpoints(text: str) -> str:
+    """Entfernt alle Breakpoints (Text bleibt sonst identisch)."""
+    if not isinstance(text, str):
+        return text
+    return text.replace(CACHE_BREAKPOINT, "\n")
+
+
+def supports_cache_control(model: Optional[str]) -> bool:
+    """True fuer Modelle, die explizite cache_control-Bloecke brauchen."""
+    name = (model or "").lower()
+    return any(marker in name for marker in _CACHE_CONTROL_MARKERS)
+
+
+# =========================================================================
+# LiteLLM-Nachrichten
+# =========================================================================
+
+def _cached_block(text: str) -> Dict[str, Any]:
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def apply_cache_breakpoints(messages: Any, model: Optional[str],
+                            min_prefix_chars: int = DEFAULT_MIN_PREFIX_CHARS) -> Any:
+    """
+    Uebersetzt Breakpoints in provider-spezifische Nachrichten.
+
+    Mit cache_control: langer System-Prompt und der Praefix jeder Nachricht
+    mit Breakpoint werden als gecachte Bloecke markiert (Anthropic erlaubt
+    max. 4 Breakpoints). Ohne cache_control wird der Marker nur entfernt.
+    Die Eingabeliste wird nie veraendert.
+    """
+    if not isinstance(messages, list):
+        return messages
+    use_cache_control = supports_cache_control(model)
+    result: List[Any] = []
+    breakpoints = 0
+    for message in messages:
+        content = message.get("content") if isinstance(message, dict) else None
+        if not isinstance(content, str):
+            result.append(message)
+            continue
+        prefix, suffix = split_cacheable(content)
+        if prefix and use_cache_control and breakpoints < 4:
+            blocks = [_cached_block(prefix)]
+            if suffix:
+                blocks.append({"type": "text", "text": suffix})
+            message = {**message, "content": blocks}
+            breakpoints += 1
+        elif prefix:
+            message = {**message, "content": strip_breakpoints(content)}
+        elif (use_cache_control and message.get("role") == "system"
+              and len(content) >= min_prefix_chars and breakpoints < 4):
+            message = {**message, "content": [_cached_block(content)]}
+            breakpoints += 1
+        result.append(message)
+    return result
+
+
+_install_lock = threading.Lock()
+
+
+def install_litellm_prompt_cache(litellm_module: Any,
+                                 min_prefix_chars: int = DEFAULT_MIN_PREFIX_CHARS) -> bool:
+    """
+    Haengt apply_cache_breakpoints vor litellm.completion/acompletion.
+
+    CrewAI und task_deriver rufen litellm.completion ueber das Modul-Attribut
+    auf, dadurch greift das Layout ohne Aenderung an den Agenten. Idempotent.
+    """
+    with _install_lock:
+        if getattr(litellm_module.completion, "_prompt_cache_wrapped", False):
+            return False
+        original_completion = litellm_module.completion
+        original_acompletion = getattr(litellm_module, "acompletion", None)
+
+        def completion(*args, **kwargs):
+            if "messages" in kwargs:
+                kwargs["messages"] = apply_cache_breakpoints(
+                    kwargs["messages"], kwargs.get("model"), min_prefix_chars)
+            return original_completion(*args, **kwargs)
+
+        completion._prompt_cache_wrapped = True
+        litellm_module.completion = completion
+
+        if original_acompletion is not None:
+            async def acompletion(*args, **kwargs):
+                if "messages" in kwargs:
+                    kwargs["messages"] = apply_cache_breakpoints(
+                        kwargs["messages"], kwargs.get("model"), min_prefix_chars)
+                return await original_acompletion(*args, **kwargs)
+
+            acompletion._prompt_cache_wrapped = True
+            litellm_module.acompletion = acompletion
+        return True
+
+
+# =========================================================================
+# Usage-Auswertung
+# =========================================================================
+
+def _field(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _as_int(value: Any) -> int:
+    # Nur echte Zahlen - Mock-/Proxy-Objekte zaehlen als 0
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0
+    return max(0, int(value))
+
+
+def extract_cached_tokens(usage: Any) -> int:
+    """
+    Gecachte (gelesene) Input-Tokens aus einem Usage-Objekt oder -Dict.
+
+    Unterstuetzt prompt_tokens_details.cached_tokens (OpenAI/OpenRouter/LiteLLM)
+    und cache_read_input_tokens (Anthropic, Claude SDK).
+    """
+    details = _field(usage, "prompt_tokens_details")
+    cached = _as_int(_field(details, "cached_tokens"))
+    if not cached:
+        cached = _as_int(_field(usage, "cache_read_input_tokens"))
+    return cached
+
+
+def usage_from_sdk_result(usage: Any) -> Optional[Dict[str, int]]:
+    """
+    Normalisiert die Usage einer Claude-SDK-ResultMessage.
+
+    input_tokens zaehlt bei Anthropic nur den ungecachten Teil - prompt_tokens
+    enthaelt hier wie bei LiteLLM alle Input-Tokens inkl. Cache.
+    """
+    if not usage:
+        return None
+    cache_read = _as_int(_field(usage, "cache_read_input_tokens"))
+    cache_write = _as_int(_field(usage, "cache_creation_input_tokens"))
+    prompt_tokens = _as_int(_field(usage, "input_tokens")) + cache_read + cache_write
+    completion_tokens = _as_int(_field(usage, "output_tokens"))
+    if not prompt_tokens and not completion_tokens:
+        return None
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cached_tokens": cache_read,
+    }
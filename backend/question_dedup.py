@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Inkrementelle Deduplizierung von Discovery-Fragen und parallele
+              Fragen-Generierung.
+              - QuestionIndex: MinHash-Signaturen (64 Permutationen) ueber die
+                normalisierten Woerter einer Frage, LSH-Baender (32 x 2) liefern
+                Kandidaten, die exakte Jaccard-Pruefung (questions_are_similar-
+                Semantik) entscheidet. Jede neue Frage kostet O(Kandidaten)
+                statt O(n) Vergleiche
+              - stream_parallel_questions: alle Agenten gleichzeitig anfragen,
+                Ergebnisse in Ankunftsreihenfolge deduplizieren und pro Agent
+                als Event liefern (Grundlage fuer den NDJSON-Stream)
+              AENDERUNG 18.10.2026: MinHash, Wort-Normalisierung und LSH-Baender
+              nach minhash_utils.py verschoben (auch vom Lesson-Index genutzt).
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from minhash_utils import band_keys, jaccard, minhash, normalized_words
+
+logger = logging.getLogger(__name__)
+
+BAND_ROWS = 2  # 32 Baender: Kandidat ab Jaccard 0.6 mit Wahrscheinlichkeit > 1 - 1e-6
+DEFAULT_THRESHOLD = 0.6
+
+
+def merge_options(target_options: list, source_options: list) -> None:
+    """Fügt einzigartige Optionen zur Zielliste hinzu."""
+    existing_values = {opt.get("value") for opt in target_options}
+    for opt in source_options:
+        if opt.get("value") not in existing_values:
+            target_options.append(opt)
+            existing_values.add(opt.get("value"))
+
+
+class QuestionIndex:
+    """
+    Inkrementeller Fragen-Index mit Gruppen wie deduplicate_questions.
+
+    Eine neue Frage wird der aeltesten Gruppe zugeordnet, deren erste Frage
+    aehnlich ist - gleiches Ergebnis wie der bisherige paarweise Vergleich
+    (ausser bei LSH-Fehltreffern mit Wahrscheinlichkeit < 1e-6), nur ohne O(n^2).
+    """
+
+    def __init__(self, stop_words: Iterable[str] = (), threshold: float = DEFAULT_THRESHOLD):
+        self.stop_words = frozenset(stop_words)
+        self.threshold = threshold
+        self.groups: List[Dict[str, Any]] = []
+        self._tokens: List[Set[str]] = []
+        self._bands: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self.added = 0
+        self.comparisons = 0
+
+    def _find(self, tokens: Set[str], signature: Tuple[int, ...]) -> Optional[int]:
+        candidates = set()
+        for key in band_keys(signature, BAND_ROWS):
+            candidates.update(self._bands.get(key, ()))
+        for index in sorted(candidates):
+            self.comparisons += 1
+            if jaccard(tokens, self._tokens[index]) >= self.threshold:
+                return index
+        return None
+
+    def add(self, question: Dict[str, Any], agent: str) -> Tuple[Dict[str, Any], bool]:
+        """Fuegt eine Frage hinzu; (Gruppe, True wenn in bestehende Gruppe gemergt)."""
+        self.added += 1
+        text = question.get("question", "")
+        tokens = normalized_words(text, self.stop_words)
+        signature = minhash(tokens)
+        index = self._find(tokens, signature) if tokens else None
+        if index is not None:
+            group = self.groups[index]
+            if agent not in group["agents"]:
+                group["agents"].append(agent)
+            merge_options(group["options"], question.get("options", []))
+            if not group["example"] and question.get("example"):
+                group["example"] = question["example"]
+            return group, True
+
+        group = {
+            "id": question.get("id", f"q_{self.added - 1}"),
+            "question": text,
+            "example": question.get("example"),
+            "options": list(question.get("options", [])),
+            "allowCustom": question.get("allowCustom", True),
+            "agents": [agent],
+        }
+        index = len(self.groups)
+        self.groups.append(group)
+        self._tokens.append(tokens)
+        if tokens:
+            for key in band_keys(signature, BAND_ROWS):
+                self._bands.setdefault(key, []).append(index)
+        return group, False
+
+
+AgentQuestionsFn = Callable[..., Awaitable[Dict[str, Any]]]
+
+
+async def stream_parallel_questions(agents: List[str], vision: str,
+                                    generate: AgentQuestionsFn,
+                                    index: QuestionIndex) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Fragt alle Agenten gleichzeitig an und liefert pro Antwort ein Event.
+
+    Event: {"type": "questions", "agent", "questions": [neue Gruppen],
+    "merged": [{"id", "agent"}], "original": Anzahl}. Fehler einzelner Agenten
+    liefern ein Event mit leerer Liste und "error".
+    """
+    async def run(agent: str):
+        try:
+            return agent, await generate(agent=agent, vision=vision, already_asked=[]), None
+        except Exception as e:
+            return agent, None, e
+
+    tasks = [asyncio.ensure_future(run(agent)) for agent in agents]
+    try:
+        for future in asyncio.as_completed(tasks):
+            agent, result, error = await future
+            event: Dict[str, Any] = {"type": "questions", "agent": agent,
+                                     "questions": [], "merged": [], "original": 0}
+            if error is not None:
+                event["error"] = str(error)
+                yield event
+                continue
+            for question in (result or {}).get("questions", []) or []:
+                if not isinstance(question, dict):
+                    continue
+                event["original"] += 1
+                group, merged = index.add(question, agent)
+                if merged:
+                    event["merged"].append({"id": group["id"], "agent": agent})
+                else:
+                    event["questions"].append(group)
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
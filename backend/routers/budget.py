@@ -230,3 +230,19 @@ def get_project(project_id: str):
         "remaining": round(project.total_budget - project_costs, 2),
         "percentage_used": round((project_costs / project.total_budget) * 100, 1) if project.total_budget > 0 else 0
     }
+
+
+# AENDERUNG 18.10.2026: Prompt-Groessen pro Sektion (Prompt-Bloat sichtbar machen)
+@router.get("/budget/prompt-sections")
+def get_prompt_sections():
+    """Groessen-Telemetrie der Coder-Prompts: Zeichen pro Sektion, Assembly-Zeit, Cache-Hits."""
+    from ..prompt_assembly import get_prompt_telemetry
+    return get_prompt_telemetry().summary()
+
+
+# AENDERUNG 18.10.2026: Agent-Pool (Wiederverwendung, Konstruktionszeit pro Rolle)
+@router.get("/budget/agent-pool")
+def get_agent_pool_stats():
+    """Hits/Misses und Konstruktionszeit des Agent-Pools."""
+    from ..agent_pool import get_agent_pool
+    return get_agent_pool().stats()
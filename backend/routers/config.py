@@ -10,12 +10,12 @@ Beschreibung: Konfigurations- und Modell-Endpoints.
 import os
 import sys
 import yaml
-import aiohttp
 import logging
 from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from ..app_state import manager, DEFAULT_MAX_RETRIES
+from ..http_client import get_http_client
 
 try:
     from ruamel.yaml import YAML
@@ -356,15 +356,15 @@ async def fetch_openrouter_models():
             raise ValueError("Kein API-Key gefunden")
 
         # ÄNDERUNG 29.01.2026: Async HTTP für non-blocking WebSocket-Stabilität
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://openrouter.ai/api/v1/models",
-                headers={"Authorization": f"Bearer {api_key}"},
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                models = data.get("data", [])
+        # AENDERUNG 18.10.2026: Geteilter HTTP-Client (Keep-Alive-Pool, Retries)
+        response = await get_http_client().aget(
+            "https://openrouter.ai/api/v1/models",
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+        models = data.get("data", [])
 
         free_models = []
         paid_models = []
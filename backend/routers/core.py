@@ -16,6 +16,7 @@ from pydantic import BaseModel
 from ..app_state import manager, ws_manager, limiter, WS_RECEIVE_TIMEOUT, WS_MAX_TIMEOUTS
 from ..api_logging import log_event
 from ..session_utils import get_session_manager_instance
+from ..run_scheduler import get_run_scheduler
 
 router = APIRouter()
 
@@ -31,6 +32,20 @@ class TaskRequest(BaseModel):
 async def run_agent_task(request: Request, task_request: TaskRequest, background_tasks: BackgroundTasks):
     print(f"Received /run request for goal: {task_request.goal}")
 
+    # AENDERUNG 18.10.2026: Mit aktivem Run-Scheduler wird ein weiterer Run
+    # eingereiht bzw. isoliert parallel gestartet statt mit 409 abgelehnt
+    scheduler = get_run_scheduler()
+    if scheduler is not None:
+        job = await asyncio.to_thread(scheduler.submit, task_request.goal, task_request.project_name)
+        return {
+            "status": "started" if job["status"] == "running" else "queued",
+            "goal": task_request.goal,
+            "run_id": job["run_id"],
+            "position": job.get("position"),
+            "eta_seconds": job.get("eta_start_seconds"),
+            "blocked_reason": job.get("blocked_reason"),
+        }
+
     # AENDERUNG 22.02.2026: Fix 68c — Nur einen Run gleichzeitig erlauben
     # AENDERUNG 25.02.2026: Fix 85 — Doppelter Check: Session-Status UND _is_running Flag
     # ROOT-CAUSE-FIX:
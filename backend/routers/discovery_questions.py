@@ -2,10 +2,12 @@
 """
 Author: rahn
 Datum: 01.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Discovery Fragen-Generierung.
               Extrahiert aus discovery.py (Regel 1: Max 500 Zeilen)
               Enthält: generate_discovery_questions, Deduplizierung, LLM-Integration
+              AENDERUNG 18.10.2026: Paralleler Modus mit MinHash-Dedup und
+                                    NDJSON-Stream pro Agent (question_dedup.py)
 """
 
 import os
@@ -17,10 +19,13 @@ import logging
 import aiohttp
 from typing import List
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ..app_state import manager
 from ..api_logging import log_event
+# AENDERUNG 18.10.2026: Inkrementeller Fragen-Index statt paarweisem Vergleich
+from ..question_dedup import QuestionIndex, merge_options, stream_parallel_questions
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -71,12 +76,25 @@ class DiscoveryQuestionsRequest(BaseModel):
     """Request für dynamische Fragen-Generierung."""
     vision: str
     agents: list
+    # AENDERUNG 18.10.2026: Alle Agenten gleichzeitig anfragen (ohne Vorwissen der anderen)
+    parallel: bool = False
 
 
 # =========================================================================
 # Hilfs-Funktionen
 # =========================================================================
 
+def sort_agents_by_priority(agents: list) -> list:
+    """Sortiert Agenten nach AGENT_QUESTION_PRIORITY (unbekannte am Ende)."""
+    def get_priority(agent_name: str) -> int:
+        try:
+            return AGENT_QUESTION_PRIORITY.index(agent_name)
+        except ValueError:
+            return 99  # Unbekannte Agenten am Ende
+
+    return sorted(agents, key=get_priority)
+
+
 async def generate_agent_questions(agent: str, vision: str, already_asked: List[str] = None) -> dict:
     """
     Generiert kundenfreundliche Fragen für einen Agent via LLM.
@@ -254,65 +272,27 @@ def questions_are_similar(q1: str, q2: str, threshold: float = 0.6) -> bool:
     return similarity >= threshold
 
 
-def merge_options(target_options: list, source_options: list) -> None:
-    """Fügt einzigartige Optionen zur Zielliste hinzu."""
-    existing_values = {opt.get("value") for opt in target_options}
-    for opt in source_options:
-        if opt.get("value") not in existing_values:
-            target_options.append(opt)
-            existing_values.add(opt.get("value"))
-
-
 def deduplicate_questions(all_agent_questions: list) -> list:
     """
     Gruppiert ähnliche Fragen von verschiedenen Agenten.
     Jede Frage wird nur einmal gestellt, aber alle relevanten Agenten zugeordnet.
+
+    AENDERUNG 18.10.2026: QuestionIndex (MinHash-Kandidaten + exakte Jaccard-
+    Pruefung) statt O(n²) paarweisem questions_are_similar - gleiche Gruppen.
     """
-    all_questions = []
+    index = QuestionIndex(stop_words=STOP_WORDS)
     for agent_data in all_agent_questions:
         agent = agent_data.get("agent", "Unknown")
         for q in agent_data.get("questions", []):
-            q_copy = q.copy()
-            q_copy["source_agent"] = agent
-            all_questions.append(q_copy)
+            index.add(q, agent)
 
-    if not all_questions:
+    merged = index.groups
+    if not index.added:
         return []
 
-    merged = []
-    used_indices = set()
-
-    for i, q1 in enumerate(all_questions):
-        if i in used_indices:
-            continue
-
-        group = {
-            "id": q1.get("id", f"q_{i}"),
-            "question": q1.get("question", ""),
-            "example": q1.get("example"),
-            "options": list(q1.get("options", [])),
-            "allowCustom": q1.get("allowCustom", True),
-            "agents": [q1["source_agent"]]
-        }
-        used_indices.add(i)
-
-        for j, q2 in enumerate(all_questions):
-            if j in used_indices:
-                continue
-
-            if questions_are_similar(q1.get("question", ""), q2.get("question", "")):
-                if q2["source_agent"] not in group["agents"]:
-                    group["agents"].append(q2["source_agent"])
-                merge_options(group["options"], q2.get("options", []))
-                if not group["example"] and q2.get("example"):
-                    group["example"] = q2["example"]
-                used_indices.add(j)
-
-        merged.append(group)
-
     log_event("Discovery", "Deduplicate",
-              f"{len(all_questions)} Fragen → {len(merged)} dedupliziert "
-              f"({len(all_questions) - len(merged)} zusammengeführt)")
+              f"{index.added} Fragen → {len(merged)} dedupliziert "
+              f"({index.added - len(merged)} zusammengeführt)")
 
     return merged
 
@@ -341,15 +321,14 @@ async def generate_discovery_questions(request: DiscoveryQuestionsRequest):
         raise HTTPException(status_code=400, detail="Keine Agenten angegeben")
 
     # Sortiere Agenten nach Priorität
-    def get_priority(agent_name: str) -> int:
-        try:
-            return AGENT_QUESTION_PRIORITY.index(agent_name)
-        except ValueError:
-            return 99  # Unbekannte Agenten am Ende
-
-    agents_sorted = sorted(agents, key=get_priority)
+    agents_sorted = sort_agents_by_priority(agents)
     log_event("Discovery", "AgentOrder", f"Fragen-Reihenfolge: {agents_sorted}")
 
+    # AENDERUNG 18.10.2026: Paralleler Modus - Latenz eines einzelnen LLM-Calls
+    if request.parallel:
+        events = [event async for event in _parallel_events(agents_sorted, vision)]
+        return events[-1]["result"]
+
     all_questions = []
     already_asked_questions = []  # Sammelt alle bisherigen Fragen
 
@@ -401,3 +380,57 @@ async def generate_discovery_questions(request: DiscoveryQuestionsRequest):
         "questions_merged": original_count - len(deduplicated),
         "generation_mode": "sequential_with_context"
     }
+
+
+# =========================================================================
+# Paralleler Modus (AENDERUNG 18.10.2026)
+# =========================================================================
+
+async def _parallel_events(agents_sorted: list, vision: str):
+    """Events pro Agent (Ankunftsreihenfolge), zuletzt {"type": "done", "result": ...}."""
+    agents_to_ask = [a for a in agents_sorted if a not in SKIP_QUESTION_AGENTS]
+    index = QuestionIndex(stop_words=STOP_WORDS)
+    processed = 0
+    async for event in stream_parallel_questions(agents_to_ask, vision, generate_agent_questions, index):
+        if event["original"]:
+            processed += 1
+        log_event("Discovery", "AgentQuestions",
+                  f"{event['agent']}: {event['original']} Fragen, "
+                  f"{len(event['merged'])} zusammengeführt (parallel)")
+        yield event
+
+    original_count = index.added
+    log_event("Discovery", "Summary",
+              f"Parallele Generation: {original_count} → {len(index.groups)} "
+              f"({original_count - len(index.groups)} zusammengeführt, "
+              f"{index.comparisons} Vergleiche)")
+    yield {"type": "done", "result": {
+        "status": "ok",
+        "questions": index.groups,
+        "agents_processed": processed,
+        "questions_original": original_count,
+        "questions_deduplicated": len(index.groups),
+        "questions_merged": original_count - len(index.groups),
+        "generation_mode": "parallel_minhash"
+    }}
+
+
+@router.post("/discovery/generate-questions/stream")
+async def stream_discovery_questions(request: DiscoveryQuestionsRequest):
+    """
+    Paralleler Modus als NDJSON-Stream: eine Zeile pro Agent, sobald seine
+    Fragen da sind ("questions": neue, "merged": in bestehende Fragen
+    zusammengeführt), zuletzt eine "done"-Zeile mit dem Gesamtergebnis.
+    """
+    if not request.vision or not request.vision.strip():
+        raise HTTPException(status_code=400, detail="Vision/Projektbeschreibung fehlt")
+    if not request.agents:
+        raise HTTPException(status_code=400, detail="Keine Agenten angegeben")
+
+    agents_sorted = sort_agents_by_priority(request.agents)
+
+    async def body():
+        async for event in _parallel_events(agents_sorted, request.vision):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
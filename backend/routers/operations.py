@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Live-Sicht auf die vom OperationSupervisor ueberwachten Operationen
+              (laufende Heartbeat-/Timeout-Operationen mit Laufzeit und Agent).
+"""
+# AENDERUNG 18.10.2026: Endpoints fuer backend/operation_supervisor.py
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ..operation_supervisor import get_supervisor
+
+router = APIRouter()
+
+
+@router.get("/operations")
+async def get_operations(include_finished: bool = Query(False)):
+    """Laufende Operationen (optional inkl. der zuletzt beendeten) und Zaehler."""
+    supervisor = get_supervisor()
+    return {
+        "operations": supervisor.snapshot(include_finished=include_finished),
+        "stats": supervisor.stats(),
+    }
+
+
+@router.post("/operations/{op_id}/cancel")
+async def cancel_operation(op_id: int):
+    """Fordert den kooperativen Abbruch einer laufenden Operation an."""
+    if not get_supervisor().cancel(op_id, reason="cancelled via API"):
+        raise HTTPException(status_code=404, detail=f"Operation {op_id} laeuft nicht")
+    return {"status": "cancel_requested", "id": op_id}
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Run-Warteschlange: Runs einreihen, Position/ETA abfragen, abbrechen.
+              Ausfuehrung und Admission-Control in backend/run_scheduler.py.
+"""
+# AENDERUNG 18.10.2026: Endpoints fuer backend/run_scheduler.py
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Optional
+
+import yaml
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel, Field
+
+from ..app_state import manager, ws_manager, limiter
+from ..run_scheduler import InProcessSlot, RunScheduler, get_run_scheduler
+from ..session_utils import get_session_manager_instance
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "config.yaml")
+
+
+class RunSubmitRequest(BaseModel):
+    goal: str
+    project_name: Optional[str] = None
+    priority: int = Field(0, ge=-10, le=10)
+
+
+def _load_config() -> dict:
+    """config.yaml direkt lesen - der OrchestrationManager wird dafuer nicht erzeugt."""
+    try:
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning("run_scheduler: config.yaml nicht lesbar: %s", e)
+        return {}
+
+
+def make_broadcast(loop: asyncio.AbstractEventLoop, in_process_run: Optional[dict] = None):
+    """
+    UI-Callback (Signatur wie manager.on_log) mit Run-ID im WebSocket-Payload.
+    "isolation" markiert Worker-Runs - die UI zeigt ohne verfolgten Run nur den
+    Run im Server-Prozess (in_process_run["run_id"]) an.
+    """
+    in_process_run = in_process_run if in_process_run is not None else {}
+
+    def broadcast(run_id: Optional[str], agent: str, event: str, message: str):
+        payload = {
+            "agent": agent,
+            "event": event,
+            "message": message,
+            "timestamp": str(datetime.now()),
+        }
+        if run_id:
+            payload["run_id"] = run_id
+            payload["isolation"] = "inprocess" if run_id == in_process_run.get("run_id") else "process"
+        asyncio.run_coroutine_threadsafe(ws_manager.broadcast(json.dumps(payload, ensure_ascii=False)), loop)
+    return broadcast
+
+
+def _manager_busy() -> bool:
+    session_mgr = get_session_manager_instance()
+    return bool(getattr(manager, "_is_running", False) or (session_mgr and session_mgr.is_active()))
+
+
+def start_scheduler(loop: asyncio.AbstractEventLoop) -> Optional[RunScheduler]:
+    """Erzeugt und startet den Scheduler (Lifespan); None wenn deaktiviert."""
+    in_process_run = {"run_id": None}
+    broadcast = make_broadcast(loop, in_process_run)
+
+    def run_in_process(job):
+        # Der Slot im Server-Prozess nutzt den globalen Manager (Session, /status, Reset)
+        in_process_run["run_id"] = job["run_id"]
+        manager.on_log = lambda agent, event, message: broadcast(job["run_id"], agent, event, message)
+        manager.run_task(job["goal"], job.get("project_name"))
+
+    scheduler = get_run_scheduler(
+        _load_config(),
+        in_process=InProcessSlot(run=run_in_process, busy=_manager_busy, stop=lambda: manager.stop()),
+        on_event=broadcast,
+    )
+    if scheduler is not None:
+        scheduler.start()
+        logger.info("Run-Scheduler gestartet (max_concurrent=%s)", scheduler.settings["max_concurrent"])
+    return scheduler
+
+
+def _scheduler() -> RunScheduler:
+    scheduler = get_run_scheduler()
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="Run-Scheduler ist deaktiviert (run_scheduler.enabled)")
+    return scheduler
+
+
+@router.post("/runs")
+@limiter.limit("10/minute")
+async def submit_run(request: Request, body: RunSubmitRequest):
+    """Reiht einen Run ein; startet sofort, wenn Slot und Admission-Control es erlauben."""
+    job = await asyncio.to_thread(_scheduler().submit, body.goal, body.project_name, body.priority)
+    return job
+
+
+@router.get("/runs")
+def list_runs(history: int = Query(20, ge=0, le=200)):
+    """Laufende und wartende Runs (Position, ETA, Blockier-Grund) plus die letzten beendeten."""
+    scheduler = _scheduler()
+    snapshot = scheduler.snapshot()
+    snapshot["finished"] = [j for j in scheduler.queue.list_jobs(limit=history)
+                            if j["status"] not in ("queued", "running")]
+    return snapshot
+
+
+@router.get("/runs/{run_id}")
+def get_run(run_id: str):
+    job = _scheduler().describe(run_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Run {run_id} nicht gefunden")
+    return job
+
+
+@router.delete("/runs/{run_id}")
+def cancel_run(run_id: str):
+    """Entfernt einen wartenden Run bzw. stoppt einen laufenden."""
+    result = _scheduler().cancel(run_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Run {run_id} ist nicht aktiv")
+    return {"run_id": run_id, "status": result}
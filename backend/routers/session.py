@@ -7,7 +7,9 @@ Beschreibung: Session-Management Endpunkte.
 """
 # ÄNDERUNG 29.01.2026: Session-Endpunkte in eigenes Router-Modul verschoben
 
-from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from ..library_manager import get_library_manager
 from ..session_utils import get_session_manager_instance
@@ -15,14 +17,30 @@ from ..session_utils import get_session_manager_instance
 router = APIRouter()
 
 
+# AENDERUNG 18.10.2026: ETag/304 - Browser revalidieren mit If-None-Match statt neu zu laden
+_REVALIDATE_HEADERS = {"Cache-Control": "no-cache"}
+
+
+def _not_modified(request: Request, etag) -> Optional[Response]:
+    """304-Antwort wenn der Client diesen State-Stand bereits hat."""
+    if not isinstance(etag, str):
+        return None
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers={"ETag": etag, **_REVALIDATE_HEADERS})
+    return None
+
+
 @router.get("/session/current")
-def get_current_session():
+def get_current_session(request: Request, response: Response):
     """
     Gibt den aktuellen Session-Status zurueck.
     Wird vom Frontend nach Refresh/Reconnect aufgerufen.
 
+    AENDERUNG 18.10.2026: ETag aus epoch/seq - unveraenderter State liefert 304
+    ohne erneute Serialisierung. Fuer Polling: GET /session/changes?since=<seq>.
+
     Returns:
-        Kompletter Session-State mit goal, status, logs, agent_data
+        Kompletter Session-State mit goal, status, logs, agent_data, epoch, seq
     """
     session_mgr = get_session_manager_instance()
     if not session_mgr:
@@ -40,17 +58,57 @@ def get_current_session():
             "is_active": False
         }
 
-    return session_mgr.get_current_state()
+    if request.headers.get("if-none-match"):
+        not_modified = _not_modified(request, session_mgr.etag())
+        if not_modified is not None:
+            return not_modified
+
+    state = session_mgr.get_current_state()
+    if "epoch" in state and "seq" in state:
+        response.headers["ETag"] = f'W/"{state["epoch"]}-{state["seq"]}"'
+        response.headers.update(_REVALIDATE_HEADERS)
+    return state
+
+
+# AENDERUNG 18.10.2026: Delta-Abfrage fuer Dashboards (nur Aenderungen seit seq)
+@router.get("/session/changes")
+def get_session_changes(
+    request: Request,
+    since: int = Query(0, ge=0, description="Zuletzt gesehene seq"),
+    epoch: Optional[str] = Query(None, description="epoch aus der letzten Antwort"),
+    log_limit: int = Query(200, ge=1, le=500)
+):
+    """
+    Aenderungen seit der State-Version since: geaenderte Session-Felder,
+    geaenderte Agent-Snapshots und neue Logs.
+
+    Ist kein Delta moeglich (Server-Neustart, Session-Reset), enthaelt die
+    Antwort den kompletten State mit full=true. Ohne Aenderung: 304.
+    """
+    session_mgr = get_session_manager_instance()
+    if not session_mgr:
+        return {"epoch": None, "seq": 0, "full": True, "session": None, "agent_data": {}, "logs": []}
+
+    if epoch is not None and epoch == session_mgr.epoch and since == session_mgr.seq:
+        return Response(status_code=304, headers={"ETag": session_mgr.etag(), **_REVALIDATE_HEADERS})
+    return session_mgr.get_changes(since, epoch=epoch, log_limit=log_limit)
 
 
 @router.get("/session/logs")
-def get_session_logs(limit: int = Query(100, ge=1, le=500), offset: int = Query(0, ge=0)):
+def get_session_logs(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    before: Optional[int] = Query(None, ge=0, description="Cursor: Logs aelter als diese seq"),
+    after: Optional[int] = Query(None, ge=0, description="Cursor: Logs neuer als diese seq")
+):
     """
     Gibt die letzten N Logs zurueck.
 
     Args:
         limit: Maximale Anzahl Logs (1-500)
         offset: Start-Offset
+        before/after: AENDERUNG 18.10.2026 - Cursor-Paging ueber die Log-seq;
+                      Antwort enthaelt has_more und die Cursor der naechsten Seite
 
     Returns:
         Liste von Log-Eintraegen
@@ -59,6 +117,9 @@ def get_session_logs(limit: int = Query(100, ge=1, le=500), offset: int = Query(
     if not session_mgr:
         return {"logs": [], "total": 0}
 
+    if before is not None or after is not None:
+        return session_mgr.get_logs_page(limit=limit, before=before, after=after)
+
     # ÄNDERUNG 29.01.2026: Atomare Logs + Total aus SessionManager
     logs, total = session_mgr.get_logs(limit=limit, offset=offset)
     return {"logs": logs, "total": total}
@@ -165,3 +226,22 @@ def get_session_status():
         "iteration": session_mgr.current_session.get("iteration", 0),
         "project_id": session_mgr.current_session.get("project_id")
     }
+
+
+# AENDERUNG 18.10.2026: Run-Telemetrie als Zeitreihe (Charts, Reconnect ohne Verlauf-Verlust)
+@router.get("/session/telemetry")
+def get_session_telemetry(
+    start: Optional[float] = Query(None, description="Unix-Zeitstempel (inklusive)"),
+    end: Optional[float] = Query(None, description="Unix-Zeitstempel (inklusive)"),
+    metrics: Optional[str] = Query(None, description="Komma-getrennt, z.B. active_workers,files_done"),
+    max_points: int = Query(500, ge=10, le=5000)
+):
+    """
+    Zeitreihe der Run-Telemetrie (aktive Worker, Tokens/min, fertige Dateien, Queue-Tiefe).
+
+    Aeltere Daten liegen in groeberer Aufloesung vor; resolution_s nennt die
+    groebste Stufe im Ergebnis.
+    """
+    from ..run_telemetry import get_run_telemetry
+    names = [m.strip() for m in metrics.split(",") if m.strip()] if metrics else None
+    return get_run_telemetry().query(start=start, end=end, metrics=names, max_points=max_points)
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Startup-Profil-Endpoint (Phasen-Zeiten, Import-Baum, Lazy-Status).
+"""
+# AENDERUNG 18.10.2026: Diagnose fuer Cold-Start-Zeiten des Servers
+
+from fastapi import APIRouter, Query
+
+from ..app_state import manager
+from ..lazy_loader import is_loaded
+from ..startup_profiler import get_startup_profiler
+
+router = APIRouter()
+
+
+@router.get("/startup/profile")
+async def get_startup_profile(
+    top: int = Query(20, ge=1, le=500),
+    min_ms: float = Query(1.0, ge=0.0),
+    tree: bool = Query(True),
+):
+    """
+    Liefert das Startup-Profil des laufenden Servers.
+
+    Der Import-Baum ist nur gefuellt wenn der Server mit PROFILE_STARTUP=1
+    (oder ueber python -m backend.startup_profiler --serve) gestartet wurde.
+    Der Aufruf erzeugt den OrchestrationManager nicht.
+    """
+    profile = get_startup_profiler().report(top=top, min_ms=min_ms, include_tree=tree)
+    profile["manager_loaded"] = is_loaded(manager)
+    return profile
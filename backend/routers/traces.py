@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Run-Traces: Liste, Critical-Path-Report und Flamegraph-Export
+              (Folded-Stacks bzw. Chrome-Trace) fuer backend/run_tracer.py.
+"""
+# AENDERUNG 18.10.2026: Endpoints fuer backend/trace_report.py
+
+import os
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from ..run_tracer import get_active_tracer, trace_path
+from ..trace_report import build_report, list_traces, load_trace, to_chrome_trace, to_folded
+
+router = APIRouter()
+
+
+@router.get("/traces")
+def get_traces():
+    """Vorhandene Run-Traces (neueste zuerst) und der gerade laufende Run."""
+    active = get_active_tracer()
+    return {"traces": list_traces(), "active_run_id": active.run_id if active else None}
+
+
+@router.get("/traces/{run_id}")
+def get_trace_report(
+    run_id: str,
+    format: str = Query("report", pattern="^(report|folded|chrome)$"),
+    top: int = Query(15, ge=1, le=200),
+):
+    """
+    Report zum Run: kritischer Pfad und Zeit je Kategorie.
+
+    format=folded liefert Folded-Stacks (flamegraph.pl, speedscope),
+    format=chrome das Chrome-Trace-JSON (chrome://tracing, Perfetto).
+    Beim laufenden Run werden die bisher geschriebenen Spans ausgewertet.
+    """
+    active = get_active_tracer()
+    if active is not None and active.run_id == run_id:
+        active.flush()
+    # trace_path bereinigt die Run-ID - nur Dateien im Trace-Verzeichnis
+    path = trace_path(run_id)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail=f"Kein Trace fuer Run {run_id}")
+    meta, spans = load_trace(path)
+    if format == "folded":
+        return PlainTextResponse(to_folded(spans))
+    if format == "chrome":
+        return to_chrome_trace(spans, meta)
+    return build_report(meta, spans, top=top)
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Persistente Prioritaets-Warteschlange fuer Runs (POST /run, /runs).
+              Folgt dem Pattern von feature_tracking_db.py (WAL-Mode, Thread-local,
+              Singleton). Ausgefuehrt werden die Eintraege von backend/run_scheduler.py.
+
+              Status-Flow: queued → running → done | failed
+                           queued → cancelled
+                           running → interrupted (Server-Neustart waehrend des Runs)
+"""
+
+import os
+import sqlite3
+import logging
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Singleton-Instance
+_instance = None
+_instance_lock = threading.Lock()
+
+DB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "budget_data")
+DB_PATH = os.path.join(DB_DIR, "run_queue.db")
+
+ACTIVE_STATUSES = ("queued", "running")
+FINAL_STATUSES = ("done", "failed", "cancelled", "interrupted")
+
+
+class RunQueueDB:
+    """SQLite-Warteschlange: hoehere Prioritaet zuerst, bei Gleichstand FIFO."""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or DB_PATH
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._local = threading.local()
+        self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Thread-lokale Connection (SQLite ist nicht thread-safe)."""
+        if not hasattr(self._local, 'conn') or self._local.conn is None:
+            self._local.conn = sqlite3.connect(self.db_path, timeout=10)
+            self._local.conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn.row_factory = sqlite3.Row
+        return self._local.conn
+
+    def _init_db(self):
+        """Erstellt Schema falls nicht vorhanden."""
+        conn = self._get_conn()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS run_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT UNIQUE NOT NULL,
+                goal TEXT NOT NULL,
+                project_name TEXT,
+                priority INTEGER DEFAULT 0,
+                provider TEXT,
+                status TEXT DEFAULT 'queued',
+                blocked_reason TEXT,
+                isolation TEXT,
+                submitted_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                duration_seconds REAL,
+                error TEXT
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_run_jobs_status ON run_jobs(status, priority, id);
+        """)
+        conn.commit()
+
+    @staticmethod
+    def _row(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        return dict(row) if row is not None else None
+
+    def enqueue(self, goal: str, project_name: Optional[str] = None, priority: int = 0,
+                provider: Optional[str] = None) -> Dict[str, Any]:
+        """Neuer Eintrag mit Status queued."""
+        run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        conn = self._get_conn()
+        conn.execute(
+            "INSERT INTO run_jobs (run_id, goal, project_name, priority, provider, submitted_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (run_id, goal, project_name, int(priority), provider, datetime.now().isoformat()))
+        conn.commit()
+        return self.get(run_id)
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        return self._row(self._get_conn().execute(
+            "SELECT * FROM run_jobs WHERE run_id = ?", (run_id,)).fetchone())
+
+    def queued(self) -> List[Dict[str, Any]]:
+        """Wartende Runs in Ausfuehrungs-Reihenfolge."""
+        rows = self._get_conn().execute(
+            "SELECT * FROM run_jobs WHERE status = 'queued' ORDER BY priority DESC, id ASC").fetchall()
+        return [dict(r) for r in rows]
+
+    def running(self) -> List[Dict[str, Any]]:
+        rows = self._get_conn().execute(
+            "SELECT * FROM run_jobs WHERE status = 'running' ORDER BY started_at").fetchall()
+        return [dict(r) for r in rows]
+
+    def list_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Aktive Runs plus die zuletzt beendeten (neueste zuerst)."""
+        rows = self._get_conn().execute(
+            "SELECT * FROM run_jobs WHERE status IN ('queued', 'running') "
+            "UNION ALL SELECT * FROM (SELECT * FROM run_jobs WHERE status NOT IN ('queued', 'running') "
+            "ORDER BY id DESC LIMIT ?)", (limit,)).fetchall()
+        return [dict(r) for r in rows]
+
+    def mark_running(self, run_id: str, isolation: str) -> bool:
+        conn = self._get_conn()
+        cur = conn.execute(
+            "UPDATE run_jobs SET status = 'running', isolation = ?, started_at = ?, blocked_reason = NULL "
+            "WHERE run_id = ? AND status = 'queued'", (isolation, datetime.now().isoformat(), run_id))
+        conn.commit()
+        return cur.rowcount > 0
+
+    def mark_finished(self, run_id: str, status: str, error: Optional[str] = None) -> None:
+        job = self.get(run_id)
+        if not job:
+            return
+        now = datetime.now()
+        duration = None
+        if job.get("started_at"):
+            duration = (now - datetime.fromisoformat(job["started_at"])).total_seconds()
+        conn = self._get_conn()
+        conn.execute(
+            "UPDATE run_jobs SET status = ?, finished_at = ?, duration_seconds = ?, error = ? "
+            "WHERE run_id = ?", (status, now.isoformat(), duration, (error or None) and error[:1000], run_id))
+        conn.commit()
+
+    def set_blocked(self, run_id: str, reason: Optional[str]) -> None:
+        conn = self._get_conn()
+        conn.execute("UPDATE run_jobs SET blocked_reason = ? WHERE run_id = ? AND status = 'queued'",
+                     (reason, run_id))
+        conn.commit()
+
+    def cancel(self, run_id: str) -> bool:
+        """Entfernt einen wartenden Run aus der Warteschlange."""
+        conn = self._get_conn()
+        cur = conn.execute(
+            "UPDATE run_jobs SET status = 'cancelled', finished_at = ? WHERE run_id = ? AND status = 'queued'",
+            (datetime.now().isoformat(), run_id))
+        conn.commit()
+        return cur.rowcount > 0
+
+    def recover_interrupted(self) -> int:
+        """Beim Start: Runs mit Status running gehoeren zu einem beendeten Server-Prozess."""
+        conn = self._get_conn()
+        cur = conn.execute(
+            "UPDATE run_jobs SET status = 'interrupted', finished_at = ?, "
+            "error = 'Server-Neustart waehrend des Runs' WHERE status = 'running'",
+            (datetime.now().isoformat(),))
+        conn.commit()
+        if cur.rowcount:
+            logger.warning("RunQueueDB: %d unterbrochene Runs markiert", cur.rowcount)
+        return cur.rowcount
+
+    def recent_durations(self, limit: int = 20) -> List[float]:
+        """Laufzeiten der letzten erfolgreichen Runs (Sekunden) fuer die ETA."""
+        rows = self._get_conn().execute(
+            "SELECT duration_seconds FROM run_jobs WHERE status = 'done' AND duration_seconds > 0 "
+            "ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [r["duration_seconds"] for r in rows]
+
+
+def get_run_queue_db(db_path: str = None) -> RunQueueDB:
+    """Singleton-Zugriff auf die Run-Warteschlange."""
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                _instance = RunQueueDB(db_path)
+    return _instance
@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Run-Scheduler mit Admission-Control fuer parallele Runs.
+              Bisher lehnte POST /run jeden weiteren Run mit 409 ab, solange der
+              globale OrchestrationManager beschaeftigt war. Der Scheduler nimmt Runs
+              in die persistente Warteschlange (backend/run_queue.py) auf und fuehrt
+              bis zu max_concurrent gleichzeitig aus:
+              - ein Slot im Server-Prozess auf dem globalen Manager (volle UI wie
+                bisher: Session, Status, Reset), jeder weitere Run isoliert in einem
+                eigenen Worker-Prozess (backend/run_worker.py)
+              - Admission-Control vor jedem Start: Restbudget gegen die BudgetTracker-
+                Caps, Kapazitaet pro LLM-Provider, CPU-Last und freier Speicher
+              - Warteposition und ETA (aus den Laufzeiten der letzten Runs) fuer Clients
+
+              Konfiguration (config.yaml):
+                run_scheduler:
+                  enabled: true
+                  max_concurrent: 2
+                  provider_capacity: {claude_sdk: 2, openrouter: 3}
+                  max_load_per_cpu: 1.5
+                  min_free_memory_mb: 1024
+                  port_stride: 100
+              AENDERUNG 18.10.2026: Jeder Worker-Run bekommt einen freien Slot und
+              damit den Host-Port-Versatz slot * port_stride (Projekt-Container).
+"""
+
+import heapq
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .run_queue import RunQueueDB, get_run_queue_db
+from .run_worker import parse_event
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUN_LOG_DIR = os.path.join(BASE_DIR, "budget_data", "run_logs")
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "enabled": True,
+    "max_concurrent": 2,
+    "provider_capacity": {"claude_sdk": 2, "openrouter": 3},
+    "max_load_per_cpu": 1.5,
+    "min_free_memory_mb": 1024,
+    "default_run_seconds": 1800,
+    "default_run_cost_usd": 1.0,
+    "poll_seconds": 15,
+    "port_stride": 100,
+}
+
+
+def get_scheduler_settings(config: Any) -> Dict[str, Any]:
+    """Liest run_scheduler aus der Config (ohne dict-Config: aus, /run wie bisher)."""
+    settings = dict(DEFAULT_SETTINGS)
+    if not isinstance(config, dict):
+        settings["enabled"] = False
+        return settings
+    raw = config.get("run_scheduler", {}) or {}
+    for key, default in DEFAULT_SETTINGS.items():
+        value = raw.get(key, default)
+        if isinstance(default, dict):
+            settings[key] = {**default, **(value or {})}
+        elif isinstance(default, bool):
+            settings[key] = bool(value)
+        else:
+            try:
+                settings[key] = type(default)(value)
+            except (TypeError, ValueError):
+                settings[key] = default
+    settings["max_concurrent"] = max(1, settings["max_concurrent"])
+    return settings
+
+
+def run_provider(config: Any) -> str:
+    """Primaerer LLM-Provider eines Runs (Claude SDK falls aktiv, sonst OpenRouter)."""
+    if isinstance(config, dict) and (config.get("claude_sdk") or {}).get("enabled", False):
+        return "claude_sdk"
+    return "openrouter"
+
+
+# =========================================================================
+# Admission-Control
+# =========================================================================
+
+def budget_headroom_usd() -> Optional[float]:
+    """
+    Freies Budget bis zur engeren Grenze (Tages- oder Monats-Cap, 30 Tage wie
+    get_stats). None wenn kein BudgetTracker verfuegbar oder auto_pause aus ist.
+    Liest die Historie direkt - get_stats() fragt zusaetzlich OpenRouter ab -
+    und laedt sie bei jeder Pruefung neu, damit Ausgaben der Worker-Prozesse zaehlen.
+    """
+    try:
+        from budget_tracker import get_budget_tracker
+        tracker = get_budget_tracker()
+    except Exception as e:
+        logger.debug("BudgetTracker nicht verfuegbar: %s", e)
+        return None
+    cfg = tracker.config
+    if not getattr(cfg, "auto_pause", True):
+        return None
+    now = datetime.now()
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    cutoff = now - timedelta(days=30)
+    spent_today = spent_period = 0.0
+    for record in tracker.reload_usage_history():
+        try:
+            ts = datetime.fromisoformat(record.timestamp)
+        except (TypeError, ValueError):
+            continue
+        if ts > cutoff:
+            spent_period += record.cost_usd
+            if ts > today_start:
+                spent_today += record.cost_usd
+    return min(cfg.global_daily_cap - spent_today, cfg.global_monthly_cap - spent_period)
+
+
+def estimate_run_cost_usd(default: float) -> float:
+    """Mittlere Kosten der letzten abgeschlossenen Runs (ModelStatsDB), sonst default."""
+    try:
+        from model_stats_db import get_model_stats_db
+        runs = get_model_stats_db().get_run_summary(limit=20)
+    except Exception:
+        return default
+    costs = [r["total_cost_usd"] for r in runs if r.get("finished_at") and (r.get("total_cost_usd") or 0) > 0]
+    return statistics.mean(costs) if costs else default
+
+
+def host_load_per_cpu() -> Optional[float]:
+    try:
+        return os.getloadavg()[0] / max(1, os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+def host_free_memory_mb() -> Optional[float]:
+    try:
+        with open("/proc/meminfo", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class AdmissionController:
+    """
+    Entscheidet, ob ein wartender Run jetzt starten darf.
+
+    Liefert (zugelassen, Grund, Bereich). Bereich "global" blockiert alle
+    nachfolgenden Runs (Budget, Host), "provider" nur Runs desselben Providers.
+    """
+
+    def __init__(self, settings: Dict[str, Any],
+                 budget_headroom: Callable[[], Optional[float]] = budget_headroom_usd,
+                 run_cost: Optional[Callable[[], float]] = None,
+                 load_per_cpu: Callable[[], Optional[float]] = host_load_per_cpu,
+                 free_memory_mb: Callable[[], Optional[float]] = host_free_memory_mb):
+        self.settings = settings
+        self._budget_headroom = budget_headroom
+        self._run_cost = run_cost or (lambda: estimate_run_cost_usd(settings["default_run_cost_usd"]))
+        self._load_per_cpu = load_per_cpu
+        self._free_memory_mb = free_memory_mb
+
+    def check(self, job: Dict[str, Any], running: List[Dict[str, Any]]) -> Tuple[bool, Optional[str], str]:
+        headroom = self._budget_headroom()
+        if headroom is not None:
+            cost = self._run_cost()
+            reserved = cost * (len(running) + 1)
+            if headroom < reserved:
+                return (False, f"Budget: {max(0.0, headroom):.2f} USD frei, "
+                               f"{len(running) + 1} Runs a ~{cost:.2f} USD benoetigt", "global")
+
+        # Host-Grenzen nur neben laufenden Runs - ein einzelner Run startet immer
+        if running:
+            load = self._load_per_cpu()
+            if load is not None and load > self.settings["max_load_per_cpu"]:
+                return False, f"CPU-Last {load:.2f} pro Kern > {self.settings['max_load_per_cpu']}", "global"
+            free_mb = self._free_memory_mb()
+            if free_mb is not None and free_mb < self.settings["min_free_memory_mb"]:
+                return False, f"Freier Speicher {free_mb:.0f} MB < {self.settings['min_free_memory_mb']} MB", "global"
+
+        provider = job.get("provider") or "openrouter"
+        capacity = self.settings["provider_capacity"].get(provider)
+        if capacity is not None:
+            active = sum(1 for r in running if (r.get("provider") or "openrouter") == provider)
+            if active >= int(capacity):
+                return False, f"Provider {provider}: {active}/{capacity} Runs aktiv", "provider"
+        return True, None, ""
+
+
+def estimate_start_times(running_elapsed: List[float], queued: int, slots: int,
+                         run_seconds: float) -> List[float]:
+    """Geschaetzte Startzeit (Sekunden ab jetzt) je wartendem Run in Reihenfolge."""
+    free = sorted(max(run_seconds - elapsed, run_seconds * 0.1) for elapsed in running_elapsed)
+    free += [0.0] * max(0, slots - len(free))
+    heapq.heapify(free)
+    starts = []
+    for _ in range(queued):
+        start = heapq.heappop(free)
+        starts.append(start)
+        heapq.heappush(free, start + run_seconds)
+    return starts
+
+
+# =========================================================================
+# Ausfuehrung
+# =========================================================================
+
+class InProcessSlot:
+    """Run im Server-Prozess auf dem globalen OrchestrationManager (volle UI)."""
+
+    def __init__(self, run: Callable[[Dict[str, Any]], None], busy: Callable[[], bool],
+                 stop: Callable[[], None]):
+        self.run = run
+        self.busy = busy
+        self.stop = stop
+
+
+class _RunHandle:
+    __slots__ = ("job", "isolation", "started", "process", "stop_requested", "slot")
+
+    def __init__(self, job: Dict[str, Any], isolation: str, slot: int = 0):
+        self.job = job
+        self.isolation = isolation
+        self.started = time.monotonic()
+        self.process: Optional[subprocess.Popen] = None
+        self.stop_requested = False
+        # 0 = Server-Prozess; Worker belegen 1..n (Port-Versatz slot * port_stride)
+        self.slot = slot
+
+
+def _worker_command(job: Dict[str, Any]) -> List[str]:
+    cmd = [sys.executable, "-m", "backend.run_worker", "--run-id", job["run_id"], "--goal", job["goal"]]
+    if job.get("project_name"):
+        cmd += ["--project-name", job["project_name"]]
+    if job.get("port_offset"):
+        cmd += ["--port-offset", str(job["port_offset"])]
+    return cmd
+
+
+class RunScheduler:
+    """Fuehrt Runs aus der Warteschlange aus (Hintergrund-Thread, Wecken bei Submit/Ende)."""
+
+    def __init__(self, queue: RunQueueDB, settings: Dict[str, Any], provider: str = "openrouter",
+                 admission: Optional[AdmissionController] = None,
+                 in_process: Optional[InProcessSlot] = None,
+                 on_event: Optional[Callable[[str, str, str, str], None]] = None,
+                 worker_command: Callable[[Dict[str, Any]], List[str]] = _worker_command,
+                 log_dir: str = RUN_LOG_DIR):
+        self.queue = queue
+        self.settings = settings
+        self.provider = provider
+        self.admission = admission or AdmissionController(settings)
+        self.in_process = in_process
+        self.on_event = on_event
+        self._worker_command = worker_command
+        self._log_dir = log_dir
+        self._running: Dict[str, _RunHandle] = {}
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ----------------------------------------------------------------- API
+
+    def start(self) -> None:
+        """Startet den Scheduler-Thread (wartende Runs aus der DB laufen weiter)."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if not self._running:
+                self.queue.recover_interrupted()
+        self._thread = threading.Thread(target=self._loop, name="run-scheduler", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def submit(self, goal: str, project_name: Optional[str] = None, priority: int = 0) -> Dict[str, Any]:
+        """Nimmt einen Run auf und startet ihn sofort, wenn Slot und Admission es erlauben."""
+        job = self.queue.enqueue(goal, project_name, priority, provider=self.provider)
+        self._emit(job["run_id"], "Scheduler", "RunQueued", goal[:200])
+        self.tick()
+        return self.describe(job["run_id"])
+
+    def cancel(self, run_id: str) -> Optional[str]:
+        """'cancelled' (wartend), 'stopping' (laufend) oder None (unbekannt/beendet)."""
+        if self.queue.cancel(run_id):
+            self._emit(run_id, "Scheduler", "RunCancelled", "Aus der Warteschlange entfernt")
+            self._wake.set()
+            return "cancelled"
+        with self._lock:
+            handle = self._running.get(run_id)
+            if handle is None:
+                return None
+            handle.stop_requested = True
+            if handle.process is not None:
+                handle.process.terminate()
+            elif self.in_process is not None:
+                self.in_process.stop()
+        return "stopping"
+
+    def describe(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Ein Run mit Warteposition und ETA (falls wartend)."""
+        for entry in self.snapshot()["queued"]:
+            if entry["run_id"] == run_id:
+                return entry
+        job = self.queue.get(run_id)
+        if job and job["status"] == "running":
+            with self._lock:
+                handle = self._running.get(run_id)
+            job["elapsed_seconds"] = round(time.monotonic() - handle.started, 1) if handle else None
+        return job
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Laufende und wartende Runs mit Position, ETA und Blockier-Grund."""
+        run_seconds = self.estimated_run_seconds()
+        with self._lock:
+            running = [(h.job, time.monotonic() - h.started, h.isolation) for h in self._running.values()]
+        queued = self.queue.queued()
+        starts = estimate_start_times([elapsed for _, elapsed, _ in running], len(queued),
+                                      self.settings["max_concurrent"], run_seconds)
+        queued_view = []
+        for position, (job, start) in enumerate(zip(queued, starts), 1):
+            queued_view.append({**job, "position": position, "eta_start_seconds": round(start),
+                                "eta_finish_seconds": round(start + run_seconds)})
+        return {
+            "max_concurrent": self.settings["max_concurrent"],
+            "estimated_run_seconds": round(run_seconds),
+            "running": [{**job, "isolation": isolation, "elapsed_seconds": round(elapsed, 1),
+                         "eta_finish_seconds": round(max(run_seconds - elapsed, 0))}
+                        for job, elapsed, isolation in running],
+            "queued": queued_view,
+        }
+
+    def estimated_run_seconds(self) -> float:
+        durations = self.queue.recent_durations()
+        return statistics.median(durations) if durations else float(self.settings["default_run_seconds"])
+
+    # --------------------------------------------------------- Scheduling
+
+    def tick(self) -> List[str]:
+        """Startet zugelassene Runs bis max_concurrent; liefert die gestarteten IDs."""
+        started = []
+        with self._lock:
+            free = self.settings["max_concurrent"] - len(self._running)
+            blocked_providers = set()
+            for job in self.queue.queued():
+                if free <= 0:
+                    break
+                if (job.get("provider") or "openrouter") in blocked_providers:
+                    continue
+                running = [h.job for h in self._running.values()]
+                ok, reason, scope = self.admission.check(job, running)
+                if not ok:
+                    if reason != job.get("blocked_reason"):
+                        self.queue.set_blocked(job["run_id"], reason)
+                        self._emit(job["run_id"], "Scheduler", "RunBlocked", reason)
+                    if scope == "global":
+                        break
+                    blocked_providers.add(job.get("provider") or "openrouter")
+                    continue
+                if self._start(job):
+                    started.append(job["run_id"])
+                    free -= 1
+        return started
+
+    def _loop(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                logger.warning("RunScheduler: Fehler im Scheduling: %s", e)
+            self._wake.wait(self.settings["poll_seconds"])
+            self._wake.clear()
+
+    def _start(self, job: Dict[str, Any]) -> bool:
+        in_process_free = (self.in_process is not None
+                           and not any(h.isolation == "inprocess" for h in self._running.values())
+                           and not self.in_process.busy())
+        isolation = "inprocess" if in_process_free else "process"
+        if not self.queue.mark_running(job["run_id"], isolation):
+            return False
+        job = self.queue.get(job["run_id"])
+        slot = 0
+        if isolation == "process":
+            used = {h.slot for h in self._running.values()}
+            slot = next(s for s in range(1, len(used) + 2) if s not in used)
+            job["port_offset"] = slot * self.settings["port_stride"]
+        handle = _RunHandle(job, isolation, slot)
+        self._running[job["run_id"]] = handle
+        self._emit(job["run_id"], "Scheduler", "RunStarted", isolation)
+        try:
+            if isolation == "inprocess":
+                threading.Thread(target=self._run_in_process, args=(handle,),
+                                 name=f"run-{job['run_id']}", daemon=True).start()
+            else:
+                self._launch_process(handle)
+        except Exception as e:
+            self._finished(job["run_id"], "failed", f"Start fehlgeschlagen: {e}")
+        return True
+
+    def _run_in_process(self, handle: _RunHandle) -> None:
+        status, error = "done", None
+        try:
+            self.in_process.run(handle.job)
+        except Exception as e:
+            status, error = "failed", f"{type(e).__name__}: {e}"
+        if handle.stop_requested and status == "done":
+            status = "cancelled"
+        self._finished(handle.job["run_id"], status, error)
+
+    def _launch_process(self, handle: _RunHandle) -> None:
+        run_id = handle.job["run_id"]
+        os.makedirs(self._log_dir, exist_ok=True)
+        log_path = os.path.join(self._log_dir, f"{run_id}.log")
+        handle.process = subprocess.Popen(
+            self._worker_command(handle.job), cwd=BASE_DIR, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True, encoding="utf-8", errors="replace", bufsize=1)
+
+        def pump():
+            with open(log_path, "a", encoding="utf-8") as log:
+                for line in handle.process.stdout:
+                    event = parse_event(line.rstrip("\n"))
+                    if event is not None:
+                        self._emit(run_id, event.get("agent", "System"), event.get("event", ""),
+                                   event.get("message", ""))
+                    else:
+                        log.write(line)
+            code = handle.process.wait()
+            if code == 0:
+                self._finished(run_id, "done", None)
+            else:
+                self._finished(run_id, "cancelled" if handle.stop_requested else "failed",
+                               f"Worker-Exit {code} (Log: {log_path})")
+
+        threading.Thread(target=pump, name=f"run-{run_id}", daemon=True).start()
+
+    def _finished(self, run_id: str, status: str, error: Optional[str]) -> None:
+        self.queue.mark_finished(run_id, status, error)
+        with self._lock:
+            self._running.pop(run_id, None)
+        self._emit(run_id, "Scheduler", "RunFinished", status if not error else f"{status}: {error}")
+        self._wake.set()
+
+    def _emit(self, run_id: str, agent: str, event: str, message: str) -> None:
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(run_id, agent, event, message)
+        except Exception as e:
+            logger.debug("RunScheduler: Event-Callback fehlgeschlagen: %s", e)
+
+
+# Singleton-Instance
+_instance: Optional[RunScheduler] = None
+_instance_lock = threading.Lock()
+
+
+def get_run_scheduler(config: Any = None, **kwargs) -> Optional[RunScheduler]:
+    """Scheduler-Singleton (None wenn run_scheduler in der Config deaktiviert ist)."""
+    global _instance
+    if _instance is None:
+        settings = get_scheduler_settings(config)
+        if not settings["enabled"]:
+            return None
+        with _instance_lock:
+            if _instance is None:
+                _instance = RunScheduler(get_run_queue_db(), settings, provider=run_provider(config),
+                                         **kwargs)
+    return _instance
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Spaltenbasierte Zeitreihen fuer die Run-Telemetrie im Dashboard.
+              - ColumnarSeries: eine array('d')-Spalte pro Metrik plus
+                Zeitstempel, gestaffelt in Aufloesungsstufen (1s, 10s, 60s, 10min).
+                Laeuft eine Stufe voll, wird ihr aeltester Teil zu Buckets der
+                naechsten Stufe gemittelt - der Speicher bleibt unabhaengig von
+                der Run-Dauer begrenzt
+              - RunTelemetry: leitet Gauges aus dem _ui_log-Strom ab
+                (WorkerStatus, FeatureUpdate, TokenMetrics, Heartbeat) und
+                schreibt hoechstens einen Sample pro sample_interval
+              - Range-Abfragen fuer GET /session/telemetry (auch nach Reconnect)
+"""
+
+import json
+import time
+import logging
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("active_workers", "tokens_per_min", "files_done", "queue_depth")
+
+# (Aufloesung in Sekunden, max. Punkte): 1h roh, 6h a 10s, 24h a 1min, 7 Tage a 10min
+DEFAULT_TIERS = ((1, 3600), (10, 2160), (60, 1440), (600, 1008))
+DEFAULT_MAX_POINTS = 500
+TOKEN_RATE_WINDOW_S = 60.0
+
+
+class _Tier:
+    """Eine Aufloesungsstufe: Zeitstempel, Gewicht (Anzahl Rohpunkte) und Metrik-Spalten."""
+
+    def __init__(self, resolution: float, capacity: int, metrics: Sequence[str]):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.ts = array("d")
+        self.weight = array("d")
+        self.columns = {name: array("d") for name in metrics}
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def append(self, timestamp: float, values: Dict[str, float], weight: float = 1.0) -> None:
+        self.ts.append(timestamp)
+        self.weight.append(weight)
+        for name, column in self.columns.items():
+            column.append(float(values.get(name, 0.0)))
+
+    def merge_last(self, values: Dict[str, float], weight: float) -> None:
+        """Gewichtetes Mittel mit dem letzten Bucket (Bucket ueber zwei Kompaktierungen)."""
+        old = self.weight[-1]
+        total = old + weight
+        for name, column in self.columns.items():
+            column[-1] = (column[-1] * old + values.get(name, 0.0) * weight) / total
+        self.weight[-1] = total
+
+    def pop_oldest(self, count: int) -> List[Tuple[float, float, Dict[str, float]]]:
+        rows = [(self.ts[i], self.weight[i], {name: col[i] for name, col in self.columns.items()})
+                for i in range(count)]
+        del self.ts[:count]
+        del self.weight[:count]
+        for column in self.columns.values():
+            del column[:count]
+        return rows
+
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.ts, self.weight, *self.columns.values()))
+
+
+class ColumnarSeries:
+    """Gestaffelte, spaltenbasierte Zeitreihe mit begrenztem Speicher."""
+
+    def __init__(self, metrics: Sequence[str] = METRICS,
+                 tiers: Sequence[Tuple[float, int]] = DEFAULT_TIERS):
+        self.metrics = tuple(metrics)
+        self._tiers = [_Tier(resolution, capacity, self.metrics) for resolution, capacity in tiers]
+        self._lock = threading.Lock()
+
+    def append(self, timestamp: float, values: Dict[str, float]) -> None:
+        with self._lock:
+            raw = self._tiers[0]
+            if len(raw) and timestamp < raw.ts[-1]:
+                timestamp = raw.ts[-1]  # Zeitstempel bleiben monoton
+            raw.append(timestamp, values)
+            self._compact(0)
+
+    def _compact(self, level: int) -> None:
+        tier = self._tiers[level]
+        if len(tier) <= tier.capacity:
+            return
+        rows = tier.pop_oldest(max(1, tier.capacity // 4))
+        if level + 1 >= len(self._tiers):
+            return  # aelteste Stufe: Daten fallen weg
+        target = self._tiers[level + 1]
+        buckets: Dict[float, List[Any]] = {}
+        for timestamp, weight, values in rows:
+            start = timestamp - timestamp % target.resolution
+            bucket = buckets.setdefault(start, [0.0, {name: 0.0 for name in self.metrics}])
+            bucket[0] += weight
+            for name in self.metrics:
+                bucket[1][name] += values[name] * weight
+        for start in sorted(buckets):
+            weight, sums = buckets[start]
+            means = {name: sums[name] / weight for name in self.metrics}
+            if len(target) and target.ts[-1] == start:
+                target.merge_last(means, weight)
+            else:
+                target.append(start, means, weight)
+        self._compact(level + 1)
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              metrics: Optional[Iterable[str]] = None,
+              max_points: int = DEFAULT_MAX_POINTS) -> Dict[str, Any]:
+        """
+        Punkte im Bereich [start, end], aelteste (grobe) Stufen zuerst.
+
+        Mehr als max_points werden in gleich breite Zeit-Buckets gemittelt.
+        """
+        names = [m for m in (metrics or self.metrics) if m in self.metrics]
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        timestamps: List[float] = []
+        weights: List[float] = []
+        series: Dict[str, List[float]] = {name: [] for name in names}
+        resolution = None
+        with self._lock:
+            for tier in reversed(self._tiers):
+                # Zeitstempel sind je Stufe monoton → Bereich per Binaersuche
+                lo, hi = bisect_left(tier.ts, start), bisect_right(tier.ts, end)
+                if lo >= hi:
+                    continue
+                resolution = tier.resolution if resolution is None else resolution
+                timestamps.extend(tier.ts[lo:hi])
+                weights.extend(tier.weight[lo:hi])
+                for name in names:
+                    series[name].extend(tier.columns[name][lo:hi])
+        if max_points > 0 and len(timestamps) > max_points:
+            timestamps, series = _downsample(timestamps, weights, series, max_points)
+        return {
+            "metrics": names,
+            "timestamps": timestamps,
+            "series": series,
+            "points": len(timestamps),
+            "resolution_s": resolution,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tiers": [{"resolution_s": t.resolution, "points": len(t), "capacity": t.capacity}
+                          for t in self._tiers],
+                "bytes": sum(t.nbytes() for t in self._tiers),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tiers = [_Tier(t.resolution, t.capacity, self.metrics) for t in self._tiers]
+
+
+def _downsample(timestamps: List[float], weights: List[float],
+                series: Dict[str, List[float]], max_points: int):
+    first, last = timestamps[0], timestamps[-1]
+    width = (last - first) / max_points or 1.0
+    buckets: Dict[int, List[Any]] = {}
+    for i, timestamp in enumerate(timestamps):
+        index = min(int((timestamp - first) / width), max_points - 1)
+        bucket = buckets.setdefault(index, [0.0, 0.0, {name: 0.0 for name in series}])
+        weight = weights[i]
+        bucket[0] += timestamp * weight
+        bucket[1] += weight
+        for name, values in series.items():
+            bucket[2][name] += values[i] * weight
+    out_ts: List[float] = []
+    out_series: Dict[str, List[float]] = {name: [] for name in series}
+    for index in sorted(buckets):
+        ts_sum, weight, sums = buckets[index]
+        out_ts.append(round(ts_sum / weight, 3))
+        for name in series:
+            out_series[name].append(round(sums[name] / weight, 3))
+    return out_ts, out_series
+
+
+# =========================================================================
+# Gauges aus dem UI-Log
+# =========================================================================
+
+class RunTelemetry:
+    """Gauges eines Runs, abgeleitet aus _ui_log-Events."""
+
+    def __init__(self, sample_interval: float = 1.0,
+                 tiers: Sequence[Tuple[float, int]] = DEFAULT_TIERS):
+        self.sample_interval = sample_interval
+        self.series = ColumnarSeries(METRICS, tiers)
+        self._lock = threading.Lock()
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._offices: Dict[str, Tuple[int, int]] = {}  # office -> (active, queue)
+        self._files_done: set = set()
+        self._token_samples: deque = deque()
+        self._last_sample = 0.0
+        self.run_started: Optional[float] = None
+
+    def reset(self) -> None:
+        """Neuer Run: Zeitreihe und Gauges leeren."""
+        with self._lock:
+            self._reset_state()
+            self.run_started = time.time()
+        self.series.clear()
+
+    def observe(self, agent: str, event: str, message: Any, now: Optional[float] = None) -> None:
+        """Wertet ein UI-Event aus; unbekannte Events sind nur ein Sample-Anlass."""
+        now = time.time() if now is None else now
+        payload = _json(message) if event in ("WorkerStatus", "FeatureUpdate", "TokenMetrics") else None
+        with self._lock:
+            if event == "WorkerStatus" and payload:
+                status = payload.get("pool_status") or {}
+                self._offices[str(payload.get("office", agent))] = (
+                    _int(status.get("active_workers")), _int(status.get("queue_size")))
+            elif event == "FeatureUpdate" and payload and payload.get("status") == "done":
+                self._files_done.add(payload.get("id") or payload.get("file_path"))
+            elif event == "TokenMetrics" and payload and not payload.get("estimated"):
+                # Kumulierte Tageswerte des BudgetTrackers → Rate ueber ein gleitendes Fenster
+                total = payload.get("total_tokens")
+                if isinstance(total, (int, float)) and not isinstance(total, bool):
+                    self._token_samples.append((now, float(total)))
+            if now - self._last_sample < self.sample_interval:
+                return
+            self._last_sample = now
+            values = self._values(now)
+        self.series.append(now, values)
+
+    def _values(self, now: float) -> Dict[str, float]:
+        samples = self._token_samples
+        while len(samples) > 1 and samples[1][0] <= now - TOKEN_RATE_WINDOW_S:
+            samples.popleft()
+        rate = 0.0
+        if len(samples) > 1 and samples[-1][0] > samples[0][0]:
+            delta = max(0.0, samples[-1][1] - samples[0][1])
+            rate = delta * 60.0 / max(samples[-1][0] - samples[0][0], 1.0)
+        return {
+            "active_workers": float(sum(active for active, _ in self._offices.values())),
+            "tokens_per_min": round(rate, 1),
+            "files_done": float(len(self._files_done)),
+            "queue_depth": float(sum(queue for _, queue in self._offices.values())),
+        }
+
+    def current(self) -> Dict[str, float]:
+        with self._lock:
+            return self._values(time.time())
+
+    def query(self, **kwargs) -> Dict[str, Any]:
+        result = self.series.query(**kwargs)
+        result["run_started"] = self.run_started
+        result["current"] = self.current()
+        return result
+
+
+def _json(message: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(message, dict):
+        return message
+    try:
+        data = json.loads(message)
+    except (TypeError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _int(value: Any) -> int:
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+_instance: Optional[RunTelemetry] = None
+_instance_lock = threading.Lock()
+
+
+def get_run_telemetry() -> RunTelemetry:
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = RunTelemetry()
+        return _instance
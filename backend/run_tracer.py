@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Span-Tracing fuer einen Run (OrchestrationManager.run_task).
+              Phasen (Research, TechStack, Planner, File-Generierung, DevLoop-
+              Iterationen, Sandbox, Review, Security, Docker) werden als Spans
+              erfasst, verschachtelt bis zu einzelnen LLM-Aufrufen und Subprozessen.
+              - Eltern-Span ueber contextvars (asyncio-Tasks erben ihn, fuer Threads
+                bind_trace_context() verwenden)
+              - geringer Overhead: ohne aktiven Run ist trace_span() ein No-Op,
+                beendete Spans werden gepuffert und blockweise als JSONL geschrieben
+              - eine Trace-Datei pro Run: budget_data/traces/<run_id>.trace.jsonl
+              Auswertung (kritischer Pfad, Flamegraph-Export): backend/trace_report.py
+"""
+
+import contextvars
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "budget_data", "traces")
+TRACE_SUFFIX = ".trace.jsonl"
+FLUSH_EVERY = 256
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "run_trace_span", default=None)
+
+
+class Span:
+    """Ein offener oder beendeter Zeitabschnitt (Zeiten in ns relativ zum Run-Start)."""
+
+    __slots__ = ("span_id", "parent_id", "name", "category", "start_ns", "end_ns",
+                 "thread", "attrs", "_tracer", "_token", "_previous")
+
+    def __init__(self, tracer: "RunTracer", span_id: int, parent_id: Optional[int],
+                 name: str, category: str, attrs: Dict[str, Any]):
+        self._tracer = tracer
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self.thread = threading.current_thread().name
+        self.start_ns = time.perf_counter_ns() - tracer.t0_ns
+        self.end_ns: Optional[int] = None
+        self._token = None
+        self._previous: Optional[Span] = None
+
+    def set(self, **attrs) -> None:
+        """Attribute nachtragen (z.B. Modell, Tokens, Exit-Code)."""
+        self.attrs.update(attrs)
+
+    def end(self, **attrs) -> None:
+        """Beendet den Span (und noch offene Kind-Spans); der Eltern-Span wird wieder aktuell."""
+        if self.end_ns is None:
+            if attrs:
+                self.attrs.update(attrs)
+            self._tracer._finish(self)
+        if self._token is not None:
+            token, self._token = self._token, None
+            try:
+                _current_span.reset(token)
+                return
+            except (ValueError, RuntimeError):
+                pass  # anderer Kontext (z.B. Thread)
+        if _current_span.get() is self:
+            _current_span.set(self._previous)
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Start und Ende getrennt abrunden, die Dauer daraus ableiten - sonst endet ein
+        # Kind-Span durch Rundung bis zu 1us nach seinem Eltern-Span
+        start_us = self.start_ns // 1000
+        end_us = max(self.end_ns or self.start_ns, self.start_ns) // 1000
+        return {
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "cat": self.category,
+            "start_us": start_us,
+            "dur_us": end_us - start_us,
+            "thread": self.thread,
+            "attrs": self.attrs,
+        }
+
+
+class RunTracer:
+    """Sammelt die Spans eines Runs und schreibt sie gepuffert in die Trace-Datei."""
+
+    def __init__(self, run_id: str, path: Optional[str] = None, flush_every: int = FLUSH_EVERY):
+        self.run_id = run_id
+        self.path = path or trace_path(run_id)
+        self.flush_every = flush_every
+        self.t0_ns = time.perf_counter_ns()
+        self.started_at = time.time()
+        self._ids = itertools.count(1)
+        self._open: Dict[int, Span] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.span_count = 0
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "run", "run_id": run_id,
+                                "started_at": self.started_at}, ensure_ascii=False) + "\n")
+
+    def start(self, name: str, category: str = "phase", parent: Optional[Span] = None,
+              activate: bool = True, **attrs) -> Span:
+        """Oeffnet einen Span unter parent (Default: aktueller Span im Kontext)."""
+        if parent is None:
+            parent = _current_span.get()
+            if parent is not None and parent._tracer is not self:
+                parent = None
+        span = Span(self, next(self._ids), parent.span_id if parent else None,
+                    name, category, attrs)
+        with self._lock:
+            self._open[span.span_id] = span
+        if activate:
+            span._previous = parent
+            span._token = _current_span.set(span)
+        return span
+
+    def _finish(self, span: Span) -> None:
+        now_ns = time.perf_counter_ns() - self.t0_ns
+        with self._lock:
+            # Offene Nachfahren enden mit dem Eltern-Span (z.B. letzte DevLoop-Iteration bei return)
+            ended = []
+            for child in sorted(self._open.values(), key=lambda s: s.span_id, reverse=True):
+                if child is not span and self._is_descendant(child, span.span_id):
+                    child.attrs.setdefault("unfinished", True)
+                    ended.append(child)
+            ended.append(span)
+            for item in ended:
+                item.end_ns = now_ns
+                self._open.pop(item.span_id, None)
+            if self._closed:
+                return
+            self._pending.extend(item.to_dict() for item in ended)
+            self.span_count += len(ended)
+            flush = len(self._pending) >= self.flush_every or span.category == "phase"
+        if flush:
+            self.flush()
+
+    def _is_descendant(self, span: Span, ancestor_id: int) -> bool:
+        parent_id = span.parent_id
+        while parent_id is not None:
+            if parent_id == ancestor_id:
+                return True
+            parent = self._open.get(parent_id)
+            if parent is None:
+                return False
+            parent_id = parent.parent_id
+        return False
+
+    def flush(self) -> None:
+        """Schreibt gepufferte Spans (Phasen-Enden flushen sofort - Crash-sicher)."""
+        with self._lock:
+            records, self._pending = self._pending, []
+            if not records:
+                return
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(r, ensure_ascii=False, default=str) + "\n"
+                                    for r in records))
+            except OSError as e:
+                logger.debug("Trace-Datei nicht schreibbar (%s): %s", self.path, e)
+
+    def close(self) -> None:
+        """Beendet offene Spans (innerste zuerst) und schreibt den Rest."""
+        with self._lock:
+            still_open = sorted(self._open.values(), key=lambda s: s.span_id)
+        for span in still_open:
+            if span.end_ns is None:
+                span.attrs.setdefault("unfinished", True)
+                self._finish(span)
+        self.flush()
+        with self._lock:
+            self._closed = True
+
+
+def trace_path(run_id: str, directory: Optional[str] = None) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", str(run_id)) or "run"
+    return os.path.join(directory or TRACE_DIR, safe + TRACE_SUFFIX)
+
+
+def get_tracing_settings(config: Any) -> Dict[str, Any]:
+    """Liest run_tracing aus der Config (ohne dict-Config: aus)."""
+    if not isinstance(config, dict):
+        return {"enabled": False}
+    settings = config.get("run_tracing", {}) or {}
+    return {"enabled": bool(settings.get("enabled", True))}
+
+
+# =========================================================================
+# Aktiver Run (ein Run pro Prozess, wie run_task)
+# =========================================================================
+
+_active: Optional[RunTracer] = None
+_active_lock = threading.Lock()
+
+
+def start_run_trace(run_id: str, directory: Optional[str] = None) -> Optional[RunTracer]:
+    """Startet das Tracing fuer einen Run; ein evtl. noch aktiver Run wird abgeschlossen."""
+    global _active
+    with _active_lock:
+        previous, _active = _active, None
+    if previous is not None:
+        previous.close()
+    try:
+        tracer = RunTracer(run_id, trace_path(run_id, directory))
+    except OSError as e:
+        logger.warning("Run-Tracing nicht verfuegbar: %s", e)
+        return None
+    with _active_lock:
+        _active = tracer
+    return tracer
+
+
+def finish_run_trace() -> Optional[str]:
+    """Schliesst den aktiven Run ab und liefert den Pfad der Trace-Datei."""
+    global _active
+    with _active_lock:
+        tracer, _active = _active, None
+    if tracer is None:
+        return None
+    tracer.close()
+    return tracer.path
+
+
+def get_active_tracer() -> Optional[RunTracer]:
+    return _active
+
+
+@contextmanager
+def trace_span(name: str, category: str = "phase", **attrs):
+    """Span um einen Block - ohne aktiven Run ein No-Op (liefert None)."""
+    tracer = _active
+    if tracer is None:
+        yield None
+        return
+    span = tracer.start(name, category, **attrs)
+    try:
+        yield span
+    except BaseException as e:
+        span.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        span.end()
+
+
+def begin_span(name: str, category: str = "phase", **attrs) -> Optional[Span]:
+    """Manuell beendeter Span (Schleifen mit vielen Austritten) - end_span() schliesst ihn."""
+    tracer = _active
+    return tracer.start(name, category, **attrs) if tracer is not None else None
+
+
+def end_span(span: Optional[Span], **attrs) -> None:
+    if span is not None:
+        span.end(**attrs)
+
+
+def bind_trace_context(func: Callable) -> Callable:
+    """Bindet den aktuellen Span an func - fuer Aufrufe in Worker-Threads."""
+    if _active is None:
+        return func
+    context = contextvars.copy_context()
+
+    def bound(*args, **kwargs):
+        # Kopie pro Aufruf: ein Context darf nicht in zwei Threads gleichzeitig laufen
+        return context.copy().run(func, *args, **kwargs)
+    return bound
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Worker-Prozess fuer einen Run aus der Warteschlange (backend/run_scheduler.py).
+              Jeder zusaetzlich parallel laufende Run bekommt einen eigenen Prozess mit
+              eigenem OrchestrationManager - Singletons (Session, Library, Tracing,
+              Budget-Kontext) sind damit pro Run getrennt.
+              UI-Events gehen als Zeilen mit EVENT_PREFIX + JSON an stdout, alle
+              anderen Ausgaben landen im Run-Log des Schedulers.
+
+              AENDERUNG 18.10.2026: Host-Ressourcen pro Run getrennt - eigener
+              Port-Bereich (--port-offset) fuer den Projekt-Container und eigene
+              Library-Datei fuer das aktuelle Projekt (ueber RUN_ID_ENV).
+
+              Aufruf (durch den Scheduler):
+                python -m backend.run_worker --run-id <id> --goal "<ziel>" [--project-name <name>]
+                                             [--port-offset <n>]
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+from typing import List, Optional
+
+EVENT_PREFIX = "@@RUN_EVENT@@ "
+
+# Vom Worker gesetzt, von LibraryManager/ProjectContainerManager/server_runner gelesen
+RUN_ID_ENV = "AGENTSMITH_RUN_ID"
+PORT_OFFSET_ENV = "AGENTSMITH_PORT_OFFSET"
+
+_emit_lock = threading.Lock()
+
+
+def emit_event(agent: str, event: str, message: str, stream=None) -> None:
+    """Schreibt ein UI-Event fuer den Scheduler (eine Zeile, sofort geflusht)."""
+    line = EVENT_PREFIX + json.dumps({"agent": agent, "event": event, "message": message},
+                                     ensure_ascii=False, default=str)
+    with _emit_lock:
+        out = stream or sys.stdout
+        out.write(line + "\n")
+        out.flush()
+
+
+def parse_event(line: str) -> Optional[dict]:
+    """Gegenstueck zu emit_event - None fuer normale Ausgabezeilen."""
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        return json.loads(line[len(EVENT_PREFIX):])
+    except ValueError:
+        return None
+
+
+def worker_run_id() -> Optional[str]:
+    """Run-ID wenn dieser Prozess ein Run-Worker ist, sonst None (Server-Prozess)."""
+    return os.environ.get(RUN_ID_ENV) or None
+
+
+def port_offset() -> int:
+    """Versatz der Host-Ports dieses Runs (0 im Server-Prozess)."""
+    try:
+        return max(0, int(os.environ.get(PORT_OFFSET_ENV, "0")))
+    except ValueError:
+        return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run-Worker (Scheduler)")
+    parser.add_argument("--run-id", required=True)
+    parser.add_argument("--goal", required=True)
+    parser.add_argument("--project-name", default=None)
+    parser.add_argument("--port-offset", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # Vor dem Manager setzen: Library und Projekt-Container lesen es bei der Erzeugung
+    os.environ[RUN_ID_ENV] = args.run_id
+    os.environ[PORT_OFFSET_ENV] = str(max(0, args.port_offset))
+
+    from .orchestration_manager import OrchestrationManager
+
+    manager = OrchestrationManager()
+    manager.on_log = emit_event
+
+    def _terminate(signum, frame):
+        # Kooperativer Stop wie POST /session/reset, danach beendet run_task selbst
+        manager.stop()
+
+    signal.signal(signal.SIGTERM, _terminate)
+    try:
+        manager.run_task(args.goal, args.project_name)
+    except Exception as e:
+        emit_event("System", "Error", f"Run {args.run_id} abgebrochen: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
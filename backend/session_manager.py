@@ -1,7 +1,7 @@
 """
 Author: rahn
 Datum: 31.01.2026
-Version: 1.4
+Version: 1.5
 Beschreibung: SessionManager - Verwaltet aktive Sessions und deren Status.
               Ermoeglicht State-Recovery nach Browser-Refresh und Navigation.
               Haelt den aktuellen Projekt-Status fuer Frontend-Synchronisation.
@@ -9,13 +9,18 @@ Beschreibung: SessionManager - Verwaltet aktive Sessions und deren Status.
               ÄNDERUNG 30.01.2026: HELP_NEEDED Support (set_agent_blocked) gemäß Protokoll.
               ÄNDERUNG 31.01.2026: get_blocked_agents(), clear_agent_blocked() fuer HELP_NEEDED Handler.
               ÄNDERUNG 31.01.2026: Parallel-Fix Status Tracking (fix, parallel_fixer Agenten).
+              AENDERUNG 18.10.2026: Versionierter State - jede Aenderung erhoeht seq,
+              get_changes(since) liefert nur geaenderte Teile, Log-Cursor per seq.
+              add_logs() fuer Batches der UI-Log-Pipeline.
 """
 
 import logging
+import uuid
 from copy import deepcopy
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from collections import deque
+from itertools import islice
 import threading
 
 logger = logging.getLogger(__name__)
@@ -86,8 +91,40 @@ class SessionManager:
         # ÄNDERUNG 29.01.2026: Discovery Briefing fuer Agent-Kontext
         self.discovery_briefing: Optional[Dict[str, Any]] = None
 
+        # AENDERUNG 18.10.2026: Versionierung fuer Delta-Abfragen und ETag
+        # epoch wechselt mit dem Prozess - seq-Werte eines alten Prozesses sind ungueltig
+        self.epoch = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._session_seq = 0
+        self._agent_seq: Dict[str, int] = {}
+        self._reset_seq = 0      # Letztes Leeren von Logs/Snapshots (Delta nicht moeglich)
+        self._evicted_seq = 0    # seq des zuletzt aus dem Ring-Buffer verdraengten Logs
+
         logger.info("SessionManager initialisiert")
 
+    # AENDERUNG 18.10.2026: Jede Aenderung bekommt eine fortlaufende seq
+    def _bump(self, session: bool = False, agent: Optional[str] = None) -> int:
+        """Erhoeht die State-Version und merkt sich, welcher Teil geaendert wurde."""
+        self._seq += 1
+        if session:
+            self._session_seq = self._seq
+        if agent is not None:
+            self._agent_seq[agent] = self._seq
+        return self._seq
+
+    def _mark_reset(self) -> None:
+        self._reset_seq = self._bump(session=True)
+        self._agent_seq.clear()
+
+    @property
+    def seq(self) -> int:
+        """Aktuelle State-Version (monoton steigend innerhalb einer epoch)."""
+        return self._seq
+
+    def etag(self) -> str:
+        """Schwacher ETag des kompletten States (GET /session/current)."""
+        return f'W/"{self.epoch}-{self._seq}"'
+
     def start_session(self, goal: str, project_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Startet eine neue Session mit dem gegebenen Ziel.
@@ -117,6 +154,7 @@ class SessionManager:
 
             # Logs leeren
             self.logs.clear()
+            self._mark_reset()
 
             self._add_log("System", "SessionStart", f"Neue Session gestartet: {goal[:50]}...")
 
@@ -137,6 +175,7 @@ class SessionManager:
             self.current_session["status"] = status
             self.current_session["last_update"] = datetime.now().isoformat()
             self.current_session["ended_at"] = datetime.now().isoformat()
+            self._bump(session=True)
 
             self._add_log("System", "SessionEnd", f"Session beendet mit Status: {status}")
 
@@ -148,12 +187,14 @@ class SessionManager:
         with self._lock:
             self.current_session["status"] = status
             self.current_session["last_update"] = datetime.now().isoformat()
+            self._bump(session=True)
 
     def update_iteration(self, iteration: int) -> None:
         """Aktualisiert die aktuelle Iteration."""
         with self._lock:
             self.current_session["iteration"] = iteration
             self.current_session["last_update"] = datetime.now().isoformat()
+            self._bump(session=True)
 
     def set_agent_active(self, agent_name: str, is_active: bool = True) -> None:
         """
@@ -166,6 +207,7 @@ class SessionManager:
         with self._lock:
             self.current_session["active_agents"][agent_name] = is_active
             self.current_session["last_update"] = datetime.now().isoformat()
+            self._bump(session=True)
 
     # ÄNDERUNG 30.01.2026: HELP_NEEDED Support gemäß Kommunikationsprotokoll
     def set_agent_blocked(self, agent_name: str, is_blocked: bool, reason: str = "") -> None:
@@ -185,6 +227,7 @@ class SessionManager:
             self.agent_snapshots[agent_name]["blocked_reason"] = reason if is_blocked else ""
             self.agent_snapshots[agent_name]["blocked_at"] = datetime.now().isoformat() if is_blocked else None
             self.current_session["last_update"] = datetime.now().isoformat()
+            self._bump(session=True, agent=agent_name)
 
             if is_blocked:
                 self._add_log(agent_name, "HELP_NEEDED", reason)
@@ -245,8 +288,10 @@ class SessionManager:
                 self.agent_snapshots[agent_name]["blocked"] = False
                 self.agent_snapshots[agent_name]["blocked_reason"] = ""
                 self.agent_snapshots[agent_name]["blocked_at"] = None
+                self._bump(agent=agent_name)
                 self._add_log(agent_name, "HELP_RESOLVED", "Blockade aufgehoben")
             self.current_session["last_update"] = datetime.now().isoformat()
+            self._bump(session=True)
 
     def update_agent_snapshot(self, agent_name: str, data: Dict[str, Any]) -> None:
         """
@@ -260,6 +305,7 @@ class SessionManager:
             if agent_name in self.agent_snapshots:
                 self.agent_snapshots[agent_name].update(data)
                 self.agent_snapshots[agent_name]["last_update"] = datetime.now().isoformat()
+                self._bump(agent=agent_name)
 
     # AENDERUNG 31.01.2026: Status-Update fuer Parallel-Fix Tracking
     def update_agent_status(self, agent_name: str, status_data: Dict[str, Any]) -> None:
@@ -290,6 +336,7 @@ class SessionManager:
             is_active = status_data.get("status") == "running"
             self.current_session["active_agents"][agent_name] = is_active
             self.current_session["last_update"] = datetime.now().isoformat()
+            self._bump(session=True, agent=agent_name)
 
             # Log bei wichtigen Status-Aenderungen
             status = status_data.get("status", "unknown")
@@ -311,16 +358,36 @@ class SessionManager:
         """
         return self._add_log(agent, event, message)
 
-    def _add_log(self, agent: str, event: str, message: str) -> Dict[str, Any]:
+    # AENDERUNG 18.10.2026: Batch-Variante fuer die UI-Log-Pipeline (ein Lock pro Batch)
+    def add_logs(self, entries: List[tuple]) -> int:
+        """
+        Fuegt mehrere Log-Eintraege unter einer Lock-Akquisition hinzu.
+
+        Args:
+            entries: (agent, event, message) oder (agent, event, message, timestamp_iso)
+
+        Returns:
+            Anzahl hinzugefuegter Eintraege
+        """
+        with self._lock:
+            for entry in entries:
+                self._add_log(*entry)
+        return len(entries)
+
+    def _add_log(self, agent: str, event: str, message: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Interne Methode zum Hinzufuegen von Logs."""
         # ÄNDERUNG 29.01.2026: Log-Zugriff reentrant absichern
         with self._lock:
             log_entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
                 "agent": agent,
                 "event": event,
-                "message": message
+                "message": message,
+                # AENDERUNG 18.10.2026: seq als Log-Cursor (Paging, Deltas)
+                "seq": self._bump()
             }
+            if len(self.logs) == self.logs.maxlen:
+                self._evicted_seq = self.logs[0].get("seq", 0)
             self.logs.append(log_entry)
             return log_entry
 
@@ -329,15 +396,71 @@ class SessionManager:
         Gibt den kompletten aktuellen State zurueck.
         Wird vom Frontend nach Refresh/Reconnect abgefragt.
 
+        AENDERUNG 18.10.2026: Mit epoch/seq fuer anschliessende Delta-Abfragen;
+        Kopien unter Lock, damit die Serialisierung ausserhalb sicher ist.
+
         Returns:
             Kompletter Session-State
         """
-        return {
-            "session": self.current_session,
-            "agent_data": self.agent_snapshots,
-            "recent_logs": list(self.logs)[-100:],  # Letzte 100 Logs
-            "is_active": self.current_session["status"] == "Working"
-        }
+        with self._lock:
+            return {
+                "session": dict(self.current_session),
+                "agent_data": {name: dict(data) for name, data in self.agent_snapshots.items()},
+                "recent_logs": list(islice(self.logs, max(0, len(self.logs) - 100), None)),  # Letzte 100 Logs
+                "is_active": self.current_session["status"] == "Working",
+                "epoch": self.epoch,
+                "seq": self._seq
+            }
+
+    # AENDERUNG 18.10.2026: Delta-Abfrage statt kompletter Snapshots
+    def get_changes(self, since: int, epoch: Optional[str] = None, log_limit: int = 200) -> Dict[str, Any]:
+        """
+        Liefert nur die Aenderungen seit der State-Version since.
+
+        Enthalten sind session (falls geaendert), die geaenderten Agent-Snapshots
+        und die neuen Logs. Ist kein Delta moeglich (andere epoch, Reset seit since,
+        seq aus der Zukunft), kommt der komplette State mit full=True.
+
+        Args:
+            since: Zuletzt gesehene seq des Clients
+            epoch: epoch aus der letzten Antwort (None = nicht pruefen)
+            log_limit: Maximale Anzahl neuer Logs (aelteste zuerst)
+
+        Returns:
+            Delta-Dictionary mit epoch, seq und full
+        """
+        with self._lock:
+            if (epoch is not None and epoch != self.epoch) or since < self._reset_seq or since > self._seq:
+                state = self.get_current_state()
+                state["full"] = True
+                return state
+
+            delta: Dict[str, Any] = {"epoch": self.epoch, "seq": self._seq, "full": False}
+            if self._session_seq > since:
+                delta["session"] = dict(self.current_session)
+                delta["is_active"] = self.current_session["status"] == "Working"
+            agents = {name: dict(self.agent_snapshots.get(name, {}))
+                      for name, agent_seq in self._agent_seq.items() if agent_seq > since}
+            if agents:
+                delta["agent_data"] = agents
+            logs = self._logs_after(since, log_limit)
+            delta["logs"] = logs
+            delta["logs_truncated"] = self._evicted_seq > since
+            delta["has_more_logs"] = bool(logs) and logs[-1]["seq"] < self._last_log_seq()
+            return delta
+
+    def _last_log_seq(self) -> int:
+        return self.logs[-1].get("seq", 0) if self.logs else 0
+
+    def _logs_after(self, after: int, limit: int) -> List[Dict[str, Any]]:
+        """Logs mit seq > after, aelteste zuerst - laeuft nur ueber die neuen Eintraege."""
+        newer = []
+        for entry in reversed(self.logs):
+            if entry.get("seq", 0) <= after:
+                break
+            newer.append(entry)
+        newer.reverse()
+        return newer[:limit]
 
     def get_logs(self, limit: int = 100, offset: int = 0) -> tuple:
         """
@@ -351,12 +474,51 @@ class SessionManager:
             Liste von Log-Eintraegen
         """
         # ÄNDERUNG 29.01.2026: Atomare Rückgabe von Logs + Total
+        # AENDERUNG 18.10.2026: Nur den angefragten Ausschnitt kopieren (islice statt list(deque))
         with self._lock:
-            logs_list = list(self.logs)
-            total = len(logs_list)
+            total = len(self.logs)
             start = max(0, total - limit - offset)
             end = total - offset if offset > 0 else total
-            return logs_list[start:end], total
+            return list(islice(self.logs, start, max(start, end))), total
+
+    # AENDERUNG 18.10.2026: Cursor-Paging ueber die Log-seq
+    def get_logs_page(self, limit: int = 100, before: Optional[int] = None,
+                      after: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Cursor-basiertes Log-Paging (stabil, auch waehrend neue Logs dazukommen).
+
+        Args:
+            limit: Maximale Anzahl Logs
+            before: Aeltere Logs als diese seq (rueckwaerts blaettern)
+            after: Neuere Logs als diese seq (vorwaerts, z.B. Nachladen)
+
+        Returns:
+            Dict mit logs (aelteste zuerst), total, has_more und den Cursorn
+            before/after fuer die naechste Seite
+        """
+        with self._lock:
+            if after is not None:
+                newer = self._logs_after(after, limit + 1)
+                logs, has_more = newer[:limit], len(newer) > limit
+            else:
+                logs = []
+                has_more = False
+                for entry in reversed(self.logs):
+                    if before is not None and entry.get("seq", 0) >= before:
+                        continue
+                    if len(logs) == limit:
+                        has_more = True
+                        break
+                    logs.append(entry)
+                logs.reverse()
+            return {
+                "logs": logs,
+                "total": len(self.logs),
+                "has_more": has_more,
+                "before": logs[0]["seq"] if logs else before,
+                "after": logs[-1]["seq"] if logs else (after if after is not None else self._last_log_seq()),
+                "epoch": self.epoch
+            }
 
     def restore_from_library(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -381,11 +543,14 @@ class SessionManager:
                 "restored_from": project_data.get("project_id")
             }
 
+            self._mark_reset()
+
             # Logs aus Library laden falls vorhanden
+            # AENDERUNG 18.10.2026: Wiederhergestellte Logs bekommen eine neue seq
             if "logs" in project_data:
                 self.logs.clear()
                 for log in project_data["logs"][-self._max_logs:]:
-                    self.logs.append(log)
+                    self.logs.append({**log, "seq": self._bump()})
 
             self._add_log("System", "SessionRestore", f"Session wiederhergestellt: {self.current_session['project_id']}")
 
@@ -487,6 +652,7 @@ class SessionManager:
             self.logs.clear()
             # ÄNDERUNG 29.01.2026: Auch Briefing zuruecksetzen
             self.discovery_briefing = None
+            self._mark_reset()
             logger.info("Session zurueckgesetzt")
 
 
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Startup-Profiler fuer den Backend-Server.
+              - Phasen-Zeiten (Dependency-Check, Router-Import, Manager-Init, ...)
+              - Optionaler Import-Zeit-Baum ueber einen Meta-Path-Hook
+                (aktiv mit PROFILE_STARTUP=1 oder ueber die CLI unten)
+              - Report als Dict (Endpoint GET /startup/profile) oder Text (CLI)
+
+              CLI:
+                python -m backend.startup_profiler [--top 25] [--min-ms 1] [--json] [--no-import-tree]
+                python -m backend.startup_profiler --serve [--port 8000]
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+PROFILE_ENV_VAR = "PROFILE_STARTUP"
+
+
+class _TimingLoader:
+    """Wrappt einen Loader und misst exec_module (inkl. verschachtelter Imports)."""
+
+    def __init__(self, inner, profiler: "StartupProfiler"):
+        self._inner = inner
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._inner.create_module(spec)
+
+    def exec_module(self, module):
+        profiler = self._profiler
+        node = profiler._enter_import(module.__name__)
+        start = time.perf_counter()
+        try:
+            self._inner.exec_module(module)
+        finally:
+            profiler._leave_import(node, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        # get_source, get_resource_reader, is_package, ... vom echten Loader
+        return getattr(self._inner, name)
+
+
+class _TimingFinder:
+    """Meta-Path-Finder, der die Specs der uebrigen Finder mit _TimingLoader versieht."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is None:
+                    continue
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimingLoader(spec.loader, self._profiler)
+                return spec
+            return None
+        finally:
+            self._local.busy = False
+
+
+class StartupProfiler:
+    """
+    Sammelt Phasen-Zeiten und (optional) den Import-Zeit-Baum.
+
+    Phasen sind immer aktiv (zwei perf_counter-Aufrufe pro Phase);
+    der Import-Hook nur auf Anforderung, da er jeden Import umleitet.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._phases: List[Dict[str, Any]] = []
+        self._marks: Dict[str, float] = {}
+        self._finder: Optional[_TimingFinder] = None
+        self._roots: List[Dict[str, Any]] = []
+        self._stack = threading.local()
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
+
+    # =========================================================================
+    # Phasen
+    # =========================================================================
+
+    @contextmanager
+    def phase(self, name: str):
+        """Misst einen Startup-Abschnitt (verschachtelbar, thread-safe)."""
+        start = self._elapsed_ms()
+        try:
+            yield
+        finally:
+            entry = {
+                "name": name,
+                "start_ms": round(start, 2),
+                "duration_ms": round(self._elapsed_ms() - start, 2),
+                "thread": threading.current_thread().name,
+            }
+            with self._lock:
+                self._phases.append(entry)
+
+    def mark(self, name: str) -> None:
+        """Zeitpunkt seit Profiler-Start merken (z.B. 'ready')."""
+        with self._lock:
+            self._marks.setdefault(name, round(self._elapsed_ms(), 2))
+
+    def phases(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._phases)
+
+    # =========================================================================
+    # Import-Baum
+    # =========================================================================
+
+    @property
+    def import_hook_active(self) -> bool:
+        return self._finder is not None
+
+    def install_import_hook(self) -> None:
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall_import_hook(self) -> None:
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def _enter_import(self, name: str) -> Dict[str, Any]:
+        stack = getattr(self._stack, "nodes", None)
+        if stack is None:
+            stack = self._stack.nodes = []
+        node = {"module": name, "cumulative_ms": 0.0, "self_ms": 0.0, "children": []}
+        if stack:
+            stack[-1]["children"].append(node)
+        else:
+            with self._lock:
+                self._roots.append(node)
+        stack.append(node)
+        return node
+
+    def _leave_import(self, node: Dict[str, Any], seconds: float) -> None:
+        self._stack.nodes.pop()
+        node["cumulative_ms"] = round(seconds * 1000, 3)
+        children_ms = sum(child["cumulative_ms"] for child in node["children"])
+        node["self_ms"] = round(max(0.0, node["cumulative_ms"] - children_ms), 3)
+
+    def import_tree(self, min_ms: float = 0.0) -> List[Dict[str, Any]]:
+        """Import-Baum; Knoten unter min_ms (kumulativ) werden weggelassen."""
+        def prune(node):
+            return {
+                **node,
+                "children": [prune(c) for c in node["children"] if c["cumulative_ms"] >= min_ms],
+            }
+        with self._lock:
+            roots = list(self._roots)
+        return [prune(n) for n in roots if n["cumulative_ms"] >= min_ms]
+
+    def slowest_imports(self, top: int = 20) -> List[Dict[str, Any]]:
+        """Module mit der hoechsten Eigenzeit (ohne Kinder)."""
+        flat = []
+
+        def walk(node):
+            flat.append({k: node[k] for k in ("module", "self_ms", "cumulative_ms")})
+            for child in node["children"]:
+                walk(child)
+
+        with self._lock:
+            roots = list(self._roots)
+        for root in roots:
+            walk(root)
+        flat.sort(key=lambda n: n["self_ms"], reverse=True)
+        return flat[:top]
+
+    # =========================================================================
+    # Report
+    # =========================================================================
+
+    def report(self, top: int = 20, min_ms: float = 1.0, include_tree: bool = True) -> Dict[str, Any]:
+        with self._lock:
+            marks = dict(self._marks)
+            total_imports_ms = sum(n["cumulative_ms"] for n in self._roots)
+        data = {
+            "started_at": self.started_at,
+            "uptime_ms": round(self._elapsed_ms(), 2),
+            "marks": marks,
+            "phases": self.phases(),
+            "import_hook_active": self.import_hook_active,
+            "imports_total_ms": round(total_imports_ms, 2),
+            "slowest_imports": self.slowest_imports(top),
+        }
+        if include_tree:
+            data["import_tree"] = self.import_tree(min_ms)
+        return data
+
+    def format_report(self, top: int = 20, min_ms: float = 1.0) -> str:
+        """Text-Report fuer die Konsole."""
+        data = self.report(top=top, min_ms=min_ms)
+        lines = ["Startup-Phasen:"]
+        for phase in sorted(data["phases"], key=lambda p: p["start_ms"]):
+            lines.append(f"  {phase['start_ms']:>9.1f} ms  +{phase['duration_ms']:>9.1f} ms  {phase['name']}")
+        for name, at in data["marks"].items():
+            lines.append(f"  {at:>9.1f} ms  [{name}]")
+        if data["slowest_imports"]:
+            lines.append(f"\nImporte gesamt: {data['imports_total_ms']:.1f} ms")
+            lines.append(f"Langsamste Module (Eigenzeit, Top {top}):")
+            for node in data["slowest_imports"]:
+                lines.append(f"  {node['self_ms']:>9.1f} ms  (kum. {node['cumulative_ms']:>8.1f})  {node['module']}")
+            lines.append(f"\nImport-Baum (>= {min_ms} ms kumulativ):")
+
+            def walk(node, depth):
+                lines.append(f"  {node['cumulative_ms']:>9.1f} ms  {'  ' * depth}{node['module']}")
+                for child in node["children"]:
+                    walk(child, depth + 1)
+
+            for root in data["import_tree"]:
+                walk(root, 0)
+        return "\n".join(lines)
+
+
+_profiler: Optional[StartupProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Prozessweiter Profiler (Singleton)."""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = StartupProfiler()
+    return _profiler
+
+
+def enable_from_env() -> bool:
+    """Aktiviert den Import-Hook wenn PROFILE_STARTUP gesetzt ist."""
+    if os.environ.get(PROFILE_ENV_VAR, "").lower() in {"1", "true", "yes"}:
+        get_startup_profiler().install_import_hook()
+        return True
+    return False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Startup-Profiler fuer backend.api")
+    parser.add_argument("--no-import-tree", action="store_true",
+                        help="Nur Phasen messen, keinen Import-Hook installieren")
+    parser.add_argument("--serve", action="store_true", help="Danach uvicorn starten")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--min-ms", type=float, default=1.0)
+    parser.add_argument("--json", action="store_true", help="Report als JSON ausgeben")
+    args = parser.parse_args(argv)
+
+    profiler = get_startup_profiler()
+    if not args.no_import_tree:
+        profiler.install_import_hook()
+    with profiler.phase("import:backend.api"):
+        from backend import api  # noqa: F401
+    profiler.mark("app_imported")
+    # Baum ist erfasst - laufender Server soll nicht weiter umgeleitet werden
+    profiler.uninstall_import_hook()
+
+    if args.json:
+        print(json.dumps(profiler.report(top=args.top, min_ms=args.min_ms), indent=2))
+    else:
+        print(profiler.format_report(top=args.top, min_ms=args.min_ms))
+
+    if args.serve:
+        import uvicorn
+        uvicorn.run(api.app, host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,6 +28,8 @@ from backend.task_models import (
     TaskPriority, filter_ready_tasks, sort_tasks_by_priority, priority_to_int
 )
 from backend.task_tracker import TaskTracker
+from backend.project_code_store import get_code_store
+from backend.prompt_cache import get_prompt_cache_settings
 
 logger = logging.getLogger(__name__)
 
@@ -601,6 +603,10 @@ class TaskDispatcher:
 
                 write_ok = self._write_file_to_project(fix_target_file, corrected_content)
                 sync_ok = self._sync_single_file_to_manager(fix_target_file, corrected_content)
+                # AENDERUNG 18.10.2026: Geschriebene Datei ist im Store nicht mehr dirty
+                store = get_code_store(self.manager)
+                if write_ok and sync_ok and store is not None:
+                    store.mark_clean([fix_target_file])
                 if not write_ok or not sync_ok:
                     sync_error = (
                         f"Fix-Task Synchronisierung fehlgeschlagen "
@@ -755,28 +761,33 @@ class TaskDispatcher:
                     f"ALLE Code-Aenderungen MUESSEN in '{language}' sein!"
                 )
 
-            if agent_type == "coder":
+            # AENDERUNG 18.10.2026: Konstruktion ueber den Agent-Pool (Security nutzt den Coder)
+            from backend.agent_pool import pooled_agent
+            if agent_type in ("coder", "security"):
                 from agents.coder_agent import create_coder
-                return create_coder(self.config, rules, router=self.router)
+                builder = lambda: create_coder(self.config, rules, router=self.router)
+                pool_role = "coder"
             elif agent_type == "fix":
                 from agents.fix_agent import create_fix_agent
-                return create_fix_agent(
+                builder = lambda: create_fix_agent(
                     self.config, rules, router=self.router,
                     tech_blueprint=tech_blueprint
                 )
+                pool_role = "fix"
             elif agent_type == "tester":
                 from agents.tester_agent import create_tester
-                return create_tester(self.config, rules, router=self.router)
-            elif agent_type == "security":
-                # Security nutzt Coder mit speziellem Prompt
-                from agents.coder_agent import create_coder
-                return create_coder(self.config, rules, router=self.router)
+                builder = lambda: create_tester(self.config, rules, router=self.router)
+                pool_role = "tester"
             elif agent_type == "reviewer":
                 from agents.reviewer_agent import create_reviewer
-                return create_reviewer(self.config, rules, router=self.router)
+                builder = lambda: create_reviewer(self.config, rules, router=self.router)
+                pool_role = "reviewer"
             else:
                 logger.warning(f"[TaskDispatcher] Unbekannter Agent-Typ: {agent_type}")
                 return None
+            # Eigener Pool-Namensraum: die Regeln unterscheiden sich von init_agents
+            return pooled_agent(self.config, pool_role, {"utds_fallback": rules}, builder,
+                                router=self.router, tech_blueprint=tech_blueprint)
         except ImportError as e:
             logger.error(f"[TaskDispatcher] Import-Fehler: {e}")
             return None
@@ -931,6 +942,8 @@ class TaskDispatcher:
             line_numbers=line_numbers,
             context_files=None,
             suggested_fix=task.description[:500] if task.description else "",
+            # AENDERUNG 18.10.2026: Stabiler Cache-Praefix wie im Coder-Prompt
+            cache_settings=get_prompt_cache_settings(getattr(self.manager, "config", None)),
         )
         return prompt, target_file
 
@@ -976,6 +989,12 @@ class TaskDispatcher:
         if not hasattr(self.manager, "current_code"):
             return False
 
+        # AENDERUNG 18.10.2026: Direkt in den ProjectCodeStore (kein Neuaufbau von Platte)
+        store = get_code_store(self.manager)
+        if store is not None:
+            store.set_file(filename, content)
+            return store.get(filename) == content
+
         if self.manager.current_code is None:
             self.manager.current_code = {}
 
@@ -1109,6 +1128,23 @@ class TaskDispatcher:
         if not modified_files or not hasattr(self.manager, 'current_code'):
             return
 
+        # AENDERUNG 18.10.2026: Manager mit ProjectCodeStore - Dateien direkt patchen
+        store = get_code_store(self.manager)
+        if store is not None:
+            patch = {}
+            for filename in modified_files:
+                new_content = self._extract_file_content_from_result(filename, result_text)
+                if new_content:
+                    patch[filename] = new_content
+            changed = store.apply_patch(patch)
+            if patch:
+                logger.info(f"[UTDS-Sync] {len(patch)}/{len(modified_files)} Dateien synchronisiert "
+                            f"({len(changed)} geaendert)")
+                if hasattr(self.manager, '_ui_log'):
+                    self.manager._ui_log("UTDS-Sync", "Info",
+                        f"{len(patch)} Dateien nach current_code synchronisiert")
+            return
+
         # FIX 05.02.2026: current_code kann String ODER Dict sein
         # Wenn String: NICHT konvertieren (würde andere Funktionen wie merge_repaired_files brechen)
         # Sync nur durchführen wenn current_code bereits ein Dict ist oder None
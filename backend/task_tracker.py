@@ -137,13 +137,13 @@ class TaskTracker:
             task_ids.append(task.id)
             session["task_ids"].append(task.id)
 
-            # Dart-Sync wenn verfuegbar
-            if self.dart_sync:
-                try:
-                    dart_id = self.dart_sync.sync_task(task)
-                    task.dart_id = dart_id
-                except Exception as e:
-                    print(f"[TaskTracker] Dart-Sync fehlgeschlagen: {e}")
+        # Dart-Sync wenn verfuegbar
+        # AENDERUNG 18.10.2026: Ein Batch (parallel) statt sync_task pro Task
+        if self.dart_sync and result.tasks:
+            try:
+                self.dart_sync.sync_batch(result.tasks)
+            except Exception as e:
+                print(f"[TaskTracker] Dart-Sync fehlgeschlagen: {e}")
 
         self._derivation_sessions.append(session)
         self._save_to_file()
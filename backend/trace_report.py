@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Auswertung der Run-Traces aus backend/run_tracer.py.
+              - Kritischer Pfad: die Kette von Spans, die das Run-Ende bestimmt
+                (ab dem Root jeweils das zuletzt endende Kind, davor das Kind,
+                das vor dessen Start endet, ...)
+              - Eigenzeit pro Kategorie (Wall-Zeit ohne Kinder; parallele Kinder
+                werden nur einmal vom Eltern-Span abgezogen)
+              - Flamegraph-Export im Folded-Format (flamegraph.pl, speedscope)
+                und als Chrome-Trace (chrome://tracing, Perfetto)
+
+              CLI:
+                python -m backend.trace_report <run_id|trace-datei> [--top 15] [--json]
+                    [--folded out.folded] [--chrome out.json]
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from .run_tracer import TRACE_DIR, TRACE_SUFFIX, trace_path
+
+# Kinder, die bis zu dieser Luecke (us) vor dem Start des Nachfolgers enden, gelten als Vorgaenger
+_EPS_US = 1000
+
+
+def load_trace(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Liest eine Trace-Datei: (Run-Metadaten, Spans). Defekte Zeilen werden ignoriert."""
+    meta: Dict[str, Any] = {}
+    spans: List[Dict[str, Any]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("type") == "run":
+                meta = record
+            elif "id" in record:
+                record["end_us"] = record["start_us"] + record["dur_us"]
+                spans.append(record)
+    return meta, spans
+
+
+def resolve_trace(run_id_or_path: str, directory: Optional[str] = None) -> Optional[str]:
+    """Pfad zur Trace-Datei aus Run-ID oder Pfad (None wenn nicht vorhanden)."""
+    if os.path.isfile(run_id_or_path):
+        return run_id_or_path
+    path = trace_path(run_id_or_path, directory)
+    return path if os.path.isfile(path) else None
+
+
+def list_traces(directory: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Vorhandene Traces, neueste zuerst."""
+    directory = directory or TRACE_DIR
+    if not os.path.isdir(directory):
+        return []
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith(TRACE_SUFFIX):
+            full = os.path.join(directory, name)
+            stat = os.stat(full)
+            entries.append({"run_id": name[:-len(TRACE_SUFFIX)], "bytes": stat.st_size,
+                            "modified": stat.st_mtime})
+    return sorted(entries, key=lambda e: e["modified"], reverse=True)
+
+
+def _children(spans: List[Dict[str, Any]]) -> Dict[Optional[int], List[Dict[str, Any]]]:
+    known = {s["id"] for s in spans}
+    children: Dict[Optional[int], List[Dict[str, Any]]] = {}
+    for span in spans:
+        parent = span.get("parent") if span.get("parent") in known else None
+        children.setdefault(parent, []).append(span)
+    return children
+
+
+def _union_us(intervals: List[Tuple[int, int]]) -> int:
+    total, cur_start, cur_end = 0, None, None
+    for start, end in sorted(intervals):
+        if cur_end is None or start > cur_end:
+            if cur_end is not None:
+                total += cur_end - cur_start
+            cur_start, cur_end = start, end
+        else:
+            cur_end = max(cur_end, end)
+    if cur_end is not None:
+        total += cur_end - cur_start
+    return total
+
+
+def self_times(spans: List[Dict[str, Any]]) -> Dict[int, int]:
+    """Eigenzeit pro Span: Dauer minus Vereinigung der (auf den Span begrenzten) Kinder."""
+    children = _children(spans)
+    result = {}
+    for span in spans:
+        clipped = [(max(c["start_us"], span["start_us"]), min(c["end_us"], span["end_us"]))
+                   for c in children.get(span["id"], [])]
+        covered = _union_us([(a, b) for a, b in clipped if b > a])
+        result[span["id"]] = max(0, span["dur_us"] - covered)
+    return result
+
+
+def _root(spans: List[Dict[str, Any]], children) -> Dict[str, Any]:
+    roots = children.get(None, [])
+    if len(roots) == 1:
+        return roots[0]
+    # Mehrere Roots: synthetischer Run-Span ueber alle
+    start = min((s["start_us"] for s in roots), default=0)
+    end = max((s["end_us"] for s in roots), default=0)
+    return {"id": None, "name": "run", "cat": "run", "start_us": start, "end_us": end,
+            "dur_us": end - start, "thread": "", "attrs": {}}
+
+
+def critical_path(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Kritischer Pfad als flache Liste (Tiefe, Name, Dauer, Anteil auf dem Pfad).
+
+    "critical_us" ist die Zeit, die der Span selbst (ohne kritische Kinder)
+    zum Run-Ende beitraegt - die Summe ergibt die Run-Dauer.
+    """
+    if not spans:
+        return []
+    children = _children(spans)
+    root = _root(spans, children)
+    result: List[Dict[str, Any]] = []
+
+    def walk(span: Dict[str, Any], depth: int) -> None:
+        kids = children.get(span["id"], []) if span["id"] is not None else children.get(None, [])
+        chain = []
+        cursor = span["end_us"]
+        for child in sorted(kids, key=lambda c: c["end_us"], reverse=True):
+            if child["end_us"] <= cursor + _EPS_US and child["start_us"] >= span["start_us"] - _EPS_US:
+                chain.append(child)
+                cursor = child["start_us"]
+        chain.reverse()
+        entry = {"id": span["id"], "name": span["name"], "category": span["cat"],
+                 "depth": depth, "start_us": span["start_us"], "dur_us": span["dur_us"],
+                 "critical_us": max(0, span["dur_us"] - sum(c["dur_us"] for c in chain)),
+                 "attrs": span.get("attrs", {})}
+        result.append(entry)
+        for child in chain:
+            walk(child, depth + 1)
+
+    walk(root, 0)
+    return result
+
+
+def category_totals(spans: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Summe der Eigenzeiten je Kategorie (us), absteigend."""
+    own = self_times(spans)
+    totals: Dict[str, int] = {}
+    for span in spans:
+        totals[span["cat"]] = totals.get(span["cat"], 0) + own[span["id"]]
+    return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def to_folded(spans: List[Dict[str, Any]]) -> str:
+    """Folded Stacks ("run;phase;llm <us>") - Eingabe fuer flamegraph.pl/speedscope."""
+    by_id = {s["id"]: s for s in spans}
+    own = self_times(spans)
+    stacks: Dict[str, int] = {}
+    for span in spans:
+        names, node, seen = [], span, set()
+        while node is not None and node["id"] not in seen:
+            seen.add(node["id"])
+            names.append(node["name"].replace(";", ",").replace(" ", "_"))
+            node = by_id.get(node.get("parent"))
+        key = ";".join(reversed(names))
+        stacks[key] = stacks.get(key, 0) + own[span["id"]]
+    return "".join(f"{stack} {value}\n" for stack, value in sorted(stacks.items()) if value > 0)
+
+
+def to_chrome_trace(spans: List[Dict[str, Any]], meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Chrome Trace Event Format (Complete Events, ein tid pro Thread)."""
+    threads: Dict[str, int] = {}
+    events = []
+    for span in sorted(spans, key=lambda s: s["start_us"]):
+        tid = threads.setdefault(span.get("thread", ""), len(threads) + 1)
+        events.append({"name": span["name"], "cat": span["cat"], "ph": "X",
+                       "ts": span["start_us"], "dur": span["dur_us"], "pid": 1, "tid": tid,
+                       "args": span.get("attrs", {})})
+    for name, tid in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}})
+    return {"traceEvents": events, "otherData": dict(meta or {})}
+
+
+def build_report(meta: Dict[str, Any], spans: List[Dict[str, Any]], top: int = 15) -> Dict[str, Any]:
+    """Zusammenfassung: Dauer, kritischer Pfad, Kategorien, groesste Einzel-Spans."""
+    path = critical_path(spans)
+    total = path[0]["dur_us"] if path else 0
+    on_path: Dict[str, int] = {}
+    for entry in path:
+        on_path[entry["category"]] = on_path.get(entry["category"], 0) + entry["critical_us"]
+    own = self_times(spans)
+    hottest = sorted(spans, key=lambda s: own[s["id"]], reverse=True)[:top]
+    return {
+        "run_id": meta.get("run_id"),
+        "started_at": meta.get("started_at"),
+        "total_ms": round(total / 1000, 1),
+        "span_count": len(spans),
+        "critical_path": [
+            {"name": e["name"], "category": e["category"], "depth": e["depth"],
+             "duration_ms": round(e["dur_us"] / 1000, 1),
+             "critical_ms": round(e["critical_us"] / 1000, 1)} for e in path],
+        "critical_by_category_ms": {k: round(v / 1000, 1) for k, v in
+                                    sorted(on_path.items(), key=lambda kv: kv[1], reverse=True) if v},
+        "self_by_category_ms": {k: round(v / 1000, 1) for k, v in category_totals(spans).items()},
+        "hottest_spans": [
+            {"name": s["name"], "category": s["cat"], "self_ms": round(own[s["id"]] / 1000, 1),
+             "duration_ms": round(s["dur_us"] / 1000, 1)} for s in hottest],
+    }
+
+
+def render_summary(report: Dict[str, Any]) -> str:
+    """Text-Zusammenfassung fuer die CLI."""
+    lines = [f"Run {report.get('run_id')}: {report['total_ms'] / 1000:.1f}s, "
+             f"{report['span_count']} Spans", "", "Kritischer Pfad:"]
+    for entry in report["critical_path"]:
+        lines.append(f"  {'  ' * entry['depth']}{entry['name']} [{entry['category']}] "
+                     f"{entry['duration_ms'] / 1000:.2f}s (davon {entry['critical_ms'] / 1000:.2f}s selbst)")
+    lines += ["", "Kritische Zeit je Kategorie:"]
+    total = report["total_ms"] or 1
+    for category, ms in report["critical_by_category_ms"].items():
+        lines.append(f"  {category:<12} {ms / 1000:8.2f}s  {100 * ms / total:5.1f}%")
+    lines += ["", "Groesste Eigenzeiten:"]
+    for span in report["hottest_spans"]:
+        lines.append(f"  {span['self_ms'] / 1000:8.2f}s  {span['name']} [{span['category']}]")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Auswertung eines Run-Traces")
+    parser.add_argument("trace", nargs="?", help="Run-ID oder Pfad (Default: neuester Trace)")
+    parser.add_argument("--dir", default=None, help="Trace-Verzeichnis")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="Report als JSON ausgeben")
+    parser.add_argument("--folded", help="Folded-Stacks in Datei schreiben (flamegraph.pl)")
+    parser.add_argument("--chrome", help="Chrome-Trace-JSON in Datei schreiben")
+    args = parser.parse_args(argv)
+
+    target = args.trace
+    if not target:
+        traces = list_traces(args.dir)
+        if not traces:
+            print("Keine Traces gefunden", file=sys.stderr)
+            return 1
+        target = traces[0]["run_id"]
+    path = resolve_trace(target, args.dir)
+    if not path:
+        print(f"Trace nicht gefunden: {target}", file=sys.stderr)
+        return 1
+
+    meta, spans = load_trace(path)
+    report = build_report(meta, spans, top=args.top)
+    if args.folded:
+        with open(args.folded, "w", encoding="utf-8") as f:
+            f.write(to_folded(spans))
+    if args.chrome:
+        with open(args.chrome, "w", encoding="utf-8") as f:
+            json.dump(to_chrome_trace(spans, meta), f)
+    print(json.dumps(report, indent=2, ensure_ascii=False) if args.json else render_summary(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Nicht-blockierende Pipeline fuer OrchestrationManager._ui_log.
+              Bisher lief jeder _ui_log-Aufruf synchron auf dem Agent-Thread:
+              WebSocket-Callback, crew_log.jsonl (inkl. NFC-Normalisierung),
+              Library-Protokoll (schreibt die JSON-Datei komplett neu) und
+              SessionManager unter dessen RLock. Langsame Platte oder Lock-Konkurrenz
+              bremsten damit die Agents selbst.
+
+              Jetzt:
+              - Hot Path: ein Tupel per deque.append (ohne Lock) in die Queue
+              - Ein Hintergrund-Consumer verarbeitet Batches in Reihenfolge und ruft
+                jede Senke einmal pro Batch auf (JSONL-Block, eine Library-Speicherung,
+                eine Session-Lock-Akquisition)
+              - Backpressure: ist die Queue voll, werden unkritische Events verworfen
+                und gezaehlt; kritische Events (Fehler, HELP_NEEDED, Ergebnisse) warten
+                bis block_timeout_ms und werden nie verworfen
+              - flush() an Phasengrenzen (Projektstart, Archivierung, Run-Ende)
+
+              Konfiguration (config.yaml):
+                ui_log_pipeline: {enabled: true, max_queue: 10000, batch_size: 256, block_timeout_ms: 200}
+
+              Mikro-Benchmark (Overhead pro Aufruf auf dem Agent-Thread):
+                python -m backend.ui_log_pipeline [--calls 20000] [--sink-ms 0.2]
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "enabled": True,
+    "max_queue": 10000,
+    "batch_size": 256,
+    "block_timeout_ms": 200,
+}
+
+# Diese Events steuern UI-Zustand oder Session-Status und werden nie verworfen
+CRITICAL_EVENTS = frozenset({
+    "Error", "Failure", "Warning", "HELP_NEEDED", "Result", "Complete", "Status", "Working",
+    "Task Start", "ProjectStart", "ProjectComplete", "Stopped",
+})
+
+# Item: (agent, event, message, on_log, iteration, timestamp)
+UILogItem = Tuple[str, str, Any, Optional[Callable[[str, str, str], None]], int, float]
+Sink = Callable[[List[UILogItem]], None]
+
+
+def get_ui_log_settings(config: Any) -> Dict[str, Any]:
+    """Liest ui_log_pipeline aus der Config (ohne dict-Config: synchron wie bisher)."""
+    settings = dict(DEFAULT_SETTINGS)
+    if not isinstance(config, dict):
+        settings["enabled"] = False
+        return settings
+    raw = config.get("ui_log_pipeline", {}) or {}
+    settings["enabled"] = bool(raw.get("enabled", True))
+    for key in ("max_queue", "batch_size", "block_timeout_ms"):
+        try:
+            settings[key] = max(1, int(raw.get(key, DEFAULT_SETTINGS[key])))
+        except (TypeError, ValueError):
+            pass
+    return settings
+
+
+class UILogPipeline:
+    """
+    Single-Consumer-Queue mit Batch-Senken.
+
+    Mit threaded=False laufen die Senken direkt im Aufrufer (bisheriges Verhalten,
+    gleiche Senken und Fehlerbehandlung).
+    """
+
+    def __init__(self, sinks: Sequence[Tuple[str, Sink]], max_queue: int = 10000, batch_size: int = 256,
+                 block_timeout_ms: float = 200, threaded: bool = True,
+                 critical_events: frozenset = CRITICAL_EVENTS, name: str = "ui-log"):
+        self.sinks = list(sinks)
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.block_timeout = block_timeout_ms / 1000.0
+        self.threaded = threaded
+        self.critical_events = critical_events
+        self.name = name
+        self._queue: deque = deque()
+        self._wake = threading.Event()
+        self._idle = True
+        self._in_flight = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._done = threading.Condition()
+        # Zaehler ausserhalb des Hot Paths (Consumer bzw. seltene Drop-/Block-Pfade)
+        self._stats_lock = threading.Lock()
+        self._processed = 0
+        self._batches = 0
+        self._max_depth = 0
+        self._blocked_submits = 0
+        self._dropped: Dict[str, int] = {}
+        self._sink_errors: Dict[str, int] = {name: 0 for name, _ in self.sinks}
+        self._sink_seconds: Dict[str, float] = {name: 0.0 for name, _ in self.sinks}
+
+    @classmethod
+    def from_config(cls, config: Any, sinks: Sequence[Tuple[str, Sink]]) -> "UILogPipeline":
+        settings = get_ui_log_settings(config)
+        return cls(sinks, max_queue=settings["max_queue"], batch_size=settings["batch_size"],
+                   block_timeout_ms=settings["block_timeout_ms"], threaded=settings["enabled"])
+
+    # ------------------------------------------------------------ Hot Path
+
+    def submit(self, agent: str, event: str, message: Any,
+               on_log: Optional[Callable[[str, str, str], None]] = None, iteration: int = 0) -> bool:
+        """Reiht ein Event ein; False wenn es wegen voller Queue verworfen wurde."""
+        item = (agent, event, message, on_log, iteration, time.time())
+        if not self.threaded or self._closed:
+            self._dispatch([item])
+            return True
+        queue = self._queue
+        if len(queue) >= self.max_queue and not self._make_room(event):
+            return False
+        queue.append(item)
+        if self._idle:
+            self._wake.set()
+            if self._thread is None:
+                self._start()
+        return True
+
+    def _make_room(self, event: str) -> bool:
+        """Backpressure bei voller Queue: unkritisch verwerfen, kritisch kurz warten."""
+        if event not in self.critical_events:
+            with self._stats_lock:
+                self._dropped[event] = self._dropped.get(event, 0) + 1
+            return False
+        with self._stats_lock:
+            self._blocked_submits += 1
+        self._wake.set()
+        deadline = time.monotonic() + self.block_timeout
+        while len(self._queue) >= self.max_queue and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return True
+
+    # ------------------------------------------------------------ Consumer
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"{self.name}-pipeline", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        queue = self._queue
+        while True:
+            self._idle = True
+            if not queue:
+                if self._closed:
+                    return
+                self._wake.wait(0.5)
+                self._wake.clear()
+                if not queue:
+                    continue
+            self._idle = False
+            self._in_flight = 1  # vor popleft setzen, sonst sieht flush() kurz eine leere Queue
+            batch = []
+            while queue and len(batch) < self.batch_size:
+                batch.append(queue.popleft())
+            self._in_flight = len(batch)
+            depth = len(queue) + len(batch)
+            if depth > self._max_depth:
+                self._max_depth = depth
+            self._dispatch(batch)
+            self._in_flight = 0
+            self._batches += 1
+            with self._done:
+                self._done.notify_all()
+
+    def _dispatch(self, batch: List[UILogItem]) -> None:
+        for name, sink in self.sinks:
+            started = time.perf_counter()
+            try:
+                sink(batch)
+            except Exception as e:
+                self._sink_errors[name] = self._sink_errors.get(name, 0) + 1
+                logger.debug("UI-Log-Senke %s fehlgeschlagen: %s", name, e)
+            self._sink_seconds[name] = self._sink_seconds.get(name, 0.0) + time.perf_counter() - started
+        self._processed += len(batch)
+
+    # ------------------------------------------------------------ Steuerung
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wartet bis alle eingereihten Events verarbeitet sind (True) oder timeout."""
+        thread = self._thread
+        if thread is None or thread is threading.current_thread():
+            return not self._queue
+        deadline = time.monotonic() + timeout
+        self._wake.set()
+        with self._done:
+            while self._queue or self._in_flight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._done.wait(min(remaining, 0.05))
+        return True
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """Verarbeitet den Rest und beendet den Consumer; danach laufen Senken synchron."""
+        flushed = self.flush(timeout)
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        return flushed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            dropped = dict(self._dropped)
+            blocked = self._blocked_submits
+        batches = self._batches
+        return {
+            "threaded": self.threaded,
+            "queued": len(self._queue),
+            "processed": self._processed,
+            "batches": batches,
+            "avg_batch": round(self._processed / batches, 1) if batches else 0.0,
+            "max_queue_depth": self._max_depth,
+            "dropped": sum(dropped.values()),
+            "dropped_by_event": dropped,
+            "blocked_submits": blocked,
+            "sink_errors": dict(self._sink_errors),
+            "sink_ms": {name: round(sec * 1000, 2) for name, sec in self._sink_seconds.items()},
+        }
+
+
+# =========================================================================
+# Senken des OrchestrationManagers
+# =========================================================================
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts).isoformat()
+
+
+def websocket_sink(batch: List[UILogItem]) -> None:
+    """on_log-Callback (WebSocket) je Event; ein fehlerhafter Callback stoppt den Rest nicht."""
+    for agent, event, message, on_log, _, _ in batch:
+        if on_log is None:
+            continue
+        try:
+            on_log(agent, event, message)
+        except Exception as e:
+            logger.debug("on_log fehlgeschlagen: %s", e)
+
+
+def jsonl_sink(batch: List[UILogItem]) -> None:
+    from logger_utils import log_events
+    log_events((agent, event, message, datetime.fromtimestamp(ts))
+               for agent, event, message, _, _, ts in batch)
+
+
+def telemetry_sink(batch: List[UILogItem]) -> None:
+    from .run_telemetry import get_run_telemetry
+    telemetry = get_run_telemetry()
+    for agent, event, message, _, _, ts in batch:
+        telemetry.observe(agent, event, message, now=ts)
+
+
+def library_sink(batch: List[UILogItem]) -> None:
+    from .library_manager import get_library_manager
+    library = get_library_manager()
+    if library.current_project:
+        library.log_entries([{"from_agent": agent, "to_agent": "System", "entry_type": event,
+                              "content": message, "iteration": iteration, "timestamp": _iso(ts)}
+                             for agent, event, message, _, iteration, ts in batch])
+
+
+# Events, die den Aktiv-/Blockiert-Status eines Agents in der Session setzen
+SESSION_STATUS_EVENTS = ("Status", "Working", "Result", "Complete", "Error", "HELP_NEEDED")
+
+
+def make_session_sink(session_key_map: Dict[str, str]) -> Sink:
+    def session_sink(batch: List[UILogItem]) -> None:
+        from .session_manager import get_session_manager
+        session_mgr = get_session_manager()
+        session_mgr.add_logs([(agent, event, message, _iso(ts)) for agent, event, message, _, _, ts in batch])
+        for agent, event, message, _, _, _ in batch:
+            if event not in SESSION_STATUS_EVENTS:
+                continue
+            agent_lower = agent.lower().replace("-", "").replace(" ", "")
+            session_key = session_key_map.get(agent, agent_lower)
+            session_mgr.set_agent_active(session_key, event in ("Status", "Working"))
+            if event == "HELP_NEEDED":
+                session_mgr.set_agent_blocked(session_key, True, message)
+    return session_sink
+
+
+def build_orchestration_sinks(session_key_map: Dict[str, str]) -> List[Tuple[str, Sink]]:
+    """Senken in der bisherigen Reihenfolge von _ui_log."""
+    return [
+        ("websocket", websocket_sink),
+        ("jsonl", jsonl_sink),
+        ("telemetry", telemetry_sink),
+        ("library", library_sink),
+        ("session", make_session_sink(session_key_map)),
+    ]
+
+
+# =========================================================================
+# Mikro-Benchmark
+# =========================================================================
+
+def benchmark(calls: int = 20000, sink_ms: float = 0.2, sinks: int = 4) -> Dict[str, Any]:
+    """
+    Overhead pro _ui_log-Aufruf auf dem Agent-Thread: synchron gegen Pipeline.
+
+    Jede simulierte Senke kostet sink_ms pro Batch (Platte, Lock) - synchron
+    zahlt der Agent-Thread das bei jedem Event, mit Pipeline der Consumer.
+    """
+    def slow_sink(batch):
+        time.sleep(sink_ms / 1000.0)
+
+    payload = "x" * 200
+    results = {}
+    # Synchron kostet jeder Aufruf sinks * sink_ms - dort reichen wenige Aufrufe
+    for label, threaded, n in (("sync", False, max(1, min(calls, 500))), ("pipeline", True, calls)):
+        pipeline = UILogPipeline([(f"sink{i}", slow_sink) for i in range(sinks)],
+                                 max_queue=max(calls, 1), threaded=threaded)
+        samples = []
+        started = time.perf_counter()
+        for i in range(n):
+            t0 = time.perf_counter_ns()
+            pipeline.submit("Coder", "Status", payload, None, 0)
+            samples.append(time.perf_counter_ns() - t0)
+        submit_seconds = time.perf_counter() - started
+        pipeline.close(timeout=60)
+        samples.sort()
+        results[label] = {
+            "calls": n,
+            "mean_us": round(sum(samples) / n / 1000, 2),
+            "p50_us": round(samples[n // 2] / 1000, 2),
+            "p99_us": round(samples[min(n - 1, int(n * 0.99))] / 1000, 2),
+            "agent_thread_seconds": round(submit_seconds, 3),
+            "stats": pipeline.stats(),
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Mikro-Benchmark der UI-Log-Pipeline")
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--sink-ms", type=float, default=0.2, help="Simulierte Kosten je Senke und Batch")
+    parser.add_argument("--sinks", type=int, default=4)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.calls, args.sink_ms, args.sinks)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'Modus':<10} {'Aufrufe':>8} {'mean us':>9} {'p50 us':>8} {'p99 us':>9} {'Batches':>8} {'avg Batch':>10}")
+    for label, r in results.items():
+        print(f"{label:<10} {r['calls']:>8} {r['mean_us']:>9} {r['p50_us']:>8} {r['p99_us']:>9} "
+              f"{r['stats']['batches']:>8} {r['stats']['avg_batch']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -24,6 +24,8 @@ class UsageRecord:
     cost_usd: float
     project_id: Optional[str] = None
     task_description: Optional[str] = None
+    # AENDERUNG 18.10.2026: Davon aus dem Provider-Prompt-Cache gelesene Input-Tokens
+    cached_tokens: int = 0
 
 
 @dataclass
@@ -89,3 +91,13 @@ MODEL_ALIASES = {
     "anthropic/claude-opus-4.5-thinking": "anthropic/claude-opus-4.5",
     "x-ai/grok-4.1-thinking": "x-ai/grok-4.1-fast"
 }
+
+# AENDERUNG 18.10.2026: Preisfaktor fuer Cache-Reads relativ zum Input-Preis
+# (Praefix der normalisierten Modell-ID; unbekannte Anbieter konservativ 0.5)
+CACHED_INPUT_FACTORS = {
+    "anthropic/": 0.1,
+    "deepseek/": 0.1,
+    "google/": 0.25,
+    "openai/": 0.5,
+}
+DEFAULT_CACHED_INPUT_FACTOR = 0.5
@@ -2,17 +2,28 @@
 """
 Author: rahn
 Datum: 01.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Budget-Persistenz - Laden und Speichern von Budget-Daten.
               Extrahiert aus budget_tracker.py (Regel 1: Max 500 Zeilen)
+              AENDERUNG 18.10.2026: append_usage_record() fuer mehrere Prozesse
+              (Run-Worker) - Lesen, Anhaengen und atomares Schreiben unter Dateisperre.
 """
 
 import json
 import logging
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import asdict
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 from budget_config import UsageRecord, BudgetConfig, ProjectBudget
 
 logger = logging.getLogger(__name__)
@@ -30,14 +41,79 @@ def load_usage_history(usage_file: Path) -> List[UsageRecord]:
     """
     if usage_file.exists():
         try:
-            with open(usage_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return [UsageRecord(**record) for record in data]
+            return _read_usage_history(usage_file)
         except Exception as e:
             logger.warning(f"Fehler beim Laden der Usage History: {e}")
     return []
 
 
+def _read_usage_history(usage_file: Path) -> List[UsageRecord]:
+    with open(usage_file, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [UsageRecord(**record) for record in data]
+
+
+def _write_atomic(usage_history: List[UsageRecord], usage_file: Path) -> None:
+    """Schreibt ueber eine Temp-Datei - Leser sehen nie eine halb geschriebene Historie."""
+    tmp = usage_file.with_name(f"{usage_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in usage_history], f, indent=2)
+        os.replace(tmp, usage_file)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _usage_file_lock(usage_file: Path):
+    """Exklusive Sperre ueber eine Nachbardatei (prozess- und threaduebergreifend)."""
+    with open(usage_file.with_name(usage_file.name + ".lock"), "a+") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def append_usage_record(record: UsageRecord, usage_file: Path) -> Optional[List[UsageRecord]]:
+    """
+    Haengt einen UsageRecord an die Historie auf der Platte an.
+
+    Jeder Run-Worker hat einen eigenen BudgetTracker; statt die eigene Liste
+    zurueckzuschreiben (und damit fremde Eintraege zu ueberschreiben) wird unter
+    Dateisperre der aktuelle Stand gelesen, ergaenzt und atomar ersetzt.
+
+    Args:
+        record: Neuer UsageRecord
+        usage_file: Pfad zur Usage-Datei
+
+    Returns:
+        Zusammengefuehrte Historie, None wenn die Datei nicht lesbar/schreibbar ist
+        (sie wird dann nicht angefasst)
+    """
+    try:
+        with _usage_file_lock(usage_file):
+            history = _read_usage_history(usage_file) if usage_file.exists() else []
+            history.append(record)
+            _write_atomic(history, usage_file)
+            return history
+    except (OSError, IOError, TypeError, ValueError) as e:
+        logger.error(f"Fehler beim Anhaengen an die Usage History: {e}. Datei: {usage_file}")
+        return None
+
+
 def save_usage_history(usage_history: List[UsageRecord], usage_file: Path) -> bool:
     """
     Speichert Nutzungshistorie in Datei.
@@ -50,8 +126,7 @@ def save_usage_history(usage_history: List[UsageRecord], usage_file: Path) -> bo
         True bei Erfolg, False bei Fehler
     """
     try:
-        with open(usage_file, "w", encoding="utf-8") as f:
-            json.dump([asdict(r) for r in usage_history], f, indent=2)
+        _write_atomic(usage_history, usage_file)
         return True
     except (OSError, IOError, TypeError, ValueError) as e:
         logger.error(f"Fehler beim Speichern der Usage History: {e}. Datei: {usage_file}")
@@ -34,10 +34,13 @@ def get_today_totals(usage_history: List[UsageRecord]) -> Dict[str, Any]:
 
     total_tokens = sum(r.total_tokens for r in today_records)
     total_cost = sum(r.cost_usd for r in today_records)
+    # AENDERUNG 18.10.2026: Aus dem Provider-Prompt-Cache gelesene Input-Tokens
+    cached_tokens = sum(r.cached_tokens for r in today_records)
 
     return {
         "total_tokens": total_tokens,
         "total_cost": round(total_cost, 6),
+        "cached_tokens": cached_tokens,
         "records_count": len(today_records)
     }
 
@@ -31,12 +31,15 @@ from budget_config import (
     ProjectBudget,
     BudgetConfig,
     MODEL_PRICES,
-    MODEL_ALIASES
+    MODEL_ALIASES,
+    CACHED_INPUT_FACTORS,
+    DEFAULT_CACHED_INPUT_FACTOR
 )
 
 from budget_persistence import (
     load_usage_history,
     save_usage_history,
+    append_usage_record,
     load_config,
     save_config,
     load_projects,
@@ -99,6 +102,7 @@ class BudgetTracker:
 
         # Lade persistierte Daten
         self.usage_history: List[UsageRecord] = load_usage_history(self.usage_file)
+        self._usage_mtime_ns = self._usage_file_mtime_ns()
         self.config: BudgetConfig = load_config(self.config_file)
         self.projects: Dict[str, ProjectBudget] = load_projects(self.projects_file)
 
@@ -120,14 +124,16 @@ class BudgetTracker:
         self._on_alert = callback
         self._alert_manager.on_alert = callback
 
-    def calculate_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    def calculate_cost(self, model: str, prompt_tokens: int, completion_tokens: int,
+                       cached_tokens: int = 0) -> float:
         """
         Berechnet die Kosten für einen API-Aufruf.
 
         Args:
             model: Modell-ID
-            prompt_tokens: Anzahl Input-Tokens
+            prompt_tokens: Anzahl Input-Tokens (inkl. gecachter Tokens)
             completion_tokens: Anzahl Output-Tokens
+            cached_tokens: Davon aus dem Prompt-Cache gelesen (verguenstigt)
 
         Returns:
             Kosten in USD
@@ -138,8 +144,17 @@ class BudgetTracker:
 
         prices = MODEL_PRICES.get(normalized_model, {"input": 0.0, "output": 0.0})
 
+        # AENDERUNG 18.10.2026: Cache-Reads mit Anbieter-Rabatt abrechnen
+        cached_tokens = min(max(cached_tokens or 0, 0), prompt_tokens)
+        cached_factor = next(
+            (factor for prefix, factor in CACHED_INPUT_FACTORS.items()
+             if normalized_model.startswith(prefix)),
+            DEFAULT_CACHED_INPUT_FACTOR
+        )
+        billed_input = (prompt_tokens - cached_tokens) + cached_tokens * cached_factor
+
         # Preise sind pro 1M Tokens
-        input_cost = (prompt_tokens / 1_000_000) * prices["input"]
+        input_cost = (billed_input / 1_000_000) * prices["input"]
         output_cost = (completion_tokens / 1_000_000) * prices["output"]
 
         return round(input_cost + output_cost, 6)
@@ -151,7 +166,8 @@ class BudgetTracker:
         prompt_tokens: int,
         completion_tokens: int,
         project_id: Optional[str] = None,
-        task_description: Optional[str] = None
+        task_description: Optional[str] = None,
+        cached_tokens: int = 0
     ) -> UsageRecord:
         """
         Zeichnet eine API-Nutzung auf.
@@ -163,13 +179,14 @@ class BudgetTracker:
             completion_tokens: Output-Tokens
             project_id: Optionale Projekt-ID
             task_description: Optionale Beschreibung
+            cached_tokens: Davon aus dem Provider-Prompt-Cache gelesene Input-Tokens
 
         Returns:
             Der erstellte UsageRecord
         """
         from datetime import datetime
 
-        cost = self.calculate_cost(model, prompt_tokens, completion_tokens)
+        cost = self.calculate_cost(model, prompt_tokens, completion_tokens, cached_tokens)
         total_tokens = prompt_tokens + completion_tokens
 
         record = UsageRecord(
@@ -181,11 +198,18 @@ class BudgetTracker:
             total_tokens=total_tokens,
             cost_usd=cost,
             project_id=project_id,
-            task_description=task_description
+            task_description=task_description,
+            cached_tokens=cached_tokens or 0
         )
 
-        self.usage_history.append(record)
-        save_usage_history(self.usage_history, self.usage_file)
+        # AENDERUNG 18.10.2026: Run-Worker haben eigene Tracker - anhaengen statt
+        # die eigene Liste zurueckzuschreiben, fremde Eintraege werden uebernommen
+        merged = append_usage_record(record, self.usage_file)
+        if merged is None:
+            self.usage_history.append(record)
+        else:
+            self.usage_history = merged
+            self._usage_mtime_ns = self._usage_file_mtime_ns()
 
         # Update Projekt-Kosten falls vorhanden
         if project_id and project_id in self.projects:
@@ -201,6 +225,26 @@ class BudgetTracker:
     # Reporting (delegiert)
     # =========================================================================
 
+    def _usage_file_mtime_ns(self) -> Optional[int]:
+        try:
+            return self.usage_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_usage_history(self) -> List[UsageRecord]:
+        """
+        Laedt die Historie neu, wenn andere Prozesse (Run-Worker) sie geaendert haben.
+
+        Returns:
+            Aktuelle Nutzungshistorie
+        """
+        # AENDERUNG 18.10.2026: Admission-Control sieht sonst die Worker-Ausgaben nicht
+        mtime_ns = self._usage_file_mtime_ns()
+        if mtime_ns is not None and mtime_ns != self._usage_mtime_ns:
+            self.usage_history = load_usage_history(self.usage_file)
+            self._usage_mtime_ns = mtime_ns
+        return self.usage_history
+
     def get_today_totals(self) -> Dict[str, Any]:
         """Gibt Token- und Kosten-Totals für heute zurück."""
         return _get_today_totals(self.usage_history)
@@ -21,6 +21,8 @@ from .base_specialist import (
     SpecialistStatus,
     SpecialistCategory
 )
+# AENDERUNG 18.10.2026: Geteilter HTTP-Client mit Verbindungspool
+from backend.http_client import get_http_client, HttpClientError, HttpTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +42,8 @@ class EXASpecialist(BaseSpecialist):
             max_results: 10
     """
 
+    API_URL = "https://api.exa.ai/search"
+
     @property
     def name(self) -> str:
         return "EXA Search"
@@ -208,6 +212,9 @@ class EXASpecialist(BaseSpecialist):
         """
         Ruft die EXA API auf.
 
+        AENDERUNG 18.10.2026: Gemeinsamer HTTP-Client mit Keep-Alive-Pool statt
+        einer neuen aiohttp-Session pro Aufruf bzw. urllib-Fallback.
+
         Args:
             api_key: EXA API Key
             query: Suchanfrage
@@ -218,13 +225,6 @@ class EXASpecialist(BaseSpecialist):
         Returns:
             API Response als Dict oder None bei Fehler
         """
-        try:
-            import aiohttp
-        except ImportError:
-            logger.warning("aiohttp nicht installiert - verwende synchronen Fallback")
-            return await self._call_exa_api_sync(api_key, query, num_results, search_type, timeout)
-
-        url = "https://api.exa.ai/search"
         headers = {
             "x-api-key": api_key,
             "Content-Type": "application/json"
@@ -240,67 +240,25 @@ class EXASpecialist(BaseSpecialist):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=timeout)
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 429:
-                        # Rate Limit
-                        cooldown = self.config.get("cooldown_seconds", 300)
-                        self.set_cooldown(cooldown)
-                        logger.warning(f"EXA Rate Limit - Cooldown {cooldown}s")
-                        return None
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"EXA API Fehler {response.status}: {error_text[:200]}")
-                        return None
-
-        except aiohttp.ClientError as e:
+            response = await get_http_client().apost(
+                self.API_URL, json_body=payload, headers=headers, timeout=timeout
+            )
+        except HttpTimeoutError as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except HttpClientError as e:
             logger.error(f"EXA HTTP Fehler: {e}")
             return None
 
-    async def _call_exa_api_sync(
-        self,
-        api_key: str,
-        query: str,
-        num_results: int,
-        search_type: str,
-        timeout: int
-    ) -> Optional[Dict[str, Any]]:
-        """Synchroner Fallback wenn aiohttp nicht verfuegbar."""
-        import urllib.request
-        import json
-
-        url = "https://api.exa.ai/search"
-        headers = {
-            "x-api-key": api_key,
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "query": query,
-            "numResults": num_results,
-            "type": search_type,
-            "useAutoprompt": True
-        }
-
-        try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(url, data=data, headers=headers, method='POST')
-
-            def do_request():
-                with urllib.request.urlopen(req, timeout=timeout) as response:
-                    return json.loads(response.read().decode('utf-8'))
-
-            result = await asyncio.to_thread(do_request)
-            return result
-
-        except Exception as e:
-            logger.error(f"EXA Sync API Fehler: {e}")
+        if response.status == 200:
+            return response.json()
+        elif response.status == 429:
+            # Rate Limit
+            cooldown = self.config.get("cooldown_seconds", 300)
+            self.set_cooldown(cooldown)
+            logger.warning(f"EXA Rate Limit - Cooldown {cooldown}s")
+            return None
+        else:
+            logger.error(f"EXA API Fehler {response.status}: {response.text[:200]}")
             return None
 
     def _parse_results(self, api_response: Dict[str, Any]) -> List[SpecialistFinding]:
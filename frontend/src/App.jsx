@@ -274,7 +274,10 @@ const App = () => {
   const {
     helpRequests,
     dismissHelpRequest,
-    clearHelpRequests
+    clearHelpRequests,
+    // AENDERUNG 18.10.2026: Run-Scheduler — nur Events des eigenen Runs anzeigen
+    followRun,
+    awaitQueuedRun
   } = useWebSocket(setLogs, activeAgents, setActiveAgents, setAgentData, setStatus, handleReconnect);
   // ÄNDERUNG 08.02.2026: researchTimeoutMinutes + handleResearchTimeoutChange entfernt (pro Agent im ModelModal)
   const {
@@ -573,16 +576,31 @@ const App = () => {
           await new Promise(r => setTimeout(r, 1500));
           setStatus('Working');
           setLogs([]);
-          await axios.post(`${API_BASE}/run`, payload);
+          const restarted = await axios.post(`${API_BASE}/run`, payload);
+          followRun(restarted.data?.run_id);
         }
         return;
       }
+      // AENDERUNG 18.10.2026: Run-Scheduler — Run wartet in der Warteschlange
+      if (response.data?.status === 'queued') {
+        awaitQueuedRun(response.data.run_id);
+        setStatus('Idle');
+        const eta = response.data.eta_seconds != null ? `, Start in ca. ${Math.ceil(response.data.eta_seconds / 60)} min` : '';
+        const reason = response.data.blocked_reason ? ` (${response.data.blocked_reason})` : '';
+        setLogs(prev => [...prev, {
+          agent: 'Scheduler', event: 'RunQueued',
+          message: `Run ${response.data.run_id} eingereiht: Position ${response.data.position}${eta}${reason}`
+        }]);
+        return;
+      }
+      // AENDERUNG 18.10.2026: Dem neuen Run folgen (ohne Scheduler fehlt run_id → Haupt-Run)
+      followRun(response.data?.run_id);
     } catch (err) {
       console.error("Backend-Verbindung fehlgeschlagen:", err);
       setLogs(prev => [...prev, { agent: 'System', event: 'Error', message: 'Keine Verbindung zum Backend.' }]);
       setStatus('Error');
     }
-  }, [goal, projectName]);
+  }, [goal, projectName, followRun, awaitQueuedRun]);
 
   useEffect(() => {
     const handleKeyDown = (e) => {
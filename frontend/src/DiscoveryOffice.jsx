@@ -398,7 +398,7 @@ const DiscoveryOffice = ({
 
           {/* Phase 2.5: Dynamische LLM-Fragen */}
           {/* ÄNDERUNG 29.01.2026 v1.3: Flache Fragen-Struktur nach Deduplizierung */}
-          {phase === PHASES.DYNAMIC_QUESTIONS && dynamicQuestions.length > 0 && (
+          {phase === PHASES.DYNAMIC_QUESTIONS && currentDynamicIndex < dynamicQuestions.length && (
             <motion.div
               key={`dynamic-${currentDynamicIndex}`}
               initial={{ opacity: 0 }}
@@ -414,6 +414,20 @@ const DiscoveryOffice = ({
             </motion.div>
           )}
 
+          {/* AENDERUNG 18.10.2026: Alle bisherigen Fragen beantwortet, Stream liefert noch */}
+          {phase === PHASES.DYNAMIC_QUESTIONS && dynamicQuestions.length > 0
+            && currentDynamicIndex >= dynamicQuestions.length && (
+            <motion.div
+              key="dynamic-waiting"
+              initial={{ opacity: 0 }}
+              animate={{ opacity: 1 }}
+              exit={{ opacity: 0 }}
+              className="bg-slate-800 rounded-xl p-8 border border-slate-700 text-center text-slate-300"
+            >
+              Weitere Fragen werden generiert...
+            </motion.div>
+          )}
+
           {/* ÄNDERUNG 29.01.2026 v1.2: Feedback-Schleife nach Agent-Runde */}
           {phase === PHASES.AGENT_FEEDBACK && completedAgent && (
             <motion.div
@@ -1,15 +1,16 @@
 /**
  * Author: rahn
  * Datum: 29.01.2026
- * Version: 1.3
+ * Version: 1.4
  * Beschreibung: Hook für Fragen-Logik, Antworten und Agentensteuerung.
  */
 // ÄNDERUNG 29.01.2026: Fragen- und Antwort-Logik ausgelagert
 // ÄNDERUNG 29.01.2026 v1.1: restoreSession Funktion für vollständigen Session-Restore
 // ÄNDERUNG 29.01.2026 v1.2: Feedback-Schleifen nach Agent-Runden
 // ÄNDERUNG 29.01.2026 v1.3: LLM-basierte intelligente Agenten-Auswahl
+// AENDERUNG 18.10.2026 v1.4: Dynamische Fragen parallel generiert und als Stream angezeigt
 
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useEffect, useRef } from 'react';
 import { PHASES } from '../constants/discoveryConstants';
 
 export const useQuestions = ({
@@ -34,6 +35,9 @@ export const useQuestions = ({
   // ÄNDERUNG 29.01.2026 v1.3: LLM-basierte Agenten-Auswahl State
   const [agentReasons, setAgentReasons] = useState({});
   const [notNeededAgents, setNotNeededAgents] = useState({});
+  // AENDERUNG 18.10.2026 v1.4: Fragen-Stream laeuft noch / Benutzer wartet auf weitere Fragen
+  const [questionsStreaming, setQuestionsStreaming] = useState(false);
+  const awaitingMoreRef = useRef(false);
 
   // ÄNDERUNG 29.01.2026 v1.3: Async LLM-basierte Agenten-Auswahl
   const handleVisionSubmit = useCallback(async () => {
@@ -93,12 +97,81 @@ export const useQuestions = ({
     setLoadingMessage('');
   }, [vision, apiBase, defaultQuestions, setPhase, setIsLoading, setLoadingMessage]);
 
+  // AENDERUNG 18.10.2026 v1.4: Liefert false, wenn der Stream nicht verfuegbar ist
+  const readQuestionStream = useCallback(async () => {
+    const response = await fetch(`${apiBase}/discovery/generate-questions/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ vision, agents: selectedAgents, parallel: true })
+    });
+    if (!response.ok || !response.body) return false;
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let questions = [];
+    let shown = false;
+
+    setQuestionsStreaming(true);
+    try {
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+
+        for (const line of lines) {
+          if (!line.trim()) continue;
+          const event = JSON.parse(line);
+          if (event.type === 'done') {
+            // Endergebnis enthaelt die zusammengefuehrten Agenten/Optionen
+            questions = event.result?.questions || questions;
+          } else {
+            questions = [...questions, ...(event.questions || [])];
+          }
+          setDynamicQuestions(questions);
+
+          if (!shown && questions.length > 0) {
+            shown = true;
+            setCurrentDynamicIndex(0);
+            setPhase(PHASES.DYNAMIC_QUESTIONS);
+            setIsLoading(false);
+            setLoadingMessage('');
+          }
+        }
+      }
+    } catch (error) {
+      // Bereits angezeigte Fragen bleiben - sonst sequentieller Fallback
+      if (!shown) throw error;
+      console.warn('Fragen-Stream abgebrochen:', error);
+    } finally {
+      setQuestionsStreaming(false);
+    }
+
+    if (!shown) {
+      setCurrentAgent(selectedAgents[0]);
+      setCurrentQuestionIndex(0);
+      setPhase(PHASES.GUIDED_QA);
+      setIsLoading(false);
+      setLoadingMessage('');
+    }
+    return true;
+  }, [apiBase, selectedAgents, vision, setPhase, setIsLoading, setLoadingMessage]);
+
   const handleTeamConfirm = useCallback(async () => {
     if (selectedAgents.length === 0) return;
 
     setIsLoading(true);
     setLoadingMessage('Agenten analysieren dein Projekt...');
 
+    // AENDERUNG 18.10.2026 v1.4: Paralleler NDJSON-Stream - erste Fragen nach einem LLM-Call
+    try {
+      if (await readQuestionStream()) return;
+    } catch (error) {
+      console.warn('Fragen-Stream fehlgeschlagen, verwende sequentielle Generierung:', error);
+    }
+
     try {
       const response = await fetch(`${apiBase}/discovery/generate-questions`, {
         method: 'POST',
@@ -133,7 +206,25 @@ export const useQuestions = ({
       setIsLoading(false);
       setLoadingMessage('');
     }
-  }, [apiBase, selectedAgents, vision, setPhase, setIsLoading, setLoadingMessage]);
+  }, [apiBase, selectedAgents, vision, setPhase, setIsLoading, setLoadingMessage, readQuestionStream]);
+
+  const finishDynamicQuestions = useCallback(() => {
+    // ÄNDERUNG 29.01.2026 v1.2: Feedback nach dynamischen Fragen
+    setCompletedAgent('Dynamische Fragen');
+    setPendingNextAgent(selectedAgents[0]);
+    setPhase(PHASES.AGENT_FEEDBACK);
+  }, [selectedAgents, setPhase]);
+
+  // AENDERUNG 18.10.2026 v1.4: Am Ende der Liste auf weitere Stream-Fragen warten
+  useEffect(() => {
+    if (!awaitingMoreRef.current) return;
+    if (currentDynamicIndex < dynamicQuestions.length) {
+      awaitingMoreRef.current = false;
+    } else if (!questionsStreaming) {
+      awaitingMoreRef.current = false;
+      finishDynamicQuestions();
+    }
+  }, [currentDynamicIndex, dynamicQuestions.length, questionsStreaming, finishDynamicQuestions]);
 
   const handleDynamicAnswer = useCallback((answer) => {
     if (!answer.skipped) {
@@ -154,13 +245,14 @@ export const useQuestions = ({
 
     if (currentDynamicIndex < dynamicQuestions.length - 1) {
       setCurrentDynamicIndex(prev => prev + 1);
+    } else if (questionsStreaming) {
+      // AENDERUNG 18.10.2026 v1.4: Weitere Agenten liefern noch Fragen
+      awaitingMoreRef.current = true;
+      setCurrentDynamicIndex(prev => prev + 1);
     } else {
-      // ÄNDERUNG 29.01.2026 v1.2: Feedback nach dynamischen Fragen
-      setCompletedAgent('Dynamische Fragen');
-      setPendingNextAgent(selectedAgents[0]);
-      setPhase(PHASES.AGENT_FEEDBACK);
+      finishDynamicQuestions();
     }
-  }, [currentDynamicIndex, dynamicQuestions.length, selectedAgents, setPhase]);
+  }, [currentDynamicIndex, dynamicQuestions.length, questionsStreaming, finishDynamicQuestions]);
 
   const handleAnswer = useCallback((questionId, selectedValues, customText = null, skipped = false) => {
     const currentQ = agentQuestions[currentAgent]?.[currentQuestionIndex];
@@ -247,6 +339,8 @@ export const useQuestions = ({
     agentQuestions,
     dynamicQuestions,
     currentDynamicIndex,
+    // AENDERUNG 18.10.2026 v1.4: Fragen-Stream aktiv
+    questionsStreaming,
     currentAgent,
     currentQuestionIndex,
     answers,
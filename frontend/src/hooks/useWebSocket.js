@@ -1,7 +1,7 @@
 /**
  * Author: rahn
  * Datum: 03.02.2026
- * Version: 2.5
+ * Version: 2.6
  * Beschreibung: Custom Hook fuer WebSocket-Verbindung zum Backend.
  *               Verarbeitet Echtzeit-Nachrichten von den Agenten.
  *               ÄNDERUNG 01.02.2026 v2.3: Refaktoriert in Module (Regel 1: Max 500 Zeilen)
@@ -11,6 +11,7 @@
  *               AENDERUNG 01.02.2026 v2.4: UTDS Event Routing hinzugefuegt
  *               AENDERUNG 03.02.2026 v2.5: ROOT-CAUSE-FIX - Worker-Status Reset bei COMPLETION_EVENT
  *                                          und System Reset. Bug Fix: Glow-Effekt stoppte nicht.
+ *               AENDERUNG 18.10.2026 v2.6: Run-Scheduler - Events nach run_id filtern (followRun)
  */
 
 import { useEffect, useRef, useState, useCallback } from 'react';
@@ -22,6 +23,7 @@ import {
   WORKING_EVENTS,
   COMPLETION_EVENTS,
   AGENT_TO_DATA_KEY,
+  MAX_FOREIGN_EVENTS,
   getReconnectDelay
 } from './webSocketConstants';
 
@@ -44,6 +46,16 @@ import {
 
 import { useWebSocketHelp } from './useWebSocketHelp';
 
+/**
+ * AENDERUNG 18.10.2026: Gehoert ein Event zum Run, dem die UI folgt?
+ * Ohne verfolgten Run zaehlt nur der Run im Server-Prozess (Session-State), keine Worker-Runs.
+ */
+const isFollowedEvent = (data, followedRunId) => {
+  if (!data.run_id) return true;
+  if (followedRunId) return data.run_id === followedRunId;
+  return data.isolation !== 'process';
+};
+
 /**
  * WebSocket Hook fuer Echtzeit-Kommunikation mit dem Backend.
  * Unterstuetzt automatische Reconnection bei Verbindungsverlust.
@@ -54,7 +66,8 @@ import { useWebSocketHelp } from './useWebSocketHelp';
  * @param {Function} setAgentData - Setter fuer strukturierte Agenten-Daten
  * @param {Function} setStatus - Setter fuer globalen Status
  * @param {Function} [onReconnect] - Optionaler Callback nach erfolgreicher Wiederverbindung
- * @returns {Object} { ws, isConnected, reconnectAttempts, helpRequests, dismissHelpRequest, clearHelpRequests }
+ * @returns {Object} { ws, isConnected, reconnectAttempts, helpRequests, dismissHelpRequest, clearHelpRequests,
+ *                     followRun, awaitQueuedRun }
  */
 const useWebSocket = (setLogs, activeAgents, setActiveAgents, setAgentData, setStatus, onReconnect) => {
   const ws = useRef(null);
@@ -80,11 +93,16 @@ const useWebSocket = (setLogs, activeAgents, setActiveAgents, setAgentData, setS
     activeAgentsRef.current = activeAgents;
   }, [activeAgents]);
 
-  // Message Handler
-  const handleMessage = useCallback((event) => {
-    try {
-      const data = JSON.parse(event.data);
+  // AENDERUNG 18.10.2026: Run-Scheduler — Events paralleler Runs tragen eine run_id.
+  // Die UI folgt genau einem Run; Events fremder Runs werden nicht angezeigt, aber kurz
+  // gepuffert, weil die ersten Events eines neuen Runs vor der /run-Antwort eintreffen.
+  const followedRunIdRef = useRef(null);
+  const pendingRunIdsRef = useRef(new Set());
+  const foreignEventsRef = useRef([]);
 
+  // Event verarbeiten (Logs, Agenten-Status, Panels)
+  const processEvent = useCallback((data) => {
+    try {
       // Log-Array auf max 1000 Eintraege limitieren
       setLogs((prev) => {
         const newLogs = [...prev, data];
@@ -227,10 +245,49 @@ const useWebSocket = (setLogs, activeAgents, setActiveAgents, setAgentData, setS
       }
 
     } catch (e) {
-      console.warn('WebSocket Message parsen fehlgeschlagen:', e);
+      console.warn('WebSocket Event verarbeiten fehlgeschlagen:', e);
     }
   }, [setActiveAgents, setAgentData, setLogs, setStatus, handleHelpNeeded]);
 
+  // AENDERUNG 18.10.2026: Ab jetzt nur noch Events dieses Runs anzeigen (null = Haupt-Run)
+  const followRun = useCallback((runId) => {
+    followedRunIdRef.current = runId || null;
+    pendingRunIdsRef.current.delete(runId);
+    const buffered = runId ? foreignEventsRef.current.filter(e => e.run_id === runId) : [];
+    foreignEventsRef.current = [];
+    buffered.forEach(processEvent);
+  }, [processEvent]);
+
+  // AENDERUNG 18.10.2026: Eingereihten Run verfolgen, sobald der Scheduler ihn startet
+  const awaitQueuedRun = useCallback((runId) => {
+    if (runId) pendingRunIdsRef.current.add(runId);
+  }, []);
+
+  // Message Handler
+  const handleMessage = useCallback((event) => {
+    let data;
+    try {
+      data = JSON.parse(event.data);
+    } catch (e) {
+      console.warn('WebSocket Message parsen fehlgeschlagen:', e);
+      return;
+    }
+
+    if (data.agent === 'Scheduler' && data.event === 'RunStarted' &&
+        pendingRunIdsRef.current.has(data.run_id)) {
+      setStatus('Working');
+      followRun(data.run_id);
+    }
+
+    if (!isFollowedEvent(data, followedRunIdRef.current)) {
+      const buffer = foreignEventsRef.current;
+      buffer.push(data);
+      if (buffer.length > MAX_FOREIGN_EVENTS) buffer.splice(0, buffer.length - MAX_FOREIGN_EVENTS);
+      return;
+    }
+    processEvent(data);
+  }, [processEvent, followRun, setStatus]);
+
   // WebSocket-Verbindung herstellen
   const connect = useCallback(() => {
     // Vorherige Verbindung bereinigen
@@ -389,7 +446,9 @@ const useWebSocket = (setLogs, activeAgents, setActiveAgents, setAgentData, setS
     reconnectAttempts: reconnectAttempts.current,
     helpRequests,
     dismissHelpRequest,
-    clearHelpRequests
+    clearHelpRequests,
+    followRun,
+    awaitQueuedRun
   };
 };
 
@@ -18,6 +18,8 @@ export const MAX_RECONNECT_ATTEMPTS = 50;
 export const HEARTBEAT_INTERVAL = 30000;  // 30 Sekunden
 export const BASE_RECONNECT_DELAY = 1000;  // 1 Sekunde
 export const MAX_RECONNECT_DELAY = 60000;  // 60 Sekunden (war 30s)
+// AENDERUNG 18.10.2026: Puffer fuer Events fremder Runs (Run-Scheduler, run_id)
+export const MAX_FOREIGN_EVENTS = 500;
 
 // Events die anzeigen dass ein Agent arbeitet
 // AENDERUNG 02.02.2026: 'Heartbeat' ENTFERNT - Heartbeats duerfen Status nicht aendern
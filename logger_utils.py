@@ -2,9 +2,10 @@
 """
 Author: rahn
 Datum: 01.02.2026
-Version: 1.1
+Version: 1.2
 Beschreibung: Logger Utilities - JSON-basiertes Event-Logging für die Agenten-Crew.
               AENDERUNG 01.02.2026: Robustes Encoding fuer Windows-Kompatibilitaet.
+              AENDERUNG 18.10.2026: log_events() schreibt mehrere Eintraege mit einem Handler-Aufruf.
 """
 
 import json
@@ -58,8 +59,7 @@ def _sanitize_string(s: str) -> str:
     return s
 
 
-def log_event(agent_name: str, action: str, content: str):
-    """Schreibt einen Logeintrag mit Zeitstempel in crew_log.jsonl."""
+def _build_entry(agent_name: str, action: str, content, timestamp: datetime = None) -> dict:
     # Safety Check: If content is not string, convert it
     if not isinstance(content, str):
         content = str(content)
@@ -69,20 +69,42 @@ def log_event(agent_name: str, action: str, content: str):
     action = _sanitize_string(action)
     content = _sanitize_string(content)
 
-    entry = {
-        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    return {
+        "timestamp": (timestamp or datetime.now()).isoformat(timespec="seconds"),
         "agent": agent_name,
         "action": action,
         "content": content.strip()[:5000], # Limit content length
     }
+
+
+def _write(entries: list) -> None:
     try:
-        _logger.info(json.dumps(entry, ensure_ascii=False))
+        _logger.info("\n".join(json.dumps(entry, ensure_ascii=False) for entry in entries))
     except UnicodeEncodeError:
         # Fallback: ASCII-safe encoding
-        _logger.info(json.dumps(entry, ensure_ascii=True))
+        _logger.info("\n".join(json.dumps(entry, ensure_ascii=True) for entry in entries))
     except Exception as e:
         # Sichere Ausgabe ohne Unicode-Zeichen
         print(f"LOG ERROR: {str(e)[:100]}")
 
+
+def log_event(agent_name: str, action: str, content: str):
+    """Schreibt einen Logeintrag mit Zeitstempel in crew_log.jsonl."""
+    _write([_build_entry(agent_name, action, content)])
+
+
+def log_events(events) -> None:
+    """
+    AENDERUNG 18.10.2026: Schreibt mehrere Logeintraege als ein JSONL-Block
+    (ein Handler-Lock und ein Flush statt einem pro Eintrag).
+
+    Args:
+        events: Iterable aus (agent_name, action, content) oder
+                (agent_name, action, content, datetime) Tupeln
+    """
+    entries = [_build_entry(*event) for event in events]
+    if entries:
+        _write(entries)
+
     # Optional: Print to console if needed (already handled by Rich in main, but good as backup)
     # print(f"[LOG] {entry['timestamp']} - {agent_name}: {action}")
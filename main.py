@@ -49,6 +49,7 @@ from file_utils import find_html_file
 # AENDERUNG 09.02.2026: Fix 36 — System-Level Blacklist
 # AENDERUNG 10.02.2026: Fix 48 — validate_before_write fuer Truncation-Guard
 from backend.dev_loop_helpers import is_forbidden_file, validate_before_write
+from backend.project_code_store import split_code_blocks
 
 # ÄNDERUNG 29.01.2026: Discovery Session für strukturierte Projektaufnahme
 from discovery_session import DiscoverySession
@@ -109,15 +110,13 @@ def save_multi_file_output(project_path: str, code_output: str,
     AENDERUNG 10.02.2026: Fix 44 — is_patch_mode Parameter fuer Phantom-Datei-Schutz.
     """
     import re
-    # Pattern: ### [KEYWORD:] Pfad/zur/Datei.ext
     # ÄNDERUNG 24.01.2026: Robusteres Pattern das auch trailing : erfasst und entfernt
-    # Erlaubte Präfixe: FILENAME:, FILE:, PATH:, DATEI:, PFAD: (case-insensitive durch split)
-    # Das trailing :? am Ende entfernt optionale : nach dem Dateinamen
-    pattern = r"###\s*(?:FILENAME|FILE|PATH|DATEI|PFAD)?:?\s*(.+?):?\s*[\r\n]+"
-    parts = re.split(pattern, code_output)
-    
-    # Wenn kein Split (oder nur 1 Teil), dann kein Multi-File-Format
-    if len(parts) < 2:
+    # Erlaubte Präfixe: FILENAME:, FILE:, PATH:, DATEI:, PFAD:
+    # AENDERUNG 18.10.2026: Gemeinsamer Parser aus backend/project_code_store.py
+    blocks = split_code_blocks(code_output)
+
+    # Wenn kein Marker gefunden, dann kein Multi-File-Format
+    if not blocks:
         # Fallback: Alles in eine Datei
         file_path = os.path.join(project_path, default_filename)
         # Bugfix: Sicherstellen, dass der Ordner existiert
@@ -129,16 +128,7 @@ def save_multi_file_output(project_path: str, code_output: str,
         return [file_path]
 
     created_files = []
-    # Start bei Index 1, da Index 0 der Preamble ist
-    # ÄNDERUNG 24.01.2026: Bounds-Check hinzugefügt um IndexError zu vermeiden
-    for i in range(1, len(parts), 2):
-        # Prüfe ob genügend Parts vorhanden sind (Dateiname + Content)
-        if i + 1 >= len(parts):
-            console.print(f"[yellow]⚠️ Unvollständiger Block bei Index {i} - übersprungen[/yellow]")
-            break
-        raw_filename = parts[i].strip()
-        content = parts[i+1].strip()
-
+    for raw_filename, content in blocks:
         # ÄNDERUNG 25.01.2026: Bug-Fix - Bereinige häufige LLM-Formatierungsfehler
         # Entferne trailing Doppelpunkte die der LLM manchmal hinzufügt
         raw_filename = raw_filename.rstrip(':')
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: MinHash-Utilities fuer die Aehnlichkeitssuche ueber Wortmengen.
+              Gemeinsame Basis von backend/question_dedup.py (Discovery-Fragen)
+              und agents/lesson_index.py (Memory-Lessons):
+              - normalized_words: Wortmenge ohne Satzzeichen und Stoppwoerter
+              - minhash: Signatur mit NUM_PERM deterministischen Permutationen
+              - band_keys: LSH-Baender einer Signatur
+              - jaccard: exakte Aehnlichkeit zweier Wortmengen
+"""
+
+import re
+import hashlib
+from typing import Iterable, Iterator, List, Set, Tuple
+
+NUM_PERM = 64
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _permutations(count: int) -> List[Tuple[int, int]]:
+    # Deterministische (a, b)-Paare - Signaturen sind ueber Prozesse stabil
+    perms = []
+    for i in range(count):
+        digest = hashlib.blake2b(f"minhash-{i}".encode(), digest_size=16).digest()
+        perms.append((int.from_bytes(digest[:8], "big") % (_MERSENNE - 1) + 1,
+                      int.from_bytes(digest[8:], "big") % _MERSENNE))
+    return perms
+
+
+_PERMS = _permutations(NUM_PERM)
+
+
+def normalized_words(text: str, stop_words: Iterable[str] = ()) -> Set[str]:
+    """Kleingeschriebene Wortmenge ohne Satzzeichen und Stoppwoerter."""
+    cleaned = re.sub(r'[^\w\s]', '', (text or "").lower())
+    return set(cleaned.split()) - set(stop_words)
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def minhash(tokens: Iterable[str]) -> Tuple[int, ...]:
+    """MinHash-Signatur (NUM_PERM Werte), leeres Tupel fuer eine leere Menge."""
+    hashes = [_token_hash(t) for t in tokens]
+    if not hashes:
+        return ()
+    return tuple(min((a * h + b) % _MERSENNE & _MAX_HASH for h in hashes) for a, b in _PERMS)
+
+
+def band_keys(signature: Tuple[int, ...], rows: int) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+    """LSH-Baender mit je rows Werten - gleicher Schluessel heisst Kandidat."""
+    for start in range(0, len(signature), rows):
+        yield start, signature[start:start + rows]
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
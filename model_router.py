@@ -2,10 +2,12 @@
 """
 Author: rahn
 Datum: 02.02.2026
-Version: 2.2
+Version: 2.3
 Beschreibung: Model Router - Intelligentes Model-Routing mit Fallback bei Rate Limits.
               REFAKTORIERT: Health-Check-Logik nach model_router_health.py ausgelagert.
 
+              AENDERUNG 18.10.2026 v2.3: is_role_rate_limited() - Primary-Modell einer Rolle
+                                         im Rate-Limit-Cooldown (Drosselung paralleler Aufrufe).
               AENDERUNG 02.02.2026 v2.2: Dynamischer OpenRouter-Fallback - Wenn alle konfigurierten
                                          Modelle erschoepft, automatisch beliebige verfuegbare
                                          Modelle von OpenRouter API holen.
@@ -71,7 +73,8 @@ class ModelRouter:
         self.error_model_history: Dict[str, Set[str]] = {}
 
         # Health-Check Manager (delegiert an separates Modul)
-        self._health_manager = HealthCheckManager()
+        # AENDERUNG 18.10.2026: Sweep-Einstellungen aus config["health_check"]
+        self._health_manager = HealthCheckManager(config)
 
     # =========================================================================
     # Properties für Rückwärtskompatibilität mit Health-Manager
@@ -498,6 +501,8 @@ class ModelRouter:
         self.rate_limited_models[model] = time.time() + cooldown
         log_event("ModelRouter", "RateLimit",
                   f"Modell {model} pausiert für {cooldown}s (Fehler #{failure_count})")
+        # AENDERUNG 18.10.2026: Health-Re-Check nach Ablauf des Cooldowns
+        self._health_manager.note_failure(model, "rate_limited", retry_after=cooldown)
         return cooldown
 
     async def mark_rate_limited(self, model: str):
@@ -510,6 +515,14 @@ class ModelRouter:
         with self._rate_limit_thread_lock:
             self._mark_rate_limited_core(model)
 
+    def is_role_rate_limited(self, agent_role: str) -> bool:
+        """True solange das Primary-Modell der Rolle im Rate-Limit-Cooldown ist."""
+        try:
+            primary = self._get_model_core(agent_role)[1]
+        except ValueError:
+            return False
+        return bool(primary) and self._is_rate_limited_sync(primary)
+
     # =========================================================================
     # Utilities
     # =========================================================================
@@ -533,6 +546,8 @@ class ModelRouter:
                 del self.model_failure_count[model]
                 log_event("ModelRouter", "Info", f"Modell {model} erfolgreich - Counter zurückgesetzt.")
             self.all_paused_count = 0
+        # AENDERUNG 18.10.2026: Erfolgreicher Call ersetzt einen Health-Check
+        self._health_manager.note_success(model)
 
     def get_all_models_for_role(self, agent_role: str) -> List[str]:
         """Gibt alle konfigurierten Modelle für eine Rolle zurück."""
@@ -619,15 +634,25 @@ class ModelRouter:
         """Prueft ob unavailable Modelle wieder verfuegbar sind."""
         return await self._health_manager.recheck_unavailable_models()
 
+    async def recheck_failed_models(self) -> Dict[str, Dict[str, Any]]:
+        """Prueft nur Modelle mit gemeldeten Fehlern (inkrementell)."""
+        return await self._health_manager.recheck_failed_models()
+
     async def health_check_all_primary_models(
         self,
-        delay_between_checks: float = 2.0
+        delay_between_checks: float = 2.0,
+        include_fallbacks: Optional[bool] = None,
+        force: bool = False,
     ) -> Dict[str, Dict[str, Any]]:
-        """Fuehrt Health-Check fuer alle Primary-Modelle durch."""
+        """
+        Fuehrt Health-Check fuer alle Primary-Modelle durch; Fallback-Ketten nur mit
+        include_fallbacks=True bzw. health_check.include_fallbacks in der Config.
+        """
         mode = self.config.get("mode", "test")
         models_config = self.config.get("models", {}).get(mode, {})
         return await self._health_manager.health_check_all_primary_models(
-            models_config, delay_between_checks
+            models_config, delay_between_checks,
+            include_fallbacks=include_fallbacks, force=force,
         )
 
     def get_health_status(self) -> Dict[str, Any]:
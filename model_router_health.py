@@ -2,7 +2,7 @@
 """
 Author: rahn
 Datum: 01.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Model Router Health-Check Funktionen.
               Extrahiert aus model_router.py (Regel 1: Max 500 Zeilen)
 
@@ -13,13 +13,15 @@ Beschreibung: Model Router Health-Check Funktionen.
               - recheck_unavailable_models
               - health_check_all_primary_models
               - get_health_status
+              AENDERUNG 18.10.2026: Sweeps laufen parallel ueber die
+              HealthSweepEngine (model_router_health_sweep.py)
 """
 
 import time
-import asyncio
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 
 from logger_utils import log_event
+from model_router_health_sweep import HealthSweepEngine, collect_models
 
 # LiteLLM Import für Health-Check
 try:
@@ -132,13 +134,16 @@ class HealthCheckManager:
     Separate Klasse für bessere Testbarkeit und Modularität.
     """
 
-    def __init__(self):
+    def __init__(self, config: Optional[Dict[str, Any]] = None,
+                 sweep_engine: Optional[HealthSweepEngine] = None):
         """Initialisiert den HealthCheckManager."""
         self.permanently_unavailable: Dict[str, str] = {}  # model -> reason
         self.last_health_check: float = 0
         self.health_check_interval: int = 600  # Re-Check alle 10 Minuten
         import threading
         self._lock = threading.Lock()
+        # AENDERUNG 18.10.2026: Parallele, gecachte Checks
+        self.sweep_engine = sweep_engine or HealthSweepEngine.from_config(config)
 
     def mark_permanently_unavailable(self, model: str, reason: str) -> None:
         """
@@ -182,21 +187,29 @@ class HealthCheckManager:
                 return True
         return False
 
+    def _apply_result(self, model: str, available: bool, reason: str) -> None:
+        """Markiert 404-Modelle, reaktiviert wieder erreichbare Modelle."""
+        if not available and "not found" in reason.lower():
+            self.mark_permanently_unavailable(model, reason)
+        elif available and reason != "rate_limited" and self.is_permanently_unavailable(model):
+            self.reactivate_model(model)
+
     async def recheck_unavailable_models(self) -> Dict[str, bool]:
         """
         Prueft ob zuvor als unavailable markierte Modelle wieder verfuegbar sind.
 
+        AENDERUNG 18.10.2026: Parallel ueber die Sweep-Engine.
+
         Returns:
             Dictionary {model: reactivated}
         """
-        results = {}
         with self._lock:
             models_to_check = list(self.permanently_unavailable.keys())
 
-        for model in models_to_check:
-            available, reason = await check_model_health_async(model)
-
-            if available and reason != "rate_limited":
+        checked = await self.sweep_engine.sweep(models_to_check, force=True)
+        results = {}
+        for model, result in checked.items():
+            if result.available and result.reason != "rate_limited":
                 self.reactivate_model(model)
                 results[model] = True
             else:
@@ -205,53 +218,86 @@ class HealthCheckManager:
         self.last_health_check = time.time()
         return results
 
+    async def recheck_failed_models(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Inkrementeller Re-Check: nur Modelle, fuer die der Router seit dem
+        letzten Check Fehler gemeldet hat und deren Wartezeit abgelaufen ist.
+
+        Returns:
+            Dictionary {model: {available, reason}}
+        """
+        checked = await self.sweep_engine.recheck_due()
+        for model, result in checked.items():
+            self._apply_result(model, result.available, result.reason)
+        return {m: {"available": r.available, "reason": r.reason} for m, r in checked.items()}
+
     async def health_check_all_primary_models(
         self,
         models_config: Dict[str, Any],
-        delay_between_checks: float = 2.0
+        delay_between_checks: float = 2.0,
+        include_fallbacks: Optional[bool] = None,
+        force: bool = False,
     ) -> Dict[str, Dict[str, Any]]:
         """
-        Fuehrt Health-Check fuer alle Primary-Modelle aller Rollen durch.
+        Fuehrt Health-Check fuer alle Modelle aller Rollen durch.
+
+        AENDERUNG 18.10.2026: Parallel (pro Provider begrenzt), fallback und
+        extended_fallback nur auf Wunsch; Ergebnisse innerhalb der TTL kommen aus dem Cache.
 
         Args:
             models_config: Model-Konfiguration für einen Mode
-            delay_between_checks: Sekunden zwischen Checks
+            delay_between_checks: Obergrenze fuer den Jitter vor jedem Check
+                                  (frueher: feste Pause zwischen Checks)
+            include_fallbacks: Auch Fallback-Ketten pruefen
+                               (None = health_check.include_fallbacks, Standard: nein)
+            force: Cache ignorieren
 
         Returns:
-            Dictionary {role: {model, available, reason}}
+            Dictionary {role: {model, available, reason, fallbacks: [...]}}
         """
-        results = {}
-        checked_models: Dict[str, Tuple[bool, str]] = {}
+        engine = self.sweep_engine
+        if include_fallbacks is None:
+            include_fallbacks = engine.include_fallbacks
+        models = collect_models(models_config, include_fallbacks=include_fallbacks)
+        jitter = min(engine.jitter_seconds, max(0.0, delay_between_checks))
+        checked = await engine.sweep(models, force=force, jitter=jitter)
 
+        for model, result in checked.items():
+            self._apply_result(model, result.available, result.reason)
+
+        results = {}
         for role, model_config in models_config.items():
-            if isinstance(model_config, dict):
-                primary = model_config.get("primary", "")
-                if primary:
-                    # Pruefe ob Modell bereits gecheckt wurde
-                    if primary in checked_models:
-                        available, reason = checked_models[primary]
-                        log_event("ModelRouter", "HealthCheck",
-                                  f"Modell {primary} bereits geprueft (uebersprungen)")
-                    else:
-                        # Delay zwischen Checks
-                        if checked_models:
-                            await asyncio.sleep(delay_between_checks)
-                        available, reason = await check_model_health_async(primary)
-                        checked_models[primary] = (available, reason)
-
-                    results[role] = {
-                        "model": primary,
-                        "available": available,
-                        "reason": reason
-                    }
-
-                    # Bei permanent unavailable automatisch markieren
-                    if not available and "not found" in reason.lower():
-                        self.mark_permanently_unavailable(primary, reason)
+            if not isinstance(model_config, dict):
+                continue
+            primary = model_config.get("primary", "")
+            if not primary or primary not in checked:
+                continue
+            entry = {
+                "model": primary,
+                "available": checked[primary].available,
+                "reason": checked[primary].reason,
+            }
+            if include_fallbacks:
+                chain = list(model_config.get("fallback", []) or []) + \
+                    list(model_config.get("extended_fallback", []) or [])
+                entry["fallbacks"] = [
+                    {"model": fb, "available": checked[fb].available, "reason": checked[fb].reason}
+                    for fb in dict.fromkeys(chain) if fb in checked
+                ]
+            results[role] = entry
 
         self.last_health_check = time.time()
         return results
 
+    # AENDERUNG 18.10.2026: Signale aus dem Routing-Betrieb
+    def note_failure(self, model: str, reason: str = "", retry_after: float = 0.0) -> None:
+        """Fehler beim Modell beobachtet → Re-Check nach retry_after Sekunden."""
+        self.sweep_engine.note_failure(model, reason, retry_after)
+
+    def note_success(self, model: str) -> None:
+        """Erfolgreicher Call → gilt als frischer Check."""
+        self.sweep_engine.note_success(model)
+
     def get_health_status(self) -> Dict[str, Any]:
         """
         Gibt den aktuellen Health-Status aller Modelle zurueck.
@@ -268,7 +314,8 @@ class HealthCheckManager:
             "unavailable_count": unav_count,
             "last_health_check": self.last_health_check,
             "health_check_interval": self.health_check_interval,
-            "next_recheck_in": max(0, (self.last_health_check + self.health_check_interval) - time.time())
+            "next_recheck_in": max(0, (self.last_health_check + self.health_check_interval) - time.time()),
+            "sweep": self.sweep_engine.stats(),
         }
 
     def clear_unavailable(self) -> None:
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Health-Sweep-Engine fuer den ModelRouter.
+              Ersetzt die sequentiellen Checks mit festem 2s-Delay:
+              - Parallele Checks, begrenzt global und pro Provider
+              - Abdeckung von primary, optional fallback und extended_fallback
+              - Jitter vor jedem Check (verteilt die Last auf den Provider)
+              - Ergebnis-Cache mit TTL, identische Checks laufen nur einmal
+              - Inkrementelle Re-Checks: der Router meldet Fehler/Erfolge,
+                faellige Modelle werden gezielt nachgeprueft
+
+              Konfiguration (optional, config.yaml):
+                health_check:
+                  max_concurrency: 8
+                  per_provider_concurrency: 3
+                  ttl_seconds: 300
+                  jitter_seconds: 0.5
+                  include_fallbacks: false   # Fallback-Ketten mitpruefen (kostet Calls)
+
+              AENDERUNG 18.10.2026: Fallbacks nur noch auf Wunsch (include_fallbacks) -
+              der Start-Sweep prueft sonst bei jedem Boot alle Fallback-Modelle kostenpflichtig.
+"""
+
+import time
+import random
+import asyncio
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+CheckFn = Callable[[str], Awaitable[Tuple[bool, str]]]
+
+
+@dataclass
+class HealthResult:
+    """Ergebnis eines Health-Checks."""
+    model: str
+    available: bool
+    reason: str
+    checked_at: float
+    duration_ms: float = 0.0
+    source: str = "check"  # check | observed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def provider_of(model: str) -> str:
+    """Provider-Praefix einer Modell-ID ("openrouter/x/y" → "openrouter")."""
+    if not model or "/" not in model:
+        return "default"
+    return model.split("/", 1)[0]
+
+
+def collect_models(models_config: Dict[str, Any],
+                   include_fallbacks: bool = False) -> Dict[str, List[str]]:
+    """
+    Sammelt alle Modelle einer Mode-Konfiguration.
+
+    Returns:
+        {model: [rollen]} - Reihenfolge: erst alle Primaries, dann Fallbacks
+    """
+    chains = []
+    for role, model_config in models_config.items():
+        if isinstance(model_config, str):
+            chains.append((role, [model_config]))
+        elif isinstance(model_config, dict):
+            chain = [model_config.get("primary", "")]
+            if include_fallbacks:
+                chain += list(model_config.get("fallback", []) or [])
+                chain += list(model_config.get("extended_fallback", []) or [])
+            chains.append((role, chain))
+
+    models: Dict[str, List[str]] = {}
+    depth = max((len(chain) for _, chain in chains), default=0)
+    for level in range(depth):
+        for role, chain in chains:
+            if level < len(chain) and chain[level]:
+                models.setdefault(chain[level], [])
+                if role not in models[chain[level]]:
+                    models[chain[level]].append(role)
+    return models
+
+
+class HealthSweepEngine:
+    """
+    Fuehrt Health-Checks parallel und gecached aus.
+
+    Args:
+        check_fn: async (model) → (available, reason); Standard ist
+                  check_model_health_async (zur Laufzeit aufgeloest)
+        max_concurrency: Gleichzeitige Checks insgesamt
+        per_provider_concurrency: Gleichzeitige Checks pro Provider
+        ttl_seconds: Gueltigkeit eines Ergebnisses
+        jitter_seconds: Obergrenze der zufaelligen Wartezeit vor einem Check
+        include_fallbacks: Sweeps pruefen auch fallback/extended_fallback (Standard: nein)
+    """
+
+    def __init__(
+        self,
+        check_fn: Optional[CheckFn] = None,
+        max_concurrency: int = 8,
+        per_provider_concurrency: int = 3,
+        ttl_seconds: float = 300.0,
+        jitter_seconds: float = 0.5,
+        include_fallbacks: bool = False,
+    ):
+        self._check_fn = check_fn
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.per_provider_concurrency = max(1, int(per_provider_concurrency))
+        self.ttl_seconds = float(ttl_seconds)
+        self.jitter_seconds = max(0.0, float(jitter_seconds))
+        self.include_fallbacks = bool(include_fallbacks)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, HealthResult] = {}
+        # model -> Zeitpunkt ab dem ein Re-Check faellig ist
+        self._due: Dict[str, float] = {}
+        # Semaphoren/In-Flight-Tasks gehoeren zu genau einem Event-Loop
+        self._loop_state: Dict[int, Dict[str, Any]] = {}
+        self._counters = {"checks": 0, "cache_hits": 0, "deduplicated": 0, "sweeps": 0}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], **kwargs) -> "HealthSweepEngine":
+        settings = dict((config or {}).get("health_check", {}) or {})
+        for key in ("max_concurrency", "per_provider_concurrency", "ttl_seconds", "jitter_seconds",
+                    "include_fallbacks"):
+            if key in settings:
+                kwargs.setdefault(key, settings[key])
+        return cls(**kwargs)
+
+    # =========================================================================
+    # Cache
+    # =========================================================================
+
+    def get_cached(self, model: str, max_age: Optional[float] = None) -> Optional[HealthResult]:
+        """Gueltiges Ergebnis aus dem Cache oder None (abgelaufen/faellig)."""
+        max_age = self.ttl_seconds if max_age is None else max_age
+        with self._lock:
+            result = self._cache.get(model)
+            if result is None or self._due.get(model, float("inf")) <= time.time():
+                return None
+            if time.time() - result.checked_at > max_age:
+                return None
+            return result
+
+    def invalidate(self, model: Optional[str] = None) -> None:
+        with self._lock:
+            if model is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(model, None)
+
+    def _store(self, result: HealthResult) -> None:
+        with self._lock:
+            self._cache[result.model] = result
+            self._due.pop(result.model, None)
+
+    # =========================================================================
+    # Signale vom Router
+    # =========================================================================
+
+    def note_failure(self, model: str, reason: str = "", retry_after: float = 0.0) -> None:
+        """
+        Fehler im Betrieb beobachtet: ab now + retry_after (z.B. Ende des
+        Rate-Limit-Cooldowns) gilt der Cache-Eintrag als veraltet und das
+        Modell wird beim naechsten recheck_due() geprueft.
+        """
+        if not model:
+            return
+        due = time.time() + max(0.0, retry_after)
+        with self._lock:
+            previous = self._due.get(model)
+            self._due[model] = due if previous is None else max(previous, due)
+            cached = self._cache.get(model)
+            if cached is not None:
+                self._cache[model] = HealthResult(
+                    model, cached.available, reason or cached.reason,
+                    cached.checked_at, cached.duration_ms, "observed",
+                )
+
+    def note_success(self, model: str) -> None:
+        """Erfolgreicher Call: zaehlt wie ein frischer, positiver Check."""
+        if not model:
+            return
+        self._store(HealthResult(model, True, "OK", time.time(), 0.0, "observed"))
+
+    def due_models(self, now: Optional[float] = None) -> List[str]:
+        now = time.time() if now is None else now
+        with self._lock:
+            return [m for m, due in self._due.items() if due <= now]
+
+    # =========================================================================
+    # Checks
+    # =========================================================================
+
+    def _state_for_loop(self) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        key = id(loop)
+        with self._lock:
+            state = self._loop_state.get(key)
+            if state is None or state["loop"] is not loop:
+                state = {
+                    "loop": loop,
+                    "global": asyncio.Semaphore(self.max_concurrency),
+                    "providers": {},
+                    "inflight": {},
+                }
+                self._loop_state = {key: state}
+            return state
+
+    async def _run_check(self, model: str, state: Dict[str, Any], jitter: float) -> HealthResult:
+        provider_sem = state["providers"].setdefault(
+            provider_of(model), asyncio.Semaphore(self.per_provider_concurrency)
+        )
+        if jitter > 0:
+            await asyncio.sleep(random.uniform(0, jitter))
+        async with provider_sem, state["global"]:
+            check_fn = self._check_fn
+            if check_fn is None:
+                from model_router_health import check_model_health_async as check_fn
+            start = time.perf_counter()
+            try:
+                available, reason = await check_fn(model)
+            except Exception as e:
+                from model_router_health import parse_health_check_error
+                available, reason = parse_health_check_error(model, e)
+            duration = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._counters["checks"] += 1
+        result = HealthResult(model, available, reason, time.time(), round(duration, 2))
+        self._store(result)
+        return result
+
+    async def check(self, model: str, force: bool = False,
+                    jitter: Optional[float] = None) -> HealthResult:
+        """Prueft ein Modell (Cache beachten, parallele Anfragen zusammenfassen)."""
+        if not force:
+            cached = self.get_cached(model)
+            if cached is not None:
+                with self._lock:
+                    self._counters["cache_hits"] += 1
+                return cached
+        state = self._state_for_loop()
+        task = state["inflight"].get(model)
+        if task is not None:
+            with self._lock:
+                self._counters["deduplicated"] += 1
+        else:
+            jitter = self.jitter_seconds if jitter is None else jitter
+            task = asyncio.ensure_future(self._run_check(model, state, jitter))
+            state["inflight"][model] = task
+            task.add_done_callback(lambda _t, m=model: state["inflight"].pop(m, None))
+        return await asyncio.shield(task)
+
+    async def sweep(self, models: Iterable[str], force: bool = False,
+                    jitter: Optional[float] = None) -> Dict[str, HealthResult]:
+        """Prueft alle Modelle parallel. Returns: {model: HealthResult}"""
+        unique = list(dict.fromkeys(m for m in models if m))
+        with self._lock:
+            self._counters["sweeps"] += 1
+        results = await asyncio.gather(*(self.check(m, force=force, jitter=jitter) for m in unique))
+        return dict(zip(unique, results))
+
+    async def recheck_due(self) -> Dict[str, HealthResult]:
+        """Prueft nur Modelle mit faelligem Re-Check (aus note_failure)."""
+        return await self.sweep(self.due_models(), force=True)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            fresh = sum(1 for r in self._cache.values() if now - r.checked_at <= self.ttl_seconds)
+            return {
+                **self._counters,
+                "cached": len(self._cache),
+                "fresh": fresh,
+                "pending_rechecks": len(self._due),
+                "max_concurrency": self.max_concurrency,
+                "per_provider_concurrency": self.per_provider_concurrency,
+                "ttl_seconds": self.ttl_seconds,
+            }
@@ -71,7 +71,8 @@ class ModelStatsDB:
                 total_tokens INTEGER DEFAULT 0,
                 cost_usd REAL DEFAULT 0.0,
                 latency_ms REAL DEFAULT 0.0,
-                success INTEGER DEFAULT 1
+                success INTEGER DEFAULT 1,
+                cached_tokens INTEGER DEFAULT 0
             );
 
             CREATE TABLE IF NOT EXISTS runs (
@@ -94,12 +95,17 @@ class ModelStatsDB:
             CREATE INDEX IF NOT EXISTS idx_calls_timestamp ON llm_calls(timestamp);
             CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
         """)
+        # AENDERUNG 18.10.2026: Bestehende DBs um cached_tokens (Prompt-Caching) erweitern
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(llm_calls)")}
+        if "cached_tokens" not in columns:
+            conn.execute("ALTER TABLE llm_calls ADD COLUMN cached_tokens INTEGER DEFAULT 0")
         conn.commit()
         logger.info("ModelStatsDB initialisiert: %s", self.db_path)
 
     def record_call(self, run_id: str, agent: str, model: str,
                     prompt_tokens: int, completion_tokens: int,
-                    cost_usd: float, latency_ms: float, success: bool = True):
+                    cost_usd: float, latency_ms: float, success: bool = True,
+                    cached_tokens: int = 0):
         """
         Zeichnet einen einzelnen LLM-API-Call auf.
 
@@ -112,18 +118,19 @@ class ModelStatsDB:
             cost_usd: Kosten in USD
             latency_ms: Antwortzeit in Millisekunden
             success: True bei Erfolg, False bei Fehler
+            cached_tokens: Davon aus dem Provider-Prompt-Cache gelesene Input-Tokens
         """
         try:
             conn = self._get_conn()
             conn.execute(
                 """INSERT INTO llm_calls
                    (timestamp, run_id, agent, model, prompt_tokens, completion_tokens,
-                    total_tokens, cost_usd, latency_ms, success)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    total_tokens, cost_usd, latency_ms, success, cached_tokens)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (datetime.now().isoformat(), run_id, agent, model,
                  prompt_tokens, completion_tokens,
                  prompt_tokens + completion_tokens,
-                 cost_usd, latency_ms, 1 if success else 0)
+                 cost_usd, latency_ms, 1 if success else 0, cached_tokens or 0)
             )
             conn.commit()
         except Exception as e:
@@ -193,7 +200,7 @@ class ModelStatsDB:
 
         Returns:
             Liste von Dicts mit: model, agent, calls, avg_latency_ms,
-            avg_tokens, total_cost, success_rate
+            avg_tokens, total_cost, success_rate, cached_tokens, cache_hit_rate
         """
         try:
             conn = self._get_conn()
@@ -204,7 +211,12 @@ class ModelStatsDB:
                        ROUND(AVG(latency_ms), 1) as avg_latency_ms,
                        ROUND(AVG(total_tokens), 0) as avg_tokens,
                        ROUND(SUM(cost_usd), 4) as total_cost,
-                       ROUND(AVG(success) * 100, 1) as success_rate
+                       ROUND(AVG(success) * 100, 1) as success_rate,
+                       COALESCE(SUM(cached_tokens), 0) as cached_tokens,
+                       CASE WHEN SUM(prompt_tokens) > 0
+                            THEN ROUND(100.0 * SUM(cached_tokens) / SUM(prompt_tokens), 1)
+                            ELSE 0
+                       END as cache_hit_rate
                 FROM llm_calls
                 WHERE timestamp > ?
             """
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Server Readiness - Event-basierte Erkennung der Server-Bereitschaft.
+              Liest stdout/stderr des Server-Prozesses im Hintergrund mit und erkennt
+              framework-spezifische "Ready"-Marker (Next.js, Vite, Flask, Uvicorn).
+              Prozess-Ende wird sofort erkannt, Port-Probes laufen nur noch als
+              Fallback mit exponentiellem Backoff. Startzeiten werden pro Framework erfasst.
+"""
+
+import re
+import socket
+import threading
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Callable
+
+logger = logging.getLogger(__name__)
+
+# Backoff fuer Fallback-Port-Probes (Sekunden)
+PROBE_INITIAL_INTERVAL = 0.1
+PROBE_MAX_INTERVAL = 2.0
+PROBE_BACKOFF_FACTOR = 2.0
+
+# Maximale Anzahl gepufferter Output-Zeilen pro Server-Prozess
+MAX_BUFFERED_LINES = 2000
+
+# Framework-spezifische Ready-Marker (Regex, case-insensitive)
+READY_MARKERS: Dict[str, List[str]] = {
+    "nextjs": [
+        r"\bready\b.*\b(started server|in \d+)",
+        r"✓\s*ready",
+        r"-\s*local:\s+https?://",
+    ],
+    "vite": [
+        r"vite v[\d.]+\s+ready in",
+        r"➜\s+local:\s+https?://",
+    ],
+    "flask": [
+        r"running on https?://",
+    ],
+    "uvicorn": [
+        r"uvicorn running on https?://",
+        r"application startup complete",
+    ],
+}
+
+# Output-Muster die einen fehlgeschlagenen Start anzeigen (Port belegt etc.)
+FATAL_MARKERS: List[str] = [
+    r"EADDRINUSE",
+    r"address already in use",
+]
+
+_COMPILED_READY = {
+    key: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for key, patterns in READY_MARKERS.items()
+}
+_COMPILED_FATAL = [re.compile(p, re.IGNORECASE) for p in FATAL_MARKERS]
+
+
+def detect_readiness_framework(tech_blueprint: Dict[str, Any], run_cmd: str = "") -> str:
+    """
+    Ermittelt den Framework-Key fuer die Ready-Marker.
+
+    Args:
+        tech_blueprint: Projekt-Blueprint
+        run_cmd: Tatsaechlich verwendeter Start-Befehl (optional)
+
+    Returns:
+        Key aus READY_MARKERS oder "generic"
+    """
+    haystack = " ".join([
+        str(tech_blueprint.get("framework", "")),
+        str(tech_blueprint.get("project_type", "")),
+        str(tech_blueprint.get("run_command", "")),
+        run_cmd or "",
+    ]).lower()
+
+    if "next" in haystack:
+        return "nextjs"
+    if "vite" in haystack or "react" in haystack or "vue" in haystack:
+        return "vite"
+    if "uvicorn" in haystack or "fastapi" in haystack:
+        return "uvicorn"
+    if "flask" in haystack:
+        return "flask"
+    return "generic"
+
+
+class ServerOutputTail:
+    """
+    Liest stdout/stderr eines Prozesses in Daemon-Threads mit.
+
+    Der Aufrufer blockiert nie auf der Pipe: Zeilen landen in einem
+    begrenzten Puffer, Ready-/Fatal-Marker und EOF signalisieren ueber
+    ein gemeinsames Event.
+    """
+
+    def __init__(self, process, framework: str = "generic",
+                 max_lines: int = MAX_BUFFERED_LINES):
+        self.process = process
+        self.framework = framework
+        self._lines = deque(maxlen=max_lines)
+        self._total_lines = 0
+        self._read_offset = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self.ready_event = threading.Event()
+        self.ready_line: Optional[str] = None
+        self.fatal_line: Optional[str] = None
+        self._open_streams = 0
+        self._threads: List[threading.Thread] = []
+        self._ready_patterns = _COMPILED_READY.get(framework, [])
+
+    def start(self) -> "ServerOutputTail":
+        """Startet die Reader-Threads fuer alle vorhandenen Pipes."""
+        streams = [s for s in (getattr(self.process, "stdout", None),
+                               getattr(self.process, "stderr", None))
+                   if s is not None and hasattr(s, "readline")]
+        self._open_streams = len(streams)
+        for stream in streams:
+            t = threading.Thread(target=self._reader, args=(stream,), daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def _reader(self, stream) -> None:
+        try:
+            while True:
+                raw = stream.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8", errors="ignore") if isinstance(raw, bytes) else str(raw)
+                self._on_line(line.rstrip("\r\n"))
+        except (OSError, ValueError) as e:
+            # Pipe wurde beim Stop geschlossen
+            logger.debug(f"Output-Tail beendet: {e}")
+        finally:
+            with self._lock:
+                self._open_streams -= 1
+            self._changed.set()
+
+    def _on_line(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            self._total_lines += 1
+        if not self.ready_event.is_set():
+            if any(p.search(line) for p in self._ready_patterns):
+                self.ready_line = line
+                self.ready_event.set()
+                self._changed.set()
+        if self.fatal_line is None and any(p.search(line) for p in _COMPILED_FATAL):
+            self.fatal_line = line
+            self._changed.set()
+
+    @property
+    def streams_closed(self) -> bool:
+        """True wenn alle Pipes EOF erreicht haben."""
+        with self._lock:
+            return self._open_streams <= 0 and bool(self._threads)
+
+    def wait_changed(self, timeout: float) -> bool:
+        """Wartet auf Marker/EOF-Signal und setzt es zurueck."""
+        fired = self._changed.wait(timeout=timeout)
+        self._changed.clear()
+        return fired
+
+    def get_output(self) -> str:
+        """Gibt den gesamten gepufferten Output zurueck."""
+        with self._lock:
+            return "\n".join(self._lines)
+
+    def read_new(self, wait: float = 0.0) -> str:
+        """
+        Gibt den seit dem letzten Aufruf hinzugekommenen Output zurueck.
+
+        Args:
+            wait: Maximale Wartezeit in Sekunden falls noch kein neuer Output vorliegt
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            with self._lock:
+                new_count = self._total_lines - self._read_offset
+                if new_count > 0 or time.monotonic() >= deadline or self._open_streams <= 0:
+                    new_count = min(new_count, len(self._lines))
+                    lines = list(self._lines)[len(self._lines) - new_count:] if new_count else []
+                    self._read_offset = self._total_lines
+                    return "\n".join(lines)
+            time.sleep(min(0.05, max(0.0, deadline - time.monotonic())))
+
+
+@dataclass
+class ReadinessResult:
+    """Ergebnis der Bereitschaftspruefung."""
+    ready: bool
+    reason: str  # "marker", "probe", "exited", "fatal_output", "timeout"
+    framework: str
+    elapsed_seconds: float
+    exit_code: Optional[int] = None
+    detail: str = ""
+    probes: int = 0
+
+
+# =========================================================================
+# Startzeit-Statistik pro Framework
+# =========================================================================
+_stats_lock = threading.Lock()
+_startup_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def record_startup(result: ReadinessResult) -> None:
+    """Erfasst eine Startzeit in der Framework-Statistik."""
+    with _stats_lock:
+        entry = _startup_stats.setdefault(result.framework, {
+            "starts": 0, "ready": 0, "failed": 0,
+            "total_seconds": 0.0, "min_seconds": None, "max_seconds": 0.0,
+            "last_seconds": 0.0, "by_reason": {},
+        })
+        entry["starts"] += 1
+        entry["by_reason"][result.reason] = entry["by_reason"].get(result.reason, 0) + 1
+        if not result.ready:
+            entry["failed"] += 1
+            return
+        secs = result.elapsed_seconds
+        entry["ready"] += 1
+        entry["total_seconds"] += secs
+        entry["last_seconds"] = secs
+        entry["max_seconds"] = max(entry["max_seconds"], secs)
+        entry["min_seconds"] = secs if entry["min_seconds"] is None else min(entry["min_seconds"], secs)
+
+
+def get_startup_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Gibt die Startzeit-Statistik pro Framework zurueck.
+
+    Returns:
+        Dict framework -> {starts, ready, failed, avg_seconds, min_seconds, ...}
+    """
+    with _stats_lock:
+        stats = {}
+        for framework, entry in _startup_stats.items():
+            copy = dict(entry)
+            copy["by_reason"] = dict(entry["by_reason"])
+            copy["avg_seconds"] = round(entry["total_seconds"] / entry["ready"], 3) if entry["ready"] else None
+            stats[framework] = copy
+        return stats
+
+
+def reset_startup_stats() -> None:
+    """Setzt die Startzeit-Statistik zurueck (fuer Tests)."""
+    with _stats_lock:
+        _startup_stats.clear()
+
+
+def _probe_port(port: int, host: str) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except (socket.timeout, ConnectionRefusedError, OSError):
+        return False
+
+
+def wait_for_server_ready(process, port: int, timeout: float,
+                          framework: str = "generic",
+                          host: str = "localhost",
+                          tail: Optional[ServerOutputTail] = None,
+                          probe: Optional[Callable[[int, str], bool]] = None) -> ReadinessResult:
+    """
+    Wartet event-basiert bis der Server bereit ist.
+
+    Reihenfolge pro Wakeup: Ready-Marker im Output → Prozess beendet /
+    Fatal-Output → Fallback-Port-Probe. Zwischen den Probes wird auf das
+    Output-Event gewartet, das Intervall waechst exponentiell.
+
+    Args:
+        process: subprocess.Popen des Servers
+        port: Erwarteter Server-Port
+        timeout: Maximale Wartezeit in Sekunden
+        framework: Key aus READY_MARKERS
+        host: Hostname fuer Port-Probes
+        tail: Bereits gestarteter ServerOutputTail (sonst wird einer erzeugt)
+        probe: Alternative Probe-Funktion (port, host) -> bool
+
+    Returns:
+        ReadinessResult (wird auch in der Framework-Statistik erfasst)
+    """
+    probe = probe or _probe_port
+    if tail is None:
+        tail = ServerOutputTail(process, framework).start()
+
+    start = time.monotonic()
+    deadline = start + timeout
+    interval = PROBE_INITIAL_INTERVAL
+    probes = 0
+    result = None
+
+    while result is None:
+        elapsed = time.monotonic() - start
+        if tail.ready_event.is_set():
+            result = ReadinessResult(True, "marker", framework, elapsed, detail=tail.ready_line or "")
+            break
+        if tail.fatal_line is not None:
+            result = ReadinessResult(False, "fatal_output", framework, elapsed, detail=tail.fatal_line)
+            break
+        exit_code = process.poll()
+        if exit_code is not None:
+            result = ReadinessResult(False, "exited", framework, elapsed, exit_code=exit_code,
+                                     detail=tail.get_output()[-500:])
+            break
+
+        probes += 1
+        if probe(port, host):
+            result = ReadinessResult(True, "probe", framework, time.monotonic() - start)
+            break
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            result = ReadinessResult(False, "timeout", framework, time.monotonic() - start,
+                                     detail=tail.get_output()[-500:])
+            break
+        tail.wait_changed(min(interval, remaining))
+        interval = min(interval * PROBE_BACKOFF_FACTOR, PROBE_MAX_INTERVAL)
+
+    result.probes = probes
+    record_startup(result)
+    if result.ready:
+        logger.info(f"Server bereit ({framework}, {result.reason}) nach {result.elapsed_seconds:.2f}s")
+    else:
+        logger.warning(f"Server nicht bereit ({framework}, {result.reason}) nach "
+                       f"{result.elapsed_seconds:.2f}s")
+    return result
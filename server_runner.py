@@ -9,6 +9,10 @@ Beschreibung: Server Runner - Startet Projekt-Server und wartet auf Verfügbarke
               ÄNDERUNG 06.02.2026: Pre-Server Dependency-Installation, Framework-aware Timeouts,
                                    App-Readiness-Check nach Port-Bind (Root-Cause-Fix für Next.js-Fehler)
               AENDERUNG 10.02.2026: Fix 50 - Docker Project Container Modus (Server+Deps in Docker)
+              AENDERUNG 18.10.2026: Event-basierte Readiness (server_readiness) statt Port-Polling,
+                                    Output-Tail, sofortige Crash-Erkennung, Backoff-Probes
+              AENDERUNG 18.10.2026: Host-Port des Projekt-Containers pro Run-Worker;
+                                    Worker haengen sich nicht an fremde Server
 """
 
 import os
@@ -23,12 +27,21 @@ from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
 
+from server_readiness import (
+    ServerOutputTail,
+    detect_readiness_framework,
+    wait_for_server_ready,
+)
+
 logger = logging.getLogger(__name__)
 
 # Konstanten
 DEFAULT_STARTUP_TIMEOUT = 30  # Sekunden
 DEFAULT_PORT_CHECK_INTERVAL = 0.5  # Sekunden
 DEFAULT_PORT = 5000
+# AENDERUNG 18.10.2026: Backoff-Grenzen fuer den HTTP-App-Readiness-Check
+APP_READY_INITIAL_INTERVAL = 0.25  # Sekunden
+APP_READY_MAX_INTERVAL = 2.0  # Sekunden
 
 # ÄNDERUNG 07.02.2026: Framework-basierte Startup-Timeouts (erweitert fuer alle Sprachen)
 # Node.js-Projekte brauchen deutlich mehr Zeit (npm install + Compile)
@@ -71,6 +84,10 @@ class ServerInfo:
     startup_output: str = ""
     # AENDERUNG 10.02.2026: Fix 50 - Optional Docker-Container-Referenz
     _docker_container: Any = None
+    # AENDERUNG 18.10.2026: Hintergrund-Tail auf stdout/stderr (server_readiness.ServerOutputTail)
+    output_tail: Any = None
+    # AENDERUNG 18.10.2026: Ergebnis der Readiness-Pruefung (ReadinessResult)
+    readiness: Any = None
 
 
 def is_port_available(port: int, host: str = "localhost") -> bool:
@@ -401,8 +418,12 @@ def _wait_for_app_ready(url: str, timeout: int = 15) -> bool:
     """
     Wartet bis die App tatsaechlich Inhalt liefert (nicht nur Port offen).
     Verhindert "leere Seite" bei Next.js/React wo Port gebunden aber App noch kompiliert.
+
+    AENDERUNG 18.10.2026: Exponentieller Backoff (0.25s → 2s) statt fixem 1s-Intervall,
+    damit schnell startende Apps nicht eine volle Sekunde verlieren.
     """
     start_time = time.time()
+    interval = APP_READY_INITIAL_INTERVAL
     while time.time() - start_time < timeout:
         try:
             response = urllib.request.urlopen(url, timeout=3)
@@ -412,7 +433,11 @@ def _wait_for_app_ready(url: str, timeout: int = 15) -> bool:
                 return True
         except Exception:
             pass
-        time.sleep(1)
+        remaining = timeout - (time.time() - start_time)
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, APP_READY_MAX_INTERVAL)
 
     logger.warning(f"App-Readiness-Timeout nach {timeout}s - Test wird trotzdem versucht")
     return False
@@ -507,6 +532,11 @@ def start_server(project_path: str, tech_blueprint: Dict[str, Any],
                 return None
         # Run-Command bestimmen
         run_cmd = _detect_run_command(project_path, tech_blueprint)
+        # AENDERUNG 18.10.2026: Worker-Runs publizieren auf einem versetzten Host-Port
+        host_port = getattr(docker_container, "host_port", port)
+        if host_port != port:
+            port = host_port
+            url = detect_test_url(tech_blueprint, port)
         # Server im Container starten
         if docker_container.start_server(run_cmd, timeout=timeout):
             _wait_for_app_ready(url, timeout=15)
@@ -535,6 +565,12 @@ def start_server(project_path: str, tech_blueprint: Dict[str, Any],
 
     # Prüfe ob Port bereits belegt
     if is_port_available(port):
+        # AENDERUNG 18.10.2026: Ein paralleler Run-Worker darf sich nicht an den Server
+        # eines anderen Runs haengen (Host-Modus kennt keinen Port-Versatz)
+        from backend.run_worker import worker_run_id
+        if worker_run_id():
+            logger.error(f"Port {port} ist durch einen anderen Run belegt - Server-Start abgebrochen")
+            return None
         logger.warning(f"Port {port} bereits belegt - ein Server läuft möglicherweise schon")
         # Wir geben trotzdem ServerInfo zurück, aber ohne eigenen Prozess
         return ServerInfo(process=None, port=port, url=url, project_path=project_path)
@@ -600,30 +636,41 @@ def start_server(project_path: str, tech_blueprint: Dict[str, Any],
 
         logger.info(f"Server-Timeout: {startup_timeout}s")
 
-        if wait_for_port(port, timeout=int(startup_timeout)):
+        # AENDERUNG 18.10.2026: Event-basierte Readiness statt wait_for_port-Polling
+        # Output-Tail liest die Pipes im Hintergrund (verhindert auch volle Pipe-Buffer),
+        # Ready-Marker beenden das Warten sofort, ein gecrashter Prozess ebenso.
+        readiness_framework = detect_readiness_framework(
+            tech_blueprint, cmd if isinstance(cmd, str) else " ".join(cmd)
+        )
+        tail = ServerOutputTail(process, readiness_framework).start()
+        readiness = wait_for_server_ready(
+            process, port, timeout=int(startup_timeout),
+            framework=readiness_framework, tail=tail
+        )
+
+        if readiness.ready:
             # ÄNDERUNG 06.02.2026: Warte auf tatsaechliche App-Bereitschaft
             _wait_for_app_ready(url, timeout=15)
             logger.info(f"Server gestartet auf {url}")
-            return ServerInfo(process=process, port=port, url=url, project_path=project_path)
+            return ServerInfo(process=process, port=port, url=url, project_path=project_path,
+                              startup_output=tail.get_output(), output_tail=tail,
+                              readiness=readiness)
         else:
-            # ROOT-CAUSE-FIX 14.02.2026:
-            # Symptom: DevLoop haengt 20+ Minuten beim Tester-Agent
-            # Ursache: process.stderr.read(500) ist ein BLOCKIERENDER Read auf einer Pipe.
-            #          Wenn der Subprocess (run.bat → npm) noch laeuft und <500 Bytes auf
-            #          stderr geschrieben hat, wartet read() UNENDLICH auf Daten oder EOF.
-            #          stop_server() wurde NACH read() aufgerufen → kam nie dran → Deadlock.
-            # Loesung: Erst Prozess stoppen (schliesst Pipe → EOF), DANN stderr lesen.
+            # ROOT-CAUSE-FIX 14.02.2026: Erst Prozess stoppen, DANN Output lesen
+            # (blockierender stderr.read() auf laufendem Prozess → Deadlock).
+            # AENDERUNG 18.10.2026: Output kommt jetzt aus dem Tail-Puffer, kein Pipe-Read mehr
             server_info = ServerInfo(process=process, port=port, url=url, project_path=project_path)
             stop_server(server_info)
-            stderr_output = ""
-            try:
-                if process.stderr:
-                    stderr_output = process.stderr.read(2000).decode("utf-8", errors="ignore")
-            except Exception:
-                pass
-            error_msg = f"Server-Start fehlgeschlagen (Timeout nach {startup_timeout}s)"
-            if stderr_output:
-                error_msg += f". stderr: {stderr_output.strip()[:500]}"
+            output = tail.read_new(wait=0.5)
+            if readiness.reason == "exited":
+                error_msg = (f"Server-Prozess beendet nach {readiness.elapsed_seconds:.1f}s "
+                             f"(Exit-Code {readiness.exit_code})")
+            elif readiness.reason == "fatal_output":
+                error_msg = f"Server-Start fehlgeschlagen: {readiness.detail.strip()[:200]}"
+            else:
+                error_msg = f"Server-Start fehlgeschlagen (Timeout nach {startup_timeout}s)"
+            if output:
+                error_msg += f". Output: {output.strip()[-500:]}"
             logger.error(error_msg)
             return None
 
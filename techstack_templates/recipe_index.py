@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Persistenter Recipe-Index fuer die Template-Lernschleife.
+              Speichert pro Archiv-Datei (Schluessel: Dateiname + mtime + Groesse)
+              das extrahierte Recipe in SQLite und haelt einen invertierten
+              Dependency-Index. Aehnlichkeitssuche liest damit nur noch die
+              Kandidaten mit gemeinsamen Dependencies statt alle Archive.
+              AENDERUNG 18.10.2026: base_template beim Schreiben und Abfragen gleich
+              normalisiert ("" → NULL), Schema-Version 2 baut alte Indizes neu auf.
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from contextlib import closing
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RECIPE_INDEX_FILENAME = ".recipe_index.db"
+# Bei Schema-Aenderungen erhoehen → Index wird neu aufgebaut
+INDEX_SCHEMA_VERSION = "2"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS archives (
+    filename TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    project_id TEXT,
+    base_template TEXT,
+    recipe TEXT
+);
+CREATE TABLE IF NOT EXISTS recipe_deps (
+    dep TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    PRIMARY KEY (dep, filename)
+);
+CREATE INDEX IF NOT EXISTS idx_archives_base ON archives(base_template);
+CREATE INDEX IF NOT EXISTS idx_recipe_deps_file ON recipe_deps(filename);
+"""
+
+# Ein Lock pro DB-Datei: refresh() und upsert() im selben Prozess serialisieren
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _base_key(recipe: Optional[dict]) -> Optional[str]:
+    """base_template-Spalte: fehlend und leer sind beide NULL (Schreiben und Abfragen)."""
+    return (recipe or {}).get("base_template") or None
+
+
+class RecipeIndex:
+    """
+    SQLite-Index ueber library/archive/*.json.
+
+    Args:
+        archive_dir: Archiv-Verzeichnis
+        extractor: Funktion Archiv-Dict → Recipe-Dict oder None
+        fingerprint: Kennung der Extraktions-Grundlage (z.B. Template-Stand);
+                     bei Abweichung wird der Index verworfen und neu aufgebaut
+        db_path: Optionaler Pfad zur DB (Standard: <archive_dir>/.recipe_index.db)
+    """
+
+    def __init__(
+        self,
+        archive_dir: str,
+        extractor: Callable[[dict], Optional[dict]],
+        fingerprint: str = "",
+        db_path: Optional[str] = None,
+    ):
+        self.archive_dir = archive_dir
+        self.extractor = extractor
+        self.fingerprint = f"{INDEX_SCHEMA_VERSION}:{fingerprint}"
+        self.db_path = db_path or os.path.join(archive_dir, RECIPE_INDEX_FILENAME)
+        self._lock = _lock_for(self.db_path)
+        self.last_refresh: Dict[str, int] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        if row is None or row[0] != self.fingerprint:
+            if row is not None:
+                logger.info("Recipe-Index: Fingerprint geaendert - Neuaufbau")
+            conn.execute("DELETE FROM archives")
+            conn.execute("DELETE FROM recipe_deps")
+            conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('fingerprint', ?)",
+                (self.fingerprint,)
+            )
+
+    # =========================================================================
+    # Aktualisierung
+    # =========================================================================
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Gleicht den Index mit dem Archiv-Verzeichnis ab.
+
+        Nur neue oder geaenderte Dateien (mtime/Groesse) werden gelesen,
+        geloeschte Dateien werden entfernt.
+
+        Returns:
+            Zaehler {"scanned", "parsed", "removed"}
+        """
+        current: Dict[str, Tuple[float, int]] = {}
+        with os.scandir(self.archive_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    st = entry.stat()
+                    current[entry.name] = (st.st_mtime, st.st_size)
+
+        stats = {"scanned": len(current), "parsed": 0, "removed": 0}
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                self._ensure_schema(conn)
+                known = {
+                    name: (mtime, size)
+                    for name, mtime, size in conn.execute(
+                        "SELECT filename, mtime, size FROM archives"
+                    )
+                }
+                for name in set(known) - set(current):
+                    self._delete(conn, name)
+                    stats["removed"] += 1
+                for name, (mtime, size) in current.items():
+                    if known.get(name) == (mtime, size):
+                        continue
+                    archive = self._read_archive(name)
+                    self._store(conn, name, mtime, size, archive)
+                    stats["parsed"] += 1
+        self.last_refresh = stats
+        return stats
+
+    def upsert_archive(self, filename: str, archive: dict) -> Optional[dict]:
+        """
+        Traegt ein Archiv direkt ein (ohne es erneut von Platte zu lesen).
+
+        Wird von der Lernschleife fuer das gerade archivierte Projekt genutzt.
+
+        Returns:
+            Das extrahierte Recipe oder None
+        """
+        path = os.path.join(self.archive_dir, filename)
+        try:
+            st = os.stat(path)
+            mtime, size = st.st_mtime, st.st_size
+        except OSError:
+            # Noch nicht auf Platte: beim naechsten refresh() neu lesen
+            mtime, size = -1.0, -1
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                self._ensure_schema(conn)
+                return self._store(conn, filename, mtime, size, archive)
+
+    def _read_archive(self, filename: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(self.archive_dir, filename), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+            return None
+
+    def _delete(self, conn: sqlite3.Connection, filename: str):
+        conn.execute("DELETE FROM archives WHERE filename = ?", (filename,))
+        conn.execute("DELETE FROM recipe_deps WHERE filename = ?", (filename,))
+
+    def _store(self, conn: sqlite3.Connection, filename: str, mtime: float, size: int,
+               archive: Optional[dict]) -> Optional[dict]:
+        recipe = self.extractor(archive) if isinstance(archive, dict) else None
+        self._delete(conn, filename)
+        conn.execute(
+            "INSERT INTO archives(filename, mtime, size, project_id, base_template, recipe) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                filename, mtime, size,
+                archive.get("project_id") if isinstance(archive, dict) else None,
+                _base_key(recipe),
+                json.dumps(recipe, ensure_ascii=False) if recipe else None,
+            )
+        )
+        if recipe:
+            conn.executemany(
+                "INSERT OR IGNORE INTO recipe_deps(dep, filename) VALUES (?, ?)",
+                [(dep, filename) for dep in recipe.get("additional_dependencies", [])]
+            )
+        return recipe
+
+    # =========================================================================
+    # Abfragen
+    # =========================================================================
+
+    def find_similar(self, recipe: dict, min_similarity: float = 0.7) -> List[dict]:
+        """
+        Liefert Recipes mit gleicher Basis und Jaccard-Aehnlichkeit der
+        additional_dependencies >= min_similarity (absteigend sortiert).
+
+        Kandidaten kommen aus dem invertierten Dependency-Index; nur bei
+        min_similarity <= 0 (auch Recipes ohne gemeinsame Dependency) werden
+        alle Recipes der Basis betrachtet.
+        """
+        ref_additional = set(recipe.get("additional_dependencies", []))
+        if not ref_additional:
+            return []
+        ref_base = _base_key(recipe)
+        own_id = recipe.get("project_id")
+
+        with closing(self._connect()) as conn:
+            if min_similarity > 0:
+                placeholders = ",".join("?" for _ in ref_additional)
+                rows = conn.execute(
+                    f"SELECT a.recipe, COUNT(*) FROM recipe_deps d "
+                    f"JOIN archives a ON a.filename = d.filename "
+                    f"WHERE d.dep IN ({placeholders}) AND a.base_template IS ? "
+                    f"GROUP BY d.filename",
+                    (*sorted(ref_additional), ref_base)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT recipe, NULL FROM archives "
+                    "WHERE recipe IS NOT NULL AND base_template IS ?",
+                    (ref_base,)
+                ).fetchall()
+
+        similar = []
+        for recipe_json, _shared in rows:
+            other = json.loads(recipe_json)
+            if own_id and other.get("project_id") == own_id:
+                continue
+            other_additional = set(other.get("additional_dependencies", []))
+            if not other_additional:
+                continue
+            union = ref_additional | other_additional
+            similarity = len(ref_additional & other_additional) / len(union)
+            if similarity >= min_similarity:
+                other["similarity"] = round(similarity, 2)
+                similar.append(other)
+
+        similar.sort(key=lambda x: x.get("similarity", 0), reverse=True)
+        return similar
+
+    def stats(self) -> Dict[str, Any]:
+        """Groesse des Index (fuer Diagnose)."""
+        with closing(self._connect()) as conn:
+            with conn:
+                self._ensure_schema(conn)
+            archives = conn.execute("SELECT COUNT(*) FROM archives").fetchone()[0]
+            recipes = conn.execute(
+                "SELECT COUNT(*) FROM archives WHERE recipe IS NOT NULL"
+            ).fetchone()[0]
+            deps = conn.execute("SELECT COUNT(DISTINCT dep) FROM recipe_deps").fetchone()[0]
+        return {"archives": archives, "recipes": recipes, "distinct_dependencies": deps}
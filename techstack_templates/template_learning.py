@@ -2,15 +2,19 @@
 """
 Author: rahn
 Datum: 07.02.2026
-Version: 1.0
+Version: 1.1
 Beschreibung: Template-Lernschleife - Extrahiert bewaehrte Konfigurationen aus
               erfolgreichen Projekten und schlaegt neue Templates vor.
               Nutzt bestehende library/archive/ Infrastruktur.
+              AENDERUNG 18.10.2026: Aehnlichkeitssuche ueber persistenten
+              Recipe-Index (recipe_index.py) statt Vollscan aller Archive.
 """
 
 import os
 import json
+import hashlib
 import logging
+import sqlite3
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -19,6 +23,7 @@ from techstack_templates.template_loader import (
     get_template_by_id,
     invalidate_cache,
 )
+from techstack_templates.recipe_index import RecipeIndex
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +31,9 @@ _MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 _STACKS_DIR = os.path.join(_MODULE_DIR, "stacks")
 _USAGE_STATS_FILE = os.path.join(_STACKS_DIR, "_usage_stats.json")
 
+# AENDERUNG 18.10.2026: Recipe-Index pro Archiv-Verzeichnis
+_recipe_indexes: Dict[str, RecipeIndex] = {}
+
 
 def extract_proven_recipe(project_archive: dict) -> Optional[dict]:
     """
@@ -101,13 +109,56 @@ def find_similar_recipes(
     if not os.path.isdir(archive_dir):
         return []
 
+    if not recipe.get("additional_dependencies"):
+        return []
+
+    # AENDERUNG 18.10.2026: Index abgleichen (nur geaenderte Archive lesen),
+    # Kandidaten ueber invertierten Dependency-Index
+    try:
+        index = get_recipe_index(archive_dir)
+        index.refresh()
+        return index.find_similar(recipe, min_similarity)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Recipe-Index nicht nutzbar, Vollscan: %s", e)
+        return _scan_similar_recipes(recipe, archive_dir, min_similarity)
+
+
+def get_recipe_index(archive_dir: str) -> RecipeIndex:
+    """Liefert den Recipe-Index fuer ein Archiv-Verzeichnis (gecached pro Pfad)."""
+    key = os.path.abspath(archive_dir)
+    fingerprint = _templates_fingerprint()
+    index = _recipe_indexes.get(key)
+    if index is None or not index.fingerprint.endswith(fingerprint):
+        index = RecipeIndex(archive_dir, extract_proven_recipe, fingerprint=fingerprint)
+        _recipe_indexes[key] = index
+    return index
+
+
+def _templates_fingerprint() -> str:
+    """
+    Kennung des Template-Stands (Dateinamen + mtime in stacks/).
+
+    additional_dependencies haengen von den Basis-Templates ab - aendern sich
+    diese, muss der Recipe-Index neu aufgebaut werden. Dateien mit '_'-Praefix
+    (z.B. _usage_stats.json) zaehlen nicht.
+    """
+    parts = []
+    if os.path.isdir(_STACKS_DIR):
+        for name in sorted(os.listdir(_STACKS_DIR)):
+            if name.endswith(".json") and not name.startswith("_"):
+                try:
+                    parts.append(f"{name}:{os.path.getmtime(os.path.join(_STACKS_DIR, name))}")
+                except OSError:
+                    continue
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _scan_similar_recipes(recipe: dict, archive_dir: str, min_similarity: float) -> List[dict]:
+    """Vollscan aller Archive - Fallback wenn der SQLite-Index nicht nutzbar ist."""
     similar = []
     ref_additional = set(recipe.get("additional_dependencies", []))
     ref_base = recipe.get("base_template", "")
 
-    if not ref_additional:
-        return []
-
     for filename in os.listdir(archive_dir):
         if not filename.endswith(".json"):
             continue
@@ -317,6 +368,16 @@ def try_learn_from_project(project_archive: dict, archive_dir: str) -> Optional[
     if not recipe.get("additional_dependencies"):
         return None
 
+    # AENDERUNG 18.10.2026: Aktuelles Projekt inkrementell indexieren
+    # (library_manager archiviert als <project_id>.json)
+    if recipe.get("project_id") and os.path.isdir(archive_dir):
+        try:
+            get_recipe_index(archive_dir).upsert_archive(
+                f"{recipe['project_id']}.json", project_archive
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Recipe-Index Update fehlgeschlagen: %s", e)
+
     similar = find_similar_recipes(recipe, archive_dir)
     if not similar:
         return None
@@ -7,6 +7,8 @@ Beschreibung: Unit-Tests für agents.dependency_checker und agents.dependency_in
               AENDERUNG 07.02.2026: Tests fuer shadcn/ui Fix (Multi-Command, npx, Pakettyp)
 """
 
+import sys
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -150,19 +152,17 @@ class TestCheckPythonPackage:
         assert out.get("version") == "builtin"
         assert out.get("meets_requirement") is True
 
-    @patch("agents.dependency_checker.subprocess.run")
-    def test_installed_package(self, mock_run):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="Name: pytest\nVersion: 7.0.0\n"
-        )
+    # AENDERUNG 18.10.2026: Lookup im Inventar-Cache statt "pip show"
+    @patch("agents.dependency_checker.get_inventory_cache")
+    def test_installed_package(self, mock_cache):
+        mock_cache.return_value.lookup_python.return_value = ("pytest", "7.0.0")
         out = check_python_package("pytest")
         assert out["installed"] is True
         assert out.get("version") == "7.0.0"
 
-    @patch("agents.dependency_checker.subprocess.run")
-    def test_not_installed(self, mock_run):
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="not found")
+    @patch("agents.dependency_checker.get_inventory_cache")
+    def test_not_installed(self, mock_cache):
+        mock_cache.return_value.lookup_python.return_value = None
         out = check_python_package("nonexistent_pkg_xyz")
         assert out["installed"] is False
 
@@ -177,9 +177,10 @@ class TestCheckNpmPackage:
         assert out["installed"] is False
         assert "error" in out
 
+    @patch("agents.dependency_checker.global_node_modules_dir", return_value=None)
     @patch("agents.dependency_checker.subprocess.run")
     @patch("agents.dependency_checker.shutil.which")
-    def test_npm_package_present(self, mock_which, mock_run):
+    def test_npm_package_present(self, mock_which, mock_run, _mock_dir):
         mock_which.return_value = "/usr/bin/npm"
         mock_run.return_value = MagicMock(
             returncode=0,
@@ -278,6 +279,22 @@ class TestInstallDependenciesMultiCommand:
         assert result["status"] == "SKIP"
 
 
+class TestInstallPythonInterpreter:
+    """pip laeuft mit demselben Interpreter, den das Inventar ausliest."""
+
+    @patch("agents.dependency_installer.subprocess.run")
+    def test_python_m_pip_nutzt_sys_executable(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="OK", stderr="")
+        install_single_package("requests", package_type="python", version="2.31.0")
+        assert mock_run.call_args[0][0] == [sys.executable, "-m", "pip", "install", "requests==2.31.0"]
+
+    @patch("agents.dependency_installer.subprocess.run")
+    def test_pip_install_nutzt_sys_executable(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="OK", stderr="")
+        install_dependencies("pip install flask", project_path=None)
+        assert mock_run.call_args[0][0] == [sys.executable, "-m", "pip", "install", "flask"]
+
+
 class TestInstallSinglePackageNpm:
     """Tests fuer install_single_package npm-Aenderungen."""
 
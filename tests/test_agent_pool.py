@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/agent_pool.py und die Pool-Nutzung in
+              init_agents. Testet: Wiederverwendung pro Key, Modellwechsel,
+              Invalidierung bei Config-Aenderung, Statistik und Opt-out.
+"""
+
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import backend.agent_pool as agent_pool_module
+from backend.agent_pool import (
+    AgentPool,
+    get_agent_pool,
+    get_agent_pool_settings,
+    model_of,
+    pooled_agent,
+)
+
+
+CONFIG = {"mode": "test", "models": {"test": {"coder": "model-a", "meta_orchestrator": "model-m"}}}
+
+
+def _agent(model):
+    return types.SimpleNamespace(llm=types.SimpleNamespace(model=model))
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    agent_pool_module._instance = None
+    yield
+    agent_pool_module._instance = None
+
+
+class TestAgentPool:
+    """LRU-Pool mit Konstruktions-Statistik."""
+
+    def test_gleicher_key_baut_einmal(self):
+        pool = AgentPool()
+        builder = MagicMock(side_effect=lambda: _agent("m"))
+        first = pool.get_or_build("coder", "m", "r", "t", "c", builder)
+        second = pool.get_or_build("coder", "m", "r", "t", "c", builder)
+        assert first is second
+        assert builder.call_count == 1
+        stats = pool.stats()
+        assert stats["roles"]["coder"]["hits"] == 1
+        assert stats["roles"]["coder"]["builds"] == 1
+        assert stats["hit_rate"] == 50.0
+
+    def test_config_aenderung_verwirft(self):
+        pool = AgentPool()
+        pool.get_or_build("coder", "m", "r", "t", "c1", lambda: _agent("m"))
+        pool.get_or_build("coder", "m", "r", "t", "c2", lambda: _agent("m"))
+        assert pool.stats()["invalidations"] == 1
+        assert pool.stats()["roles"]["coder"]["builds"] == 2
+
+    def test_tatsaechliches_modell_als_key(self):
+        pool = AgentPool()
+        built = pool.get_or_build("coder", "m1", "r", "t", "c", lambda: _agent("m2"))
+        assert pool.get_or_build("coder", "m2", "r", "t", "c", MagicMock()) is built
+
+    def test_lru_und_fehler_nicht_gecached(self):
+        pool = AgentPool(max_entries=1)
+        pool.get_or_build("coder", "a", "r", "t", "c", lambda: _agent("a"))
+        pool.get_or_build("coder", "b", "r", "t", "c", lambda: _agent("b"))
+        assert pool.stats()["entries"] == 1
+        with pytest.raises(RuntimeError):
+            pool.get_or_build("tester", "x", "r", "t", "c", MagicMock(side_effect=RuntimeError))
+        assert pool.invalidate(role="coder") == 1
+        assert pool.stats()["entries"] == 0
+
+    def test_model_of(self):
+        assert model_of(types.SimpleNamespace(llm="m")) == "m"
+        assert model_of(_agent("x")) == "x"
+        assert model_of(MagicMock()) is None
+
+
+class TestPooledAgent:
+    """Key-Bildung aus Config, Router, Regeln und Tech-Stack."""
+
+    def test_mock_config_ohne_pool(self):
+        assert get_agent_pool_settings(MagicMock())["enabled"] is False
+        builder = MagicMock(side_effect=lambda: _agent("m"))
+        pooled_agent(MagicMock(), "coder", {}, builder)
+        pooled_agent(MagicMock(), "coder", {}, builder)
+        assert builder.call_count == 2
+
+    def test_router_modellwechsel_und_rueckwechsel(self):
+        router = MagicMock()
+        router.get_model.side_effect = ["model-a", "model-b", "model-a"]
+        agents = [pooled_agent(CONFIG, "coder", {}, lambda m=m: _agent(m), router=router)
+                  for m in ("model-a", "model-b", "unused")]
+        assert agents[0] is agents[2]
+        assert agents[0] is not agents[1]
+        assert get_agent_pool().stats()["roles"]["coder"]["builds"] == 2
+
+    def test_regeln_und_tech_stack_im_key(self):
+        builder = MagicMock(side_effect=lambda: _agent("model-m"))
+        pooled_agent(CONFIG, "analyst", {"global": ["A"]}, builder)
+        pooled_agent(CONFIG, "analyst", {"global": ["B"]}, builder)
+        pooled_agent(CONFIG, "analyst", {"global": ["B"]}, builder, tech_blueprint={"language": "go"})
+        pooled_agent(CONFIG, "analyst", {"global": ["B"]}, builder, tech_blueprint={"language": "go"})
+        assert builder.call_count == 3
+
+    def test_deaktiviert(self):
+        config = dict(CONFIG, agent_pool={"enabled": False})
+        builder = MagicMock(side_effect=lambda: _agent("model-a"))
+        pooled_agent(config, "coder", {}, builder)
+        pooled_agent(config, "coder", {}, builder)
+        assert builder.call_count == 2
+
+
+class TestInitAgentsPool:
+    """init_agents nutzt den Pool, pooled=False baut immer neu."""
+
+    @pytest.fixture
+    def factory(self):
+        pytest.importorskip("crewai")
+        import backend.agent_factory as factory
+        return factory
+
+    def test_init_agents_wiederverwendung(self, factory):
+        with patch.object(factory, "create_coder", side_effect=lambda *a, **k: _agent("model-a")) as coder:
+            first = factory.init_agents(CONFIG, {}, include=["coder"])["coder"]
+            second = factory.init_agents(CONFIG, {}, include=["coder"])["coder"]
+            third = factory.init_agents(CONFIG, {}, include=["coder"], pooled=False)["coder"]
+        assert first is second
+        assert third is not first
+        assert coder.call_count == 2
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/benchmark_harness.py.
+              Testet: Benchmark-Config, Referenzprojekte, Replay-Lauf mit
+              Messwerten und Phasen aus dem Run-Trace, Baseline-Vergleich und CLI.
+"""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from backend import benchmark_harness, run_tracer
+from backend.benchmark_harness import (
+    build_benchmark_config,
+    compare_to_baseline,
+    load_reference_projects,
+    measure,
+    render_table,
+    run_project,
+)
+from backend.llm_cassette import (
+    CassetteRecorder,
+    get_cassette_player,
+)
+from backend.run_tracer import finish_run_trace, start_run_trace, trace_span
+
+
+class FakeManager:
+    """Minimaler run_task: Trace wie im echten Run, LLM-Aufrufe ueber die Kassette."""
+
+    def __init__(self, config_path, output_root, trace_dir):
+        with open(config_path, encoding="utf-8") as f:
+            self.config = yaml.safe_load(f)
+        self.output_root = output_root
+        self.trace_dir = trace_dir
+        self.project_path = None
+        self._stats_project_id = None
+
+    def run_task(self, user_goal, project_name=None):
+        self._stats_project_id = "bench_run"
+        start_run_trace(self._stats_project_id, self.trace_dir)
+        try:
+            with trace_span("run", "run"):
+                with trace_span("planner"):
+                    plan = get_cassette_player().replay("litellm", "Planner", "m", user_goal)
+                with trace_span("file_generation"):
+                    with trace_span("Coder", "llm"):
+                        code = get_cassette_player().replay("claude_sdk", "Coder", "sonnet", plan)
+                    self.project_path = os.path.join(self.output_root, project_name)
+                    os.makedirs(self.project_path, exist_ok=True)
+                    with open(os.path.join(self.project_path, "app.py"), "w", encoding="utf-8") as f:
+                        f.write(code * 100)
+        finally:
+            finish_run_trace()
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    trace_dir = str(tmp_path / "traces")
+    monkeypatch.setattr(run_tracer, "TRACE_DIR", trace_dir)
+    monkeypatch.setattr(benchmark_harness, "TRACE_DIR", trace_dir)
+    cassette = str(tmp_path / "flask.cassette.jsonl")
+    recorder = CassetteRecorder(cassette)
+    recorder.record("litellm", "Planner", "m", "Ziel", "PLAN", latency_ms=40)
+    recorder.record("claude_sdk", "Coder", "sonnet", "PLAN", "print('x')\n", latency_ms=60)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump({"claude_sdk": {"pre_call_cooldown": {"planner": 60}},
+                                           "docker": {"enabled": True, "memory_limit": "1g"}}),
+                           encoding="utf-8")
+
+    def factory(path):
+        return FakeManager(path, str(tmp_path / "projects"), trace_dir)
+
+    return {"cassette": cassette, "config": str(config_path), "factory": factory}
+
+
+class TestConfig:
+    """Benchmark-Config und Referenzprojekte."""
+
+    def test_overrides(self):
+        config = build_benchmark_config(
+            {"docker": {"enabled": True, "memory_limit": "1g"},
+             "claude_sdk": {"enabled": True, "pre_call_cooldown": {"planner": 60}}},
+            {"docker": {"memory_limit": "2g"}})
+        assert config["docker"] == {"enabled": False, "memory_limit": "2g", "fallback_to_host": True}
+        assert config["claude_sdk"] == {"enabled": True, "pre_call_cooldown": {}}
+        assert config["doc_enrichment"]["enabled"] is False
+        recording = build_benchmark_config({"claude_sdk": {"pre_call_cooldown": {"planner": 60}}},
+                                           replay=False)
+        assert recording["claude_sdk"]["pre_call_cooldown"] == {"planner": 60}
+
+    def test_referenzprojekte(self):
+        projects = load_reference_projects()
+        assert {"flask_todo", "nextjs_landing", "cli_tool"} <= set(projects)
+        assert all(p.get("goal") and p.get("project_name") for p in projects.values())
+
+
+class TestRun:
+    """Replay-Lauf und Messwerte."""
+
+    def test_replay_lauf(self, setup):
+        result = run_project("flask", {"goal": "Ziel", "project_name": "bench_flask"},
+                             cassette=setup["cassette"], latency_scale=1.0,
+                             base_config_path=setup["config"], manager_factory=setup["factory"])
+        assert result["error"] is None
+        assert result["wall_seconds"] >= 0.1  # 40ms + 60ms synthetische Latenz
+        assert result["cassette"]["exact"] == 2 and result["cassette"]["misses"] == 0
+        assert result["output_files"] == 1 and result["output_bytes"] == 1100
+        assert set(result["phases_ms"]) == {"planner", "file_generation"}
+        assert result["phases_ms"]["file_generation"] >= 60
+        assert result["llm_calls"] == 1
+        assert get_cassette_player() is None
+        assert "flask" in render_table([result])
+
+    def test_fehltreffer_werden_gemeldet(self, setup):
+        result = run_project("flask", {"goal": "Ziel", "project_name": "bench_flask"},
+                             cassette=setup["cassette"], latency_ms=0,
+                             base_config_path=setup["config"],
+                             manager_factory=lambda p: _DivergingManager())
+        assert result["error"].startswith("CassetteMissError")
+        assert result["cassette"]["misses"] == 1
+
+    def test_measure(self, tmp_path):
+        def work():
+            (tmp_path / "f.bin").write_bytes(b"x" * 4096)
+            time.sleep(0.02)
+            return 7
+
+        value, metrics = measure(work)
+        assert value == 7
+        assert metrics["wall_seconds"] >= 0.02
+        assert metrics["cpu_seconds"] >= 0
+        if metrics["peak_rss_mb"] is not None:
+            assert metrics["peak_rss_mb"] > 0
+
+
+class _DivergingManager:
+    project_path = None
+    _stats_project_id = None
+
+    def run_task(self, user_goal, project_name=None):
+        get_cassette_player().replay("litellm", "Researcher", "m", "nicht aufgezeichnet")
+
+
+class TestBaseline:
+    """Regressionserkennung und CLI."""
+
+    def test_vergleich(self):
+        baseline = {"results": [{"project": "p", "wall_seconds": 10.0, "cpu_seconds": 5.0,
+                                 "peak_rss_mb": 200.0, "phases_ms": {"planner": 1000, "tiny": 10}}]}
+        ok = [{"project": "p", "wall_seconds": 11.0, "cpu_seconds": 5.0, "peak_rss_mb": 210.0,
+               "phases_ms": {"planner": 1100, "tiny": 100}}]
+        assert compare_to_baseline(ok, baseline) == []
+        slow = [{"project": "p", "wall_seconds": 13.0, "cpu_seconds": 5.0, "peak_rss_mb": 200.0,
+                 "phases_ms": {"planner": 2000}}]
+        regressions = compare_to_baseline(slow, baseline)
+        assert len(regressions) == 2
+        assert regressions[0].startswith("p: wall_seconds 13.0 > 10.0")
+        assert compare_to_baseline([{"project": "p", "error": "x"}], baseline) == []
+
+    def test_cli_ohne_kassette(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(benchmark_harness, "CASSETTE_DIR", str(tmp_path))
+        assert benchmark_harness.main(["run", "cli_tool"]) == 2
+        assert "record cli_tool" in capsys.readouterr().err
+        assert benchmark_harness.main(["run", "gibtsnicht"]) == 2
+        assert benchmark_harness.main(["list"]) == 0
+        assert "keine Kassette" in capsys.readouterr().out
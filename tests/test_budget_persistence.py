@@ -8,6 +8,7 @@ Beschreibung: Tests fuer budget_persistence.py - Laden und Speichern von Budget-
 """
 
 import json
+import threading
 from pathlib import Path
 
 import pytest
@@ -15,6 +16,7 @@ import pytest
 from budget_persistence import (
     load_usage_history,
     save_usage_history,
+    append_usage_record,
     load_config,
     save_config,
     load_projects,
@@ -147,6 +149,40 @@ class TestUsageHistory:
             "Speichern an unmoeglichem Pfad sollte False zurueckgeben"
         )
 
+    def test_append_behaelt_fremde_eintraege(self, tmp_path: Path):
+        """Ein zweiter Schreiber (Run-Worker) ueberschreibt die Eintraege des ersten nicht."""
+        datei = tmp_path / "usage.json"
+        erster, zweiter = _erstelle_usage_records()
+        save_usage_history([erster], datei)
+
+        zusammengefuehrt = append_usage_record(zweiter, datei)
+        assert [r.agent for r in zusammengefuehrt] == [erster.agent, zweiter.agent]
+        assert [r.agent for r in load_usage_history(datei)] == [erster.agent, zweiter.agent]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_append_parallel(self, tmp_path: Path):
+        """Gleichzeitige Schreiber verlieren unter der Dateisperre keinen Eintrag."""
+        datei = tmp_path / "usage.json"
+        vorlage = _erstelle_usage_records()[0]
+
+        def schreibe(nr):
+            for i in range(10):
+                append_usage_record(UsageRecord(**{**vorlage.__dict__, "agent": f"w{nr}-{i}"}), datei)
+
+        threads = [threading.Thread(target=schreibe, args=(nr,)) for nr in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(load_usage_history(datei)) == 40
+
+    def test_append_korrupte_datei_bleibt_unangetastet(self, tmp_path: Path):
+        """Ist die Historie nicht lesbar, wird sie nicht durch einen Einzeleintrag ersetzt."""
+        datei = tmp_path / "usage.json"
+        datei.write_text("{kaputt", encoding="utf-8")
+        assert append_usage_record(_erstelle_usage_records()[0], datei) is None
+        assert datei.read_text(encoding="utf-8") == "{kaputt"
+
 
 # ===========================================================================
 # Tests: Config
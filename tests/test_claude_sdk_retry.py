@@ -6,7 +6,10 @@ Fokus: effektives Token-Limit wird vor SDK-Call erzwungen.
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from backend.claude_sdk.retry import run_sdk_with_retry
+from backend.operation_supervisor import OperationCancelled
 
 
 def _build_manager():
@@ -240,3 +243,23 @@ def test_run_sdk_with_retry_accepts_task_deriver_with_parseable_task_json(monkey
     )
 
     assert result == '{"tasks":[{"title":"T1"}]}'
+
+
+def test_run_sdk_with_retry_bricht_bei_abbruch_ohne_retry_ab(monkeypatch):
+    manager = _build_manager()
+    manager.config["claude_sdk"]["max_retries"] = 3
+    manager.claude_provider.run_agent.side_effect = OperationCancelled("cancelled via API")
+
+    monkeypatch.setattr("backend.heartbeat_utils.run_with_heartbeat", lambda func, **kwargs: func())
+    monkeypatch.setattr("backend.dev_loop_coder_utils._clean_model_output", lambda text: text)
+
+    with pytest.raises(OperationCancelled):
+        run_sdk_with_retry(
+            manager,
+            role="coder",
+            prompt="fix this",
+            timeout_seconds=30,
+            agent_display_name="Coder",
+        )
+    assert manager.claude_provider.run_agent.call_count == 1
+    manager.force_openrouter_for_claude.assert_not_called()
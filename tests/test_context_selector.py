@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/context_selector.py.
+              Testet: Import-Graph (Python/JS/Templates), Ranking nach depends_on,
+              Signaturen statt Vollinhalt, Token-Budget und konstante
+              Prompt-Groesse bei wachsender Dateianzahl.
+"""
+
+from unittest.mock import MagicMock
+
+from backend.context_selector import (
+    CHARS_PER_TOKEN,
+    export_signatures,
+    get_context_settings,
+    import_distances,
+    legacy_selection,
+    rank_files,
+    select_context,
+)
+
+
+FILES = {
+    "requirements.txt": "flask==3.0\n",
+    "database.py": "from flask_sqlalchemy import SQLAlchemy\ndb = SQLAlchemy()\n\ndef init_db(app):\n    pass\n",
+    "models.py": "from database import db\n\nclass User(db.Model):\n    def to_dict(self):\n        return {}\n",
+    "routes/users.py": "from models import User\n\n@bp.route('/users')\ndef list_users():\n    return []\n",
+    "static/js/api.js": "export const api = {}\nexport async function fetchUsers() {\n  return []\n}\n",
+    "static/js/app.js": "import { api } from './api.js'\nexport function start() {}\n",
+    "templates/base.html": '<script src="/static/js/app.js"></script>{% block content %}{% endblock %}',
+    "templates/users.html": "{% extends 'base.html' %}\n{% block content %}{% endblock %}",
+}
+
+
+class TestImportGraph:
+    """Abstaende im ungerichteten Import-Graph."""
+
+    def test_python_js_und_templates(self):
+        distances = import_distances("app.py", FILES, ["routes/users.py"])
+        assert distances["routes/users.py"] == 1
+        assert distances["models.py"] == 2
+        assert distances["database.py"] == 3
+        assert "static/js/api.js" not in distances
+
+        distances = import_distances("templates/users.html", FILES)
+        assert distances["templates/base.html"] == 1
+        assert distances["static/js/app.js"] == 2
+        assert distances["static/js/api.js"] == 3
+
+    def test_dateien_die_das_ziel_importieren(self):
+        files = {"app.py": "from services.mail import send\n"}
+        assert import_distances("services/mail.py", files) == {"services/mail.py": 0, "app.py": 1}
+
+
+class TestRanking:
+    """Reihenfolge und Auswahl."""
+
+    def test_geplante_abhaengigkeit_zuerst(self):
+        ranked = rank_files("app.py", FILES, ["database.py"])
+        assert ranked[0]["path"] == "database.py" and ranked[0]["direct"]
+        assert ranked[1]["path"] == "models.py"
+
+    def test_vollinhalt_nur_fuer_abhaengigkeiten(self):
+        selection = select_context("routes/orders.py", FILES, ["models.py"])
+        assert selection.full == ["models.py"]
+        assert "--- models.py ---\nfrom database import db" in selection.text
+        assert "--- routes/users.py (Signaturen) ---\n@bp.route('/users')\ndef list_users():" in selection.text
+        assert "return []" not in selection.text.split("routes/users.py (Signaturen)")[1].split("---")[0]
+
+    def test_budget_und_weglassen(self):
+        selection = select_context("app.py", FILES, ["database.py"], budget_tokens=60)
+        assert len(selection.text) <= 60 * CHARS_PER_TOKEN + 200
+        assert selection.full == ["database.py"]
+        assert selection.omitted
+        assert "Weitere vorhandene Dateien:" in selection.text
+
+    def test_prompt_groesse_waechst_nicht_linear(self):
+        body = "\n".join(f"    x{i} = {i}" for i in range(60))
+        files = {f"pkg/module_{i}.py": f"def handler_{i}(request):\n{body}\n" for i in range(200)}
+        small = select_context("pkg/main.py", dict(list(files.items())[:20]), budget_tokens=2000)
+        large = select_context("pkg/main.py", files, budget_tokens=2000)
+        assert len(large.text) <= 2000 * CHARS_PER_TOKEN + 2000
+        assert large.legacy_chars > 9 * small.legacy_chars
+        assert large.stats()["saved_chars"] > 0.9 * large.legacy_chars
+
+
+class TestSignaturesAndSettings:
+    """Export-Signaturen, altes Format und Config."""
+
+    def test_signaturen(self):
+        assert export_signatures("static/js/api.js", FILES["static/js/api.js"]) == (
+            "export const api = {}\nexport async function fetchUsers()")
+        assert export_signatures("schema.sql", "CREATE TABLE bugs (\n id INT\n);") == "CREATE TABLE bugs ("
+        assert export_signatures("README.md", "\n".join(str(i) for i in range(20))).endswith("(gekuerzt)")
+
+    def test_legacy_selection(self):
+        selection = legacy_selection({"a.py": "\n".join(["x"] * 60)})
+        assert selection.text.count("\nx") == 50
+        assert selection.stats()["saved_chars"] == 0
+
+    def test_settings(self):
+        assert get_context_settings(MagicMock())["enabled"] is False
+        assert get_context_settings({})["enabled"] is True
+        assert get_context_settings({"single_file_context": {"budget_tokens": 100}})["budget_tokens"] == 100
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer agents/dependency_inventory_cache.py.
+              Testet: node_modules-Parser (Lockfile + package.json-Fallback),
+              Fingerprint-Invalidierung, Datei-Cache und O(1)-Lookups.
+"""
+
+import os
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from agents import dependency_inventory_cache as inv
+from agents.dependency_inventory_cache import (
+    InventoryCache,
+    global_node_modules_dir,
+    normalize_python_name,
+    parse_node_modules,
+    scan_python_distributions,
+)
+
+
+@pytest.fixture
+def npm_prefix(tmp_path):
+    """Fake-npm-Installation: <prefix>/bin/npm + <prefix>/lib/node_modules."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    npm = bin_dir / "npm"
+    npm.write_text("#!/bin/sh\n")
+    node_modules = tmp_path / "lib" / "node_modules"
+    for name, version in (("npm", "10.2.0"), ("typescript", "5.4.2"), ("@vue/cli", "5.0.8")):
+        pkg = node_modules / name
+        pkg.mkdir(parents=True)
+        (pkg / "package.json").write_text(json.dumps({"name": name, "version": version}))
+    return str(npm), node_modules
+
+
+@pytest.fixture
+def cache(tmp_path, npm_prefix):
+    npm_path, _ = npm_prefix
+    with patch.object(inv, "scan_system_tools_concurrent", return_value={"git": "2.40"}):
+        yield InventoryCache(cache_path=tmp_path / "cache.json", npm_path=npm_path, tools=("git",))
+
+
+# =========================================================================
+# Tests fuer die Scanner
+# =========================================================================
+class TestScanner:
+    """Python- und npm-Scan ohne Subprozesse."""
+
+    def test_python_distributions(self):
+        result = scan_python_distributions()
+        names = {normalize_python_name(p["name"]) for p in result["packages"]}
+        assert "pytest" in names
+        assert result["version"].count(".") == 2
+
+    def test_name_normalisierung(self):
+        assert normalize_python_name("Flask_SQLAlchemy") == "flask-sqlalchemy"
+        assert normalize_python_name("zope.interface") == "zope-interface"
+
+    def test_node_modules_aus_npm_pfad(self, npm_prefix):
+        npm_path, node_modules = npm_prefix
+        assert global_node_modules_dir(npm_path) == str(node_modules)
+        assert global_node_modules_dir(None) is None
+
+    def test_package_json_fallback_mit_scope(self, npm_prefix):
+        _, node_modules = npm_prefix
+        packages = {p["name"]: p["version"] for p in parse_node_modules(str(node_modules))}
+        assert packages == {"npm": "10.2.0", "typescript": "5.4.2", "@vue/cli": "5.0.8"}
+
+    def test_lockfile_bevorzugt(self, npm_prefix):
+        _, node_modules = npm_prefix
+        (node_modules / ".package-lock.json").write_text(json.dumps({"packages": {
+            "node_modules/eslint": {"version": "9.0.0"},
+            "node_modules/eslint/node_modules/debug": {"version": "4.3.4"},
+        }}))
+        packages = parse_node_modules(str(node_modules))
+        assert packages == [{"name": "eslint", "version": "9.0.0", "status": "installed"}]
+
+
+# =========================================================================
+# Tests fuer InventoryCache
+# =========================================================================
+class TestInventoryCache:
+    """Fingerprint-Cache und Lookups."""
+
+    def test_scan_und_lookups(self, cache):
+        inventory = cache.get()
+        assert inventory["npm"]["version"] == "10.2.0"
+        assert inventory["system"]["git"] == "2.40"
+        assert cache.lookup_npm("typescript") == "5.4.2"
+        assert cache.lookup_npm("react") is None
+        assert cache.lookup_python("PyTest")[1]
+        assert cache.stats["scans"] == 1
+
+    def test_zweiter_aufruf_ohne_scan(self, cache):
+        cache.get()
+        cache.get()
+        cache.lookup_python("pytest")
+        assert cache.stats["scans"] == 1
+
+    def test_fingerprint_aenderung_loest_neuen_scan_aus(self, cache, npm_prefix):
+        _, node_modules = npm_prefix
+        cache.get()
+        (node_modules / "react").mkdir()
+        (node_modules / "react" / "package.json").write_text('{"version": "18.2.0"}')
+        future = time.time() + 10
+        os.utime(node_modules, (future, future))
+        cache._checked_at = 0.0  # Throttle ueberspringen
+        cache.get()
+        assert cache.stats["scans"] == 2
+        assert cache.lookup_npm("react") == "18.2.0"
+
+    def test_datei_cache_ueberlebt_neuen_prozess(self, cache, tmp_path, npm_prefix):
+        cache.get()
+        assert (tmp_path / "cache.json").exists()
+        fresh = InventoryCache(cache_path=tmp_path / "cache.json",
+                               npm_path=npm_prefix[0], tools=("git",))
+        fresh.get()
+        assert fresh.stats == {"scans": 0, "memory_hits": 0, "disk_hits": 1}
+        assert fresh.lookup_npm("@vue/cli") == "5.0.8"
+
+    def test_force_refresh(self, cache):
+        cache.get()
+        cache.get(force_refresh=True)
+        assert cache.stats["scans"] == 2
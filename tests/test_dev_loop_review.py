@@ -27,7 +27,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 class TestCompressReviewCode:
     """Tests fuer _compress_review_code(manager, sandbox_result, test_summary)."""
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_leeres_code_dict_fallback_current_code(self, mock_compress, mock_get_code):
         """Bei leerem code_dict wird manager.current_code als Fallback zurueckgegeben."""
@@ -46,7 +46,7 @@ class TestCompressReviewCode:
         # compress_context sollte NICHT aufgerufen werden bei leerem code_dict
         mock_compress.assert_not_called()
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_none_code_dict_fallback_leerer_string(self, mock_compress, mock_get_code):
         """Bei None code_dict und fehlendem current_code wird leerer String zurueckgegeben."""
@@ -62,7 +62,7 @@ class TestCompressReviewCode:
             "Erwartet: Leerer String wenn code_dict None und current_code fehlt"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_normaler_fall_filename_format(self, mock_compress, mock_get_code):
         """Normaler Fall: Komprimierte Dateien werden im ### FILENAME: Format ausgegeben."""
@@ -92,7 +92,7 @@ class TestCompressReviewCode:
             "Erwartet: Inhalt von lib/db.js im Ergebnis"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_summary_dateien_markiert(self, mock_compress, mock_get_code):
         """Dateien mit Summary-Marker (IMPORTS:, FUNKTIONEN:, etc.) werden als ZUSAMMENFASSUNG markiert."""
@@ -122,7 +122,7 @@ class TestCompressReviewCode:
             "Erwartet: utils.js hat (ZUSAMMENFASSUNG) Label"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_verschiedene_summary_marker(self, mock_compress, mock_get_code):
         """Alle Summary-Marker werden erkannt: IMPORTS, VORSCHAU, SELEKTOREN, TOP-KEYS, NAME, KLASSEN, FUNKTIONEN, [."""
@@ -153,7 +153,7 @@ class TestCompressReviewCode:
             f"Erwartet: 8 Dateien mit (ZUSAMMENFASSUNG), erhalten: {zusammenfassung_count}"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_cache_wird_persistiert(self, mock_compress, mock_get_code):
         """Der Reviewer-Summary-Cache wird auf manager._reviewer_summary_cache persistiert."""
@@ -176,7 +176,7 @@ class TestCompressReviewCode:
             "Erwartet: Cache auf manager._reviewer_summary_cache gespeichert"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_bestehender_cache_wird_weitergegeben(self, mock_compress, mock_get_code):
         """Ein bestehender manager._reviewer_summary_cache wird an compress_context uebergeben."""
@@ -199,7 +199,7 @@ class TestCompressReviewCode:
             "Erwartet: Bestehender Cache an compress_context uebergeben"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_max_reviewer_prompt_chars_ueberschritten(self, mock_compress, mock_get_code):
         """Bei Ueberschreitung von max_reviewer_prompt_chars wird der Code gekuerzt."""
@@ -219,7 +219,7 @@ class TestCompressReviewCode:
             "Erwartet: Kuerzungshinweis am Ende des gesamten Outputs"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_default_max_reviewer_prompt_chars_400000(self, mock_compress, mock_get_code):
         """Default-Wert fuer max_reviewer_prompt_chars ist 400000."""
@@ -238,7 +238,7 @@ class TestCompressReviewCode:
             "Erwartet: Kein Kuerzen bei unter 400000 Zeichen"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_feedback_aus_sandbox_und_test_zusammengesetzt(self, mock_compress, mock_get_code):
         """Sandbox-Result und Test-Summary werden als zusammengesetztes Feedback uebergeben."""
@@ -263,7 +263,7 @@ class TestCompressReviewCode:
             "Erwartet: test_summary im Feedback enthalten"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_dateien_alphabetisch_sortiert(self, mock_compress, mock_get_code):
         """Dateien werden alphabetisch sortiert im Output."""
@@ -742,6 +742,39 @@ class TestRunReview:
             "Erwartet: _compress_review_code mit manager, sandbox_result, test_summary aufgerufen"
         )
 
+    @patch("backend.dev_loop_review._compress_review_code")
+    @patch("backend.dev_loop_review.Task")
+    @patch("backend.dev_loop_review.run_with_heartbeat")
+    @patch("backend.dev_loop_review.init_agents")
+    @patch("backend.dev_loop_review.is_empty_or_invalid_response", return_value=False)
+    @patch("backend.dev_loop_review.is_rate_limit_error", return_value=False)
+    @patch("backend.dev_loop_review.is_openrouter_error", return_value=False)
+    @patch("backend.dev_loop_review.truncate_review_output", side_effect=lambda x, **kw: x)
+    @patch("backend.dev_loop_review.create_human_readable_verdict", return_value="Zusammenfassung")
+    def test_prompt_cache_anweisungen_als_praefix(self, mock_verdict, mock_truncate,
+                                                   mock_openrouter, mock_rate, mock_empty,
+                                                   mock_init, mock_heartbeat, mock_task,
+                                                   mock_compress):
+        """Mit prompt_cache stehen die Anweisungen als stabiler Praefix vor dem Code."""
+        from backend.dev_loop_review import REVIEW_INSTRUCTIONS, run_review
+        from backend.prompt_cache import split_cacheable
+
+        mock_compress.return_value = "compressed code"
+        mock_heartbeat.return_value = "OK"
+        prompts = []
+        for config in ({"prompt_cache": {"enabled": True, "min_prefix_chars": 100}}, {}):
+            manager = self._create_default_manager()
+            manager.config.update(config)
+            run_review(manager, {}, "code", "sandbox", "tests", False, MagicMock())
+            prompts.append(mock_task.call_args.kwargs["description"])
+
+        prefix, suffix = split_cacheable(prompts[0])
+        assert prefix == REVIEW_INSTRUCTIONS
+        assert suffix.startswith("=== CODE ZUM PRUEFEN ===\ncompressed code")
+        # Ohne prompt_cache bleibt die bisherige Reihenfolge
+        assert prompts[1].startswith("=== CODE ZUM PRUEFEN ===")
+        assert prompts[1].endswith(REVIEW_INSTRUCTIONS)
+
     @patch("backend.dev_loop_review._compress_review_code")
     @patch("backend.dev_loop_review.Task")
     @patch("backend.dev_loop_review.run_with_heartbeat")
@@ -839,7 +872,7 @@ class TestRunReview:
             "Erwartet: ImportError im hervorgehobenen Abschnitt"
         )
 
-    @patch("backend.dev_loop_review._get_current_code_dict")
+    @patch("backend.dev_loop_review.get_project_files")
     @patch("backend.dev_loop_review.compress_context")
     def test_compress_kein_cache_attribut_am_manager(self, mock_compress, mock_get_code):
         """Wenn manager kein _reviewer_summary_cache hat, wird leerer Cache verwendet."""
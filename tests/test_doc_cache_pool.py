@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/mcp_session_pool.py und backend/doc_cache.py.
+              Gegen einen lokalen Fake-MCP-Server: ein Handshake fuer mehrere
+              Libraries, parallele Fetches, Zeitbudget, Neuaufbau nach Fehler und
+              der persistente Doc-Cache ueber Pipelines hinweg (inkl. TTL).
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from backend.doc_cache import DocDiskCache, get_doc_disk_cache
+from backend.doc_enrichment import DocEnrichmentPipeline
+from backend.mcp_session_pool import McpSessionPool, is_connection_error
+
+
+class FakeMcpServer:
+    """Context7-aehnlicher Fake-Server mit Latenz pro Tool-Aufruf."""
+
+    def __init__(self, latency=0.05, slow=None, missing=()):
+        self.latency = latency
+        self.slow = slow or {}
+        self.missing = set(missing)
+        self.handshakes = 0
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.fail_next = False
+        self._lock = threading.Lock()
+
+    def connect(self, command, args, env):
+        server = self
+
+        @asynccontextmanager
+        async def session_cm():
+            server.handshakes += 1
+            yield server
+        return session_cm
+
+    async def list_tools(self):
+        names = ("resolve-library-id", "query-docs")
+        return SimpleNamespace(tools=[SimpleNamespace(name=n) for n in names])
+
+    async def call_tool(self, name, arguments):
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionResetError("Server weg")
+        library = arguments.get("libraryName") or arguments["libraryId"].rsplit("/", 1)[-1]
+        with self._lock:
+            self.calls.append((name, library))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.slow.get(library, self.latency))
+        finally:
+            with self._lock:
+                self.active -= 1
+        if library in self.missing:
+            return SimpleNamespace(isError=True, content=[])
+        text = f"/fake/{library}" if name == "resolve-library-id" else f"Docs fuer {library}"
+        return SimpleNamespace(isError=False, content=[SimpleNamespace(text=text)])
+
+
+DEPS = {"dependencies": {"prisma": "5.1", "zod": "3.2", "stripe": "14.0"}}
+
+
+@pytest.fixture
+def pool():
+    pool = McpSessionPool()
+    yield pool
+    pool.close_all()
+
+
+def _pipeline(server, pool, disk=None, **settings):
+    config = {"enabled": True, "ref_tools": {"enabled": False}, **settings}
+    if disk is not None:
+        config["disk_cache"] = {"enabled": True, "path": disk}
+    p = DocEnrichmentPipeline(config={"doc_enrichment": config})
+    p._pool = pool
+    p._npx_path = "npx"
+    p._connect = server.connect
+    return p
+
+
+class TestSessionPool:
+    """Langlebige Sessions statt Handshake pro Fetch."""
+
+    def test_ein_handshake_und_parallele_fetches(self, pool):
+        server = FakeMcpServer(latency=0.2)
+        p = _pipeline(server, pool)
+        start = time.monotonic()
+        erg = p.get_enrichment_section(DEPS, "")
+        elapsed = time.monotonic() - start
+
+        assert server.handshakes == 1
+        assert server.max_active == 3
+        assert elapsed < 1.0  # seriell waeren es 3 x 2 x 0.2s
+        assert "Docs fuer prisma" in erg and "Docs fuer zod" in erg and "Docs fuer stripe" in erg
+        assert sum(pool.stats()["reuses"].values()) == 2
+
+    def test_zeitbudget_ueberspringt_langsame_library(self, pool):
+        server = FakeMcpServer(latency=0.01, slow={"zod": 0.5})
+        p = _pipeline(server, pool, fetch_budget_seconds=0.3)
+        erg = p.get_enrichment_section(DEPS, "")
+        assert "Docs fuer prisma" in erg and "zod" not in erg
+        # der Fetch laeuft weiter und fuellt den Cache fuer den naechsten Prompt
+        assert p.docs_generation == 0
+        time.sleep(0.8)
+        assert p._cache["zod"] == "Docs fuer zod"
+        # neue Generation: der Coder-Prompt baut die Sektion mit zod neu auf
+        assert p.docs_generation == 1
+        assert "Docs fuer zod" in p.get_enrichment_section(DEPS, "")
+
+    def test_neuaufbau_nach_fehler(self, pool):
+        server = FakeMcpServer(latency=0.01)
+        p = _pipeline(server, pool)
+        server.fail_next = True
+        assert p._fetch_docs_for_library("prisma", "setup") is None
+        assert p._fetch_docs_for_library("zod", "setup") == "Docs fuer zod"
+        assert server.handshakes == 2
+
+    def test_timeout_schliesst_geteilte_session_nicht(self, pool):
+        server = FakeMcpServer(latency=0.05, slow={"zod": 1.0})
+        p = _pipeline(server, pool, context7={"timeout_seconds": 0.3})
+
+        async def beide():
+            return await asyncio.gather(p._fetch_via_context7("zod", "q"),
+                                        p._fetch_via_context7("prisma", "q"))
+
+        # zod laeuft in den Timeout, prisma teilt sich dieselbe Session und kommt durch
+        assert pool.run(beide(), timeout=5) == [None, "Docs fuer prisma"]
+        assert p._fetch_docs_for_library("stripe", "q") == "Docs fuer stripe"
+        assert server.handshakes == 1
+
+    def test_discard_nur_fuer_die_kaputte_session(self, pool):
+        server = FakeMcpServer()
+
+        async def ablauf():
+            alt = await pool.acquire("ctx", lambda: server.connect(None, None, None)())
+            await pool.discard("ctx", alt)
+            neu = await pool.acquire("ctx", lambda: server.connect(None, None, None)())
+            # Ein zweiter Fetch mit derselben (alten) Session verwirft die neue nicht
+            await pool.discard("ctx", alt)
+            return neu.alive, pool._sessions.get("ctx") is neu
+
+        assert pool.run(ablauf(), timeout=5) == (True, True)
+        assert server.handshakes == 2
+
+    def test_verbindungsfehler_erkennen(self):
+        class ClosedResourceError(Exception):
+            pass
+
+        assert is_connection_error(ConnectionResetError())
+        assert is_connection_error(ClosedResourceError())
+        assert is_connection_error(Exception()) is False
+        assert is_connection_error(asyncio.TimeoutError()) is False
+        mcp_closed = Exception("Connection closed")
+        mcp_closed.error = SimpleNamespace(code=-32000)
+        assert is_connection_error(mcp_closed)
+
+
+class TestDiskCache:
+    """Persistenter Cache ueber Pipelines (Runs) hinweg."""
+
+    def test_zweite_pipeline_ohne_mcp_aufrufe(self, pool, tmp_path):
+        disk = str(tmp_path / "doc_cache.db")
+        server = FakeMcpServer(latency=0.01)
+        first = _pipeline(server, pool, disk=disk).get_enrichment_section(DEPS, "")
+        calls = len(server.calls)
+
+        second = _pipeline(server, pool, disk=disk).get_enrichment_section(DEPS, "")
+        assert second == first
+        assert len(server.calls) == calls
+        assert get_doc_disk_cache({"enabled": True, "path": disk}).stats()["hits"] == 3
+
+    def test_fehler_wird_nicht_als_keine_docs_gespeichert(self, pool, tmp_path):
+        disk = str(tmp_path / "doc_cache.db")
+        server = FakeMcpServer(latency=0.01, missing={"unbekannt"})
+        p = _pipeline(server, pool, disk=disk)
+        server.fail_next = True
+        assert p._fetch_docs_for_library("prisma", "setup") is None
+        assert p._fetch_docs_for_library("unbekannt", "setup") is None
+        cache = get_doc_disk_cache({"enabled": True, "path": disk})
+        # Nur das von Context7 gemeldete "keine Docs" ist negativ gecacht
+        assert cache.get("prisma", "", "setup") == (False, None)
+        assert cache.get("unbekannt", "", "setup") == (True, None)
+        # Der naechste Run versucht prisma erneut
+        assert _pipeline(server, pool, disk=disk)._fetch_docs_for_library("prisma", "setup") == "Docs fuer prisma"
+
+    def test_version_ist_teil_des_keys(self, tmp_path):
+        cache = DocDiskCache(str(tmp_path / "c.db"))
+        cache.put("Prisma", "5.1", "setup", "Docs")
+        assert cache.get("prisma", "5.1", "setup") == (True, "Docs")
+        assert cache.get("prisma", "6.0", "setup") == (False, None)
+        assert cache.get("prisma", "5.1", "auth") == (False, None)
+
+    def test_ttl_und_negative_eintraege(self, tmp_path):
+        cache = DocDiskCache(str(tmp_path / "c.db"), ttl_hours=1, negative_ttl_hours=0.1)
+        now = 1_000_000.0
+        cache.put("zod", "3", "q", "Docs", now=now)
+        cache.put("unbekannt", "", "q", None, now=now)
+        assert cache.get("zod", "3", "q", now=now + 3000) == (True, "Docs")
+        assert cache.get("unbekannt", "", "q", now=now + 300) == (True, None)
+        assert cache.get("unbekannt", "", "q", now=now + 400) == (False, None)
+        assert cache.get("zod", "3", "q", now=now + 3700) == (False, None)
+        assert cache.purge_expired(now=now + 3700) == 2
+
+    def test_ohne_enabled_kein_disk_cache(self):
+        assert get_doc_disk_cache(None) is None
+        assert get_doc_disk_cache({"ttl_hours": 1}) is None
+        p = DocEnrichmentPipeline(config={"doc_enrichment": {"enabled": True}})
+        assert p._disk_cache is None
+
+    @patch.object(DocEnrichmentPipeline, "_fetch_async")
+    def test_pipeline_liest_disk_cache(self, mock_fetch, tmp_path):
+        disk = str(tmp_path / "doc_cache.db")
+        get_doc_disk_cache({"enabled": True, "path": disk}).put("prisma", "5.1", "setup", "Gecacht")
+        p = DocEnrichmentPipeline(config={"doc_enrichment": {
+            "enabled": True, "disk_cache": {"enabled": True, "path": disk}}})
+        p._versions = {"prisma": "5.1"}
+        assert p._fetch_docs_for_library("prisma", "setup") == "Gecacht"
+        mock_fetch.assert_not_called()
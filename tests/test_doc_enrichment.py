@@ -239,8 +239,10 @@ class TestGetEnrichmentSection:
         mock_fetch.side_effect = side_effect
         p = DocEnrichmentPipeline(config={
             "doc_enrichment": {"enabled": True, "max_total_chars": 50}})
-        p.get_enrichment_section({"dependencies": {"prisma": "5", "zod": "3"}}, "")
-        assert counter["n"] == 1  # Nur erste Library gefetcht
+        erg = p.get_enrichment_section({"dependencies": {"prisma": "5", "zod": "3"}}, "")
+        # AENDERUNG 18.10.2026: Fetches laufen parallel - nur die erste Library landet im Prompt
+        assert counter["n"] == 2
+        assert "### prisma" in erg and "### zod" not in erg
 
 
 # ===== 6. TestGetDocEnrichmentSection — Manager-Integration =====
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/docker_test_matrix.py - parallele Test-Matrix.
+              Laeuft ohne Docker-Daemon ueber den LocalCheckRunner.
+"""
+
+import os
+import sys
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.docker_executor import DockerExecutor, DockerConfig, DockerResult
+from backend.docker_test_matrix import (
+    MatrixCheck,
+    MatrixResult,
+    LocalCheckRunner,
+    DockerCheckRunner,
+    run_matrix,
+)
+
+PY = f'"{sys.executable}"'
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Shell-Befehle sind POSIX-spezifisch")
+
+
+class TestRunMatrixLokal:
+    """Tests fuer run_matrix mit lokalem Stand-in."""
+
+    def test_checks_laufen_parallel(self, temp_dir):
+        checks = [MatrixCheck(f"c{i}", f"{PY} -c \"import time; time.sleep(0.5); print('ok{i}')\"")
+                  for i in range(3)]
+        start = time.time()
+        result = run_matrix(checks, LocalCheckRunner(temp_dir), max_parallel=3)
+        assert time.time() - start < 1.4
+        assert result.success
+        assert result.runner == "local"
+        assert list(result.results) == ["c0", "c1", "c2"]
+        assert "ok1" in result.results["c1"].stdout
+
+    def test_max_parallel_begrenzt(self, temp_dir):
+        checks = [MatrixCheck(f"c{i}", f"{PY} -c \"import time; time.sleep(0.3)\"") for i in range(2)]
+        start = time.time()
+        run_matrix(checks, LocalCheckRunner(temp_dir), max_parallel=1)
+        assert time.time() - start >= 0.6
+
+    def test_kritischer_fehler_bricht_rest_ab(self, temp_dir):
+        checks = [
+            MatrixCheck("syntax", "exit 2", critical=True),
+            MatrixCheck("langsam", f"{PY} -c \"import time; time.sleep(10)\""),
+        ]
+        start = time.time()
+        result = run_matrix(checks, LocalCheckRunner(temp_dir))
+        assert time.time() - start < 5
+        assert not result.success
+        assert result.cancelled == ["langsam"]
+        assert result.results["syntax"].exit_code == 2
+        assert result.failed_checks == ["syntax"]
+
+    def test_unkritischer_fehler_bricht_nicht_ab(self, temp_dir):
+        checks = [
+            MatrixCheck("app_start", "exit 1"),
+            MatrixCheck("tests", f"{PY} -c \"import time; time.sleep(0.3); print('fertig')\""),
+        ]
+        result = run_matrix(checks, LocalCheckRunner(temp_dir))
+        assert result.cancelled == []
+        assert result.results["tests"].success
+        assert not result.success
+
+    def test_timeout(self, temp_dir):
+        checks = [MatrixCheck("haengt", f"{PY} -c \"import time; time.sleep(10)\"", timeout=1)]
+        result = run_matrix(checks, LocalCheckRunner(temp_dir))
+        assert not result.results["haengt"].success
+        assert "Timeout" in result.results["haengt"].stderr
+
+    def test_logs_werden_gestreamt(self, temp_dir):
+        lines = []
+        checks = [MatrixCheck("c", "echo eins; echo zwei 1>&2")]
+        run_matrix(checks, LocalCheckRunner(temp_dir),
+                   on_log=lambda name, stream, line: lines.append((name, stream, line)))
+        assert ("c", "stdout", "eins") in lines
+        assert ("c", "stderr", "zwei") in lines
+
+    def test_zeile_laenger_als_stream_limit(self, temp_dir):
+        lines = []
+        checks = [MatrixCheck("lang", f"{PY} -c \"print('x' * 100000); print('ende')\"")]
+        result = run_matrix(checks, LocalCheckRunner(temp_dir),
+                            on_log=lambda name, stream, line: lines.append(line))
+        assert result.success
+        assert result.results["lang"].stdout.count("x") == 100000
+        assert lines[-1] == "ende" and all(len(line) <= 65536 for line in lines)
+
+    def test_stream_fehler_wird_fehlgeschlagener_check(self, temp_dir):
+        killed = []
+
+        class _Kaputt(LocalCheckRunner):
+            @staticmethod
+            async def _pump(stream, check_name, stream_name, buffer, on_log):
+                raise ValueError("Separator is found, but chunk is longer than limit")
+
+            async def _kill(self, check, process):
+                killed.append(check.name)
+                await super()._kill(check, process)
+
+        checks = [MatrixCheck("c", f"{PY} -c \"import time; time.sleep(10)\"")]
+        start = time.time()
+        result = run_matrix(checks, _Kaputt(temp_dir))
+        assert time.time() - start < 5
+        assert killed == ["c"]
+        assert not result.results["c"].success
+        assert "Log-Streaming fehlgeschlagen" in result.results["c"].stderr
+
+
+class TestMatrixResult:
+    """Tests fuer die Aggregation."""
+
+    def test_combined_result(self):
+        matrix = MatrixResult(results={
+            "syntax": DockerResult(True, "Syntax OK", "", 0),
+            "install_test": DockerResult(False, "1 failed", "err", 1),
+        }, duration_seconds=3.0)
+        combined = matrix.combined_result()
+        assert combined.success is False
+        assert combined.exit_code == 1
+        assert "=== syntax ===" in combined.stdout
+        assert "=== install_test ===" in combined.stderr
+        assert combined.duration_seconds == 3.0
+
+    def test_abgebrochen_ist_kein_erfolg(self):
+        matrix = MatrixResult(results={"a": DockerResult(True, "", "", 0)}, cancelled=["b"])
+        assert matrix.success is False
+        assert "Abgebrochen: b" in matrix.combined_result().stderr
+
+    def test_leere_matrix_ist_kein_erfolg(self):
+        matrix = MatrixResult(error="Unbekannter TechStack: cobol")
+        assert matrix.success is False
+        combined = matrix.combined_result()
+        assert combined.success is False and combined.exit_code == 1
+        assert "Unbekannter TechStack" in combined.stderr
+
+
+class TestDockerExecutorMatrix:
+    """Tests fuer die Integration in den DockerExecutor."""
+
+    def test_build_matrix_checks_python(self, temp_dir):
+        Path(temp_dir, "requirements.txt").write_text("flask\n")
+        Path(temp_dir, "tests").mkdir()
+        Path(temp_dir, "src").mkdir()
+        Path(temp_dir, "src", "app.py").write_text("print('x')\n")
+        executor = DockerExecutor(Path(temp_dir), "python")
+        checks = executor.build_matrix_checks()
+        assert [c.name for c in checks] == ["syntax", "install_test", "app_start"]
+        assert checks[0].critical and checks[1].critical and not checks[2].critical
+        assert "pytest" in checks[1].cmd
+
+    def test_build_matrix_checks_ohne_app(self, temp_dir):
+        executor = DockerExecutor(Path(temp_dir), "nodejs")
+        Path(temp_dir, "package.json").write_text("{}")
+        checks = executor.build_matrix_checks(include_app=True)
+        # Kein node_modules → kein App-Check (parallele npm installs vermeiden)
+        assert [c.name for c in checks] == ["syntax", "install_test"]
+
+    def test_docker_befehl_mit_limits(self, temp_dir):
+        executor = DockerExecutor(Path(temp_dir), "python", DockerConfig(memory_limit="256m", cpu_limit=0.5))
+        runner = DockerCheckRunner(executor)
+        cmd = runner.build_command(MatrixCheck("syntax", "echo hi", memory_limit="128m"))
+        assert cmd[cmd.index("--memory") + 1] == "128m"
+        assert cmd[cmd.index("--cpus") + 1] == "0.5"
+        assert cmd[cmd.index("--name") + 1].endswith("_syntax")
+        assert cmd[-3:] == ["sh", "-c", "echo hi"]
+
+    def test_ohne_docker_runtime_error(self, temp_dir):
+        executor = DockerExecutor(Path(temp_dir), "python")
+        with patch.object(executor, "_get_docker_path", return_value=None):
+            with pytest.raises(RuntimeError):
+                executor.run_test_matrix([MatrixCheck("a", "true")])
+
+    def test_lokaler_runner_als_stand_in(self, temp_dir):
+        executor = DockerExecutor(Path(temp_dir), "python")
+        result = executor.run_test_matrix(
+            [MatrixCheck("a", "echo a"), MatrixCheck("b", "echo b")],
+            runner=LocalCheckRunner(temp_dir)
+        )
+        assert result.success
+        assert result.combined_result().stdout.count("===") == 4
+
+    def test_unbekannter_techstack_schlaegt_fehl(self, temp_dir):
+        executor = DockerExecutor(Path(temp_dir), "cobol")
+        result = executor.run_test_matrix(runner=LocalCheckRunner(temp_dir))
+        assert result.success is False
+        assert "Unbekannter TechStack: cobol" in result.combined_result().stderr
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/feedback_delta.py und die Integration in
+              DevLoopTaskDerivation.process_feedback.
+              Testet: Issue-Zerlegung, SimHash-Near-Duplicates, Ledger mit
+              neuen/unterdrueckten/regressed/erneut abgeleiteten Issues und Stats/UI-Events.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.feedback_delta import (
+    FeedbackDeltaEngine,
+    IssueLedger,
+    delta_text,
+    hamming,
+    normalize_issue,
+    simhash,
+    split_issue_units,
+)
+
+
+REVIEW_1 = """## Review
+- [DATEI:app/page.js] useState wird ohne Import verwendet (line 12)
+- [DATEI:app/api/route.js] SQL-Query wird per String-Konkatenation gebaut
+- [DATEI:package.json] test-Script fehlt komplett
+"""
+
+REVIEW_2 = """## Review
+- [DATEI:app/page.js] useState wird ohne Import verwendet (line 14)
+- [DATEI:app/api/route.js] SQL-Query wird per String-Konkatenation gebaut
+- [DATEI:app/layout.js] metadata Export fehlt im Root-Layout
+"""
+
+
+# =========================================================================
+# Zerlegung und Fingerprints
+# =========================================================================
+class TestIssueUnits:
+    """Issue-Einheiten und SimHash."""
+
+    def test_bullets_und_folgezeilen(self):
+        units = split_issue_units("Fehler:\n- Erstes Problem im Code\n  Details dazu\n- Zweites Problem hier\n")
+        assert units == ["- Erstes Problem im Code\n  Details dazu", "- Zweites Problem hier"]
+
+    def test_normalisierung_ignoriert_zeilennummern(self):
+        assert normalize_issue("- Fehler in line 12") == normalize_issue("* Fehler in line 99")
+
+    def test_simhash_near_duplicate(self):
+        a = simhash(normalize_issue("useState wird in app/page.js ohne Import aus react verwendet"))
+        b = simhash(normalize_issue("useState wird in app/page.js ohne Import aus react verwendet!"))
+        c = simhash(normalize_issue("Die Datenbank-Tabelle users fehlt im Schema komplett"))
+        assert hamming(a, b) <= 3
+        assert hamming(a, c) > 3
+
+
+# =========================================================================
+# Ledger
+# =========================================================================
+class TestIssueLedger:
+    """Neue, unterdrueckte, behobene und regressed Issues."""
+
+    def test_zweite_runde_nur_neue_issues(self):
+        ledger = IssueLedger()
+        first = ledger.reconcile(REVIEW_1, "reviewer")
+        ledger.mark_derived(first)
+        second = ledger.reconcile(REVIEW_2, "reviewer")
+        assert len(first.new) == 3 and first.suppressed == 0
+        assert second.suppressed == 2
+        assert [u for u in second.new] == ["- [DATEI:app/layout.js] metadata Export fehlt im Root-Layout"]
+        assert second.resolved == 1  # package.json-Issue ist verschwunden
+
+    def test_regression(self):
+        ledger = IssueLedger()
+        ledger.mark_derived(ledger.reconcile(REVIEW_1, "reviewer"))
+        ledger.mark_derived(ledger.reconcile(REVIEW_2, "reviewer"))
+        third = ledger.reconcile(REVIEW_1, "reviewer")
+        assert third.regressed == ["- [DATEI:package.json] test-Script fehlt komplett"]
+        assert third.suppressed == 2
+
+    def test_fehlgeschlagene_ableitung_wird_wiederholt(self):
+        ledger = IssueLedger()
+        ledger.reconcile(REVIEW_1, "reviewer")  # Tasks fehlgeschlagen: kein mark_derived
+        second = ledger.reconcile(REVIEW_2, "reviewer")
+        assert second.suppressed == 0 and len(second.retried) == 2 and len(second.new) == 1
+        ledger.mark_derived(second)
+        assert ledger.reconcile(REVIEW_2, "reviewer").skip_derivation
+
+    def test_quellen_getrennt(self):
+        ledger = IssueLedger()
+        ledger.reconcile(REVIEW_1, "reviewer")
+        delta = ledger.reconcile(REVIEW_1, "security")
+        assert len(delta.new) == 3
+
+    def test_delta_text(self):
+        ledger = IssueLedger()
+        first = ledger.reconcile(REVIEW_1, "reviewer")
+        assert delta_text(first, REVIEW_1) == REVIEW_1
+        ledger.mark_derived(first)
+        second = ledger.reconcile(REVIEW_2, "reviewer")
+        assert delta_text(second, REVIEW_2) == "- [DATEI:app/layout.js] metadata Export fehlt im Root-Layout"
+
+
+class TestFeedbackDeltaEngine:
+    """Konfiguration und Statistik."""
+
+    def test_config_und_quellen(self):
+        engine = FeedbackDeltaEngine.from_config({"feedback_delta": {"sources": ["reviewer"]}})
+        assert engine.filter(REVIEW_1, "sandbox") is None
+        assert engine.filter(REVIEW_1, "reviewer") is not None
+        assert FeedbackDeltaEngine.from_config({"feedback_delta": {"enabled": False}}).filter(
+            REVIEW_1, "reviewer") is None
+
+    def test_stats(self):
+        engine = FeedbackDeltaEngine()
+        engine.confirm(engine.filter(REVIEW_1, "reviewer"), True)
+        delta = engine.filter(REVIEW_1, "reviewer")
+        assert delta.skip_derivation
+        stats = engine.stats()
+        assert stats["suppressed"] == 3
+        assert stats["derivations_skipped"] == 1
+        assert stats["ledger_size"] == 3
+
+
+# =========================================================================
+# Integration in DevLoopTaskDerivation
+# =========================================================================
+@pytest.fixture
+def td():
+    pytest.importorskip("crewai")
+    from backend.dev_loop_task_derivation import DevLoopTaskDerivation
+    manager = MagicMock()
+    manager.config = {}
+    manager.base_dir = "."
+    manager.model_router = None
+    with patch("backend.dev_loop_task_derivation.DartTaskSync"), \
+         patch("backend.dev_loop_task_derivation.TaskTracker"), \
+         patch("backend.dev_loop_task_derivation.TaskDeriver"):
+        instance = DevLoopTaskDerivation(manager)
+    instance.deriver.derive_tasks.return_value = MagicMock(tasks=[])
+    return instance
+
+
+class TestProcessFeedbackDelta:
+    """Nur neue/regressed Issues erreichen den TaskDeriver."""
+
+    def test_wiederholtes_feedback_ueberspringt_ableitung(self, td):
+        td.process_feedback(REVIEW_1, "reviewer")
+        success, summary, modified = td.process_feedback(REVIEW_1, "reviewer")
+        assert td.deriver.derive_tasks.call_count == 1
+        # None = uebersprungen, kein Fehlschlag fuer den Aufrufer
+        assert success is None and modified == []
+        assert "3 bekannte Issues" in summary
+        assert td.get_stats()["feedback_delta"]["derivations_skipped"] == 1
+
+    def test_nur_neue_issues_an_deriver(self, td):
+        td.process_feedback(REVIEW_1, "reviewer")
+        td.process_feedback(REVIEW_2, "reviewer")
+        second_feedback = td.deriver.derive_tasks.call_args_list[1].args[0]
+        assert "app/layout.js" in second_feedback
+        assert "useState" not in second_feedback
+
+    def test_ui_event_mit_zaehlern(self, td):
+        td.process_feedback(REVIEW_1, "reviewer")
+        td.process_feedback(REVIEW_2, "reviewer")
+        events = [c.args for c in td.manager._ui_log.call_args_list if c.args[1] == "FeedbackDelta"]
+        payload = json.loads(events[-1][2])
+        assert payload["suppressed"] == 2
+        assert payload["new"] == 1
+        assert payload["stats"]["feedback_delta"]["suppressed"] == 2
+
+    def test_sandbox_unveraendert(self, td):
+        td.process_feedback("Sandbox-Fehler:\nTraceback ...", "sandbox")
+        td.process_feedback("Sandbox-Fehler:\nTraceback ...", "sandbox")
+        assert td.deriver.derive_tasks.call_count == 2
+
+    def test_fehlgeschlagene_tasks_werden_erneut_abgeleitet(self, td):
+        td.deriver.derive_tasks.return_value = MagicMock(tasks=[MagicMock()])
+        td._dispatcher = MagicMock()
+        td._dispatcher.dispatch.return_value = []
+        with patch.object(td, "_summarize_results", return_value=(False, "fehlgeschlagen", [])), \
+             patch.object(td, "_record_to_memory"), patch.object(td, "_record_to_documentation"), \
+             patch.object(td, "_record_execution_to_documentation"):
+            assert td.process_feedback(REVIEW_1, "reviewer")[0] is False
+            td.process_feedback(REVIEW_1, "reviewer")
+        assert td.deriver.derive_tasks.call_count == 2
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/file_by_file_pipeline.py.
+              Testet: Abhaengigkeits-Reihenfolge, In-Flight-Fenster, Retry nur der
+              fehlgeschlagenen Datei, Feature-DB-Updates, Blacklist, Event-Loop
+              bleibt frei und Laufzeit gegenueber strikt sequenzieller Ausfuehrung.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.file_by_file_pipeline import get_pipeline_settings, run_pipelined_files
+
+
+PLAN = [
+    {"path": "requirements.txt", "depends_on": []},
+    {"path": "database.py", "depends_on": []},
+    {"path": "models.py", "depends_on": ["database.py"]},
+    {"path": "routes.py", "depends_on": ["models.py"]},
+    {"path": "app.py", "depends_on": ["routes.py", "database.py"]},
+    {"path": "templates/index.html", "depends_on": []},
+]
+
+
+class FakeCoder:
+    """Ersetzt run_single_file_coder: blockierender 'LLM-Aufruf' mit Latenz."""
+
+    def __init__(self, latency=0.05, failures=None):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, manager, project_rules, file_task, existing, user_goal, iteration,
+                 error_context=None):
+        path = file_task["path"]
+        with self._lock:
+            self.calls.append((path, iteration, sorted(existing), error_context))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+            if self.failures.get(path, 0) > 0:
+                self.failures[path] -= 1
+                return None, "SyntaxError: unterminated string"
+        return path, f"# {path}\n"
+
+
+def _analyze(output, expected_path, error_message):
+    return {"error_type": "syntax", "suggested_fix": "", "context_hint": error_message}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = MagicMock()
+    manager.project_path = str(tmp_path)
+    return manager
+
+
+def _run(manager, coder, **kwargs):
+    return asyncio.run(run_pipelined_files(manager, {}, PLAN, "Ziel", coder, _analyze, **kwargs))
+
+
+class TestPipeline:
+    """Ablauf und Ergebnis der Pipeline."""
+
+    def test_abhaengigkeiten_und_ergebnis(self, manager, tmp_path):
+        coder = FakeCoder()
+        completed, content, failed = _run(manager, coder, window=3)
+        assert completed == [f["path"] for f in PLAN] and failed == []
+        assert (tmp_path / "templates" / "index.html").read_text(encoding="utf-8") == "# templates/index.html\n"
+        seen = {path: existing for path, _, existing, _ in coder.calls}
+        assert "database.py" in seen["models.py"]
+        assert {"database.py", "models.py", "routes.py"} <= set(seen["app.py"])
+        assert 1 < coder.max_active <= 3
+
+    def test_fenster_1_ist_sequenziell(self, manager):
+        coder = FakeCoder(latency=0.01)
+        _run(manager, coder, window=1)
+        assert coder.max_active == 1
+        assert [c[0] for c in coder.calls] == [f["path"] for f in PLAN]
+
+    def test_schneller_als_sequenziell(self, manager):
+        plan = [{"path": f"pages/p{i}.py", "depends_on": []} for i in range(12)]
+        coder = FakeCoder(latency=0.1)
+        start = time.monotonic()
+        asyncio.run(run_pipelined_files(manager, {}, plan, "Ziel", coder, _analyze, window=4))
+        assert time.monotonic() - start < 0.6  # sequenziell: 1.2s
+
+    def test_retry_nur_fuer_fehlgeschlagene_datei(self, manager):
+        coder = FakeCoder(failures={"models.py": 1, "routes.py": 5})
+        completed, _, failed = _run(manager, coder, window=3, max_iterations=2)
+        attempts = {}
+        for path, iteration, _, error_context in coder.calls:
+            attempts.setdefault(path, []).append(iteration)
+            if iteration:
+                assert error_context["context_hint"].startswith("SyntaxError")
+        assert attempts["models.py"] == [0, 1]
+        assert attempts["routes.py"] == [0, 1]
+        assert all(v == [0] for k, v in attempts.items() if k not in ("models.py", "routes.py"))
+        assert failed == ["routes.py"]
+        # app.py laeuft trotz fehlgeschlagener Abhaengigkeit (wie sequenziell, mit Warnung)
+        assert "app.py" in completed
+
+    def test_event_loop_bleibt_frei(self, manager):
+        ticks = []
+
+        async def main():
+            async def ticker():
+                while True:
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.01)
+            task = asyncio.create_task(ticker())
+            await run_pipelined_files(manager, {}, PLAN[:2], "Ziel", FakeCoder(latency=0.2),
+                                      _analyze, window=1)
+            task.cancel()
+
+        asyncio.run(main())
+        assert len(ticks) > 10
+
+
+class TestRateLimit:
+    """Drosselung bei Rate-Limit des Coder-Modells."""
+
+    def test_rate_limit_drosselt_auf_eine_datei(self, manager):
+        limited = {"coder": True}
+        manager.model_router.is_role_rate_limited.side_effect = lambda role: limited[role]
+        coder = FakeCoder(latency=0.05)
+        completed, _, failed = _run(manager, coder, window=3)
+        assert coder.max_active == 1
+        assert len(completed) == len(PLAN) and failed == []
+        events = [c.args[1] for c in manager._ui_log.call_args_list]
+        assert events.count("Throttled") == 1
+
+    def test_ohne_rate_limit_volles_fenster(self, manager):
+        manager.model_router.is_role_rate_limited.return_value = False
+        coder = FakeCoder(latency=0.1)
+        _run(manager, coder, window=3)
+        assert coder.max_active > 1
+
+
+class TestFeaturesAndSettings:
+    """Feature-DB, Blacklist und Config."""
+
+    def test_feature_db_updates(self, manager):
+        fdb = MagicMock()
+        fid_map = {"models.py": 7, "routes.py": 8}
+        _run(manager, FakeCoder(failures={"routes.py": 9}), window=2, max_iterations=2,
+             fdb=fdb, fid_map=fid_map)
+        fdb.update_status.assert_any_call(7, "in_progress", agent="Coder")
+        fdb.mark_done.assert_called_once_with(7, actual_lines=1)
+        fdb.mark_failed.assert_called_once_with(8, "Generierung fehlgeschlagen nach 2 Versuchen")
+
+    def test_verbotene_datei(self, manager, tmp_path):
+        plan = [{"path": "package-lock.json", "depends_on": []}, {"path": "main.py", "depends_on": []}]
+        fdb = MagicMock()
+        completed, _, failed = asyncio.run(
+            run_pipelined_files(manager, {}, plan, "Ziel", FakeCoder(latency=0), _analyze,
+                                fdb=fdb, fid_map={"package-lock.json": 3}))
+        assert completed == ["main.py"] and failed == ["package-lock.json"]
+        assert not (tmp_path / "package-lock.json").exists()
+        fdb.mark_failed.assert_called_once_with(3, "Datei steht auf der Blacklist (nicht generieren)")
+
+    def test_settings(self):
+        assert get_pipeline_settings(MagicMock())["enabled"] is False
+        assert get_pipeline_settings({}) == {"enabled": False, "window": 3}
+        assert get_pipeline_settings({"file_by_file_pipeline": {"enabled": True}})["enabled"] is True
+        assert get_pipeline_settings({"file_by_file_pipeline": {"window": 0}})["window"] == 1
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/http_client.py gegen einen lokalen Stub-Server.
+              Testet: Keep-Alive-Wiederverwendung, Retries, GET-Coalescing,
+              Async-Wrapper, EXA-Specialist und parallelen Dart-Batch-Sync.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.http_client import (
+    SharedHttpClient,
+    HttpClientError,
+    HttpStatusError,
+    HttpTimeoutError,
+    get_http_client,
+    reset_http_client,
+)
+from backend.dart_task_sync import DartTaskSync
+from backend.task_models import DerivedTask, TaskCategory, TaskPriority, TargetAgent
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Minimaler API-Stub mit HTTP/1.1 Keep-Alive."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload, extra_headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            server.connections.add(self.client_address)
+
+    def do_GET(self):
+        self._record()
+        if self.path == "/slow":
+            time.sleep(0.3)
+            self._send(200, {"slow": True})
+        elif self.path == "/flaky":
+            with self.server.lock:
+                self.server.flaky_calls += 1
+                calls = self.server.flaky_calls
+            if calls < 3:
+                self._send(503, {"error": "busy"})
+            else:
+                self._send(200, {"calls": calls})
+        elif self.path == "/hang":
+            time.sleep(1.0)
+            self._send(200, {})
+        elif self.path == "/missing":
+            self._send(404, {"error": "not found"})
+        else:
+            self._send(200, {"path": self.path})
+
+    def do_POST(self):
+        self._record()
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path == "/flaky":
+            self._send(503, {"error": "busy"})
+        elif self.path == "/search":
+            self._send(200, {"results": [{"title": payload.get("query"), "url": "http://x", "score": 0.9}]})
+        elif self.path == "/limited":
+            self._send(429, {"error": "rate"})
+        elif self.path == "/tasks/create":
+            time.sleep(0.2)
+            with self.server.lock:
+                self.server.created.append(payload["title"])
+            self._send(201, {"id": "D-" + payload["title"].split("]")[0].strip("[")})
+        else:
+            self._send(200, payload)
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.lock = threading.Lock()
+        self.hits = {}
+        self.connections = set()
+        self.flaky_calls = 0
+        self.created = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def stub_server():
+    server = _StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    c = SharedHttpClient(backoff_base=0.01, backoff_max=0.05)
+    yield c
+    c.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_client():
+    reset_http_client()
+    yield
+    reset_http_client()
+
+
+def _task(task_id):
+    return DerivedTask(
+        id=task_id, title=f"Task {task_id}", description="d",
+        category=TaskCategory.CODE, priority=TaskPriority.MEDIUM,
+        target_agent=TargetAgent.CODER,
+    )
+
+
+# =========================================================================
+# Tests fuer SharedHttpClient
+# =========================================================================
+class TestSharedHttpClient:
+    """Tests fuer Pooling, Retries und Coalescing."""
+
+    def test_keep_alive_wiederverwendung(self, stub_server, client):
+        for i in range(5):
+            assert client.get(f"{stub_server.url}/item/{i}").json() == {"path": f"/item/{i}"}
+        stats = client.stats()
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 4
+        assert len(stub_server.connections) == 1
+
+    def test_post_json(self, stub_server, client):
+        response = client.post(f"{stub_server.url}/echo", json_body={"a": 1})
+        assert response.ok
+        assert response.json() == {"a": 1}
+
+    def test_retry_bei_503_mit_jitter(self, stub_server, client):
+        response = client.get(f"{stub_server.url}/flaky")
+        assert response.status == 200
+        assert response.json() == {"calls": 3}
+        assert client.stats()["retries"] == 2
+
+    def test_post_wird_bei_503_nicht_wiederholt(self, stub_server, client):
+        response = client.post(f"{stub_server.url}/flaky", json_body={})
+        assert response.status == 503
+        assert client.stats()["retries"] == 0
+
+    def test_raise_for_status(self, stub_server, client):
+        response = client.get(f"{stub_server.url}/missing")
+        with pytest.raises(HttpStatusError) as exc:
+            response.raise_for_status()
+        assert exc.value.status == 404
+
+    def test_get_coalescing(self, stub_server, client):
+        results = []
+
+        def worker():
+            results.append(client.get(f"{stub_server.url}/slow").json())
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [{"slow": True}] * 5
+        assert stub_server.hits["/slow"] == 1
+        assert client.stats()["coalesced"] == 4
+
+    def test_timeout(self, stub_server):
+        c = SharedHttpClient(retries=0)
+        with pytest.raises(HttpTimeoutError):
+            c.get(f"{stub_server.url}/hang", timeout=0.2)
+        c.close()
+
+    def test_verbindungsfehler(self, client):
+        with pytest.raises(HttpClientError):
+            client.get("http://127.0.0.1:1/nix", retries=0, timeout=1)
+
+    def test_ungueltige_url(self, client):
+        with pytest.raises(HttpClientError):
+            client.get("ftp://example.com/datei")
+
+    def test_tote_keep_alive_verbindung_wird_ersetzt(self, stub_server, client):
+        client.get(f"{stub_server.url}/a")
+        # Idle-Verbindung schliessen (wie nach abgelaufenem Keep-Alive)
+        pool = next(iter(client._pools.values()))
+        pool._idle[0].sock.close()
+        pool._idle[0].sock = None
+        assert client.post(f"{stub_server.url}/echo", json_body={"ok": 1}).json() == {"ok": 1}
+
+    def test_async_wrapper(self, stub_server, client):
+        async def run():
+            return await asyncio.gather(*[client.aget(f"{stub_server.url}/p/{i}") for i in range(4)])
+
+        responses = asyncio.run(run())
+        assert [r.json()["path"] for r in responses] == [f"/p/{i}" for i in range(4)]
+
+    def test_map_concurrent_reihenfolge(self, client):
+        assert client.map_concurrent(lambda x: x * 2, [1, 2, 3], max_workers=3) == [2, 4, 6]
+
+    def test_geteilter_client_singleton(self):
+        assert get_http_client() is get_http_client()
+
+
+# =========================================================================
+# Tests fuer die Integrationen
+# =========================================================================
+class TestIntegrationen:
+    """EXA und Dart ueber den geteilten Client."""
+
+    def test_dart_sync_batch_parallel(self, stub_server):
+        sync = DartTaskSync(token="t")
+        sync.API_BASE = stub_server.url
+        tasks = [_task(f"T-{i}") for i in range(4)]
+        start = time.monotonic()
+        mapping = sync.sync_batch(tasks)
+        elapsed = time.monotonic() - start
+        assert mapping == {f"T-{i}": f"D-T-{i}" for i in range(4)}
+        assert tasks[2].dart_id == "D-T-2"
+        # 4 Requests a 0.2s parallel statt 0.8s sequentiell
+        assert elapsed < 0.7
+        assert get_http_client().stats()["connections_created"] <= DartTaskSync.BATCH_CONCURRENCY
+
+    def test_dart_netzwerkfehler(self):
+        sync = DartTaskSync(token="t")
+        sync.API_BASE = "http://127.0.0.1:1"
+        assert sync.sync_task(_task("T-X")) is None
+
+    def test_exa_api_ueber_client(self, stub_server):
+        from external_specialists.exa_specialist import EXASpecialist
+        exa = EXASpecialist({})
+        exa.API_URL = f"{stub_server.url}/search"
+        result = asyncio.run(exa._call_exa_api("key", "react hooks", 3, "neural", 5))
+        assert result["results"][0]["title"] == "react hooks"
+
+    def test_exa_rate_limit_setzt_cooldown(self, stub_server):
+        from external_specialists.exa_specialist import EXASpecialist
+        exa = EXASpecialist({"cooldown_seconds": 60})
+        exa.API_URL = f"{stub_server.url}/limited"
+        assert asyncio.run(exa._call_exa_api("key", "q", 3, "neural", 5)) is None
+        assert exa.is_in_cooldown()
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer agents/lesson_index.py.
+              Testet: BM25-Ranking im Prompt, unveraenderte Auswahl ohne Query,
+              Duplikat-Pruefung gegen den bisherigen Vergleich, inkrementellen
+              Index-Sync ueber save_memory und die Lessons im Coder-Prompt.
+"""
+
+import json
+import random
+from unittest.mock import MagicMock, patch
+
+from agents.lesson_index import LessonIndex, get_lesson_index, get_lesson_retrieval_settings
+from agents.memory_core import get_lessons_for_prompt, save_memory
+from agents.memory_features import _add_or_update_lesson
+from agents.memory_learning import is_duplicate_lesson, learn_from_error
+
+
+def _lesson(pattern, action, tags=("global",), count=1):
+    return {"pattern": pattern, "action": action, "tags": list(tags), "count": count}
+
+
+LESSONS = [
+    _lesson("ModuleNotFoundError", "Pruefe requirements.txt", count=7),
+    _lesson("before_first_request", "Nutze app.app_context()", tags=("flask",), count=3),
+    _lesson("unterminated string literal", "Weniger Dateien pro Response", count=2),
+    _lesson("KeyError: 'user_id'", "Nutze dict.get() mit Default", count=1),
+]
+
+
+def _write(tmp_path, lessons):
+    path = tmp_path / "memory.json"
+    path.write_text(json.dumps({"lessons": lessons, "history": []}), encoding="utf-8")
+    return str(path)
+
+
+def _overlap_duplicate(lessons, pattern, threshold=0.6):
+    """Referenz: bisheriger Vergleich aus is_duplicate_lesson."""
+    error_lower = pattern.lower()
+    error_words = set(error_lower.split())
+    for lesson in lessons:
+        existing = lesson.get("pattern", "").lower()
+        if existing in error_lower or error_lower in existing:
+            return True
+        words = set(existing.split())
+        if error_words and words and len(error_words & words) / max(len(error_words), len(words)) >= threshold:
+            return True
+    return False
+
+
+class TestRanking:
+    """Auswahl der Lessons fuer den Prompt."""
+
+    def test_ohne_query_wie_bisher(self, tmp_path):
+        path = _write(tmp_path, LESSONS)
+        lines = get_lessons_for_prompt(path, tech_stack="flask webapp").splitlines()
+        assert lines[0].startswith("🔴 [7x]")
+        assert [line.split("] ")[1] for line in lines] == [
+            "Pruefe requirements.txt", "Nutze app.app_context()",
+            "Weniger Dateien pro Response", "Nutze dict.get() mit Default"]
+        # Flask-Lesson nur mit passendem Tech-Stack
+        assert "app_context" not in get_lessons_for_prompt(path, tech_stack="django")
+
+    def test_query_rankt_nach_relevanz(self, tmp_path):
+        path = _write(tmp_path, LESSONS)
+        result = get_lessons_for_prompt(path, limit=2, query="KeyError: 'user_id' in routes.py")
+        lines = result.splitlines()
+        assert lines[0] == "⚪ [1x] Nutze dict.get() mit Default"
+        # freier Platz wird nach count aufgefuellt
+        assert lines[1].startswith("🔴 [7x]")
+
+    def test_bm25_bevorzugt_seltene_terme(self):
+        index = LessonIndex([
+            _lesson("error in app", "allgemein"),
+            _lesson("error in jinja template enumerate", "Jinja-Globals setzen"),
+        ])
+        scores = index.scores("error enumerate")
+        assert scores[1] > scores[0] > 0
+
+    def test_settings(self):
+        assert get_lesson_retrieval_settings(MagicMock())["enabled"] is False
+        assert get_lesson_retrieval_settings({})["enabled"] is True
+        assert get_lesson_retrieval_settings({"lesson_retrieval": {"enabled": False}})["enabled"] is False
+
+
+class TestDuplicate:
+    """MinHash-Kandidaten mit exakter Ueberlappungs-Pruefung."""
+
+    def test_gleiches_ergebnis_wie_paarweiser_vergleich(self, tmp_path):
+        rng = random.Random(3)
+        vocab = ["error", "import", "flask", "route", "missing", "template", "json", "token",
+                 "timeout", "database", "session", "cookie", "header", "render", "query"]
+        lessons = [_lesson(" ".join(rng.sample(vocab, rng.randint(3, 6))), "x") for _ in range(200)]
+        index = LessonIndex(lessons)
+        for _ in range(200):
+            pattern = " ".join(rng.sample(vocab, rng.randint(3, 7)))
+            assert index.is_duplicate(pattern) == _overlap_duplicate(lessons, pattern)
+
+    def test_is_duplicate_lesson_nutzt_index(self, tmp_path):
+        path = _write(tmp_path, LESSONS)
+        assert is_duplicate_lesson(path, "modulenotfounderror: no module named x")
+        assert not is_duplicate_lesson(path, "Voellig neuer Fehler ohne Bezug")
+        assert get_lesson_index(path) is get_lesson_index(path)
+
+
+class TestIncrementalSync:
+    """save_memory zieht einen vorhandenen Index nach."""
+
+    def test_learn_from_error_ergaenzt_index(self, tmp_path):
+        path = _write(tmp_path, LESSONS)
+        index = get_lesson_index(path)
+        learn_from_error(path, "TypeError: unsupported operand type(s) for +: 'int' and 'str'", ["global"])
+        learn_from_error(path, "ModuleNotFoundError: No module named 'requests'", ["global"])
+        assert get_lesson_index(path) is index
+        assert len(index) == 5
+        assert index.lessons[0]["count"] == 8
+        ranked = get_lessons_for_prompt(path, query="TypeError unsupported operand")
+        assert ranked.splitlines()[0] == "⚪ [1x] Prüfe die Datentypen der übergebenen Argumente."
+
+    def test_add_or_update_lesson_und_neuaufbau(self, tmp_path):
+        path = _write(tmp_path, LESSONS)
+        index = get_lesson_index(path)
+        data = {"lessons": [dict(lesson) for lesson in LESSONS]}
+        _add_or_update_lesson(data, "task_derivation_many_critical", "task_derivation", "Priorisieren",
+                              ["global", "task_derivation"])
+        save_memory(path, data)
+        assert get_lesson_index(path) is index
+        assert index.scores("critical task_derivation_many_critical")
+        # geaenderter Praefix → neuer Index
+        save_memory(path, {"lessons": data["lessons"][1:]})
+        assert get_lesson_index(path) is not index
+        assert len(get_lesson_index(path)) == 4
+
+
+@patch("backend.doc_enrichment.get_doc_enrichment_section", return_value=None)
+@patch("backend.dev_loop_coder_prompt.get_python_dependency_versions", return_value="")
+@patch("backend.dev_loop_coder_prompt.get_constraints_for_prompt", return_value="")
+def test_coder_prompt_gerankte_lessons_im_suffix(_c, _d, _e, tmp_path):
+    from backend.dev_loop_coder_prompt import build_coder_prompt
+    from backend.prompt_cache import split_cacheable
+
+    manager = MagicMock()
+    manager.tech_blueprint = {"project_type": "webapp", "language": "python"}
+    manager.config = {"prompt_cache": {"enabled": True, "min_prefix_chars": 100},
+                      "lesson_retrieval": {"query_chars": 10}}
+    manager.is_first_run = True
+    manager.current_code = ""
+    manager.base_dir = str(tmp_path)
+    manager.database_schema = ""
+    manager._missing_files = []
+    manager.get_briefing_context = MagicMock(return_value="")
+    del manager.design_concept
+    del manager.security_vulnerabilities
+
+    with patch("backend.dev_loop_coder_prompt.get_lessons_for_prompt", return_value="- L") as lessons:
+        prompt = build_coder_prompt(manager, "Ziel", "KeyError: 'user_id' in routes.py", 1)
+    assert lessons.call_args.kwargs["query"] == "KeyError: "
+    prefix, suffix = split_cacheable(prompt)
+    assert "LESSONS LEARNED" in suffix and "LESSONS LEARNED" not in prefix
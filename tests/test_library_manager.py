@@ -44,6 +44,15 @@ class TestInit:
         assert os.path.isdir(mgr.library_dir), "library/ Verzeichnis fehlt"
         assert os.path.isdir(mgr.archive_dir), "library/archive/ Verzeichnis fehlt"
 
+    def test_run_worker_eigene_projektdatei(self, tmp_path, monkeypatch):
+        """Run-Worker schreiben nicht in die current_project.json des Servers."""
+        monkeypatch.setenv("AGENTSMITH_RUN_ID", "run_20261018_101010_abc123")
+        mgr = LibraryManager(base_dir=str(tmp_path))
+        assert os.path.basename(mgr.current_project_file) == \
+            "current_project_run_20261018_101010_abc123.json"
+        mgr.start_project(name="p", goal="g")
+        assert not os.path.exists(os.path.join(mgr.library_dir, "current_project.json"))
+
     def test_current_project_ist_initial_none(self, lib_mgr):
         """Ohne vorhandene Projektdatei ist current_project None."""
         assert lib_mgr.current_project is None
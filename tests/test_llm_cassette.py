@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/llm_cassette.py.
+              Testet: Prompt-Normalisierung, Aufnahme/Replay mit Hash- und
+              Reihenfolge-Zuordnung, synthetische Latenz, strikter Modus,
+              LiteLLM-Wrapper (mock_response) und ClaudeSDKProvider-Replay.
+"""
+
+import asyncio
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend import llm_cassette
+from backend.llm_cassette import (
+    CassetteMissError,
+    CassettePlayer,
+    finish_cassette_recording,
+    finish_cassette_replay,
+    get_cassette_settings,
+    install_litellm_cassette,
+    load_cassette,
+    prompt_key,
+    response_text,
+    start_cassette_recording,
+    start_cassette_replay,
+)
+from backend.prompt_cache import CACHE_BREAKPOINT
+
+
+@pytest.fixture(autouse=True)
+def _reset_active():
+    yield
+    finish_cassette_recording()
+    finish_cassette_replay()
+
+
+def _entry(agent, response, key="k", latency_ms=100.0):
+    return {"type": "call", "provider": "litellm", "agent": agent, "model": "m", "key": key,
+            "response": response, "latency_ms": latency_ms}
+
+
+class TestPromptKey:
+    """Stabile Schluessel trotz laufzeit-abhaengiger Prompt-Teile."""
+
+    def test_pfade_zeitstempel_ids(self):
+        a = "Projekt /home/a/app/projects/todo_20260101_101010/app.py am 2026-01-01T10:10:10Z id 1b4e28ba-2fa1-11d2-883f-0016d3cca427"
+        b = "Projekt /srv/x/projects/todo_20261018_090000/app.py am 2026-10-18 09:00:00 id 6fa459ea-ee8a-3ca4-894e-db77e160355e"
+        assert prompt_key(a) == prompt_key(b)
+        assert prompt_key("Erstelle app.py") != prompt_key("Erstelle main.py")
+
+    def test_breakpoint_und_content_bloecke(self):
+        raw = [{"role": "user", "content": "PRAEFIX" + CACHE_BREAKPOINT + "SUFFIX"}]
+        blocks = [{"role": "user", "content": [
+            {"type": "text", "text": "PRAEFIX", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "SUFFIX"}]}]
+        assert prompt_key(raw) == prompt_key(blocks)
+
+    def test_response_text_und_settings(self):
+        obj = types.SimpleNamespace(choices=[types.SimpleNamespace(
+            message=types.SimpleNamespace(content="hallo"))])
+        assert response_text(obj) == "hallo"
+        assert response_text({"choices": [{"message": {"content": "x"}}]}) == "x"
+        assert response_text(None) == ""
+        assert get_cassette_settings({})["record"] is False
+        assert get_cassette_settings({"llm_cassettes": {"record": True}})["record"] is True
+
+
+class TestRecordReplay:
+    """Aufnahme, Zuordnung und Latenz."""
+
+    def test_aufnahme_und_replay(self, tmp_path):
+        path = str(tmp_path / "run.cassette.jsonl")
+        start_cassette_recording(path, source="test")
+        llm_cassette.record_llm_call("litellm", "Coder", "m", "Erstelle app.py", "A", 200.0)
+        llm_cassette.record_llm_call("claude_sdk", "Reviewer", "sonnet", "Review", "OK", 50.0)
+        assert finish_cassette_recording() == path
+        entries = load_cassette(path)
+        assert [e["response"] for e in entries] == ["A", "OK"]
+
+        sleeps = []
+        player = start_cassette_replay(path, latency_scale=0.5, sleep=sleeps.append)
+        # Reihenfolge der Anfragen darf von der Aufnahme abweichen
+        assert player.replay("claude_sdk", "Reviewer", "sonnet", "Review") == "OK"
+        assert player.replay("litellm", "Coder", "m", "Erstelle app.py") == "A"
+        assert sleeps == [0.025, 0.1]
+        stats = finish_cassette_replay()
+        assert stats["exact"] == 2 and stats["unused"] == 0 and stats["simulated_latency_ms"] == 125.0
+
+    def test_reihenfolge_fallback_pro_agent(self):
+        player = CassettePlayer([_entry("Coder", "erste"), _entry("Reviewer", "review"),
+                                 _entry("Coder", "zweite")], latency_ms=0)
+        assert player.replay("litellm", "coder", "m", "ganz anderer Prompt") == "erste"
+        assert player.replay("litellm", "Coder", "m", "noch einer") == "zweite"
+        assert player.stats()["sequence"] == 2
+
+    def test_strikt_und_tolerant(self):
+        strict = CassettePlayer([_entry("Coder", "a")], latency_ms=0)
+        strict.replay("litellm", "Coder", "m", "x")
+        with pytest.raises(CassetteMissError):
+            strict.replay("litellm", "Coder", "m", "y")
+        assert strict.stats()["misses"] == 1
+        lenient = CassettePlayer([_entry("Coder", "a")], latency_ms=0, strict=False)
+        lenient.replay("litellm", "Coder", "m", "x")
+        assert lenient.replay("litellm", "Coder", "m", "y") == "a"
+        with pytest.raises(CassetteMissError):
+            lenient.replay("litellm", "Planner", "m", "z")
+
+
+class TestIntegration:
+    """LiteLLM-Wrapper und ClaudeSDKProvider."""
+
+    def test_litellm_mock_response(self):
+        calls = []
+
+        def completion(*args, **kwargs):
+            calls.append(kwargs)
+            return kwargs.get("mock_response", "echt")
+
+        async def acompletion(*args, **kwargs):
+            calls.append(kwargs)
+            return kwargs.get("mock_response", "echt")
+
+        module = types.SimpleNamespace(completion=completion, acompletion=acompletion)
+        assert install_litellm_cassette(module, agent_getter=lambda: "Coder") is True
+        assert install_litellm_cassette(module) is False
+        messages = [{"role": "user", "content": "hi"}]
+        assert module.completion(model="m", messages=messages) == "echt"
+
+        llm_cassette._player = CassettePlayer([_entry("Coder", "aus Kassette"),
+                                               _entry("Coder", "async")], latency_ms=0)
+        assert module.completion(model="m", messages=messages) == "aus Kassette"
+        assert asyncio.run(module.acompletion(model="m", messages=messages)) == "async"
+        assert calls[1]["mock_response"] == "aus Kassette"
+
+    def test_provider_replay_ohne_sdk(self, tmp_path):
+        from backend.claude_sdk.provider import ClaudeSDKProvider
+        provider = ClaudeSDKProvider()
+        provider._ensure_initialized = MagicMock(side_effect=AssertionError("SDK geladen"))
+        prompt = "Regeln" + CACHE_BREAKPOINT + "Erstelle app.py"
+
+        path = str(tmp_path / "sdk.cassette.jsonl")
+        start_cassette_recording(path)
+        with patch.object(provider, "_run_cli", return_value="### FILENAME: app.py"), \
+             patch.object(provider, "_record_success"):
+            provider.run_agent(prompt=prompt, role="coder", use_cli_mode=True)
+        finish_cassette_recording()
+
+        start_cassette_replay(path, latency_ms=0)
+        with patch.object(provider, "_run_sync") as run_sync, \
+             patch.object(provider, "_record_success") as record:
+            assert provider.run_agent(prompt=prompt, role="coder") == "### FILENAME: app.py"
+        run_sync.assert_not_called()
+        assert record.called
+        assert finish_cassette_replay()["exact"] == 1
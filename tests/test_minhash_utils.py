@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer minhash_utils.py.
+              Testet: Wort-Normalisierung, deterministische Signaturen,
+              LSH-Baender und Jaccard.
+"""
+
+from minhash_utils import NUM_PERM, band_keys, jaccard, minhash, normalized_words
+
+
+class TestMinhashUtils:
+    """Gemeinsame Basis von Fragen-Dedup und Lesson-Index."""
+
+    def test_normalized_words(self):
+        assert normalized_words("Soll die App offline funktionieren?", {"die"}) == {
+            "soll", "app", "offline", "funktionieren"}
+        assert normalized_words(None) == set()
+
+    def test_minhash_deterministisch(self):
+        tokens = normalized_words("Soll die App offline funktionieren?")
+        assert minhash(tokens) == minhash(set(tokens))
+        assert minhash(sorted(tokens)) == minhash(reversed(sorted(tokens)))
+        assert len(minhash(tokens)) == NUM_PERM
+        assert minhash(set()) == ()
+
+    def test_band_keys_und_jaccard(self):
+        signature = minhash({"a", "b", "c"})
+        keys = list(band_keys(signature, 2))
+        assert len(keys) == NUM_PERM // 2
+        assert keys[1] == (2, signature[2:4])
+        assert jaccard({"a", "b"}, {"b", "c"}) == 1 / 3
+        assert jaccard(set(), set()) == 0.0
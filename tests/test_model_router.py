@@ -138,6 +138,14 @@ class TestRateLimitingAndFallback:
         model = router.get_model("coder")
         assert model == "model-fallback-2"
 
+    def test_is_role_rate_limited(self, router):
+        """Rolle gilt als rate-limited solange ihr Primary im Cooldown ist."""
+        assert router.is_role_rate_limited("coder") is False
+        router.mark_rate_limited_sync("model-primary")
+        assert router.is_role_rate_limited("coder") is True
+        router.rate_limited_models["model-primary"] = time.time() - 1
+        assert router.is_role_rate_limited("coder") is False
+
     def test_cooldown_tracking(self, router):
         """Modell wird nach Cooldown wieder verfügbar."""
         # Rate-Limit setzen mit sehr kurzem Cooldown
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer model_router_health_sweep.py und die parallelen Sweeps
+              im HealthCheckManager - gegen einen Fake-LiteLLM-Completion-Stub.
+
+              Tests validieren:
+              - Parallelitaet global und pro Provider begrenzt
+              - Abdeckung der Fallback-Ketten
+              - TTL-Cache und Zusammenfassen identischer Checks
+              - Inkrementelle Re-Checks aus Router-Fehlersignalen
+"""
+
+import time
+import asyncio
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import model_router_health
+from model_router import ModelRouter, reset_model_router
+from model_router_health import HealthCheckManager
+from model_router_health_sweep import HealthSweepEngine, collect_models, provider_of
+
+
+class FakeLiteLLM:
+    """Stub fuer litellm.acompletion mit Latenz, Fehlern und Parallelitaetsmessung."""
+
+    def __init__(self, delay=0.05, errors=None):
+        self.delay = delay
+        self.errors = dict(errors or {})
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.active_per_provider = {}
+        self.max_per_provider = {}
+
+    async def acompletion(self, model, messages, max_tokens, timeout):
+        provider = provider_of(model)
+        self.calls.append(model)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.active_per_provider[provider] = self.active_per_provider.get(provider, 0) + 1
+        self.max_per_provider[provider] = max(
+            self.max_per_provider.get(provider, 0), self.active_per_provider[provider]
+        )
+        try:
+            await asyncio.sleep(self.delay)
+            if model in self.errors:
+                raise Exception(self.errors[model])
+            return {"choices": [{"message": {"content": "H"}}]}
+        finally:
+            self.active -= 1
+            self.active_per_provider[provider] -= 1
+
+
+@pytest.fixture
+def fake_litellm(monkeypatch):
+    fake = FakeLiteLLM()
+    monkeypatch.setattr(model_router_health, "litellm", fake, raising=False)
+    monkeypatch.setattr(model_router_health, "LITELLM_AVAILABLE", True)
+    return fake
+
+
+def _models_config(roles=15):
+    config = {}
+    for i in range(roles):
+        provider = "openrouter" if i % 2 else "anthropic"
+        config[f"role{i}"] = {
+            "primary": f"{provider}/primary-{i}",
+            "fallback": [f"{provider}/fb-{i}", "openrouter/shared-fb"],
+            "extended_fallback": [f"openrouter/ext-{i}"],
+        }
+    return config
+
+
+# =========================================================================
+# Tests fuer collect_models / provider_of
+# =========================================================================
+class TestCollectModels:
+    """Modell-Sammlung ueber alle Ketten."""
+
+    def test_primaries_zuerst_und_dedupliziert(self):
+        models = collect_models({
+            "coder": {"primary": "a/p1", "fallback": ["a/f1", "x/shared"]},
+            "reviewer": {"primary": "b/p2", "fallback": ["x/shared"]},
+            "meta": "c/simple",
+        }, include_fallbacks=True)
+        assert list(models)[:3] == ["a/p1", "b/p2", "c/simple"]
+        assert sorted(models["x/shared"]) == ["coder", "reviewer"]
+
+    def test_ohne_fallbacks(self):
+        # Standard: nur Primaries - Fallbacks kosten beim Start-Sweep zusaetzliche Calls
+        models = collect_models({"coder": {"primary": "p", "fallback": ["f"]}})
+        assert list(models) == ["p"]
+
+    def test_provider(self):
+        assert provider_of("openrouter/x/y:free") == "openrouter"
+        assert provider_of("gpt-4") == "default"
+
+
+# =========================================================================
+# Tests fuer HealthSweepEngine
+# =========================================================================
+class TestHealthSweepEngine:
+    """Parallelitaet, Cache und Signale."""
+
+    def test_parallel_mit_provider_limit(self, fake_litellm):
+        engine = HealthSweepEngine(max_concurrency=6, per_provider_concurrency=2, jitter_seconds=0)
+        models = collect_models(_models_config())
+        start = time.monotonic()
+        results = asyncio.run(engine.sweep(models))
+        elapsed = time.monotonic() - start
+
+        assert set(results) == set(models)
+        assert len(fake_litellm.calls) == len(models)
+        assert fake_litellm.max_active <= 6
+        assert max(fake_litellm.max_per_provider.values()) <= 2
+        # 46 Modelle sequentiell mit 2s Pause waeren > 90s
+        assert elapsed < len(models) * fake_litellm.delay
+
+    def test_ttl_cache(self, fake_litellm):
+        engine = HealthSweepEngine(jitter_seconds=0, ttl_seconds=60)
+
+        async def run():
+            await engine.sweep(["a/m1", "a/m2"])
+            await engine.sweep(["a/m1", "a/m2"])
+
+        asyncio.run(run())
+        assert len(fake_litellm.calls) == 2
+        assert engine.stats()["cache_hits"] == 2
+
+    def test_abgelaufener_cache_wird_neu_geprueft(self, fake_litellm):
+        engine = HealthSweepEngine(jitter_seconds=0, ttl_seconds=0)
+
+        async def run():
+            await engine.check("a/m1")
+            await asyncio.sleep(0.01)
+            await engine.check("a/m1")
+
+        asyncio.run(run())
+        assert fake_litellm.calls == ["a/m1", "a/m1"]
+
+    def test_gleichzeitige_checks_zusammengefasst(self, fake_litellm):
+        engine = HealthSweepEngine(jitter_seconds=0)
+
+        async def run():
+            return await asyncio.gather(*(engine.check("a/m1") for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert fake_litellm.calls == ["a/m1"]
+        assert all(r.available for r in results)
+        assert engine.stats()["deduplicated"] == 4
+
+    def test_fehler_signal_und_recheck_due(self, fake_litellm):
+        engine = HealthSweepEngine(jitter_seconds=0)
+
+        async def run():
+            await engine.sweep(["a/m1", "a/m2"])
+            engine.note_failure("a/m1", "rate_limited", retry_after=0)
+            engine.note_failure("a/m2", "rate_limited", retry_after=60)
+            return await engine.recheck_due()
+
+        rechecked = asyncio.run(run())
+        assert list(rechecked) == ["a/m1"]
+        assert engine.due_models(now=time.time() + 61) == ["a/m2"]
+        # m2 ist noch im Cooldown → Cache bleibt gueltig
+        assert engine.get_cached("a/m2") is not None
+
+    def test_erfolg_ersetzt_check(self, fake_litellm):
+        engine = HealthSweepEngine(jitter_seconds=0)
+        engine.note_success("a/m1")
+        asyncio.run(engine.sweep(["a/m1"]))
+        assert fake_litellm.calls == []
+
+    def test_from_config(self):
+        engine = HealthSweepEngine.from_config({"health_check": {"per_provider_concurrency": 1, "ttl_seconds": 5}})
+        assert engine.per_provider_concurrency == 1
+        assert engine.ttl_seconds == 5.0
+
+
+# =========================================================================
+# Tests fuer HealthCheckManager / ModelRouter
+# =========================================================================
+class TestHealthCheckManagerSweep:
+    """Integration in HealthCheckManager und ModelRouter."""
+
+    def test_sweep_mit_fallbacks_und_404(self, fake_litellm):
+        fake_litellm.errors = {
+            "anthropic/fb-0": "404 Not Found: free period ended",
+            "openrouter/primary-1": "429 rate limit",
+        }
+        manager = HealthCheckManager({"health_check": {"jitter_seconds": 0, "include_fallbacks": True}})
+        results = asyncio.run(manager.health_check_all_primary_models(_models_config(2)))
+
+        assert results["role0"]["available"] is True
+        fallbacks = {f["model"]: f for f in results["role0"]["fallbacks"]}
+        assert fallbacks["anthropic/fb-0"]["available"] is False
+        assert manager.is_permanently_unavailable("anthropic/fb-0")
+        assert results["role1"]["reason"] == "rate_limited"
+        assert not manager.is_permanently_unavailable("openrouter/primary-1")
+
+    def test_recheck_unavailable_parallel(self, fake_litellm):
+        manager = HealthCheckManager({"health_check": {"jitter_seconds": 0}})
+        for i in range(6):
+            manager.mark_permanently_unavailable(f"a/m{i}", "404")
+        fake_litellm.errors = {"a/m0": "404 not found"}
+        start = time.monotonic()
+        results = asyncio.run(manager.recheck_unavailable_models())
+        assert time.monotonic() - start < 6 * fake_litellm.delay
+        assert results["a/m0"] is False
+        assert sum(results.values()) == 5
+        assert list(manager.permanently_unavailable) == ["a/m0"]
+
+    def test_router_fehler_loest_inkrementellen_recheck_aus(self, fake_litellm):
+        reset_model_router()
+        router = ModelRouter({
+            "mode": "test",
+            "health_check": {"jitter_seconds": 0},
+            "models": {"test": {"coder": {"primary": "a/p", "fallback": ["a/f"]}}},
+        })
+
+        async def run():
+            await router.health_check_all_primary_models(delay_between_checks=0)
+            calls_after_sweep = len(fake_litellm.calls)
+            router.mark_rate_limited_sync("a/p")
+            # Cooldown laeuft noch → nichts faellig
+            assert await router.recheck_failed_models() == {}
+            engine = router._health_manager.sweep_engine
+            engine._due["a/p"] = time.time() - 1
+            rechecked = await router.recheck_failed_models()
+            return calls_after_sweep, rechecked
+
+        calls_after_sweep, rechecked = asyncio.run(run())
+        assert calls_after_sweep == 1  # Start-Sweep: nur Primary, Fallback a/f ist opt-in
+        assert list(rechecked) == ["a/p"]
+        assert fake_litellm.calls.count("a/p") == 2
+        assert "sweep" in router.get_health_status()
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/operation_supervisor.py.
+              Testet: Ergebnis/Fehler, Deadlines, Heartbeats ueber einen Timer-
+              Thread, kooperativen Abbruch, Live-Sicht und Thread-Sparsamkeit.
+"""
+
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.operation_supervisor import (
+    OperationCancelled,
+    OperationSupervisor,
+    cancellable_sleep,
+    check_cancelled,
+    current_operation,
+)
+
+
+@pytest.fixture
+def supervisor():
+    sup = OperationSupervisor(max_workers=4)
+    yield sup
+    sup.shutdown()
+
+
+class TestOperationSupervisor:
+    """Ausfuehrung, Deadlines und Heartbeats."""
+
+    def test_ergebnis_und_argumente(self, supervisor):
+        assert supervisor.run(lambda a, b=0: a + b, 2, b=3, name="add") == 5
+        assert supervisor.stats()["done"] == 1
+
+    def test_exception_unveraendert(self, supervisor):
+        def boom():
+            raise KeyError("x")
+        with pytest.raises(KeyError):
+            supervisor.run(boom)
+        assert supervisor.stats()["failed"] == 1
+
+    def test_deadline_gibt_aufrufer_frei_und_setzt_token(self, supervisor):
+        seen = {}
+
+        def slow():
+            op = current_operation()
+            seen["cancelled"] = op.token.wait(2)
+            seen["reason"] = op.token.reason
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError, match="0.2s"):
+            supervisor.run(slow, timeout=0.2, owner="Coder")
+        assert time.monotonic() - start < 1.0
+        time.sleep(0.1)
+        assert seen == {"cancelled": True, "reason": "timeout"}
+        assert supervisor.stats()["timeout"] == 1
+
+    def test_heartbeats_aus_einem_timer_thread(self, supervisor):
+        beats = []
+        threads = set()
+
+        def on_heartbeat(op):
+            beats.append(op.heartbeat_count)
+            threads.add(threading.current_thread().name)
+
+        before = threading.active_count()
+        ops = [supervisor.start(time.sleep, 0.45, heartbeat_interval=0.1,
+                                on_heartbeat=on_heartbeat) for _ in range(4)]
+        # 4 Worker + 1 Timer-Thread + Heartbeat-Lane, keine Threads pro Operation
+        assert threading.active_count() - before <= 7
+        for op in ops:
+            op.future.result(timeout=2)
+        time.sleep(0.05)
+        # Callbacks laufen nie im Timer-Thread (voller Pool → Heartbeat-Lane)
+        assert threads and all(name.startswith("Supervisor-Heartbeat") for name in threads)
+        assert len(beats) >= 8
+        assert supervisor.stats()["heartbeats"] >= len(beats)
+
+    def test_langsamer_heartbeat_blockiert_keine_deadline(self, supervisor):
+        release = threading.Event()
+
+        def slow_heartbeat(op):
+            release.wait(2)
+
+        supervisor.start(time.sleep, 1.0, heartbeat_interval=0.05, on_heartbeat=slow_heartbeat)
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            supervisor.run(time.sleep, 1.0, timeout=0.2)
+        assert time.monotonic() - start < 0.6
+        release.set()
+
+    def test_abbruch_gibt_wartenden_aufrufer_frei(self, supervisor):
+        inner_started = threading.Event()
+        inner_ops = []
+
+        def inner():
+            inner_ops.append(current_operation())
+            inner_started.set()
+            time.sleep(1.0)  # ohne Abbruchpunkt
+
+        def outer():
+            return supervisor.run(inner, name="inner")
+
+        op = supervisor.start(outer, name="outer")
+        assert inner_started.wait(1)
+        start = time.monotonic()
+        assert supervisor.cancel(op.op_id, "user")
+        with pytest.raises(OperationCancelled, match="user"):
+            op.future.result(timeout=0.5)
+        assert time.monotonic() - start < 0.5
+        # Verschachtelte Operation wurde mit abgebrochen
+        assert inner_ops[0].token.reason == "user" and inner_ops[0].status == "cancelled"
+        assert supervisor.snapshot() == []
+
+    def test_cancellable_sleep(self, supervisor):
+        def worker():
+            cancellable_sleep(5)
+
+        op = supervisor.start(worker)
+        time.sleep(0.05)
+        start = time.monotonic()
+        supervisor.cancel(op.op_id, "stop")
+        with pytest.raises(OperationCancelled):
+            op.future.result(timeout=1)
+        assert time.monotonic() - start < 0.5
+        cancellable_sleep(0)  # ausserhalb einer Operation: normales sleep
+
+    def test_kooperativer_abbruch_und_live_sicht(self, supervisor):
+        started = threading.Event()
+
+        def worker():
+            started.set()
+            while True:
+                check_cancelled()
+                time.sleep(0.01)
+
+        op = supervisor.start(worker, name="loop", owner="Tester", timeout=30)
+        started.wait(1)
+        view = supervisor.snapshot()
+        assert [(v["name"], v["owner"], v["status"]) for v in view] == [("loop", "Tester", "running")]
+        assert view[0]["remaining_seconds"] <= 30
+        assert supervisor.cancel(op.op_id, "user")
+        with pytest.raises(OperationCancelled, match="user"):
+            op.future.result(timeout=1)
+        assert supervisor.snapshot() == []
+        finished = supervisor.snapshot(include_finished=True)
+        assert finished[0]["status"] == "cancelled"
+        assert not supervisor.cancel(op.op_id)
+
+    def test_voller_pool_nutzt_overflow_statt_deadlock(self, supervisor):
+        # Verschachtelt: jeder Worker wartet auf eine innere Operation - die
+        # Barriere stellt sicher, dass alle Pool-Worker belegt sind
+        barrier = threading.Barrier(4)
+
+        def outer():
+            barrier.wait(timeout=2)
+            return supervisor.run(lambda: "inner", timeout=2)
+
+        ops = [supervisor.start(outer) for _ in range(4)]
+        assert [op.future.result(timeout=3) for op in ops] == ["inner"] * 4
+        assert supervisor.stats()["overflow"] >= 1
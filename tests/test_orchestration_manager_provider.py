@@ -42,3 +42,30 @@ def test_reset_claude_provider_override_clears_short_response_guard():
     mgr.force_openrouter_for_claude("Persistent short responses")
     mgr.reset_claude_provider_override()
     assert mgr._claude_short_response_guard == {"total_failures": 0, "by_role": {}}
+
+
+
+def test_help_needed_liest_blockierte_agents_nach_flush(monkeypatch):
+    import threading
+    import backend.orchestration_manager as om
+    from backend.session_manager import SessionManager
+    from backend.ui_log_pipeline import UILogPipeline, make_session_sink
+
+    monkeypatch.setattr(SessionManager, "_instance", None)
+    gate = threading.Event()
+    pipeline = UILogPipeline([("langsam", lambda batch: gate.wait(5)),
+                              ("session", make_session_sink({"Security": "security"}))])
+    seen = {}
+    monkeypatch.setattr(om, "handle_help_needed_events",
+                        lambda session_mgr, **kw: seen.setdefault("blocked", session_mgr.get_blocked_agents()))
+    mgr = _build_manager_stub()
+    mgr._ui_log_pipeline = pipeline
+    mgr.project_path = mgr.tech_blueprint = mgr.project_rules = mgr.model_router = None
+    try:
+        pipeline.submit("Security", "HELP_NEEDED", "{}", None, 1)
+        # Consumer haengt noch in der langsamen Senke, wenn der Handler startet
+        threading.Timer(0.2, gate.set).start()
+        mgr._handle_help_needed_events(1)
+    finally:
+        pipeline.close()
+    assert "security" in seen["blocked"]
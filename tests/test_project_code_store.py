@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/project_code_store.py - Datei-basierter Code-Speicher
+              hinter manager.current_code (Parser, Hashes, Versionen, Dirty-Tracking,
+              lazy Rendering) und die Integration in merge_repaired_files.
+"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.project_code_store import (
+    ProjectCodeStore,
+    split_code_blocks,
+    parse_code_files,
+    get_code_store,
+)
+
+CODE = (
+    "### FILENAME: app/page.js\n"
+    "export default function Page() {}\n\n"
+    "### FILENAME: README.md\n"
+    "# Projekt\n\n### Installation\nnpm install\n\n"
+    "### lib/db.js\n"
+    "const db = 1;\n"
+)
+
+
+class TestParser:
+    """Tests fuer split_code_blocks / parse_code_files."""
+
+    def test_alle_marker_varianten(self):
+        text = ("### FILENAME: a.js\n1\n### FILE: b.js\n2\n### PATH: c.js\n3\n"
+                "### DATEI: d.py\n4\n### PFAD: e.py:\n5\n### f/g.ts\n6\n")
+        assert [n for n, _ in split_code_blocks(text)] == ["a.js", "b.js", "c.js", "d.py", "e.py", "f/g.ts"]
+
+    def test_markdown_ueberschrift_bleibt_im_inhalt(self):
+        files = parse_code_files(CODE)
+        assert list(files) == ["app/page.js", "README.md", "lib/db.js"]
+        assert "### Installation" in files["README.md"]
+
+    def test_dockerfile_ohne_extension(self):
+        assert parse_code_files("### Dockerfile\nFROM python:3.11\n") == {"Dockerfile": "FROM python:3.11"}
+
+    def test_ohne_marker(self):
+        assert split_code_blocks("print('x')") == []
+        assert parse_code_files("") == {}
+
+    def test_parse_liefert_kopie(self):
+        first = parse_code_files(CODE)
+        first["neu.js"] = "x"
+        assert "neu.js" not in parse_code_files(CODE)
+
+
+class TestProjectCodeStore:
+    """Tests fuer Store-Operationen."""
+
+    def test_render_ohne_aenderung_ist_identisch(self):
+        store = ProjectCodeStore.from_code(CODE)
+        assert len(store) == 3
+        assert store.render() == CODE
+
+    def test_lazy_parse(self):
+        store = ProjectCodeStore.from_code(CODE)
+        assert store.render() == CODE
+        assert store.stats()["parses"] == 1
+        store.render()
+        assert store.stats()["parses"] == 1
+
+    def test_apply_patch_aendert_nur_betroffene_bloecke(self):
+        store = ProjectCodeStore.from_code(CODE)
+        store.mark_clean()
+        changed = store.apply_patch({"lib/db.js": "const db = 2;", "app/page.js": store.get("app/page.js")})
+        assert changed == ["lib/db.js"]
+        assert store.dirty_files() == ["lib/db.js"]
+        assert store.file_info("lib/db.js").version == 2
+        assert store.file_info("app/page.js").version == 1
+        rendered = store.render()
+        assert "const db = 2;" in rendered
+        # Unveraenderte Bloecke woertlich, geaenderte im ### FILENAME:-Format
+        assert rendered.startswith("### FILENAME: app/page.js\nexport default function Page() {}\n\n")
+        assert "### FILENAME: lib/db.js\nconst db = 2;\n" in rendered
+
+    def test_neue_datei_wird_angehaengt(self):
+        store = ProjectCodeStore.from_code("### FILENAME: a.js\n1")
+        store.set_file("b.js", "2")
+        assert store.render() == "### FILENAME: a.js\n1\n### FILENAME: b.js\n2\n"
+
+    def test_render_cache_bis_zur_aenderung(self):
+        store = ProjectCodeStore.from_code(CODE)
+        store.set_file("x.js", "1")
+        first = store.render()
+        assert store.render() is first
+        renders = store.stats()["renders"]
+        store.set_file("x.js", "1")  # kein echter Change
+        store.render()
+        assert store.stats()["renders"] == renders
+
+    def test_hashes_und_reload_diff(self):
+        store = ProjectCodeStore.from_code(CODE)
+        before = store.hashes()
+        store.mark_clean()
+        store.load_code(CODE.replace("const db = 1;", "const db = 3;"))
+        after = store.hashes()
+        assert before["app/page.js"] == after["app/page.js"]
+        assert before["lib/db.js"] != after["lib/db.js"]
+        assert store.dirty_files() == ["lib/db.js"]
+        assert store.file_info("lib/db.js").version == 2
+
+    def test_dict_zuweisung(self):
+        store = ProjectCodeStore.from_code(CODE)
+        store.load_code({"a.py": "x = 1"})
+        assert store.paths() == ["a.py"]
+        assert store.render() == "### FILENAME: a.py\nx = 1\n"
+
+    def test_preamble_bleibt_erhalten(self):
+        store = ProjectCodeStore.from_code("Hinweis vorab\n### FILENAME: a.js\n1\n")
+        store.set_file("a.js", "2")
+        assert store.render().startswith("Hinweis vorab\n### FILENAME: a.js\n2\n")
+
+    def test_remove_file(self):
+        store = ProjectCodeStore.from_code(CODE)
+        assert store.remove_file("README.md")
+        assert "README.md" not in store
+        assert "Installation" not in store.render()
+
+    def test_none_und_leer(self):
+        store = ProjectCodeStore.from_code(None)
+        assert store.render() == ""
+        assert len(store) == 0
+
+
+class TestIntegration:
+    """Tests fuer Helfer und bestehende Aufrufer."""
+
+    def test_get_code_store_nur_fuer_echten_store(self):
+        class _Manager:
+            code_store = ProjectCodeStore()
+
+        from unittest.mock import MagicMock
+        assert get_code_store(MagicMock()) is None
+        assert isinstance(get_code_store(_Manager()), ProjectCodeStore)
+
+    def test_merge_repaired_files(self):
+        pytest.importorskip("crewai")
+        from backend.file_by_file_loop import merge_repaired_files
+        merged = merge_repaired_files(CODE, {"lib/db.js": "const db = 9;", "neu.js": "n"})
+        files = parse_code_files(merged)
+        assert files["lib/db.js"] == "const db = 9;"
+        assert files["neu.js"] == "n"
+        assert "### Installation" in files["README.md"]
+
+    def test_eigene_sicht_zuweisen_laedt_nicht_neu(self):
+        store = ProjectCodeStore.from_code(CODE)
+        store.mark_clean()
+        store.set_file("lib/db.js", "const db = 2;")
+        revision = store.revision
+        store.load_code(store.render())
+        assert store.revision == revision
+        assert store.dirty_files() == ["lib/db.js"]
+
+    def test_sync_written_files_liest_nur_geschriebene(self, tmp_path):
+        from types import SimpleNamespace
+        from backend.dev_loop_coder_utils import get_project_files, sync_written_files
+
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "db.js").write_text("const db = 3;", encoding="utf-8")
+        (tmp_path / "app.js").write_text("nicht im Store", encoding="utf-8")
+        manager = SimpleNamespace(code_store=ProjectCodeStore.from_code(CODE), project_path=str(tmp_path))
+        manager.code_store.mark_clean()
+        manager.code_store.set_file("app/page.js", "noch nicht geschrieben")
+
+        rendered = sync_written_files(manager, ["lib\\db.js"])
+        files = get_project_files(manager)
+        assert files["lib/db.js"] == "const db = 3;"
+        assert "app.js" not in files
+        assert "### FILENAME: lib/db.js\nconst db = 3;" in rendered
+        assert manager.code_store.dirty_files() == ["app/page.js"]
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/prompt_assembly.py und die Sektions-Assembly
+              in build_coder_prompt (Memoisierung, Budget, Telemetrie).
+"""
+
+import os
+import sys
+import json
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.prompt_assembly import (
+    TRUNCATION_MARKER,
+    PromptAssembler,
+    PromptTelemetry,
+    SectionCache,
+    get_prompt_telemetry,
+    hash_key,
+)
+from backend.dev_loop_coder_prompt import build_coder_prompt
+
+
+def _manager(base_dir, config=None):
+    manager = MagicMock()
+    manager.tech_blueprint = {"project_type": "webapp", "framework": "Next.js", "language": "javascript"}
+    manager.config = config or {"mode": "test"}
+    manager.is_first_run = True
+    manager.current_code = ""
+    manager.base_dir = str(base_dir)
+    manager.database_schema = ""
+    manager._missing_files = []
+    manager.get_briefing_context = MagicMock(return_value="")
+    del manager.design_concept
+    del manager.security_vulnerabilities
+    return manager
+
+
+class TestPromptAssembler:
+    """Sektionen, Groessen und Budget."""
+
+    def test_text_und_groessen(self):
+        asm = PromptAssembler()
+        asm += "Ziel\n"
+        asm.start("leer")
+        asm.add("lessons", "L" * 10)
+        asm += "M" * 5
+        asm.add("format", "F")
+        assert asm.text() == "Ziel\n" + "L" * 10 + "M" * 5 + "F"
+        assert dict(asm.sizes()) == {"header": 5, "lessons": 15, "format": 1}
+
+    def test_budget_verwirft_in_prioritaet(self):
+        asm = PromptAssembler()
+        asm += "H" * 10
+        asm.add("doc_enrichment", "D" * 20)
+        asm.add("lessons", "L" * 20)
+        asm.add("env_constraints", "E" * 20)
+        asm.apply_budget(35)
+        assert asm.dropped == ["lessons", "env_constraints"]
+        assert asm.text() == "H" * 10 + "D" * 20
+
+    def test_sektions_obergrenze(self):
+        asm = PromptAssembler()
+        asm.add("lessons", "L" * 500)
+        asm.apply_budget(10_000, {"lessons": 100})
+        assert len(asm.text()) == 100
+        assert asm.text().endswith(TRUNCATION_MARKER)
+        assert asm.capped == ["lessons"]
+
+
+class TestSectionCache:
+    """Hash-Key-Memoisierung."""
+
+    def test_hit_nur_bei_gleicher_funktion(self):
+        cache = SectionCache()
+        builder = MagicMock(return_value="x")
+        key = hash_key("a", 1)
+        assert cache.get("s", key, builder) == "x"
+        assert cache.get("s", key, builder) == "x"
+        assert builder.call_count == 1
+        other = MagicMock(return_value="y")
+        assert cache.get("s", key, other) == "y"
+
+    def test_leeres_ergebnis_optional_nicht_gecached(self):
+        cache = SectionCache()
+        builder = MagicMock(return_value="")
+        cache.get("s", "k", builder, cache_empty=False)
+        cache.get("s", "k", builder, cache_empty=False)
+        assert builder.call_count == 2
+
+    def test_lru_grenze(self):
+        cache = SectionCache(max_entries=2)
+        for i in range(3):
+            cache.get("s", str(i), str)
+        assert cache.stats()["entries"] == 2
+
+
+@patch("backend.doc_enrichment.get_doc_enrichment_section", return_value=None)
+@patch("backend.dev_loop_coder_prompt.get_python_dependency_versions", return_value="")
+@patch("backend.dev_loop_coder_prompt.get_constraints_for_prompt", return_value="- canvas fehlt")
+class TestBuildCoderPromptAssembly:
+    """Integration in build_coder_prompt."""
+
+    def test_lessons_nur_bei_geaenderter_memory_neu_gelesen(self, _c, _d, _e, tmp_path):
+        memory = tmp_path / "memory"
+        memory.mkdir()
+        (memory / "global_memory.json").write_text("{}")
+        lessons = MagicMock(return_value="- Lektion")
+        with patch("backend.dev_loop_coder_prompt.get_lessons_for_prompt", lessons):
+            first = build_coder_prompt(_manager(tmp_path), "Ziel", None, 0)
+            second = build_coder_prompt(_manager(tmp_path), "Ziel", None, 0)
+            assert first == second
+            assert lessons.call_count == 1
+            (memory / "global_memory.json").write_text('{"lessons": []}')
+            build_coder_prompt(_manager(tmp_path), "Ziel", None, 0)
+            assert lessons.call_count == 2
+
+    def test_telemetrie_und_ui_log(self, _c, _d, _e, tmp_path):
+        telemetry = get_prompt_telemetry()
+        before = telemetry.prompts
+        manager = _manager(tmp_path)
+        with patch("backend.dev_loop_coder_prompt.get_lessons_for_prompt", return_value="- L"):
+            prompt = build_coder_prompt(manager, "Ziel", None, 0)
+        summary = telemetry.summary()
+        assert summary["prompts"] == before + 1
+        last = summary["recent"][-1]
+        assert last["final_chars"] == len(prompt)
+        assert {"header", "lessons", "env_constraints", "run_bat", "format"} <= set(last["sections_chars"])
+        events = [c[0][1] for c in manager._ui_log.call_args_list]
+        assert "PromptSections" in events
+
+    def test_budget_entfernt_lessons_vor_dateikuerzung(self, _c, _d, _e, tmp_path):
+        lessons = "- " + "x" * 5000
+        with patch("backend.dev_loop_coder_prompt.get_lessons_for_prompt", return_value=lessons):
+            big = build_coder_prompt(_manager(tmp_path), "Ziel", None, 0)
+            small = build_coder_prompt(_manager(tmp_path, {"max_prompt_tokens": 1500}), "Ziel", None, 0)
+        assert "LESSONS LEARNED" in big
+        assert "LESSONS LEARNED" not in small
+        assert get_prompt_telemetry().summary()["recent"][-1]["dropped"][0] == "lessons"
+
+
+def test_telemetrie_aggregiert():
+    telemetry = PromptTelemetry()
+    for size in (10, 30):
+        asm = PromptAssembler()
+        asm.add("lessons", "x" * size)
+        telemetry.record(asm, size)
+    stats = telemetry.summary()["sections"]["lessons"]
+    assert stats == {"count": 2, "total_chars": 40, "max_chars": 30, "avg_chars": 20.0}
+    json.dumps(telemetry.summary())
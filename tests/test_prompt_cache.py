@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/prompt_cache.py - Praefix/Suffix-Layout,
+              cache_control-Breakpoints, Usage-Auswertung und Cache-Accounting
+              in ModelStatsDB/BudgetTracker gegen einen lokalen Stub-Provider.
+"""
+
+import os
+import sys
+import sqlite3
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.prompt_cache import (
+    CACHE_BREAKPOINT,
+    apply_cache_breakpoints,
+    extract_cached_tokens,
+    install_litellm_prompt_cache,
+    join_cacheable,
+    split_cacheable,
+    strip_breakpoints,
+    usage_from_sdk_result,
+)
+from backend.prompt_assembly import PromptAssembler
+from backend.dev_loop_coder_prompt import build_coder_prompt
+from model_stats_db import ModelStatsDB
+
+
+class StubProvider:
+    """
+    Lokaler Stub fuer litellm.completion mit Praefix-Cache wie bei Anthropic:
+    als cache_control markierte Bloecke werden gemerkt, ein erneut gesendeter
+    Block zaehlt als Cache-Read (1 Token = 4 Zeichen).
+    """
+
+    def __init__(self):
+        self.calls = []
+        self._cache = set()
+
+    def completion(self, model, messages, **kwargs):
+        self.calls.append(messages)
+        cached = 0
+        total = 0
+        for message in messages:
+            content = message["content"]
+            blocks = content if isinstance(content, list) else [{"text": content}]
+            for block in blocks:
+                total += len(block["text"]) // 4
+                if "cache_control" in block:
+                    if block["text"] in self._cache:
+                        cached += len(block["text"]) // 4
+                    self._cache.add(block["text"])
+        usage = types.SimpleNamespace(
+            prompt_tokens=total, completion_tokens=10,
+            prompt_tokens_details=types.SimpleNamespace(cached_tokens=cached),
+        )
+        return types.SimpleNamespace(usage=usage)
+
+
+def _manager(base_dir, config):
+    manager = MagicMock()
+    manager.tech_blueprint = {"project_type": "webapp", "framework": "Next.js", "language": "javascript"}
+    manager.config = config
+    manager.is_first_run = True
+    manager.current_code = ""
+    manager.base_dir = str(base_dir)
+    manager.database_schema = ""
+    manager._missing_files = []
+    manager.get_briefing_context = MagicMock(return_value="")
+    del manager.design_concept
+    del manager.security_vulnerabilities
+    return manager
+
+
+# =========================================================================
+# Layout
+# =========================================================================
+class TestLayout:
+    """Praefix/Suffix und Breakpoint-Marker."""
+
+    def test_join_und_split(self):
+        prompt = join_cacheable("P" * 50, "S", min_prefix_chars=10)
+        assert CACHE_BREAKPOINT in prompt
+        assert split_cacheable(prompt) == ("P" * 50, "S")
+        assert strip_breakpoints(prompt) == "P" * 50 + "\nS"
+
+    def test_kurzer_praefix_ohne_breakpoint(self):
+        assert join_cacheable("P", "S", min_prefix_chars=10) == "PS"
+        assert split_cacheable("PS") == ("", "PS")
+
+    def test_assembler_split_behaelt_reihenfolge(self):
+        asm = PromptAssembler()
+        asm += "H"
+        asm.add("code_context", "C")
+        asm.add("lessons", "L")
+        asm.add("format", "F")
+        assert asm.split_text(("header", "lessons")) == ("HL", "CF")
+
+
+@patch("backend.doc_enrichment.get_doc_enrichment_section", return_value=None)
+@patch("backend.dev_loop_coder_prompt.get_python_dependency_versions", return_value="")
+@patch("backend.dev_loop_coder_prompt.get_constraints_for_prompt", return_value="")
+class TestCoderPromptLayout:
+    """build_coder_prompt mit und ohne prompt_cache."""
+
+    def test_coder_prompt_praefix_stabil_ueber_iterationen(self, _c, _d, _e, tmp_path):
+        config = {"prompt_cache": {"enabled": True, "min_prefix_chars": 100}}
+        with patch("backend.dev_loop_coder_prompt.get_lessons_for_prompt", return_value="- L"):
+            first = build_coder_prompt(_manager(tmp_path, config), "Ziel", "Fehler A", 1)
+            second = build_coder_prompt(_manager(tmp_path, config), "Ziel", "Fehler B", 2)
+        prefix_1, suffix_1 = split_cacheable(first)
+        prefix_2, suffix_2 = split_cacheable(second)
+        assert prefix_1 and prefix_1 == prefix_2
+        assert "Fehler A" in suffix_1 and "Fehler B" in suffix_2
+        assert suffix_1.rstrip().endswith("Format: ### FILENAME: path/to/file.ext")
+
+    def test_ohne_config_unveraendertes_layout(self, _c, _d, _e, tmp_path):
+        with patch("backend.dev_loop_coder_prompt.get_lessons_for_prompt", return_value="- L"):
+            prompt = build_coder_prompt(_manager(tmp_path, {"mode": "test"}), "Ziel", "Fehler", 1)
+        assert CACHE_BREAKPOINT not in prompt
+        assert prompt.startswith("Ziel: Ziel")
+
+
+class TestFixPromptLayout:
+    """build_fix_prompt mit und ohne prompt_cache."""
+
+    def test_anweisungen_als_stabiler_praefix(self):
+        pytest.importorskip("crewai")
+        fix_agent = sys.modules.get("agents.fix_agent")
+        if fix_agent is not None and not isinstance(fix_agent, types.ModuleType):
+            pytest.skip("agents.fix_agent ist in dieser Session gemockt (test_parallel_fixer)")
+        from agents.fix_agent import FIX_PROMPT_INSTRUCTIONS, build_fix_prompt
+
+        settings = {"enabled": True, "min_prefix_chars": 100}
+        prompts = [build_fix_prompt(path, "x = 1", "syntax", f"Fehler in {path}", [1],
+                                    cache_settings=settings) for path in ("a.py", "b.py")]
+        prefixes = [split_cacheable(p)[0] for p in prompts]
+        assert prefixes == [FIX_PROMPT_INSTRUCTIONS, FIX_PROMPT_INSTRUCTIONS]
+        assert "### CORRECTION: b.py" in split_cacheable(prompts[1])[1]
+        legacy = build_fix_prompt("a.py", "x = 1", "syntax", "Fehler", [1])
+        assert CACHE_BREAKPOINT not in legacy and legacy.startswith("KORREKTUR-AUFGABE\n\nZIELDATEI: a.py")
+
+
+# =========================================================================
+# LiteLLM-Nachrichten
+# =========================================================================
+class TestCacheBreakpoints:
+    """cache_control-Bloecke je Provider."""
+
+    def _messages(self):
+        return [
+            {"role": "system", "content": "R" * 50},
+            {"role": "user", "content": "P" * 20 + CACHE_BREAKPOINT + "S"},
+        ]
+
+    def test_anthropic_bekommt_cache_control(self):
+        messages = self._messages()
+        result = apply_cache_breakpoints(messages, "openrouter/anthropic/claude-sonnet-4", 10)
+        assert result[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert result[1]["content"] == [
+            {"type": "text", "text": "P" * 20, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "S"},
+        ]
+        assert isinstance(messages[1]["content"], str)  # Eingabe unveraendert
+
+    def test_andere_provider_nur_marker_entfernt(self):
+        result = apply_cache_breakpoints(self._messages(), "openrouter/deepseek/deepseek-r1-0528", 10)
+        assert result[0]["content"] == "R" * 50
+        assert result[1]["content"] == "P" * 20 + "\nS"
+
+    def test_stub_provider_liefert_cache_hits(self):
+        stub = StubProvider()
+        module = types.SimpleNamespace(completion=stub.completion)
+        assert install_litellm_prompt_cache(module, min_prefix_chars=10)
+        assert not install_litellm_prompt_cache(module)  # idempotent
+
+        prefix = "Regeln " * 200
+        model = "anthropic/claude-sonnet-4"
+        first = module.completion(model=model, messages=[
+            {"role": "user", "content": prefix + CACHE_BREAKPOINT + "Feedback 1"}])
+        second = module.completion(model=model, messages=[
+            {"role": "user", "content": prefix + CACHE_BREAKPOINT + "Feedback 2"}])
+
+        assert extract_cached_tokens(first.usage) == 0
+        assert extract_cached_tokens(second.usage) == len(prefix) // 4
+
+
+# =========================================================================
+# Usage und Accounting
+# =========================================================================
+class TestCacheAccounting:
+    """Cache-Tokens in Usage, BudgetTracker und ModelStatsDB."""
+
+    def test_usage_formate(self):
+        assert extract_cached_tokens({"prompt_tokens_details": {"cached_tokens": 7}}) == 7
+        assert extract_cached_tokens({"cache_read_input_tokens": 5}) == 5
+        assert extract_cached_tokens(MagicMock()) == 0
+        assert usage_from_sdk_result({
+            "input_tokens": 10, "cache_read_input_tokens": 900,
+            "cache_creation_input_tokens": 90, "output_tokens": 50,
+        }) == {"prompt_tokens": 1000, "completion_tokens": 50, "cached_tokens": 900}
+        assert usage_from_sdk_result(None) is None
+
+    def test_budget_tracker_rabatt(self, tmp_path):
+        pytest.importorskip("requests")
+        from budget_tracker import BudgetTracker
+        tracker = BudgetTracker(data_dir=str(tmp_path))
+        full = tracker.calculate_cost("anthropic/claude-sonnet-4", 1_000_000, 0)
+        cached = tracker.calculate_cost("anthropic/claude-sonnet-4", 1_000_000, 0, cached_tokens=1_000_000)
+        assert full == 3.0
+        assert cached == 0.3
+        record = tracker.record_usage("Coder", "anthropic/claude-sonnet-4", 1000, 10, cached_tokens=800)
+        assert record.cached_tokens == 800
+        assert tracker.get_today_totals()["cached_tokens"] == 800
+
+    def test_model_stats_db_migration_und_aggregation(self, tmp_path):
+        db_path = str(tmp_path / "stats.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""CREATE TABLE llm_calls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, run_id TEXT,
+            agent TEXT NOT NULL, model TEXT NOT NULL, prompt_tokens INTEGER DEFAULT 0,
+            completion_tokens INTEGER DEFAULT 0, total_tokens INTEGER DEFAULT 0,
+            cost_usd REAL DEFAULT 0.0, latency_ms REAL DEFAULT 0.0, success INTEGER DEFAULT 1)""")
+        conn.commit()
+        conn.close()
+
+        db = ModelStatsDB(db_path)
+        db.record_call("run", "Coder", "m", 1000, 10, 0.0, 5.0)
+        db.record_call("run", "Coder", "m", 1000, 10, 0.0, 5.0, cached_tokens=900)
+        stats = db.get_model_stats()
+        assert stats[0]["cached_tokens"] == 900
+        assert stats[0]["cache_hit_rate"] == 45.0
+
+
+# =========================================================================
+# ClaudeSDKProvider
+# =========================================================================
+class TestClaudeSDKProviderCache:
+    """Praefix im System-Prompt und echte Usage aus der ResultMessage."""
+
+    def _provider(self):
+        from backend.claude_sdk.provider import ClaudeSDKProvider
+        provider = ClaudeSDKProvider()
+        provider._ensure_initialized = MagicMock()
+        return provider
+
+    def test_praefix_wandert_in_system_prompt(self):
+        provider = self._provider()
+        captured = {}
+
+        def fake_run_sync(**kwargs):
+            captured.update(kwargs)
+            provider._usage_local.usage = {"input_tokens": 20, "cache_read_input_tokens": 400,
+                                           "output_tokens": 30}
+            return "### FILENAME: a.py"
+
+        with patch.object(provider, "_run_sync", side_effect=fake_run_sync), \
+             patch.object(provider, "_record_success") as record:
+            provider.run_agent(prompt="PREFIX" + CACHE_BREAKPOINT + "SUFFIX", role="coder")
+
+        assert captured["prompt"] == "SUFFIX"
+        assert captured["system_prompt"].endswith("\n\nPREFIX")
+        assert record.call_args.kwargs["cached_tokens"] == 400
+        assert record.call_args.kwargs["prompt_tokens"] == 420
+
+    def test_cli_modus_behaelt_praefix_im_prompt(self):
+        provider = self._provider()
+        with patch.object(provider, "_run_cli", return_value="ok") as run_cli, \
+             patch.object(provider, "_record_success") as record:
+            provider.run_agent(prompt="PREFIX" + CACHE_BREAKPOINT + "SUFFIX", role="reviewer",
+                               use_cli_mode=True)
+        assert run_cli.call_args.kwargs["prompt"] == "PREFIX\nSUFFIX"
+        assert run_cli.call_args.kwargs["system_prompt"] is None
+        assert record.call_args.kwargs["cached_tokens"] == 0
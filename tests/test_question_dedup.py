@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/question_dedup.py.
+              Testet: MinHash-Index gegen den bisherigen paarweisen Vergleich,
+              Gruppen-Merge und parallele Fragen-Generierung in Ankunftsreihenfolge.
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from backend.question_dedup import QuestionIndex, stream_parallel_questions
+from minhash_utils import jaccard, normalized_words
+
+STOP_WORDS = {"die", "soll", "der", "das", "mit", "und"}
+
+
+def _pairwise_groups(questions, threshold=0.6):
+    """Referenz: bisheriger O(n^2)-Algorithmus aus deduplicate_questions."""
+    groups, used = [], set()
+    for i, (agent_1, text_1) in enumerate(questions):
+        if i in used:
+            continue
+        used.add(i)
+        group = [agent_1]
+        tokens_1 = normalized_words(text_1, STOP_WORDS)
+        for j, (agent_2, text_2) in enumerate(questions):
+            if j in used:
+                continue
+            tokens_2 = normalized_words(text_2, STOP_WORDS)
+            if tokens_1 and tokens_2 and jaccard(tokens_1, tokens_2) >= threshold:
+                if agent_2 not in group:
+                    group.append(agent_2)
+                used.add(j)
+        groups.append((text_1, group))
+    return groups
+
+
+def _question(text, qid="q", value="v"):
+    return {"id": qid, "question": text, "options": [{"text": value, "value": value}]}
+
+
+class TestQuestionIndex:
+    """Inkrementelle Deduplizierung."""
+
+    def test_merge_wie_deduplicate_questions(self):
+        index = QuestionIndex(stop_words=STOP_WORDS)
+        index.add(_question("Soll die App offline funktionieren?", "q1", "yes"), "Coder")
+        group, merged = index.add(_question("Soll die App offline funktionieren!", "q2", "no"), "Designer")
+        assert merged
+        assert group["id"] == "q1"
+        assert group["agents"] == ["Coder", "Designer"]
+        assert [o["value"] for o in group["options"]] == ["yes", "no"]
+        _, merged = index.add(_question("Welche Farben passen zur Marke?"), "Designer")
+        assert not merged
+        assert len(index.groups) == 2
+
+    def test_gleiche_gruppen_wie_paarweiser_vergleich(self):
+        rng = random.Random(7)
+        vocab = ["app", "offline", "nutzer", "daten", "login", "handy", "export", "farben",
+                 "suche", "rollen", "backup", "preise", "kalender", "teilen", "sprache"]
+        questions = []
+        for i in range(300):
+            words = rng.sample(vocab, rng.randint(2, 6))
+            questions.append((f"Agent{i % 5}", " ".join(words) + "?"))
+
+        index = QuestionIndex(stop_words=STOP_WORDS)
+        for agent, text in questions:
+            index.add({"question": text}, agent)
+
+        expected = _pairwise_groups(questions)
+        assert [(g["question"], g["agents"]) for g in index.groups] == expected
+        assert index.comparisons < len(questions) * len(expected)
+
+
+class TestParallelStream:
+    """Parallele Generierung mit Events in Ankunftsreihenfolge."""
+
+    def test_parallel_und_ankunftsreihenfolge(self):
+        delays = {"Coder": 0.15, "Designer": 0.05, "Planner": 0.1}
+
+        async def generate(agent, vision, already_asked):
+            assert already_asked == []
+            await asyncio.sleep(delays[agent])
+            if agent == "Planner":
+                raise RuntimeError("Timeout")
+            return {"agent": agent, "questions": [_question("Soll die App offline funktionieren?", agent)]}
+
+        async def collect():
+            index = QuestionIndex(stop_words=STOP_WORDS)
+            start = time.perf_counter()
+            events = [e async for e in stream_parallel_questions(list(delays), "Vision", generate, index)]
+            return events, index, time.perf_counter() - start
+
+        events, index, elapsed = asyncio.run(collect())
+        assert [e["agent"] for e in events] == ["Designer", "Planner", "Coder"]
+        assert elapsed < sum(delays.values())
+        assert events[0]["questions"][0]["id"] == "Designer"
+        assert events[1]["error"] == "Timeout"
+        assert events[2]["merged"] == [{"id": "Designer", "agent": "Coder"}]
+        assert index.groups[0]["agents"] == ["Designer", "Coder"]
+
+
+def test_router_parallel_modus(monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("aiohttp")
+    from backend.routers import discovery_questions as module
+
+    async def fake_generate(agent, vision, already_asked=None):
+        return {"agent": agent, "questions": [_question("Soll die App offline funktionieren?", agent)]}
+
+    monkeypatch.setattr(module, "generate_agent_questions", fake_generate)
+    request = module.DiscoveryQuestionsRequest(vision="App", agents=["Coder", "Designer", "Tester"], parallel=True)
+    result = asyncio.run(module.generate_discovery_questions(request))
+    assert result["generation_mode"] == "parallel_minhash"
+    assert result["questions_original"] == 2
+    assert result["questions_deduplicated"] == 1
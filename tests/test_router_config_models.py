@@ -291,19 +291,16 @@ class TestFetchOpenrouterModels:
             ]
         }
 
-        mock_response = AsyncMock()
+        # AENDERUNG 18.10.2026: Geteilter HTTP-Client statt aiohttp-Session
+        mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
-        mock_response.json = AsyncMock(return_value=mock_response_data)
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=False)
+        mock_response.json = MagicMock(return_value=mock_response_data)
 
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=False)
+        mock_client = MagicMock()
+        mock_client.aget = AsyncMock(return_value=mock_response)
 
         try:
-            with patch("backend.routers.config.aiohttp.ClientSession", return_value=mock_session), \
+            with patch("backend.routers.config.get_http_client", return_value=mock_client), \
                  patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}):
                 result = await fetch_openrouter_models()
                 assert len(result["free_models"]) == 1
@@ -318,7 +315,10 @@ class TestFetchOpenrouterModels:
         _models_cache["data"] = None
         _models_cache["timestamp"] = None
 
-        with patch("backend.routers.config.aiohttp.ClientSession", side_effect=Exception("Netzwerk-Fehler")), \
+        mock_client = MagicMock()
+        mock_client.aget = AsyncMock(side_effect=Exception("Netzwerk-Fehler"))
+
+        with patch("backend.routers.config.get_http_client", return_value=mock_client), \
              patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key"}):
             result = await fetch_openrouter_models()
             # Fallback-Modelle muessen vorhanden sein
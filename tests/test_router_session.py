@@ -6,7 +6,7 @@ Version: 1.0
 Beschreibung: Unit-Tests fuer backend/routers/session.py.
               Testet die Session-Management-Endpoints (GET /session/current,
               GET /session/logs, POST /session/restore, POST /session/reset,
-              GET /session/status).
+              GET /session/status, GET /session/changes, ETag/304).
 """
 
 import os
@@ -133,6 +133,51 @@ class TestGetSessionLogs:
         mock_session.get_logs.assert_called_once_with(limit=100, offset=0)
 
 
+# =========================================================================
+# TestSessionVersionierung — ETag, /session/changes, Log-Cursor (AENDERUNG 18.10.2026)
+# =========================================================================
+
+class TestSessionVersionierung:
+    """Tests fuer ETag/304, Delta-Endpoint und Cursor-Paging mit echtem SessionManager."""
+
+    @pytest.fixture
+    def sm(self):
+        from backend.session_manager import SessionManager
+        SessionManager._instance = None
+        with patch("backend.routers.session.get_session_manager_instance") as mock_get:
+            mock_get.return_value = SessionManager()
+            yield mock_get.return_value
+        SessionManager._instance = None
+
+    def test_etag_und_304(self, sm):
+        """Unveraenderter State liefert 304, nach Aenderung wieder 200."""
+        response = client.get("/session/current")
+        etag = response.headers["etag"]
+        assert client.get("/session/current", headers={"If-None-Match": etag}).status_code == 304
+        sm.add_log("coder", "event", "neu")
+        response = client.get("/session/current", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_changes_delta_und_304(self, sm):
+        """GET /session/changes liefert nur neue Logs bzw. 304 ohne Aenderung."""
+        state = client.get("/session/current").json()
+        params = {"since": state["seq"], "epoch": state["epoch"]}
+        assert client.get("/session/changes", params=params).status_code == 304
+        sm.add_log("coder", "event", "neu")
+        delta = client.get("/session/changes", params=params).json()
+        assert delta["full"] is False
+        assert [l["message"] for l in delta["logs"]] == ["neu"]
+
+    def test_logs_cursor(self, sm):
+        """before/after schalten auf Cursor-Paging um."""
+        for i in range(5):
+            sm.add_log("test", "event", f"Log {i}")
+        seite = client.get("/session/logs", params={"limit": 2, "after": 0}).json()
+        assert [l["message"] for l in seite["logs"]] == ["Log 0", "Log 1"]
+        assert seite["has_more"] is True
+
+
 # =========================================================================
 # TestRestoreSession — POST /session/restore
 # =========================================================================
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/run_queue.py, backend/run_scheduler.py und backend/run_worker.py.
+              Testet: Prioritaets-Warteschlange, Admission-Control (Budget, Provider,
+              Host), ETA-Schaetzung, Scheduler mit In-Process-Slot und Worker-Prozess.
+"""
+
+import io
+import sys
+import threading
+import time
+import types
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.run_queue import RunQueueDB
+from backend.run_scheduler import (
+    AdmissionController,
+    InProcessSlot,
+    RunScheduler,
+    budget_headroom_usd,
+    estimate_start_times,
+    _worker_command,
+    get_scheduler_settings,
+    run_provider,
+)
+from backend.run_worker import emit_event, parse_event
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return RunQueueDB(str(tmp_path / "run_queue.db"))
+
+
+def _settings(**overrides):
+    settings = get_scheduler_settings({"run_scheduler": overrides})
+    settings["poll_seconds"] = 0.05
+    return settings
+
+
+def _admission(settings, headroom=None, cost=1.0, load=None, free_mb=None):
+    return AdmissionController(settings, budget_headroom=lambda: headroom, run_cost=lambda: cost,
+                               load_per_cpu=lambda: load, free_memory_mb=lambda: free_mb)
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestQueue:
+    """Persistente Warteschlange."""
+
+    def test_prioritaet_und_fifo(self, queue):
+        a = queue.enqueue("A")
+        b = queue.enqueue("B", priority=5)
+        c = queue.enqueue("C")
+        assert [j["goal"] for j in queue.queued()] == ["B", "A", "C"]
+        assert queue.cancel(c["run_id"]) is True
+        assert queue.cancel(c["run_id"]) is False
+        assert queue.mark_running(b["run_id"], "process") is True
+        assert queue.mark_running(b["run_id"], "process") is False
+        queue.mark_finished(b["run_id"], "done")
+        assert queue.get(b["run_id"])["duration_seconds"] >= 0
+        assert [j["goal"] for j in queue.queued()] == ["A"]
+        assert a["status"] == "queued"
+
+    def test_neustart_markiert_laufende(self, queue):
+        job = queue.enqueue("A")
+        queue.mark_running(job["run_id"], "inprocess")
+        assert queue.recover_interrupted() == 1
+        assert queue.get(job["run_id"])["status"] == "interrupted"
+        assert queue.running() == []
+
+
+class TestAdmission:
+    """Budget, Provider-Kapazitaet und Host-Grenzen."""
+
+    def test_settings_und_provider(self):
+        assert get_scheduler_settings(None)["enabled"] is False
+        settings = get_scheduler_settings({"run_scheduler": {"max_concurrent": 0,
+                                                             "provider_capacity": {"claude_sdk": 1}}})
+        assert settings["max_concurrent"] == 1
+        assert settings["provider_capacity"] == {"claude_sdk": 1, "openrouter": 3}
+        assert run_provider({"claude_sdk": {"enabled": True}}) == "claude_sdk"
+        assert run_provider({}) == "openrouter"
+
+    def test_budget_reserviert_laufende_runs(self):
+        admission = _admission(_settings(), headroom=2.5, cost=1.0)
+        assert admission.check({"provider": "openrouter"}, [{}])[0] is True
+        ok, reason, scope = admission.check({"provider": "openrouter"}, [{}, {}])
+        assert not ok and scope == "global" and reason.startswith("Budget")
+
+    def test_provider_und_host(self):
+        settings = _settings(provider_capacity={"claude_sdk": 1}, max_load_per_cpu=1.0)
+        admission = _admission(settings, load=3.0, free_mb=100)
+        # Erster Run startet trotz Last - Host-Grenzen gelten nur neben laufenden Runs
+        assert admission.check({"provider": "claude_sdk"}, [])[0] is True
+        ok, reason, scope = admission.check({"provider": "claude_sdk"}, [{"provider": "openrouter"}])
+        assert not ok and scope == "global" and reason.startswith("CPU-Last")
+        relaxed = _admission(settings)
+        ok, reason, scope = relaxed.check({"provider": "claude_sdk"}, [{"provider": "claude_sdk"}])
+        assert not ok and scope == "provider"
+        assert relaxed.check({"provider": "openrouter"}, [{"provider": "claude_sdk"}])[0] is True
+
+    def test_budget_aus_historie(self, monkeypatch):
+        now = datetime.now()
+        history = [types.SimpleNamespace(timestamp=now.isoformat(), cost_usd=3.0),
+                   types.SimpleNamespace(timestamp=(now - timedelta(days=3)).isoformat(), cost_usd=40.0),
+                   types.SimpleNamespace(timestamp=(now - timedelta(days=60)).isoformat(), cost_usd=500.0)]
+        config = types.SimpleNamespace(auto_pause=True, global_daily_cap=10.0, global_monthly_cap=100.0)
+        # Die Historie wird bei jeder Pruefung neu geladen (Ausgaben der Worker-Prozesse)
+        tracker = types.SimpleNamespace(config=config, reload_usage_history=lambda: history)
+        monkeypatch.setitem(sys.modules, "budget_tracker",
+                            types.SimpleNamespace(get_budget_tracker=lambda: tracker))
+        assert budget_headroom_usd() == pytest.approx(7.0)
+        config.global_monthly_cap = 45.0
+        assert budget_headroom_usd() == pytest.approx(2.0)
+        history.append(types.SimpleNamespace(timestamp=now.isoformat(), cost_usd=1.5))
+        assert budget_headroom_usd() == pytest.approx(0.5)
+        config.auto_pause = False
+        assert budget_headroom_usd() is None
+
+
+class TestEta:
+    def test_startzeiten(self):
+        assert estimate_start_times([], 3, 2, 100) == [0, 0, 100]
+        assert estimate_start_times([30, 90], 2, 2, 100) == [10, 70]
+        # Ueberzogene Runs: Rest nie unter 10% der mittleren Laufzeit
+        assert estimate_start_times([500], 1, 1, 100) == [10]
+
+
+class TestScheduler:
+    """Ausfuehrung mit In-Process-Slot und Worker-Prozessen."""
+
+    def test_in_process_dann_warteschlange(self, queue, tmp_path):
+        release = threading.Event()
+        ran = []
+
+        def run(job):
+            ran.append(job["goal"])
+            release.wait(5)
+
+        events = []
+        scheduler = RunScheduler(queue, _settings(max_concurrent=1), admission=_admission(_settings()),
+                                 in_process=InProcessSlot(run=run, busy=lambda: False, stop=release.set),
+                                 on_event=lambda *e: events.append(e), log_dir=str(tmp_path / "logs"))
+        first = scheduler.submit("A")
+        assert first["status"] == "running" and first["isolation"] == "inprocess"
+        second = scheduler.submit("B")
+        assert second["status"] == "queued" and second["position"] == 1
+        assert second["eta_start_seconds"] > 0
+        third = scheduler.submit("C")
+        assert scheduler.cancel(third["run_id"]) == "cancelled"
+
+        scheduler.start()
+        try:
+            release.set()
+            assert _wait_for(lambda: queue.get(second["run_id"])["status"] == "done")
+        finally:
+            scheduler.shutdown()
+        assert ran == ["A", "B"]
+        assert queue.get(first["run_id"])["status"] == "done"
+        names = [e[2] for e in events]
+        assert names.count("RunStarted") == 2 and "RunCancelled" in names
+
+    def test_worker_prozess_und_blockierung(self, queue, tmp_path):
+        # Worker laufen mit cwd=Repo-Root, backend ist damit importierbar
+        script = ("from backend.run_worker import emit_event; "
+                  "print('build output'); emit_event('Coder', 'Status', 'fertig')")
+        settings = _settings(max_concurrent=2)
+        blocked = {"headroom": None}
+        admission = AdmissionController(settings, budget_headroom=lambda: blocked["headroom"],
+                                        run_cost=lambda: 1.0, load_per_cpu=lambda: None,
+                                        free_memory_mb=lambda: None)
+        events = []
+        scheduler = RunScheduler(queue, settings, admission=admission,
+                                 worker_command=lambda job: [sys.executable, "-c", script],
+                                 on_event=lambda *e: events.append(e), log_dir=str(tmp_path / "logs"))
+        job = scheduler.submit("A")
+        assert job["isolation"] == "process"
+        assert _wait_for(lambda: queue.get(job["run_id"])["status"] == "done")
+        assert (job["run_id"], "Coder", "Status", "fertig") in events
+        log = (tmp_path / "logs" / f"{job['run_id']}.log").read_text(encoding="utf-8")
+        assert "build output" in log and "@@RUN_EVENT@@" not in log
+
+        blocked["headroom"] = 0.5
+        waiting = scheduler.submit("B")
+        assert waiting["status"] == "queued"
+        assert queue.get(waiting["run_id"])["blocked_reason"].startswith("Budget")
+        blocked["headroom"] = None
+        assert scheduler.tick() == [waiting["run_id"]]
+        assert _wait_for(lambda: queue.get(waiting["run_id"])["status"] == "done")
+
+
+    def test_worker_bekommen_eigene_port_bereiche(self, queue, tmp_path):
+        release = tmp_path / "release"
+        script = (f"import os, time\nwhile not os.path.exists({str(release)!r}): time.sleep(0.02)")
+        offsets = []
+
+        def command(job):
+            offsets.append(job.get("port_offset"))
+            return [sys.executable, "-c", script]
+
+        settings = _settings(max_concurrent=3)
+        admission = AdmissionController(settings, budget_headroom=lambda: None, run_cost=lambda: 1.0,
+                                        load_per_cpu=lambda: None, free_memory_mb=lambda: None)
+        scheduler = RunScheduler(queue, settings, admission=admission, worker_command=command,
+                                 log_dir=str(tmp_path / "logs"))
+        first, second = scheduler.submit("A"), scheduler.submit("B")
+        assert offsets == [100, 200]
+        release.write_text("x")
+        for job in (first, second):
+            assert _wait_for(lambda: queue.get(job["run_id"])["status"] == "done")
+        scheduler.submit("C")
+        assert offsets[-1] == 100
+        assert "--port-offset" in _worker_command({"run_id": "r", "goal": "g", "port_offset": 100})
+        assert "--port-offset" not in _worker_command({"run_id": "r", "goal": "g"})
+
+
+def test_worker_events_roundtrip():
+    stream = io.StringIO()
+    emit_event("Coder", "Status", "Zeile mit Ümlaut", stream=stream)
+    assert parse_event(stream.getvalue().rstrip("\n")) == {"agent": "Coder", "event": "Status",
+                                                            "message": "Zeile mit Ümlaut"}
+    assert parse_event("normale Ausgabe") is None
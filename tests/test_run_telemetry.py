@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/run_telemetry.py.
+              Testet: Spalten-Stufen mit Downsampling, begrenzten Speicher,
+              Range-Abfragen und die Gauges aus WorkerStatus/FeatureUpdate/TokenMetrics.
+"""
+
+import json
+
+from backend.run_telemetry import ColumnarSeries, RunTelemetry
+
+
+TIERS = ((1, 40), (10, 20), (60, 10))
+
+
+def _fill(series, seconds, start=0.0):
+    for t in range(seconds):
+        series.append(start + t, {"active_workers": t % 4, "files_done": t})
+
+
+class TestColumnarSeries:
+    """Stufen, Kompaktierung und Abfragen."""
+
+    def test_speicher_bleibt_begrenzt(self):
+        series = ColumnarSeries(tiers=TIERS)
+        _fill(series, 2000)
+        size_short = series.stats()["bytes"]
+        _fill(series, 20000, start=2000)
+        stats = series.stats()
+        assert all(t["points"] <= t["capacity"] for t in stats["tiers"])
+        assert stats["bytes"] <= size_short * 1.2
+
+    def test_downsampling_mittelt_buckets(self):
+        series = ColumnarSeries(tiers=TIERS)
+        _fill(series, 100)
+        result = series.query(metrics=["files_done"], max_points=0)
+        assert result["resolution_s"] == 10
+        # erster 10s-Bucket: Mittel von 0..9
+        assert result["timestamps"][0] == 0
+        assert result["series"]["files_done"][0] == 4.5
+        # neueste Punkte liegen roh vor
+        assert result["timestamps"][-1] == 99
+        assert result["timestamps"] == sorted(result["timestamps"])
+
+    def test_bucket_ueber_zwei_kompaktierungen(self):
+        series = ColumnarSeries(tiers=((1, 8), (10, 10)))
+        _fill(series, 30)
+        result = series.query(metrics=["files_done"], max_points=0)
+        coarse = [ts for ts in result["timestamps"] if ts % 10 == 0]
+        assert len(coarse) == len(set(coarse))
+
+    def test_range_und_max_points(self):
+        series = ColumnarSeries(tiers=TIERS)
+        _fill(series, 30)
+        result = series.query(start=10, end=19, metrics=["files_done", "unbekannt"])
+        assert result["metrics"] == ["files_done"]
+        assert result["timestamps"] == [float(t) for t in range(10, 20)]
+        reduced = series.query(max_points=10)
+        assert reduced["points"] <= 10
+        assert reduced["series"]["files_done"][0] < reduced["series"]["files_done"][-1]
+
+
+class TestRunTelemetry:
+    """Gauges aus UI-Events."""
+
+    def _worker(self, office, active, queue=0):
+        return json.dumps({"office": office, "pool_status": {"active_workers": active, "queue_size": queue}})
+
+    def test_gauges(self):
+        telemetry = RunTelemetry(sample_interval=1.0, tiers=TIERS)
+        telemetry.observe("Coder", "WorkerStatus", self._worker("coder", 2, 3), now=100.0)
+        telemetry.observe("Tester", "WorkerStatus", self._worker("tester", 1), now=101.0)
+        telemetry.observe("System", "FeatureUpdate", json.dumps({"id": 1, "status": "done"}), now=102.0)
+        telemetry.observe("System", "FeatureUpdate", json.dumps({"id": 1, "status": "done"}), now=103.0)
+        telemetry.observe("Coder", "TokenMetrics", json.dumps({"total_tokens": 1000}), now=104.0)
+        telemetry.observe("Coder", "TokenMetrics", json.dumps({"total_tokens": 2000}), now=134.0)
+        telemetry.observe("Planner", "TokenMetrics", json.dumps({"total_tokens": 99999, "estimated": True}),
+                          now=135.0)
+        result = telemetry.series.query(max_points=0)
+        last = {name: values[-1] for name, values in result["series"].items()}
+        assert last == {"active_workers": 3.0, "tokens_per_min": 2000.0, "files_done": 1.0, "queue_depth": 3.0}
+
+    def test_sample_intervall_und_reset(self):
+        telemetry = RunTelemetry(sample_interval=5.0, tiers=TIERS)
+        for i in range(10):
+            telemetry.observe("System", "Heartbeat", "tick", now=100.0 + i)
+        assert telemetry.series.query()["points"] == 2
+        telemetry.reset()
+        assert telemetry.series.query()["points"] == 0
+        assert telemetry.query()["run_started"] is not None
+
+    def test_ungueltige_payloads(self):
+        telemetry = RunTelemetry(tiers=TIERS)
+        telemetry.observe("Coder", "WorkerStatus", "kein json", now=1.0)
+        telemetry.observe("Coder", "TokenMetrics", json.dumps([1, 2]), now=2.0)
+        assert telemetry.series.query()["series"]["active_workers"] == [0.0, 0.0]
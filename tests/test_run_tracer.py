@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/run_tracer.py und backend/trace_report.py.
+              Testet: Verschachtelung ueber contextvars und Threads, No-Op ohne
+              aktiven Run, Schliessen offener Kind-Spans, kritischer Pfad,
+              Folded-/Chrome-Export und die CLI.
+"""
+
+import json
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend import run_tracer
+from backend.heartbeat_utils import run_with_heartbeat
+from backend.run_tracer import (
+    begin_span,
+    bind_trace_context,
+    end_span,
+    finish_run_trace,
+    get_tracing_settings,
+    start_run_trace,
+    trace_span,
+)
+from backend.trace_report import (
+    build_report,
+    critical_path,
+    load_trace,
+    main,
+    to_chrome_trace,
+    to_folded,
+)
+
+
+@pytest.fixture
+def trace_dir(tmp_path):
+    yield str(tmp_path)
+    finish_run_trace()
+
+
+def _span(span_id, name, start, dur, parent=None, cat="phase", thread="main"):
+    return {"id": span_id, "parent": parent, "name": name, "cat": cat, "start_us": start,
+            "dur_us": dur, "end_us": start + dur, "thread": thread, "attrs": {}}
+
+
+# Run 0-100ms: research 0-20, planner 20-30, dev_loop 30-100 mit zwei parallelen
+# LLM-Aufrufen (30-60 und 30-90) und danach sandbox 90-100
+SPANS = [
+    _span(1, "run", 0, 100_000, cat="run"),
+    _span(2, "research", 0, 20_000, parent=1),
+    _span(3, "planner", 20_000, 10_000, parent=1),
+    _span(4, "dev_loop", 30_000, 70_000, parent=1),
+    _span(5, "Generiere a.py", 30_000, 30_000, parent=4, cat="llm", thread="w1"),
+    _span(6, "Generiere b.py", 30_000, 60_000, parent=4, cat="llm", thread="w2"),
+    _span(7, "sandbox", 90_000, 10_000, parent=4, cat="sandbox"),
+]
+
+
+class TestTracer:
+    """Aufzeichnung der Spans."""
+
+    def test_verschachtelung_und_threads(self, trace_dir):
+        tracer = start_run_trace("run/1", trace_dir)
+        assert tracer.path.endswith("run_1.trace.jsonl")
+        with trace_span("dev_loop") as loop_span:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                def work(name):
+                    with trace_span(name, "llm"):
+                        time.sleep(0.01)
+                list(pool.map(bind_trace_context(work), ["a", "b"]))
+            with trace_span("sandbox", "sandbox", files=3) as span:
+                span.set(exit_code=0)
+        path = finish_run_trace()
+
+        meta, spans = load_trace(path)
+        assert meta["run_id"] == "run/1"
+        by_name = {s["name"]: s for s in spans}
+        assert by_name["a"]["parent"] == by_name["b"]["parent"] == loop_span.span_id
+        assert by_name["a"]["thread"] != "MainThread"
+        assert by_name["sandbox"]["attrs"] == {"files": 3, "exit_code": 0}
+        assert by_name["dev_loop"]["dur_us"] >= 10_000
+
+    def test_ohne_aktiven_run_kein_span(self):
+        finish_run_trace()
+        with trace_span("x") as span:
+            assert span is None
+        assert begin_span("y") is None
+        func = lambda: 1
+        assert bind_trace_context(func) is func
+
+    def test_offene_kinder_enden_mit_eltern_span(self, trace_dir):
+        start_run_trace("r2", trace_dir)
+        with trace_span("dev_loop"):
+            iteration = begin_span("iteration 1", "iteration")
+            end_span(iteration)
+            begin_span("iteration 2", "iteration")  # return ohne end_span
+        with trace_span("danach") as after:
+            pass
+        path = finish_run_trace()
+        _, spans = load_trace(path)
+        by_name = {s["name"]: s for s in spans}
+        assert by_name["iteration 2"]["attrs"]["unfinished"] is True
+        assert by_name["iteration 2"]["end_us"] <= by_name["dev_loop"]["end_us"]
+        assert after and by_name["danach"]["parent"] is None
+
+    def test_rundung_kind_endet_nicht_nach_eltern(self):
+        tracer = types.SimpleNamespace(t0_ns=time.perf_counter_ns())
+        parent = run_tracer.Span(tracer, 1, None, "eltern", "phase", {})
+        child = run_tracer.Span(tracer, 2, 1, "kind", "llm", {})
+        # Beide enden gleichzeitig: Start und Dauer getrennt abgerundet ergaeben
+        # fuer den Eltern-Span 1 + 2 = 3us, fuer das Kind 2 + 2 = 4us
+        parent.start_ns, parent.end_ns = 1999, 4000
+        child.start_ns, child.end_ns = 2000, 4000
+        p, c = parent.to_dict(), child.to_dict()
+        assert c["start_us"] + c["dur_us"] == p["start_us"] + p["dur_us"] == 4
+
+    def test_fehler_wird_vermerkt_und_heartbeat_span(self, trace_dir):
+        start_run_trace("r3", trace_dir)
+        with pytest.raises(ValueError):
+            with trace_span("review", "review"):
+                run_with_heartbeat(lambda: 42, MagicMock(), "Reviewer", "Review", timeout_seconds=5)
+                raise ValueError("kaputt")
+        _, spans = load_trace(finish_run_trace())
+        by_name = {s["name"]: s for s in spans}
+        assert by_name["review"]["attrs"]["error"] == "ValueError"
+        assert by_name["Review"]["cat"] == "llm"
+        assert by_name["Review"]["parent"] == by_name["review"]["id"]
+
+    def test_puffer_und_settings(self, trace_dir):
+        tracer = start_run_trace("r4", trace_dir)
+        with trace_span("llm-call", "llm"):
+            pass
+        with open(tracer.path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 1  # nur Header, Span noch im Puffer
+        with trace_span("phase-ende"):
+            pass
+        with open(tracer.path, encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+        assert get_tracing_settings(MagicMock())["enabled"] is False
+        assert get_tracing_settings({})["enabled"] is True
+
+
+class TestReport:
+    """Kritischer Pfad und Exporte."""
+
+    def test_kritischer_pfad(self):
+        path = critical_path(SPANS)
+        assert [e["name"] for e in path] == ["run", "research", "planner", "dev_loop",
+                                             "Generiere b.py", "sandbox"]
+        assert sum(e["critical_us"] for e in path) == 100_000
+        assert next(e for e in path if e["name"] == "dev_loop")["critical_us"] == 0
+
+    def test_report_kategorien(self):
+        report = build_report({"run_id": "x"}, SPANS)
+        assert report["total_ms"] == 100.0
+        assert report["critical_by_category_ms"] == {"llm": 60.0, "phase": 30.0, "sandbox": 10.0}
+        # Eigenzeit zaehlt parallele Kinder nur einmal gegen den Eltern-Span
+        assert report["self_by_category_ms"]["llm"] == 90.0
+        assert report["self_by_category_ms"]["phase"] == 30.0
+
+    def test_folded_und_chrome(self):
+        folded = to_folded(SPANS).splitlines()
+        assert "run;dev_loop;Generiere_b.py 60000" in folded
+        assert "run;research 20000" in folded
+        assert not any(line.startswith("run;dev_loop ") for line in folded)
+        chrome = to_chrome_trace(SPANS)
+        complete = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+        assert len(complete) == len(SPANS)
+        assert len({e["tid"] for e in complete}) == 3
+
+    def test_cli(self, tmp_path, capsys):
+        path = tmp_path / "r.trace.jsonl"
+        lines = [json.dumps({"type": "run", "run_id": "r"})]
+        lines += [json.dumps({k: v for k, v in s.items() if k != "end_us"}) for s in SPANS]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        folded = tmp_path / "out.folded"
+        assert main([str(path), "--folded", str(folded)]) == 0
+        out = capsys.readouterr().out
+        assert "Kritischer Pfad:" in out and "Generiere b.py [llm]" in out
+        assert "run;sandbox" not in folded.read_text(encoding="utf-8")
+        assert main([str(tmp_path / "fehlt")]) == 1
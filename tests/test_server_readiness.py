@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Unit Tests fuer server_readiness.py - Event-basierte Server-Bereitschaft.
+              Testet: Framework-Erkennung, Ready-Marker, Crash-Erkennung,
+              Fallback-Probes, Output-Tail und Startzeit-Statistik.
+"""
+
+import os
+import sys
+import subprocess
+import time
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server_readiness import (
+    ServerOutputTail,
+    ReadinessResult,
+    detect_readiness_framework,
+    wait_for_server_ready,
+    record_startup,
+    get_startup_stats,
+    reset_startup_stats,
+)
+
+
+def _spawn(code: str) -> subprocess.Popen:
+    """Startet einen Python-Prozess mit Pipes wie start_server()."""
+    return subprocess.Popen(
+        [sys.executable, "-u", "-c", code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    reset_startup_stats()
+    yield
+    reset_startup_stats()
+
+
+# =========================================================================
+# Tests fuer detect_readiness_framework
+# =========================================================================
+class TestDetectReadinessFramework:
+    """Tests fuer die Marker-Framework-Erkennung."""
+
+    def test_nextjs(self):
+        assert detect_readiness_framework({"framework": "Next.js"}) == "nextjs"
+
+    def test_vite_ueber_react(self):
+        assert detect_readiness_framework({"project_type": "react_vite"}) == "vite"
+
+    def test_uvicorn_ueber_run_cmd(self):
+        assert detect_readiness_framework({}, "uvicorn app:app") == "uvicorn"
+
+    def test_fastapi_als_uvicorn(self):
+        assert detect_readiness_framework({"project_type": "fastapi_app"}) == "uvicorn"
+
+    def test_flask(self):
+        assert detect_readiness_framework({"project_type": "flask_app"}) == "flask"
+
+    def test_unbekannt_generic(self):
+        assert detect_readiness_framework({"language": "go"}) == "generic"
+
+
+# =========================================================================
+# Tests fuer wait_for_server_ready
+# =========================================================================
+class TestWaitForServerReady:
+    """Tests fuer die event-basierte Bereitschaftspruefung."""
+
+    def test_ready_marker_flask(self):
+        """Flask-Marker beendet das Warten ohne erfolgreiche Probe."""
+        proc = _spawn(
+            "import time\n"
+            "print(' * Running on http://127.0.0.1:5000')\n"
+            "time.sleep(5)"
+        )
+        try:
+            result = wait_for_server_ready(proc, 1, timeout=5, framework="flask",
+                                           probe=lambda p, h: False)
+            assert result.ready is True
+            assert result.reason == "marker"
+            assert "Running on" in result.detail
+            assert result.elapsed_seconds < 4
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_uvicorn_marker_auf_stderr(self):
+        """Uvicorn loggt auf stderr - auch das wird erkannt."""
+        proc = _spawn(
+            "import sys, time\n"
+            "sys.stderr.write('INFO:     Uvicorn running on http://0.0.0.0:8000\\n')\n"
+            "time.sleep(5)"
+        )
+        try:
+            result = wait_for_server_ready(proc, 1, timeout=5, framework="uvicorn",
+                                           probe=lambda p, h: False)
+            assert result.ready is True
+            assert result.reason == "marker"
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_crash_wird_sofort_erkannt(self):
+        """Beendeter Prozess fuehrt sofort zu 'exited' statt Timeout."""
+        proc = _spawn("import sys; print('boom'); sys.exit(3)")
+        start = time.monotonic()
+        result = wait_for_server_ready(proc, 1, timeout=30, framework="flask",
+                                       probe=lambda p, h: False)
+        assert result.ready is False
+        assert result.reason == "exited"
+        assert result.exit_code == 3
+        assert time.monotonic() - start < 10
+
+    def test_fatal_output_port_belegt(self):
+        """EADDRINUSE im Output bricht ab, auch wenn der Prozess noch lebt."""
+        proc = _spawn(
+            "import sys, time\n"
+            "sys.stderr.write('Error: listen EADDRINUSE: address already in use :::3000\\n')\n"
+            "time.sleep(5)"
+        )
+        try:
+            result = wait_for_server_ready(proc, 1, timeout=5, framework="nextjs",
+                                           probe=lambda p, h: False)
+            assert result.ready is False
+            assert result.reason == "fatal_output"
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_fallback_probe(self):
+        """Ohne Marker entscheidet die Port-Probe."""
+        proc = _spawn("import time; time.sleep(5)")
+        calls = []
+
+        def probe(port, host):
+            calls.append(port)
+            return len(calls) >= 3
+
+        try:
+            result = wait_for_server_ready(proc, 4321, timeout=5, framework="generic",
+                                           probe=probe)
+            assert result.ready is True
+            assert result.reason == "probe"
+            assert result.probes == 3
+            assert calls == [4321, 4321, 4321]
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_timeout(self):
+        proc = _spawn("import time; time.sleep(5)")
+        try:
+            result = wait_for_server_ready(proc, 1, timeout=0.3, framework="vite",
+                                           probe=lambda p, h: False)
+            assert result.ready is False
+            assert result.reason == "timeout"
+        finally:
+            proc.kill()
+            proc.wait()
+
+
+# =========================================================================
+# Tests fuer ServerOutputTail
+# =========================================================================
+class TestServerOutputTail:
+    """Tests fuer den Hintergrund-Output-Tail."""
+
+    def test_read_new_liefert_nur_neuen_output(self):
+        proc = _spawn("print('zeile1'); print('zeile2')")
+        tail = ServerOutputTail(proc).start()
+        proc.wait()
+        first = tail.read_new(wait=2.0)
+        deadline = time.monotonic() + 2
+        while "zeile2" not in first and time.monotonic() < deadline:
+            first += "\n" + tail.read_new(wait=0.2)
+        assert "zeile1" in first and "zeile2" in first
+        assert tail.read_new() == ""
+        assert "zeile1" in tail.get_output()
+
+    def test_ohne_pipes(self):
+        """Prozess ohne Pipes erzeugt keinen Fehler."""
+        class _Proc:
+            stdout = None
+            stderr = None
+        tail = ServerOutputTail(_Proc()).start()
+        assert tail.get_output() == ""
+        assert tail.read_new(wait=0.1) == ""
+
+
+# =========================================================================
+# Tests fuer die Startzeit-Statistik
+# =========================================================================
+class TestStartupStats:
+    """Tests fuer die Framework-Startzeit-Statistik."""
+
+    def test_aggregation(self):
+        record_startup(ReadinessResult(True, "marker", "nextjs", 2.0))
+        record_startup(ReadinessResult(True, "probe", "nextjs", 4.0))
+        record_startup(ReadinessResult(False, "exited", "nextjs", 0.5))
+        stats = get_startup_stats()["nextjs"]
+        assert stats["starts"] == 3
+        assert stats["ready"] == 2
+        assert stats["failed"] == 1
+        assert stats["avg_seconds"] == 3.0
+        assert stats["min_seconds"] == 2.0
+        assert stats["max_seconds"] == 4.0
+        assert stats["by_reason"] == {"marker": 1, "probe": 1, "exited": 1}
+
+    def test_wait_for_server_ready_erfasst_statistik(self):
+        proc = _spawn("import sys; sys.exit(1)")
+        wait_for_server_ready(proc, 1, timeout=5, framework="flask", probe=lambda p, h: False)
+        assert get_startup_stats()["flask"]["failed"] == 1
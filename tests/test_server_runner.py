@@ -397,6 +397,37 @@ class TestStartServer:
                 assert result.process is None
                 assert result.port == 5000
 
+    def test_worker_haengt_sich_nicht_an_fremden_server(self, temp_dir, monkeypatch):
+        """Run-Worker: belegter Port gehoert einem anderen Run → kein ServerInfo."""
+        monkeypatch.setenv("AGENTSMITH_RUN_ID", "run_b")
+        bp = {"project_type": "flask_app", "app_type": "webapp",
+              "language": "python", "run_command": ""}
+        with patch("server_runner.is_port_available", return_value=True):
+            with patch("server_runner._install_dependencies", return_value=True):
+                assert start_server(temp_dir, bp) is None
+
+    def test_docker_container_mit_port_versatz(self, temp_dir, monkeypatch):
+        """Projekt-Container eines Workers publiziert und prueft den versetzten Host-Port."""
+        from backend.docker_project_container import ProjectContainerManager
+        monkeypatch.setenv("AGENTSMITH_PORT_OFFSET", "100")
+        bp = {"project_type": "flask_app", "app_type": "webapp", "language": "python",
+              "run_command": "python app.py", "server_port": 5000}
+        container = ProjectContainerManager(temp_dir, bp, {})
+        assert (container.port, container.host_port) == (5000, 5100)
+        with patch.object(container, "_get_docker_path", return_value="docker"), \
+                patch.object(container, "_remove_existing_container"), \
+                patch("backend.docker_project_container.subprocess.run",
+                      return_value=MagicMock(returncode=0, stdout="abc", stderr="")) as run:
+            assert container.create() is True
+        cmd = run.call_args.args[0]
+        assert cmd[cmd.index("-p") + 1] == "5100:5000"
+
+        container.install_deps = MagicMock(return_value=MagicMock(success=True, stderr=""))
+        with patch.object(container, "start_server", return_value=True), \
+                patch("server_runner._wait_for_app_ready"):
+            info = start_server(temp_dir, bp, docker_container=container)
+        assert info.port == 5100 and info.url.endswith(":5100")
+
     def test_kein_startbefehl(self, temp_dir):
         """None wenn kein Startbefehl gefunden."""
         bp = {"project_type": "flask_app", "app_type": "webapp",
@@ -429,12 +460,19 @@ class TestStartServer:
                     f.write("echo test")
 
                 mock_process = MagicMock()
+                mock_process.stdout = None
                 mock_process.stderr = None
+                # AENDERUNG 18.10.2026: Readiness laeuft ueber wait_for_server_ready
+                not_ready = MagicMock(ready=False, reason="timeout", detail="")
                 with patch("server_runner.subprocess.Popen", return_value=mock_process):
-                    with patch("server_runner.wait_for_port", return_value=False) as mock_wait:
-                        start_server(temp_dir, bp)
-                        # Timeout sollte 60s sein (60000ms / 1000)
-                        mock_wait.assert_called_once_with(5000, timeout=60)
+                    with patch("server_runner.stop_server", return_value=True):
+                        with patch("server_runner.wait_for_server_ready",
+                                   return_value=not_ready) as mock_wait:
+                            start_server(temp_dir, bp)
+                            # Timeout sollte 60s sein (60000ms / 1000)
+                            assert mock_wait.call_count == 1
+                            assert mock_wait.call_args.args[1] == 5000
+                            assert mock_wait.call_args.kwargs["timeout"] == 60
 
 
 # =========================================================================
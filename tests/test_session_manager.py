@@ -773,6 +773,89 @@ class TestRestoreFromLibrary:
         )
 
 
+# =========================================================================
+# TestVersionierung - seq, Deltas und Log-Cursor (AENDERUNG 18.10.2026)
+# =========================================================================
+
+class TestVersionierung:
+    """Tests fuer get_changes(), get_logs_page() und etag()."""
+
+    def test_seq_steigt_bei_jeder_aenderung(self):
+        """Jede Aenderung erhoeht seq, der ETag folgt."""
+        sm = SessionManager()
+        etag = sm.etag()
+        seq = sm.seq
+        sm.update_status("Working")
+        assert sm.seq == seq + 1
+        assert sm.etag() != etag
+        eintrag = sm.add_log("coder", "event", "x")
+        assert eintrag["seq"] == sm.seq
+
+    def test_delta_enthaelt_nur_aenderungen(self):
+        """get_changes() liefert nur geaenderte Agents und neue Logs."""
+        sm = SessionManager()
+        sm.start_session("Test")
+        seit = sm.get_current_state()["seq"]
+        sm.update_agent_snapshot("coder", {"file": "app.py"})
+        sm.add_log("coder", "event", "neu")
+
+        delta = sm.get_changes(seit, epoch=sm.epoch)
+        assert delta["full"] is False
+        assert "session" not in delta
+        assert list(delta["agent_data"]) == ["coder"]
+        assert [l["message"] for l in delta["logs"]] == ["neu"]
+        assert delta["seq"] == sm.seq
+
+        sm.update_iteration(2)
+        delta = sm.get_changes(delta["seq"], epoch=sm.epoch)
+        assert delta["session"]["iteration"] == 2
+        assert delta["logs"] == [] and "agent_data" not in delta
+
+    def test_voller_state_nach_reset_oder_fremder_epoch(self):
+        """Nach Reset, bei anderer epoch oder seq aus der Zukunft: full=True."""
+        sm = SessionManager()
+        sm.add_log("coder", "event", "alt")
+        seit = sm.seq
+        sm.reset()
+        assert sm.get_changes(seit)["full"] is True
+        assert sm.get_changes(sm.seq, epoch="andere")["full"] is True
+        assert sm.get_changes(sm.seq + 5)["full"] is True
+        assert sm.get_changes(sm.seq)["full"] is False
+
+    def test_verdraengte_logs_werden_gemeldet(self):
+        """logs_truncated, wenn Logs seit since aus dem Ring-Buffer gefallen sind."""
+        sm = SessionManager()
+        seit = sm.seq
+        for i in range(sm._max_logs + 5):
+            sm.add_log("test", "event", f"Log {i}")
+        delta = sm.get_changes(seit, log_limit=10)
+        assert delta["logs_truncated"] is True
+        assert delta["has_more_logs"] is True
+        assert delta["logs"][0]["message"] == "Log 5"
+
+    def test_cursor_paging(self):
+        """get_logs_page() blaettert stabil per seq rueckwaerts und vorwaerts."""
+        sm = SessionManager()
+        for i in range(10):
+            sm.add_log("test", "event", f"Log {i}")
+        seite = sm.get_logs_page(limit=4)
+        assert [l["message"] for l in seite["logs"]] == ["Log 6", "Log 7", "Log 8", "Log 9"]
+        assert seite["has_more"] is True
+        aelter = sm.get_logs_page(limit=4, before=seite["before"])
+        assert [l["message"] for l in aelter["logs"]] == ["Log 2", "Log 3", "Log 4", "Log 5"]
+        sm.add_log("test", "event", "Log 10")
+        neuer = sm.get_logs_page(limit=4, after=seite["after"])
+        assert [l["message"] for l in neuer["logs"]] == ["Log 10"]
+        assert neuer["has_more"] is False
+
+    def test_wiederhergestellte_logs_bekommen_seq(self):
+        """restore_from_library() vergibt neue seq fuer geladene Logs."""
+        sm = SessionManager()
+        sm.restore_from_library({"project_id": "p1", "logs": [{"agent": "a", "event": "e", "message": "m"}]})
+        seqs = [l["seq"] for l in sm.logs]
+        assert seqs == sorted(seqs) and len(seqs) == 2
+
+
 # =========================================================================
 # TestThreadSafety - Parallele Zugriffe
 # =========================================================================
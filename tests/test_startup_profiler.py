@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/startup_profiler.py und backend/lazy_loader.py.
+              Testet: Phasen-Zeiten, Import-Baum, LazyAttr/LazyInstance und
+              den Cold-Start-Benchmark (app_state ohne OrchestrationManager).
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import threading
+import subprocess
+import textwrap
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.startup_profiler import StartupProfiler
+from backend.lazy_loader import LazyAttr, LazyInstance, is_loaded, lazy_get
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cold-Start-Budget fuer "import backend.app_state" (Sekunden). Grosszuegig
+# gewaehlt - der Test soll das Nachladen der Agenten-Kette erkennen, nicht
+# Schwankungen der Maschine.
+COLD_START_BUDGET_SECONDS = 5.0
+
+
+@pytest.fixture
+def temp_package(tmp_path, monkeypatch):
+    """Paket lazypkg mit Untermodul, das beim Import einen Zaehler erhoeht."""
+    pkg = tmp_path / "lazypkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "heavy.py").write_text(textwrap.dedent("""
+        import time
+        from lazypkg import helper
+        time.sleep(0.02)
+        LOADS = helper.bump()
+
+        class Thing:
+            def __init__(self, value):
+                self.value = value
+    """))
+    (pkg / "helper.py").write_text(textwrap.dedent("""
+        _count = 0
+        def bump():
+            global _count
+            _count += 1
+            return _count
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazypkg"
+    for name in [m for m in sys.modules if m == "lazypkg" or m.startswith("lazypkg.")]:
+        del sys.modules[name]
+
+
+# =========================================================================
+# Tests fuer StartupProfiler
+# =========================================================================
+class TestStartupProfiler:
+    """Phasen und Import-Baum."""
+
+    def test_phasen_werden_erfasst(self):
+        profiler = StartupProfiler()
+        with profiler.phase("aussen"):
+            with profiler.phase("innen"):
+                time.sleep(0.01)
+        phases = {p["name"]: p for p in profiler.phases()}
+        assert phases["innen"]["duration_ms"] >= 10
+        assert phases["aussen"]["duration_ms"] >= phases["innen"]["duration_ms"]
+
+    def test_mark_nur_einmal(self):
+        profiler = StartupProfiler()
+        profiler.mark("ready")
+        first = profiler.report()["marks"]["ready"]
+        time.sleep(0.01)
+        profiler.mark("ready")
+        assert profiler.report()["marks"]["ready"] == first
+
+    def test_import_baum(self, temp_package):
+        profiler = StartupProfiler()
+        profiler.install_import_hook()
+        try:
+            __import__("lazypkg.heavy")
+        finally:
+            profiler.uninstall_import_hook()
+        assert not profiler.import_hook_active
+
+        tree = profiler.import_tree()
+        # Paket laeuft vor dem Untermodul durch → beide sind Wurzeln
+        assert [n["module"] for n in tree] == ["lazypkg", "lazypkg.heavy"]
+        heavy = tree[1]
+        assert [c["module"] for c in heavy["children"]] == ["lazypkg.helper"]
+        assert heavy["cumulative_ms"] >= 20
+        assert heavy["self_ms"] <= heavy["cumulative_ms"]
+        assert profiler.slowest_imports(1)[0]["module"] == "lazypkg.heavy"
+
+    def test_report_ist_json_und_text(self, temp_package):
+        profiler = StartupProfiler()
+        profiler.install_import_hook()
+        with profiler.phase("import:lazypkg"):
+            __import__("lazypkg.heavy")
+        profiler.uninstall_import_hook()
+        json.dumps(profiler.report())
+        text = profiler.format_report(min_ms=0)
+        assert "import:lazypkg" in text
+        assert "lazypkg.heavy" in text
+
+    def test_ohne_hook_kein_baum(self, temp_package):
+        profiler = StartupProfiler()
+        __import__("lazypkg.heavy")
+        assert profiler.import_tree() == []
+        assert "Import-Baum" not in profiler.format_report()
+
+
+# =========================================================================
+# Tests fuer LazyAttr / LazyInstance
+# =========================================================================
+class TestLazyLoader:
+    """Lazy-Platzhalter fuer Module und Singletons."""
+
+    def test_lazy_attr_importiert_erst_beim_aufruf(self, temp_package):
+        thing = LazyAttr("lazypkg.heavy", "Thing")
+        assert "lazypkg.heavy" not in sys.modules
+        assert not thing.is_loaded
+        assert thing(3).value == 3
+        assert thing.is_loaded
+        assert sys.modules["lazypkg.heavy"].LOADS == 1
+        assert lazy_get(thing) is sys.modules["lazypkg.heavy"].Thing
+
+    def test_lazy_instance_einmalig_und_thread_safe(self):
+        calls = []
+
+        class Target:
+            def __init__(self):
+                calls.append(1)
+                time.sleep(0.02)
+                self.config = {"a": 1}
+
+        proxy = LazyInstance(Target, "Target")
+        assert not is_loaded(proxy)
+        assert "nicht erzeugt" in repr(proxy)
+        threads = [threading.Thread(target=lambda: proxy.config) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert calls == [1]
+        assert is_loaded(proxy)
+
+    def test_lazy_instance_leitet_schreiben_weiter(self):
+        class Target:
+            value = 0
+
+        proxy = LazyInstance(Target, "Target")
+        proxy.value = 5
+        real = lazy_get(proxy)
+        assert real.value == 5
+        del proxy.value
+        assert real.value == 0
+        assert isinstance(proxy, Target)
+
+
+# =========================================================================
+# Cold-Start-Regression
+# =========================================================================
+class TestColdStart:
+    """Server-Start darf die Agenten-Kette nicht mehr laden."""
+
+    HEAVY_MODULES = {
+        "crewai", "backend.agent_factory", "backend.dev_loop", "backend.orchestration_phases",
+        "backend.orchestration_readme", "backend.dev_loop_task_derivation",
+        "agents.meta_orchestrator_agent", "agents.researcher_agent",
+    }
+
+    def test_orchestration_manager_importiert_schwere_module_lazy(self):
+        path = os.path.join(PROJECT_ROOT, "backend", "orchestration_manager.py")
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        eager = set()
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                if node.level:
+                    module = f"backend.{module}" if module else "backend"
+                eager.add(module)
+            elif isinstance(node, ast.Import):
+                eager.update(alias.name for alias in node.names)
+        assert not (eager & self.HEAVY_MODULES)
+
+    def test_app_state_cold_start(self):
+        pytest.importorskip("slowapi")
+        pytest.importorskip("dotenv")
+        code = (
+            "import sys, time, json\n"
+            "t = time.perf_counter()\n"
+            "import backend.app_state as s\n"
+            "elapsed = time.perf_counter() - t\n"
+            "from backend.lazy_loader import is_loaded\n"
+            "print(json.dumps({'elapsed': elapsed, 'loaded': is_loaded(s.manager),"
+            " 'om': 'backend.orchestration_manager' in sys.modules}))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+        assert data["loaded"] is False
+        assert data["om"] is False
+        assert data["elapsed"] < COLD_START_BUDGET_SECONDS
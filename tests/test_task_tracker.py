@@ -17,6 +17,7 @@ import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from backend.task_tracker import TaskTracker
+from backend.dart_task_sync import MockDartTaskSync
 from backend.task_models import (
     DerivedTask, TaskStatus, TaskDerivationResult,
     TaskCategory, TaskPriority, TargetAgent,
@@ -103,17 +104,16 @@ class TestLogDerivationResult:
         ids = tracker.log_derivation_result(_make_result(tasks=tasks))
         assert len(ids) == 3 and all(tid in tracker._tasks for tid in ["T-A", "T-B", "T-C"])
     def test_mit_dart_sync_aufgerufen(self, tmp_path):
-        """Mit dart_sync wird sync_task aufgerufen."""
-        mock_sync = MagicMock()
-        mock_sync.sync_task.return_value = "DART-42"
+        """Mit dart_sync wird sync_batch einmal fuer alle Tasks aufgerufen."""
+        # AENDERUNG 18.10.2026: Batch-Sync statt sync_task pro Task
+        mock_sync = MockDartTaskSync()
         tracker = TaskTracker(log_dir=str(tmp_path), dart_sync=mock_sync)
         tracker.log_derivation_result(_make_result(tasks=[_make_task(task_id="T-DART")]))
-        mock_sync.sync_task.assert_called_once()
-        assert tracker._tasks["T-DART"].dart_id == "DART-42"
+        assert tracker._tasks["T-DART"].dart_id == "DART-MOCK-0001"
     def test_dart_sync_exception_kein_crash(self, tmp_path):
         """dart_sync Exception fuehrt nicht zum Crash."""
         mock_sync = MagicMock()
-        mock_sync.sync_task.side_effect = RuntimeError("Dart offline")
+        mock_sync.sync_batch.side_effect = RuntimeError("Dart offline")
         tracker = TaskTracker(log_dir=str(tmp_path), dart_sync=mock_sync)
         assert tracker.log_derivation_result(_make_result(tasks=[_make_task(task_id="T-ERR")])) == ["T-ERR"]
     def test_session_enthaelt_task_ids(self, tmp_path):
@@ -27,7 +27,10 @@ from techstack_templates.template_learning import (
     try_learn_from_project,
     _extract_blueprint_from_archive,
     _load_usage_stats,
+    _scan_similar_recipes,
+    get_recipe_index,
 )
+from techstack_templates.recipe_index import RecipeIndex, RECIPE_INDEX_FILENAME
 
 
 # ============================================================================
@@ -244,6 +247,105 @@ class TestFindSimilarRecipes:
             assert similar == []
 
 
+# ============================================================================
+# Tests: Recipe-Index (AENDERUNG 18.10.2026)
+# ============================================================================
+
+def _archive_with_deps(project_id, extra_deps, status="success"):
+    """Archiv auf nextjs_tailwind-Basis mit zusaetzlichen Dependencies."""
+    return {
+        "project_id": project_id,
+        "status": status,
+        "entries": [{
+            "type": "TechStackOutput",
+            "content": json.dumps({"blueprint": {
+                "project_type": "nextjs",
+                "language": "javascript",
+                "_source_template": "nextjs_tailwind",
+                "dependencies": ["next", "react"] + list(extra_deps),
+            }})
+        }]
+    }
+
+
+class TestRecipeIndex:
+    """Tests fuer den persistenten Recipe-Index."""
+
+    def test_index_wird_angelegt(self, sample_project_archive, archive_dir):
+        recipe = extract_proven_recipe(sample_project_archive)
+        find_similar_recipes(recipe, archive_dir, min_similarity=0.3)
+        assert os.path.exists(os.path.join(archive_dir, RECIPE_INDEX_FILENAME))
+        assert get_recipe_index(archive_dir).stats()["recipes"] == 2
+
+    def test_nur_geaenderte_archive_werden_gelesen(self, archive_dir):
+        index = RecipeIndex(archive_dir, extract_proven_recipe)
+        assert index.refresh()["parsed"] == 2
+        assert index.refresh()["parsed"] == 0
+
+        with open(os.path.join(archive_dir, "proj_neu.json"), "w", encoding="utf-8") as f:
+            json.dump(_archive_with_deps("proj_neu", ["zustand"]), f)
+        stats = index.refresh()
+        assert stats["parsed"] == 1
+        assert stats["scanned"] == 3
+
+    def test_geloeschtes_archiv_wird_entfernt(self, sample_project_archive, archive_dir):
+        index = RecipeIndex(archive_dir, extract_proven_recipe)
+        index.refresh()
+        os.remove(os.path.join(archive_dir, f"{sample_project_archive['project_id']}.json"))
+        assert index.refresh()["removed"] == 1
+        assert index.stats()["recipes"] == 1
+
+    def test_fingerprint_aenderung_baut_neu_auf(self, archive_dir):
+        RecipeIndex(archive_dir, extract_proven_recipe, fingerprint="a").refresh()
+        assert RecipeIndex(archive_dir, extract_proven_recipe, fingerprint="b").refresh()["parsed"] == 2
+
+    def test_ergebnis_wie_vollscan(self, sample_project_archive, archive_dir):
+        """Index liefert dieselben Treffer wie der bisherige Vollscan."""
+        for i, deps in enumerate([["react-speech-recognition", "openai", "zod"],
+                                  ["openai"], ["prisma", "zod"]]):
+            with open(os.path.join(archive_dir, f"p{i}.json"), "w", encoding="utf-8") as f:
+                json.dump(_archive_with_deps(f"p{i}", deps), f)
+        with open(os.path.join(archive_dir, "failed.json"), "w", encoding="utf-8") as f:
+            json.dump(_archive_with_deps("failed", ["openai"], status="failed"), f)
+
+        recipe = extract_proven_recipe(sample_project_archive)
+        for min_sim in (0.0, 0.3, 0.5):
+            expected = _scan_similar_recipes(recipe, archive_dir, min_sim)
+            actual = find_similar_recipes(recipe, archive_dir, min_sim)
+            assert sorted((r["project_id"], r["similarity"]) for r in actual) == \
+                sorted((r["project_id"], r["similarity"]) for r in expected)
+
+    def test_upsert_ohne_datei(self, archive_dir):
+        index = RecipeIndex(archive_dir, extract_proven_recipe)
+        index.refresh()
+        recipe = index.upsert_archive("proj_x.json", _archive_with_deps("proj_x", ["openai"]))
+        assert recipe["additional_dependencies"] == ["openai"]
+        ref = {"project_id": "ref", "base_template": "nextjs_tailwind",
+               "additional_dependencies": ["openai"]}
+        assert [r["project_id"] for r in index.find_similar(ref, 1.0)] == ["proj_x"]
+
+    def test_leere_basis_passt_zu_fehlender_basis(self, tmp_path):
+        """base_template "" und None landen in derselben Gruppe (Schreiben wie Abfrage)."""
+        def extractor(archive):
+            return {"project_id": archive["project_id"], "base_template": archive["base"],
+                    "additional_dependencies": ["openai"]}
+
+        index = RecipeIndex(str(tmp_path), extractor)
+        index.upsert_archive("leer.json", {"project_id": "leer", "base": ""})
+        index.upsert_archive("ohne.json", {"project_id": "ohne", "base": None})
+        for base in ("", None):
+            ref = {"project_id": "ref", "base_template": base, "additional_dependencies": ["openai"]}
+            for min_sim in (0.0, 1.0):
+                assert sorted(r["project_id"] for r in index.find_similar(ref, min_sim)) == ["leer", "ohne"]
+
+    def test_kaputtes_archiv_wird_ignoriert(self, archive_dir):
+        with open(os.path.join(archive_dir, "kaputt.json"), "w", encoding="utf-8") as f:
+            f.write("{kein json")
+        index = RecipeIndex(archive_dir, extract_proven_recipe)
+        assert index.refresh()["parsed"] == 3
+        assert index.stats()["recipes"] == 2
+
+
 # ============================================================================
 # Tests: propose_new_template
 # ============================================================================
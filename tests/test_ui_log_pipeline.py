@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.0
+Beschreibung: Tests fuer backend/ui_log_pipeline.py.
+              Testet: Reihenfolge und Batching im Consumer, Backpressure mit
+              Drop-Zaehlung, Senken-Fehler, synchronen Modus, Batch-Senken
+              (Session, Library, crew_log.jsonl) und den Mikro-Benchmark.
+"""
+
+import logging
+import threading
+
+import pytest
+
+from backend.library_manager import LibraryManager
+from backend.session_manager import SessionManager
+from backend.ui_log_pipeline import (
+    UILogPipeline,
+    benchmark,
+    get_ui_log_settings,
+    make_session_sink,
+)
+
+
+class _GateSink:
+    """Senke, die bis zum Freigeben blockiert (simuliert langsame Platte/Locks)."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.batches = []
+
+    def __call__(self, batch):
+        self.entered.set()
+        self.gate.wait(5)
+        self.batches.append([item[2] for item in batch])
+
+
+class TestPipeline:
+    """Consumer, Backpressure und Steuerung."""
+
+    def test_reihenfolge_und_batches(self):
+        sink = _GateSink()
+        pipeline = UILogPipeline([("gate", sink)], batch_size=50)
+        pipeline.submit("Coder", "Status", 0)
+        assert sink.entered.wait(5)
+        for i in range(1, 120):
+            pipeline.submit("Coder", "Status", i)
+        sink.gate.set()
+        assert pipeline.flush() is True
+        received = [m for batch in sink.batches for m in batch]
+        assert received == list(range(120))
+        # Waehrend die Senke blockiert, sammeln sich die Events zu Batches
+        assert len(sink.batches) <= 5
+        stats = pipeline.stats()
+        assert stats["processed"] == 120 and stats["queued"] == 0 and stats["max_queue_depth"] >= 50
+        pipeline.close()
+
+    def test_backpressure_und_drops(self):
+        sink = _GateSink()
+        pipeline = UILogPipeline([("gate", sink)], max_queue=2, block_timeout_ms=50)
+        pipeline.submit("Coder", "Status", "erster")
+        assert sink.entered.wait(5)
+        pipeline.submit("Coder", "Token", "a")
+        pipeline.submit("Coder", "Token", "b")
+        assert pipeline.submit("Coder", "Token", "verworfen") is False
+        # Kritische Events warten bis block_timeout und gehen nie verloren
+        assert pipeline.submit("System", "Error", "bleibt") is True
+        sink.gate.set()
+        pipeline.flush()
+        received = [m for batch in sink.batches for m in batch]
+        assert "verworfen" not in received and received[-1] == "bleibt"
+        stats = pipeline.stats()
+        assert stats["dropped"] == 1 and stats["dropped_by_event"] == {"Token": 1}
+        assert stats["blocked_submits"] == 1
+        pipeline.close()
+
+    def test_senken_fehler_und_synchroner_modus(self):
+        seen = []
+
+        def broken(batch):
+            raise OSError("Platte voll")
+
+        pipeline = UILogPipeline([("broken", broken), ("ok", lambda b: seen.extend(b))], threaded=False)
+        assert pipeline.submit("Coder", "Status", "x", None, 2) is True
+        # Synchron: Senken laufen sofort im Aufrufer, Fehler einer Senke stoppt die anderen nicht
+        assert [(i[0], i[2], i[4]) for i in seen] == [("Coder", "x", 2)]
+        assert pipeline.stats()["sink_errors"] == {"broken": 1, "ok": 0}
+
+    def test_close_und_settings(self):
+        seen = []
+        pipeline = UILogPipeline([("ok", lambda b: seen.extend(b))])
+        pipeline.submit("A", "Status", 1)
+        assert pipeline.close() is True
+        pipeline.submit("A", "Status", 2)
+        assert [i[2] for i in seen] == [1, 2]
+        assert get_ui_log_settings(None)["enabled"] is False
+        settings = get_ui_log_settings({"ui_log_pipeline": {"enabled": False, "max_queue": "50"}})
+        assert settings == {"enabled": False, "max_queue": 50, "batch_size": 256, "block_timeout_ms": 200}
+
+    def test_benchmark_agent_thread_entlastet(self):
+        results = benchmark(calls=300, sink_ms=1.0, sinks=2)
+        assert results["sync"]["mean_us"] > 1000
+        assert results["pipeline"]["mean_us"] < results["sync"]["mean_us"] / 10
+        assert results["pipeline"]["stats"]["processed"] == 300
+
+
+class TestSinks:
+    """Batch-Senken des OrchestrationManagers."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_session(self):
+        SessionManager._instance = None
+        yield
+        SessionManager._instance = None
+
+    def test_session_senke(self):
+        sink = make_session_sink({"Coder": "coder"})
+        sink([("Coder", "Working", "baut", None, 0, 1.0e9 + 43200),
+              ("Security", "HELP_NEEDED", "{}", None, 0, 1.0e9 + 43201),
+              ("Coder", "Info", "egal", None, 0, 1.0e9 + 43202)])
+        sm = SessionManager()
+        logs, total = sm.get_logs()
+        assert [l["event"] for l in logs[:3]] == ["Working", "HELP_NEEDED", "Info"]
+        assert logs[0]["timestamp"].startswith("2001-09-09")
+        assert sm.current_session["active_agents"]["coder"] is True
+        assert sm.agent_snapshots["security"]["blocked"] is True
+
+    def test_library_batch_speichert_einmal(self, tmp_path, monkeypatch):
+        library = LibraryManager(base_dir=str(tmp_path))
+        library.start_project(name="p", goal="g")
+        saves = []
+        original = library._save_current_project
+        monkeypatch.setattr(library, "_save_current_project", lambda: (saves.append(1), original()))
+        assert library.log_entries([
+            {"from_agent": "Coder", "entry_type": "Status", "content": "a", "iteration": 2},
+            {"from_agent": "Reviewer", "entry_type": "Result", "content": "b", "timestamp": "2026-10-18T10:00:00"},
+        ]) == 2
+        assert len(saves) == 1
+        entries = library.current_project["entries"]
+        assert [e["id"] for e in entries] == ["entry_0001", "entry_0002"]
+        assert entries[1]["timestamp"] == "2026-10-18T10:00:00"
+        assert library.current_project["iterations"] == 2
+        assert library.current_project["agents_involved"] == ["Coder", "Reviewer"]
+
+    def test_jsonl_block(self, caplog):
+        from logger_utils import log_events
+        with caplog.at_level(logging.INFO, logger="crew_logger"):
+            log_events([("Coder", "Status", "Café"), ("Tester", "Result", 42)])
+        records = [r for r in caplog.records if r.name == "crew_logger"]
+        assert len(records) == 1
+        lines = records[0].getMessage().split("\n")
+        assert len(lines) == 2 and "Café" in lines[0] and '"content": "42"' in lines[1]
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Tests fuer unit_test_impact.py - Import-Graph, Test-Auswahl
+              und Content-Hash-Cache fuer inkrementelle Unit-Tests.
+              AENDERUNG 18.10.2026: Cache unter budget_data/ statt im Projekt.
+"""
+
+import os
+import sys
+import json
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unit_test_impact import (
+    TestImpactAnalyzer,
+    TestSelection,
+    extract_failed_test_files,
+    is_js_test_file,
+    is_python_test_file,
+    impact_cache_path,
+)
+from unit_test_runner import run_unit_tests
+
+
+def _write(base, rel, content):
+    path = os.path.join(base, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+@pytest.fixture(autouse=True)
+def impact_cache_dir(tmp_path, monkeypatch):
+    """Impact-Cache in ein temporaeres Verzeichnis statt budget_data/."""
+    cache_dir = str(tmp_path / "impact_cache")
+    monkeypatch.setattr("unit_test_impact.IMPACT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def python_project(temp_dir):
+    """Flask-aehnliches Projekt mit zwei Modulen und zwei Test-Dateien."""
+    _write(temp_dir, "src/models.py", "class User:\n    pass\n")
+    _write(temp_dir, "src/app.py", "from src.models import User\n\ndef create():\n    return User()\n")
+    _write(temp_dir, "src/utils.py", "def helper():\n    return 1\n")
+    _write(temp_dir, "tests/test_app.py", "from src.app import create\n\ndef test_create():\n    assert create()\n")
+    _write(temp_dir, "tests/test_utils.py", "import sys\nsys.path.insert(0, 'src')\nimport utils\n\n"
+                                             "def test_helper():\n    assert utils.helper() == 1\n")
+    return temp_dir
+
+
+class TestFileKlassifizierung:
+    """Tests fuer die Test-Datei-Erkennung."""
+
+    def test_python_test_dateien(self):
+        assert is_python_test_file("tests/test_app.py")
+        assert is_python_test_file("app_test.py")
+        assert not is_python_test_file("src/app.py")
+
+    def test_js_test_dateien(self):
+        assert is_js_test_file("src/App.test.jsx")
+        assert is_js_test_file("lib/db.spec.ts")
+        assert is_js_test_file("src/__tests__/util.js")
+        assert not is_js_test_file("src/App.jsx")
+
+
+class TestImportGraph:
+    """Tests fuer den Import-Graph."""
+
+    def test_python_absolute_imports(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project, "python")
+        graph = analyzer.build_import_graph()
+        assert graph["tests/test_app.py"] == {"src/app.py"}
+        assert graph["src/app.py"] == {"src/models.py"}
+
+    def test_python_suffix_import_via_sys_path(self, python_project):
+        """'import utils' nach sys.path-Hack wird auf src/utils.py aufgeloest."""
+        analyzer = TestImpactAnalyzer(python_project, "python")
+        assert analyzer.build_import_graph()["tests/test_utils.py"] == {"src/utils.py"}
+
+    def test_python_transitiv(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project, "python")
+        assert analyzer.transitive_dependencies("tests/test_app.py") == {"src/app.py", "src/models.py"}
+
+    def test_python_relative_imports(self, temp_dir):
+        _write(temp_dir, "pkg/__init__.py", "")
+        _write(temp_dir, "pkg/a.py", "from .b import x\n")
+        _write(temp_dir, "pkg/b.py", "x = 1\n")
+        analyzer = TestImpactAnalyzer(temp_dir, "python")
+        assert analyzer.build_import_graph()["pkg/a.py"] == {"pkg/b.py"}
+
+    def test_js_imports_mit_alias(self, temp_dir):
+        _write(temp_dir, "lib/db.js", "export const db = 1;\n")
+        _write(temp_dir, "components/List.jsx", "import { db } from '@/lib/db';\nimport React from 'react';\n")
+        _write(temp_dir, "components/List.test.jsx", "const List = require('./List');\n")
+        analyzer = TestImpactAnalyzer(temp_dir, "javascript")
+        graph = analyzer.build_import_graph()
+        assert graph["components/List.jsx"] == {"lib/db.js"}
+        assert analyzer.transitive_dependencies("components/List.test.jsx") == {
+            "components/List.jsx", "lib/db.js"
+        }
+
+    def test_syntaxfehler_kein_crash(self, temp_dir):
+        _write(temp_dir, "broken.py", "def (:\n")
+        analyzer = TestImpactAnalyzer(temp_dir, "python")
+        assert analyzer.build_import_graph()["broken.py"] == set()
+
+
+class TestSelectionLogik:
+    """Tests fuer Auswahl und Cache."""
+
+    def test_erster_lauf_alle_neu(self, python_project):
+        selection = TestImpactAnalyzer(python_project).select()
+        assert set(selection.selected) == {"tests/test_app.py", "tests/test_utils.py"}
+        assert selection.skipped == []
+        assert selection.full_run is True
+
+    def test_unveraendert_wird_uebersprungen(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=[], duration_seconds=4.0)
+
+        selection = TestImpactAnalyzer(python_project).select()
+        assert selection.selected == []
+        assert len(selection.skipped) == 2
+        assert selection.estimated_saved_seconds == pytest.approx(4.0)
+
+    def test_geaenderte_abhaengigkeit(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=[], duration_seconds=2.0)
+        _write(python_project, "src/models.py", "class User:\n    name = 'x'\n")
+
+        selection = TestImpactAnalyzer(python_project).select()
+        assert selection.selected == ["tests/test_app.py"]
+        assert selection.reasons["tests/test_app.py"] == "changed"
+        assert selection.skipped == ["tests/test_utils.py"]
+        assert selection.full_run is False
+
+    def test_fehlgeschlagene_werden_wiederholt(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=["tests/test_utils.py"],
+                                duration_seconds=2.0)
+        selection = TestImpactAnalyzer(python_project).select()
+        assert selection.selected == ["tests/test_utils.py"]
+        assert selection.reasons["tests/test_utils.py"] == "failed"
+
+    def test_full_run_erzwingt_alle(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=[], duration_seconds=2.0)
+        selection = TestImpactAnalyzer(python_project).select(full_run=True)
+        assert len(selection.selected) == 2
+        assert selection.full_run is True
+
+    def test_changed_files_hint(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=[], duration_seconds=2.0)
+        selection = TestImpactAnalyzer(python_project).select(changed_files=["./src/utils.py"])
+        assert selection.selected == ["tests/test_utils.py"]
+
+    def test_cache_ausserhalb_des_projekts(self, python_project, impact_cache_dir):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=[], duration_seconds=1.0)
+        assert os.path.dirname(analyzer.cache_path) == impact_cache_dir
+        assert os.path.isfile(analyzer.cache_path)
+        assert not any(name.endswith(".json") for name in os.listdir(python_project))
+        # Gleicher Projektname an anderem Ort bekommt eine eigene Datei
+        other = os.path.join(python_project, "sub", os.path.basename(python_project))
+        assert impact_cache_path(other) != analyzer.cache_path
+
+    def test_kaputter_cache_wird_ignoriert(self, python_project):
+        cache_path = impact_cache_path(python_project)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w") as f:
+            f.write("{kein json")
+        selection = TestImpactAnalyzer(python_project).select()
+        assert len(selection.selected) == 2
+
+
+class TestExtractFailedTestFiles:
+    """Tests fuer das Parsen fehlgeschlagener Test-Dateien."""
+
+    def test_pytest_output(self):
+        output = ("FAILED tests/test_app.py::test_create - AssertionError\n"
+                  "ERROR tests/test_db.py\n1 failed, 3 passed")
+        assert extract_failed_test_files(output) == {"tests/test_app.py", "tests/test_db.py"}
+
+    def test_jest_output_absolute_pfade(self):
+        output = "FAIL /proj/src/App.test.jsx\nPASS /proj/src/util.test.js"
+        assert extract_failed_test_files(output, "/proj") == {"src/App.test.jsx"}
+
+
+class TestRunUnitTestsIncremental:
+    """Tests fuer run_unit_tests im inkrementellen Modus."""
+
+    def test_nur_betroffene_dateien_an_pytest(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=[], duration_seconds=3.0)
+        _write(python_project, "src/utils.py", "def helper():\n    return 1  # geaendert\n")
+
+        ok = {"status": "OK", "summary": "Alle 1 Unit-Tests bestanden", "details": "1 passed", "test_count": 1}
+        with patch("unit_test_runner._run_pytest", return_value=ok) as mock_run:
+            result = run_unit_tests(python_project, {"language": "python"}, incremental=True)
+        mock_run.assert_called_once_with(python_project, ["tests/test_utils.py"])
+        assert result["impact"]["skipped"] == 1
+        assert "uebersprungen" in result["summary"]
+
+    def test_alles_unveraendert_kein_lauf(self, python_project):
+        analyzer = TestImpactAnalyzer(python_project)
+        analyzer.record_results(analyzer.select(), failed_files=[], duration_seconds=3.0)
+        with patch("unit_test_runner._run_pytest") as mock_run:
+            result = run_unit_tests(python_project, {"language": "python"}, incremental=True)
+        mock_run.assert_not_called()
+        assert result["status"] == "OK"
+        assert result["impact"]["skipped"] == 2
+
+    def test_fehlschlag_wird_gecacht(self, python_project):
+        fail = {"status": "FAIL", "summary": "x", "test_count": 2,
+                "details": "FAILED tests/test_app.py::test_create - boom\n1 failed, 1 passed"}
+        with patch("unit_test_runner._run_pytest", return_value=fail):
+            run_unit_tests(python_project, {"language": "python"}, incremental=True)
+        with open(impact_cache_path(python_project)) as f:
+            cache = json.load(f)
+        assert cache["tests"]["tests/test_app.py"]["status"] == "failed"
+        assert cache["tests"]["tests/test_utils.py"]["status"] == "passed"
+
+    def test_ohne_incremental_unveraendert(self, python_project):
+        ok = {"status": "OK", "summary": "ok", "details": "", "test_count": 2}
+        with patch("unit_test_runner._run_pytest", return_value=ok) as mock_run:
+            result = run_unit_tests(python_project, {"language": "python"})
+        mock_run.assert_called_once_with(python_project)
+        assert "impact" not in result
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+Author: rahn
+Datum: 18.10.2026
+Version: 1.1
+Beschreibung: Impact-Analyse fuer den Unit Test Runner.
+              Baut den Import-Graph des generierten Projekts (Python via ast,
+              JavaScript/TypeScript via Regex), ordnet jeder Test-Datei ihre
+              transitiv importierten Quell-Module zu und waehlt im Patch-Modus
+              nur betroffene oder zuletzt fehlgeschlagene Tests aus.
+              Ergebnisse werden pro Test-Datei mit Content-Hash gecacht.
+
+              AENDERUNG 18.10.2026: Cache liegt nicht mehr im generierten Projekt,
+              sondern unter budget_data/unit_test_impact/ (eine Datei pro Projekt).
+"""
+
+import os
+import re
+import ast
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Cache-Verzeichnis des Orchestrators (Version erhoehen wenn sich das Format aendert)
+IMPACT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budget_data", "unit_test_impact")
+IMPACT_CACHE_VERSION = 1
+
+_SKIP_DIRS = {'node_modules', 'venv', '.venv', '.git', '__pycache__', 'screenshots',
+              '.next', 'dist', 'build', '.pytest_cache', 'coverage'}
+
+_PY_EXTENSIONS = (".py",)
+_JS_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")
+
+_JS_IMPORT_PATTERNS = [
+    re.compile(r"""import\s+(?:[\w*{}\s,]+\s+from\s+)?['"]([^'"]+)['"]"""),
+    re.compile(r"""require\(\s*['"]([^'"]+)['"]\s*\)"""),
+    re.compile(r"""import\(\s*['"]([^'"]+)['"]\s*\)"""),
+    re.compile(r"""export\s+[\w*{}\s,]+\s+from\s+['"]([^'"]+)['"]"""),
+]
+
+
+def _norm(path: str) -> str:
+    """Normalisiert relative Pfade auf Forward-Slashes."""
+    path = path.replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    return path
+
+
+def impact_cache_path(project_path: str, cache_dir: Optional[str] = None) -> str:
+    """Cache-Datei eines Projekts - Projektname plus Hash des absoluten Pfads."""
+    abs_path = os.path.abspath(project_path)
+    name = re.sub(r'[^\w.-]', '_', os.path.basename(abs_path.rstrip(os.sep))) or "project"
+    key = hashlib.sha256(abs_path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir or IMPACT_CACHE_DIR, f"{name}-{key}.json")
+
+
+def is_python_test_file(rel_path: str) -> bool:
+    """True fuer test_*.py und *_test.py."""
+    name = os.path.basename(rel_path)
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def is_js_test_file(rel_path: str) -> bool:
+    """True fuer *.test.*, *.spec.* und Dateien in __tests__/."""
+    name = os.path.basename(rel_path)
+    if not name.endswith(_JS_EXTENSIONS):
+        return False
+    return ".test." in name or ".spec." in name or "__tests__/" in rel_path
+
+
+@dataclass
+class TestSelection:
+    """
+    Ergebnis der Test-Auswahl.
+
+    Attributes:
+        selected: Auszufuehrende Test-Dateien (relativ zum Projekt)
+        skipped: Unveraenderte, zuletzt bestandene Test-Dateien
+        reasons: Test-Datei -> Grund der Auswahl ("changed", "failed", "new", "full")
+        full_run: True wenn die komplette Suite laeuft
+        estimated_saved_seconds: Geschaetzte Zeitersparnis durch uebersprungene Tests
+    """
+    __test__ = False  # Kein pytest-Testklassen-Kandidat trotz "Test"-Prefix
+
+    selected: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    reasons: Dict[str, str] = field(default_factory=dict)
+    full_run: bool = True
+    estimated_saved_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "selected": len(self.selected),
+            "skipped": len(self.skipped),
+            "full_run": self.full_run,
+            "estimated_saved_seconds": round(self.estimated_saved_seconds, 1),
+        }
+
+
+class TestImpactAnalyzer:
+    """
+    Import-Graph + Content-Hash-Cache fuer inkrementelle Unit-Tests.
+
+    Der Impact-Hash einer Test-Datei umfasst ihren eigenen Inhalt und den
+    aller transitiv importierten Projekt-Dateien. Bleibt er gleich und war
+    der letzte Lauf gruen, kann der Test uebersprungen werden.
+    """
+    __test__ = False
+
+    def __init__(self, project_path: str, language: str = "python", cache_dir: Optional[str] = None):
+        self.project_path = project_path
+        self.language = "javascript" if language in ("javascript", "typescript") else "python"
+        self.extensions = _JS_EXTENSIONS if self.language == "javascript" else _PY_EXTENSIONS
+        self.cache_path = impact_cache_path(project_path, cache_dir)
+        self._files: Optional[List[str]] = None
+        self._graph: Optional[Dict[str, Set[str]]] = None
+        self._content_hashes: Dict[str, str] = {}
+        self._cache = self._load_cache()
+
+    # ------------------------------------------------------------------
+    # Datei-Index und Import-Graph
+    # ------------------------------------------------------------------
+    def _list_files(self) -> List[str]:
+        if self._files is None:
+            files = []
+            for root, dirs, names in os.walk(self.project_path):
+                dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+                for name in names:
+                    if name.endswith(self.extensions):
+                        rel = os.path.relpath(os.path.join(root, name), self.project_path)
+                        files.append(rel.replace("\\", "/"))
+            self._files = sorted(files)
+        return self._files
+
+    def _read(self, rel_path: str) -> str:
+        try:
+            with open(os.path.join(self.project_path, rel_path), "r", encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    def _hash_file(self, rel_path: str) -> str:
+        if rel_path not in self._content_hashes:
+            self._content_hashes[rel_path] = hashlib.sha256(
+                self._read(rel_path).encode("utf-8")
+            ).hexdigest()
+        return self._content_hashes[rel_path]
+
+    def find_test_files(self) -> List[str]:
+        """Liefert alle Test-Dateien des Projekts."""
+        check = is_js_test_file if self.language == "javascript" else is_python_test_file
+        return [f for f in self._list_files() if check(f)]
+
+    def _python_module_index(self) -> Dict[str, str]:
+        """Modulname -> Datei. Enthaelt auch Suffixe (src.app → app) fuer sys.path-Hacks."""
+        modules = []
+        for rel in self._list_files():
+            parts = rel[:-3].split("/")
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            if parts:
+                modules.append((parts, rel))
+        # Vollstaendige Modulpfade haben Vorrang vor Suffixen
+        index: Dict[str, str] = {".".join(parts): rel for parts, rel in modules}
+        for parts, rel in modules:
+            for start in range(1, len(parts)):
+                index.setdefault(".".join(parts[start:]), rel)
+        return index
+
+    def _python_imports(self, rel_path: str, index: Dict[str, str]) -> Set[str]:
+        try:
+            tree = ast.parse(self._read(rel_path))
+        except (SyntaxError, ValueError):
+            return set()
+        package = rel_path[:-3].split("/")[:-1]
+        found: Set[str] = set()
+
+        def resolve(name: str) -> None:
+            if name in index:
+                found.add(index[name])
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    resolve(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    base = package[:len(package) - (node.level - 1)] if node.level > 1 else package
+                    prefix = ".".join(base + ([node.module] if node.module else []))
+                else:
+                    prefix = node.module or ""
+                if prefix:
+                    resolve(prefix)
+                for alias in node.names:
+                    resolve(f"{prefix}.{alias.name}" if prefix else alias.name)
+        found.discard(rel_path)
+        return found
+
+    def _js_resolve(self, importer: str, spec: str, files: Set[str]) -> Optional[str]:
+        if spec.startswith("@/"):
+            base = spec[2:]
+            candidates_roots = [base, "src/" + base]
+        elif spec.startswith("."):
+            base = os.path.normpath(os.path.join(os.path.dirname(importer), spec)).replace("\\", "/")
+            candidates_roots = [base]
+        else:
+            return None  # npm-Paket
+        for root in candidates_roots:
+            if root in files:
+                return root
+            for ext in _JS_EXTENSIONS:
+                if root + ext in files:
+                    return root + ext
+                if f"{root}/index{ext}" in files:
+                    return f"{root}/index{ext}"
+        return None
+
+    def _js_imports(self, rel_path: str, files: Set[str]) -> Set[str]:
+        content = self._read(rel_path)
+        found: Set[str] = set()
+        for pattern in _JS_IMPORT_PATTERNS:
+            for spec in pattern.findall(content):
+                target = self._js_resolve(rel_path, spec, files)
+                if target and target != rel_path:
+                    found.add(target)
+        return found
+
+    def build_import_graph(self) -> Dict[str, Set[str]]:
+        """
+        Baut den direkten Import-Graph (Datei -> importierte Projekt-Dateien).
+
+        Returns:
+            Dict mit relativen Pfaden
+        """
+        if self._graph is None:
+            graph: Dict[str, Set[str]] = {}
+            if self.language == "javascript":
+                files = set(self._list_files())
+                for rel in files:
+                    graph[rel] = self._js_imports(rel, files)
+            else:
+                index = self._python_module_index()
+                for rel in self._list_files():
+                    graph[rel] = self._python_imports(rel, index)
+            self._graph = graph
+        return self._graph
+
+    def transitive_dependencies(self, rel_path: str) -> Set[str]:
+        """Alle direkt und indirekt importierten Projekt-Dateien."""
+        graph = self.build_import_graph()
+        seen: Set[str] = set()
+        stack = list(graph.get(rel_path, ()))
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            stack.extend(graph.get(current, ()))
+        seen.discard(rel_path)
+        return seen
+
+    def impact_hash(self, test_file: str) -> str:
+        """Hash ueber Test-Datei und alle transitiven Abhaengigkeiten."""
+        digest = hashlib.sha256()
+        for rel in [test_file] + sorted(self.transitive_dependencies(test_file)):
+            digest.update(rel.encode("utf-8"))
+            digest.update(self._hash_file(rel).encode("ascii"))
+        return digest.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+    def _load_cache(self) -> Dict[str, object]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == IMPACT_CACHE_VERSION and data.get("language") == self.language:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"version": IMPACT_CACHE_VERSION, "language": self.language, "tests": {}}
+
+    def _save_cache(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, indent=2)
+        except OSError as e:
+            logger.debug(f"Impact-Cache konnte nicht gespeichert werden: {e}")
+
+    # ------------------------------------------------------------------
+    # Auswahl und Ergebnis-Erfassung
+    # ------------------------------------------------------------------
+    def select(self, changed_files: Optional[Iterable[str]] = None,
+               full_run: bool = False) -> TestSelection:
+        """
+        Waehlt die auszufuehrenden Test-Dateien aus.
+
+        Args:
+            changed_files: Im aktuellen Durchlauf geschriebene Dateien (optional, erzwingt Auswahl)
+            full_run: True erzwingt die komplette Suite (z.B. letzte Iteration)
+
+        Returns:
+            TestSelection
+        """
+        tests = self.find_test_files()
+        cached = self._cache.get("tests", {})
+        changed = {_norm(f) for f in (changed_files or [])}
+        selection = TestSelection(full_run=full_run)
+
+        for test_file in tests:
+            entry = cached.get(test_file)
+            if full_run:
+                reason = "full"
+            elif entry is None:
+                reason = "new"
+            elif entry.get("status") != "passed":
+                reason = "failed"
+            elif entry.get("hash") != self.impact_hash(test_file):
+                reason = "changed"
+            elif test_file in changed or changed & self.transitive_dependencies(test_file):
+                reason = "changed"
+            else:
+                reason = None
+
+            if reason:
+                selection.selected.append(test_file)
+                selection.reasons[test_file] = reason
+            else:
+                selection.skipped.append(test_file)
+                selection.estimated_saved_seconds += float(entry.get("duration", 0.0))
+
+        if not full_run and not selection.skipped:
+            # Nichts zu sparen → wie ein Volllauf behandeln (einfacheres Kommando)
+            selection.full_run = True
+        return selection
+
+    def record_results(self, selection: TestSelection, failed_files: Iterable[str],
+                       duration_seconds: float) -> None:
+        """
+        Speichert die Ergebnisse des Laufs im Cache.
+
+        Args:
+            selection: Die ausgefuehrte Auswahl
+            failed_files: Test-Dateien mit mindestens einem Fehler
+            duration_seconds: Gesamtdauer des Laufs (wird gleichmaessig verteilt)
+        """
+        failed = {_norm(f) for f in failed_files}
+        per_file = duration_seconds / len(selection.selected) if selection.selected else 0.0
+        tests = self._cache.setdefault("tests", {})
+        for test_file in selection.selected:
+            tests[test_file] = {
+                "hash": self.impact_hash(test_file),
+                "status": "failed" if test_file in failed else "passed",
+                "duration": round(per_file, 3),
+            }
+        # Geloeschte Test-Dateien aus dem Cache entfernen
+        existing = set(self.find_test_files())
+        for stale in [t for t in tests if t not in existing]:
+            del tests[stale]
+        self._save_cache()
+
+
+def extract_failed_test_files(output: str, project_path: str = "") -> Set[str]:
+    """
+    Extrahiert fehlgeschlagene Test-Dateien aus pytest- oder jest/vitest-Output.
+
+    Args:
+        output: Runner-Output
+        project_path: Projektpfad zum Relativieren absoluter Pfade
+
+    Returns:
+        Set relativer Test-Dateipfade
+    """
+    files: Set[str] = set()
+    prefix = project_path.replace("\\", "/").rstrip("/") + "/" if project_path else ""
+    for match in re.findall(r'(?:FAILED|ERROR)\s+([^\s:]+\.py)', output):
+        files.add(match)
+    for match in re.findall(r'FAIL\s+([^\s]+\.(?:jsx|js|tsx|ts|mjs|cjs))(?=\s|$)', output):
+        files.add(match)
+    normalized = set()
+    for f in files:
+        f = f.replace("\\", "/")
+        if prefix and f.startswith(prefix):
+            f = f[len(prefix):]
+        normalized.add(_norm(f))
+    return normalized
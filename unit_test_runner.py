@@ -6,6 +6,8 @@ Version: 1.0
 Beschreibung: Unit Test Runner - Fuehrt pytest (Python) oder npm test (JavaScript) aus.
               Wird im DEV-Loop vor den Playwright UI-Tests aufgerufen.
               Erkennt automatisch das Test-Framework basierend auf tech_blueprint.
+              AENDERUNG 18.10.2026: Inkrementeller Modus (unit_test_impact) - nur betroffene
+                                    und zuletzt fehlgeschlagene Test-Dateien ausfuehren.
 """
 
 import os
@@ -13,22 +15,31 @@ import subprocess
 import logging
 import re
 import shutil
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Iterable
+
+from unit_test_impact import TestImpactAnalyzer, extract_failed_test_files
 
 logger = logging.getLogger(__name__)
 
 
-def run_unit_tests(project_path: str, tech_blueprint: Dict[str, Any]) -> Dict[str, Any]:
+def run_unit_tests(project_path: str, tech_blueprint: Dict[str, Any],
+                   changed_files: Optional[Iterable[str]] = None,
+                   incremental: bool = False,
+                   full_run: bool = False) -> Dict[str, Any]:
     """
     Fuehrt Unit-Tests basierend auf Tech-Stack durch.
 
     Args:
         project_path: Pfad zum Projektverzeichnis
         tech_blueprint: Blueprint mit language, project_type, etc.
+        changed_files: In dieser Iteration geschriebene Dateien (nur inkrementeller Modus)
+        incremental: AENDERUNG 18.10.2026 - Impact-Analyse statt kompletter Suite
+        full_run: Erzwingt die komplette Suite auch im inkrementellen Modus (letzte Iteration)
 
     Returns:
-        Dict mit status, summary, details, test_count
+        Dict mit status, summary, details, test_count (+ impact im inkrementellen Modus)
     """
     language = tech_blueprint.get("language", "python")
     project_type = str(tech_blueprint.get("project_type", "")).lower()
@@ -37,10 +48,18 @@ def run_unit_tests(project_path: str, tech_blueprint: Dict[str, Any]) -> Dict[st
 
     # Python-Projekte: pytest
     if language == "python" or "python" in project_type or "flask" in project_type or "fastapi" in project_type:
+        if incremental:
+            return _run_with_impact(project_path, "python", _run_pytest, changed_files, full_run)
         return _run_pytest(project_path)
 
     # JavaScript-Projekte: npm test (jest/vitest/mocha)
     elif language == "javascript" or "node" in project_type or "react" in project_type or "vue" in project_type:
+        if incremental:
+            return _run_with_impact(
+                project_path, "javascript",
+                lambda path, targets=None: _run_npm_test(path, project_type, targets),
+                changed_files, full_run
+            )
         return _run_npm_test(project_path, project_type)
 
     # Statische HTML-Projekte: Keine Unit-Tests
@@ -61,12 +80,62 @@ def run_unit_tests(project_path: str, tech_blueprint: Dict[str, Any]) -> Dict[st
     }
 
 
-def _run_pytest(project_path: str) -> Dict[str, Any]:
+def _run_with_impact(project_path: str, language: str,
+                     run_fn: Callable[..., Dict[str, Any]],
+                     changed_files: Optional[Iterable[str]],
+                     full_run: bool) -> Dict[str, Any]:
+    """
+    AENDERUNG 18.10.2026: Inkrementeller Testlauf ueber TestImpactAnalyzer.
+    Fuehrt nur die ausgewaehlten Test-Dateien aus, speichert die Ergebnisse
+    im Content-Hash-Cache und ergaenzt das Ergebnis um Impact-Statistiken.
+    """
+    try:
+        analyzer = TestImpactAnalyzer(project_path, language)
+        selection = analyzer.select(changed_files, full_run=full_run)
+    except Exception as e:
+        logger.warning(f"Impact-Analyse fehlgeschlagen - komplette Suite: {e}")
+        return run_fn(project_path)
+
+    if not selection.selected and selection.skipped:
+        return {
+            "status": "OK",
+            "summary": (f"Alle {len(selection.skipped)} Test-Dateien unveraendert und zuletzt bestanden "
+                        f"(~{selection.estimated_saved_seconds:.1f}s gespart)"),
+            "details": "",
+            "test_count": 0,
+            "impact": selection.to_dict(),
+        }
+
+    start = time.time()
+    result = run_fn(project_path, None if selection.full_run else selection.selected)
+    duration = time.time() - start
+
+    if result.get("status") in ("OK", "FAIL"):
+        failed = extract_failed_test_files(result.get("details", ""), project_path)
+        if result.get("status") == "FAIL" and not failed:
+            # Fehler nicht zuordenbar (Timeout, Collection) → alle ausgewaehlten als fehlgeschlagen
+            failed = set(selection.selected)
+        try:
+            analyzer.record_results(selection, failed, duration)
+        except Exception as e:
+            logger.debug(f"Impact-Cache Update fehlgeschlagen: {e}")
+
+    result["impact"] = selection.to_dict()
+    if selection.skipped:
+        result["summary"] = (f"{result.get('summary', '')} ({len(selection.skipped)} unveraenderte "
+                             f"Test-Dateien uebersprungen, ~{selection.estimated_saved_seconds:.1f}s gespart)")
+    logger.info(f"Impact-Analyse: {len(selection.selected)} ausgefuehrt, "
+                f"{len(selection.skipped)} uebersprungen, full_run={selection.full_run}")
+    return result
+
+
+def _run_pytest(project_path: str, test_targets: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Fuehrt pytest aus.
 
     Args:
         project_path: Pfad zum Projektverzeichnis
+        test_targets: Optional nur diese Test-Dateien (relativ zum Projekt) ausfuehren
 
     Returns:
         Dict mit status, summary, details, test_count
@@ -88,7 +157,8 @@ def _run_pytest(project_path: str) -> Dict[str, Any]:
         # ÄNDERUNG 28.01.2026: python -m pytest statt direktem pytest-Aufruf
         # Damit funktioniert es auch wenn pytest nicht im PATH ist
         result = subprocess.run(
-            ["python", "-m", "pytest", project_path, "--tb=short", "-q", "--no-header"],
+            ["python", "-m", "pytest", *(test_targets or [project_path]),
+             "--tb=short", "-q", "--no-header"],
             cwd=project_path,
             capture_output=True,
             timeout=120,
@@ -153,13 +223,15 @@ def _run_pytest(project_path: str) -> Dict[str, Any]:
         }
 
 
-def _run_npm_test(project_path: str, project_type: str) -> Dict[str, Any]:
+def _run_npm_test(project_path: str, project_type: str,
+                  test_targets: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Fuehrt npm test (jest/vitest/mocha) aus.
 
     Args:
         project_path: Pfad zum Projektverzeichnis
         project_type: Projekttyp (react_app, vue_app, nodejs_express, etc.)
+        test_targets: Optional nur diese Test-Dateien ausfuehren (jest/vitest Pfad-Filter)
 
     Returns:
         Dict mit status, summary, details, test_count
@@ -228,6 +300,9 @@ def _run_npm_test(project_path: str, project_type: str) -> Dict[str, Any]:
         npm_cmd = [npm_path, "run", test_script_name, "--", "--passWithNoTests", "--silent"] \
             if test_script_name != "test" \
             else [npm_path, "test", "--", "--passWithNoTests", "--silent"]
+        # AENDERUNG 18.10.2026: Positionsargumente filtern jest/vitest auf die ausgewaehlten Dateien
+        if test_targets:
+            npm_cmd.extend(test_targets)
         logger.info(f"Fuehre aus: {' '.join(npm_cmd)}")
         result = subprocess.run(
             npm_cmd,